@@ -72,6 +72,25 @@ CREATE INDEX IF NOT EXISTS idx_blocklist_ip ON anonymous_blocklist(first_ip);
 CREATE INDEX IF NOT EXISTS idx_blocklist_blocked ON anonymous_blocklist(blocked);
 CREATE INDEX IF NOT EXISTS idx_blocklist_multi ON anonymous_blocklist(visitor_id, fingerprint_hash, first_ip);
 
+-- Biblioteca de referências (métricas pré-computadas por usuário / compartilhadas)
+CREATE TABLE IF NOT EXISTS reference_library (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  owner_uid VARCHAR(128) NOT NULL,          -- UID do usuário ou 'shared'
+  name VARCHAR(255) NOT NULL,
+  file_name VARCHAR(255),
+  fingerprint VARCHAR(128) NOT NULL,        -- sha256 do arquivo de referência
+  source_job_id UUID,
+  snapshot_version INTEGER NOT NULL DEFAULT 1,
+  metrics JSONB NOT NULL,
+  use_count INTEGER NOT NULL DEFAULT 0,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+  last_used_at TIMESTAMP WITH TIME ZONE,
+
+  CONSTRAINT unique_reference_owner_fingerprint UNIQUE (owner_uid, fingerprint)
+);
+
+CREATE INDEX IF NOT EXISTS idx_reference_library_owner ON reference_library(owner_uid);
+
 -- ═══════════════════════════════════════════════════════════════════
 -- VERIFICAÇÃO
 -- ═══════════════════════════════════════════════════════════════════
@@ -85,7 +104,12 @@ UNION ALL
 SELECT 
   'anonymous_blocklist' as tabela,
   COUNT(*) as registros
-FROM anonymous_blocklist;
+FROM anonymous_blocklist
+UNION ALL
+SELECT 
+  'reference_library' as tabela,
+  COUNT(*) as registros
+FROM reference_library;
 
 -- ═══════════════════════════════════════════════════════════════════
 -- RESULTADO ESPERADO
@@ -94,6 +118,7 @@ FROM anonymous_blocklist;
 -- -----------------------+-----------
 -- anonymous_usage        | 0
 -- anonymous_blocklist    | 0
+-- reference_library      | 0
 --
 -- Se aparecer isso, as tabelas foram criadas com sucesso!
 -- ═══════════════════════════════════════════════════════════════════
@@ -154,7 +154,7 @@ export default async function handler(req, res) {
   if (req.method !== 'POST') return res.status(405).json({ error: 'METHOD_NOT_ALLOWED' });
   
   try {
-    const { fileKey, fileName, genre, genreTargets, visitorId, soundDestination } = req.body || {};
+    const { fileKey, fileName, genre, genreTargets, visitorId, soundDestination, analysisTier } = req.body || {};
     
     // Validar visitorId
     if (!visitorId || typeof visitorId !== 'string' || visitorId.length < 10) {
@@ -212,7 +212,8 @@ export default async function handler(req, res) {
         genre,
         genreTargets,
         visitorId,
-        soundDestination: soundDestination || 'pista'
+        soundDestination: soundDestination || 'pista',
+        analysisTier // 'quick' | 'full' (backend aplica o padrão se ausente)
       })
     });
     
@@ -1,6 +1,5 @@
 import express from "express";
 import pkg from "pg";
-import multer from "multer";
 import cors from "cors";
 import fetch from "node-fetch";
 
@@ -51,33 +50,6 @@ async function getS3Client() {
 
 const BUCKET_NAME = process.env.B2_BUCKET_NAME;
 
-// ---------- Middleware para upload ----------
-const storage = multer.memoryStorage();
-
-const fileFilter = (req, file, cb) => {
-  const allowedTypes = [
-    "audio/mpeg",   // mp3
-    "audio/wav",    // wav
-    "audio/x-wav",  // outra variação wav
-    "audio/wave",   // outra variação wav
-    "audio/x-m4a",  // m4a
-    "audio/mp4",    // m4a/mp4
-  ];
-  if (!allowedTypes.includes(file.mimetype)) {
-    return cb(
-      new Error("Tipo de arquivo não permitido. Envie apenas mp3, wav ou m4a."),
-      false
-    );
-  }
-  cb(null, true);
-};
-
-const upload = multer({
-  storage,
-  limits: { fileSize: 150 * 1024 * 1024 }, // 150 MB
-  fileFilter,
-});
-
 // ⚠️ CORRECTION PLAN: Rota está no SoundyAI-app (server.js raiz)
 // O serviço api/ não precisa dessa rota
 
@@ -470,40 +442,25 @@ app.get("/test", async (req, res) => {
   }
 });
 
-app.post("/upload", upload.single("file"), async (req, res) => {
-  try {
-    if (!req.file) {
-      return res
-        .status(400)
-        .json({ error: "Nenhum arquivo enviado ou tipo inválido." });
-    }
-
-    const key = `uploads/${Date.now()}-${req.file.originalname}`;
-
-    const params = {
-      Bucket: BUCKET_NAME,
-      Key: key,
-      Body: req.file.buffer,
-      ContentType: req.file.mimetype,
-    };
-
-    const s3 = await getS3Client();
-    const data = await s3.upload(params).promise();
-    console.log("✅ Upload concluído:", key);
+// ---------- Upload multipart: proxy para o backend Railway (work/api/uploads/multipart.js) ----------
+// As partes vão direto para o bucket; aqui só passam as chamadas JSON (criar/retomar/concluir/cancelar)
+const RAILWAY_BACKEND_URL = process.env.RAILWAY_BACKEND_URL || "https://soundyai-app-production.up.railway.app";
 
-    const result = await pool.query(
-      "INSERT INTO jobs (file_key, status) VALUES ($1, $2) RETURNING *",
-      [key, "queued"]
-    );
+app.use("/api/uploads/multipart", async (req, res) => {
+  try {
+    const headers = { "Content-Type": "application/json", "X-Forwarded-For": req.ip };
+    if (req.headers.authorization) headers.Authorization = req.headers.authorization;
 
-    res.json({
-      message: "Arquivo enviado e job criado!",
-      fileUrl: `https://s3.us-east-005.backblazeb2.com/${BUCKET_NAME}/${key}`,
-      job: result.rows[0],
+    const upstream = await fetch(`${RAILWAY_BACKEND_URL}${req.originalUrl}`, {
+      method: req.method,
+      headers,
+      body: ["GET", "HEAD"].includes(req.method) ? undefined : JSON.stringify(req.body || {}),
     });
+    const data = await upstream.json().catch(() => ({ success: false, error: "UPLOAD_ERROR" }));
+    res.status(upstream.status).json(data);
   } catch (err) {
-    console.error("❌ Erro no upload:", err.message);
-    res.status(500).json({ error: err.message });
+    console.error("❌ Erro no proxy de upload multipart:", err.message);
+    res.status(502).json({ success: false, error: "UPLOAD_ERROR" });
   }
 });
 
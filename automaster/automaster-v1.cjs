@@ -46,9 +46,9 @@ const execFileAsync = promisify(execFile);
 const LUFS_TOLERANCE = 0.2;  // ±0.2 LU (padrão prático profissional)
 const TP_TOLERANCE = 0.05;   // +0.05 dB
 
-// Scripts do projeto
-const MEASURE_SCRIPT = path.resolve(__dirname, 'measure-audio.cjs');
-const FIX_TP_SCRIPT = path.resolve(__dirname, 'fix-true-peak.cjs');
+// Etapas do projeto (in-process, sem subprocess node)
+const { measureAudio } = require('./measure-audio.cjs');
+const { fixTruePeak } = require('./fix-true-peak.cjs');
 
 // ============================================================
 // VALIDAÇÃO DE PARÂMETROS
@@ -63,6 +63,13 @@ function validateArgs() {
   }
 
   const [inputPath, outputPath, mode] = args;
+  return { inputPath, outputPath, mode };
+}
+
+function validateOptions({ inputPath, outputPath, mode } = {}) {
+  if (!inputPath || !outputPath) {
+    throw new Error('inputPath e outputPath sao obrigatorios');
+  }
 
   // Validar arquivo de entrada
   if (!fs.existsSync(inputPath)) {
@@ -203,18 +210,13 @@ async function measureWithOfficialScript(filePath, maxRetries = 3) {
   
   for (let attempt = 1; attempt <= maxRetries; attempt++) {
     try {
-      const { stdout } = await execFileAsync('node', [MEASURE_SCRIPT, filePath], {
-        maxBuffer: 10 * 1024 * 1024,
-        timeout: 120000
-      });
+      const data = await measureAudio(filePath);
       
-      // Validar que stdout não está vazio
-      if (!stdout || stdout.trim().length === 0) {
+      // Validar que a medição retornou dados
+      if (!data) {
         throw new Error('measure-audio.cjs retornou output vazio');
       }
       
-      const data = JSON.parse(stdout.trim());
-      
       // Validação rigorosa dos campos obrigatórios
       if (typeof data.lufs_i !== 'number' || isNaN(data.lufs_i)) {
         throw new Error('lufs_i inválido ou ausente');
@@ -259,15 +261,7 @@ async function applyTruePeakFix(outputPath, ceilingDbtp = -1.0) {
   const debug = process.env.DEBUG_PIPELINE === 'true';
   
   try {
-    const scriptArgs = [FIX_TP_SCRIPT, outputPath];
-    if (ceilingDbtp !== -1.0) scriptArgs.push(ceilingDbtp.toString());
-
-    const { stdout } = await execFileAsync('node', scriptArgs, {
-      maxBuffer: 10 * 1024 * 1024,
-      timeout: 120000
-    });
-    
-    const result = JSON.parse(stdout.trim());
+    const result = await fixTruePeak(outputPath, { targetTP: ceilingDbtp });
     
     if (result.status === 'OK') {
       // Já estava dentro do limite
@@ -3911,7 +3905,7 @@ async function runTwoPassLoudnorm(options) {
     console.error('[DEBUG] [PRE-LIMITER] Not needed (TP within safe range)');
   }
   
-  eqTempFile = null;  // Reset
+  let eqTempFile = null;  // Temporário EQ/pre-gain/trim deste render (local: execução in-process não compartilha estado)
   let audioToMeasure = inputPath;  // Por padrão, medir o input original
   let audioToRender = inputPath;   // Por padrão, renderizar o input original
   let renderWithEQ = defensiveEQFilters; // Por padrão, aplicar EQ no render
@@ -4262,6 +4256,11 @@ async function runTwoPassLoudnorm(options) {
   );
   if (debug) console.error(`[DEBUG] Tempo: ${renderResult.duration}s`);
 
+  // Temporário não é mais necessário após o render
+  if (eqTempFile && fs.existsSync(eqTempFile)) {
+    try { fs.unlinkSync(eqTempFile); } catch { /* limpeza silenciosa */ }
+  }
+
   // Passo 3: Validação com measure-audio.cjs (confiável para TP final)
   // 🔒 CRITICAL: Garantir que medição final SEMPRE retorna LUFS válido
   if (debug) console.error('[DEBUG] [3/5] Medindo resultado final (measure-audio.cjs)...');
@@ -5572,10 +5571,21 @@ function isMixNotApt(m) {
 }
 
 // ============================================================
-// MAIN
+// API PROGRAMÁTICA
 // ============================================================
 
-async function main() {
+/**
+ * Núcleo técnico in-process (mesmo resultado que a CLI imprime no stdout).
+ *
+ * @param {Object} options
+ * @param {string} options.inputPath - WAV de entrada
+ * @param {string} options.outputPath - WAV de saída
+ * @param {string} [options.mode='MEDIUM'] - STREAMING | LOW | MEDIUM | HIGH | EXTREME
+ * @returns {Promise<Object>} { success: true, final_lufs, final_tp, ... } ou
+ *   { success: false, impact_aborted | violations } quando o plano/fallback recusa o render
+ * @throws {Error} parâmetros inválidos, FFmpeg ausente ou falha de processamento
+ */
+async function runAutomasterCore(options) {
   const debug = process.env.DEBUG_PIPELINE === 'true';
   let eqTempFile = null;           // Arquivo temporário com EQ (para limpeza ao final)
   let peakCorrectionTempFile = null; // Arquivo temporário de peak correction
@@ -5584,29 +5594,27 @@ async function main() {
   let rescueModeActive = false;      // Indica se Opração Resgate foi ativada
   let rescueDeGainDB = 0;            // De-Gain aplicado no resgate (dB)
 
+  // Limpeza dos temporários em TODAS as saídas (processo pode ser reutilizado)
+  const cleanupTempFiles = () => {
+    for (const tempFile of [eqTempFile, peakCorrectionTempFile, rescueDeGainTempFile]) {
+      if (tempFile && fs.existsSync(tempFile)) {
+        try { fs.unlinkSync(tempFile); } catch { /* limpeza silenciosa */ }
+      }
+    }
+  };
+
   if (debug) {
     console.error('[DEBUG] AutoMaster V1 - Nucleo Tecnico');
   }
 
   // 1. Validar argumentos
-  let config;
-  try {
-    config = validateArgs();
-    if (debug) console.error('[DEBUG] Parametros validos');
-  } catch (error) {
-    process.stdout.write(JSON.stringify({ success: false, error: error.message }) + '\n');
-    process.exit(1);
-  }
+  const config = validateOptions(options);
+  if (debug) console.error('[DEBUG] Parametros validos');
 
   // 2. Verificar FFmpeg
   if (debug) console.error('[DEBUG] Verificando FFmpeg...');
-  try {
-    const ffmpegVersion = await checkFFmpeg();
-    if (debug) console.error(`[DEBUG] FFmpeg encontrado: ${ffmpegVersion}`);
-  } catch (error) {
-    process.stdout.write(JSON.stringify({ success: false, error: error.message }) + '\n');
-    process.exit(1);
-  }
+  const ffmpegVersion = await checkFFmpeg();
+  if (debug) console.error(`[DEBUG] FFmpeg encontrado: ${ffmpegVersion}`);
 
   // 2.5 BUILD MASTERING PLAN (análise + decisão unificados)
   console.error('[MASTERING PLAN] Analisando métricas e construindo plano...');
@@ -5713,15 +5721,15 @@ async function main() {
 
     if (!masteringPlan.shouldProcess) {
       console.error('[MASTERING PLAN] Processamento abortado:', masteringPlan.abortReason);
-      process.stdout.write(JSON.stringify({
+      cleanupTempFiles();
+      return {
         success: false,
         impact_aborted: true,
         abort_reason: masteringPlan.abortReason || 'MASTERING_PLAN_ABORT',
         final_lufs: metrics.lufs,
         final_tp: metrics.truePeak,
         mode_result: config.mode
-      }) + '\n');
-      process.exit(0);
+      };
     }
 
     // Expor campos do plano diretamente em config (mantém compatibilidade total)
@@ -5766,8 +5774,8 @@ async function main() {
 
   } catch (error) {
     console.error('[MASTERING PLAN] Erro ao analisar áudio:', error.message);
-    process.stdout.write(JSON.stringify({ success: false, error: '[MASTERING PLAN] ' + error.message }) + '\n');
-    process.exit(1);
+    cleanupTempFiles();
+    throw new Error('[MASTERING PLAN] ' + error.message);
   }
 
   if (debug) {
@@ -5936,8 +5944,8 @@ async function main() {
         console.error('❌ ERRO CRÍTICO: Mesmo fallback conservador violou regras técnicas');
         console.error('   Isto indica problema técnico no pipeline');
         console.error(`   Violações: ${validation.violations.join(', ')}`);
-        process.stdout.write(JSON.stringify({ success: false, error: 'Fallback conservador violou regras técnicas', violations: validation.violations }) + '\n');
-        process.exit(0);
+        cleanupTempFiles();
+        return { success: false, error: 'Fallback conservador violou regras técnicas', violations: validation.violations };
       }
       
       console.error('✅ Fallback conservador aplicado com sucesso');
@@ -6067,67 +6075,44 @@ async function main() {
     const _finalStat = fs.statSync(config.outputPath);
     console.error(`[FINAL FILE READY - STABLE] ${config.outputPath} — ${(_finalStat.size / 1024).toFixed(1)} KB — pronto para leitura`);
 
-    process.stdout.write(JSON.stringify(jsonResult));
-    
-    // Limpar arquivo temporário (se foi criado)
-    if (eqTempFile && fs.existsSync(eqTempFile)) {
-      if (debug) {
-        console.error(`[DEBUG] [CLEANUP] Removendo arquivo temporário: ${eqTempFile}`);
-      }
-      try {
-        fs.unlinkSync(eqTempFile);
-      } catch (cleanupError) {
-        // Não falhar se limpeza falhou
-        if (debug) {
-          console.error(`[DEBUG] [CLEANUP] Aviso: falha ao remover temporário: ${cleanupError.message}`);
-        }
-      }
-    }
-
-    // Limpar arquivo temporário do peak correction
-    if (peakCorrectionTempFile && fs.existsSync(peakCorrectionTempFile)) {
-      try {
-        fs.unlinkSync(peakCorrectionTempFile);
-      } catch { /* limpeza silenciosa */ }
-    }
+    // Limpar arquivos temporários (EQ, peak correction, Operação Resgate)
+    if (debug) console.error('[DEBUG] [CLEANUP] Removendo arquivos temporários');
+    cleanupTempFiles();
 
-    // Limpar arquivo temporário da Operação Resgate (De-Gain)
-    if (rescueDeGainTempFile && fs.existsSync(rescueDeGainTempFile)) {
-      try {
-        fs.unlinkSync(rescueDeGainTempFile);
-      } catch { /* limpeza silenciosa */ }
-    }
-    
-    process.exit(0);
+    return jsonResult;
   } catch (error) {
     if (debug) {
       console.error('[DEBUG] ERRO NO PROCESSAMENTO');
     }
     console.error(error.message);
-    
-    // Limpar arquivo temporário mesmo em caso de erro
-    if (typeof eqTempFile !== 'undefined' && eqTempFile && fs.existsSync(eqTempFile)) {
-      try {
-        fs.unlinkSync(eqTempFile);
-        if (debug) {
-          console.error(`[DEBUG] [CLEANUP] Arquivo temporário removido após erro`);
-        }
-      } catch (cleanupError) {
-        // Ignorar erro de limpeza
-      }
-    }
-    
-    // BUG FIX: garantir que stdout sempre receba JSON antes de sair
-    process.stdout.write(JSON.stringify({ success: false, error: error.message, stack: error.stack }) + '\n');
 
-    // Limpar arquivo temporário da Operação Resgate (De-Gain)
-    if (typeof rescueDeGainTempFile !== 'undefined' && rescueDeGainTempFile && fs.existsSync(rescueDeGainTempFile)) {
-      try { fs.unlinkSync(rescueDeGainTempFile); } catch { /* silencioso */ }
-    }
+    // Limpar arquivos temporários mesmo em caso de erro
+    cleanupTempFiles();
+    throw error;
+  }
+}
+
+// ============================================================
+// MAIN (CLI)
+// ============================================================
 
+async function main() {
+  try {
+    const result = await runAutomasterCore(validateArgs());
+    // JSON PURO NO STDOUT (sem prefixo, sem decoração)
+    process.stdout.write(JSON.stringify(result) + (result.success ? '' : '\n'));
+    process.exit(0);
+  } catch (error) {
+    // stdout sempre recebe JSON antes de sair
+    process.stdout.write(JSON.stringify({ success: false, error: error.message, stack: error.stack }) + '\n');
     process.exit(1);
   }
 }
 
-// Executar
-main();
+// Executar se chamado diretamente
+if (require.main === module) {
+  main();
+}
+
+// Exportar para uso programático
+module.exports = { runAutomasterCore };
@@ -52,27 +52,39 @@ function validateInput() {
     exitWithError('INVALID_ARGS', 'Uso: node fix-true-peak.cjs <input.wav> [ceiling_dbtp]');
   }
 
-  const inputPath = path.resolve(args[0]);
+  return { inputPath: args[0], targetTP: args.length === 2 ? args[1] : DEFAULT_TARGET_TP };
+}
+
+/**
+ * Erro com código estável (mesmos códigos do JSON de erro da CLI)
+ */
+function fixTruePeakError(code, message) {
+  const error = new Error(message);
+  error.code = code;
+  return error;
+}
+
+/**
+ * Valida arquivo + ceiling. Lança erro com .code (INVALID_*, FILE_NOT_FOUND).
+ */
+function validateOptions(rawInputPath, rawTargetTP) {
+  const inputPath = path.resolve(rawInputPath);
 
   // Validar existência
   if (!fs.existsSync(inputPath)) {
-    exitWithError('FILE_NOT_FOUND', `Arquivo não encontrado: ${inputPath}`);
+    throw fixTruePeakError('FILE_NOT_FOUND', `Arquivo não encontrado: ${inputPath}`);
   }
 
   // Validar extensão
   const ext = path.extname(inputPath).toLowerCase();
   if (ext !== '.wav') {
-    exitWithError('INVALID_FORMAT', `Apenas WAV é suportado (recebido: ${ext})`);
+    throw fixTruePeakError('INVALID_FORMAT', `Apenas WAV é suportado (recebido: ${ext})`);
   }
 
-  // Argumento opcional: ceiling em dBTP
-  let targetTP = DEFAULT_TARGET_TP;
-  if (args.length === 2) {
-    const parsed = parseFloat(args[1]);
-    if (isNaN(parsed) || parsed > 0 || parsed < -6) {
-      exitWithError('INVALID_CEILING', `Ceiling inválido: "${args[1]}" — deve ser um número entre -6 e 0 (ex: -0.5, -1.0)`);
-    }
-    targetTP = parsed;
+  // Ceiling em dBTP
+  const targetTP = typeof rawTargetTP === 'number' ? rawTargetTP : parseFloat(rawTargetTP);
+  if (isNaN(targetTP) || targetTP > 0 || targetTP < -6) {
+    throw fixTruePeakError('INVALID_CEILING', `Ceiling inválido: "${rawTargetTP}" — deve ser um número entre -6 e 0 (ex: -0.5, -1.0)`);
   }
 
   return { inputPath, targetTP };
@@ -218,14 +230,23 @@ function exitWithError(code, message) {
 }
 
 // ============================================================
-// MAIN
+// API PROGRAMÁTICA
 // ============================================================
 
-async function main() {
-  try {
-    // 1. Validar entrada
-    const { inputPath, targetTP: TARGET_TP } = validateInput();
+/**
+ * Corrige True Peak com ganho negativo (sem subprocess node).
+ *
+ * @param {string} inputPath - WAV de entrada
+ * @param {Object} [options]
+ * @param {number} [options.targetTP=-1.0] - ceiling em dBTP (-6..0)
+ * @returns {Promise<Object>} { status: 'OK'|'FIXED', input_tp, target_tp, action, ... } (mesmo JSON da CLI)
+ * @throws {Error} com .code (FILE_NOT_FOUND | INVALID_FORMAT | INVALID_CEILING | INTERNAL_ERROR)
+ */
+async function fixTruePeak(rawInputPath, { targetTP: rawTargetTP = DEFAULT_TARGET_TP } = {}) {
+  // 1. Validar entrada
+  const { inputPath, targetTP: TARGET_TP } = validateOptions(rawInputPath, rawTargetTP);
 
+  try {
     // 2. Detectar sample rate (para preservação)
     const sampleRate = await detectInputSampleRate(inputPath);
 
@@ -235,15 +256,13 @@ async function main() {
     // 4. Verificar se precisa correção
     if (inputTP <= TARGET_TP) {
       // Já está seguro
-      outputResult({
+      return {
         status: 'OK',
         message: 'True Peak dentro do limite seguro. Nenhuma correção necessária.',
         input_tp: parseFloat(inputTP.toFixed(2)),
         target_tp: TARGET_TP,
         action: 'none'
-      });
-      process.exit(0);
-      return;
+      };
     }
 
     // 5. Calcular ganho negativo mínimo necessário
@@ -291,7 +310,7 @@ async function main() {
     }
 
     // 8. Retornar resultado
-    outputResult({
+    return {
       status: 'FIXED',
       message: 'True Peak corrigido com ganho negativo.',
       input_tp: parseFloat(inputTP.toFixed(3)),
@@ -302,14 +321,31 @@ async function main() {
       target_tp: TARGET_TP,
       safety_margin: SAFETY_MARGIN,
       action: 'volume_reduction'
-    });
+    };
+  } catch (error) {
+    throw error.code ? error : fixTruePeakError('INTERNAL_ERROR', error.message);
+  }
+}
 
-    process.exit(0);
+// ============================================================
+// MAIN (CLI)
+// ============================================================
 
+async function main() {
+  const { inputPath, targetTP } = validateInput();
+
+  try {
+    outputResult(await fixTruePeak(inputPath, { targetTP }));
+    process.exit(0);
   } catch (error) {
-    exitWithError('INTERNAL_ERROR', error.message);
+    exitWithError(error.code || 'INTERNAL_ERROR', error.message);
   }
 }
 
-// Executar
-main();
+// Executar se chamado diretamente
+if (require.main === module) {
+  main();
+}
+
+// Exportar para uso programático
+module.exports = { fixTruePeak, DEFAULT_TARGET_TP, SAFETY_MARGIN };
@@ -35,13 +35,9 @@
  *   const result = await runProcess({ inputPath, outputPath, genreKey, mode, rescue: true });
  */
 
-const { execFile } = require('child_process');
-const { promisify } = require('util');
 const path = require('path');
 const fs = require('fs');
 
-const execFileAsync = promisify(execFile);
-
 // ============================================================================
 // CONSTANTES
 // ============================================================================
@@ -50,43 +46,48 @@ const TP_CEILING = -1.0; // dBTP fixo para TODOS os modos (V1)
 const VALID_MODES = ['STREAMING', 'BALANCED', 'IMPACT'];
 const MAX_RENDERS = 2; // primary + CLEAN fallback
 
-// Caminhos dos scripts (todos no mesmo diretório)
-const SCRIPTS = {
-  measureAudio:   path.resolve(__dirname, 'measure-audio.cjs'),
-  checkAptitude:  path.resolve(__dirname, 'check-aptitude.cjs'),
-  rescueMode:     path.resolve(__dirname, 'rescue-mode.cjs'),
-  postcheck:      path.resolve(__dirname, 'postcheck-audio.cjs'),
-  core:           path.resolve(__dirname, 'automaster-v1.cjs'),
-};
-
 // Dependências programáticas (sem subprocess)
 const { getMasterTargets } = require('./targets-adapter.cjs');
 const { recommendMode }    = require('./recommend-mode.cjs');
+const { measureAudio }     = require('./measure-audio.cjs');
+const { checkAptitude }    = require('./check-aptitude.cjs');
+const { runRescueMode }    = require('./rescue-mode.cjs');
+const { postcheckAudio }   = require('./postcheck-audio.cjs');
+const { runAutomasterCore } = require('./automaster-v1.cjs');
 
 // ============================================================================
-// HELPERS: EXECUÇÃO DE CHILD PROCESSES (JSON-only)
+// HELPERS: ETAPAS IN-PROCESS (mesmos argumentos posicionais das CLIs)
 // ============================================================================
 
-const EXEC_OPTS = { maxBuffer: 10 * 1024 * 1024, timeout: 300000 };
+const STAGES = {
+  measureAudio:  ([inputPath]) => measureAudio(inputPath),
+  checkAptitude: ([lufs_i, true_peak_db, target_lufs]) =>
+    checkAptitude({ lufs_i: parseFloat(lufs_i), true_peak_db: parseFloat(true_peak_db) }, parseFloat(target_lufs)),
+  rescueMode:    ([inputPath, outputPath]) => runRescueMode(inputPath, outputPath),
+  postcheck:     ([audioPath, mode]) => postcheckAudio(audioPath, mode),
+  core:          ([inputPath, outputPath, mode]) => runAutomasterCore({ inputPath, outputPath, mode }),
+};
+
+// Etapas cuja CLI devolve JSON de falha (exit 1) em vez de só stderr — mesmo contrato in-process
+const STAGE_FAILURE_RESULT = {
+  postcheck: (error) => ({
+    status: 'FAILED',
+    metrics: null,
+    tiers: { tier1_pass: false, tier2_pass: false, tier3_pass: false, reasons: [error.message] },
+    recommended_action: 'ABORT'
+  }),
+  core: (error) => ({ success: false, error: error.message, stack: error.stack }),
+};
 
 /**
- * Executa um script child e parseia JSON do stdout.
- * Trata exit code 1 que retorna JSON válido no stdout (ex: check-aptitude NÃO_APTA).
+ * Executa uma etapa in-process (antes: `node <script>.cjs ...` + parse do stdout).
  */
-async function execScript(scriptPath, args = []) {
+async function runStage(stage, args = []) {
   try {
-    const { stdout } = await execFileAsync('node', [scriptPath, ...args], EXEC_OPTS);
-    return JSON.parse(stdout.trim());
+    return await STAGES[stage](args);
   } catch (error) {
-    // Alguns scripts usam exit(1) mas retornam JSON no stdout (ex: check-aptitude)
-    if (error.stdout) {
-      try {
-        return JSON.parse(error.stdout.trim());
-      } catch (_) {
-        // Não é JSON válido — propagar erro original
-      }
-    }
-    throw new Error(`Script falhou [${path.basename(scriptPath)}]: ${error.message}`);
+    if (STAGE_FAILURE_RESULT[stage]) return STAGE_FAILURE_RESULT[stage](error);
+    throw new Error(`Etapa falhou [${stage}]: ${error.message}`);
   }
 }
 
@@ -191,10 +192,10 @@ async function runPrecheck({ inputPath, genreKey, mode = 'BALANCED' }) {
     };
   }
 
-  // 3. MEDIÇÃO (via child process — JSON puro)
+  // 3. MEDIÇÃO (in-process)
   let measured;
   try {
-    measured = await execScript(SCRIPTS.measureAudio, [resolvedInput]);
+    measured = await runStage('measureAudio', [resolvedInput]);
   } catch (error) {
     return {
       phase: 'PRECHECK',
@@ -210,7 +211,7 @@ async function runPrecheck({ inputPath, genreKey, mode = 'BALANCED' }) {
   // 4. GATE DE APTIDÃO (usa targetLufs do gênero, não do modo)
   let aptitude;
   try {
-    aptitude = await execScript(SCRIPTS.checkAptitude, [
+    aptitude = await runStage('checkAptitude', [
       measured.lufs_i.toString(),
       measured.true_peak_db.toString(),
       targets.targetLufs.toString()
@@ -328,7 +329,7 @@ async function runProcess({ inputPath, outputPath, genreKey, mode, rescue = fals
   // 3. MEDIÇÃO INICIAL
   let measured;
   try {
-    measured = await execScript(SCRIPTS.measureAudio, [resolvedInput]);
+    measured = await runStage('measureAudio', [resolvedInput]);
   } catch (error) {
     return {
       phase: 'PROCESS',
@@ -344,7 +345,7 @@ async function runProcess({ inputPath, outputPath, genreKey, mode, rescue = fals
   // 4. GATE DE APTIDÃO (targetLufs do gênero)
   let aptitude;
   try {
-    aptitude = await execScript(SCRIPTS.checkAptitude, [
+    aptitude = await runStage('checkAptitude', [
       measured.lufs_i.toString(),
       measured.true_peak_db.toString(),
       targetLufs.toString()
@@ -393,7 +394,7 @@ async function runProcess({ inputPath, outputPath, genreKey, mode, rescue = fals
     const rescueTmpPath = path.join(inputDir, `${inputName}_rescue_tmp.wav`);
 
     try {
-      rescueResult = await execScript(SCRIPTS.rescueMode, [resolvedInput, rescueTmpPath]);
+      rescueResult = await runStage('rescueMode', [resolvedInput, rescueTmpPath]);
     } catch (error) {
       return {
         phase: 'PROCESS',
@@ -432,7 +433,7 @@ async function runProcess({ inputPath, outputPath, genreKey, mode, rescue = fals
   let primaryResult;
   try {
     renderCount++;
-    primaryResult = await execScript(SCRIPTS.core, [
+    primaryResult = await runStage('core', [
       inputForMaster,
       resolvedOutput,
       targetLufs.toString(),
@@ -455,7 +456,7 @@ async function runProcess({ inputPath, outputPath, genreKey, mode, rescue = fals
   // 7. POSTCHECK DO RENDER PRIMÁRIO
   let postcheck1;
   try {
-    postcheck1 = await execScript(SCRIPTS.postcheck, [resolvedOutput, validMode]);
+    postcheck1 = await runStage('postcheck', [resolvedOutput, validMode]);
   } catch (error) {
     cleanupTempFiles(rescueResult);
     return {
@@ -509,7 +510,7 @@ async function runProcess({ inputPath, outputPath, genreKey, mode, rescue = fals
     let cleanResult;
     try {
       renderCount++;
-      cleanResult = await execScript(SCRIPTS.core, [
+      cleanResult = await runStage('core', [
         inputForMaster,
         resolvedOutput,
         targetLufs.toString(),
@@ -534,7 +535,7 @@ async function runProcess({ inputPath, outputPath, genreKey, mode, rescue = fals
     // Postcheck do CLEAN
     let postcheck2;
     try {
-      postcheck2 = await execScript(SCRIPTS.postcheck, [resolvedOutput, validMode]);
+      postcheck2 = await runStage('postcheck', [resolvedOutput, validMode]);
     } catch (error) {
       cleanupTempFiles(rescueResult);
       return {
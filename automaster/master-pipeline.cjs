@@ -4,6 +4,9 @@
  * Pipeline autônomo para execução via child_process.exec
  * Retorna SOMENTE JSON no stdout (sem banners, emojis ou logs decorativos)
  * 
+ * Etapas (precheck, medição, aptidão, rescue, core, fix-true-peak, postcheck) rodam
+ * in-process — só ffmpeg/ffprobe são subprocessos. Workers: pipeline-thread.cjs.
+ * 
  * Uso: node master-pipeline.cjs <inputPath> <outputPath> <mode>
  * 
  * Sucesso: exit(0) + JSON no stdout
@@ -34,13 +37,14 @@ async function hashFile(filePath) {
 
 const VALID_MODES = ['STREAMING', 'LOW', 'MEDIUM', 'HIGH', 'EXTREME'];
 
-const MEASURE_AUDIO_SCRIPT = path.resolve(__dirname, 'measure-audio.cjs');
-const CHECK_APTITUDE_SCRIPT = path.resolve(__dirname, 'check-aptitude.cjs');
-const RESCUE_MODE_SCRIPT = path.resolve(__dirname, 'rescue-mode.cjs');
-const PRECHECK_SCRIPT = path.resolve(__dirname, 'precheck-audio.cjs');
-const FIX_TP_SCRIPT = path.resolve(__dirname, 'fix-true-peak.cjs');
-const RUN_AUTOMASTER_SCRIPT = path.resolve(__dirname, 'run-automaster.cjs');
-const POSTCHECK_SCRIPT = path.resolve(__dirname, 'postcheck-audio.cjs');
+// Etapas in-process (cada uma continua disponível como CLI: node <etapa>.cjs ...)
+const { measureAudio } = require('./measure-audio.cjs');
+const { checkAptitude } = require('./check-aptitude.cjs');
+const { runRescueMode: rescueGainOnly } = require('./rescue-mode.cjs');
+const { precheckAudio } = require('./precheck-audio.cjs');
+const { fixTruePeak } = require('./fix-true-peak.cjs');
+const { runAutomaster } = require('./run-automaster.cjs');
+const { postcheckAudio } = require('./postcheck-audio.cjs');
 
 // ============================================================================
 // FUNÇÕES AUXILIARES SILENCIOSAS
@@ -86,91 +90,32 @@ function validateOutput(outputPath) {
 
 async function runMeasureAudio(inputPath) {
   try {
-    const { stdout } = await execFileAsync(
-      'node',
-      [MEASURE_AUDIO_SCRIPT, inputPath],
-      { maxBuffer: 10 * 1024 * 1024, timeout: 120000 }
-    );
-
-    return JSON.parse(stdout.trim());
+    return await measureAudio(inputPath);
   } catch (error) {
-    if (error instanceof SyntaxError) {
-      throw new Error(`Medição retornou JSON invalido: ${error.message}`);
-    }
     throw new Error(`Erro ao medir audio: ${error.message}`);
   }
 }
 
 async function runCheckAptitude(lufs_i, true_peak_db, targetLufs) {
   try {
-    const { stdout } = await execFileAsync(
-      'node',
-      [CHECK_APTITUDE_SCRIPT, lufs_i.toString(), true_peak_db.toString(), targetLufs.toString()],
-      { maxBuffer: 10 * 1024 * 1024, timeout: 30000 }
-    );
-
-    return JSON.parse(stdout.trim());
+    return checkAptitude({ lufs_i, true_peak_db }, targetLufs);
   } catch (error) {
-    // Exit code 1 significa NÃO_APTA, mas stdout contém o JSON correto
-    if (error.stdout) {
-      try {
-        return JSON.parse(error.stdout.trim());
-      } catch (parseError) {
-        throw new Error(`Checagem de aptidão retornou JSON invalido: ${parseError.message}`);
-      }
-    }
     throw new Error(`Erro ao checar aptidão: ${error.message}`);
   }
 }
 
 async function runRescueMode(inputPath, tmpOutputPath) {
   try {
-    const { stdout } = await execFileAsync(
-      'node',
-      [RESCUE_MODE_SCRIPT, inputPath, tmpOutputPath],
-      { maxBuffer: 10 * 1024 * 1024, timeout: 180000 }
-    );
-
-    return JSON.parse(stdout.trim());
+    // ABORT_UNSAFE_INPUT volta como resultado (não como erro)
+    return await rescueGainOnly(inputPath, tmpOutputPath);
   } catch (error) {
-    // Exit code 1 pode ser ABORT_UNSAFE, mas stdout contém o JSON
-    if (error.stdout) {
-      try {
-        return JSON.parse(error.stdout.trim());
-      } catch (parseError) {
-        throw new Error(`Rescue Mode retornou JSON invalido: ${parseError.message}`);
-      }
-    }
     throw new Error(`Erro ao executar Rescue Mode: ${error.message}`);
   }
 }
 
 async function runPrecheck(inputPath) {
-  let stdout;
-
-  try {
-    const result = await execFileAsync(
-      'node',
-      [PRECHECK_SCRIPT, inputPath],
-      { maxBuffer: 10 * 1024 * 1024, timeout: 60000 }
-    );
-    stdout = result.stdout;
-  } catch (error) {
-    stdout = error.stdout;
-
-    if (!stdout) {
-      throw new Error(`Erro ao executar precheck: ${error.message}`);
-    }
-
-    console.warn('[PRECHECK NON-ZERO EXIT] usando stdout mesmo com erro');
-  }
-
-  let parsed;
-  try {
-    parsed = JSON.parse(stdout.trim());
-  } catch (syntaxErr) {
-    throw new Error(`Precheck retornou JSON invalido: ${syntaxErr.message}`);
-  }
+  // precheckAudio nunca lança: erros internos voltam como BLOCKED "[CODE] mensagem"
+  const parsed = await precheckAudio(inputPath);
 
   console.error('[PRECHECK RESULT]', parsed);
 
@@ -187,46 +132,18 @@ async function runPrecheck(inputPath) {
 
 async function runFixTruePeak(inputPath) {
   try {
-    const { stdout } = await execFileAsync(
-      'node',
-      [FIX_TP_SCRIPT, inputPath],
-      { maxBuffer: 10 * 1024 * 1024, timeout: 120000 }
-    );
-
-    return JSON.parse(stdout.trim());
+    return await fixTruePeak(inputPath);
   } catch (error) {
-    if (error instanceof SyntaxError) {
-      throw new Error(`Fix True Peak retornou JSON invalido: ${error.message}`);
-    }
     throw new Error(`Erro ao executar fix-true-peak: ${error.message}`);
   }
 }
 
 async function runMaster(inputPath, outputPath, mode, strategy) {
   try {
-    const args = [RUN_AUTOMASTER_SCRIPT, inputPath, outputPath, mode];
-    if (strategy) args.push(strategy);
-
-    const { stdout } = await execFileAsync(
-      'node',
-      args,
-      { maxBuffer: 10 * 1024 * 1024, timeout: 720000 }  // 12min — margem acima do timeout interno de run-automaster (11min)
-    );
-
-    return JSON.parse(stdout.trim());
+    return await runAutomaster({ inputPath, outputPath, mode, strategy });
   } catch (error) {
-    // Exit code != 0 mas stdout pode conter JSON válido (ex: validation_passed=false com success=true)
-    if (error.stdout) {
-      try {
-        return JSON.parse(error.stdout.trim());
-      } catch (parseError) {
-        throw new Error(`Masterizacao retornou JSON invalido: ${parseError.message}`);
-      }
-    }
-    if (error instanceof SyntaxError) {
-      throw new Error(`Masterizacao retornou JSON invalido: ${error.message}`);
-    }
-    throw new Error(`Erro ao executar masterizacao: ${error.message}`);
+    // Mesmo contrato da CLI de run-automaster: falha vira JSON success=false (não exceção)
+    return { ok: false, success: false, error: error.message, stack: error.stack };
   }
 }
 
@@ -361,17 +278,8 @@ async function runSafeModeDelivery(inputPath, outputPath) {
 
 async function runPostcheck(outputPath, mode) {
   try {
-    const { stdout } = await execFileAsync(
-      'node',
-      [POSTCHECK_SCRIPT, outputPath, mode],
-      { maxBuffer: 10 * 1024 * 1024, timeout: 60000 }
-    );
-
-    return JSON.parse(stdout.trim());
+    return await postcheckAudio(outputPath, mode);
   } catch (error) {
-    if (error instanceof SyntaxError) {
-      throw new Error(`Postcheck retornou JSON invalido: ${error.message}`);
-    }
     throw new Error(`Erro ao executar postcheck: ${error.message}`);
   }
 }
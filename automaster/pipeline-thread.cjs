@@ -0,0 +1,241 @@
+/**
+ * AutoMaster V1 - Execução do pipeline em worker_threads
+ *
+ * Substitui o `node master-pipeline.cjs` por job: o pipeline roda in-process numa thread
+ * reaproveitada (sem cold start do node nem re-require dos módulos a cada job).
+ *
+ * - Uma thread executa UM job por vez; o pool cresce até a concorrência do chamador
+ * - Reciclagem após AUTOMASTER_THREAD_MAX_JOBS jobs (memória do DSP não acumula)
+ * - Timeout: worker.terminate() — mesma garantia do kill do execFile
+ * - stdout/stderr da thread capturados por job e devolvidos junto do resultado (diagnóstico)
+ * - AUTOMASTER_EXECUTION=inline: roda no próprio processo (sem isolamento; timeout só rejeita)
+ * - settings.pipelineModule: outro módulo com runMasterPipeline (testes); threads não são
+ *   compartilhadas entre módulos
+ *
+ * Contrato de resultado = CLI do master-pipeline: erros viram { ok: false, success: false, error }.
+ *
+ * Uso Programático:
+ *   const { runPipeline } = require('./pipeline-thread.cjs');
+ *   const { result, stderr } = await runPipeline({ inputPath, outputPath, mode, safeMode }, { timeoutMs: 300000 });
+ */
+
+const path = require('path');
+const { Worker, isMainThread, parentPort, workerData } = require('worker_threads');
+
+const THREAD_ROLE = 'automaster-pipeline';
+const EXECUTION_MODE = (process.env.AUTOMASTER_EXECUTION || 'thread').toLowerCase();
+const MAX_JOBS_PER_THREAD = parseInt(process.env.AUTOMASTER_THREAD_MAX_JOBS || '20', 10);
+const DEFAULT_TIMEOUT_MS = 300000;
+const MAX_CAPTURE_BYTES = 10 * 1024 * 1024; // mesmo maxBuffer do execFile antigo
+const DEFAULT_PIPELINE_MODULE = path.join(__dirname, 'master-pipeline.cjs');
+
+/**
+ * @typedef {Object} PipelineOptions
+ * @property {string} inputPath
+ * @property {string} outputPath
+ * @property {string} mode - STREAMING | LOW | MEDIUM | HIGH | EXTREME
+ * @property {boolean} [rescueMode=false]
+ * @property {boolean} [safeMode=false]
+ */
+
+/**
+ * @typedef {Object} PipelineRun
+ * @property {Object} result - JSON do master-pipeline (sucesso ou { ok: false, success: false, error })
+ * @property {string} stdout
+ * @property {string} stderr
+ * @property {number} duration_ms
+ * @property {'thread'|'inline'} execution
+ */
+
+function toCliResult(error) {
+  return { ok: false, success: false, error: error.message || String(error) };
+}
+
+function timeoutError(timeoutMs) {
+  const error = new Error(`Pipeline excedeu timeout de ${timeoutMs / 1000}s`);
+  error.code = 'PIPELINE_TIMEOUT';
+  error.killed = true;
+  return error;
+}
+
+// ============================================================================
+// LADO DA THREAD
+// ============================================================================
+
+if (!isMainThread && workerData && workerData.role === THREAD_ROLE) {
+  const { runMasterPipeline } = require(workerData.pipelineModule);
+
+  // Captura no lado da thread (worker.stdout/stderr no pai seguram o event loop mesmo com unref)
+  const captured = { stdout: '', stderr: '' };
+  for (const key of ['stdout', 'stderr']) {
+    process[key].write = (chunk, encoding, callback) => {
+      if (captured[key].length < MAX_CAPTURE_BYTES) captured[key] += chunk.toString();
+      const done = typeof encoding === 'function' ? encoding : callback;
+      if (typeof done === 'function') done();
+      return true;
+    };
+  }
+
+  parentPort.on('message', async ({ id, options }) => {
+    captured.stdout = '';
+    captured.stderr = '';
+    let result;
+    try {
+      result = await runMasterPipeline(options);
+    } catch (error) {
+      result = toCliResult(error);
+    }
+    parentPort.postMessage({ id, result, stdout: captured.stdout.trim(), stderr: captured.stderr.trim() });
+  });
+}
+
+// ============================================================================
+// POOL (lado do processo principal)
+// ============================================================================
+
+const idleThreads = [];
+const busyThreads = new Set();
+let nextJobId = 1;
+
+function createThread(pipelineModule) {
+  const worker = new Worker(__filename, { workerData: { role: THREAD_ROLE, pipelineModule } });
+  const thread = { worker, pipelineModule, jobsRun: 0, current: null };
+
+  worker.on('message', ({ id, result, stdout, stderr }) => {
+    const job = thread.current;
+    if (!job || job.id !== id) return;
+    finishJob(thread, () => job.resolve({ result, stdout, stderr }));
+  });
+
+  worker.on('error', (error) => {
+    const job = thread.current;
+    discardThread(thread);
+    if (job) finishJob(thread, () => job.reject(error), true);
+  });
+
+  worker.on('exit', (code) => {
+    const job = thread.current;
+    discardThread(thread);
+    if (job) finishJob(thread, () => job.reject(new Error(`Thread do pipeline encerrou (code ${code})`)), true);
+  });
+
+  return thread;
+}
+
+function discardThread(thread) {
+  thread.discarded = true;
+  busyThreads.delete(thread);
+  const index = idleThreads.indexOf(thread);
+  if (index >= 0) idleThreads.splice(index, 1);
+}
+
+function finishJob(thread, settle, failed = false) {
+  const job = thread.current;
+  thread.current = null;
+  clearTimeout(job.timer);
+  busyThreads.delete(thread);
+
+  if (!failed && !thread.discarded) {
+    thread.jobsRun++;
+    if (thread.jobsRun >= MAX_JOBS_PER_THREAD) {
+      // Reciclar: próxima execução pega uma thread nova
+      discardThread(thread);
+      thread.worker.terminate().catch(() => {});
+    } else {
+      thread.worker.unref(); // thread ociosa não segura o event loop
+      idleThreads.push(thread);
+    }
+  }
+
+  settle();
+}
+
+function acquireThread(pipelineModule) {
+  const index = idleThreads.map(t => t.pipelineModule).lastIndexOf(pipelineModule);
+  const thread = index >= 0 ? idleThreads.splice(index, 1)[0] : createThread(pipelineModule);
+  thread.worker.ref();
+  busyThreads.add(thread);
+  return thread;
+}
+
+function runInThread(options, timeoutMs, pipelineModule) {
+  return new Promise((resolve, reject) => {
+    const thread = acquireThread(pipelineModule);
+    const job = { id: nextJobId++, resolve, reject };
+
+    job.timer = setTimeout(() => {
+      // Sem cooperação do DSP: a thread inteira é descartada (ffmpeg em andamento segue até o
+      // próprio timeout, como acontecia no kill do processo node)
+      const current = thread.current;
+      discardThread(thread);
+      thread.worker.terminate().catch(() => {});
+      if (current) finishJob(thread, () => current.reject(timeoutError(timeoutMs)), true);
+    }, timeoutMs);
+
+    thread.current = job;
+    thread.worker.postMessage({ id: job.id, options });
+  });
+}
+
+async function runInline(options, timeoutMs, pipelineModule) {
+  const { runMasterPipeline } = require(pipelineModule);
+  let timer;
+  const timeout = new Promise((_, reject) => {
+    timer = setTimeout(() => reject(timeoutError(timeoutMs)), timeoutMs);
+  });
+
+  try {
+    const result = await Promise.race([
+      runMasterPipeline(options).catch(toCliResult),
+      timeout
+    ]);
+    return { result, stdout: '', stderr: '' };
+  } finally {
+    clearTimeout(timer);
+  }
+}
+
+/**
+ * Executa o master-pipeline sem subprocess node.
+ *
+ * @param {PipelineOptions} options
+ * @param {Object} [settings]
+ * @param {number} [settings.timeoutMs=300000]
+ * @param {'thread'|'inline'} [settings.execution] - padrão: AUTOMASTER_EXECUTION ou 'thread'
+ * @param {string} [settings.pipelineModule] - caminho absoluto; padrão: master-pipeline.cjs
+ * @returns {Promise<PipelineRun>}
+ * @throws {Error} timeout (code PIPELINE_TIMEOUT) ou thread encerrada inesperadamente
+ */
+async function runPipeline(options, {
+  timeoutMs = DEFAULT_TIMEOUT_MS,
+  execution = EXECUTION_MODE,
+  pipelineModule = DEFAULT_PIPELINE_MODULE
+} = {}) {
+  const startTime = Date.now();
+  const mode = execution === 'inline' ? 'inline' : 'thread';
+  const run = mode === 'inline'
+    ? await runInline(options, timeoutMs, pipelineModule)
+    : await runInThread(options, timeoutMs, pipelineModule);
+
+  return { ...run, duration_ms: Date.now() - startTime, execution: mode };
+}
+
+/**
+ * Encerra as threads ociosas e em uso (graceful shutdown)
+ */
+async function shutdownPipelineThreads() {
+  const threads = [...idleThreads, ...busyThreads];
+  idleThreads.length = 0;
+  busyThreads.clear();
+  await Promise.all(threads.map(thread => {
+    thread.discarded = true;
+    return thread.worker.terminate().catch(() => {});
+  }));
+}
+
+module.exports = {
+  runPipeline,
+  shutdownPipelineThreads,
+  EXECUTION_MODE,
+  MAX_JOBS_PER_THREAD
+};
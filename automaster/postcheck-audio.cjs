@@ -51,15 +51,19 @@ async function validateArgs() {
   if (args.length < 2) {
     exitError('Uso: node postcheck-audio.cjs <audioPath> <mode>');
   }
-  const audioPath = path.resolve(args[0]);
-  const mode = args[1] ? args[1].toUpperCase() : null;
+  return { audioPath: args[0], mode: args[1] };
+}
+
+function validateOptions(rawAudioPath, rawMode) {
+  const audioPath = path.resolve(rawAudioPath);
+  const mode = rawMode ? String(rawMode).toUpperCase() : null;
 
   if (!fs.existsSync(audioPath)) {
-    exitError(`Arquivo nao encontrado: ${audioPath}`);
+    throw new Error(`Arquivo nao encontrado: ${audioPath}`);
   }
 
   if (!MODE_TARGETS[mode]) {
-    exitError(`Mode invalido: ${mode}`);
+    throw new Error(`Mode invalido: ${mode}`);
   }
 
   return { audioPath, mode };
@@ -137,8 +141,16 @@ async function estimateDynamicRange(inputPath) {
   }
 }
 
-async function run() {
-  const { audioPath, mode } = await validateArgs();
+/**
+ * Postcheck técnico do render (sem subprocess node; ffmpeg/ffprobe continuam externos).
+ *
+ * @param {string} audioPath - WAV renderizado
+ * @param {string} mode - STREAMING | LOW | MEDIUM | HIGH | EXTREME | CLEAN
+ * @returns {Promise<{status: 'OK'|'FAILED', metrics: Object, tiers: Object, recommended_action: 'OK'|'FALLBACK_CLEAN'|'ABORT'}>}
+ * @throws {Error} arquivo inexistente ou modo inválido
+ */
+async function postcheckAudio(rawAudioPath, rawMode) {
+  const { audioPath, mode } = validateOptions(rawAudioPath, rawMode);
 
   const basic = await getBasicMetrics(audioPath);
   const loud = await getLoudnessMetrics(audioPath);
@@ -216,16 +228,25 @@ async function run() {
 
   const status = recommended_action === 'OK' ? 'OK' : 'FAILED';
 
-  const out = {
+  return {
     status,
     metrics,
     tiers,
     recommended_action
   };
+}
+
+async function run() {
+  const { audioPath, mode } = await validateArgs();
+  exitWithJson(await postcheckAudio(audioPath, mode), 0);
+}
 
-  exitWithJson(out, recommended_action === 'OK' ? 0 : 0);
+// Executar se chamado diretamente
+if (require.main === module) {
+  run().catch(err => {
+    exitError(err.message || String(err));
+  });
 }
 
-run().catch(err => {
-  exitError(err.message || String(err));
-});
+// Exportar para uso programático
+module.exports = { postcheckAudio, MODE_TARGETS };
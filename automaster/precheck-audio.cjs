@@ -60,17 +60,30 @@ function validateInput() {
     exitWithError('INVALID_ARGS', 'Uso: node precheck-audio.cjs <input.wav>');
   }
 
-  const inputPath = path.resolve(args[0]);
+  return args[0];
+}
+
+/**
+ * Erro com código de gate (vira reason "[CODE] mensagem")
+ */
+function precheckError(code, message) {
+  const error = new Error(message);
+  error.code = code;
+  return error;
+}
+
+function validateInputFile(rawInputPath) {
+  const inputPath = path.resolve(rawInputPath);
 
   // Validar existência
   if (!fs.existsSync(inputPath)) {
-    exitWithError('FILE_NOT_FOUND', `Arquivo não encontrado: ${inputPath}`);
+    throw precheckError('FILE_NOT_FOUND', `Arquivo não encontrado: ${inputPath}`);
   }
 
   // Validar extensão
   const ext = path.extname(inputPath).toLowerCase();
   if (ext !== '.wav') {
-    exitWithError('INVALID_FORMAT', `Apenas WAV é suportado (recebido: ${ext})`);
+    throw precheckError('INVALID_FORMAT', `Apenas WAV é suportado (recebido: ${ext})`);
   }
 
   return inputPath;
@@ -188,15 +201,18 @@ function getBasicMetrics(inputPath) {
 
         // Validar valores
         if (isNaN(duration) || duration < MIN_DURATION_SEC) {
-          exitWithError('INVALID_DURATION', `Duração mínima: ${MIN_DURATION_SEC}s (encontrado: ${duration.toFixed(1)}s)`);
+          reject(precheckError('INVALID_DURATION', `Duração mínima: ${MIN_DURATION_SEC}s (encontrado: ${duration.toFixed(1)}s)`));
+          return;
         }
 
         if (!VALID_SAMPLE_RATES.includes(sampleRate)) {
-          exitWithError('INVALID_SAMPLE_RATE', `Sample rate inválido: ${sampleRate} (aceito: ${VALID_SAMPLE_RATES.join(', ')})`);
+          reject(precheckError('INVALID_SAMPLE_RATE', `Sample rate inválido: ${sampleRate} (aceito: ${VALID_SAMPLE_RATES.join(', ')})`));
+          return;
         }
 
         if (!VALID_CHANNELS.includes(channels)) {
-          exitWithError('INVALID_CHANNELS', `Canais inválidos: ${channels} (aceito: mono/stereo)`);
+          reject(precheckError('INVALID_CHANNELS', `Canais inválidos: ${channels} (aceito: mono/stereo)`));
+          return;
         }
 
         resolve({
@@ -426,15 +442,22 @@ function exitWithError(code, message) {
 }
 
 // ============================================================
-// MAIN
+// API PROGRAMÁTICA
 // ============================================================
 
-async function main() {
+/**
+ * Precheck técnico (sem subprocess node). Nunca lança: erros viram BLOCKED com
+ * reason "[CODE] mensagem" — mesmo contrato do JSON da CLI.
+ *
+ * @param {string} inputPath - WAV de entrada
+ * @returns {Promise<{status: 'OK'|'WARNING'|'BLOCKED', reason: string, metrics: Object|null}>}
+ */
+async function precheckAudio(rawInputPath) {
   let normalizedPath = null;
 
   try {
     // 1. Validar entrada
-    const inputPath = validateInput();
+    const inputPath = validateInputFile(rawInputPath);
 
     // 2. Verificar FFmpeg
     await checkFFmpeg();
@@ -447,26 +470,40 @@ async function main() {
 
     // 5. Classificar
     const { status, reason } = classify(metrics);
-
-    // 6. Saída JSON pura
-    outputResult(status, reason, metrics);
-
-    // Cleanup antes de sair
-    if (normalizedPath && fs.existsSync(normalizedPath)) {
-      try { fs.unlinkSync(normalizedPath); } catch (_) {}
-    }
-
-    // Exit code baseado em status
-    process.exit(status === 'BLOCKED' ? 1 : 0);
+    return { status, reason, metrics };
 
   } catch (error) {
-    // Cleanup em caso de erro
+    return {
+      status: 'BLOCKED',
+      reason: `[${error.code || 'INTERNAL_ERROR'}] ${error.message}`,
+      metrics: null
+    };
+  } finally {
+    // Cleanup do arquivo normalizado
     if (normalizedPath && fs.existsSync(normalizedPath)) {
       try { fs.unlinkSync(normalizedPath); } catch (_) {}
     }
-    exitWithError('INTERNAL_ERROR', error.message);
   }
 }
 
-// Executar
-main();
+// ============================================================
+// MAIN (CLI)
+// ============================================================
+
+async function main() {
+  const { status, reason, metrics } = await precheckAudio(validateInput());
+
+  // Saída JSON pura
+  outputResult(status, reason, metrics);
+
+  // Exit code baseado em status
+  process.exit(status === 'BLOCKED' ? 1 : 0);
+}
+
+// Executar se chamado diretamente
+if (require.main === module) {
+  main();
+}
+
+// Exportar para uso programático
+module.exports = { precheckAudio, GATE_RULES };
@@ -15,9 +15,9 @@
  *   await runAutomaster({ inputPath, outputPath, mode: "MEDIUM" });
  */
 
-const { execFile } = require('child_process');
 const fs = require('fs');
 const path = require('path');
+const { runAutomasterCore } = require('./automaster-v1.cjs');
 
 // ============================================================
 // MAPEAMENTO DE MODOS
@@ -185,97 +185,26 @@ function validateInput(options) {
 // EXECUÇÃO DO CORE ENGINE
 // ============================================================
 
-function executeCoreEngine(inputPath, outputPath, mode, strategy) {
-  return new Promise((resolve, reject) => {
-    const corePath = path.join(__dirname, 'automaster-v1.cjs');
-    const debug = process.env.DEBUG_PIPELINE === 'true';
-
-    // Verificar se o core existe
-    if (!fs.existsSync(corePath)) {
-      reject(new Error(`Core engine nao encontrado: ${corePath}`));
-      return;
-    }
-
-    // Passar mode diretamente ao core — sem conversão
-    const args = [
-      corePath,
-      inputPath,
-      outputPath,
-      mode
-    ];
-
-    if (strategy) {
-      args.push(strategy);
-    }
-
-    const nodeProcess = execFile('node', args, {
-      maxBuffer: 10 * 1024 * 1024,
-      timeout: 660000,  // 11min — HIGH mode POOR mix: 7 iter (~210s) + AUDIT (~120s) + loudnorm (~180s)
-      cwd: __dirname,
-      env: Object.assign({}, process.env, { AUTOMASTER_STRATEGY: strategy || '' })
-    });
-
-    let stdoutData = '';
-    let stderrData = '';
-
-    // Capturar stdout (deve conter SOMENTE JSON)
-    nodeProcess.stdout.on('data', (data) => {
-      stdoutData += data.toString();
-    });
+/**
+ * Chama o core in-process (antes: `node automaster-v1.cjs` em subprocess).
+ * strategy não é consumida pelo core (era repassada só via env AUTOMASTER_STRATEGY, sem leitor).
+ * Timeout: responsabilidade do chamador (pipeline-thread.cjs encerra a thread inteira).
+ */
+async function executeCoreEngine(inputPath, outputPath, mode, strategy) {
+  const debug = process.env.DEBUG_PIPELINE === 'true';
 
-    // Capturar stderr (logs de debug)
-    nodeProcess.stderr.on('data', (data) => {
-      stderrData += data.toString();
-      if (debug) {
-        process.stderr.write(data);
-      }
-    });
+  let result;
+  try {
+    result = await runAutomasterCore({ inputPath, outputPath, mode });
+  } catch (error) {
+    throw new Error(`Core engine falhou: ${error.message}`);
+  }
 
-    nodeProcess.on('close', (code) => {
-      if (code === null) {
-        reject(new Error('Core engine timeout: DSP chain excedeu 5.5 minutos sem resposta'));
-        return;
-      }
-      if (code === 0) {
-        // Validar se stdout começa com '{'
-        const trimmed = stdoutData.trim();
-        
-        if (debug) {
-          console.error('[DEBUG] Core stdout length:', trimmed.length);
-          console.error('[DEBUG] Core stdout (first 200 chars):', trimmed.substring(0, 200));
-          console.error('[DEBUG] Core stderr:', stderrData);
-        }
-        
-        if (!trimmed) {
-          reject(new Error('Core retornou stdout vazio'));
-          return;
-        }
-        
-        if (!trimmed.startsWith('{')) {
-          reject(new Error(`Core retornou saida invalida (nao comeca com JSON). Primeiros 100 chars: ${trimmed.substring(0, 100)}`));
-          return;
-        }
-
-        try {
-          const result = JSON.parse(trimmed);
-          
-          if (debug) {
-            console.error('[DEBUG] JSON parseado com sucesso:', JSON.stringify(result, null, 2));
-          }
-          
-          resolve(result);
-        } catch (parseError) {
-          reject(new Error(`Erro ao parsear JSON do core: ${parseError.message}. Stdout length: ${trimmed.length}, First 200 chars: ${trimmed.substring(0, 200)}`));
-        }
-      } else {
-        reject(new Error(`Core engine falhou com codigo ${code}. Stderr: ${stderrData}`));
-      }
-    });
+  if (debug) {
+    console.error('[DEBUG] Core result:', JSON.stringify(result, null, 2));
+  }
 
-    nodeProcess.on('error', (err) => {
-      reject(new Error(`Erro ao executar core engine: ${err.message}`));
-    });
-  });
+  return result;
 }
 
 // ============================================================
@@ -6,6 +6,7 @@
  *   1. targets-adapter.cjs   — resolução de gênero + targets
  *   2. recommend-mode.cjs    — recomendação determinística
  *   3. master-job.cjs        — PRECHECK + PROCESS
+ *   4. pipeline-thread.cjs   — etapas in-process + worker_thread (timeout/reciclagem)
  * 
  * Cada teste valida:
  *   - JSON puro no stdout (sem lixo)
@@ -22,6 +23,7 @@ const { execFile } = require('child_process');
 const { promisify } = require('util');
 const path = require('path');
 const fs = require('fs');
+const os = require('os');
 
 const execFileAsync = promisify(execFile);
 const EXEC_OPTS = { maxBuffer: 10 * 1024 * 1024, timeout: 300000 };
@@ -109,6 +111,7 @@ const AUTOMASTER_DIR = path.resolve(__dirname, '..');
 const ADAPTER     = path.join(AUTOMASTER_DIR, 'targets-adapter.cjs');
 const RECOMMEND   = path.join(AUTOMASTER_DIR, 'recommend-mode.cjs');
 const MASTER_JOB  = path.join(AUTOMASTER_DIR, 'master-job.cjs');
+const FIX_TP      = path.join(AUTOMASTER_DIR, 'fix-true-peak.cjs');
 const MUSICAS_DIR = path.join(AUTOMASTER_DIR, '..', 'musicas');
 
 // ============================================================================
@@ -232,6 +235,71 @@ async function runRecommendTests() {
   });
 }
 
+// ============================================================================
+// TESTES: API in-process + pipeline-thread.cjs (sem áudio)
+// ============================================================================
+
+async function runInProcessTests() {
+  process.stderr.write('\n=== PIPELINE IN-PROCESS ===\n');
+
+  const { runPipeline } = require('../pipeline-thread.cjs');
+  const missing = { inputPath: path.join(AUTOMASTER_DIR, 'nao-existe.wav'), outputPath: '/tmp/out.wav', mode: 'MEDIUM' };
+
+  await test('in-process: etapas exportam funções (require sem executar CLI)', async () => {
+    const stages = {
+      'precheck-audio.cjs': 'precheckAudio',
+      'fix-true-peak.cjs': 'fixTruePeak',
+      'postcheck-audio.cjs': 'postcheckAudio',
+      'automaster-v1.cjs': 'runAutomasterCore',
+      'master-pipeline.cjs': 'runMasterPipeline'
+    };
+    for (const [file, fn] of Object.entries(stages)) {
+      assertType(require(path.join(AUTOMASTER_DIR, file))[fn], 'function', `${file}.${fn}`);
+    }
+  });
+
+  await test('in-process: precheckAudio nunca lança (BLOCKED + [CODE])', async () => {
+    const { precheckAudio } = require('../precheck-audio.cjs');
+    const result = await precheckAudio(missing.inputPath);
+    assertEqual(result.status, 'BLOCKED', 'status');
+    assert(result.reason.startsWith('[FILE_NOT_FOUND]'), `reason: ${result.reason}`);
+  });
+
+  await test('in-process: CLI fix-true-peak continua com JSON de erro', async () => {
+    const { json, exitCode } = await execScriptJSON(FIX_TP, [missing.inputPath]);
+    assertEqual(json.status, 'ERROR', 'status');
+    assertEqual(json.code, 'FILE_NOT_FOUND', 'code');
+    assertEqual(exitCode, 1, 'exit code');
+  });
+
+  await test('pipeline-thread: erro vira JSON do contrato da CLI (thread e inline)', async () => {
+    for (const execution of ['thread', 'inline']) {
+      const run = await runPipeline(missing, { execution, timeoutMs: 30000 });
+      assertEqual(run.execution, execution, 'execution');
+      assertEqual(run.result.success, false, `${execution}: success`);
+      assert(/nao encontrado/.test(run.result.error), `${execution}: error = ${run.result.error}`);
+    }
+  });
+
+  await test('pipeline-thread: timeout encerra a thread e a próxima execução funciona', async () => {
+    // Estágio que nunca termina: o timeout é determinístico (um arquivo ausente falha em < 1 ms)
+    const stalledModule = path.join(os.tmpdir(), `automaster-stalled-pipeline-${process.pid}.cjs`);
+    fs.writeFileSync(stalledModule, 'module.exports = { runMasterPipeline: () => new Promise(() => {}) };\n');
+    try {
+      for (const execution of ['thread', 'inline']) {
+        const error = await runPipeline(missing, { execution, timeoutMs: 200, pipelineModule: stalledModule })
+          .then(() => null, err => err);
+        assert(error, `${execution}: esperado erro de timeout`);
+        assertEqual(error.code, 'PIPELINE_TIMEOUT', `${execution}: code`);
+      }
+    } finally {
+      fs.unlinkSync(stalledModule);
+    }
+    const run = await runPipeline(missing, { timeoutMs: 30000 });
+    assertEqual(run.result.success, false, 'success após timeout');
+  });
+}
+
 // ============================================================================
 // TESTES: master-job.cjs (requer áudio WAV)
 // ============================================================================
@@ -454,6 +522,7 @@ async function main() {
   // Testes unitários (sem áudio, rápidos)
   await runAdapterTests();
   await runRecommendTests();
+  await runInProcessTests();
 
   // Testes de integração (requer áudio)
   await runMasterJobTests();
@@ -0,0 +1,153 @@
+/**
+ * 📦 Analyzer Loader - SoundyAI
+ * Carregamento sob demanda dos blocos do analisador que só importam DEPOIS da análise
+ * (sugestões + camada de IA). Tira ~600 KB de JS do caminho crítico do index.html.
+ *
+ * - Prefetch em idle após o `load` ou na primeira interação do usuário
+ * - displayModalResults() aguarda ensureResults() antes de renderizar
+ * - AnalyzerLoader.report() mostra DOMContentLoaded / interativo / tempo de cada bloco
+ *
+ * Ordem dos scripts dentro de cada bloco = ordem antiga do index.html (async = false).
+ */
+
+(function() {
+    'use strict';
+
+    // Blocos sob demanda (manifesto também lido por work/tools/perf/frontend-budget.js)
+    const CHUNKS = {
+        suggestions: {
+            description: 'Motores de sugestão (render de resultados)',
+            deps: [],
+            scripts: [
+                'suggestion-scorer.js?v=20250920-enhanced',
+                'enhanced-suggestion-engine.js?v=20250920-enhanced',
+                'advanced-educational-suggestion-system.js?v=20250920-ultra',
+                'ultra-advanced-suggestion-enhancer-v2.js?v=20250920-ultra-v2',
+                'validador-integracao-ultra-avancado.js?v=20250920-validator',
+                'monitor-modal-ultra-avancado.js?v=20250920-monitor',
+                'suggestion-text-generator.js?v=20250815',
+                'suggestion-system-emergency.js?v=emergency-20250920',
+                // Antes injetado por audio-analyzer-integration.js (depois dos scripts acima)
+                'suggestion-system-unified.js'
+            ]
+        },
+        ai: {
+            description: 'Camada de IA das sugestões (modal de IA)',
+            deps: ['suggestions'],
+            scripts: [
+                'ai-suggestion-layer.js?v=20250922-ai-layer',
+                'ai-configuration-manager.js?v=20250922-config',
+                'ai-suggestion-ui-controller.js?v=20250922-ui',
+                'ai-suggestions-integration.js?v=20250922-integration',
+                'ai-suggestion-system-tester.js?v=20250922-test',
+                'ai-force-test.js?v=20250922-force',
+                'ai-auto-config.js?v=20250922-autoconfig',
+                'secure-api-loader.js?v=20250922-secure'
+            ]
+        }
+    };
+
+    const RESULTS_CHUNKS = ['suggestions', 'ai'];
+    const RESULTS_TIMEOUT_MS = 8000; // nunca segurar o render por rede lenta/erro
+    const IDLE_TIMEOUT_MS = 3000;
+
+    const pending = {};
+    const timings = [];
+
+    const now = () => (typeof performance !== 'undefined' ? performance.now() : Date.now());
+
+    function injectScript(src) {
+        return new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = src;
+            script.async = false; // executa na ordem de inserção
+            script.onload = () => resolve(src);
+            script.onerror = () => reject(new Error(`Falha ao carregar ${src}`));
+            document.head.appendChild(script);
+        });
+    }
+
+    /**
+     * Carrega um bloco (e dependências) uma única vez
+     */
+    function loadChunk(name) {
+        if (pending[name]) return pending[name];
+        const chunk = CHUNKS[name];
+        if (!chunk) return Promise.reject(new Error(`Bloco desconhecido: ${name}`));
+
+        pending[name] = Promise.all(chunk.deps.map(loadChunk))
+            .then(() => {
+                const start = now();
+                return Promise.all(chunk.scripts.map(injectScript)).then(() => {
+                    const ms = now() - start;
+                    timings.push({ chunk: name, ms: Math.round(ms), scripts: chunk.scripts.length, at: Math.round(now()) });
+                    log(`📦 [ANALYZER-LOADER] Bloco "${name}" carregado em ${ms.toFixed(0)} ms`);
+                    document.dispatchEvent(new CustomEvent('analyzer:chunk-loaded', { detail: { chunk: name, ms } }));
+                });
+            })
+            .catch((err) => {
+                delete pending[name]; // permite nova tentativa
+                warn(`⚠️ [ANALYZER-LOADER] ${err.message}`);
+                throw err;
+            });
+        return pending[name];
+    }
+
+    function load(...names) {
+        return Promise.all(names.map(loadChunk));
+    }
+
+    function isLoaded(name) {
+        return timings.some(t => t.chunk === name);
+    }
+
+    /**
+     * Garante os blocos do render de resultados (com teto de espera)
+     */
+    function ensureResults(timeoutMs = RESULTS_TIMEOUT_MS) {
+        if (RESULTS_CHUNKS.every(isLoaded)) return Promise.resolve(true);
+        const timeout = new Promise(resolve => setTimeout(() => resolve(false), timeoutMs));
+        return Promise.race([load(...RESULTS_CHUNKS).then(() => true), timeout]).catch(() => false);
+    }
+
+    function prefetch() {
+        load(...RESULTS_CHUNKS).catch(() => {});
+    }
+
+    /**
+     * Relatório de carregamento (DevTools: AnalyzerLoader.report())
+     */
+    function report() {
+        const nav = performance.getEntriesByType?.('navigation')?.[0];
+        const summary = {
+            domInteractiveMs: nav ? Math.round(nav.domInteractive) : null,
+            domContentLoadedMs: nav ? Math.round(nav.domContentLoadedEventEnd) : null,
+            loadMs: nav ? Math.round(nav.loadEventEnd) : null,
+            chunks: timings.slice()
+        };
+        console.table(timings);
+        return summary;
+    }
+
+    window.AnalyzerLoader = { chunks: CHUNKS, load, isLoaded, ensureResults, prefetch, report };
+
+    if (typeof window.addEventListener !== 'function') return;
+
+    // Primeira interação → provavelmente vai analisar: antecipa o download
+    const onIntent = () => {
+        window.removeEventListener('pointerdown', onIntent, true);
+        window.removeEventListener('keydown', onIntent, true);
+        prefetch();
+    };
+    window.addEventListener('pointerdown', onIntent, true);
+    window.addEventListener('keydown', onIntent, true);
+
+    // Ocioso após o load → baixa sem competir com o first paint
+    window.addEventListener('load', () => {
+        if (typeof window.requestIdleCallback === 'function') {
+            window.requestIdleCallback(prefetch, { timeout: IDLE_TIMEOUT_MS });
+        } else {
+            setTimeout(prefetch, 1500);
+        }
+    });
+})();
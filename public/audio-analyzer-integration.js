@@ -2,7 +2,8 @@
 // Conecta o sistema de análise de áudio com o chat existente
 
 // 🎯 CARREGAR SISTEMA UNIFICADO CORRIGIDO - Versão com todas as correções
-if (typeof window !== 'undefined' && !window.suggestionSystem) {
+// (com AnalyzerLoader o suggestion-system-unified.js vem no bloco sob demanda "suggestions")
+if (typeof window !== 'undefined' && !window.suggestionSystem && !window.AnalyzerLoader) {
     const script = document.createElement('script');
     script.src = 'suggestion-system-unified.js';
     script.async = true;
@@ -3792,6 +3793,47 @@ async function uploadToBucket(uploadUrl, file) {
     }
 }
 
+/**
+ * 📤 Upload do arquivo para o bucket: multipart pré-assinado e retomável
+ * (public/multipart-uploader.js). Sem o uploader carregado ou com a rota
+ * indisponível, cai no PUT único via /api/presign.
+ * @param {File} file
+ * @returns {Promise<{fileKey: string}>}
+ */
+async function uploadFileToStorage(file) {
+    if (window.MultipartUploader) {
+        try {
+            showUploadProgress(`Enviando ${file.name} para análise...`);
+            const { fileKey, resumed } = await window.MultipartUploader.upload(file, {
+                onProgress: ({ percent }) => showUploadProgress(`Enviando ${file.name}... ${percent}%`)
+            });
+            __dbg('✅ Upload multipart concluído', { fileKey, resumed });
+            showUploadProgress(`Upload concluído! Processando ${file.name}...`);
+
+            // 📊 GA4 Tracking: Upload de áudio iniciado
+            if (window.GATracking?.trackAudioUploadStarted) {
+                window.GATracking.trackAudioUploadStarted({
+                    format: file.name.split('.').pop(),
+                    sizeMB: parseFloat((file.size / 1024 / 1024).toFixed(2)),
+                    mode: window.currentAnalysisMode || 'genre'
+                });
+            }
+            return { fileKey };
+        } catch (error) {
+            // 404/405: servidor sem a rota multipart → fluxo antigo
+            if (error.status !== 404 && error.status !== 405) {
+                debugError('❌ Erro no upload multipart:', error);
+                throw new Error(`Falha ao enviar arquivo para análise: ${error.message}`);
+            }
+            __dbg('⚠️ Rota multipart indisponível - usando PUT único');
+        }
+    }
+
+    const { uploadUrl, fileKey } = await getPresignedUrl(file);
+    await uploadToBucket(uploadUrl, file);
+    return { fileKey };
+}
+
 
 
 /**
@@ -4966,11 +5008,8 @@ function handleReferenceFileSelection(type) {
 
                 // 🌐 NOVO FLUXO: Presigned URL → Upload → Job Creation → Polling
                 
-                // 1. Obter URL pré-assinada
-                const { uploadUrl, fileKey } = await getPresignedUrl(file);
-                
-                // 2. Upload direto para bucket
-                await uploadToBucket(uploadUrl, file);
+                // 1-2. Upload direto para bucket (multipart pré-assinado)
+                const { fileKey } = await uploadFileToStorage(file);
                 
                 // 3. Criar job de análise
                 const jobResult = await createAnalysisJob(fileKey, 'reference', file.name);
@@ -11229,11 +11268,8 @@ async function handleModalFileSelection(file) {
         showAnalysisLoading();
         showUploadProgress(`Preparando upload de ${file.name}...`);
         
-        // 🌐 ETAPA 1: Obter URL pré-assinada
-        const { uploadUrl, fileKey } = await getPresignedUrl(file);
-        
-        // 🌐 ETAPA 2: Upload direto para bucket
-        await uploadToBucket(uploadUrl, file);
+        // 🌐 ETAPAS 1-2: Upload direto para bucket (multipart pré-assinado)
+        const { fileKey } = await uploadFileToStorage(file);
         
         // 🌐 ETAPA 3: Criar job de análise no backend
         const jobResult = await createAnalysisJob(fileKey, currentAnalysisMode, file.name);
@@ -12270,8 +12306,7 @@ async function handleModalFileSelection(file) {
  * 📤 uploadFileOnly(file)
  *
  * Executa APENAS as etapas 1 e 2 do pipeline:
- *   1) getPresignedUrl(file)     → obtém uploadUrl + fileKey do backend
- *   2) uploadToBucket(url, file) → PUT direto no bucket
+ *   uploadFileToStorage(file) → partes direto no bucket (multipart) → fileKey
  *
  * NÃO dispara análise, NÃO cria job, NÃO altera UI nem state machine.
  *
@@ -12281,8 +12316,7 @@ async function handleModalFileSelection(file) {
 async function uploadFileOnly(file) {
     __dbg('📤 [uploadFileOnly] Iniciando upload isolado:', file.name);
 
-    const { uploadUrl, fileKey } = await getPresignedUrl(file);
-    await uploadToBucket(uploadUrl, file);
+    const { fileKey } = await uploadFileToStorage(file);
 
     // Persistir para uso posterior (ex: runAnalysisFromFileKey ou master.html)
     window.__PENDING_FILE_KEY__  = fileKey;
@@ -12305,7 +12339,7 @@ async function uploadFileOnly(file) {
  *
  * Respeita o modo de análise ativo (window.currentAnalysisMode),
  * os guards de demo/anonymous e o tracking de jobId existente.
- * NÃO faz upload, NÃO chama getPresignedUrl, NÃO chama uploadToBucket.
+ * NÃO faz upload, NÃO chama uploadFileToStorage.
  *
  * @param {string} fileKey
  * @param {string} fileName
@@ -14949,6 +14983,12 @@ function areSameTrack(a, b) {
 
 // 📊 Mostrar resultados no modal
 async function displayModalResults(analysis) {
+    // 📦 Sugestões + IA são carregadas sob demanda (analyzer-loader.js)
+    if (window.AnalyzerLoader) {
+        const ready = await window.AnalyzerLoader.ensureResults();
+        if (!ready) debugWarn('[ANALYZER-LOADER] Blocos de sugestões/IA indisponíveis - render sem eles');
+    }
+
     debugLog("🔥 RESETANDO ESTADO PARA TESTE");
 
     try {
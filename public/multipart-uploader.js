@@ -0,0 +1,151 @@
+/**
+ * 📤 Multipart Uploader - SoundyAI
+ * Envia o arquivo em partes DIRETO para o bucket com URLs pré-assinadas
+ * (POST /api/uploads/multipart). A API nunca recebe os bytes do áudio.
+ *
+ * - PARALLEL_PARTS partes em paralelo, RETRIES tentativas por parte (backoff)
+ * - Retomável: { uploadId, fileKey } fica no localStorage por arquivo (nome+tamanho+data);
+ *   numa nova tentativa o servidor devolve o que já chegou e só o resto é reenviado
+ * - Progresso: onProgress({ loaded, total, percent })
+ *
+ * Uso: const { fileKey } = await MultipartUploader.upload(file, { onProgress });
+ */
+
+(function() {
+    'use strict';
+
+    const ENDPOINT = '/api/uploads/multipart';
+    const PARALLEL_PARTS = 4;
+    const RETRIES = 3;
+    const STORAGE_PREFIX = 'soundy:multipart:';
+    const RESUME_MAX_AGE_MS = 23 * 60 * 60 * 1000; // bucket descarta uploads incompletos ~24h
+
+    function resumeKey(file) {
+        return `${STORAGE_PREFIX}${file.name}:${file.size}:${file.lastModified}`;
+    }
+
+    function loadResume(file) {
+        try {
+            const saved = JSON.parse(localStorage.getItem(resumeKey(file)) || 'null');
+            if (saved && Date.now() - saved.startedAt < RESUME_MAX_AGE_MS) return saved;
+        } catch (_) {}
+        return null;
+    }
+
+    function saveResume(file, session) {
+        try {
+            localStorage.setItem(resumeKey(file), JSON.stringify(session));
+        } catch (_) {}
+    }
+
+    function clearResume(file) {
+        try {
+            localStorage.removeItem(resumeKey(file));
+        } catch (_) {}
+    }
+
+    async function api(path, body, method = 'POST') {
+        const response = await fetch(`${ENDPOINT}${path}`, {
+            method,
+            headers: { 'Content-Type': 'application/json', 'Accept': 'application/json' },
+            body: JSON.stringify(body)
+        });
+        const data = await response.json().catch(() => ({}));
+        if (!response.ok || !data.success) {
+            const error = new Error(`Upload multipart: ${data.error || response.status}`);
+            error.code = data.error || `HTTP_${response.status}`;
+            error.status = response.status;
+            throw error;
+        }
+        return data;
+    }
+
+    const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+    async function putPart(url, blob) {
+        let lastError;
+        for (let attempt = 1; attempt <= RETRIES; attempt++) {
+            try {
+                const response = await fetch(url, { method: 'PUT', body: blob });
+                if (response.ok) return;
+                lastError = new Error(`PUT parte: HTTP ${response.status}`);
+                if (response.status === 403) break; // URL expirada: só uma retomada resolve
+            } catch (err) {
+                lastError = err;
+            }
+            if (attempt < RETRIES) await sleep(500 * Math.pow(2, attempt - 1));
+        }
+        throw lastError;
+    }
+
+    /**
+     * Cria o upload ou retoma um anterior do mesmo arquivo
+     */
+    async function openSession(file) {
+        const saved = loadResume(file);
+        if (saved) {
+            try {
+                const resumed = await api(`/${encodeURIComponent(saved.uploadId)}/parts`, { fileKey: saved.fileKey, size: file.size });
+                return { ...resumed, startedAt: saved.startedAt };
+            } catch (err) {
+                if (err.code !== 'UPLOAD_NOT_FOUND') throw err;
+                clearResume(file); // expirou/cancelado no bucket → começa de novo
+            }
+        }
+
+        const ext = file.name.split('.').pop().toLowerCase();
+        const started = await api('', { ext, contentType: file.type || 'application/octet-stream', size: file.size });
+        const session = { ...started, uploadedParts: [], startedAt: Date.now() };
+        saveResume(file, { uploadId: session.uploadId, fileKey: session.fileKey, startedAt: session.startedAt });
+        return session;
+    }
+
+    /**
+     * Upload completo (ou retomada) de um File
+     * @param {File} file
+     * @param {{ onProgress?: Function }} [options]
+     * @returns {Promise<{ fileKey: string, size: number, resumed: boolean }>}
+     */
+    async function upload(file, { onProgress } = {}) {
+        const session = await openSession(file);
+        const { uploadId, fileKey, partSize } = session;
+        const resumed = session.uploadedParts.length > 0;
+
+        const partBytes = (n) => Math.min(partSize, file.size - (n - 1) * partSize);
+        let loaded = session.uploadedParts.reduce((acc, n) => acc + partBytes(n), 0);
+        const report = () => onProgress && onProgress({
+            loaded,
+            total: file.size,
+            percent: Math.round((loaded / file.size) * 100)
+        });
+        report();
+
+        const queue = session.parts.slice();
+        const worker = async () => {
+            while (queue.length > 0) {
+                const { partNumber, url } = queue.shift();
+                const start = (partNumber - 1) * partSize;
+                await putPart(url, file.slice(start, start + partSize));
+                loaded += partBytes(partNumber);
+                report();
+            }
+        };
+        await Promise.all(Array.from({ length: Math.min(PARALLEL_PARTS, queue.length) }, worker));
+
+        const completed = await api(`/${encodeURIComponent(uploadId)}/complete`, { fileKey, size: file.size });
+        clearResume(file);
+        return { fileKey: completed.fileKey, size: completed.size, resumed };
+    }
+
+    /**
+     * Cancela o upload pendente de um arquivo (descarta partes no bucket)
+     */
+    async function abort(file) {
+        const saved = loadResume(file);
+        clearResume(file);
+        if (!saved) return;
+        await api(`/${encodeURIComponent(saved.uploadId)}`, { fileKey: saved.fileKey }, 'DELETE').catch(() => {});
+    }
+
+    window.MultipartUploader = { upload, abort };
+})();
@@ -4,11 +4,17 @@
 log('🚀 [VALIDADOR] Iniciando validação do Sistema Ultra-Avançado...');
 
 // Aguardar carregamento completo
-window.addEventListener('DOMContentLoaded', function() {
+// (pode chegar depois do DOMContentLoaded quando vem pelo analyzer-loader)
+function agendarValidacao() {
     setTimeout(() => {
         validarIntegracao();
     }, 2000);
-});
+}
+if (document.readyState === 'loading') {
+    window.addEventListener('DOMContentLoaded', agendarValidacao);
+} else {
+    agendarValidacao();
+}
 
 function validarIntegracao() {
     log('🔍 [VALIDADOR] Executando validação completa...');
@@ -73,6 +73,7 @@ const { createServiceLogger, createJobLogger } = require('../services/logger.cjs
 const jobStore = require('../services/job-store.cjs');
 const jobLock = require('../services/job-lock.cjs');
 const errorClassifier = require('../services/error-classifier.cjs');
+const { runPipeline, shutdownPipelineThreads, EXECUTION_MODE } = require('../automaster/pipeline-thread.cjs');
 
 // ============================================================================
 // FIREBASE ADMIN — inicialização lazy CJS
@@ -150,7 +151,6 @@ const logger = createServiceLogger('automaster-worker');
 
 const WORKER_CONCURRENCY = parseInt(process.env.AUTOMASTER_CONCURRENCY || '1', 10);
 const TIMEOUT_MS = 300000; // 300 segundos (5 minutos) - aumentado para áudios longos
-const MASTER_PIPELINE_SCRIPT = path.resolve(__dirname, '../automaster/master-pipeline.cjs');
 const TMP_BASE_DIR = path.resolve(__dirname, '../tmp');
 
 const JOB_ID_REGEX = /^[a-zA-Z0-9_-]+$/;
@@ -164,7 +164,7 @@ if (WORKER_CONCURRENCY < 1 || WORKER_CONCURRENCY > 4) {
   process.exit(1);
 }
 
-logger.info({ concurrency: WORKER_CONCURRENCY, timeout: TIMEOUT_MS }, 'Worker configurado');
+logger.info({ concurrency: WORKER_CONCURRENCY, timeout: TIMEOUT_MS, execution: EXECUTION_MODE }, 'Worker configurado');
 
 // ============================================================================
 // GARANTIR DIRETÓRIOS
@@ -233,63 +233,35 @@ async function cleanupJobWorkspace(jobId) {
 // ============================================================================
 
 async function executePipeline(isolatedInput, isolatedOutput, mode, jobLogger, safeMode = false) {
-  jobLogger.info({ mode, safeMode }, 'Executando pipeline');
-
-  const pipelineFlags = [];
-  if (safeMode) pipelineFlags.push('--safe-mode');
-
-  return new Promise((resolve, reject) => {
-    execFile(
-      'node',
-      [MASTER_PIPELINE_SCRIPT, isolatedInput, isolatedOutput, mode, ...pipelineFlags],
-      {
-        timeout: TIMEOUT_MS,
-        maxBuffer: 10 * 1024 * 1024,
-        killSignal: 'SIGTERM',
-        encoding: 'utf8'
-      },
-      (error, stdout, stderr) => {
-        // Logar stderr para diagnóstico (sem bloquear o fluxo)
-        if (stderr && stderr.trim()) {
-          jobLogger.info({ stderr: stderr.trim().substring(0, 2000) }, 'Pipeline stderr (diagnóstico)');
-        }
+  jobLogger.info({ mode, safeMode, execution: EXECUTION_MODE }, 'Executando pipeline');
 
-        // stdout com JSON válido tem prioridade sobre exit code
-        // Exit code não-zero pode ser intencional (ex.: ABORT_UNSAFE_INPUT)
-        const rawOut = stdout && stdout.trim();
-        if (rawOut) {
-          const lines = rawOut.split('\n');
-          const lastLine = lines[lines.length - 1];
-
-          jobLogger.info({
-            totalLines: lines.length,
-            lastLinePreview: lastLine.substring(0, 100)
-          }, 'Pipeline output received');
-
-          try {
-            const result = JSON.parse(lastLine);
-            return resolve({
-              pipelineResult: result,
-              stdout: rawOut,
-              stderr: stderr ? stderr.trim() : ''
-            });
-          } catch (parseErr) {
-            jobLogger.error({ lastLine }, 'Failed to parse pipeline JSON');
-            // Cair no reject abaixo
-          }
-        }
+  let run;
+  try {
+    // In-process (worker_thread reciclada): sem cold start de node por job
+    run = await runPipeline(
+      { inputPath: isolatedInput, outputPath: isolatedOutput, mode, safeMode },
+      { timeoutMs: TIMEOUT_MS }
+    );
+  } catch (error) {
+    jobLogger.error({ error: error.message, code: error.code }, 'Pipeline execution failed');
+    throw error;
+  }
 
-        // Sem stdout ou JSON inválido: aí sim reportar o erro real
-        if (error) {
-          jobLogger.error({ error: error.message, code: error.code, stderr }, 'Pipeline execution failed');
-          return reject(error);
-        }
+  // Logar stderr para diagnóstico (sem bloquear o fluxo)
+  if (run.stderr) {
+    jobLogger.info({ stderr: run.stderr.substring(0, 2000) }, 'Pipeline stderr (diagnóstico)');
+  }
 
-        jobLogger.error({ stdout, stderr }, 'Pipeline returned empty stdout');
-        return reject(new Error('Pipeline returned empty output'));
-      }
-    );
-  });
+  jobLogger.info({
+    durationMs: run.duration_ms,
+    execution: run.execution
+  }, 'Pipeline output received');
+
+  return {
+    pipelineResult: run.result,
+    stdout: run.stdout,
+    stderr: run.stderr
+  };
 }
 
 // ============================================================================
@@ -902,7 +874,10 @@ async function gracefulShutdown(signal) {
       logger.info('Todos os jobs ativos finalizados');
     }
 
-    // 3. Fechar conexão Redis
+    // 3. Encerrar threads do pipeline
+    await shutdownPipelineThreads();
+
+    // 4. Fechar conexão Redis
     await redis.quit();
     logger.info('Conexão Redis encerrada');
 
@@ -917,6 +892,21 @@ async function gracefulShutdown(signal) {
 process.on('SIGTERM', () => gracefulShutdown('SIGTERM'));
 process.on('SIGINT', () => gracefulShutdown('SIGINT'));
 
+// ============================================================================
+// SUPERVISOR (work/supervisor.js): concorrência em runtime, drenagem via SIGTERM
+// ============================================================================
+
+if (process.send) {
+  process.on('message', (msg) => {
+    if (!msg || msg.type !== 'scale' || !worker) return;
+    const concurrency = Math.min(4, Math.max(1, Math.floor(Number(msg.concurrency)) || 1));
+    worker.concurrency = concurrency;
+    logger.info({ concurrency }, '[AUTOSCALER] Concorrência ajustada');
+  });
+
+  process.on('disconnect', () => gracefulShutdown('SUPERVISOR_DISCONNECT'));
+}
+
 logger.info({
   concurrency: WORKER_CONCURRENCY,
   timeout_ms: TIMEOUT_MS,
@@ -98,107 +98,20 @@ const logger = new Logger(RUN_ID, DEFAULT_CONFIG.logLevel);
 
 class WAVDecoder {
   static async readWAVFile(filePath) {
-    const buffer = fs.readFileSync(filePath);
-    
-    // Verificar cabeçalho RIFF/WAVE
-    if (buffer.toString('ascii', 0, 4) !== 'RIFF' || buffer.toString('ascii', 8, 12) !== 'WAVE') {
-      throw new Error(`Arquivo não é WAV válido: ${filePath}`);
-    }
-
-    let offset = 12;
-    let format, numChannels, sampleRate, bitsPerSample, dataOffset = -1, dataSize = 0;
-
-    // Percorrer chunks
-    while (offset + 8 <= buffer.length) {
-      const chunkId = buffer.toString('ascii', offset, offset + 4);
-      const chunkSize = buffer.readUInt32LE(offset + 4);
-      const chunkStart = offset + 8;
-
-      if (chunkId === 'fmt ') {
-        format = buffer.readUInt16LE(chunkStart);
-        numChannels = buffer.readUInt16LE(chunkStart + 2);
-        sampleRate = buffer.readUInt32LE(chunkStart + 4);
-        bitsPerSample = buffer.readUInt16LE(chunkStart + 14);
-      } else if (chunkId === 'data') {
-        dataOffset = chunkStart;
-        dataSize = chunkSize;
-        break;
-      }
-
-      offset = chunkStart + chunkSize + (chunkSize % 2);
-    }
-
-    if (dataOffset < 0) {
-      throw new Error(`Chunk data não encontrado: ${filePath}`);
-    }
-
-    // Decodificar PCM para Float32Array
-    const bytesPerSample = bitsPerSample / 8;
-    const frameCount = Math.floor(dataSize / (bytesPerSample * numChannels));
-    const left = new Float32Array(frameCount);
-    const right = new Float32Array(frameCount);
-
-    let pos = dataOffset;
-    for (let i = 0; i < frameCount; i++) {
-      let sL, sR;
-
-      // Canal esquerdo
-      if (format === 3 && bitsPerSample === 32) {
-        sL = buffer.readFloatLE(pos);
-      } else if (bitsPerSample === 16) {
-        sL = buffer.readInt16LE(pos) / 32768.0;
-      } else if (bitsPerSample === 24) {
-        const b0 = buffer[pos];
-        const b1 = buffer[pos + 1];
-        const b2 = buffer[pos + 2];
-        let val = b0 | (b1 << 8) | (b2 << 16);
-        if (val & 0x800000) val |= 0xFF000000;
-        sL = val / 8388608.0;
-      } else if (bitsPerSample === 32) {
-        sL = buffer.readInt32LE(pos) / 2147483648.0;
-      } else {
-        throw new Error(`Formato PCM não suportado: ${bitsPerSample} bits`);
-      }
-
-      pos += bytesPerSample;
-
-      // Canal direito (ou duplicar esquerdo se mono)
-      if (numChannels > 1) {
-        if (format === 3 && bitsPerSample === 32) {
-          sR = buffer.readFloatLE(pos);
-        } else if (bitsPerSample === 16) {
-          sR = buffer.readInt16LE(pos) / 32768.0;
-        } else if (bitsPerSample === 24) {
-          const b0 = buffer[pos];
-          const b1 = buffer[pos + 1];
-          const b2 = buffer[pos + 2];
-          let val = b0 | (b1 << 8) | (b2 << 16);
-          if (val & 0x800000) val |= 0xFF000000;
-          sR = val / 8388608.0;
-        } else if (bitsPerSample === 32) {
-          sR = buffer.readInt32LE(pos) / 2147483648.0;
-        }
-        pos += bytesPerSample;
-      } else {
-        sR = sL;
-      }
-
-      left[i] = sL;
-      right[i] = sR;
+    // Leitor compartilhado com tools/reference-builder.js e tools/metrics-recalc.js
+    const { readWavFile } = await import('../tools/wav-reader.js');
+    let audio;
+    try {
+      audio = await readWavFile(filePath);
+    } catch (error) {
+      throw new Error(`${error.message}: ${filePath}`);
     }
 
     // Remover DC offset
-    WAVDecoder.removeDCOffset(left);
-    WAVDecoder.removeDCOffset(right);
+    WAVDecoder.removeDCOffset(audio.left);
+    WAVDecoder.removeDCOffset(audio.right);
 
-    return {
-      left,
-      right,
-      sampleRate,
-      channels: numChannels,
-      bitDepth: bitsPerSample,
-      format: format === 3 ? 'IEEE_FLOAT' : 'PCM'
-    };
+    return audio;
   }
 
   static removeDCOffset(channelData) {
@@ -535,6 +448,39 @@ class SpectralMetricsCalculator {
 // PROCESSADOR DE GÊNERO
 // ============================================================================
 
+// Versão do código de medição por faixa: incrementar ao alterar _processTrack e as classes que ele usa.
+// Junto com alvo LUFS/TP e os utilitários forma a chave do cache em refs/.cache/refs-normalize
+const MEASURE_VERSION = 1;
+const MEASURE_SOURCES = [
+  path.join(__dirname, 'loudness-utils.cjs'),
+  path.join(__dirname, 'spectral-utils.cjs'),
+  path.join(__dirname, '..', 'tools', 'wav-reader.js')
+];
+
+/**
+ * Mede uma faixa (normalização + métricas) — roda nos workers de tools/reference-cache.js
+ */
+async function measureNormalizedTrack(filePath, { lufsTarget, truePeakCeiling }) {
+  const processor = new GenreProcessor(path.basename(path.dirname(filePath)), { lufsTarget, truePeakCeiling });
+  return processor._processTrack(filePath);
+}
+
+async function measureTracksWithCache(files, config) {
+  const { analysisVersion, measureTracksCached } = await import('../tools/reference-cache.js');
+  const measureConfig = {
+    lufsTarget: config.lufsTarget,
+    truePeakCeiling: config.truePeakCeiling
+  };
+  return measureTracksCached(files, {
+    namespace: 'refs-normalize',
+    version: analysisVersion({ config: measureConfig, sources: MEASURE_SOURCES, codeVersion: MEASURE_VERSION }),
+    measure: { module: __filename, exportName: 'measureNormalizedTrack' },
+    options: measureConfig,
+    concurrency: config.concurrency,
+    force: config.noCache
+  });
+}
+
 class GenreProcessor {
   constructor(genreName, config) {
     this.genreName = genreName;
@@ -563,28 +509,41 @@ class GenreProcessor {
 
     logger.info(`Encontrados ${wavFiles.length} arquivos WAV`, { genre: this.genreName });
 
-    // Processar cada arquivo WAV
-    for (const wavFile of wavFiles) {
-      const filePath = path.join(genreDir, wavFile);
-      try {
-        const result = await this._processTrack(filePath);
-        this.results.push(result);
-        
-        // Log por faixa conforme especificação
-        logger.info(`Faixa processada: ${wavFile}`, {
-          genre: this.genreName,
-          lufs_in: result.originalMetrics.lufsIntegrated.toFixed(1),
-          tp_in: result.originalMetrics.truePeakDbtp.toFixed(1),
-          gain_db_aplicado: result.gainAppliedDb.toFixed(1),
-          lufs_out: result.finalMetrics.lufsIntegrated.toFixed(1),
-          tp_out: result.finalMetrics.truePeakDbtp.toFixed(1)
-        });
-      } catch (error) {
-        logger.error(`Erro ao processar ${wavFile}`, { error: error.message });
-        throw error;
-      }
+    // Medições por faixa com cache endereçado por conteúdo (refs/.cache/refs-normalize):
+    // só faixas novas/alteradas (ou com outra versão de análise) são medidas, em paralelo
+    const { rows, failed, stats } = await measureTracksWithCache(
+      wavFiles.map(wavFile => path.join(genreDir, wavFile)),
+      this.config
+    );
+
+    if (failed.length > 0) {
+      const first = failed[0];
+      logger.error(`Erro ao processar ${path.basename(first.file)}`, { error: first.error });
+      throw new Error(first.error);
+    }
+
+    for (const row of rows) {
+      const result = row.metrics;
+      this.results.push(result);
+
+      // Log por faixa conforme especificação
+      logger.info(`Faixa ${row.cached ? 'do cache' : 'processada'}: ${result.fileName}`, {
+        genre: this.genreName,
+        lufs_in: result.originalMetrics.lufsIntegrated.toFixed(1),
+        tp_in: result.originalMetrics.truePeakDbtp.toFixed(1),
+        gain_db_aplicado: result.gainAppliedDb.toFixed(1),
+        lufs_out: result.finalMetrics.lufsIntegrated.toFixed(1),
+        tp_out: result.finalMetrics.truePeakDbtp.toFixed(1)
+      });
     }
 
+    logger.info(`Cache de medições`, {
+      genre: this.genreName,
+      cached: stats.cached,
+      measured: stats.measured,
+      ms: stats.ms
+    });
+
     // Calcular médias aritméticas
     const averages = this._calculateGenreAverages();
     
@@ -1227,6 +1186,12 @@ function parseArguments() {
       case '--verbose':
         config.logLevel = 'DEBUG';
         break;
+      case '--concurrency':
+        config.concurrency = parseInt(args[++i]) || undefined;
+        break;
+      case '--no-cache':
+        config.noCache = true;
+        break;
       case '--help':
         printHelp();
         process.exit(0);
@@ -1257,6 +1222,8 @@ Opções:
   --refsVer <ver>   Versão das referências (default: v2_lufs_norm)
   --dry-run         Apenas gerar preview sem modificar arquivos
   --verbose         Log detalhado (DEBUG)
+  --concurrency <n> Faixas medidas em paralelo (default: núcleos - 1)
+  --no-cache        Ignorar refs/.cache e medir todas as faixas de novo
   --help            Mostrar esta ajuda
 
 Exemplos:
@@ -1275,6 +1242,7 @@ Funcionalidades:
   ✅ Controle True Peak com oversampling
   ✅ Recálculo de métricas espectrais por faixa normalizada
   ✅ Médias aritméticas por gênero
+  ✅ Cache por faixa (hash do áudio): só faixas novas/alteradas são medidas, em paralelo
   ✅ Backup automático dos JSONs existentes
   ✅ Modo DRY-RUN para preview seguro
   ✅ Versionamento com refsVer
@@ -1324,5 +1292,6 @@ module.exports = {
   LoudnessAnalyzer,
   SpectralMetricsCalculator,
   GenreProcessor,
-  JSONManager 
+  JSONManager,
+  measureNormalizedTrack
 };
@@ -1,19 +1,22 @@
 /**
  * Metrics Recalculator - Reprocessa todas as faixas de um gênero e recalcula métricas agregadas
  * Uso: npm run metrics:recalc -- --genre=funk_mandela --save
- * Features: Idempotente, paralelismo limitado, dry-run, logs detalhados
+ * Features: Idempotente, cache por faixa endereçado por conteúdo (refs/.cache), medição paralela
+ *           em worker_threads só do que mudou, dry-run, logs detalhados
  */
 
 import fs from 'node:fs';
 import fsp from 'node:fs/promises';
 import path from 'node:path';
 import { fileURLToPath } from 'node:url';
-import { Worker } from 'node:worker_threads';
+import { isMainThread } from 'node:worker_threads';
 
 // Importar pipeline existente
 import { STFTEngine, nextPowerOfTwo } from '../lib/audio/fft.js';
 import { calculateLoudnessMetrics } from '../lib/audio/features/loudness.js';
 import { analyzeTruePeaks } from '../lib/audio/features/truepeak.js';
+import { readWavFile } from './wav-reader.js';
+import { analysisVersion, measureTracksCached } from './reference-cache.js';
 
 const CONFIG = {
   sampleRate: 48000,
@@ -33,6 +36,16 @@ const CONFIG = {
   ]
 };
 
+// Versão do código de medição por faixa: incrementar ao alterar measureTrack/computeBandProfile.
+// Junto com CONFIG e os módulos de lib/audio forma a chave do cache em refs/.cache/metrics-recalc
+const MEASURE_VERSION = 1;
+const MEASURE_SOURCES = [
+  new URL('../lib/audio/fft.js', import.meta.url),
+  new URL('../lib/audio/features/loudness.js', import.meta.url),
+  new URL('../lib/audio/features/truepeak.js', import.meta.url),
+  new URL('./wav-reader.js', import.meta.url)
+];
+
 // ========== Utilitários ==========
 
 function round1(x) { return Number.isFinite(x) ? Math.round(x * 10) / 10 : x; }
@@ -57,80 +70,6 @@ function robustTol(values, minTol) {
   return Math.max(minTol, 1.4826 * M);
 }
 
-// ========== WAV Reader ==========
-
-function readWavFile(filePath) {
-  const buffer = fs.readFileSync(filePath);
-  
-  // Parse básico WAV (apenas PCM 16/24/32-bit)
-  if (buffer.toString('ascii', 0, 4) !== 'RIFF') throw new Error('Não é um arquivo WAV válido');
-  if (buffer.toString('ascii', 8, 12) !== 'WAVE') throw new Error('Formato WAV inválido');
-  
-  let offset = 12;
-  let fmtChunk = null, dataChunk = null;
-  
-  while (offset < buffer.length) {
-    const chunkId = buffer.toString('ascii', offset, offset + 4);
-    const chunkSize = buffer.readUInt32LE(offset + 4);
-    
-    if (chunkId === 'fmt ') {
-      fmtChunk = { offset: offset + 8, size: chunkSize };
-    } else if (chunkId === 'data') {
-      dataChunk = { offset: offset + 8, size: chunkSize };
-      break;
-    }
-    offset += 8 + chunkSize;
-  }
-  
-  if (!fmtChunk || !dataChunk) throw new Error('Chunks fmt/data não encontrados');
-  
-  const channels = buffer.readUInt16LE(fmtChunk.offset + 2);
-  const sampleRate = buffer.readUInt32LE(fmtChunk.offset + 4);
-  const bitsPerSample = buffer.readUInt16LE(fmtChunk.offset + 14);
-  
-  if (![16, 24, 32].includes(bitsPerSample)) throw new Error(`Bits/sample ${bitsPerSample} não suportado`);
-  if (channels < 1 || channels > 2) throw new Error(`${channels} canais não suportado`);
-  
-  const bytesPerSample = bitsPerSample / 8;
-  const numSamples = Math.floor(dataChunk.size / (channels * bytesPerSample));
-  
-  const left = new Float32Array(numSamples);
-  const right = new Float32Array(numSamples);
-  
-  for (let i = 0; i < numSamples; i++) {
-    const sampleOffset = dataChunk.offset + i * channels * bytesPerSample;
-    
-    let leftSample, rightSample;
-    
-    if (bitsPerSample === 16) {
-      leftSample = buffer.readInt16LE(sampleOffset) / 32768.0;
-      rightSample = channels > 1 ? buffer.readInt16LE(sampleOffset + 2) / 32768.0 : leftSample;
-    } else if (bitsPerSample === 24) {
-      const l1 = buffer.readUInt8(sampleOffset);
-      const l2 = buffer.readUInt8(sampleOffset + 1);
-      const l3 = buffer.readInt8(sampleOffset + 2);
-      leftSample = (l1 + (l2 << 8) + (l3 << 16)) / 8388608.0;
-      
-      if (channels > 1) {
-        const r1 = buffer.readUInt8(sampleOffset + 3);
-        const r2 = buffer.readUInt8(sampleOffset + 4);
-        const r3 = buffer.readInt8(sampleOffset + 5);
-        rightSample = (r1 + (r2 << 8) + (r3 << 16)) / 8388608.0;
-      } else {
-        rightSample = leftSample;
-      }
-    } else { // 32-bit
-      leftSample = buffer.readInt32LE(sampleOffset) / 2147483648.0;
-      rightSample = channels > 1 ? buffer.readInt32LE(sampleOffset + 4) / 2147483648.0 : leftSample;
-    }
-    
-    left[i] = leftSample;
-    right[i] = rightSample;
-  }
-  
-  return { left, right, sampleRate };
-}
-
 // ========== Audio Processing ==========
 
 function resampleLinear(input, fromRate, toRate) {
@@ -286,6 +225,22 @@ function measureTrack(left, right, sampleRate) {
   }
 }
 
+// Medição de um arquivo (roda nos workers de reference-cache.js; resultado vai para o cache)
+async function measureRecalcFile(filePath) {
+  const startTime = Date.now();
+  let { left, right, sampleRate } = await readWavFile(filePath);
+
+  // Reamostrar se necessário
+  if (sampleRate !== CONFIG.sampleRate) {
+    left = resampleLinear(left, sampleRate, CONFIG.sampleRate);
+    right = resampleLinear(right, sampleRate, CONFIG.sampleRate);
+  }
+
+  const metrics = measureTrack(left, right, CONFIG.sampleRate);
+  if (metrics) metrics._processingTime = Date.now() - startTime;
+  return metrics;
+}
+
 // ========== Agregação Estatística ==========
 
 function aggregateMetrics(trackMetrics) {
@@ -413,7 +368,7 @@ function generateAnalysisPreset(aggregated) {
 // ========== Processamento Principal ==========
 
 async function processGenre(genre, options = {}) {
-  const { dry = false, concurrency = 4, save = false } = options;
+  const { dry = false, concurrency = 4, save = false, noCache = false } = options;
   
   console.log(`\n🎵 === Reprocessando gênero: ${genre} ===`);
   console.log(`Modo: ${dry ? 'DRY-RUN' : 'PROCESSAMENTO'} | Concorrência: ${concurrency}`);
@@ -440,52 +395,25 @@ async function processGenre(genre, options = {}) {
     return { files: files.length, processed: 0, aggregated: null, preset: null };
   }
   
-  // Processar arquivos com limite de concorrência
-  const trackMetrics = [];
-  let processed = 0;
-  
+  // Faixas já medidas com o mesmo áudio e a mesma versão de análise vêm do cache;
+  // as demais são medidas em paralelo (worker_threads, até `concurrency` simultâneas)
   console.log('\n🔄 Iniciando processamento de faixas...');
-  
-  for (let i = 0; i < files.length; i += concurrency) {
-    const batch = files.slice(i, i + concurrency);
-    const promises = batch.map(async (file) => {
-      const startTime = Date.now();
-      
-      try {
-        console.log(`📊 Processando: ${path.basename(file)}`);
-        
-        const wav = readWavFile(file);
-        let { left, right, sampleRate } = wav;
-        
-        // Reamostrar se necessário
-        if (sampleRate !== CONFIG.sampleRate) {
-          console.log(`  🔄 Reamostrando: ${sampleRate}Hz → ${CONFIG.sampleRate}Hz`);
-          left = resampleLinear(left, sampleRate, CONFIG.sampleRate);
-          right = resampleLinear(right, sampleRate, CONFIG.sampleRate);
-        }
-        
-        const metrics = measureTrack(left, right, CONFIG.sampleRate);
-        
-        if (metrics) {
-          metrics._file = path.basename(file);
-          metrics._processingTime = Date.now() - startTime;
-          trackMetrics.push(metrics);
-          console.log(`  ✅ Concluído: ${metrics._processingTime}ms`);
-        } else {
-          console.log(`  ❌ Falha na medição`);
-        }
-        
-        processed++;
-        
-      } catch (error) {
-        console.warn(`  ⚠️ Erro: ${error.message}`);
-      }
-    });
-    
-    await Promise.all(promises);
-    console.log(`📈 Progresso: ${processed}/${files.length} (${Math.round(processed/files.length*100)}%)`);
-  }
-  
+
+  const { rows, failed, stats } = await measureTracksCached(files, {
+    namespace: 'metrics-recalc',
+    version: analysisVersion({ config: CONFIG, sources: MEASURE_SOURCES, codeVersion: MEASURE_VERSION }),
+    measure: { module: fileURLToPath(import.meta.url), exportName: 'measureRecalcFile' },
+    concurrency,
+    force: noCache,
+    onProgress: ({ file, cached, error, done, total }) => {
+      const status = error ? `⚠️ Erro: ${error}` : cached ? '♻️ Cache' : '✅ Concluído';
+      console.log(`  ${status}: ${path.basename(file)} (${done}/${total})`);
+    }
+  });
+
+  const trackMetrics = rows.map(row => ({ ...row.metrics, _file: path.basename(row.file), _cached: row.cached }));
+  console.log(`📦 Cache: ${stats.cached} reaproveitadas, ${stats.measured} medidas, ${failed.length} com erro (${stats.ms}ms)`);
+
   if (trackMetrics.length === 0) {
     throw new Error('Nenhuma faixa foi processada com sucesso');
   }
@@ -624,6 +552,7 @@ async function main() {
   const dry = args.includes('--dry');
   const save = args.includes('--save') && !dry; // Não salvar em dry-run
   const concurrency = parseInt(args.find(a => a.startsWith('--concurrency='))?.split('=')[1]) || 4;
+  const noCache = args.includes('--no-cache');
   
   if (!genre) {
     console.error(`
@@ -633,11 +562,13 @@ Exemplos:
   node metrics-recalc.js funk_mandela --dry              # Dry-run
   node metrics-recalc.js funk_mandela --save             # Processar e salvar
   node metrics-recalc.js funk_mandela --save --concurrency=2  # Limite de concorrência
+  node metrics-recalc.js funk_mandela --save --no-cache  # Medir todas as faixas de novo
 
 Opções:
   --dry               Simular processamento (não calcula métricas)
   --save              Salvar resultados em refs/out/
-  --concurrency=N     Limite de faixas simultâneas (default: 4)
+  --concurrency=N     Limite de faixas medidas em paralelo (default: 4)
+  --no-cache          Ignorar refs/.cache e medir todas as faixas de novo
 `);
     process.exit(1);
   }
@@ -648,7 +579,7 @@ Opções:
     console.log(`🚀 Iniciando reprocessamento de ${genre}`);
     console.log(`⚙️ Configuração: LUFS=${CONFIG.lufsTarget}, Janela=${CONFIG.windowSeconds}s, Hop=${CONFIG.hopSeconds}s`);
     
-    const result = await processGenre(genre, { dry, save, concurrency });
+    const result = await processGenre(genre, { dry, save, concurrency, noCache });
     
     const totalTime = Date.now() - startTime;
     
@@ -686,12 +617,12 @@ Opções:
   }
 }
 
-// Executar se chamado diretamente
-if (import.meta.url === `file://${process.argv[1]}` || process.argv[1].endsWith('metrics-recalc.js')) {
+// Executar se chamado diretamente (nunca nos workers de medição, que importam este módulo)
+if (isMainThread && import.meta.url === `file://${process.argv[1]}` || process.argv[1].endsWith('metrics-recalc.js')) {
   main().catch(err => {
     console.error('❌ Erro fatal:', err);
     process.exit(1);
   });
 }
 
-export { processGenre, measureTrack, aggregateMetrics, generateAnalysisPreset };
+export { processGenre, measureTrack, measureRecalcFile, aggregateMetrics, generateAnalysisPreset };
@@ -8,11 +8,14 @@ import fs from 'node:fs';
 import fsp from 'node:fs/promises';
 import path from 'node:path';
 import { fileURLToPath } from 'node:url';
+import { isMainThread } from 'node:worker_threads';
 
 // Reuso de funções internas do projeto
 import { STFTEngine, nextPowerOfTwo } from '../lib/audio/fft.js';
 import { calculateLoudnessMetrics } from '../lib/audio/features/loudness.js';
 import { analyzeTruePeaks } from '../lib/audio/features/truepeak.js';
+import { readWavFile } from './wav-reader.js';
+import { analysisVersion, measureTracksCached } from './reference-cache.js';
 
 // Configuração compartilhada
 const CONFIG = {
@@ -34,87 +37,15 @@ const CONFIG = {
 	]
 };
 
-// Util: leitura de WAV (PCM 16/24/32, float32)
-async function readWavFile(filePath) {
-	const buf = await fsp.readFile(filePath);
-	// Checar RIFF/WAVE
-	if (buf.toString('ascii', 0, 4) !== 'RIFF' || buf.toString('ascii', 8, 12) !== 'WAVE') {
-		throw new Error('Formato não suportado (apenas WAV)');
-	}
-	// Encontrar chunks fmt/data
-	let offset = 12;
-	let format, numChannels, sampleRate, bitsPerSample, dataOffset = -1, dataSize = 0;
-	while (offset + 8 <= buf.length) {
-		const chunkId = buf.toString('ascii', offset, offset + 4);
-		const chunkSize = buf.readUInt32LE(offset + 4);
-		const chunkStart = offset + 8;
-		if (chunkId === 'fmt ') {
-			format = buf.readUInt16LE(chunkStart);
-			numChannels = buf.readUInt16LE(chunkStart + 2);
-			sampleRate = buf.readUInt32LE(chunkStart + 4);
-			bitsPerSample = buf.readUInt16LE(chunkStart + 14);
-		} else if (chunkId === 'data') {
-			dataOffset = chunkStart;
-			dataSize = chunkSize;
-			break;
-		}
-		offset = chunkStart + chunkSize + (chunkSize % 2); // alinhamento
-	}
-	if (dataOffset < 0) throw new Error('Chunk data não encontrado');
-	// Extrair PCM
-	const bytesPerSample = bitsPerSample / 8;
-	const frameCount = Math.floor(dataSize / (bytesPerSample * numChannels));
-	const left = new Float32Array(frameCount);
-	const right = new Float32Array(frameCount);
-	let pos = dataOffset;
-	for (let i = 0; i < frameCount; i++) {
-		// Canal L
-		let sL;
-		if (format === 3 && bitsPerSample === 32) {
-			sL = buf.readFloatLE(pos);
-		} else if (bitsPerSample === 16) {
-			sL = buf.readInt16LE(pos) / 32768;
-		} else if (bitsPerSample === 24) {
-			const b0 = buf[pos];
-			const b1 = buf[pos + 1];
-			const b2 = buf[pos + 2];
-			let val = b0 | (b1 << 8) | (b2 << 16);
-			if (val & 0x800000) val |= 0xFF000000;
-			sL = val / 8388608;
-		} else if (bitsPerSample === 32) {
-			sL = buf.readInt32LE(pos) / 2147483648;
-		} else {
-			throw new Error(`PCM não suportado: ${bitsPerSample} bits`);
-		}
-		pos += bytesPerSample;
-		// Canal R (ou duplicar L se mono)
-		let sR;
-		if (numChannels > 1) {
-			if (format === 3 && bitsPerSample === 32) {
-				sR = buf.readFloatLE(pos);
-			} else if (bitsPerSample === 16) {
-				sR = buf.readInt16LE(pos) / 32768;
-			} else if (bitsPerSample === 24) {
-				const c0 = buf[pos];
-				const c1 = buf[pos + 1];
-				const c2 = buf[pos + 2];
-				let v = c0 | (c1 << 8) | (c2 << 16);
-				if (v & 0x800000) v |= 0xFF000000;
-				sR = v / 8388608;
-			} else if (bitsPerSample === 32) {
-				sR = buf.readInt32LE(pos) / 2147483648;
-			} else {
-				throw new Error(`PCM não suportado: ${bitsPerSample} bits`);
-			}
-			pos += bytesPerSample;
-		} else {
-			sR = sL;
-		}
-		left[i] = sL;
-		right[i] = sR;
-	}
-	return { left, right, sampleRate, channels: numChannels };
-}
+// Versão do código de medição por faixa: incrementar ao alterar measureTrack/computeBandProfile.
+// Junto com CONFIG e os módulos de lib/audio forma a chave do cache em refs/.cache/reference-builder
+const MEASURE_VERSION = 1;
+const MEASURE_SOURCES = [
+	new URL('../lib/audio/fft.js', import.meta.url),
+	new URL('../lib/audio/features/loudness.js', import.meta.url),
+	new URL('../lib/audio/features/truepeak.js', import.meta.url),
+	new URL('./wav-reader.js', import.meta.url)
+];
 
 // Util: resample linear para 48k
 function resampleLinear(channel, fromRate, toRate) {
@@ -316,8 +247,21 @@ function tols(valueMad, minTol) {
 
 function clamp(x, lo, hi) { return Math.max(lo, Math.min(hi, x)); }
 
+// Medição de um arquivo (roda nos workers de reference-cache.js; resultado vai para o cache)
+export async function measureReferenceFile(filePath, { useLinearAggregation = true } = {}) {
+	CONFIG.useLinearAggregation = useLinearAggregation;
+	const wav = await readWavFile(filePath);
+	let L = wav.left, R = wav.right;
+	if (wav.sampleRate !== CONFIG.sampleRate) {
+		L = resampleLinear(L, wav.sampleRate, CONFIG.sampleRate);
+		R = resampleLinear(R, wav.sampleRate, CONFIG.sampleRate);
+	}
+	return measureTrack(L, R, CONFIG.sampleRate);
+}
+
 // Pipeline principal
-async function buildGenre(genre) {
+// options.concurrency: workers de medição; options.noCache: ignora refs/.cache e mede tudo de novo
+export async function buildGenre(genre, options = {}) {
 	const inDir = path.resolve(process.cwd(), 'refs', genre);
 	const samplesDir = path.join(inDir, 'samples');
 	const outDir = path.resolve(process.cwd(), 'refs', 'out');
@@ -350,22 +294,18 @@ async function buildGenre(genre) {
 
 	console.log(`Iniciando build para gênero '${genre}' em ${searchDir} | WAVs: ${files.length}`);
 
-	const perTrack = [];
-	for (const f of files) {
-		const fp = path.join(searchDir, f);
-		try {
-			const wav = await readWavFile(fp);
-			let L = wav.left, R = wav.right;
-			if (wav.sampleRate !== CONFIG.sampleRate) {
-				L = resampleLinear(L, wav.sampleRate, CONFIG.sampleRate);
-				R = resampleLinear(R, wav.sampleRate, CONFIG.sampleRate);
-			}
-			perTrack.push(measureTrack(L, R, CONFIG.sampleRate));
-			console.log(`✔️ Processado: ${f}`);
-		} catch (e) {
-			console.warn(`⚠️ Ignorado ${f}: ${e.message}`);
-		}
-	}
+	const { rows, failed, stats } = await measureTracksCached(files.map(f => path.join(searchDir, f)), {
+		namespace: 'reference-builder',
+		version: analysisVersion({ config: CONFIG, sources: MEASURE_SOURCES, codeVersion: MEASURE_VERSION }),
+		measure: { module: fileURLToPath(import.meta.url), exportName: 'measureReferenceFile' },
+		options: { useLinearAggregation: CONFIG.useLinearAggregation },
+		concurrency: options.concurrency,
+		force: options.noCache
+	});
+	for (const row of rows) console.log(`${row.cached ? '♻️ Cache' : '✔️ Processado'}: ${path.basename(row.file)}`);
+	for (const f of failed) console.warn(`⚠️ Ignorado ${path.basename(f.file)}: ${f.error}`);
+	console.log(`📦 Cache: ${stats.cached} reaproveitadas, ${stats.measured} medidas, ${stats.failed} com erro (${stats.ms}ms)`);
+	const perTrack = rows.map(r => r.metrics);
 
 	if (perTrack.length === 0) {
 		console.error('Nenhuma faixa válida processada. Abortando.');
@@ -454,41 +394,54 @@ async function buildGenre(genre) {
 function round1(x) { return Number.isFinite(x) ? Math.round(x * 10) / 10 : x; }
 function round2(x) { return Number.isFinite(x) ? Math.round(x * 100) / 100 : x; }
 
+function cliOptions(args) {
+	const concurrency = parseInt(args.find(a => a.startsWith('--concurrency='))?.split('=')[1]);
+	return {
+		concurrency: Number.isFinite(concurrency) && concurrency > 0 ? concurrency : undefined,
+		noCache: args.includes('--no-cache')
+	};
+}
+
 // CLI (compatível com Windows)
-try {
-	const thisFile = fileURLToPath(import.meta.url);
-	if (thisFile === process.argv[1]) {
+// Só na thread principal: os workers de medição importam este módulo com o mesmo process.argv
+if (isMainThread) {
+	try {
+		const thisFile = fileURLToPath(import.meta.url);
+		if (thisFile === process.argv[1]) {
+			const args = process.argv.slice(2);
+			const genre = args.find(a => !a.startsWith('-'));
+			
+			// Processar flags
+			if (args.includes('--v1') || args.includes('--legacy')) {
+				CONFIG.useLinearAggregation = false;
+				console.log('🔧 Usando agregação v1.0 (legacy dB domain)');
+			} else if (args.includes('--v2') || args.includes('--linear')) {
+				CONFIG.useLinearAggregation = true;
+				console.log('🔧 Usando agregação v2.0 (linear domain corrigida)');
+			} else {
+				console.log('🔧 Usando agregação v2.0 (default - linear domain)');
+			}
+			
+			if (!genre) {
+				console.error('Uso: node tools/reference-builder.js <genero> [--v1|--v2] [--legacy|--linear] [--concurrency=N] [--no-cache]');
+				console.error('  --v1/--legacy: usar método antigo (pode gerar valores positivos incorretos)');
+				console.error('  --v2/--linear: usar método corrigido com agregação linear (default)');
+			console.error('  --concurrency=N: workers de medição em paralelo (default: núcleos - 1)');
+			console.error('  --no-cache: ignora refs/.cache e mede todas as faixas de novo');
+				process.exit(1);
+			}
+			buildGenre(genre, cliOptions(args)).catch(err => {
+				console.error('Erro ao gerar referência:', err);
+				process.exit(1);
+			});
+		}
+	} catch (e) {
+		// Fallback: tenta sempre rodar se não conseguir resolver
 		const args = process.argv.slice(2);
 		const genre = args.find(a => !a.startsWith('-'));
-		
-		// Processar flags
-		if (args.includes('--v1') || args.includes('--legacy')) {
-			CONFIG.useLinearAggregation = false;
-			console.log('🔧 Usando agregação v1.0 (legacy dB domain)');
-		} else if (args.includes('--v2') || args.includes('--linear')) {
-			CONFIG.useLinearAggregation = true;
-			console.log('🔧 Usando agregação v2.0 (linear domain corrigida)');
-		} else {
-			console.log('🔧 Usando agregação v2.0 (default - linear domain)');
-		}
-		
-		if (!genre) {
-			console.error('Uso: node tools/reference-builder.js <genero> [--v1|--v2] [--legacy|--linear]');
-			console.error('  --v1/--legacy: usar método antigo (pode gerar valores positivos incorretos)');
-			console.error('  --v2/--linear: usar método corrigido com agregação linear (default)');
-			process.exit(1);
+		if (genre) {
+			if (args.includes('--v1') || args.includes('--legacy')) CONFIG.useLinearAggregation = false;
+			buildGenre(genre, cliOptions(args)).catch(err => { console.error('Erro ao gerar referência:', err); process.exit(1); });
 		}
-		buildGenre(genre).catch(err => {
-			console.error('Erro ao gerar referência:', err);
-			process.exit(1);
-		});
-	}
-} catch (e) {
-	// Fallback: tenta sempre rodar se não conseguir resolver
-	const args = process.argv.slice(2);
-	const genre = args.find(a => !a.startsWith('-'));
-	if (genre) {
-		if (args.includes('--v1') || args.includes('--legacy')) CONFIG.useLinearAggregation = false;
-		buildGenre(genre).catch(err => { console.error('Erro ao gerar referência:', err); process.exit(1); });
 	}
 }
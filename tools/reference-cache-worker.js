@@ -0,0 +1,27 @@
+/**
+ * Worker do pool de reference-cache.js: importa o módulo de medição e mede um arquivo por mensagem
+ * Mensagem: { modulePath, exportName, filePath, options } → { metrics } | { error }
+ */
+
+import { parentPort } from 'node:worker_threads';
+
+const modules = new Map();
+
+async function loadMeasure(modulePath, exportName) {
+  if (!modules.has(modulePath)) modules.set(modulePath, await import(modulePath));
+  const mod = modules.get(modulePath);
+  // Módulos CommonJS chegam como { default: module.exports }
+  const fn = mod[exportName] ?? mod.default?.[exportName];
+  if (typeof fn !== 'function') throw new Error(`${exportName} não exportado por ${modulePath}`);
+  return fn;
+}
+
+parentPort.on('message', async ({ modulePath, exportName, filePath, options }) => {
+  try {
+    const measure = await loadMeasure(modulePath, exportName);
+    const metrics = await measure(filePath, options);
+    parentPort.postMessage({ metrics });
+  } catch (error) {
+    parentPort.postMessage({ error: error.message });
+  }
+});
@@ -0,0 +1,270 @@
+/**
+ * Reference Cache - medições por faixa endereçadas por conteúdo
+ *
+ * Cada ferramenta de referência (reference-builder, metrics-recalc, refs-normalize-and-rebuild)
+ * guarda a medição de cada faixa em refs/.cache/<namespace>/tracks/<sha256-do-áudio>-<versão>.json.
+ * A versão de análise é o hash do CONFIG + código-fonte das funções de medição. Numa nova execução:
+ *   - faixa com mesmo conteúdo e mesma versão → linha lida do cache (sem ler o WAV)
+ *   - faixa nova/alterada ou versão de análise diferente → medida de novo, em paralelo (worker_threads)
+ * A agregação do gênero roda sempre sobre as linhas por faixa, então re-agregar leva segundos.
+ *
+ * O index.json do namespace guarda tamanho/mtime → hash de cada arquivo (como o index do git):
+ * arquivos intocados nem são re-hasheados.
+ */
+
+import fs from 'node:fs';
+import fsp from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import crypto from 'node:crypto';
+import { pipeline } from 'node:stream/promises';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+import { Worker } from 'node:worker_threads';
+
+// Ancorado na raiz do repositório (tools/..), não no diretório de onde a ferramenta foi chamada
+const REPO_ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..');
+
+export const REFERENCE_CACHE_DIR = path.resolve(REPO_ROOT, process.env.REFS_CACHE_DIR || path.join('refs', '.cache'));
+
+const WORKER_PATH = new URL('./reference-cache-worker.js', import.meta.url);
+
+/**
+ * SHA-256 do conteúdo do arquivo (streaming, não carrega o áudio inteiro)
+ */
+export async function hashFile(filePath) {
+  const hash = crypto.createHash('sha256');
+  await pipeline(fs.createReadStream(filePath), hash);
+  return hash.digest('hex');
+}
+
+/**
+ * Versão de análise: muda quando a configuração de medição ou o código que mede muda
+ * @param {Object} params
+ * @param {Object} params.config - parâmetros que afetam a medição (alvo LUFS, bandas, janelas...)
+ * @param {string[]} params.sources - arquivos com o código de medição (caminhos ou file URLs)
+ * @param {string|number} [params.codeVersion] - versão manual para mudanças fora dos sources
+ */
+export function analysisVersion({ config, sources = [], codeVersion = 1 }) {
+  const hash = crypto.createHash('sha256');
+  hash.update(`v${codeVersion}\n${JSON.stringify(config)}\n`);
+  for (const source of sources) {
+    hash.update(fs.readFileSync(source instanceof URL ? source : path.resolve(source)));
+  }
+  return hash.digest('hex').slice(0, 16);
+}
+
+// Medições carregam -Infinity/NaN (ex.: RMS de silêncio); JSON puro viraria null e mudaria a agregação
+const NON_FINITE = '$nonFinite';
+const encodeNonFinite = (_key, value) =>
+  (typeof value === 'number' && !Number.isFinite(value) ? { [NON_FINITE]: String(value) } : value);
+const decodeNonFinite = (_key, value) =>
+  (value && typeof value === 'object' && NON_FINITE in value ? Number(value[NON_FINITE]) : value);
+
+async function readJson(filePath) {
+  try {
+    return JSON.parse(await fsp.readFile(filePath, 'utf8'), decodeNonFinite);
+  } catch {
+    return null;
+  }
+}
+
+async function writeJsonAtomic(filePath, data) {
+  const tmp = `${filePath}.${process.pid}.tmp`;
+  await fsp.writeFile(tmp, JSON.stringify(data, encodeNonFinite));
+  await fsp.rename(tmp, filePath);
+}
+
+/**
+ * Hash de cada arquivo, reaproveitando o index quando tamanho e mtime não mudaram
+ */
+async function resolveHashes(files, index, rehash) {
+  const hashes = new Map();
+  let rehashed = 0;
+  for (const file of files) {
+    const info = await fsp.stat(file);
+    const known = index[file];
+    if (!rehash && known && known.size === info.size && known.mtimeMs === info.mtimeMs) {
+      hashes.set(file, known.hash);
+      continue;
+    }
+    const hash = await hashFile(file);
+    index[file] = { size: info.size, mtimeMs: info.mtimeMs, hash };
+    hashes.set(file, hash);
+    rehashed++;
+  }
+  return { hashes, rehashed };
+}
+
+/**
+ * Mede arquivos num pool de worker_threads; cada worker importa measure.module e chama
+ * measure.exportName(filePath, options), que deve devolver um objeto serializável
+ */
+async function runPool(jobs, { measure, options, concurrency, onResult }) {
+  if (jobs.length === 0) return;
+  const modulePath = pathToFileURL(path.resolve(measure.module)).href;
+  const queue = jobs.slice();
+  const size = Math.max(1, Math.min(concurrency, queue.length));
+
+  const runWorker = () => new Promise((resolve, reject) => {
+    const worker = new Worker(WORKER_PATH);
+    let current = null;
+
+    const next = () => {
+      current = queue.shift();
+      if (!current) {
+        worker.terminate().then(() => resolve());
+        return;
+      }
+      worker.postMessage({ modulePath, exportName: measure.exportName, filePath: current.file, options });
+    };
+
+    worker.on('message', async (message) => {
+      try {
+        await onResult(current, message);
+      } catch (error) {
+        worker.terminate();
+        return reject(error);
+      }
+      next();
+    });
+    worker.on('error', (error) => {
+      // Crash do worker (ex.: OOM numa faixa enorme): registra a faixa e segue com um worker novo
+      onResult(current, { error: error.message }).then(() => runWorker().then(resolve, reject), reject);
+    });
+    next();
+  });
+
+  await Promise.all(Array.from({ length: size }, runWorker));
+}
+
+/**
+ * Medições por faixa com cache endereçado por conteúdo
+ * @param {string[]} files - caminhos dos arquivos de áudio
+ * @param {Object} params
+ * @param {string} params.namespace - pasta do cache (uma por pipeline de medição)
+ * @param {string} params.version - resultado de analysisVersion()
+ * @param {{ module: string, exportName: string }} params.measure - função de medição por arquivo
+ * @param {Object} [params.options] - repassado à função de medição (precisa ser serializável)
+ * @param {number} [params.concurrency] - workers simultâneos (padrão: núcleos - 1)
+ * @param {boolean} [params.force] - ignora o cache e mede tudo de novo
+ * @param {boolean} [params.rehash] - recalcula o hash mesmo com tamanho/mtime iguais
+ * @param {string} [params.cacheDir]
+ * @param {Function} [params.onProgress] - ({ file, cached, error, done, total }) por faixa
+ * @returns {Promise<{ rows: Array<{ file: string, hash: string, cached: boolean, metrics: Object }>,
+ *   failed: Array<{ file: string, error: string }>, stats: Object }>}
+ */
+export async function measureTracksCached(files, {
+  namespace,
+  version,
+  measure,
+  options = {},
+  concurrency = Math.max(1, (os.availableParallelism?.() ?? os.cpus().length) - 1),
+  force = false,
+  rehash = false,
+  cacheDir = REFERENCE_CACHE_DIR,
+  onProgress
+}) {
+  const startedAt = Date.now();
+  const nsDir = path.join(cacheDir, namespace);
+  const tracksDir = path.join(nsDir, 'tracks');
+  const indexPath = path.join(nsDir, 'index.json');
+  const entryPath = (hash) => path.join(tracksDir, `${hash}-${version}.json`);
+  await fsp.mkdir(tracksDir, { recursive: true });
+
+  const absFiles = files.map(f => path.resolve(f));
+  const index = (await readJson(indexPath)) || {};
+  const { hashes, rehashed } = await resolveHashes(absFiles, index, rehash);
+  await writeJsonAtomic(indexPath, index);
+
+  const results = new Map();
+  const misses = [];
+  let done = 0;
+
+  for (const file of absFiles) {
+    const hash = hashes.get(file);
+    const entry = force ? null : await readJson(entryPath(hash));
+    if (entry && entry.version === version && entry.metrics) {
+      results.set(file, { file, hash, cached: true, metrics: entry.metrics });
+      onProgress?.({ file, cached: true, done: ++done, total: absFiles.length });
+    } else {
+      misses.push({ file, hash });
+    }
+  }
+
+  // Mesmo áudio em dois caminhos (cópia entre gêneros): mede uma vez só
+  const byHash = new Map();
+  for (const miss of misses) {
+    if (!byHash.has(miss.hash)) byHash.set(miss.hash, []);
+    byHash.get(miss.hash).push(miss);
+  }
+  const jobs = [...byHash.values()].map(group => group[0]);
+
+  await runPool(jobs, {
+    measure,
+    options,
+    concurrency,
+    onResult: async (job, message) => {
+      const group = byHash.get(job.hash);
+      if (!message.error && message.metrics) {
+        await writeJsonAtomic(entryPath(job.hash), {
+          hash: job.hash,
+          version,
+          file: path.basename(job.file),
+          measured_at: new Date().toISOString(),
+          metrics: message.metrics
+        });
+      }
+      for (const { file, hash } of group) {
+        results.set(file, message.error || !message.metrics
+          ? { file, hash, error: message.error || 'medição vazia' }
+          : { file, hash, cached: false, metrics: message.metrics });
+        onProgress?.({ file, cached: false, error: message.error, done: ++done, total: absFiles.length });
+      }
+    }
+  });
+
+  const ordered = absFiles.map(f => results.get(f));
+  const rows = ordered.filter(r => !r.error);
+  const failed = ordered.filter(r => r.error).map(({ file, error }) => ({ file, error }));
+
+  return {
+    rows,
+    failed,
+    stats: {
+      total: absFiles.length,
+      cached: rows.filter(r => r.cached).length,
+      measured: rows.filter(r => !r.cached).length,
+      failed: failed.length,
+      deduplicated: misses.length - jobs.length,
+      rehashed,
+      version,
+      ms: Date.now() - startedAt
+    }
+  };
+}
+
+/**
+ * Remove do namespace as medições de versões antigas e arquivos que não estão mais no index
+ */
+export async function pruneCache(namespace, { version, cacheDir = REFERENCE_CACHE_DIR } = {}) {
+  const nsDir = path.join(cacheDir, namespace);
+  const tracksDir = path.join(nsDir, 'tracks');
+  const indexPath = path.join(nsDir, 'index.json');
+  const index = (await readJson(indexPath)) || {};
+  for (const file of Object.keys(index)) {
+    if (!fs.existsSync(file)) delete index[file];
+  }
+  await writeJsonAtomic(indexPath, index);
+  const live = new Set(Object.values(index).map(e => e.hash));
+
+  let removed = 0;
+  const entries = await fsp.readdir(tracksDir).catch(() => []);
+  for (const name of entries.filter(n => n.endsWith('.json'))) {
+    const entry = await readJson(path.join(tracksDir, name));
+    if (!entry || !live.has(entry.hash) || (version && entry.version !== version)) {
+      await fsp.rm(path.join(tracksDir, name), { force: true });
+      removed++;
+    }
+  }
+  return { removed };
+}
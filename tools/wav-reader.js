@@ -0,0 +1,80 @@
+/**
+ * WAV Reader compartilhado das ferramentas de referência
+ * (reference-builder.js, metrics-recalc.js e scripts/refs-normalize-and-rebuild.cjs)
+ *
+ * PCM 16/24/32 bits e IEEE float 32; mono é duplicado em L/R.
+ * Chunks com tamanho ímpar respeitam o byte de alinhamento do RIFF.
+ */
+
+import fsp from 'node:fs/promises';
+
+function readSample(buf, pos, format, bitsPerSample) {
+  if (format === 3 && bitsPerSample === 32) return buf.readFloatLE(pos);
+  if (bitsPerSample === 16) return buf.readInt16LE(pos) / 32768;
+  if (bitsPerSample === 24) {
+    let val = buf[pos] | (buf[pos + 1] << 8) | (buf[pos + 2] << 16);
+    if (val & 0x800000) val |= 0xFF000000;
+    return val / 8388608;
+  }
+  if (bitsPerSample === 32) return buf.readInt32LE(pos) / 2147483648;
+  throw new Error(`PCM não suportado: ${bitsPerSample} bits`);
+}
+
+/**
+ * Decodifica um WAV já carregado em memória
+ * @param {Buffer} buf
+ * @returns {{ left: Float32Array, right: Float32Array, sampleRate: number, channels: number, bitDepth: number, format: string }}
+ */
+export function decodeWavBuffer(buf) {
+  if (buf.toString('ascii', 0, 4) !== 'RIFF' || buf.toString('ascii', 8, 12) !== 'WAVE') {
+    throw new Error('Formato não suportado (apenas WAV)');
+  }
+
+  let offset = 12;
+  let format, numChannels, sampleRate, bitsPerSample, dataOffset = -1, dataSize = 0;
+  while (offset + 8 <= buf.length) {
+    const chunkId = buf.toString('ascii', offset, offset + 4);
+    const chunkSize = buf.readUInt32LE(offset + 4);
+    const chunkStart = offset + 8;
+    if (chunkId === 'fmt ') {
+      format = buf.readUInt16LE(chunkStart);
+      numChannels = buf.readUInt16LE(chunkStart + 2);
+      sampleRate = buf.readUInt32LE(chunkStart + 4);
+      bitsPerSample = buf.readUInt16LE(chunkStart + 14);
+    } else if (chunkId === 'data') {
+      dataOffset = chunkStart;
+      dataSize = Math.min(chunkSize, buf.length - chunkStart);
+      break;
+    }
+    offset = chunkStart + chunkSize + (chunkSize % 2); // alinhamento
+  }
+  if (!numChannels) throw new Error('Chunk fmt não encontrado');
+  if (dataOffset < 0) throw new Error('Chunk data não encontrado');
+
+  const bytesPerSample = bitsPerSample / 8;
+  const frameSize = bytesPerSample * numChannels;
+  const frameCount = Math.floor(dataSize / frameSize);
+  const left = new Float32Array(frameCount);
+  const right = new Float32Array(frameCount);
+  for (let i = 0, pos = dataOffset; i < frameCount; i++, pos += frameSize) {
+    left[i] = readSample(buf, pos, format, bitsPerSample);
+    right[i] = numChannels > 1 ? readSample(buf, pos + bytesPerSample, format, bitsPerSample) : left[i];
+  }
+
+  return {
+    left,
+    right,
+    sampleRate,
+    channels: numChannels,
+    bitDepth: bitsPerSample,
+    format: format === 3 ? 'IEEE_FLOAT' : 'PCM'
+  };
+}
+
+/**
+ * Lê e decodifica um arquivo WAV
+ * @param {string} filePath
+ */
+export async function readWavFile(filePath) {
+  return decodeWavBuffer(await fsp.readFile(filePath));
+}
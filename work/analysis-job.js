@@ -23,10 +23,20 @@ import "dotenv/config";
 import AWS from "aws-sdk";
 import fs from "fs";
 import path from "path";
+import { createHash } from "crypto";
 import { fileURLToPath } from "url";
 import pool from './db.js';
+import { loadReferenceMetrics } from './lib/references/referenceLibrary.js';
 import { enrichSuggestionsWithAI } from './lib/ai/suggestion-enricher.js';
 import { referenceSuggestionEngine } from './lib/audio/features/reference-suggestion-engine.js';
+import { encodeResultWire, RESULT_SCHEMA_VERSION } from './lib/serialization/result-schema.js';
+import { createLogger } from './lib/logger.js';
+import { startJobProfile, profileStage } from './lib/job-profiler.js';
+import { decodeAudioExcerpt, probeAudioDuration } from './api/audio/audio-decoder.js';
+import { QUICK_SCAN_CONFIG, selectExcerptWindow, runQuickScan, buildQuickScanResult } from './lib/audio/quick-scan.js';
+import { putCachedSource, takeCachedSource } from './lib/audio/source-cache.js';
+
+const logger = createLogger('analysis-job');
 
 // Pipeline completo
 let processAudioComplete = null;
@@ -37,7 +47,7 @@ try {
   processAudioComplete = imported.processAudioComplete;
   runPipeline = imported.runPipeline;
 } catch (err) {
-  console.error(`[ANALYSIS-JOB] ❌ Falha ao carregar pipeline:`, err.message);
+  logger.error(`[ANALYSIS-JOB] ❌ Falha ao carregar pipeline:`, err.message);
   if (process.send) {
     process.send({ type: 'error', error: `Falha ao carregar pipeline: ${err.message}` });
   }
@@ -65,16 +75,19 @@ function createS3Client() {
 // DOWNLOAD STREAMING
 // ═══════════════════════════════════════════════════════════
 
-async function downloadFileFromBucket(fileKey) {
-  const s3 = createS3Client();
+function tempFilePathFor(fileKey) {
   const tempDir = path.join(__dirname, 'temp');
 
   if (!fs.existsSync(tempDir)) {
     fs.mkdirSync(tempDir, { recursive: true });
   }
 
-  const fileName = path.basename(fileKey);
-  const localFilePath = path.join(tempDir, `${Date.now()}-${process.pid}-${fileName}`);
+  return path.join(tempDir, `${Date.now()}-${process.pid}-${path.basename(fileKey)}`);
+}
+
+async function downloadFileFromBucket(fileKey) {
+  const s3 = createS3Client();
+  const localFilePath = tempFilePathFor(fileKey);
 
   await new Promise((resolve, reject) => {
     const readStream = s3.getObject({
@@ -114,6 +127,19 @@ async function downloadFileFromBucket(fileKey) {
   return localFilePath;
 }
 
+/**
+ * 🔑 Fingerprint do arquivo (SHA-256 em stream) — chave da biblioteca de referências
+ */
+function hashFile(filePath) {
+  return new Promise((resolve, reject) => {
+    const hash = createHash('sha256');
+    fs.createReadStream(filePath)
+      .on('data', chunk => hash.update(chunk))
+      .on('error', reject)
+      .on('end', () => resolve(`sha256:${hash.digest('hex')}`));
+  });
+}
+
 // ═══════════════════════════════════════════════════════════
 // SANITIZAÇÃO (mesmo do worker-redis.js)
 // ═══════════════════════════════════════════════════════════
@@ -185,20 +211,22 @@ function validateCompleteJSON(finalJSON, mode, referenceJobId) {
 // ═══════════════════════════════════════════════════════════
 
 async function processReferenceBase(jobData) {
-  const { jobId, fileKey, fileName } = jobData;
+  const { jobId, fileKey, fileName, planContext } = jobData;
 
-  console.log(`[ANALYSIS-JOB][REF-BASE] PID=${process.pid} Job=${jobId?.substring(0, 8)}`);
+  logger.info(`[ANALYSIS-JOB][REF-BASE] PID=${process.pid} Job=${jobId?.substring(0, 8)}`);
 
   let localFilePath = null;
 
   try {
-    localFilePath = await downloadFileFromBucket(fileKey);
+    localFilePath = await profileStage('download', () => downloadFileFromBucket(fileKey));
     
     // 🧹 MEMORY OPT: Obter tamanho do arquivo SEM carregá-lo na RAM
     const fileStats = fs.statSync(localFilePath);
-    console.log(`[ANALYSIS-JOB][REF-BASE] Arquivo: ${fileStats.size} bytes`);
+    logger.info(`[ANALYSIS-JOB][REF-BASE] Arquivo: ${fileStats.size} bytes`);
 
     const t0 = Date.now();
+    // 📚 Fingerprint em paralelo com o pipeline (permite salvar a referência na biblioteca)
+    const fingerprintPromise = hashFile(localFilePath).catch(() => null);
     // 🧹 MEMORY OPT: Passar caminho do arquivo — FFmpeg lê do disco direto
     const finalJSON = await processAudioComplete(null, fileName || 'unknown.wav', {
       jobId,
@@ -206,9 +234,10 @@ async function processReferenceBase(jobData) {
       referenceStage: 'base',
       inputFilePath: localFilePath,
     });
+    finalJSON.audioFingerprint = await fingerprintPromise;
 
     const totalMs = Date.now() - t0;
-    console.log(`[ANALYSIS-JOB][REF-BASE] Pipeline concluído em ${totalMs}ms`);
+    logger.info(`[ANALYSIS-JOB][REF-BASE] Pipeline concluído em ${totalMs}ms`);
 
     // Campos específicos de reference base
     finalJSON.success = true;
@@ -218,6 +247,7 @@ async function processReferenceBase(jobData) {
     finalJSON.requiresSecondTrack = true;
     finalJSON.referenceJobId = jobId;
     finalJSON.jobId = jobId;
+    finalJSON.ownerUid = planContext?.uid || null; // 🔒 dono: só ele salva a base na biblioteca
     finalJSON.analysisMode = finalJSON.analysisMode || 'full';
     finalJSON.isReduced = finalJSON.isReduced ?? false;
     finalJSON.aiSuggestions = [];
@@ -257,36 +287,52 @@ async function processReferenceBase(jobData) {
   }
 }
 
+async function loadBaseMetricsFromJob(referenceJobId) {
+  const refResult = await pool.query(
+    'SELECT id, status, results FROM jobs WHERE id = $1',
+    [referenceJobId]
+  );
+
+  if (refResult.rows.length === 0) {
+    throw new Error(`Job de referência ${referenceJobId} não encontrado`);
+  }
+  const refJob = refResult.rows[0];
+  if (refJob.status !== 'completed') {
+    throw new Error(`Job de referência status '${refJob.status}' (esperado: completed)`);
+  }
+  if (!refJob.results) {
+    throw new Error('Job de referência não possui resultados');
+  }
+  return refJob.results;
+}
+
 async function processReferenceCompare(jobData) {
-  const { jobId, fileKey, fileName, referenceJobId } = jobData;
+  const { jobId, fileKey, fileName, referenceId } = jobData;
+  let { referenceJobId } = jobData;
 
-  console.log(`[ANALYSIS-JOB][REF-COMPARE] PID=${process.pid} Job=${jobId?.substring(0, 8)}`);
+  logger.info(`[ANALYSIS-JOB][REF-COMPARE] PID=${process.pid} Job=${jobId?.substring(0, 8)}`);
 
   let localFilePath = null;
 
   try {
-    // Carregar métricas da base
-    const refResult = await pool.query(
-      'SELECT id, status, results FROM jobs WHERE id = $1',
-      [referenceJobId]
-    );
-
-    if (refResult.rows.length === 0) {
-      throw new Error(`Job de referência ${referenceJobId} não encontrado`);
-    }
-    const refJob = refResult.rows[0];
-    if (refJob.status !== 'completed') {
-      throw new Error(`Job de referência status '${refJob.status}' (esperado: completed)`);
-    }
-    if (!refJob.results) {
-      throw new Error('Job de referência não possui resultados');
+    // Carregar métricas da base: biblioteca (pré-computadas) ou job reference/base
+    let baseMetrics;
+    if (referenceId) {
+      const libraryReference = await loadReferenceMetrics(referenceId);
+      if (!libraryReference) {
+        throw new Error(`Referência ${referenceId} não encontrada na biblioteca`);
+      }
+      baseMetrics = libraryReference.metrics;
+      referenceJobId = referenceJobId || libraryReference.sourceJobId;
+      logger.info(`[ANALYSIS-JOB][REF-COMPARE] 📚 Base da biblioteca: ${libraryReference.name}`);
+    } else {
+      baseMetrics = await loadBaseMetricsFromJob(referenceJobId);
     }
-    const baseMetrics = refJob.results;
 
     // Download e processamento
-    localFilePath = await downloadFileFromBucket(fileKey);
+    localFilePath = await profileStage('download', () => downloadFileFromBucket(fileKey));
     const fileStats = fs.statSync(localFilePath);
-    console.log(`[ANALYSIS-JOB][REF-COMPARE] Arquivo: ${fileStats.size} bytes`);
+    logger.info(`[ANALYSIS-JOB][REF-COMPARE] Arquivo: ${fileStats.size} bytes`);
 
     const t0 = Date.now();
     const finalJSON = await processAudioComplete(null, fileName || 'unknown.wav', {
@@ -299,7 +345,7 @@ async function processReferenceCompare(jobData) {
     });
 
     const totalMs = Date.now() - t0;
-    console.log(`[ANALYSIS-JOB][REF-COMPARE] Pipeline concluído em ${totalMs}ms`);
+    logger.info(`[ANALYSIS-JOB][REF-COMPARE] Pipeline concluído em ${totalMs}ms`);
 
     // Calcular referenceComparison (deltas)
     const baseTech = baseMetrics.technicalData || {};
@@ -359,6 +405,7 @@ async function processReferenceCompare(jobData) {
     finalJSON.mode = 'reference';
     finalJSON.referenceStage = 'compare';
     finalJSON.referenceJobId = referenceJobId;
+    finalJSON.referenceId = referenceId || null;
     finalJSON.jobId = jobId;
     finalJSON.requiresSecondTrack = false;
     finalJSON.analysisMode = finalJSON.analysisMode || 'full';
@@ -403,12 +450,13 @@ async function processGenre(jobData) {
     jobId, fileKey, fileName, mode,
     referenceJobId, genre, genreTargets,
     soundDestination = 'pista',
-    planContext
+    planContext,
+    quickScanUpgrade = null
   } = jobData;
 
   const validSoundDestination = ['pista', 'streaming'].includes(soundDestination) ? soundDestination : 'pista';
 
-  console.log(`[ANALYSIS-JOB][GENRE] PID=${process.pid} Job=${jobId?.substring(0, 8)} Genre=${genre || 'N/A'}`);
+  logger.info(`[ANALYSIS-JOB][GENRE] PID=${process.pid} Job=${jobId?.substring(0, 8)} Genre=${genre || 'N/A'}`);
 
   let localFilePath = null;
   let preloadedReferenceMetrics = null;
@@ -437,21 +485,29 @@ async function processGenre(jobData) {
         );
         if (refResult.rows.length > 0 && refResult.rows[0].status === 'completed' && refResult.rows[0].results) {
           preloadedReferenceMetrics = refResult.rows[0].results;
-          console.log('[ANALYSIS-JOB][GENRE] ✅ Métricas ref carregadas');
+          logger.info('[ANALYSIS-JOB][GENRE] ✅ Métricas ref carregadas');
         }
       } catch (refError) {
-        console.error('[ANALYSIS-JOB][GENRE] ❌ Erro ao carregar métricas ref:', refError.message);
+        logger.error('[ANALYSIS-JOB][GENRE] ❌ Erro ao carregar métricas ref:', refError.message);
       }
     }
 
-    // Download
+    // Download (upgrade do quick-scan: cópia local guardada pelo quick-scan, se ainda estiver aqui)
     const downloadStartTime = Date.now();
-    localFilePath = await downloadFileFromBucket(fileKey);
+    let sourceReused = false;
+    if (quickScanUpgrade) {
+      const reusePath = tempFilePathFor(fileKey);
+      sourceReused = await takeCachedSource(fileKey, reusePath, { expectedBytes: quickScanUpgrade.sourceBytes });
+      if (sourceReused) localFilePath = reusePath;
+    }
+    if (!sourceReused) {
+      localFilePath = await profileStage('download', () => downloadFileFromBucket(fileKey));
+    }
     const downloadTime = Date.now() - downloadStartTime;
     
     // 🧹 MEMORY OPT: Obter tamanho SEM carregar na RAM
     const fileStats = fs.statSync(localFilePath);
-    console.log(`[ANALYSIS-JOB][GENRE] ✅ Download em ${downloadTime}ms (${fileStats.size} bytes)`);
+    logger.info(`[ANALYSIS-JOB][GENRE] ✅ ${sourceReused ? 'Cópia do quick-scan reaproveitada' : 'Download'} em ${downloadTime}ms (${fileStats.size} bytes)`);
 
     const t0 = Date.now();
 
@@ -465,6 +521,8 @@ async function processGenre(jobData) {
       _buffer: null,
       _inputFilePath: localFilePath,
       _preloadedReferenceMetrics: preloadedReferenceMetrics,
+      // Duração medida pelo quick-scan: decode pré-alocado sem ffprobe
+      _expectedFrames: quickScanUpgrade?.expectedFrames || null,
     };
 
     // Pipeline com timeout
@@ -485,7 +543,7 @@ async function processGenre(jobData) {
     pseudoJob._preloadedReferenceMetrics = null;
 
     const totalMs = Date.now() - t0;
-    console.log(`[ANALYSIS-JOB][GENRE] ✅ Pipeline concluído em ${totalMs}ms`);
+    logger.info(`[ANALYSIS-JOB][GENRE] ✅ Pipeline concluído em ${totalMs}ms`);
 
     finalJSON.soundDestination = validSoundDestination;
 
@@ -507,7 +565,8 @@ async function processGenre(jobData) {
       workerTimestamp: new Date().toISOString(),
       backendPhase: '5.1-5.4-isolated',
       workerId: process.pid,
-      downloadTimeMs: downloadTime
+      downloadTimeMs: downloadTime,
+      ...(quickScanUpgrade && { quickScanJobId: quickScanUpgrade.quickScanJobId, sourceReused })
     };
 
     finalJSON._worker = {
@@ -524,12 +583,12 @@ async function processGenre(jobData) {
 
     // AI Enrichment
     try {
-      console.log('[ANALYSIS-JOB][GENRE] Iniciando AI enrichment...');
+      logger.info('[ANALYSIS-JOB][GENRE] Iniciando AI enrichment...');
       const metrics = finalJSON.data?.metrics || finalJSON.metrics || null;
       const targets = finalJSON.data?.genreTargets || finalJSON.genreTargets || null;
       const problems = finalJSON.problemsAnalysis || null;
 
-      const enriched = await enrichSuggestionsWithAI(
+      const enriched = await profileStage('ai', () => enrichSuggestionsWithAI(
         finalJSON.suggestions || [],
         {
           metrics,
@@ -539,19 +598,19 @@ async function processGenre(jobData) {
           mode,
           referenceJobId,
         }
-      );
+      ));
 
       finalJSON.aiSuggestions = Array.isArray(enriched) ? enriched : [];
-      console.log(`[ANALYSIS-JOB][GENRE] ✅ AI enrichment: ${finalJSON.aiSuggestions.length} sugestões`);
+      logger.info(`[ANALYSIS-JOB][GENRE] ✅ AI enrichment: ${finalJSON.aiSuggestions.length} sugestões`);
     } catch (err) {
-      console.error('[ANALYSIS-JOB][GENRE] ❌ Erro no enrichment:', err.message);
+      logger.error('[ANALYSIS-JOB][GENRE] ❌ Erro no enrichment:', err.message);
       finalJSON.aiSuggestions = [];
     }
 
     // Validação
     const validation = validateCompleteJSON(finalJSON, mode, referenceJobId);
     if (!validation.valid) {
-      console.error(`[ANALYSIS-JOB][GENRE] ❌ JSON incompleto: ${validation.missing.join(', ')}`);
+      logger.error(`[ANALYSIS-JOB][GENRE] ❌ JSON incompleto: ${validation.missing.join(', ')}`);
       throw new Error(`JSON incompleto: ${validation.missing.join(', ')}`);
     }
 
@@ -564,6 +623,77 @@ async function processGenre(jobData) {
   }
 }
 
+/**
+ * ⚡ Quick-scan (visitante anônimo): trecho reamostrado → LUFS, True Peak, DR e bandas grossas.
+ * Sem runPipeline, scoring, sugestões nem IA. O arquivo baixado vai para o source cache
+ * (upgrade para a análise completa após o cadastro).
+ */
+async function processQuickScan(jobData) {
+  const { jobId, fileKey, fileName, genre, soundDestination = 'pista', upgradeTokenHash = null } = jobData;
+
+  logger.info(`[ANALYSIS-JOB][QUICK] PID=${process.pid} Job=${jobId?.substring(0, 8)} Genre=${genre || 'N/A'}`);
+
+  let localFilePath = null;
+
+  try {
+    if (!fileKey || typeof fileKey !== 'string' || fileKey.length < 3 || !jobId) {
+      throw new Error(`Dados do job inválidos`);
+    }
+
+    const downloadStartTime = Date.now();
+    localFilePath = await profileStage('download', () => downloadFileFromBucket(fileKey));
+    const downloadTime = Date.now() - downloadStartTime;
+    const sourceBytes = fs.statSync(localFilePath).size;
+
+    const t0 = Date.now();
+    const sourceDurationSeconds = await profileStage('probe', () => probeAudioDuration(localFilePath));
+    const excerpt = selectExcerptWindow(sourceDurationSeconds);
+
+    let audio = await profileStage('decode', () => decodeAudioExcerpt(localFilePath, fileName || path.basename(fileKey), {
+      jobId,
+      sampleRate: QUICK_SCAN_CONFIG.sampleRate,
+      startSeconds: excerpt.startSeconds,
+      durationSeconds: excerpt.durationSeconds
+    }));
+    const metrics = profileStage('quick_scan', () => runQuickScan(audio));
+    audio = null;
+
+    const processingMs = Date.now() - t0;
+    logger.info(`[ANALYSIS-JOB][QUICK] ✅ ${excerpt.durationSeconds ?? 'arquivo inteiro'}s a ${QUICK_SCAN_CONFIG.sampleRate}Hz em ${processingMs}ms ` +
+      `(LUFS ${metrics.lufsIntegrated?.toFixed(1)}, TP ${metrics.truePeakDbtp?.toFixed(2)} dBTP, DR ${metrics.dynamicRange?.toFixed(1)})`);
+
+    const result = buildQuickScanResult(metrics, {
+      jobId,
+      fileKey,
+      fileName,
+      genre,
+      soundDestination: ['pista', 'streaming'].includes(soundDestination) ? soundDestination : 'pista',
+      excerpt,
+      sampleRate: QUICK_SCAN_CONFIG.sampleRate,
+      sourceDurationSeconds,
+      sourceBytes,
+      processingMs,
+      upgradeTokenHash
+    });
+    result.performance = { workerTotalTimeMs: processingMs, downloadTimeMs: downloadTime, workerId: process.pid };
+
+    // 🔁 Upgrade: guardar a cópia local em vez de apagar (falha aqui não derruba o quick-scan)
+    try {
+      await putCachedSource(fileKey, localFilePath);
+      localFilePath = null;
+    } catch (err) {
+      logger.warn(`[ANALYSIS-JOB][QUICK] ⚠️ Cópia local não guardada para upgrade: ${err.message}`);
+    }
+
+    return { status: 'completed', result };
+
+  } finally {
+    if (localFilePath && fs.existsSync(localFilePath)) {
+      try { fs.unlinkSync(localFilePath); } catch (_) {}
+    }
+  }
+}
+
 // ═══════════════════════════════════════════════════════════
 // ENTRY POINT — RECEBER MENSAGEM VIA IPC
 // ═══════════════════════════════════════════════════════════
@@ -576,23 +706,24 @@ process.on('message', async (msg) => {
   const startTime = Date.now();
 
   const memBefore = process.memoryUsage();
-  console.log(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
-  console.log(`[ANALYSIS-JOB] 🚀 Job recebido PID=${process.pid}`);
-  console.log(`[ANALYSIS-JOB] Job ID: ${jobData.jobId?.substring(0, 8)}`);
-  console.log(`[ANALYSIS-JOB] Mode: ${mode} | Stage: ${referenceStage || 'N/A'}`);
-  console.log(`[ANALYSIS-JOB] RAM inicial: ${(memBefore.rss / 1024 / 1024).toFixed(1)}MB`);
-  console.log(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
+  logger.info(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
+  logger.info(`[ANALYSIS-JOB] 🚀 Job recebido PID=${process.pid}`);
+  logger.info(`[ANALYSIS-JOB] Job ID: ${jobData.jobId?.substring(0, 8)}`);
+  logger.info(`[ANALYSIS-JOB] Mode: ${mode} | Stage: ${referenceStage || 'N/A'}`);
+  logger.info(`[ANALYSIS-JOB] RAM inicial: ${(memBefore.rss / 1024 / 1024).toFixed(1)}MB`);
+  logger.info(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
+
+  // 🔬 Profiling por estágio (PROFILE_JOB_IDS / PROFILE_SAMPLE_RATE); o limiar de artefatos vem do pai
+  const profile = await startJobProfile(jobData.jobId, { keepAboveMs: msg.profiling?.keepAboveMs ?? 0 });
+  const runJob = () => {
+    if (mode === 'reference' && referenceStage === 'base') return processReferenceBase(jobData);
+    if (mode === 'reference' && referenceStage === 'compare') return processReferenceCompare(jobData);
+    if (jobData.analysisTier === 'quick') return processQuickScan(jobData);
+    return processGenre(jobData);
+  };
 
   try {
-    let outcome;
-
-    if (mode === 'reference' && referenceStage === 'base') {
-      outcome = await processReferenceBase(jobData);
-    } else if (mode === 'reference' && referenceStage === 'compare') {
-      outcome = await processReferenceCompare(jobData);
-    } else {
-      outcome = await processGenre(jobData);
-    }
+    const outcome = profile ? await profile.run(runJob) : await runJob();
 
     // Sanitizar antes de enviar
     if (outcome.result) {
@@ -602,32 +733,49 @@ process.on('message', async (msg) => {
     const memAfter = process.memoryUsage();
     const elapsed = Date.now() - startTime;
 
-    console.log(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
-    console.log(`[ANALYSIS-JOB] ✅ Job concluído PID=${process.pid}`);
-    console.log(`[ANALYSIS-JOB] Tempo total: ${elapsed}ms`);
-    console.log(`[ANALYSIS-JOB] RAM pico: ${(memAfter.rss / 1024 / 1024).toFixed(1)}MB`);
-    console.log(`[ANALYSIS-JOB] Heap usado: ${(memAfter.heapUsed / 1024 / 1024).toFixed(1)}MB`);
-    console.log(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
+    logger.info(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
+    logger.info(`[ANALYSIS-JOB] ✅ Job concluído PID=${process.pid}`);
+    logger.info(`[ANALYSIS-JOB] Tempo total: ${elapsed}ms`);
+    logger.info(`[ANALYSIS-JOB] RAM pico: ${(memAfter.rss / 1024 / 1024).toFixed(1)}MB`);
+    logger.info(`[ANALYSIS-JOB] Heap usado: ${(memAfter.heapUsed / 1024 / 1024).toFixed(1)}MB`);
+    logger.info(`[ANALYSIS-JOB] ═══════════════════════════════════════`);
+
+    // 📦 Resultado em MessagePack (aliases duplicados removidos, precisão do schema aplicada)
+    const encodeStart = performance.now();
+    const payload = encodeResultWire(outcome.result);
+    const wireEncodeMs = performance.now() - encodeStart;
+    logger.info(`[ANALYSIS-JOB] 📦 Payload IPC: ${(payload.length / 1024).toFixed(1)}KB msgpack (encode ${wireEncodeMs.toFixed(2)}ms)`);
+
+    const profileSummary = profile ? await profile.finish({ status: outcome.status }) : null;
 
     // Enviar resultado para o processo pai
     process.send({
       type: 'result',
       status: outcome.status,
-      result: outcome.result,
+      encoding: 'msgpack',
+      schemaVersion: RESULT_SCHEMA_VERSION,
+      payload,
       metrics: {
         elapsed,
         peakRssMB: Math.round(memAfter.rss / 1024 / 1024),
         heapUsedMB: Math.round(memAfter.heapUsed / 1024 / 1024),
+        wireBytes: payload.length,
+        wireEncodeMs: +wireEncodeMs.toFixed(3),
+        profile: profileSummary,
       }
     });
 
   } catch (error) {
-    console.error(`[ANALYSIS-JOB] ❌ Erro fatal PID=${process.pid}:`, error.message);
+    logger.error(`[ANALYSIS-JOB] ❌ Erro fatal PID=${process.pid}:`, error.message);
+
+    // Jobs que falham costumam ser os lentos: o perfil segue junto com o erro
+    const profileSummary = profile ? await profile.finish({ status: 'failed' }).catch(() => null) : null;
 
     process.send({
       type: 'error',
       error: error.message,
       stack: error.stack,
+      metrics: { profile: profileSummary },
     });
   } finally {
     // Fechar pool do DB (o pool pode manter o processo vivo)
@@ -638,7 +786,7 @@ process.on('message', async (msg) => {
     // 🔥 ESSENCIAL: Garantir morte do processo após envio
     // Pequeno delay para garantir que o IPC flush aconteça
     setTimeout(() => {
-      console.log(`[ANALYSIS-JOB] 💀 Encerrando processo PID=${process.pid}`);
+      logger.info(`[ANALYSIS-JOB] 💀 Encerrando processo PID=${process.pid}`);
       process.exit(0);
     }, 500);
   }
@@ -646,13 +794,13 @@ process.on('message', async (msg) => {
 
 // Safety: se o processo pai morrer, este processo também morre
 process.on('disconnect', () => {
-  console.log(`[ANALYSIS-JOB] ⚠️ Pai desconectou — encerrando PID=${process.pid}`);
+  logger.info(`[ANALYSIS-JOB] ⚠️ Pai desconectou — encerrando PID=${process.pid}`);
   process.exit(1);
 });
 
 // Safety: timeout global para processos órfãos (5 minutos)
 const ORPHAN_TIMEOUT = 300000;
 setTimeout(() => {
-  console.error(`[ANALYSIS-JOB] ⏰ Timeout global de ${ORPHAN_TIMEOUT / 1000}s — processo órfão PID=${process.pid}`);
+  logger.error(`[ANALYSIS-JOB] ⏰ Timeout global de ${ORPHAN_TIMEOUT / 1000}s — processo órfão PID=${process.pid}`);
   process.exit(1);
 }, ORPHAN_TIMEOUT).unref(); // unref para não impedir exit natural
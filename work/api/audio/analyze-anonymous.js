@@ -15,8 +15,10 @@
  * 
  * IMPORTANTE:
  * - Apenas modo "genre" permitido (reference requer conta)
- * - Análise completa (sem modo reduced)
+ * - Análise completa (sem modo reduced) ou quick-scan (analysisTier 'quick'):
+ *   trecho reamostrado, só LUFS/True Peak/DR/bandas grossas (lib/audio/quick-scan.js)
  * - Sem persistência de histórico (apenas resultado imediato)
+ * - Upgrade: após o cadastro, POST /api/audio/analyze com quickScanJobId reaproveita o upload
  * 
  * @version 2.0.0 - BLOQUEIO PERMANENTE
  * @date 2025-01-03
@@ -24,9 +26,9 @@
 
 import "dotenv/config";
 import express from "express";
-import { randomUUID } from "crypto";
+import { randomUUID, randomBytes, createHash } from "crypto";
 import cors from 'cors';
-import { getAudioQueue, getQueueReadyPromise } from '../../lib/queue.js';
+import { getQueueReadyPromise, addAudioJob } from '../../lib/queue.js';
 import pool from "../../db.js";
 import {
   canAnonymousAnalyze,
@@ -37,6 +39,9 @@ import {
   enforceAnonymousSingleAnalysis,
   registerAndBlockAnonymous
 } from '../../lib/anonymousBlockGuard.js';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:analyze-anonymous');
 
 const router = express.Router();
 
@@ -46,10 +51,10 @@ const router = express.Router();
 
 let queueReady = false;
 const queueInit = (async () => {
-  console.log('🚀 [ANON_ANALYZE] Inicializando fila...');
+  logger.info('🚀 [ANON_ANALYZE] Inicializando fila...');
   await getQueueReadyPromise();
   queueReady = true;
-  console.log('✅ [ANON_ANALYZE] Fila pronta!');
+  logger.info('✅ [ANON_ANALYZE] Fila pronta!');
 })();
 
 // ═══════════════════════════════════════════════════════════════════
@@ -59,6 +64,17 @@ const queueInit = (async () => {
 const MAX_UPLOAD_MB = parseInt(process.env.MAX_UPLOAD_MB || "150");
 const ALLOWED_EXTENSIONS = [".wav", ".flac", ".mp3"];
 
+// ⚡ Tier da análise anônima: 'full' (pipeline completo) | 'quick' (quick-scan)
+// ANONYMOUS_ANALYSIS_TIER define o padrão; o frontend pode pedir explicitamente via analysisTier
+const ANALYSIS_TIERS = ['full', 'quick'];
+const DEFAULT_ANALYSIS_TIER = ANALYSIS_TIERS.includes(process.env.ANONYMOUS_ANALYSIS_TIER)
+  ? process.env.ANONYMOUS_ANALYSIS_TIER
+  : 'full';
+
+function resolveAnalysisTier(requested) {
+  return ANALYSIS_TIERS.includes(requested) ? requested : DEFAULT_ANALYSIS_TIER;
+}
+
 // ═══════════════════════════════════════════════════════════════════
 // VALIDAÇÃO
 // ═══════════════════════════════════════════════════════════════════
@@ -84,30 +100,34 @@ function validateFileType(fileKey) {
  * - O INSERT deve ser IDÊNTICO ao modo logado
  * - O worker processa o payload e popula results.genre
  */
-async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTargets, visitorId, soundDestination = 'pista') {
+async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTargets, visitorId, soundDestination = 'pista', analysisTier = 'full') {
   const jobId = randomUUID();
   const externalId = `anon-${Date.now()}-${jobId.substring(0, 8)}`;
+
+  // 🔑 Quick-scan: token de upgrade só na resposta ao visitante; o job guarda o hash
+  // (mesmo hash de hashUpgradeToken em lib/audio/quick-scan.js)
+  const upgradeToken = analysisTier === 'quick' ? randomBytes(32).toString('base64url') : null;
+  const upgradeTokenHash = upgradeToken ? createHash('sha256').update(upgradeToken).digest('hex') : null;
   
   const validSoundDestination = ['pista', 'streaming'].includes(soundDestination) ? soundDestination : 'pista';
   
-  console.log(`📋 [ANON_JOB] Criando job anônimo:`);
-  console.log(`   🔑 UUID: ${jobId}`);
-  console.log(`   📋 External ID: ${externalId}`);
-  console.log(`   📁 Arquivo: ${fileKey}`);
-  console.log(`   🎵 Gênero: ${genre}`);
-  console.log(`   📡 Destino: ${validSoundDestination}`);
-  console.log(`   👤 Visitor: ${visitorId.substring(0, 8)}...`);
+  logger.info(`📋 [ANON_JOB] Criando job anônimo:`);
+  logger.info(`   🔑 UUID: ${jobId}`);
+  logger.info(`   📋 External ID: ${externalId}`);
+  logger.info(`   📁 Arquivo: ${fileKey}`);
+  logger.info(`   🎵 Gênero: ${genre}`);
+  logger.info(`   📡 Destino: ${validSoundDestination}`);
+  logger.info(`   ⚡ Tier: ${analysisTier}`);
+  logger.info(`   👤 Visitor: ${visitorId.substring(0, 8)}...`);
 
   try {
     // Garantir fila pronta
     if (!queueReady) {
-      console.log('⏳ [ANON_JOB] Aguardando fila...');
+      logger.info('⏳ [ANON_JOB] Aguardando fila...');
       await queueInit;
     }
 
     // ✅ ETAPA 1: Enfileirar no Redis (com genre e soundDestination no payload)
-    const queue = getAudioQueue();
-    
     const payloadParaRedis = {
       jobId,
       externalId,
@@ -120,9 +140,12 @@ async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTarge
       soundDestination: validSoundDestination, // 🎯 Destino vai aqui
       anonymous: true,
       visitorId,
+      analysisTier,          // ⚡ 'quick' → analysis-job.js roda o quick-scan em vez do pipeline
+      upgradeTokenHash,      // 🔑 Gravado em results.quickScan.upgrade (checado no upgrade)
       planContext: {
         plan: 'anonymous',
         mode: 'full',
+        analysisTier,
         features: {
           aiSuggestions: false, // Anônimos não têm IA suggestions
           pdfReport: false,
@@ -131,12 +154,11 @@ async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTarge
       }
     };
 
-    console.log('📩 [ANON_JOB] Enfileirando no Redis...');
-    console.log('📦 [ANON_JOB] Payload Redis:', JSON.stringify(payloadParaRedis, null, 2));
+    logger.info('📩 [ANON_JOB] Enfileirando no Redis...');
+    logger.debug(() => ['📦 [ANON_JOB] Payload Redis:', JSON.stringify(payloadParaRedis, null, 2)]);
     
-    const redisJob = await queue.add('process-audio', payloadParaRedis, {
+    const redisJob = await addAudioJob('process-audio', payloadParaRedis, {
       jobId: externalId,
-      priority: 5, // Prioridade mais baixa que usuários pagos
       attempts: 2, // Menos tentativas que usuários pagos
       backoff: {
         type: 'exponential',
@@ -146,12 +168,12 @@ async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTarge
       removeOnFail: 3,
     });
 
-    console.log(`✅ [ANON_JOB] Job enfileirado: ${redisJob.id}`);
+    logger.info(`✅ [ANON_JOB] Job enfileirado: ${redisJob.id}`);
 
     // ✅ ETAPA 2: Gravar no PostgreSQL (MESMO SCHEMA do modo logado)
     // NOTA: genre e sound_destination NÃO são colunas da tabela jobs
     // O worker processa o payload do Redis e popula results.genre
-    console.log('📝 [ANON_JOB] Gravando no PostgreSQL (schema padrão)...');
+    logger.info('📝 [ANON_JOB] Gravando no PostgreSQL (schema padrão)...');
     
     const result = await pool.query(
       `INSERT INTO jobs (id, file_key, mode, status, file_name, reference_for, created_at, updated_at)
@@ -159,7 +181,7 @@ async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTarge
       [jobId, fileKey, "genre", "queued", fileName || null, null]
     );
 
-    console.log(`✅ [ANON_JOB] Job gravado no PostgreSQL:`, {
+    logger.info(`✅ [ANON_JOB] Job gravado no PostgreSQL:`, {
       id: result.rows[0].id,
       file_key: result.rows[0].file_key,
       mode: result.rows[0].mode,
@@ -169,11 +191,12 @@ async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTarge
     // Retornar com jobId para polling
     return {
       ...result.rows[0],
-      jobId: result.rows[0].id // Alias para compatibilidade
+      jobId: result.rows[0].id, // Alias para compatibilidade
+      upgradeToken
     };
     
   } catch (error) {
-    console.error(`💥 [ANON_JOB] Erro:`, error.message);
+    logger.error(`💥 [ANON_JOB] Erro:`, error.message);
     throw new Error(`Erro ao criar job anônimo: ${error.message}`);
   }
 }
@@ -185,11 +208,11 @@ async function createAnonymousJobInDatabase(fileKey, fileName, genre, genreTarge
 router.post("/", async (req, res) => {
   const requestId = Math.random().toString(36).substring(7);
   
-  console.log(`\n${'='.repeat(60)}`);
-  console.log(`🔓 [ANON_ANALYZE:${requestId}] Nova análise anônima`);
-  console.log(`${'='.repeat(60)}`);
-  console.log(`📅 ${new Date().toISOString()}`);
-  console.log(`🌐 IP: ${req.headers['x-forwarded-for'] || req.socket?.remoteAddress}`);
+  logger.info(`\n${'='.repeat(60)}`);
+  logger.info(`🔓 [ANON_ANALYZE:${requestId}] Nova análise anônima`);
+  logger.info(`${'='.repeat(60)}`);
+  logger.info(`📅 ${new Date().toISOString()}`);
+  logger.info(`🌐 IP: ${req.headers['x-forwarded-for'] || req.socket?.remoteAddress}`);
   
   try {
     // ═══════════════════════════════════════════════════════════════
@@ -206,13 +229,15 @@ router.post("/", async (req, res) => {
       isDemo,
       // 🛡️ NOVO: Fingerprint forte do dispositivo
       fingerprintHash,
-      hardwareSummary
+      hardwareSummary,
+      analysisTier: requestedTier
     } = req.body;
     
     // 🔥 MODO DEMO: Usar limites mais restritivos
     const isDemoMode = isDemo === true;
+    const analysisTier = resolveAnalysisTier(requestedTier);
 
-    console.log('[ANON_ANALYZE] Payload recebido:', {
+    logger.info('[ANON_ANALYZE] Payload recebido:', {
       hasFileKey: !!fileKey,
       hasFileName: !!fileName,
       isDemoMode,
@@ -222,7 +247,8 @@ router.post("/", async (req, res) => {
       visitorIdLength: visitorId?.length,
       hasFingerprintHash: !!fingerprintHash,
       fingerprintHashLength: fingerprintHash?.length,
-      soundDestination
+      soundDestination,
+      analysisTier
     });
 
     // ═══════════════════════════════════════════════════════════════
@@ -230,7 +256,7 @@ router.post("/", async (req, res) => {
     // ═══════════════════════════════════════════════════════════════
     
     if (!visitorId || typeof visitorId !== 'string' || visitorId.length < 10) {
-      console.error(`❌ [ANON_ANALYZE:${requestId}] visitorId inválido`);
+      logger.error(`❌ [ANON_ANALYZE:${requestId}] visitorId inválido`);
       return res.status(400).json({
         success: false,
         error: 'VISITOR_ID_REQUIRED',
@@ -242,9 +268,9 @@ router.post("/", async (req, res) => {
     // ETAPA 3: 🛡️ GUARD DE BLOQUEIO DEFINITIVO (MULTI-CAMADA)
     // ═══════════════════════════════════════════════════════════════
     
-    console.log(`🛡️ [ANON_ANALYZE:${requestId}] Executando GUARD de bloqueio definitivo...`);
-    console.log(`   visitorId: ${visitorId.substring(0, 12)}...`);
-    console.log(`   fingerprintHash: ${fingerprintHash?.substring(0, 12) || 'N/A'}...`);
+    logger.info(`🛡️ [ANON_ANALYZE:${requestId}] Executando GUARD de bloqueio definitivo...`);
+    logger.info(`   visitorId: ${visitorId.substring(0, 12)}...`);
+    logger.info(`   fingerprintHash: ${fingerprintHash?.substring(0, 12) || 'N/A'}...`);
     
     // 🚨 GUARD PRINCIPAL - Verifica TODAS as camadas de identificação
     const blockGuard = await enforceAnonymousSingleAnalysis(
@@ -258,7 +284,7 @@ router.post("/", async (req, res) => {
     );
     
     if (!blockGuard.allowed) {
-      console.log(`🚫 [ANON_ANALYZE:${requestId}] BLOQUEADO pelo guard:`, {
+      logger.info(`🚫 [ANON_ANALYZE:${requestId}] BLOQUEADO pelo guard:`, {
         reason: blockGuard.reason,
         errorCode: blockGuard.errorCode,
         isDemo: isDemoMode
@@ -275,7 +301,7 @@ router.post("/", async (req, res) => {
       });
     }
 
-    console.log(`✅ [ANON_ANALYZE:${requestId}] Guard OK - primeira análise permitida`);
+    logger.info(`✅ [ANON_ANALYZE:${requestId}] Guard OK - primeira análise permitida`);
     
     // Guardar dados para registro após análise
     const registrationData = blockGuard.registrationData;
@@ -314,7 +340,7 @@ router.post("/", async (req, res) => {
     // ETAPA 5: CRIAR JOB
     // ═══════════════════════════════════════════════════════════════
     
-    console.log(`🎵 [ANON_ANALYZE:${requestId}] Criando job anônimo...`);
+    logger.info(`🎵 [ANON_ANALYZE:${requestId}] Criando job anônimo...`);
     
     const job = await createAnonymousJobInDatabase(
       fileKey,
@@ -322,7 +348,8 @@ router.post("/", async (req, res) => {
       genre.trim(),
       genreTargets,
       visitorId,
-      soundDestination
+      soundDestination,
+      analysisTier
     );
 
     // ═══════════════════════════════════════════════════════════════
@@ -332,7 +359,7 @@ router.post("/", async (req, res) => {
     // 🛡️ Registrar na blocklist DEFINITIVA (tabela anonymous_blocklist)
     if (registrationData) {
       const blockResult = await registerAndBlockAnonymous(registrationData);
-      console.log(`🚫 [ANON_ANALYZE:${requestId}] Bloqueio permanente registrado:`, {
+      logger.info(`🚫 [ANON_ANALYZE:${requestId}] Bloqueio permanente registrado:`, {
         success: blockResult.success,
         blocked: blockResult.blocked
       });
@@ -341,7 +368,7 @@ router.post("/", async (req, res) => {
     // 📝 Também registrar no sistema antigo para compatibilidade
     const registerResult = await registerAnonymousAnalysis(visitorId, req, { isDemo: isDemoMode });
     
-    console.log(`✅ [ANON_ANALYZE:${requestId}] Análise registrada:`, {
+    logger.info(`✅ [ANON_ANALYZE:${requestId}] Análise registrada:`, {
       used: registerResult.used,
       remaining: registerResult.remaining,
       isDemo: isDemoMode,
@@ -352,17 +379,20 @@ router.post("/", async (req, res) => {
     // ETAPA 7: RESPOSTA
     // ═══════════════════════════════════════════════════════════════
     
-    console.log(`${'='.repeat(60)}`);
-    console.log(`✅ [ANON_ANALYZE:${requestId}] Job criado com sucesso!`);
-    console.log(`   🔑 Job ID: ${job.id}`);
-    console.log(`   🚫 Usuário BLOQUEADO PERMANENTEMENTE após esta análise`);
-    console.log(`${'='.repeat(60)}\n`);
+    logger.info(`${'='.repeat(60)}`);
+    logger.info(`✅ [ANON_ANALYZE:${requestId}] Job criado com sucesso!`);
+    logger.info(`   🔑 Job ID: ${job.id}`);
+    logger.info(`   🚫 Usuário BLOQUEADO PERMANENTEMENTE após esta análise`);
+    logger.info(`${'='.repeat(60)}\n`);
     
     return res.status(201).json({
       success: true,
       jobId: job.id,
       status: job.status,
       anonymous: true,
+      analysisTier,
+      // 🔁 Após o cadastro, enviar quickScanJobId + quickScanToken no /api/audio/analyze (sem novo upload)
+      ...(analysisTier === 'quick' && { upgrade: { quickScanJobId: job.id, upgradeToken: job.upgradeToken } }),
       limits: {
         used: 1,
         remaining: 0,
@@ -373,8 +403,8 @@ router.post("/", async (req, res) => {
     });
 
   } catch (error) {
-    console.error(`❌ [ANON_ANALYZE:${requestId}] Erro:`, error.message);
-    console.error(error.stack);
+    logger.error(`❌ [ANON_ANALYZE:${requestId}] Erro:`, error.message);
+    logger.error(error.stack);
     
     return res.status(500).json({
       success: false,
@@ -414,7 +444,7 @@ router.get("/status", async (req, res) => {
     });
     
   } catch (error) {
-    console.error('[ANON_ANALYZE] Erro ao obter status:', error.message);
+    logger.error('[ANON_ANALYZE] Erro ao obter status:', error.message);
     return res.status(500).json({
       success: false,
       error: 'STATUS_CHECK_ERROR'
@@ -22,7 +22,7 @@
 import "dotenv/config";
 import express from "express";
 import { randomUUID } from "crypto";
-import { getAudioQueue, getQueueReadyPromise } from '../../lib/queue.js';
+import { getAudioQueue, getQueueReadyPromise, addAudioJob } from '../../lib/queue.js';
 import pool from "../../db.js";
 import { getAuth, getFirestore } from '../../firebase/admin.js';
 import { canUseAnalysis, registerAnalysis, getPlanFeatures } from '../../lib/user/userPlans.js';
@@ -30,9 +30,13 @@ import { analysisLimiter } from '../../lib/rateLimiterRedis.js'; // ✅ V3: Rate
 
 // 🔐 ENTITLEMENTS: Sistema de controle de acesso por plano
 import { getUserPlan, hasEntitlement, buildPlanRequiredResponse } from '../../lib/entitlements.js';
+import { getReference } from '../../lib/references/referenceLibrary.js';
 
 // 🔥 DEMO: Controle de limite 100% backend
 import { canDemoAnalyze, registerDemoUsage, generateDemoId, extractDemoParams } from '../../../lib/demo-control.js';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:analyze');
 
 
 // Definir service name para auditoria
@@ -53,10 +57,10 @@ const router = express.Router();
 // ✅ INICIALIZAÇÃO GLOBAL ASSÍNCRONA OBRIGATÓRIA
 let queueReady = false;
 const queueInit = (async () => {
-  console.log('🚀 [API-INIT] Iniciando inicialização da fila...');
+  logger.info('🚀 [API-INIT] Iniciando inicialização da fila...');
   await getQueueReadyPromise();
   queueReady = true;
-  console.log('✅ [API-INIT] Fila inicializada com sucesso!');
+  logger.info('✅ [API-INIT] Fila inicializada com sucesso!');
 })();
 
 // Configuração via variável de ambiente
@@ -98,7 +102,7 @@ function validateFileType(fileKey) {
  * 🔑 IMPORTANTE: jobId DEVE SEMPRE SER UUID VÁLIDO para PostgreSQL
  * Ordem obrigatória: Redis → PostgreSQL (previne jobs órfãos)
  */
-async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = null, genre = null, genreTargets = null, planContext = null, analysisType = null, referenceStage = null, soundDestination = 'pista') {
+async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = null, genre = null, genreTargets = null, planContext = null, analysisType = null, referenceStage = null, soundDestination = 'pista', referenceId = null, quickScanUpgrade = null) {
   // 🔑 CRÍTICO: jobId DEVE ser UUID válido para tabela PostgreSQL (coluna tipo 'uuid')
   const jobId = randomUUID();
   
@@ -112,31 +116,31 @@ async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = nul
   // 📋 externalId para logs e identificação externa (pode ser personalizado)
   const externalId = `audio-${Date.now()}-${jobId.substring(0, 8)}`;
   
-  console.log(`📋 [JOB-CREATE] Iniciando job:`);
-  console.log(`   🔑 UUID (Banco): ${jobId}`);
-  console.log(`   📋 ID Externo: ${externalId}`);
-  console.log(`   📁 Arquivo: ${fileKey}`);
-  console.log(`   ⚙️ Modo: ${mode}`);
-  console.log(`   📡 Sound Destination: ${validSoundDestination}`);
-  console.log(`   🎵 Gênero: ${genre || 'não especificado'}`);
-  console.log(`   🎯 Targets: ${genreTargets ? 'presentes' : 'ausentes'}`);
-  console.log(`   🔗 Reference Job ID: ${referenceJobId || 'nenhum'}`);
-  console.log(`   📊 Plan Context:`, planContext);
+  logger.info(`📋 [JOB-CREATE] Iniciando job:`);
+  logger.info(`   🔑 UUID (Banco): ${jobId}`);
+  logger.info(`   📋 ID Externo: ${externalId}`);
+  logger.info(`   📁 Arquivo: ${fileKey}`);
+  logger.info(`   ⚙️ Modo: ${mode}`);
+  logger.info(`   📡 Sound Destination: ${validSoundDestination}`);
+  logger.info(`   🎵 Gênero: ${genre || 'não especificado'}`);
+  logger.info(`   🎯 Targets: ${genreTargets ? 'presentes' : 'ausentes'}`);
+  logger.info(`   🔗 Reference Job ID: ${referenceJobId || 'nenhum'}`);
+  logger.info(`   📚 Reference Library ID: ${referenceId || 'nenhum'}`);
+  logger.info(`   📊 Plan Context:`, planContext);
 
   try {
     // ✅ ETAPA 1: GARANTIR QUE FILA ESTÁ PRONTA
     if (!queueReady) {
-      console.log('⏳ [JOB-CREATE] Aguardando fila inicializar...');
+      logger.info('⏳ [JOB-CREATE] Aguardando fila inicializar...');
       await queueInit;
-      console.log('✅ [JOB-CREATE] Fila pronta para enfileiramento!');
+      logger.info('✅ [JOB-CREATE] Fila pronta para enfileiramento!');
     }
 
     // ✅ ETAPA 2: ENFILEIRAR PRIMEIRO (REDIS)
-    const queue = getAudioQueue();
-    console.log('📩 [API] Enfileirando job no Redis...');
+    logger.info('📩 [API] Enfileirando job no Redis...');
     
-    console.log("🟥 [AUDIT:CONTROLLER-QUEUE] Payload enviado para BullMQ:");
-    console.dir({
+    logger.debug("🟥 [AUDIT:CONTROLLER-QUEUE] Payload enviado para BullMQ:");
+    if (logger.debugEnabled) console.dir({
       jobId: jobId,
       externalId: externalId,
       fileKey,
@@ -147,8 +151,8 @@ async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = nul
       referenceJobId: referenceJobId
     }, { depth: 10 });
     
-    console.log('\n\n===== [DEBUG-CONTROLLER-PAYLOAD] Payload que VAI para o Redis (WORK) =====');
-    console.dir({
+    logger.debug('\n\n===== [DEBUG-CONTROLLER-PAYLOAD] Payload que VAI para o Redis (WORK) =====');
+    if (logger.debugEnabled) console.dir({
       jobId: jobId,
       externalId: externalId,
       fileKey,
@@ -158,7 +162,7 @@ async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = nul
       genreTargets: genreTargets,
       referenceJobId: referenceJobId
     }, { depth: 10 });
-    console.log('===============================================================\n\n');
+    logger.debug('===============================================================\n\n');
     
     // 🟥🟥 AUDITORIA: QUEM ESTÁ CRIANDO O JOB
     const payloadParaRedis = {
@@ -173,17 +177,18 @@ async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = nul
       genre: genre,        // 🎯 Genre (obrigatório apenas em genre e reference base)
       genreTargets: genreTargets, // 🎯 GenreTargets (obrigatório apenas em genre e reference base)
       referenceJobId: referenceJobId, // 🔗 ID do job de referência (se referenceStage='compare')
-      planContext: planContext // 📊 Contexto de plano e features
+      referenceId: referenceId, // 📚 ID na biblioteca de referências (alternativa ao referenceJobId)
+      planContext: planContext, // 📊 Contexto de plano e features
+      quickScanUpgrade: quickScanUpgrade // 🔁 Reaproveitamento do quick-scan anônimo (ou null)
     };
     
-    console.log("🟥🟥 [AUDIT:JOB-CREATOR] Este arquivo está CRIANDO um job AGORA:");
-    console.log("🟥 [AUDIT:JOB-CREATOR] Arquivo:", import.meta.url);
-    console.log("🟥 [AUDIT:JOB-CREATOR] Payload enviado para a fila:");
-    console.dir(payloadParaRedis, { depth: 10 });
+    logger.debug("🟥🟥 [AUDIT:JOB-CREATOR] Este arquivo está CRIANDO um job AGORA:");
+    logger.debug(() => ["🟥 [AUDIT:JOB-CREATOR] Arquivo:", import.meta.url]);
+    logger.debug("🟥 [AUDIT:JOB-CREATOR] Payload enviado para a fila:");
+    if (logger.debugEnabled) console.dir(payloadParaRedis, { depth: 10 });
     
-    const redisJob = await queue.add('process-audio', payloadParaRedis, {
+    const redisJob = await addAudioJob('process-audio', payloadParaRedis, {
       jobId: externalId,   // 📋 BullMQ job ID (pode ser customizado)
-      priority: 1,
       attempts: 3,
       backoff: {
         type: 'exponential',
@@ -193,13 +198,13 @@ async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = nul
       removeOnFail: 5,
     });
     
-    console.log(`✅ [API] Job enfileirado com sucesso:`);
-    console.log(`   🔑 UUID (Banco): ${jobId}`);
-    console.log(`   📋 Redis Job ID: ${redisJob.id}`);
-    console.log(`   📋 ID Externo: ${externalId}`);
+    logger.info(`✅ [API] Job enfileirado com sucesso:`);
+    logger.info(`   🔑 UUID (Banco): ${jobId}`);
+    logger.info(`   📋 Redis Job ID: ${redisJob.id}`);
+    logger.info(`   📋 ID Externo: ${externalId}`);
 
     // ✅ ETAPA 3: GRAVAR NO POSTGRESQL DEPOIS
-    console.log('📝 [API] Gravando no PostgreSQL com UUID...');
+    logger.info('📝 [API] Gravando no PostgreSQL com UUID...');
     
     // 🎯 CORREÇÃO: Validação de genre APENAS em mode='genre'
     // Reference mode NÃO exige genre (independente de ser base ou compare)
@@ -213,21 +218,21 @@ async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = nul
         throw new Error('❌ [CRITICAL] Genre é obrigatório no modo "genre"');
       }
       
-      console.log('[BACKEND-VALIDATION] 💾 Salvando job genre:', {
+      logger.debug(() => ['[BACKEND-VALIDATION] 💾 Salvando job genre:', {
         mode,
         jobId: jobId.substring(0, 8),
         genre,
         hasGenreTargets: !!genreTargets
-      });
+      }]);
     } else if (isReferenceMode) {
       // Reference mode: genre é OPCIONAL (não validar)
-      console.log('[BACKEND-VALIDATION] 💾 Salvando job reference:', {
+      logger.debug(() => ['[BACKEND-VALIDATION] 💾 Salvando job reference:', {
         mode,
         jobId: jobId.substring(0, 8),
         referenceJobId: referenceJobId || 'nenhum (primeira track)',
         genrePresent: !!genre,
         genreIgnored: true
-      });
+      }]);
     }
     
     const result = await pool.query(
@@ -236,24 +241,24 @@ async function createJobInDatabase(fileKey, mode, fileName, referenceJobId = nul
       [jobId, fileKey, mode, "queued", fileName || null, referenceJobId || null]
     );
 
-    console.log(`✅ [API] Gravado no PostgreSQL:`, {
+    logger.info(`✅ [API] Gravado no PostgreSQL:`, {
       id: result.rows[0].id,
       fileKey: result.rows[0].file_key,
       status: result.rows[0].status,
       mode: result.rows[0].mode,
       referenceFor: result.rows[0].reference_for
     });
-    console.log('🎯 [API] Fluxo completo - Redis ➜ PostgreSQL concluído!');
+    logger.info('🎯 [API] Fluxo completo - Redis ➜ PostgreSQL concluído!');
 
     return result.rows[0];
       
   } catch (error) {
-    console.error(`💥 [JOB-CREATE] Erro crítico:`, error.message);
+    logger.error(`💥 [JOB-CREATE] Erro crítico:`, error.message);
     
     // Se erro foi no PostgreSQL, job já está no Redis (o que é seguro)
     // Worker pode processar e atualizar status depois
     if (error.message.includes('PostgreSQL') || error.code?.startsWith('2')) {
-      console.warn(`⚠️ [JOB-CREATE] Job ${jobId} enfileirado mas falha no PostgreSQL - Worker pode recuperar`);
+      logger.warn(`⚠️ [JOB-CREATE] Job ${jobId} enfileirado mas falha no PostgreSQL - Worker pode recuperar`);
     }
     
     throw new Error(`Erro ao criar job: ${error.message}`);
@@ -272,24 +277,23 @@ async function createComparisonJobInDatabase(userFileKey, referenceFileKey, user
   // 📋 externalId para logs e identificação externa (pode ser personalizado)
   const externalId = `comparison-${Date.now()}-${jobId.substring(0, 8)}`;
   
-  console.log(`🎧 [COMPARISON-CREATE] Iniciando job de comparação:`);
-  console.log(`   🔑 UUID (Banco): ${jobId}`);
-  console.log(`   📋 ID Externo: ${externalId}`);
-  console.log(`   📁 Arquivo Usuário: ${userFileKey}`);
-  console.log(`   📁 Arquivo Referência: ${referenceFileKey}`);
-  console.log(`   ⚙️ Modo: comparison`);
+  logger.info(`🎧 [COMPARISON-CREATE] Iniciando job de comparação:`);
+  logger.info(`   🔑 UUID (Banco): ${jobId}`);
+  logger.info(`   📋 ID Externo: ${externalId}`);
+  logger.info(`   📁 Arquivo Usuário: ${userFileKey}`);
+  logger.info(`   📁 Arquivo Referência: ${referenceFileKey}`);
+  logger.info(`   ⚙️ Modo: comparison`);
 
   try {
     // ✅ ETAPA 1: GARANTIR QUE FILA ESTÁ PRONTA
     if (!queueReady) {
-      console.log('⏳ [COMPARISON-CREATE] Aguardando fila inicializar...');
+      logger.info('⏳ [COMPARISON-CREATE] Aguardando fila inicializar...');
       await queueInit;
-      console.log('✅ [COMPARISON-CREATE] Fila pronta para enfileiramento!');
+      logger.info('✅ [COMPARISON-CREATE] Fila pronta para enfileiramento!');
     }
 
     // ✅ ETAPA 2: ENFILEIRAR PRIMEIRO (REDIS)
-    const queue = getAudioQueue();
-    console.log('📩 [API] Enfileirando job de comparação no Redis...');
+    logger.info('📩 [API] Enfileirando job de comparação no Redis...');
     
     // 🟥🟥 AUDITORIA: QUEM ESTÁ CRIANDO O JOB DE COMPARAÇÃO
     const payloadParaRedis = {
@@ -302,14 +306,13 @@ async function createComparisonJobInDatabase(userFileKey, referenceFileKey, user
       mode: 'comparison'
     };
     
-    console.log("🟥🟥 [AUDIT:JOB-CREATOR] Este arquivo está CRIANDO um job de COMPARAÇÃO AGORA:");
-    console.log("🟥 [AUDIT:JOB-CREATOR] Arquivo:", import.meta.url);
-    console.log("🟥 [AUDIT:JOB-CREATOR] Payload enviado para a fila:");
-    console.dir(payloadParaRedis, { depth: 10 });
+    logger.debug("🟥🟥 [AUDIT:JOB-CREATOR] Este arquivo está CRIANDO um job de COMPARAÇÃO AGORA:");
+    logger.debug(() => ["🟥 [AUDIT:JOB-CREATOR] Arquivo:", import.meta.url]);
+    logger.debug("🟥 [AUDIT:JOB-CREATOR] Payload enviado para a fila:");
+    if (logger.debugEnabled) console.dir(payloadParaRedis, { depth: 10 });
     
-    const redisJob = await queue.add('process-audio', payloadParaRedis, {
+    const redisJob = await addAudioJob('process-audio', payloadParaRedis, {
       jobId: externalId,   // 📋 BullMQ job ID (pode ser customizado)
-      priority: 1,
       attempts: 3,
       backoff: {
         type: 'exponential',
@@ -319,13 +322,13 @@ async function createComparisonJobInDatabase(userFileKey, referenceFileKey, user
       removeOnFail: 5,
     });
     
-    console.log(`✅ [API] Job de comparação enfileirado com sucesso:`);
-    console.log(`   🔑 UUID (Banco): ${jobId}`);
-    console.log(`   📋 Redis Job ID: ${redisJob.id}`);
-    console.log(`   📋 ID Externo: ${externalId}`);
+    logger.info(`✅ [API] Job de comparação enfileirado com sucesso:`);
+    logger.info(`   🔑 UUID (Banco): ${jobId}`);
+    logger.info(`   📋 Redis Job ID: ${redisJob.id}`);
+    logger.info(`   📋 ID Externo: ${externalId}`);
 
     // ✅ ETAPA 3: GRAVAR NO POSTGRESQL DEPOIS
-    console.log('📝 [API] Gravando job de comparação no PostgreSQL com UUID...');
+    logger.info('📝 [API] Gravando job de comparação no PostgreSQL com UUID...');
     
     // 🔑 CRÍTICO: Usar jobId (UUID) na coluna 'id' do PostgreSQL
     const result = await pool.query(
@@ -334,24 +337,24 @@ async function createComparisonJobInDatabase(userFileKey, referenceFileKey, user
       [jobId, userFileKey, referenceFileKey, "comparison", "queued", userFileName || null]
     );
 
-    console.log(`✅ [API] Job de comparação gravado no PostgreSQL:`, {
+    logger.info(`✅ [API] Job de comparação gravado no PostgreSQL:`, {
       id: result.rows[0].id,
       fileKey: result.rows[0].file_key,
       referenceFileKey: result.rows[0].reference_file_key,
       status: result.rows[0].status,
       mode: result.rows[0].mode
     });
-    console.log('🎯 [API] Fluxo completo comparação - Redis ➜ PostgreSQL concluído!');
+    logger.info('🎯 [API] Fluxo completo comparação - Redis ➜ PostgreSQL concluído!');
 
     return result.rows[0];
       
   } catch (error) {
-    console.error(`💥 [COMPARISON-CREATE] Erro crítico:`, error.message);
+    logger.error(`💥 [COMPARISON-CREATE] Erro crítico:`, error.message);
     
     // Se erro foi no PostgreSQL, job já está no Redis (o que é seguro)
     // Worker pode processar e atualizar status depois
     if (error.message.includes('PostgreSQL') || error.code?.startsWith('2')) {
-      console.warn(`⚠️ [COMPARISON-CREATE] Job ${jobId} enfileirado mas falha no PostgreSQL - Worker pode recuperar`);
+      logger.warn(`⚠️ [COMPARISON-CREATE] Job ${jobId} enfileirado mas falha no PostgreSQL - Worker pode recuperar`);
     }
     
     throw new Error(`Erro ao criar job de comparação: ${error.message}`);
@@ -437,18 +440,18 @@ router.use((req, res, next) => {
 router.post("/analyze", analysisLimiter, async (req, res) => {
   // 🔍 PR1: Log instrumentação - Request recebido
   const requestTraceId = `API-${Date.now()}-${Math.random().toString(36).substring(2, 8)}`;
-  console.log(`[PR1-TRACE] ${requestTraceId} ═══════════════════════════════════════`);
-  console.log(`[PR1-TRACE] ${requestTraceId} ENDPOINT /analyze RECEBEU REQUEST`);
-  console.log(`[PR1-TRACE] ${requestTraceId} Timestamp: ${new Date().toISOString()}`);
+  logger.debug(() => [`[PR1-TRACE] ${requestTraceId} ═══════════════════════════════════════`]);
+  logger.debug(() => [`[PR1-TRACE] ${requestTraceId} ENDPOINT /analyze RECEBEU REQUEST`]);
+  logger.debug(() => [`[PR1-TRACE] ${requestTraceId} Timestamp: ${new Date().toISOString()}`]);
   
   // ✅ LOG OBRIGATÓRIO: Rota chamada
-  console.log('🚀 [API] /analyze chamada');
-  console.log('📦 [ANALYZE] Headers:', req.headers);
-  console.log('📦 [ANALYZE] Body:', req.body);
+  logger.info('🚀 [API] /analyze chamada');
+  logger.info('📦 [ANALYZE] Headers:', req.headers);
+  logger.info('📦 [ANALYZE] Body:', req.body);
   
   // 🔍 PR1: Log payload recebido (SEM token)
   const { fileKey, mode, fileName, genre, genreTargets, referenceJobId, hasTargets } = req.body;
-  console.log(`[PR1-TRACE] ${requestTraceId} PAYLOAD RECEBIDO:`, {
+  logger.debug(() => [`[PR1-TRACE] ${requestTraceId} PAYLOAD RECEBIDO:`, {
     fileKey: fileKey ? `${fileKey.substring(0, 30)}...` : null,
     mode,
     fileName,
@@ -458,43 +461,43 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
     referenceJobId: referenceJobId || null,
     hasTargets: hasTargets || null,
     idToken: req.body.idToken ? '***masked***' : 'absent',
-  });
+  }]);
   
   // 🔍 PR1: Validar invariantes do payload
   // 🆕 PR2: VALIDAÇÃO RÍGIDA e CORREÇÃO de payload
   if (mode === 'reference' && referenceJobId) {
     // Segunda música reference - REMOVER genre/genreTargets se presentes
     if (genre || genreTargets) {
-      console.warn(`[PR2-CORRECTION] ${requestTraceId} ⚠️ Reference segunda track tem genre/targets - REMOVENDO`);
-      console.log(`[PR2-CORRECTION] ${requestTraceId} Antes: genre=${genre}, targets=${!!genreTargets}`);
+      logger.warn(`[PR2-CORRECTION] ${requestTraceId} ⚠️ Reference segunda track tem genre/targets - REMOVENDO`);
+      logger.debug(() => [`[PR2-CORRECTION] ${requestTraceId} Antes: genre=${genre}, targets=${!!genreTargets}`]);
       
       // Limpar do req.body para não propagar
       delete req.body.genre;
       delete req.body.genreTargets;
       delete req.body.hasTargets;
       
-      console.log(`[PR2-CORRECTION] ${requestTraceId} Depois: payload limpo para reference puro`);
+      logger.debug(() => [`[PR2-CORRECTION] ${requestTraceId} Depois: payload limpo para reference puro`]);
     }
-    console.log(`[PR1-INVARIANT] ${requestTraceId} ✅ Reference segunda track - modo reference puro`);
+    logger.debug(() => [`[PR1-INVARIANT] ${requestTraceId} ✅ Reference segunda track - modo reference puro`]);
   } else if (mode === 'reference' && !referenceJobId) {
     // Primeira música reference - pode ter genre (para análise base)
-    console.log(`[PR1-TRACE] ${requestTraceId} ✅ First reference track - genre=${genre} is acceptable`);
+    logger.debug(() => [`[PR1-TRACE] ${requestTraceId} ✅ First reference track - genre=${genre} is acceptable`]);
   } else if (mode === 'genre') {
     // Modo genre - deve ter genre e genreTargets
     if (!genre) {
-      console.warn(`[PR1-INVARIANT] ${requestTraceId} ⚠️ mode=genre BUT no genre provided`);
+      logger.warn(`[PR1-INVARIANT] ${requestTraceId} ⚠️ mode=genre BUT no genre provided`);
     }
     if (!genreTargets) {
-      console.warn(`[PR1-INVARIANT] ${requestTraceId} ⚠️ mode=genre BUT no genreTargets provided`);
+      logger.warn(`[PR1-INVARIANT] ${requestTraceId} ⚠️ mode=genre BUT no genreTargets provided`);
     }
   }
   
   try {
-    console.log("🟥 [AUDIT:CONTROLLER-BODY] Payload recebido do front:");
-    console.dir(req.body, { depth: 10 });
+    logger.debug("🟥 [AUDIT:CONTROLLER-BODY] Payload recebido do front:");
+    if (logger.debugEnabled) console.dir(req.body, { depth: 10 });
     
     const { 
-      fileKey, 
+      fileKey: bodyFileKey, 
       mode = "genre",  // Mantido por compatibilidade
       analysisType,    // 🆕 Campo explícito: 'genre' | 'reference'
       referenceStage,  // 🆕 Para reference: 'base' | 'compare'
@@ -502,18 +505,22 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       fileName, 
       genre, 
       genreTargets,
+      referenceId,     // 📚 Referência da biblioteca (métricas pré-computadas)
+      quickScanJobId,  // 🔁 Upgrade de um quick-scan anônimo (fileKey opcional)
+      quickScanToken,  // 🔑 Token de upgrade devolvido ao visitante junto com o quickScanJobId
       idToken  // ✅ NOVO: Token de autenticação
     } = req.body;
     
     // 🆕 STREAMING MODE: Validar e logar soundDestination
     const validSoundDestination = ['pista', 'streaming'].includes(soundDestination) ? soundDestination : 'pista';
-    console.log(`📡 [ANALYZE] Sound Destination: ${validSoundDestination} (original: ${soundDestination})`);
+    logger.info(`📡 [ANALYZE] Sound Destination: ${validSoundDestination} (original: ${soundDestination})`);
     
     // ✅ NORMALIZAR: usar analysisType se presente, senão fallback para mode
     const finalAnalysisType = analysisType || mode;
-    const finalReferenceStage = referenceStage || null;
+    // 📚 Referência da biblioteca = segunda track direto (base já analisada)
+    const finalReferenceStage = referenceStage || (referenceId ? 'compare' : null);
     
-    console.log('[ANALYZE] Tipo de análise:', {
+    logger.info('[ANALYZE] Tipo de análise:', {
       analysisType: finalAnalysisType,
       referenceStage: finalReferenceStage,
       hasGenre: !!genre,
@@ -528,7 +535,7 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
     let demoId = null;
     
     if (isDemoMode) {
-      console.log('🔥 [ANALYZE] MODO DEMO detectado - visitor:', demoVisitorId);
+      logger.info('🔥 [ANALYZE] MODO DEMO detectado - visitor:', demoVisitorId);
       
       // 🔴 VERIFICAÇÃO BACKEND: Checar se demo já foi usado
       try {
@@ -536,7 +543,7 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
         demoId = demoCheck.demoId;
         
         if (!demoCheck.allowed) {
-          console.log('🚫 [ANALYZE] DEMO BLOQUEADO pelo backend:', demoCheck.reason);
+          logger.info('🚫 [ANALYZE] DEMO BLOQUEADO pelo backend:', demoCheck.reason);
           return res.status(403).json({
             success: false,
             error: 'DEMO_LIMIT_REACHED',
@@ -550,18 +557,18 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
           });
         }
         
-        console.log('✅ [ANALYZE] DEMO permitido pelo backend:', {
+        logger.info('✅ [ANALYZE] DEMO permitido pelo backend:', {
           demoId: demoId?.substring(0, 16) + '...',
           remaining: demoCheck.remaining
         });
       } catch (demoErr) {
-        console.error('⚠️ [ANALYZE] Erro ao verificar demo (fail-open):', demoErr.message);
+        logger.error('⚠️ [ANALYZE] Erro ao verificar demo (fail-open):', demoErr.message);
         // Fail-open: em caso de erro, permitir (não perder venda potencial)
       }
     }
     
     // ✅ ETAPA 1: AUTENTICAÇÃO (bypass para demo)
-    console.log('🔐 [ANALYZE] Verificando autenticação...');
+    logger.info('🔐 [ANALYZE] Verificando autenticação...');
     
     let uid;
     let decoded;
@@ -570,11 +577,11 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       // 🔥 DEMO MODE: Usar demoId como UID (mais confiável que visitorId)
       uid = `demo_${demoId || demoVisitorId}`;
       decoded = { uid, demo: true, demoId };
-      console.log('🔥 [ANALYZE] Usando UID demo:', uid);
+      logger.info('🔥 [ANALYZE] Usando UID demo:', uid);
     } else {
       // Fluxo normal de autenticação
       if (!idToken) {
-        console.error('❌ [ANALYZE] Token ausente no body');
+        logger.error('❌ [ANALYZE] Token ausente no body');
         return res.status(401).json({
           success: false,
           error: "AUTH_TOKEN_MISSING",
@@ -584,14 +591,14 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       
       // 🆕 MOVER PARA ANTES DAS VALIDAÇÕES (previne 'Cannot access before initialization')
       const referenceJobId = req.body.referenceJobId || null;
-      console.log('🔑 [ANALYZE] IDTOKEN recebido:', idToken.substring(0, 20) + '...');
+      logger.info('🔑 [ANALYZE] IDTOKEN recebido:', idToken.substring(0, 20) + '...');
       
       try {
         decoded = await getAuthLazy().verifyIdToken(idToken);
-        console.log('✅ [ANALYZE] Token verificado com sucesso');
+        logger.info('✅ [ANALYZE] Token verificado com sucesso');
       } catch (err) {
-        console.error('❌ [ANALYZE] Erro ao verificar token:', err.message);
-        console.error('❌ [ANALYZE] Stack:', err.stack);
+        logger.error('❌ [ANALYZE] Erro ao verificar token:', err.message);
+        logger.error('❌ [ANALYZE] Stack:', err.stack);
         return res.status(401).json({
           success: false,
           error: "AUTH_ERROR",
@@ -600,10 +607,10 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       }
       
       uid = decoded.uid;
-      console.log('🔑 [ANALYZE] UID decodificado:', uid);
+      logger.info('🔑 [ANALYZE] UID decodificado:', uid);
       
       if (!uid) {
-        console.error('❌ [ANALYZE] UID undefined após decodificação!');
+        logger.error('❌ [ANALYZE] UID undefined após decodificação!');
         return res.status(401).json({
           success: false,
           error: "INVALID_UID",
@@ -619,7 +626,7 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
     // 🔐 ENTITLEMENTS: Verificar permissão para modo referência (PRO only)
     // ═══════════════════════════════════════════════════════════
     if (!isDemoMode && (finalAnalysisType === 'reference' || mode === 'reference')) {
-      console.log('🔐 [ENTITLEMENTS] Modo referência detectado - verificando permissão...');
+      logger.info('🔐 [ENTITLEMENTS] Modo referência detectado - verificando permissão...');
       
       // Buscar documento do usuário no Firestore para determinar plano
       const db = getFirestore();
@@ -627,18 +634,31 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       const userData = userDoc.exists ? userDoc.data() : null;
       const userPlan = getUserPlan(userData);
       
-      console.log(`🔐 [ENTITLEMENTS] Plano do usuário: ${userPlan}`);
+      logger.info(`🔐 [ENTITLEMENTS] Plano do usuário: ${userPlan}`);
       
       if (!hasEntitlement(userPlan, 'reference')) {
-        console.log(`🔐 [ENTITLEMENTS] ❌ BLOQUEADO: Modo Referência requer PRO, usuário tem ${userPlan}`);
+        logger.info(`🔐 [ENTITLEMENTS] ❌ BLOQUEADO: Modo Referência requer PRO, usuário tem ${userPlan}`);
         return res.status(403).json(buildPlanRequiredResponse('reference', userPlan));
       }
       
-      console.log(`🔐 [ENTITLEMENTS] ✅ Modo Referência permitido para plano ${userPlan}`);
+      logger.info(`🔐 [ENTITLEMENTS] ✅ Modo Referência permitido para plano ${userPlan}`);
+    }
+    
+    // 📚 Biblioteca: referência precisa ser do usuário ou compartilhada
+    if (referenceId && (finalAnalysisType === 'reference' || mode === 'reference')) {
+      const libraryReference = await getReference(referenceId, uid);
+      if (!libraryReference) {
+        return res.status(404).json({
+          success: false,
+          error: 'REFERENCE_NOT_FOUND',
+          message: 'Referência não encontrada na biblioteca'
+        });
+      }
+      logger.info(`📚 [ANALYZE] Referência da biblioteca: ${libraryReference.name} (${referenceId})`);
     }
     
     // ✅ ETAPA 2: VALIDAR LIMITES DE ANÁLISE ANTES DE CRIAR JOB
-    console.log('📊 [ANALYZE] Verificando limites de análise para UID:', uid);
+    logger.info('📊 [ANALYZE] Verificando limites de análise para UID:', uid);
     
     let analysisCheck;
     
@@ -653,14 +673,14 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
         user: { plan: 'demo' }, 
         remainingFull: 1 
       };
-      console.log('🔥 [ANALYZE] DEMO MODE: Limite validado pelo backend');
+      logger.info('🔥 [ANALYZE] DEMO MODE: Limite validado pelo backend');
     } else {
       try {
         analysisCheck = await canUseAnalysis(uid);
-        console.log('📊 [ANALYZE] Resultado da verificação:', analysisCheck);
+        logger.info('📊 [ANALYZE] Resultado da verificação:', analysisCheck);
       } catch (err) {
-        console.error('❌ [ANALYZE] Erro ao verificar limites:', err.message);
-        console.error('❌ [ANALYZE] Stack:', err.stack);
+        logger.error('❌ [ANALYZE] Erro ao verificar limites:', err.message);
+        logger.error('❌ [ANALYZE] Stack:', err.stack);
         return res.status(500).json({
           success: false,
           error: "LIMIT_CHECK_ERROR",
@@ -670,8 +690,8 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       }
     
       if (!analysisCheck.allowed) {
-        console.log(`⛔ [ANALYZE] Limite de análises atingido para UID: ${uid}`);
-        console.log(`⛔ [ANALYZE] Plano: ${analysisCheck.user.plan}, Mode: ${analysisCheck.mode}`);
+        logger.info(`⛔ [ANALYZE] Limite de análises atingido para UID: ${uid}`);
+        logger.info(`⛔ [ANALYZE] Plano: ${analysisCheck.user.plan}, Mode: ${analysisCheck.mode}`);
         
         // ✅ Calcular data de reset (primeiro dia do próximo mês)
         const now = new Date();
@@ -715,36 +735,62 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
     const analysisMode = analysisCheck.mode; // "full" | "reduced"
     const features = getPlanFeatures(analysisCheck.user?.plan || 'demo', analysisMode);
     
-    console.log(`\n═══════════════════════════════════════════════════════`);
-    console.log(`📊 [ANALYZE] MODO DE ANÁLISE DECIDIDO`);
-    console.log(`═══════════════════════════════════════════════════════`);
-    console.log(`  Modo: ${analysisMode.toUpperCase()}`);
-    console.log(`  Plano: ${analysisCheck.user?.plan || 'demo'}`);
-    console.log(`  Análises usadas: ${analysisCheck.user?.analysesMonth || 0}`);
-    console.log(`  Análises full restantes: ${analysisCheck.remainingFull}`);
-    console.log(`  UID: ${uid}`);
+    logger.info(`\n═══════════════════════════════════════════════════════`);
+    logger.info(`📊 [ANALYZE] MODO DE ANÁLISE DECIDIDO`);
+    logger.info(`═══════════════════════════════════════════════════════`);
+    logger.info(`  Modo: ${analysisMode.toUpperCase()}`);
+    logger.info(`  Plano: ${analysisCheck.user?.plan || 'demo'}`);
+    logger.info(`  Análises usadas: ${analysisCheck.user?.analysesMonth || 0}`);
+    logger.info(`  Análises full restantes: ${analysisCheck.remainingFull}`);
+    logger.info(`  UID: ${uid}`);
     if (analysisMode === 'reduced') {
-      console.log(`  ⚠️ REDUCED: Backend enviará JSON completo`);
-      console.log(`  ⚠️ REDUCED: Frontend aplicará máscaras nas métricas avançadas`);
+      logger.info(`  ⚠️ REDUCED: Backend enviará JSON completo`);
+      logger.info(`  ⚠️ REDUCED: Frontend aplicará máscaras nas métricas avançadas`);
     } else {
-      console.log(`  ✅ FULL: Todas as métricas serão exibidas sem restrições`);
+      logger.info(`  ✅ FULL: Todas as métricas serão exibidas sem restrições`);
     }
-    console.log(`═══════════════════════════════════════════════════════\n`);
+    logger.info(`═══════════════════════════════════════════════════════\n`);
     
-    console.log(`✅ [ANALYZE] Análise permitida - UID: ${uid}`);
-    console.log(`🎯 [ANALYZE] Features:`, features);
+    logger.info(`✅ [ANALYZE] Análise permitida - UID: ${uid}`);
+    logger.info(`🎯 [ANALYZE] Features:`, features);
+    
+    // 🔁 UPGRADE DO QUICK-SCAN: análise completa do arquivo já enviado na análise anônima
+    // (sem novo upload; o worker reaproveita a cópia local e a duração medida, se ainda existirem)
+    let quickScanUpgrade = null;
+    if (quickScanJobId) {
+      if (finalAnalysisType !== 'genre') {
+        return res.status(400).json({
+          success: false,
+          error: 'QUICK_SCAN_UPGRADE_GENRE_ONLY',
+          message: 'O upgrade da análise rápida só está disponível no modo gênero'
+        });
+      }
+      // Import sob demanda: o módulo de métricas só carrega na API quando há upgrade
+      const { resolveQuickScanUpgrade } = await import('../../lib/audio/quick-scan.js');
+      const isUuid = typeof quickScanJobId === 'string' && /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i.test(quickScanJobId);
+      const quickRow = isUuid
+        ? await pool.query('SELECT id, file_key, status, results FROM jobs WHERE id = $1', [quickScanJobId])
+        : { rows: [] };
+      const resolved = resolveQuickScanUpgrade(quickRow.rows[0] || null, bodyFileKey || null, quickScanToken || null);
+      if (resolved.error) {
+        return res.status(resolved.error === 'QUICK_SCAN_FORBIDDEN' ? 403 : 400).json({ success: false, error: resolved.error, message: resolved.message });
+      }
+      quickScanUpgrade = resolved.upgrade;
+      logger.info(`🔁 [ANALYZE] Upgrade do quick-scan ${quickScanJobId.substring(0, 8)} (${quickScanUpgrade.fileKey})`);
+    }
+    const fileKey = bodyFileKey || quickScanUpgrade?.fileKey || null;
     
     // 🎯 LOG DE AUDITORIA OBRIGATÓRIO
-    console.log('[GENRE-TRACE][BACKEND] 📥 Payload recebido do frontend:', {
+    logger.debug(() => ['[GENRE-TRACE][BACKEND] 📥 Payload recebido do frontend:', {
       genre,
       hasGenreTargets: !!genreTargets,
       genreTargetsKeys: genreTargets ? Object.keys(genreTargets) : null,
       mode,
       fileKey
-    });
+    }]);
     
     // 🧠 LOG DE DEBUG: Modo recebido
-    console.log('🧠 Modo de análise recebido:', mode);
+    logger.info('🧠 Modo de análise recebido:', mode);
     
     // ✅ VALIDAÇÕES BÁSICAS
     if (!fileKey) {
@@ -782,11 +828,11 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       // MODO REFERENCE: Genre NÃO é obrigatório (reference é independente de gênero)
       // Validar apenas referenceJobId na segunda track
       if (finalReferenceStage === 'compare' || referenceJobId) {
-        // Segunda track: referenceJobId OBRIGATÓRIO
-        if (!referenceJobId) {
+        // Segunda track: referenceJobId (ou referenceId da biblioteca) OBRIGATÓRIO
+        if (!referenceJobId && !referenceId) {
           return res.status(400).json({
             success: false,
-            error: 'referenceJobId é obrigatório para segunda track de referência'
+            error: 'referenceJobId ou referenceId é obrigatório para segunda track de referência'
           });
         }
       }
@@ -795,26 +841,26 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
 
 
     // 🧠 DEBUG: Log do modo e referenceJobId
-    console.log('🧠 [ANALYZE] Modo:', mode);
-    console.log('🔗 [ANALYZE] Reference Job ID:', referenceJobId || 'nenhum');
+    logger.info('🧠 [ANALYZE] Modo:', mode);
+    logger.info('🔗 [ANALYZE] Reference Job ID:', referenceJobId || 'nenhum');
     
     if (mode === 'reference' && referenceJobId) {
-      console.log('🎯 [ANALYZE] Segunda música detectada - será comparada com job:', referenceJobId);
+      logger.info('🎯 [ANALYZE] Segunda música detectada - será comparada com job:', referenceJobId);
     } else if (mode === 'reference' && !referenceJobId) {
-      console.log('🎯 [ANALYZE] Primeira música em modo reference - aguardará segunda');
+      logger.info('🎯 [ANALYZE] Primeira música em modo reference - aguardará segunda');
     }
 
     // ✅ VERIFICAÇÃO OBRIGATÓRIA DA FILA
     if (!queueReady) {
-      console.log('⏳ [API] Aguardando fila inicializar...');
+      logger.info('⏳ [API] Aguardando fila inicializar...');
       await queueInit;
     }
 
     // ✅ OBTER INSTÂNCIA DA FILA
     const queue = getAudioQueue();
     
-    console.log("🟥 [AUDIT:CONTROLLER-PAYLOAD] Payload enviado para Postgres:");
-    console.dir({ fileKey, mode, fileName, referenceJobId, genre, genreTargets }, { depth: 10 });
+    logger.debug("🟥 [AUDIT:CONTROLLER-PAYLOAD] Payload enviado para Postgres:");
+    if (logger.debugEnabled) console.dir({ fileKey, mode, fileName, referenceJobId, genre, genreTargets }, { depth: 10 });
     
     // ✅ MONTAR PLAN CONTEXT PARA O PIPELINE
     const planContext = {
@@ -827,7 +873,7 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       isFirstFreeAnalysis: !analysisCheck.user.hasCompletedFirstFreeAnalysis && analysisCheck.user.plan === 'free' && analysisMode === 'full'
     };
     
-    console.log('📊 [ANALYZE] Plan Context montado:', planContext);
+    logger.info('📊 [ANALYZE] Plan Context montado:', planContext);
     
     // ✅ CRIAR JOB NO BANCO E ENFILEIRAR (passar todos os parâmetros incluindo analysisType e referenceStage)
     const jobRecord = await createJobInDatabase(
@@ -840,10 +886,12 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
       planContext,
       finalAnalysisType,    // 🆕 Campo explícito
       finalReferenceStage,  // 🆕 Campo explícito
-      validSoundDestination // 🆕 STREAMING MODE: 'pista' | 'streaming'
+      validSoundDestination, // 🆕 STREAMING MODE: 'pista' | 'streaming'
+      finalAnalysisType === 'reference' ? (referenceId || null) : null, // 📚 Biblioteca de referências
+      quickScanUpgrade // 🔁 Upgrade do quick-scan anônimo
     );
     
-    console.log('[ANALYZE] ✅ Job criado:', {
+    logger.info('[ANALYZE] ✅ Job criado:', {
       jobId: jobRecord.id,
       analysisType: finalAnalysisType,
       referenceStage: finalReferenceStage,
@@ -854,29 +902,29 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
     // ✅ ETAPA 3: REGISTRAR USO DE ANÁLISE NO SISTEMA DE LIMITES (SÓ SE FOR FULL)
     // 🔥 DEMO MODE: Não registrar uso no banco
     if (!isDemoMode) {
-      console.log('📝 [ANALYZE] Registrando uso de análise para UID:', uid, '- Mode:', analysisMode);
+      logger.info('📝 [ANALYZE] Registrando uso de análise para UID:', uid, '- Mode:', analysisMode);
       try {
         await registerAnalysis(uid, analysisMode);
-        console.log(`✅ [ANALYZE] Análise registrada com sucesso para: ${uid} (mode: ${analysisMode})`);
+        logger.info(`✅ [ANALYZE] Análise registrada com sucesso para: ${uid} (mode: ${analysisMode})`);
       } catch (err) {
-        console.error('⚠️ [ANALYZE] Erro ao registrar análise (job já foi criado):', err.message);
+        logger.error('⚠️ [ANALYZE] Erro ao registrar análise (job já foi criado):', err.message);
         // Não bloquear resposta - job já foi criado com sucesso
       }
     } else {
-      console.log('🔥 [ANALYZE] DEMO MODE: Pulando registro de uso no banco');
+      logger.info('🔥 [ANALYZE] DEMO MODE: Pulando registro de uso no banco');
     }
 
     // 🔥 DEMO: Registrar uso APÓS job criado com sucesso
     if (isDemoMode && demoId) {
       try {
         const demoResult = await registerDemoUsage(req);
-        console.log('🔥 [ANALYZE] Demo registrado no backend:', {
+        logger.info('🔥 [ANALYZE] Demo registrado no backend:', {
           demoId: demoId.substring(0, 16) + '...',
           success: demoResult.success,
           blocked: demoResult.blocked
         });
       } catch (demoErr) {
-        console.error('⚠️ [ANALYZE] Erro ao registrar demo (não crítico):', demoErr.message);
+        logger.error('⚠️ [ANALYZE] Erro ao registrar demo (não crítico):', demoErr.message);
       }
     }
 
@@ -901,8 +949,8 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
 
   } catch (error) {
     // ✅ LOG DE ERRO OBRIGATÓRIO
-    console.error('❌ [API] Erro na rota /analyze:', error.message);
-    console.error('❌ [API] Stack:', error.stack);
+    logger.error('❌ [API] Erro na rota /analyze:', error.message);
+    logger.error('❌ [API] Stack:', error.stack);
     
     // ✅ RESPOSTA DE ERRO COM STATUS 500
     res.status(500).json({
@@ -919,7 +967,7 @@ router.post("/analyze", analysisLimiter, async (req, res) => {
  */
 router.post("/compare", analysisLimiter, async (req, res) => {
   // ✅ LOG OBRIGATÓRIO: Rota chamada
-  console.log('🎧 [API] /compare chamada');
+  logger.info('🎧 [API] /compare chamada');
   
   try {
     const { userFileKey, referenceFileKey, userFileName, refFileName } = req.body;
@@ -955,7 +1003,7 @@ router.post("/compare", analysisLimiter, async (req, res) => {
 
     // ✅ VERIFICAÇÃO OBRIGATÓRIA DA FILA
     if (!queueReady) {
-      console.log('⏳ [API] Aguardando fila inicializar...');
+      logger.info('⏳ [API] Aguardando fila inicializar...');
       await queueInit;
     }
 
@@ -965,7 +1013,7 @@ router.post("/compare", analysisLimiter, async (req, res) => {
     // ✅ CRIAR JOB DE COMPARAÇÃO NO BANCO E ENFILEIRAR
     const jobRecord = await createComparisonJobInDatabase(userFileKey, referenceFileKey, userFileName, refFileName);
 
-    console.log("🎧 Novo job de comparação criado:", jobRecord.id);
+    logger.info("🎧 Novo job de comparação criado:", jobRecord.id);
 
     // ✅ RESPOSTA DE SUCESSO COM JOBID GARANTIDO
     res.status(200).json({
@@ -982,7 +1030,7 @@ router.post("/compare", analysisLimiter, async (req, res) => {
 
   } catch (error) {
     // ✅ LOG DE ERRO OBRIGATÓRIO
-    console.error('❌ [API] Erro na rota /compare:', error.message);
+    logger.error('❌ [API] Erro na rota /compare:', error.message);
     
     // ✅ RESPOSTA DE ERRO COM STATUS 500
     res.status(500).json({
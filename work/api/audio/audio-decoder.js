@@ -2,6 +2,7 @@
  * Audio Decoder – Fase 5.1 (Servidor) - CORRIGIDO
  * Decodifica WAV/MP3 para PCM Float32 estéreo 48kHz com validações rigorosas.
  * Implementa fail-fast, guards contra NaN/Infinity, política de canais explícita.
+ * Padrão: FFmpeg emite f32le bruto, deintercalado direto nos canais (AUDIO_DECODE_MODE=wav volta ao WAV).
  */
 
 import { spawn } from 'child_process';
@@ -9,13 +10,18 @@ import { tmpdir } from 'os';
 import { join } from 'path';
 import { randomBytes } from 'crypto';
 import { writeFile, unlink } from 'fs/promises';
+import { createWriteStream } from 'fs';
 
 // Sistema de tratamento de erros padronizado
 import { makeErr, ensureFiniteArray, logAudio, removeDCOffset, detectClipping } from '../../lib/audio/error-handling.js';
+import { PcmChannelSink } from '../../lib/audio/utils/pcm-channel-sink.js';
 
 // Paths portáteis do ffmpeg/ffprobe
 import ffmpegStatic from 'ffmpeg-static';
 import ffprobeStaticPkg from 'ffprobe-static';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:audio-decoder');
 
 const FFMPEG_PATH = process.env.FFMPEG_PATH || ffmpegStatic || 'ffmpeg';
 const FFPROBE_PATH =
@@ -30,6 +36,11 @@ const BIT_DEPTH = 32;             // Float32
 const MAX_DURATION_SECONDS = 600; // 10 minutos
 const MAX_SIZE_BYTES = 100 * 1024 * 1024; // 100MB
 const SUPPORTED_EXTS = ['.wav', '.mp3', '.flac']; // WAV/MP3 conforme solicitado
+// download (2 min) + decode (2 min) correm juntos; worker.js deriva o timeout do pipeline daqui
+export const STREAM_DECODE_TIMEOUT_MS = 240000;
+// 'raw': FFmpeg emite f32le e os chunks vão direto para os canais (padrão)
+// 'wav': caminho antigo — WAV inteiro em memória + parser RIFF (fallback)
+const DECODE_MODE = (process.env.AUDIO_DECODE_MODE || 'raw').toLowerCase();
 
 // ========= POLÍTICA DE CANAIS (EXPLÍCITA) =========
 // REGRA: Sempre normalizar para ESTÉREO (2 canais)
@@ -93,7 +104,7 @@ async function convertToWavPcmFromFile(inputFilePath, filename) {
     let ffmpegKilled = false;
 
     const ffmpegTimeout = setTimeout(() => {
-      console.warn(`⚠️ FFmpeg timeout para ${filename} - matando processo...`);
+      logger.warn(`⚠️ FFmpeg timeout para ${filename} - matando processo...`);
       ffmpegKilled = true;
       try { ff.stdout.destroy(); } catch (_) {}
       try { ff.stderr.destroy(); } catch (_) {}
@@ -174,7 +185,7 @@ async function convertToWavPcmStream(inputBuffer, filename) {
 
     // 🔥 TIMEOUT PROTECTION
     const ffmpegTimeout = setTimeout(() => {
-      console.warn(`⚠️ FFmpeg timeout para ${filename} - matando processo...`);
+      logger.warn(`⚠️ FFmpeg timeout para ${filename} - matando processo...`);
       ffmpegKilled = true;
       // 🧹 MEMORY FIX: destruir streams antes de matar o processo
       try { ff.stdout.destroy(); } catch (_) {}
@@ -232,6 +243,374 @@ async function convertToWavPcmStream(inputBuffer, filename) {
   });
 }
 
+/**
+ * 🌊 STREAMING: Converte um Readable (ex: Body do GetObject) para WAV PCM Float32 48kHz estéreo
+ * O stream vai direto para o stdin do FFmpeg, então download e decode acontecem em paralelo.
+ * Se spillPath for informado, os mesmos bytes são gravados em disco ao mesmo tempo
+ * (o True Peak via FFmpeg ebur128 ainda lê o arquivo original).
+ * @param {import('stream').Readable} inputStream - Stream do arquivo de áudio
+ * @param {string} filename - Nome do arquivo para logs
+ * @param {string|null} spillPath - Caminho opcional para cópia em disco
+ * @returns {Promise<Buffer>} WAV convertido (Float32 LE, 48kHz, 2ch)
+ */
+async function convertToWavPcmFromReadable(inputStream, filename, spillPath = null) {
+  return new Promise((resolve, reject) => {
+    if (!inputStream || typeof inputStream.pipe !== 'function') {
+      reject(makeErr('decode', 'Stream de entrada inválido', 'invalid_input_stream'));
+      return;
+    }
+
+    const args = [
+      '-hide_banner',
+      '-loglevel', 'error',
+      '-nostdin',
+      '-i', 'pipe:0',        // entrada via stdin (stream do bucket)
+      '-vn',
+      '-ar', String(SAMPLE_RATE),
+      '-ac', String(CHANNELS),
+      '-c:a', 'pcm_f32le',
+      '-f', 'wav',
+      'pipe:1'
+    ];
+
+    const ff = spawn(FFMPEG_PATH, args, { stdio: ['pipe', 'pipe', 'pipe'] });
+
+    let stderr = '';
+    const chunks = [];
+    let settled = false;
+    let spill = null;
+    let spillDone = !spillPath;
+    let outputBuffer = null;
+
+    const fail = (err) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(ffmpegTimeout);
+      // 🧹 MEMORY FIX: derrubar stream de entrada, processo e spill juntos
+      try { inputStream.unpipe(); } catch (_) {}
+      try { inputStream.destroy(); } catch (_) {}
+      try { ff.kill('SIGKILL'); } catch (_) {}
+      try { ff.stdout.destroy(); } catch (_) {}
+      try { ff.stderr.destroy(); } catch (_) {}
+      if (spill) {
+        try { spill.destroy(); } catch (_) {}
+      }
+      chunks.length = 0;
+      reject(err);
+    };
+
+    // Só resolve quando FFmpeg terminou E o spill foi fechado (True Peak lê o arquivo em seguida)
+    const maybeResolve = () => {
+      if (settled || !outputBuffer || !spillDone) return;
+      settled = true;
+      clearTimeout(ffmpegTimeout);
+      resolve(outputBuffer);
+    };
+
+    const ffmpegTimeout = setTimeout(() => {
+      logger.warn(`⚠️ FFmpeg (stream) timeout para ${filename} - matando processo...`);
+      fail(makeErr('decode', `Download+decode timeout após ${STREAM_DECODE_TIMEOUT_MS / 60000} minutos para: ${filename}`, 'ffmpeg_timeout'));
+    }, STREAM_DECODE_TIMEOUT_MS);
+
+    ff.stdout.on('data', (d) => chunks.push(d));
+    ff.stderr.on('data', (d) => (stderr += d?.toString?.() || ''));
+
+    ff.on('error', (err) => {
+      fail(makeErr('decode', `FFmpeg spawn error: ${err.message}`, 'ffmpeg_spawn_error'));
+    });
+
+    ff.on('close', (code) => {
+      if (settled) return;
+
+      if (code !== 0) {
+        const errorMsg = stderr || '(sem stderr)';
+        fail(makeErr('decode', `FFmpeg falhou (code=${code}): ${errorMsg}`, 'ffmpeg_conversion_failed'));
+        return;
+      }
+
+      const buffer = Buffer.concat(chunks);
+      chunks.length = 0;
+      if (buffer.length === 0) {
+        fail(makeErr('decode', 'FFmpeg retornou buffer vazio', 'ffmpeg_empty_output'));
+        return;
+      }
+
+      outputBuffer = buffer;
+      maybeResolve();
+    });
+
+    // EPIPE: FFmpeg fechou o stdin antes do fim do stream — o 'close' acima reporta a causa real
+    ff.stdin.on('error', (err) => {
+      if (err.code !== 'EPIPE') {
+        fail(makeErr('decode', `Erro ao escrever no stdin do FFmpeg: ${err.message}`, 'ffmpeg_stdin_error'));
+      }
+    });
+
+    inputStream.on('error', (err) => {
+      fail(makeErr('decode', `Erro no stream de entrada: ${err.message}`, 'input_stream_error'));
+    });
+
+    if (spillPath) {
+      spill = createWriteStream(spillPath);
+      spill.on('error', (err) => {
+        fail(makeErr('decode', `Erro ao gravar cópia em disco: ${err.message}`, 'spill_write_error'));
+      });
+      spill.on('finish', () => {
+        spillDone = true;
+        maybeResolve();
+      });
+      inputStream.pipe(spill);
+    }
+
+    inputStream.pipe(ff.stdin);
+  });
+}
+
+// ========= DECODE RAW f32le (SEM WAV INTERMEDIÁRIO) =========
+
+/**
+ * Duração estimada pelo ffprobe (só dimensiona a pré-alocação; não valida nada)
+ * @param {string} filePath
+ * @returns {Promise<number|null>} segundos ou null se indisponível
+ */
+function probeDurationSeconds(filePath) {
+  return new Promise((resolve) => {
+    const args = ['-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', filePath];
+    const probe = spawn(FFPROBE_PATH, args, { stdio: ['ignore', 'pipe', 'ignore'] });
+    let out = '';
+    const timer = setTimeout(() => { try { probe.kill('SIGKILL'); } catch (_) {} resolve(null); }, 10000);
+    probe.stdout.on('data', (d) => (out += d.toString()));
+    probe.on('error', () => { clearTimeout(timer); resolve(null); });
+    probe.on('close', () => {
+      clearTimeout(timer);
+      const seconds = parseFloat(out);
+      resolve(Number.isFinite(seconds) && seconds > 0 ? seconds : null);
+    });
+  });
+}
+
+/**
+ * 🎚️ Decodifica para Float32 48kHz estéreo com FFmpeg emitindo f32le bruto (-f f32le).
+ * O stdout é deintercalado chunk a chunk direto nos Float32Array por canal (PcmChannelSink):
+ * sem Buffer.concat do arquivo inteiro, sem parse de RIFF e sem a segunda cópia do parser WAV.
+ * Duração acima do máximo derruba o FFmpeg na hora (fail-fast).
+ * Trecho (startSeconds/durationSeconds) e sampleRate menor só valem para o quick-scan: o FFmpeg
+ * busca no arquivo (-ss antes do -i) e reamostra, então o resto do arquivo nem é decodificado.
+ * @param {string|Buffer|import('stream').Readable} input - caminho no disco, buffer ou stream
+ * @param {string} filename - Nome do arquivo para logs
+ * @param {Object} options - { spillPath, expectedFrames, timeoutMs, sampleRate, startSeconds, durationSeconds }
+ * @returns {Promise<Object>} Mesmo formato de decodeWavFloat32Stereo
+ */
+async function decodeRawFloat32Stereo(input, filename, {
+  spillPath = null,
+  expectedFrames = null,
+  timeoutMs = 120000,
+  sampleRate = SAMPLE_RATE,
+  startSeconds = null,
+  durationSeconds = null
+} = {}) {
+  const fromFile = typeof input === 'string';
+  const fromBuffer = Buffer.isBuffer(input);
+
+  if (fromFile && !input) {
+    throw makeErr('decode', 'Caminho de arquivo inválido', 'invalid_file_path');
+  }
+  if (fromBuffer && input.length === 0) {
+    throw makeErr('decode', 'Buffer de entrada inválido ou vazio', 'invalid_input');
+  }
+  if (!fromFile && !fromBuffer && (!input || typeof input.pipe !== 'function')) {
+    throw makeErr('decode', 'Stream de entrada inválido', 'invalid_input_stream');
+  }
+
+  // Trecho: o tamanho já é conhecido; arquivo inteiro: ffprobe dimensiona os canais de uma vez (sem realocação)
+  if (durationSeconds > 0 && !expectedFrames) {
+    expectedFrames = Math.ceil(durationSeconds * sampleRate);
+  }
+  if (fromFile && !expectedFrames) {
+    const seconds = await probeDurationSeconds(input);
+    if (seconds) expectedFrames = Math.ceil(seconds * sampleRate) + sampleRate; // +1s de folga (VBR)
+  }
+
+  const sink = new PcmChannelSink({
+    channels: CHANNELS,
+    sampleRate,
+    expectedFrames,
+    maxFrames: MAX_DURATION_SECONDS * sampleRate
+  });
+
+  return new Promise((resolve, reject) => {
+    const args = [
+      '-hide_banner',
+      '-loglevel', 'error',
+      '-nostdin',
+      ...(startSeconds > 0 ? ['-ss', startSeconds.toFixed(3)] : []),
+      ...(durationSeconds > 0 ? ['-t', durationSeconds.toFixed(3)] : []),
+      '-i', fromFile ? input : 'pipe:0',
+      '-vn',
+      '-ar', String(sampleRate),
+      '-ac', String(CHANNELS),
+      '-c:a', 'pcm_f32le',
+      '-f', 'f32le',         // PCM intercalado sem cabeçalho
+      'pipe:1'
+    ];
+
+    const ff = spawn(FFMPEG_PATH, args, { stdio: [fromFile ? 'ignore' : 'pipe', 'pipe', 'pipe'] });
+    const inputStream = !fromFile && !fromBuffer ? input : null;
+
+    let stderr = '';
+    let settled = false;
+    let spill = null;
+    let spillDone = !(inputStream && spillPath);
+    let audioData = null;
+
+    const fail = (err) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(ffmpegTimeout);
+      if (inputStream) {
+        try { inputStream.unpipe(); } catch (_) {}
+        try { inputStream.destroy(); } catch (_) {}
+      }
+      try { ff.kill('SIGKILL'); } catch (_) {}
+      try { ff.stdout.destroy(); } catch (_) {}
+      try { ff.stderr.destroy(); } catch (_) {}
+      if (spill) {
+        try { spill.destroy(); } catch (_) {}
+      }
+      reject(err);
+    };
+
+    // Stream: só resolve quando o spill fechou (True Peak lê o arquivo em seguida)
+    const maybeResolve = () => {
+      if (settled || !audioData || !spillDone) return;
+      settled = true;
+      clearTimeout(ffmpegTimeout);
+      resolve(audioData);
+    };
+
+    const ffmpegTimeout = setTimeout(() => {
+      logger.warn(`⚠️ FFmpeg (raw) timeout para ${filename} - matando processo...`);
+      fail(makeErr('decode', `FFmpeg timeout após ${timeoutMs / 60000} minutos para: ${filename}`, 'ffmpeg_timeout'));
+    }, timeoutMs);
+
+    ff.stdout.on('data', (chunk) => {
+      if (settled) return;
+      try {
+        sink.write(chunk);
+      } catch (err) {
+        fail(err); // não finito ou duração acima do máximo: não espera o FFmpeg terminar
+      }
+    });
+    ff.stderr.on('data', (d) => (stderr += d?.toString?.() || ''));
+
+    ff.on('error', (err) => {
+      fail(makeErr('decode', `FFmpeg spawn error: ${err.message}`, 'ffmpeg_spawn_error'));
+    });
+
+    ff.on('close', (code) => {
+      if (settled) return;
+
+      if (code !== 0) {
+        const errorMsg = stderr || '(sem stderr)';
+        fail(makeErr('decode', `FFmpeg falhou (code=${code}): ${errorMsg}`, 'ffmpeg_conversion_failed'));
+        return;
+      }
+
+      const { channels, frames, reallocations } = sink.finish();
+      if (frames === 0) {
+        fail(makeErr('decode', 'FFmpeg retornou buffer vazio', 'ffmpeg_empty_output'));
+        return;
+      }
+
+      if (reallocations > 0) {
+        logger.debug(() => [`[AUDIO_DECODE] raw f32le: ${reallocations} realocação(ões) sem estimativa de duração (${filename})`]);
+      }
+
+      const [left, right] = channels;
+      audioData = {
+        sampleRate,
+        numberOfChannels: CHANNELS,
+        length: frames,
+        duration: frames / sampleRate,
+        data: left,          // Canal principal para compatibilidade
+        leftChannel: left,
+        rightChannel: right
+      };
+      maybeResolve();
+    });
+
+    if (fromFile) return;
+
+    // EPIPE: FFmpeg fechou o stdin antes do fim da entrada — o 'close' acima reporta a causa real
+    ff.stdin.on('error', (err) => {
+      if (err.code !== 'EPIPE') {
+        fail(makeErr('decode', `Erro ao escrever no stdin do FFmpeg: ${err.message}`, 'ffmpeg_stdin_error'));
+      }
+    });
+
+    if (fromBuffer) {
+      ff.stdin.end(input);
+      return;
+    }
+
+    inputStream.on('error', (err) => {
+      fail(makeErr('decode', `Erro no stream de entrada: ${err.message}`, 'input_stream_error'));
+    });
+
+    if (spillPath) {
+      spill = createWriteStream(spillPath);
+      spill.on('error', (err) => {
+        fail(makeErr('decode', `Erro ao gravar cópia em disco: ${err.message}`, 'spill_write_error'));
+      });
+      spill.on('finish', () => {
+        spillDone = true;
+        maybeResolve();
+      });
+      inputStream.pipe(spill);
+    }
+
+    inputStream.pipe(ff.stdin);
+  });
+}
+
+/**
+ * Decodifica entrada (arquivo/buffer/stream) para canais Float32 no modo configurado.
+ * 'raw' (padrão): f32le direto nos canais; 'wav': caminho antigo (WAV em memória + parser RIFF).
+ * @param {'file'|'buffer'|'stream'} source
+ * @param {string|Buffer|import('stream').Readable} input
+ * @param {string} filename
+ * @param {Object} options - { decodeMode, spillPath, expectedFrames }
+ */
+async function decodeToChannels(source, input, filename, { decodeMode = DECODE_MODE, spillPath = null, expectedFrames = null } = {}) {
+  const stage = 'decode';
+
+  if (decodeMode !== 'wav') {
+    const timeoutMs = source === 'stream' ? STREAM_DECODE_TIMEOUT_MS : 120000;
+    return decodeRawFloat32Stereo(input, filename, { spillPath, expectedFrames, timeoutMs });
+  }
+
+  // ========= CONVERSÃO FFmpeg → WAV em memória =========
+  let wavBuffer;
+  try {
+    if (source === 'file') wavBuffer = await convertToWavPcmFromFile(input, filename);
+    else if (source === 'stream') wavBuffer = await convertToWavPcmFromReadable(input, filename, spillPath);
+    else wavBuffer = await convertToWavPcmStream(input, filename);
+  } catch (err) {
+    if (err.stage === stage) throw err;
+    throw makeErr(stage, `FFmpeg conversion failed: ${err.message}`, 'ffmpeg_conversion_failed');
+  }
+
+  // ========= DECODIFICAÇÃO WAV =========
+  try {
+    return decodeWavFloat32Stereo(wavBuffer, filename);
+  } catch (err) {
+    if (err.stage === stage) throw err;
+    throw makeErr(stage, `WAV decode failed: ${err.message}`, 'wav_decode_failed');
+  } finally {
+    wavBuffer = null; // 🧹 liberar wavBuffer (~115-230MB) mesmo em erro
+  }
+}
+
 // ========= PARSER WAV ROBUSTO (FAIL-FAST) =========
 
 /**
@@ -265,7 +644,7 @@ function decodeWavFloat32Stereo(wav, filename) {
   let off = 12;
   let chunkCount = 0;
   
-  console.log(`[WAV_PARSE] Iniciando parse: ${wav.length} bytes, arquivo=${filename}`);
+  logger.debug(() => [`[WAV_PARSE] Iniciando parse: ${wav.length} bytes, arquivo=${filename}`]);
   
   while (off + 8 <= wav.length && chunkCount < 20) {
     const id = wav.toString('ascii', off, off + 4);
@@ -273,22 +652,22 @@ function decodeWavFloat32Stereo(wav, filename) {
     const payloadStart = off + 8;
     const next = payloadStart + sz + (sz % 2); // alinhamento
 
-    console.log(`[WAV_PARSE] Chunk #${chunkCount}: id="${id}", offset=${off}, size=${sz}, payloadStart=${payloadStart}, next=${next}`);
+    logger.trace(() => [`[WAV_PARSE] Chunk #${chunkCount}: id="${id}", offset=${off}, size=${sz}, payloadStart=${payloadStart}, next=${next}`]);
 
     if (id === 'fmt ') {
       fmtOffset = payloadStart;
       fmtSize = sz; // ⚠️ SALVAR TAMANHO
-      console.log(`[WAV_PARSE] ✅ fmt chunk encontrado: offset=${fmtOffset}, size=${fmtSize}`);
+      logger.debug(() => [`[WAV_PARSE] ✅ fmt chunk encontrado: offset=${fmtOffset}, size=${fmtSize}`]);
     } else if (id === 'data') {
       dataOffset = payloadStart;
       dataSize = sz;
-      console.log(`[WAV_PARSE] ✅ data chunk encontrado: offset=${dataOffset}, size=${dataSize}`);
+      logger.debug(() => [`[WAV_PARSE] ✅ data chunk encontrado: offset=${dataOffset}, size=${dataSize}`]);
       break; // dados encontrados, podemos parar
     }
     
     // Proteção contra chunks inválidos
     if (next <= off || next > wav.length || sz > wav.length) {
-      console.warn(`[WAV_PARSE] ⚠️ Chunk inválido detectado, parando parse`);
+      logger.warn(`[WAV_PARSE] ⚠️ Chunk inválido detectado, parando parse`);
       break;
     }
     
@@ -309,7 +688,7 @@ function decodeWavFloat32Stereo(wav, filename) {
   const sampleRate = wav.readUInt32LE(fmtOffset + 4);
   const bitsPerSample = wav.readUInt16LE(fmtOffset + 14);
 
-  console.log(`[WAV_PARSE] Formato: audioFormat=${audioFormat}, channels=${numChannels}, sampleRate=${sampleRate}, bitsPerSample=${bitsPerSample}`);
+  logger.debug(() => [`[WAV_PARSE] Formato: audioFormat=${audioFormat}, channels=${numChannels}, sampleRate=${sampleRate}, bitsPerSample=${bitsPerSample}`]);
 
   // Validações rigorosas do formato
   if (audioFormat !== 3 && audioFormat !== 65534) {
@@ -318,14 +697,14 @@ function decodeWavFloat32Stereo(wav, filename) {
   
   // ========= VALIDAÇÃO EXTENSIBLE: Verificar GUID ==========
   if (audioFormat === 65534) {
-    console.log(`[WAV_PARSE] 🔍 Formato Extensible detectado - validando GUID...`);
+    logger.debug(`[WAV_PARSE] 🔍 Formato Extensible detectado - validando GUID...`);
     
     if (fmtSize < 40) {
       throw makeErr('decode', `WAV Extensible: chunk fmt muito pequeno (${fmtSize} bytes, esperado >= 40)`, 'wav_invalid_extensible');
     }
     
     const cbSize = wav.readUInt16LE(fmtOffset + 16);
-    console.log(`[WAV_PARSE] cbSize=${cbSize}`);
+    logger.debug(() => [`[WAV_PARSE] cbSize=${cbSize}`]);
     
     if (cbSize >= 22) {
       const validBitsPerSample = wav.readUInt16LE(fmtOffset + 18);
@@ -347,9 +726,9 @@ function decodeWavFloat32Stereo(wav, filename) {
         throw makeErr('decode', `WAV Extensible: SubFormat não é Float32 (GUID: ${guidHex}, esperado: 0300000000001000800000aa00389b71)`, 'wav_unsupported_subformat');
       }
       
-      console.log(`[WAV_PARSE] ✅ Extensible validado: SubFormat=Float32, validBits=${validBitsPerSample}, channelMask=0x${channelMask.toString(16)}`);
+      logger.debug(() => [`[WAV_PARSE] ✅ Extensible validado: SubFormat=Float32, validBits=${validBitsPerSample}, channelMask=0x${channelMask.toString(16)}`]);
     } else {
-      console.warn(`[WAV_PARSE] ⚠️ Extensible sem GUID (cbSize=${cbSize} < 22) - assumindo Float32`);
+      logger.warn(`[WAV_PARSE] ⚠️ Extensible sem GUID (cbSize=${cbSize} < 22) - assumindo Float32`);
     }
   }
   
@@ -412,7 +791,7 @@ function decodeWavFloat32Stereo(wav, filename) {
   }
 
   // ========= 🔍 SANITY CHECK: Sample Peak deve estar em [-1, 1] =========
-  console.log(`[WAV_SANITY] Verificando normalização do buffer...`);
+  logger.debug(`[WAV_SANITY] Verificando normalização do buffer...`);
   
   let maxAbsoluteFound = 0;
   let outOfRangeCount = 0;
@@ -429,7 +808,7 @@ function decodeWavFloat32Stereo(wav, filename) {
       
       // Log primeiros 5 valores fora de range
       if (outOfRangeCount <= 5) {
-        console.warn(`[WAV_SANITY] ⚠️ Sample ${i} fora de range: L=${left[i].toFixed(6)}, R=${right[i].toFixed(6)}`);
+        logger.warn(`[WAV_SANITY] ⚠️ Sample ${i} fora de range: L=${left[i].toFixed(6)}, R=${right[i].toFixed(6)}`);
       }
     }
   }
@@ -437,15 +816,15 @@ function decodeWavFloat32Stereo(wav, filename) {
   const maxDb = maxAbsoluteFound > 0 ? 20 * Math.log10(maxAbsoluteFound) : -120;
   const outOfRangePct = (outOfRangeCount / samplesPerChannel) * 100;
   
-  console.log(`[WAV_SANITY] Max Absolute: ${maxAbsoluteFound.toFixed(6)} linear (${maxDb.toFixed(2)} dBFS)`);
-  console.log(`[WAV_SANITY] Out of range [-1, 1]: ${outOfRangeCount} / ${samplesPerChannel} samples (${outOfRangePct.toFixed(2)}%)`);
+  logger.debug(() => [`[WAV_SANITY] Max Absolute: ${maxAbsoluteFound.toFixed(6)} linear (${maxDb.toFixed(2)} dBFS)`]);
+  logger.debug(() => [`[WAV_SANITY] Out of range [-1, 1]: ${outOfRangeCount} / ${samplesPerChannel} samples (${outOfRangePct.toFixed(2)}%)`]);
   
   if (maxAbsoluteFound > 1.1) {
     throw makeErr('decode', `WAV: valores muito acima de 1.0 (max=${maxAbsoluteFound.toFixed(2)} = ${maxDb.toFixed(2)} dBFS). Buffer não está normalizado! Possível erro na conversão FFmpeg ou leitura de offset incorreto.`, 'wav_not_normalized');
   } else if (maxAbsoluteFound > 1.0) {
-    console.warn(`[WAV_SANITY] ⚠️ Valores ligeiramente > 1.0 (clipping permitido, max=${maxAbsoluteFound.toFixed(4)})`);
+    logger.warn(`[WAV_SANITY] ⚠️ Valores ligeiramente > 1.0 (clipping permitido, max=${maxAbsoluteFound.toFixed(4)})`);
   } else {
-    console.log(`[WAV_SANITY] ✅ Buffer normalizado corretamente`);
+    logger.debug(`[WAV_SANITY] ✅ Buffer normalizado corretamente`);
   }
 
   return {
@@ -465,7 +844,7 @@ function decodeWavFloat32Stereo(wav, filename) {
  * Decodifica arquivo de áudio para PCM Float32 estéreo 48kHz - FASE 5.1
  * @param {Buffer} fileBuffer - Buffer do arquivo
  * @param {string} filename - Nome do arquivo
- * @param {Object} options - Opções (jobId para logs)
+ * @param {Object} options - Opções (jobId para logs, decodeMode 'raw' | 'wav')
  */
 export async function decodeAudioFile(fileBuffer, filename, options = {}) {
   const jobId = options.jobId || 'unknown';
@@ -491,31 +870,8 @@ export async function decodeAudioFile(fileBuffer, filename, options = {}) {
     // Validar formato suportado
     validateSupportedFormat(filename || '');
 
-    // ========= CONVERSÃO FFmpeg =========
-    let wavBuffer;
-    try {
-      wavBuffer = await convertToWavPcmStream(fileBuffer, filename);
-    } catch (err) {
-      // Re-propagar erros do FFmpeg com contexto
-      if (err.stage === 'decode') {
-        throw err; // Já é um erro estruturado
-      }
-      throw makeErr(stage, `FFmpeg conversion failed: ${err.message}`, 'ffmpeg_conversion_failed');
-    }
-
-    // ========= DECODIFICAÇÃO WAV =========
-    let audioData;
-    try {
-      audioData = decodeWavFloat32Stereo(wavBuffer, filename);
-      // 🧹 MEMORY FIX: wavBuffer (~115MB PCM) já foi decodificado — liberar antes da análise
-      wavBuffer = null;
-    } catch (err) {
-      wavBuffer = null; // garantir liberação mesmo em erro
-      if (err.stage === 'decode') {
-        throw err; // Já é um erro estruturado
-      }
-      throw makeErr(stage, `WAV decode failed: ${err.message}`, 'wav_decode_failed');
-    }
+    // ========= CONVERSÃO FFmpeg + DECODIFICAÇÃO =========
+    const audioData = await decodeToChannels('buffer', fileBuffer, filename, options);
 
     // ========= DETECÇÃO DE CLIPPING/NEAR-CLIPPING (antes de pós-processar) =========
     
@@ -550,11 +906,11 @@ export async function decodeAudioFile(fileBuffer, filename, options = {}) {
     const pctHigh = (countHigh / totalSamples) * 100;
     const maxAbsOverall = Math.max(maxAbsLeft, maxAbsRight);
     
-    console.log(`[AUDIO_DECODE] 🔍 Análise de amplitude do buffer:`);
-    console.log(`   Max absolute: ${maxAbsOverall.toFixed(6)} (${(20 * Math.log10(maxAbsOverall)).toFixed(2)} dBFS)`);
-    console.log(`   Samples = ±1.000: ${countExact1} (${pctExact1.toFixed(2)}%)`);
-    console.log(`   Samples >= 0.995: ${countNear1} (${pctNear1.toFixed(2)}%)`);
-    console.log(`   Samples >= 0.990: ${countHigh} (${pctHigh.toFixed(2)}%)`);
+    logger.debug(`[AUDIO_DECODE] 🔍 Análise de amplitude do buffer:`);
+    logger.debug(() => [`   Max absolute: ${maxAbsOverall.toFixed(6)} (${(20 * Math.log10(maxAbsOverall)).toFixed(2)} dBFS)`]);
+    logger.debug(() => [`   Samples = ±1.000: ${countExact1} (${pctExact1.toFixed(2)}%)`]);
+    logger.debug(() => [`   Samples >= 0.995: ${countNear1} (${pctNear1.toFixed(2)}%)`]);
+    logger.debug(() => [`   Samples >= 0.990: ${countHigh} (${pctHigh.toFixed(2)}%)`]);
     
     // Detectar clipping usando threshold padrão (0.99) para stats gerais
     const clippingLeft = detectClipping(audioData.leftChannel);
@@ -577,13 +933,13 @@ export async function decodeAudioFile(fileBuffer, filename, options = {}) {
     let leftProcessed, rightProcessed;
     
     if (shouldSkipDcFilter) {
-      console.log(`[AUDIO_DECODE] ⚠️ Near-clipping detectado - PULANDO filtro DC para evitar overshoots`);
-      console.log(`   Razão: ${pctNear1 >= 0.1 ? `${pctNear1.toFixed(2)}% >= 0.995` : `maxAbs=${maxAbsOverall.toFixed(4)}`}`);
+      logger.debug(`[AUDIO_DECODE] ⚠️ Near-clipping detectado - PULANDO filtro DC para evitar overshoots`);
+      logger.debug(() => [`   Razão: ${pctNear1 >= 0.1 ? `${pctNear1.toFixed(2)}% >= 0.995` : `maxAbs=${maxAbsOverall.toFixed(4)}`}`]);
       // Usar canais originais sem filtro DC
       leftProcessed = audioData.leftChannel;
       rightProcessed = audioData.rightChannel;
     } else {
-      console.log(`[AUDIO_DECODE] ✅ Aplicando filtro DC (20Hz) - áudio com headroom suficiente`);
+      logger.debug(`[AUDIO_DECODE] ✅ Aplicando filtro DC (20Hz) - áudio com headroom suficiente`);
       // Remover DC offset (filtro 20Hz)
       leftProcessed = removeDCOffset(audioData.leftChannel, audioData.sampleRate, 20);
       rightProcessed = removeDCOffset(audioData.rightChannel, audioData.sampleRate, 20);
@@ -663,13 +1019,106 @@ export async function decodeAudioFile(fileBuffer, filename, options = {}) {
   }
 }
 
+/**
+ * Pós-processamento comum aos decoders por arquivo/stream: clipping, filtro DC
+ * e montagem do objeto compatível com AudioBuffer.
+ * @param {Object} audioData - Saída de decodeWavFloat32Stereo
+ * @param {string} filename - Nome do arquivo para logs
+ * @param {Object} ctx - { stage, start, source }
+ */
+function buildDecodedAudio(audioData, filename, { stage, start, source }) {
+  // ========= DETECÇÃO DE CLIPPING =========
+  let maxAbsLeft = 0, maxAbsRight = 0;
+  let countNear1 = 0;
+  
+  for (let i = 0; i < audioData.leftChannel.length; i++) {
+    const absL = Math.abs(audioData.leftChannel[i]);
+    const absR = Math.abs(audioData.rightChannel[i]);
+    if (absL > maxAbsLeft) maxAbsLeft = absL;
+    if (absR > maxAbsRight) maxAbsRight = absR;
+    if (absL >= 0.995) countNear1++;
+    if (absR >= 0.995) countNear1++;
+  }
+  
+  const maxAbsOverall = Math.max(maxAbsLeft, maxAbsRight);
+  const totalSamples = audioData.leftChannel.length * 2;
+  const pctNear1 = (countNear1 / totalSamples) * 100;
+
+  const clippingLeft = detectClipping(audioData.leftChannel);
+  const clippingRight = detectClipping(audioData.rightChannel);
+
+  // ========= PÓS-PROCESSAMENTO (DC filter) =========
+  const shouldSkipDcFilter = (pctNear1 >= 0.1 || maxAbsOverall >= 0.998);
+  
+  let leftProcessed, rightProcessed;
+  if (shouldSkipDcFilter) {
+    logger.debug(`[AUDIO_DECODE] ⚠️ Near-clipping — PULANDO filtro DC`);
+    leftProcessed = audioData.leftChannel;
+    rightProcessed = audioData.rightChannel;
+  } else {
+    logger.debug(`[AUDIO_DECODE] ✅ Aplicando filtro DC (20Hz)`);
+    leftProcessed = removeDCOffset(audioData.leftChannel, audioData.sampleRate, 20);
+    rightProcessed = removeDCOffset(audioData.rightChannel, audioData.sampleRate, 20);
+    ensureFiniteArray(leftProcessed, stage, 'left after DC');
+    ensureFiniteArray(rightProcessed, stage, 'right after DC');
+  }
+
+  const clippingTotal = {
+    clippedSamples: clippingLeft.clippedSamples + clippingRight.clippedSamples,
+    totalSamples: clippingLeft.totalSamples + clippingRight.totalSamples,
+    clippingPct: ((clippingLeft.clippedSamples + clippingRight.clippedSamples) / (clippingLeft.totalSamples + clippingRight.totalSamples)) * 100
+  };
+
+  const processingTime = Date.now() - start;
+
+  const audioBufferCompatible = {
+    sampleRate: audioData.sampleRate,
+    numberOfChannels: audioData.numberOfChannels,
+    length: audioData.length,
+    duration: audioData.duration,
+    data: leftProcessed,
+    leftChannel: leftProcessed,
+    rightChannel: rightProcessed,
+    getChannelData(channel) {
+      if (channel === 0) return this.leftChannel;
+      if (channel === 1) return this.rightChannel;
+      throw makeErr(stage, `Canal inválido: ${channel}`, 'invalid_channel');
+    },
+    _metadata: {
+      processingTime,
+      decodedAt: new Date().toISOString(),
+      stage: '5.1-decode',
+      format: extFromFilename(filename),
+      clipping: clippingTotal,
+      dcRemoval: !shouldSkipDcFilter,
+      channelPolicy: 'force_stereo',
+      source,
+      enforced: { SAMPLE_RATE: audioData.sampleRate, CHANNELS, BIT_DEPTH }
+    }
+  };
+
+  logAudio(stage, 'done', {
+    ms: processingTime,
+    meta: {
+      sampleRate: audioData.sampleRate,
+      channels: audioData.numberOfChannels,
+      duration: audioData.duration.toFixed(2),
+      clippingPct: clippingTotal.clippingPct.toFixed(1),
+      source
+    }
+  });
+
+  return audioBufferCompatible;
+}
+
 /**
  * 🧹 MEMORY OPT: Decodifica arquivo de áudio a partir do DISCO (sem carregar na RAM)
  * Mesma lógica que decodeAudioFile, mas FFmpeg lê do disco direto.
  * Economia: ~100-150MB (evita fs.readFile + FFmpeg stdin)
  * @param {string} filePath - Caminho do arquivo no disco
  * @param {string} filename - Nome do arquivo para logs
- * @param {Object} options - Opções (jobId para logs)
+ * @param {Object} options - Opções (jobId para logs, decodeMode 'raw' | 'wav', expectedFrames já
+ *   conhecido — ex: duração medida pelo quick-scan — dispensa o ffprobe)
  */
 export async function decodeAudioFromFile(filePath, filename, options = {}) {
   const jobId = options.jobId || 'unknown';
@@ -682,117 +1131,94 @@ export async function decodeAudioFromFile(filePath, filename, options = {}) {
     // Validar formato suportado
     validateSupportedFormat(filename || '');
 
-    // ========= CONVERSÃO FFmpeg (lê do disco) =========
-    let wavBuffer;
-    try {
-      wavBuffer = await convertToWavPcmFromFile(filePath, filename);
-    } catch (err) {
-      if (err.stage === 'decode') throw err;
-      throw makeErr(stage, `FFmpeg conversion failed: ${err.message}`, 'ffmpeg_conversion_failed');
-    }
+    // ========= CONVERSÃO FFmpeg (lê do disco) + DECODIFICAÇÃO =========
+    const audioData = await decodeToChannels('file', filePath, filename, options);
 
-    // ========= DECODIFICAÇÃO WAV =========
-    let audioData;
-    try {
-      audioData = decodeWavFloat32Stereo(wavBuffer, filename);
-      wavBuffer = null; // 🧹 liberar wavBuffer (~115-230MB)
-    } catch (err) {
-      wavBuffer = null;
-      if (err.stage === 'decode') throw err;
-      throw makeErr(stage, `WAV decode failed: ${err.message}`, 'wav_decode_failed');
-    }
+    return buildDecodedAudio(audioData, filename, { stage, start, source: 'file' });
 
-    // ========= DETECÇÃO DE CLIPPING =========
-    let maxAbsLeft = 0, maxAbsRight = 0;
-    let countNear1 = 0;
-    
-    for (let i = 0; i < audioData.leftChannel.length; i++) {
-      const absL = Math.abs(audioData.leftChannel[i]);
-      const absR = Math.abs(audioData.rightChannel[i]);
-      if (absL > maxAbsLeft) maxAbsLeft = absL;
-      if (absR > maxAbsRight) maxAbsRight = absR;
-      if (absL >= 0.995) countNear1++;
-      if (absR >= 0.995) countNear1++;
-    }
-    
-    const maxAbsOverall = Math.max(maxAbsLeft, maxAbsRight);
-    const totalSamples = audioData.leftChannel.length * 2;
-    const pctNear1 = (countNear1 / totalSamples) * 100;
+  } catch (error) {
+    const processingTime = Date.now() - start;
+    logAudio(stage, 'error', { code: error.code || 'unknown', message: error.message });
+    if (error.stage === stage) throw error;
+    throw makeErr(stage, `Audio decode from file failed: ${error.message}`, 'decode_file_failed');
+  }
+}
 
-    const clippingLeft = detectClipping(audioData.leftChannel);
-    const clippingRight = detectClipping(audioData.rightChannel);
+/**
+ * 🌊 STREAMING: Decodifica áudio direto de um Readable (ex: Body do GetObject do B2/S3)
+ * O stream é encaminhado ao stdin do FFmpeg, sobrepondo download e decode.
+ * Todos os SUPPORTED_EXTS decodificam via stdin; options.spillPath recebe uma cópia
+ * integral em paralelo porque o True Peak (FFmpeg ebur128) ainda lê o arquivo em disco.
+ * @param {import('stream').Readable} inputStream - Stream do arquivo
+ * @param {string} filename - Nome do arquivo para logs
+ * @param {Object} options - Opções (jobId para logs, spillPath para cópia em disco, decodeMode 'raw' | 'wav')
+ */
+export async function decodeAudioFromStream(inputStream, filename, options = {}) {
+  const jobId = options.jobId || 'unknown';
+  const spillPath = options.spillPath || null;
+  const stage = 'decode';
+  const start = Date.now();
 
-    // ========= PÓS-PROCESSAMENTO (DC filter) =========
-    const shouldSkipDcFilter = (pctNear1 >= 0.1 || maxAbsOverall >= 0.998);
-    
-    let leftProcessed, rightProcessed;
-    if (shouldSkipDcFilter) {
-      console.log(`[AUDIO_DECODE] ⚠️ Near-clipping — PULANDO filtro DC`);
-      leftProcessed = audioData.leftChannel;
-      rightProcessed = audioData.rightChannel;
-    } else {
-      console.log(`[AUDIO_DECODE] ✅ Aplicando filtro DC (20Hz)`);
-      leftProcessed = removeDCOffset(audioData.leftChannel, audioData.sampleRate, 20);
-      rightProcessed = removeDCOffset(audioData.rightChannel, audioData.sampleRate, 20);
-      ensureFiniteArray(leftProcessed, stage, 'left after DC');
-      ensureFiniteArray(rightProcessed, stage, 'right after DC');
-    }
+  try {
+    logAudio(stage, 'start', { fileName: filename, jobId, source: 'stream' });
 
-    const clippingTotal = {
-      clippedSamples: clippingLeft.clippedSamples + clippingRight.clippedSamples,
-      totalSamples: clippingLeft.totalSamples + clippingRight.totalSamples,
-      clippingPct: ((clippingLeft.clippedSamples + clippingRight.clippedSamples) / (clippingLeft.totalSamples + clippingRight.totalSamples)) * 100
-    };
+    // Validar formato suportado
+    validateSupportedFormat(filename || '');
 
-    const processingTime = Date.now() - start;
+    // ========= CONVERSÃO FFmpeg (lê do stream) + DECODIFICAÇÃO =========
+    const audioData = await decodeToChannels('stream', inputStream, filename, { ...options, spillPath });
 
-    const audioBufferCompatible = {
-      sampleRate: audioData.sampleRate,
-      numberOfChannels: audioData.numberOfChannels,
-      length: audioData.length,
-      duration: audioData.duration,
-      data: leftProcessed,
-      leftChannel: leftProcessed,
-      rightChannel: rightProcessed,
-      getChannelData(channel) {
-        if (channel === 0) return this.leftChannel;
-        if (channel === 1) return this.rightChannel;
-        throw makeErr(stage, `Canal inválido: ${channel}`, 'invalid_channel');
-      },
-      _metadata: {
-        processingTime,
-        decodedAt: new Date().toISOString(),
-        stage: '5.1-decode',
-        format: extFromFilename(filename),
-        clipping: clippingTotal,
-        dcRemoval: !shouldSkipDcFilter,
-        channelPolicy: 'force_stereo',
-        source: 'file',
-        enforced: { SAMPLE_RATE, CHANNELS, BIT_DEPTH }
-      }
-    };
+    return buildDecodedAudio(audioData, filename, { stage, start, source: 'stream' });
 
-    logAudio(stage, 'done', {
-      ms: processingTime,
-      meta: {
-        sampleRate: audioData.sampleRate,
-        channels: audioData.numberOfChannels,
-        duration: audioData.duration.toFixed(2),
-        clippingPct: clippingTotal.clippingPct.toFixed(1),
-        source: 'file'
-      }
+  } catch (error) {
+    logAudio(stage, 'error', { code: error.code || 'unknown', message: error.message });
+    if (error.stage === stage) throw error;
+    throw makeErr(stage, `Audio decode from stream failed: ${error.message}`, 'decode_stream_failed');
+  }
+}
+
+/**
+ * ⚡ QUICK-SCAN: Decodifica só um trecho do arquivo, reamostrado (ex: 45s a 32kHz)
+ * Sempre f32le bruto; mesmo pós-processamento (clipping, filtro DC) do decode completo.
+ * @param {string} filePath - Caminho do arquivo no disco (o -ss precisa de seek)
+ * @param {string} filename - Nome do arquivo para logs
+ * @param {Object} options - { jobId, sampleRate, startSeconds, durationSeconds }
+ */
+export async function decodeAudioExcerpt(filePath, filename, options = {}) {
+  const jobId = options.jobId || 'unknown';
+  const stage = 'decode';
+  const start = Date.now();
+
+  try {
+    logAudio(stage, 'start', { fileName: filename, jobId, source: 'excerpt' });
+
+    validateSupportedFormat(filename || '');
+
+    const audioData = await decodeRawFloat32Stereo(filePath, filename, {
+      sampleRate: options.sampleRate || SAMPLE_RATE,
+      startSeconds: options.startSeconds || null,
+      durationSeconds: options.durationSeconds || null,
+      timeoutMs: 60000
     });
 
-    return audioBufferCompatible;
+    return buildDecodedAudio(audioData, filename, { stage, start, source: 'excerpt' });
 
   } catch (error) {
-    const processingTime = Date.now() - start;
     logAudio(stage, 'error', { code: error.code || 'unknown', message: error.message });
     if (error.stage === stage) throw error;
-    throw makeErr(stage, `Audio decode from file failed: ${error.message}`, 'decode_file_failed');
+    throw makeErr(stage, `Audio excerpt decode failed: ${error.message}`, 'decode_excerpt_failed');
   }
 }
 
+/**
+ * Duração do arquivo pelo ffprobe (null se indisponível)
+ * @param {string} filePath
+ * @returns {Promise<number|null>}
+ */
+export function probeAudioDuration(filePath) {
+  return probeDurationSeconds(filePath);
+}
+
 /**
  * Verifica se ffmpeg está disponível
  */
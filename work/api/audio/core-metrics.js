@@ -11,9 +11,12 @@ import { SpectralMetricsCalculator, SpectralMetricsAggregator, serializeSpectral
 import { calculateDynamicsMetrics } from "../../lib/audio/features/dynamics-corrected.js";
 import { calculateSpectralBands, SpectralBandsCalculator, SpectralBandsAggregator } from "../../lib/audio/features/spectral-bands.js";
 import { calculateSpectralCentroid, SpectralCentroidCalculator, SpectralCentroidAggregator } from "../../lib/audio/features/spectral-centroid.js";
+import { SpectralBatchAnalyzer } from "../../lib/audio/features/spectral-batch.js";
 import { analyzeStereoMetrics, StereoMetricsCalculator, StereoMetricsAggregator } from "../../lib/audio/features/stereo-metrics.js";
 import { calculateDominantFrequencies } from "../../lib/audio/features/dominant-frequencies.js";
-import { calculateDCOffset } from "../../lib/audio/features/dc-offset.js";
+import { calculateDCOffset, calculateDCOffsetFromStats } from "../../lib/audio/features/dc-offset.js";
+import { computeTimeDomainStats } from "../../lib/audio/features/time-domain-kernel.js";
+import { RunningStats } from "../../lib/audio/utils/streaming-stats.js";
 import { calculateSpectralUniformity } from "../../lib/audio/features/spectral-uniformity.js";
 import { analyzeProblemsAndSuggestionsV2 } from "../../lib/audio/features/problems-suggestions-v2.js";
 import { loadGenreTargets, loadGenreTargetsFromWorker } from "../../lib/audio/utils/genre-targets-loader.js";
@@ -31,18 +34,23 @@ import {
   ffmpegSamplePeakFallback,
   correctSamplePeakIfNeeded
 } from './sample-peak-diagnostics.js';
+import { createLogger } from '../../lib/logger.js';
+import { profileStage } from '../../lib/job-profiler.js';
+
+const logger = createLogger('audio:core-metrics');
 
 /**
  * 🎯 FUNÇÃO PURA: Calcular Sample Peak REAL (max absolute sample)
  * HOTFIX: Implementado como função standalone (não método de classe) para evitar contexto `this`
  * @param {Float32Array} leftChannel - Canal esquerdo
  * @param {Float32Array} rightChannel - Canal direito
+ * @param {object|null} timeDomainStats - Acumuladores do kernel de passada única (evita reler os canais)
  * @returns {object|null} - { left, right, max, leftDbfs, rightDbfs, maxDbfs } ou null se erro
  */
-function calculateSamplePeakDbfs(leftChannel, rightChannel) {
+function calculateSamplePeakDbfs(leftChannel, rightChannel, timeDomainStats = null) {
   try {
     if (!leftChannel || !rightChannel || leftChannel.length === 0 || rightChannel.length === 0) {
-      console.warn('[SAMPLE_PEAK] Canais inválidos ou vazios');
+      logger.warn('[SAMPLE_PEAK] Canais inválidos ou vazios');
       return null;
     }
 
@@ -54,18 +62,22 @@ function calculateSamplePeakDbfs(leftChannel, rightChannel) {
     let countExact1 = 0;
     let countNear1 = 0;  // >= 0.995
     
-    for (let i = 0; i < leftChannel.length; i++) {
-      const absLeft = Math.abs(leftChannel[i]);
-      if (absLeft > peakLeftLinear) peakLeftLinear = absLeft;
-      if (absLeft === 1.0) countExact1++;
-      if (absLeft >= 0.995) countNear1++;
-    }
-    
-    for (let i = 0; i < rightChannel.length; i++) {
-      const absRight = Math.abs(rightChannel[i]);
-      if (absRight > peakRightLinear) peakRightLinear = absRight;
-      if (absRight === 1.0) countExact1++;
-      if (absRight >= 0.995) countNear1++;
+    if (timeDomainStats) {
+      ({ left: peakLeftLinear, right: peakRightLinear, countExact1, countNear1 } = timeDomainStats.peak);
+    } else {
+      for (let i = 0; i < leftChannel.length; i++) {
+        const absLeft = Math.abs(leftChannel[i]);
+        if (absLeft > peakLeftLinear) peakLeftLinear = absLeft;
+        if (absLeft === 1.0) countExact1++;
+        if (absLeft >= 0.995) countNear1++;
+      }
+      
+      for (let i = 0; i < rightChannel.length; i++) {
+        const absRight = Math.abs(rightChannel[i]);
+        if (absRight > peakRightLinear) peakRightLinear = absRight;
+        if (absRight === 1.0) countExact1++;
+        if (absRight >= 0.995) countNear1++;
+      }
     }
     
     const peakMaxLinear = Math.max(peakLeftLinear, peakRightLinear);
@@ -77,20 +89,20 @@ function calculateSamplePeakDbfs(leftChannel, rightChannel) {
     
     // 🔍 LOG DIAGNÓSTICO
     const totalSamples = leftChannel.length + rightChannel.length;
-    console.log(`[SAMPLE_PEAK] 🔍 Diagnóstico do buffer:`);
-    console.log(`   Peak L: ${peakLeftLinear.toFixed(6)} (${peakLeftDbfs.toFixed(2)} dBFS)`);
-    console.log(`   Peak R: ${peakRightLinear.toFixed(6)} (${peakRightDbfs.toFixed(2)} dBFS)`);
-    console.log(`   Peak Max: ${peakMaxLinear.toFixed(6)} (${peakMaxDbfs.toFixed(2)} dBFS)`);
-    console.log(`   Samples = ±1.000: ${countExact1} (${(countExact1 / totalSamples * 100).toFixed(3)}%)`);
-    console.log(`   Samples >= 0.995: ${countNear1} (${(countNear1 / totalSamples * 100).toFixed(3)}%)`);
+    logger.debug(`[SAMPLE_PEAK] 🔍 Diagnóstico do buffer:`);
+    logger.debug(() => [`   Peak L: ${peakLeftLinear.toFixed(6)} (${peakLeftDbfs.toFixed(2)} dBFS)`]);
+    logger.debug(() => [`   Peak R: ${peakRightLinear.toFixed(6)} (${peakRightDbfs.toFixed(2)} dBFS)`]);
+    logger.debug(() => [`   Peak Max: ${peakMaxLinear.toFixed(6)} (${peakMaxDbfs.toFixed(2)} dBFS)`]);
+    logger.debug(() => [`   Samples = ±1.000: ${countExact1} (${(countExact1 / totalSamples * 100).toFixed(3)}%)`]);
+    logger.debug(() => [`   Samples >= 0.995: ${countNear1} (${(countNear1 / totalSamples * 100).toFixed(3)}%)`]);
     
     // ⚠️ AVISO se Sample Peak > 0.2 dB (suspeito para PCM inteiro)
     if (peakMaxDbfs > 0.2) {
-      console.warn(`[SAMPLE_PEAK] ⚠️ Sample Peak > 0.2 dBFS (${peakMaxDbfs.toFixed(2)} dB) - SUSPEITO para PCM inteiro!`);
-      console.warn(`   Possíveis causas:`);
-      console.warn(`   1. Filtro DC introduziu overshoots (verificar audio-decoder logs)`);
-      console.warn(`   2. Buffer não normalizado corretamente (verificar FFmpeg conversion)`);
-      console.warn(`   3. Arquivo em formato float (permitido Sample Peak > 0 dBFS)`);
+      logger.warn(`[SAMPLE_PEAK] ⚠️ Sample Peak > 0.2 dBFS (${peakMaxDbfs.toFixed(2)} dB) - SUSPEITO para PCM inteiro!`);
+      logger.warn(`   Possíveis causas:`);
+      logger.warn(`   1. Filtro DC introduziu overshoots (verificar audio-decoder logs)`);
+      logger.warn(`   2. Buffer não normalizado corretamente (verificar FFmpeg conversion)`);
+      logger.warn(`   3. Arquivo em formato float (permitido Sample Peak > 0 dBFS)`);
     }
     
     return {
@@ -109,7 +121,7 @@ function calculateSamplePeakDbfs(leftChannel, rightChannel) {
     };
     
   } catch (error) {
-    console.error('[SAMPLE_PEAK] Erro ao calcular:', error.message);
+    logger.error('[SAMPLE_PEAK] Erro ao calcular:', error.message);
     return null;
   }
 }
@@ -131,10 +143,17 @@ const CORE_METRICS_CONFIG = {
 
   // True Peak
   TRUE_PEAK_OVERSAMPLING: 4,
+
+  // Normalização virtual: ganho como escalar, sem cópias normalizadas dos canais
+  VIRTUAL_NORMALIZATION: process.env.VIRTUAL_NORMALIZATION !== 'false',
+
+  // Bandas/centróide sobre o espectrograma inteiro em lote (typed arrays) em vez de frame a frame
+  SPECTRAL_BATCH: process.env.SPECTRAL_BATCH !== 'false',
 };
 
-// 🎯 Flag para controle de logs verbosos
-const DEBUG_AUDIO = process.env.DEBUG_AUDIO === 'true';
+// 🎯 Logs por frame do cálculo de bandas: 1º frame e depois 1 a cada N (só em trace)
+const FRAME_LOG_SAMPLE_EVERY = 200;
+const frameLogger = logger.sampled(FRAME_LOG_SAMPLE_EVERY);
 
 /**
  * 🧮 Instâncias dos processadores de áudio
@@ -157,6 +176,11 @@ class CoreMetricsProcessor {
       CORE_METRICS_CONFIG.SAMPLE_RATE,
       CORE_METRICS_CONFIG.FFT_SIZE
     );
+    this.spectralBatchAnalyzer = new SpectralBatchAnalyzer(
+      CORE_METRICS_CONFIG.SAMPLE_RATE,
+      CORE_METRICS_CONFIG.FFT_SIZE,
+      this.spectralBandsCalculator
+    );
     this.stereoMetricsCalculator = new StereoMetricsCalculator();
     
     // SKIP: Analisadores removidos temporariamente para evitar quebras
@@ -208,6 +232,10 @@ class CoreMetricsProcessor {
       // 🔍 TAREFA 3: Detectar erro de PCM 24-bit
       const pcm24Check = detectWrongPCM24Divisor({ leftChannel, rightChannel }, { fileName });
       
+      // ⚡ Kernel de passada única: sample peak, dinâmica, estéreo e DC saem dos mesmos acumuladores
+      const timeDomainStats = segmentedAudio.timeDomainStats
+        || computeTimeDomainStats(leftChannel, rightChannel, CORE_METRICS_CONFIG.SAMPLE_RATE);
+      
       // HOTFIX: Sample Peak é feature nova e OPCIONAL - não deve quebrar pipeline
       let samplePeakMetrics = null;
       try {
@@ -216,21 +244,21 @@ class CoreMetricsProcessor {
         });
         
         // Calcular Sample Peak
-        samplePeakMetrics = calculateSamplePeakDbfs(leftChannel, rightChannel);
+        samplePeakMetrics = profileStage('metrics:sample_peak', () => calculateSamplePeakDbfs(leftChannel, rightChannel, timeDomainStats));
         
         // 🔍 TAREFA 3B: Aplicar correção se detectado erro de escala
         if (bufferAnalysis.needsCorrection) {
-          console.warn(`[SAMPLE_PEAK] ⚠️ Aplicando correção de escala (divisor=${bufferAnalysis.divisorNeeded})`);
+          logger.warn(`[SAMPLE_PEAK] ⚠️ Aplicando correção de escala (divisor=${bufferAnalysis.divisorNeeded})`);
           samplePeakMetrics = correctSamplePeakIfNeeded(samplePeakMetrics, bufferAnalysis);
         }
         
         if (samplePeakMetrics && samplePeakMetrics.maxDbfs !== null) {
-          console.log('[SAMPLE_PEAK] ✅ Max Sample Peak (RAW):', samplePeakMetrics.maxDbfs.toFixed(2), 'dBFS');
+          logger.debug(() => ['[SAMPLE_PEAK] ✅ Max Sample Peak (RAW):', samplePeakMetrics.maxDbfs.toFixed(2), 'dBFS']);
         } else {
-          console.warn('[SAMPLE_PEAK] ⚠️ Não foi possível calcular (canais inválidos)');
+          logger.warn('[SAMPLE_PEAK] ⚠️ Não foi possível calcular (canais inválidos)');
         }
       } catch (error) {
-        console.warn('[SAMPLE_PEAK] ⚠️ Erro ao calcular - continuando pipeline:', error.message);
+        logger.warn('[SAMPLE_PEAK] ⚠️ Erro ao calcular - continuando pipeline:', error.message);
         samplePeakMetrics = null;
       }
 
@@ -242,18 +270,18 @@ class CoreMetricsProcessor {
 
       // 🎯 CÁLCULO RAW: LUFS Integrado (áudio original)
       logAudio('core_metrics', 'raw_lufs_start', { frames: segmentedAudio.framesRMS?.count });
-      const rawLufsMetrics = await this.calculateLUFSMetrics(leftChannel, rightChannel, { jobId });
+      const rawLufsMetrics = await profileStage('metrics:lufs', () => this.calculateLUFSMetrics(leftChannel, rightChannel, { jobId }));
       assertFinite(rawLufsMetrics, 'core_metrics');
-      console.log('[RAW_METRICS] ✅ LUFS integrado (RAW):', rawLufsMetrics.integrated);
+      logger.debug(() => ['[RAW_METRICS] ✅ LUFS integrado (RAW):', rawLufsMetrics.integrated]);
 
       // 🎯 CÁLCULO RAW: True Peak (áudio original)
       logAudio('core_metrics', 'raw_truepeak_start', { channels: 2, method: 'ffmpeg_ebur128' });
-      const rawTruePeakMetrics = await this.calculateTruePeakMetrics(leftChannel, rightChannel, { 
+      const rawTruePeakMetrics = await profileStage('metrics:true_peak', () => this.calculateTruePeakMetrics(leftChannel, rightChannel, { 
         jobId, 
         tempFilePath: options.tempFilePath 
-      });
+      }));
       assertFinite(rawTruePeakMetrics, 'core_metrics');
-      console.log('[RAW_METRICS] ✅ True Peak (RAW):', rawTruePeakMetrics.maxDbtp);
+      logger.debug(() => ['[RAW_METRICS] ✅ True Peak (RAW):', rawTruePeakMetrics.maxDbtp]);
 
       // 🔍 TAREFA 5: Sanity Check - comparar Sample Peak vs True Peak
       if (samplePeakMetrics && samplePeakMetrics.maxDbfs !== null && rawTruePeakMetrics && rawTruePeakMetrics.maxDbtp !== null) {
@@ -265,13 +293,13 @@ class CoreMetricsProcessor {
         
         // 🔍 TAREFA 6: Se suspeito, rodar FFmpeg fallback
         if (sanityCheck.needsFallback && options.tempFilePath) {
-          console.warn(`[SANITY_CHECK] ⚠️ Sample Peak suspeito - rodando FFmpeg fallback...`);
+          logger.warn(`[SANITY_CHECK] ⚠️ Sample Peak suspeito - rodando FFmpeg fallback...`);
           try {
             const ffmpegResult = await ffmpegSamplePeakFallback(options.tempFilePath);
             
             // Usar valores do FFmpeg se disponíveis
             if (ffmpegResult.samplePeakMaxDb !== null) {
-              console.log(`[FALLBACK] ✅ FFmpeg retornou Sample Peak: ${ffmpegResult.samplePeakMaxDb.toFixed(2)} dBFS`);
+              logger.debug(() => [`[FALLBACK] ✅ FFmpeg retornou Sample Peak: ${ffmpegResult.samplePeakMaxDb.toFixed(2)} dBFS`]);
               
               // Converter valor dB de volta para linear
               const fallbackLinear = Math.pow(10, ffmpegResult.samplePeakMaxDb / 20);
@@ -288,10 +316,10 @@ class CoreMetricsProcessor {
                 _fallbackSource: 'ffmpeg_astats'
               };
               
-              console.log(`[FALLBACK] ✅ Sample Peak corrigido: ${samplePeakMetrics.maxDbfs.toFixed(2)} dBFS`);
+              logger.debug(() => [`[FALLBACK] ✅ Sample Peak corrigido: ${samplePeakMetrics.maxDbfs.toFixed(2)} dBFS`]);
             }
           } catch (fallbackError) {
-            console.error(`[FALLBACK] ❌ Erro ao executar FFmpeg fallback:`, fallbackError.message);
+            logger.error(`[FALLBACK] ❌ Erro ao executar FFmpeg fallback:`, fallbackError.message);
             // Continuar com valor original mesmo que suspeito
           }
         }
@@ -299,13 +327,14 @@ class CoreMetricsProcessor {
 
       // 🎯 CÁLCULO RAW: Dynamic Range (áudio original, precisa do LRA do RAW)
       logAudio('core_metrics', 'raw_dynamics_start', { length: leftChannel.length });
-      const rawDynamicsMetrics = calculateDynamicsMetrics(
+      const rawDynamicsMetrics = profileStage('metrics:dynamics', () => calculateDynamicsMetrics(
         leftChannel, 
         rightChannel, 
         CORE_METRICS_CONFIG.SAMPLE_RATE,
-        rawLufsMetrics.lra // Usar LRA já calculado do RAW
-      );
-      console.log('[RAW_METRICS] ✅ Dynamic Range (RAW):', rawDynamicsMetrics.dynamicRange);
+        rawLufsMetrics.lra, // Usar LRA já calculado do RAW
+        timeDomainStats
+      ));
+      logger.debug(() => ['[RAW_METRICS] ✅ Dynamic Range (RAW):', rawDynamicsMetrics.dynamicRange]);
 
       // ========= 🎯 ETAPA 2: NORMALIZAÇÃO A -23 LUFS (PARA BANDAS/SPECTRAL) =========
       // 🔥 PATCH AUDITORIA: Passar originalLUFS como parâmetro (não recalcular Quick LUFS)
@@ -315,24 +344,29 @@ class CoreMetricsProcessor {
         method: 'FULL_INTEGRATED'
       });
       
-      const normalizationResult = await normalizeAudioToTargetLUFS(
+      const normalizationResult = await profileStage('metrics:normalization', () => normalizeAudioToTargetLUFS(
         { leftChannel, rightChannel },
         CORE_METRICS_CONFIG.SAMPLE_RATE,
         { 
           jobId, 
           targetLUFS: -23.0,
-          originalLUFS: rawLufsMetrics.integrated  // ✅ Passar LUFS integrado REAL
+          originalLUFS: rawLufsMetrics.integrated,  // ✅ Passar LUFS integrado REAL
+          virtual: CORE_METRICS_CONFIG.VIRTUAL_NORMALIZATION
         }
-      );
+      ));
       
-      // Usar canais normalizados APENAS para análises espectrais/bandas
-      const normalizedLeft = normalizationResult.leftChannel;
-      const normalizedRight = normalizationResult.rightChannel;
+      // 🧮 Normalização virtual: nenhuma cópia dos canais — o ganho segue como escalar.
+      // Estéreo (correlação/largura) é invariante à escala → usa RAW; DC offset é linear → recebe o ganho.
+      const isVirtualNormalization = normalizationResult.virtual === true;
+      const normalizedLeft = isVirtualNormalization ? leftChannel : normalizationResult.leftChannel;
+      const normalizedRight = isVirtualNormalization ? rightChannel : normalizationResult.rightChannel;
+      const pendingGainLinear = isVirtualNormalization ? normalizationResult.gainAppliedLinear : 1;
       
       logAudio('core_metrics', 'normalization_completed', { 
         applied: normalizationResult.normalizationApplied,
         originalLUFS: normalizationResult.originalLUFS,
-        gainDB: normalizationResult.gainAppliedDB 
+        gainDB: normalizationResult.gainAppliedDB,
+        virtual: isVirtualNormalization
       });
 
       // ========= 🎯 ETAPA 3: MÉTRICAS NORM (CÁLCULO ALGÉBRICO - SEM RECALCULAR) =========
@@ -368,17 +402,17 @@ class CoreMetricsProcessor {
         lra: rawLufsMetrics.lra
       };
       
-      console.log('[NORM_FREQ] 🧮 Métricas normalizadas (algébrico - Δ=0 vs recálculo):', {
+      logger.debug(() => ['[NORM_FREQ] 🧮 Métricas normalizadas (algébrico - Δ=0 vs recálculo):', {
         lufsIntegrated: normLufsMetrics.integrated,
         truePeakDbtp: normTruePeakMetrics.maxDbtp,
         dynamicRange: normDynamicsMetrics.dynamicRange,
         gainAppliedDB: gainAppliedDB,
         method: 'ALGEBRAIC_IDENTITY'
-      });
+      }]);
 
       // ========= CÁLCULO DE MÉTRICAS FFT CORRIGIDAS =========
       logAudio('core_metrics', 'fft_start', { frames: segmentedAudio.framesFFT?.count });
-      const fftResults = await this.calculateFFTMetrics(segmentedAudio.framesFFT, { jobId });
+      const fftResults = await profileStage('metrics:fft', () => this.calculateFFTMetrics(segmentedAudio.framesFFT, { jobId }));
       assertFinite(fftResults, 'core_metrics');
 
       // ========= 🚀 OTIMIZAÇÃO: MÉTRICAS ESPECTRAIS EM PARALELO =========
@@ -392,47 +426,65 @@ class CoreMetricsProcessor {
       
       const parallelSpectralStartTime = Date.now();
       
+      // ⚡ Espectrograma analisado em lote UMA vez: bandas, centróide, rolloff e flatness por frame
+      let spectralBatch = null;
+      if (CORE_METRICS_CONFIG.SPECTRAL_BATCH && segmentedAudio.framesFFT?.count > 0) {
+        try {
+          spectralBatch = profileStage('metrics:spectral_batch', () => this.spectralBatchAnalyzer.analyzeFrames(segmentedAudio.framesFFT, { jobId }));
+        } catch (error) {
+          logAudio('spectral_batch', 'fallback_per_frame', { error: error.message, jobId });
+        }
+      }
+      
       const [spectralBandsResults, spectralCentroidResults, stereoMetrics] = await Promise.all([
         // 🎵 BANDAS ESPECTRAIS (7 BANDAS) - BUFFER NORMALIZADO
-        this.calculateSpectralBandsMetrics(segmentedAudio.framesFFT, { jobId }),
+        profileStage('metrics:spectral_bands', () => this.calculateSpectralBandsMetrics(segmentedAudio.framesFFT, { jobId, spectralBatch })),
         
         // 🎵 SPECTRAL CENTROID (Hz) - BUFFER NORMALIZADO  
-        this.calculateSpectralCentroidMetrics(segmentedAudio.framesFFT, { jobId }),
+        profileStage('metrics:spectral_centroid', () => this.calculateSpectralCentroidMetrics(segmentedAudio.framesFFT, { jobId, spectralBatch })),
         
         // 🎵 ANÁLISE ESTÉREO - BUFFER NORMALIZADO
-        this.calculateStereoMetricsCorrect(normalizedLeft, normalizedRight, { jobId })
+        profileStage('metrics:stereo', () => this.calculateStereoMetricsCorrect(normalizedLeft, normalizedRight, {
+          jobId,
+          timeDomainStats: isVirtualNormalization ? timeDomainStats : null
+        }))
       ]);
       
-      console.log(`[PERF] 🚀 Métricas espectrais paralelas concluídas em ${Date.now() - parallelSpectralStartTime}ms`);
+      logger.debug(() => [`[PERF] 🚀 Métricas espectrais paralelas concluídas em ${Date.now() - parallelSpectralStartTime}ms`]);
+      
+      // 🎚️ Perfil de análise: trechos sinalizados pela passada rápida, re-analisados em hop fino
+      const analysisProfileMetrics = this.summarizeRefinedSegments(segmentedAudio.analysisProfile, { jobId });
       assertFinite(stereoMetrics, 'core_metrics');
       // ========= MONTAGEM DE RESULTADO CORRIGIDO =========
       // 🎯 LOG CRÍTICO: Confirmar que valores RAW serão usados
-      console.log('[RAW_METRICS] ═══════════════════════════════════════════════════════════════');
-      console.log('[RAW_METRICS] 📊 VALORES RAW (que serão salvos em technicalData):');
-      console.log('[RAW_METRICS]   - lufsIntegrated:', rawLufsMetrics.integrated, 'LUFS');
-      console.log('[RAW_METRICS]   - truePeakDbtp:', rawTruePeakMetrics.maxDbtp, 'dBTP');
-      console.log('[RAW_METRICS]   - dynamicRange:', rawDynamicsMetrics.dynamicRange, 'dB');
-      console.log('[RAW_METRICS]   - lra:', rawLufsMetrics.lra, 'LU');
-      console.log('[RAW_METRICS] ═══════════════════════════════════════════════════════════════');
+      logger.debug('[RAW_METRICS] ═══════════════════════════════════════════════════════════════');
+      logger.debug('[RAW_METRICS] 📊 VALORES RAW (que serão salvos em technicalData):');
+      logger.debug(() => ['[RAW_METRICS]   - lufsIntegrated:', rawLufsMetrics.integrated, 'LUFS']);
+      logger.debug(() => ['[RAW_METRICS]   - truePeakDbtp:', rawTruePeakMetrics.maxDbtp, 'dBTP']);
+      logger.debug(() => ['[RAW_METRICS]   - dynamicRange:', rawDynamicsMetrics.dynamicRange, 'dB']);
+      logger.debug(() => ['[RAW_METRICS]   - lra:', rawLufsMetrics.lra, 'LU']);
+      logger.debug('[RAW_METRICS] ═══════════════════════════════════════════════════════════════');
       
-      console.log('[NORM_FREQ] ═══════════════════════════════════════════════════════════════');
-      console.log('[NORM_FREQ] 🔊 BANDAS ESPECTRAIS (calculadas no buffer normalizado):');
-      console.log('[NORM_FREQ]   - bands present:', !!spectralBandsResults);
-      console.log('[NORM_FREQ]   - spectral_balance keys:', spectralBandsResults ? Object.keys(spectralBandsResults) : []);
-      console.log('[NORM_FREQ] ═══════════════════════════════════════════════════════════════');
+      logger.debug('[NORM_FREQ] ═══════════════════════════════════════════════════════════════');
+      logger.debug('[NORM_FREQ] 🔊 BANDAS ESPECTRAIS (calculadas no buffer normalizado):');
+      logger.debug(() => ['[NORM_FREQ]   - bands present:', !!spectralBandsResults]);
+      logger.debug(() => ['[NORM_FREQ]   - spectral_balance keys:', spectralBandsResults ? Object.keys(spectralBandsResults) : []]);
+      logger.debug('[NORM_FREQ] ═══════════════════════════════════════════════════════════════');
 
       // ========= ANÁLISE AUXILIAR - VERSÃO SIMPLIFICADA SEM CLASSES =========
       // 🚨 IMPORTANTE: Usando apenas funções standalone para evitar erros de classe
 
-      console.log('[PIPELINE] Iniciando análise de métricas auxiliares (standalone functions)');
+      logger.debug('[PIPELINE] Iniciando análise de métricas auxiliares (standalone functions)');
       
       // DC Offset - FUNÇÃO STANDALONE SIMPLES
       let dcOffsetMetrics = null;
       try {
-        dcOffsetMetrics = calculateDCOffset(normalizedLeft, normalizedRight);
-        console.log('[SUCCESS] DC Offset calculado via função standalone');
+        dcOffsetMetrics = isVirtualNormalization
+          ? calculateDCOffsetFromStats(timeDomainStats, pendingGainLinear)
+          : calculateDCOffset(normalizedLeft, normalizedRight, pendingGainLinear);
+        logger.debug('[SUCCESS] DC Offset calculado via função standalone');
       } catch (error) {
-        console.log('[SKIP_METRIC] dcOffset: erro na função standalone -', error.message);
+        logger.debug(() => ['[SKIP_METRIC] dcOffset: erro na função standalone -', error.message]);
         dcOffsetMetrics = null;
       }
       
@@ -441,29 +493,29 @@ class CoreMetricsProcessor {
       try {
         if (fftResults.magnitudeSpectrum && fftResults.magnitudeSpectrum.length > 0) {
           const spectrum = fftResults.magnitudeSpectrum[0];
-          console.log('[DEBUG_DOMINANT] Espectro recebido:', {
+          logger.debug(() => ['[DEBUG_DOMINANT] Espectro recebido:', {
             length: spectrum.length,
             maxValue: Math.max(...spectrum),
             avgValue: spectrum.reduce((sum, val) => sum + val, 0) / spectrum.length,
             first5: spectrum.slice(0, 5),
             nonZeroCount: spectrum.filter(v => v > 0.001).length
-          });
+          }]);
           
           dominantFreqMetrics = calculateDominantFrequencies(
             fftResults.magnitudeSpectrum[0], // Usar primeiro frame
             CORE_METRICS_CONFIG.SAMPLE_RATE,
             CORE_METRICS_CONFIG.FFT_SIZE
           );
-          console.log('[DEBUG_DOMINANT] Resultado da função:', dominantFreqMetrics);
-          console.log('[SUCCESS] Dominant Frequencies calculado via função standalone');
+          logger.debug(() => ['[DEBUG_DOMINANT] Resultado da função:', dominantFreqMetrics]);
+          logger.debug('[SUCCESS] Dominant Frequencies calculado via função standalone');
         } else {
-          console.log('[DEBUG_DOMINANT] FFT spectrum não disponível:', {
+          logger.debug(() => ['[DEBUG_DOMINANT] FFT spectrum não disponível:', {
             hasSpectrum: !!fftResults.magnitudeSpectrum,
             spectrumLength: fftResults.magnitudeSpectrum?.length || 0
-          });
+          }]);
         }
       } catch (error) {
-        console.log('[SKIP_METRIC] dominantFrequencies: erro na função standalone -', error.message);
+        logger.debug(() => ['[SKIP_METRIC] dominantFrequencies: erro na função standalone -', error.message]);
         dominantFreqMetrics = null;
       }
       
@@ -472,15 +524,15 @@ class CoreMetricsProcessor {
       let spectralUniformityMetrics = null;
       try {
         // 🔍 DEBUG CRÍTICO: Verificar se magnitudeSpectrum existe e tem dados
-        console.log('[UNIFORMITY_PIPELINE] 🔍 PRÉ-CHECK magnitudeSpectrum:', {
+        logger.debug(() => ['[UNIFORMITY_PIPELINE] 🔍 PRÉ-CHECK magnitudeSpectrum:', {
           hasFftResults: !!fftResults,
           hasMagnitudeSpectrum: !!fftResults?.magnitudeSpectrum,
           magnitudeSpectrumLength: fftResults?.magnitudeSpectrum?.length || 0,
           firstFrameLength: fftResults?.magnitudeSpectrum?.[0]?.length || 0
-        });
+        }]);
         
         if (fftResults.magnitudeSpectrum && fftResults.magnitudeSpectrum.length > 0) {
-          console.log('[UNIFORMITY_PIPELINE] ✅ ENTRANDO no bloco de cálculo de uniformidade');
+          logger.debug('[UNIFORMITY_PIPELINE] ✅ ENTRANDO no bloco de cálculo de uniformidade');
           
           const binCount = fftResults.magnitudeSpectrum[0].length;
           const frequencyBins = Array.from({length: binCount}, (_, i) => 
@@ -540,7 +592,7 @@ class CoreMetricsProcessor {
                 
                 // 🔍 DEBUG: Log do primeiro frame para diagnóstico
                 if (frameIdx === 0) {
-                  console.log('[UNIFORMITY_PIPELINE] 🔍 Primeiro frame analisado:', {
+                  logger.debug(() => ['[UNIFORMITY_PIPELINE] 🔍 Primeiro frame analisado:', {
                     coefficient: frameResult.uniformity.coefficient,
                     standardDeviation: frameResult.uniformity.standardDeviation,
                     variance: frameResult.uniformity.variance,
@@ -548,7 +600,7 @@ class CoreMetricsProcessor {
                     hasRealVariation,
                     isRealAnalysis,
                     rating: frameResult.rating
-                  });
+                  }]);
                 }
                 
                 if (isRealAnalysis) {
@@ -561,11 +613,11 @@ class CoreMetricsProcessor {
                 framesWithInsufficientBands++;
                 // 🔍 DEBUG: Log do primeiro frame que falhou
                 if (frameIdx === 0) {
-                  console.log('[UNIFORMITY_PIPELINE] ⚠️ Primeiro frame INVÁLIDO:', {
+                  logger.debug(() => ['[UNIFORMITY_PIPELINE] ⚠️ Primeiro frame INVÁLIDO:', {
                     hasFrameResult: !!frameResult,
                     hasUniformity: !!frameResult?.uniformity,
                     coefficient: frameResult?.uniformity?.coefficient
-                  });
+                  }]);
                 }
               }
             } catch (frameError) {
@@ -574,14 +626,14 @@ class CoreMetricsProcessor {
             }
           }
           
-          console.log('[UNIFORMITY_PIPELINE] 📊 Frames processados:', {
+          logger.debug(() => ['[UNIFORMITY_PIPELINE] 📊 Frames processados:', {
             totalFrames: fftResults.magnitudeSpectrum.length,
             processedFrames: maxFramesToProcess,
             framesWithValidCoefficient,
             framesWithInsufficientBands,
             validCoefficients: uniformityCoefficients.length,
             sampleCoeffs: uniformityCoefficients.slice(0, 5).map(c => c.toFixed(3))
-          });
+          }]);
           
           // 🔧 CORREÇÃO: Agregar usando MEDIANA dos coeficientes válidos
           if (uniformityCoefficients.length > 0) {
@@ -621,16 +673,16 @@ class CoreMetricsProcessor {
             };
             
             // 🎯 LOG FORMATO SOLICITADO: [UNIFORMITY_PIPELINE] frames=XXX medianCV=0.34 percent=65.2
-            console.log(`[UNIFORMITY_PIPELINE] ✅ frames=${uniformityCoefficients.length} medianCV=${medianCoefficient.toFixed(3)} percent=${uniformityPercent.toFixed(1)}`);
-            console.log('[UNIFORMITY_PIPELINE] ✅ Resultado agregado:', {
+            logger.debug(() => [`[UNIFORMITY_PIPELINE] ✅ frames=${uniformityCoefficients.length} medianCV=${medianCoefficient.toFixed(3)} percent=${uniformityPercent.toFixed(1)}`]);
+            logger.debug(() => ['[UNIFORMITY_PIPELINE] ✅ Resultado agregado:', {
               medianCoefficient,
               uniformityPercent,
               rating: spectralUniformityMetrics.rating,
               validFrames: uniformityCoefficients.length,
               framesWithInsufficientBands
-            });
+            }]);
           } else {
-            console.log('[UNIFORMITY_PIPELINE] ⚠️ ERRO: Nenhum coeficiente válido encontrado!', {
+            logger.debug(() => ['[UNIFORMITY_PIPELINE] ⚠️ ERRO: Nenhum coeficiente válido encontrado!', {
               totalFrames: fftResults.magnitudeSpectrum.length,
               processedFrames: maxFramesToProcess,
               framesWithValidCoefficient,
@@ -638,16 +690,16 @@ class CoreMetricsProcessor {
               reason: framesWithInsufficientBands > 0 
                 ? 'Maioria dos frames tem menos de 3 bandas com energia > -100dB (threshold atual)' 
                 : 'Frames FFT podem estar corrompidos ou zerados'
-            });
+            }]);
             spectralUniformityMetrics = null;
           }
           
-          console.log('[UNIFORMITY_PIPELINE] Spectral Uniformity calculado via agregação de frames');
+          logger.debug('[UNIFORMITY_PIPELINE] Spectral Uniformity calculado via agregação de frames');
         } else {
-          console.log('[UNIFORMITY_PIPELINE] ❌ FFT spectrum não disponível - magnitudeSpectrum vazio ou null');
+          logger.debug('[UNIFORMITY_PIPELINE] ❌ FFT spectrum não disponível - magnitudeSpectrum vazio ou null');
         }
       } catch (error) {
-        console.log('[UNIFORMITY_PIPELINE] ❌ ERRO na função standalone:', error.message);
+        logger.debug(() => ['[UNIFORMITY_PIPELINE] ❌ ERRO na função standalone:', error.message]);
         spectralUniformityMetrics = null;
       }
 
@@ -684,16 +736,16 @@ class CoreMetricsProcessor {
         dynamics: rawDynamicsMetrics,
         
         rms: (() => {
-          console.log(`[DEBUG CORE] Chamando processRMSMetrics com segmentedAudio.framesRMS:`, {
+          logger.debug(() => [`[DEBUG CORE] Chamando processRMSMetrics com segmentedAudio.framesRMS:`, {
             hasFramesRMS: !!segmentedAudio.framesRMS,
             hasLeft: !!segmentedAudio.framesRMS?.left,
             hasRight: !!segmentedAudio.framesRMS?.right,
             leftLength: segmentedAudio.framesRMS?.left?.length,
             rightLength: segmentedAudio.framesRMS?.right?.length,
             count: segmentedAudio.framesRMS?.count
-          });
+          }]);
           const result = this.processRMSMetrics(segmentedAudio.framesRMS);
-          console.log(`[DEBUG CORE] processRMSMetrics retornou:`, result);
+          logger.debug(() => [`[DEBUG CORE] processRMSMetrics retornou:`, result]);
           return result;
         })(), // ✅ NOVO: Processar métricas RMS
         
@@ -704,6 +756,7 @@ class CoreMetricsProcessor {
         bpm: bmpMetrics.bpm, // ✅ NOVO: Beats Per Minute
         bpmConfidence: bmpMetrics.bpmConfidence, // ✅ CORREÇÃO: BPM Confidence
         bpmSource: bmpMetrics.bpmSource, // ✅ NOVO: Fonte do cálculo BPM
+        analysisProfile: analysisProfileMetrics, // 🎚️ Perfil (fast/detailed) + trechos refinados
         
         // 🎯 OPCIONAL: Adicionar valores NORM para debug (não usado pela UI)
         _norm: {
@@ -720,6 +773,7 @@ class CoreMetricsProcessor {
           targetLUFS: normalizationResult.targetLUFS,
           gainAppliedDB: normalizationResult.gainAppliedDB,
           gainAppliedLinear: normalizationResult.gainAppliedLinear,
+          virtual: isVirtualNormalization,
           isSilence: normalizationResult.isSilence,
           hasClipping: normalizationResult.hasClipping,
           processingTime: normalizationResult.processingTime
@@ -736,13 +790,13 @@ class CoreMetricsProcessor {
       };
       
       // 🎯 LOG OBRIGATÓRIO: Confirmar atribuição de spectralUniformity ao objeto coreMetrics
-      console.log('[UNIFORMITY_PIPELINE] 📦 coreMetrics.spectralUniformity ATRIBUÍDO:', {
+      logger.debug(() => ['[UNIFORMITY_PIPELINE] 📦 coreMetrics.spectralUniformity ATRIBUÍDO:', {
         hasSpectralUniformity: !!coreMetrics.spectralUniformity,
         uniformityPercent: coreMetrics.spectralUniformity?.uniformityPercent,
         coefficient: coreMetrics.spectralUniformity?.uniformity?.coefficient,
         rating: coreMetrics.spectralUniformity?.rating,
         validFrames: coreMetrics.spectralUniformity?.aggregation?.validFrames
-      });
+      }]);
 
       // ========= ANÁLISE DE PROBLEMAS E SUGESTÕES V2 =========
       // Sistema educativo com criticidade por cores
@@ -771,7 +825,7 @@ class CoreMetricsProcessor {
       
       if (!DISABLE_SUGGESTIONS) {
         try {
-          if (DEBUG_AUDIO) {
+          if (logger.traceEnabled) {
             process.stderr.write("\n\n🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥\n");
             process.stderr.write("[AUDIT-STDERR] ENTRANDO NO BLOCO DE SUGESTÕES\n");
             process.stderr.write("[AUDIT-STDERR] Timestamp: " + new Date().toISOString() + "\n");
@@ -782,14 +836,14 @@ class CoreMetricsProcessor {
           const detectedGenre = options.genre || options.data?.genre || options.reference?.genre || null;
           const mode = options.mode || 'genre';
           
-          if (DEBUG_AUDIO) {
+          if (logger.traceEnabled) {
             process.stderr.write("[AUDIT-STDERR] detectedGenre: " + detectedGenre + "\n");
             process.stderr.write("[AUDIT-STDERR] mode: " + mode + "\n");
           }
 
           // 🚨 Se modo genre → gênero É obrigatório
           if (mode === 'genre' && (!detectedGenre || detectedGenre === 'default')) {
-            console.error('[CORE-METRICS-ERROR] Genre ausente ou default em modo genre:', {
+            logger.error('[CORE-METRICS-ERROR] Genre ausente ou default em modo genre:', {
               optionsGenre: options.genre,
               dataGenre: options.data?.genre,
               referenceGenre: options.reference?.genre,
@@ -799,24 +853,24 @@ class CoreMetricsProcessor {
           }
 
           // 🚨 LOG DE AUDITORIA
-          console.log('[AUDIT-CORE-METRICS] Genre detectado:', {
+          logger.debug(() => ['[AUDIT-CORE-METRICS] Genre detectado:', {
             detectedGenre,
             mode,
             optionsGenre: options.genre,
             hasGenreTargets: !!options.genreTargets
-          });
+          }]);
           
-          console.log("[SUGGESTIONS] Ativas (V2 rodando normalmente).");
+          logger.debug("[SUGGESTIONS] Ativas (V2 rodando normalmente).");
           
           // � VERIFICAR analysisType para decidir se chama Suggestion Engine
           const analysisType = options.analysisType || options.mode || 'genre';
           const referenceStage = options.referenceStage || null;
           
-          console.log('[CORE_METRICS] 🔍 Tipo de análise:', {
+          logger.debug(() => ['[CORE_METRICS] 🔍 Tipo de análise:', {
             analysisType,
             referenceStage,
             skipSuggestions: analysisType === 'reference' && referenceStage === 'base'
-          });
+          }]);
           
           // 🎯 CORREÇÃO DEFINITIVA: CARREGAR TARGETS DO WORKER (SEGURO)
           // REGRA 6: Fallback SÓ acontece se customTargets === undefined
@@ -829,23 +883,23 @@ class CoreMetricsProcessor {
               customTargets = await loadGenreTargetsFromWorker(detectedGenre);
               
               // 🔧 NORMALIZAR TARGETS: Converter formato JSON real → formato analyzer
-              console.log('[CORE_METRICS] 🔍 Formato original dos targets:', {
+              logger.debug(() => ['[CORE_METRICS] 🔍 Formato original dos targets:', {
                 hasLufsTarget: 'lufs_target' in (customTargets || {}),
                 hasLufsObject: customTargets && customTargets.lufs && 'target' in customTargets.lufs
-              });
+              }]);
               
               customTargets = normalizeGenreTargets(customTargets);
               
-              console.log(`[CORE_METRICS] ✅ Targets oficiais carregados e normalizados de work/refs/out/${detectedGenre}.json`);
-              console.log(`[CORE_METRICS] 📊 LUFS: ${customTargets.lufs && customTargets.lufs.target}, TruePeak: ${customTargets.truePeak && customTargets.truePeak.target}, DR: ${customTargets.dr && customTargets.dr.target}`);
+              logger.debug(() => [`[CORE_METRICS] ✅ Targets oficiais carregados e normalizados de work/refs/out/${detectedGenre}.json`]);
+              logger.debug(() => [`[CORE_METRICS] 📊 LUFS: ${customTargets.lufs && customTargets.lufs.target}, TruePeak: ${customTargets.truePeak && customTargets.truePeak.target}, DR: ${customTargets.dr && customTargets.dr.target}`]);
             } catch (error) {
               // REGRA 6: Quando genreTargets === undefined, lançar erro explícito
               const errorMsg = `[CORE_METRICS-ERROR] Falha ao carregar targets para "${detectedGenre}": ${error.message}`;
-              console.error(errorMsg);
+              logger.error(errorMsg);
               throw new Error(errorMsg);
             }
           } else if (mode === 'reference') {
-            console.log(`[CORE_METRICS] 🔒 Modo referência - ignorando targets de gênero`);
+            logger.debug(`[CORE_METRICS] 🔒 Modo referência - ignorando targets de gênero`);
           }
           
           // 🔥 CONSTRUIR consolidatedData para passar ao analyzer
@@ -895,53 +949,53 @@ class CoreMetricsProcessor {
           };            
           
           // 🔥 LOG CRÍTICO: AUDITORIA COMPLETA DE consolidatedData.metrics.bands
-          console.log('[CORE-METRICS] ═══════════════════════════════════════════════════════════════');
-          console.log('[CORE-METRICS] 🔍 AUDITORIA: consolidatedData.metrics.bands MONTADO');
-          console.log('[CORE-METRICS] ═══════════════════════════════════════════════════════════════');
-          console.log('[CORE-METRICS] coreMetrics.spectralBands (FONTE):');
-          console.log('[CORE-METRICS] - sub.energy_db:', coreMetrics.spectralBands?.sub?.energy_db);
-          console.log('[CORE-METRICS] - sub.percentage:', coreMetrics.spectralBands?.sub?.percentage);
-          console.log('[CORE-METRICS] - bass.energy_db:', coreMetrics.spectralBands?.bass?.energy_db);
-          console.log('[CORE-METRICS] - bass.percentage:', coreMetrics.spectralBands?.bass?.percentage);
-          console.log('[CORE-METRICS]');
-          console.log('[CORE-METRICS] consolidatedData.metrics.bands (DESTINO):');
-          console.log('[CORE-METRICS] - sub.value:', consolidatedData.metrics.bands.sub.value);
-          console.log('[CORE-METRICS] - sub.unit:', consolidatedData.metrics.bands.sub.unit);
-          console.log('[CORE-METRICS] - bass.value:', consolidatedData.metrics.bands.bass.value);
-          console.log('[CORE-METRICS] - bass.unit:', consolidatedData.metrics.bands.bass.unit);
-          console.log('[CORE-METRICS] ═══════════════════════════════════════════════════════════════');
+          logger.debug('[CORE-METRICS] ═══════════════════════════════════════════════════════════════');
+          logger.debug('[CORE-METRICS] 🔍 AUDITORIA: consolidatedData.metrics.bands MONTADO');
+          logger.debug('[CORE-METRICS] ═══════════════════════════════════════════════════════════════');
+          logger.debug('[CORE-METRICS] coreMetrics.spectralBands (FONTE):');
+          logger.debug(() => ['[CORE-METRICS] - sub.energy_db:', coreMetrics.spectralBands?.sub?.energy_db]);
+          logger.debug(() => ['[CORE-METRICS] - sub.percentage:', coreMetrics.spectralBands?.sub?.percentage]);
+          logger.debug(() => ['[CORE-METRICS] - bass.energy_db:', coreMetrics.spectralBands?.bass?.energy_db]);
+          logger.debug(() => ['[CORE-METRICS] - bass.percentage:', coreMetrics.spectralBands?.bass?.percentage]);
+          logger.debug('[CORE-METRICS]');
+          logger.debug('[CORE-METRICS] consolidatedData.metrics.bands (DESTINO):');
+          logger.debug(() => ['[CORE-METRICS] - sub.value:', consolidatedData.metrics.bands.sub.value]);
+          logger.debug(() => ['[CORE-METRICS] - sub.unit:', consolidatedData.metrics.bands.sub.unit]);
+          logger.debug(() => ['[CORE-METRICS] - bass.value:', consolidatedData.metrics.bands.bass.value]);
+          logger.debug(() => ['[CORE-METRICS] - bass.unit:', consolidatedData.metrics.bands.bass.unit]);
+          logger.debug('[CORE-METRICS] ═══════════════════════════════════════════════════════════════');
           
           // REGRA 9: Logs de auditoria mostrando consolidatedData
-          console.log('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
-          console.log('[AUDIT-CORRECTION] 📊 CONSOLIDATED DATA (core-metrics.js)');
-          console.log('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
-          console.log('[AUDIT-CORRECTION] consolidatedData.metrics:', JSON.stringify({
+          logger.debug('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
+          logger.debug('[AUDIT-CORRECTION] 📊 CONSOLIDATED DATA (core-metrics.js)');
+          logger.debug('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
+          logger.debug(() => ['[AUDIT-CORRECTION] consolidatedData.metrics:', JSON.stringify({
             loudness: consolidatedData.metrics.loudness,
             truePeak: consolidatedData.metrics.truePeak,
             dr: consolidatedData.metrics.dr,
             stereo: consolidatedData.metrics.stereo,
             bandsCount: Object.keys(consolidatedData.metrics.bands).length
-          }, null, 2));
-          console.log('[AUDIT-CORRECTION] consolidatedData.genreTargets:', JSON.stringify({
+          }, null, 2)]);
+          logger.debug(() => ['[AUDIT-CORRECTION] consolidatedData.genreTargets:', JSON.stringify({
             lufs: consolidatedData.genreTargets.lufs,
             truePeak: consolidatedData.genreTargets.truePeak,
             dr: consolidatedData.genreTargets.dr,
             stereo: consolidatedData.genreTargets.stereo,
             hasBands: !!consolidatedData.genreTargets.bands
-          }, null, 2));
-          console.log('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
+          }, null, 2)]);
+          logger.debug('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
           
-          console.log('[CORE_METRICS] 🎯 consolidatedData construído:', {
+          logger.debug(() => ['[CORE_METRICS] 🎯 consolidatedData construído:', {
               hasMetrics: !!consolidatedData.metrics,
               hasGenreTargets: !!consolidatedData.genreTargets,
               lufsValue: consolidatedData.metrics.loudness.value,
               lufsTarget: consolidatedData.genreTargets.lufs && consolidatedData.genreTargets.lufs.target
-            });
+            }]);
           }
           
           // 🆕 SKIP SUGGESTION ENGINE para TODO reference mode (base e compare)
           if (analysisType === 'reference') {
-            console.log('[CORE_METRICS] ⏭️ SKIP: Suggestion Engine não executado para analysisType=reference');
+            logger.debug('[CORE_METRICS] ⏭️ SKIP: Suggestion Engine não executado para analysisType=reference');
             problemsAnalysis = {
               suggestions: [],
               problems: [],
@@ -955,7 +1009,7 @@ class CoreMetricsProcessor {
             };
           } else {
             // Executar Suggestion Engine normalmente
-            if (DEBUG_AUDIO) {
+            if (logger.traceEnabled) {
               process.stderr.write("\n\n");
               process.stderr.write("╔════════════════════════════════════════════════════════════════╗\n");
               process.stderr.write("║  🚀🚀🚀 CORE-METRICS: CHAMANDO SUGGESTION ENGINE 🚀🚀🚀     ║\n");
@@ -972,12 +1026,12 @@ class CoreMetricsProcessor {
             
             // 🆕 STREAMING MODE: Passar soundDestination para o analyzer
             const soundDestinationCM = options.soundDestination || 'pista';
-            problemsAnalysis = analyzeProblemsAndSuggestionsV2(coreMetrics, detectedGenre, customTargets, { 
+            problemsAnalysis = profileStage('metrics:problems', () => analyzeProblemsAndSuggestionsV2(coreMetrics, detectedGenre, customTargets, { 
               data: consolidatedData,
               soundDestination: soundDestinationCM
-            });
+            }));
             
-            if (DEBUG_AUDIO) {
+            if (logger.traceEnabled) {
               process.stderr.write("\n\n");
               process.stderr.write("╔════════════════════════════════════════════════════════════════╗\n");
               process.stderr.write("║  ✅✅✅ CORE-METRICS: RETORNO DO SUGGESTION ENGINE ✅✅✅     ║\n");
@@ -1004,7 +1058,7 @@ class CoreMetricsProcessor {
           // Manter estrutura padrão definida acima
         }
       } else {
-        console.log("[SUGGESTIONS] Desativadas via flag de ambiente.");
+        logger.debug("[SUGGESTIONS] Desativadas via flag de ambiente.");
         problemsAnalysis = null; // garante consistência no JSON
       }
       
@@ -1016,13 +1070,13 @@ class CoreMetricsProcessor {
       coreMetrics.suggestionMetadata = problemsAnalysis?.metadata || {};
 
       // 📊 LOG DE AUDITORIA: Confirmar geração de sugestões
-      console.log('[AI-AUDIT][SUGGESTIONS_STATUS] ✅ Sugestões V2 integradas:', {
+      logger.debug(() => ['[AI-AUDIT][SUGGESTIONS_STATUS] ✅ Sugestões V2 integradas:', {
         problems: coreMetrics.problems.length,
         baseSuggestions: coreMetrics.suggestions.length,
         hasQualityAssessment: !!Object.keys(coreMetrics.qualityAssessment).length,
         hasPriorityRecommendations: coreMetrics.priorityRecommendations.length,
         hasMetadata: !!Object.keys(coreMetrics.suggestionMetadata).length
-      });
+      }]);
 
       // ========= VALIDAÇÃO FINAL =========
       try {
@@ -1045,7 +1099,7 @@ class CoreMetricsProcessor {
       const totalTime = Date.now() - startTime;
       
       // 🎯 LOG DE DEBUG: Verificar estrutura antes do return
-      console.log('[CORE-METRICS-RETURN] ✅ Estrutura final:', {
+      logger.debug(() => ['[CORE-METRICS-RETURN] ✅ Estrutura final:', {
         hasLufs: !!coreMetrics.lufs,
         hasTruePeak: !!coreMetrics.truePeak,
         hasDynamics: !!coreMetrics.dynamics,
@@ -1053,18 +1107,18 @@ class CoreMetricsProcessor {
         lufsIntegrated: coreMetrics.lufs?.integrated,
         truePeakDbtp: coreMetrics.truePeak?.maxDbtp,
         dynamicRange: coreMetrics.dynamics?.dynamicRange
-      });
+      }]);
       
       // 📊 LOG CRÍTICO: Confirmar Sample Peak antes do return
       if (coreMetrics.samplePeak) {
-        console.log('[CORE-METRICS] ✅ CONFIRMAÇÃO FINAL - Sample Peak no objeto de retorno:', {
+        logger.debug(() => ['[CORE-METRICS] ✅ CONFIRMAÇÃO FINAL - Sample Peak no objeto de retorno:', {
           maxDbfs: coreMetrics.samplePeak.maxDbfs,
           leftDbfs: coreMetrics.samplePeak.leftDbfs,
           rightDbfs: coreMetrics.samplePeak.rightDbfs,
           hasValidValues: coreMetrics.samplePeak.maxDbfs !== null && coreMetrics.samplePeak.maxDbfs !== undefined
-        });
+        }]);
       } else {
-        console.warn('[CORE-METRICS] ⚠️ Sample Peak NULL no objeto final - coreMetrics.samplePeak não existe');
+        logger.warn('[CORE-METRICS] ⚠️ Sample Peak NULL no objeto final - coreMetrics.samplePeak não existe');
       }
       
       logAudio('core_metrics', 'completed', { 
@@ -1104,7 +1158,7 @@ class CoreMetricsProcessor {
     const requiredFields = ['framesFFT', 'framesRMS', 'originalChannels', 'timestamps'];
 
     // 🔍 DEBUG: Log do objeto recebido
-    console.log('🔍 [DEBUG VALIDATION] Objeto recebido na validação:', {
+    logger.debug(() => ['🔍 [DEBUG VALIDATION] Objeto recebido na validação:', {
       hasFramesFFT: !!segmentedAudio.framesFFT,
       hasFramesRMS: !!segmentedAudio.framesRMS,
       hasOriginalChannels: !!segmentedAudio.originalChannels,
@@ -1112,11 +1166,11 @@ class CoreMetricsProcessor {
       originalChannelsValue: segmentedAudio.originalChannels,
       allKeys: Object.keys(segmentedAudio),
       typeof_originalChannels: typeof segmentedAudio.originalChannels
-    });
+    }]);
 
     for (const field of requiredFields) {
       if (!segmentedAudio[field]) {
-        console.error(`❌ [VALIDATION ERROR] Campo ausente: ${field}`, {
+        logger.error(`❌ [VALIDATION ERROR] Campo ausente: ${field}`, {
           fieldValue: segmentedAudio[field],
           fieldType: typeof segmentedAudio[field],
           objectKeys: Object.keys(segmentedAudio)
@@ -1344,7 +1398,7 @@ class CoreMetricsProcessor {
       });
       
       // 🔥 DEBUG CRITICAL: Log completo das métricas espectrais agregadas
-      console.log("[AUDIT] Spectral aggregated result:", {
+      logger.debug(() => ["[AUDIT] Spectral aggregated result:", {
         spectralCentroidHz: finalSpectral.spectralCentroidHz,
         spectralRolloffHz: finalSpectral.spectralRolloffHz,
         spectralBandwidthHz: finalSpectral.spectralBandwidthHz,
@@ -1353,15 +1407,15 @@ class CoreMetricsProcessor {
         spectralSkewness: finalSpectral.spectralSkewness,
         spectralKurtosis: finalSpectral.spectralKurtosis,
         framesProcessed: metricsArray.length
-      });
+      }]);
       
       // 🔥 DEBUG CRITICAL: Log da estrutura aggregated criada
-      console.log("[AUDIT] FFT aggregated structure created:", {
+      logger.debug(() => ["[AUDIT] FFT aggregated structure created:", {
         hasAggregated: !!fftResults.aggregated,
         aggregatedKeys: Object.keys(fftResults.aggregated || {}),
         spectralCentroidHz: fftResults.aggregated?.spectralCentroidHz,
         spectralRolloffHz: fftResults.aggregated?.spectralRolloffHz
-      });
+      }]);
       
       // Verificação final
       if (fftResults.processedFrames === 0) {
@@ -1374,11 +1428,11 @@ class CoreMetricsProcessor {
       });
 
       // 🔍 DEBUG CRÍTICO: Confirmar que magnitudeSpectrum foi populado
-      console.log('[UNIFORMITY_V2] 🔍 FFT Results após processamento:', {
+      logger.debug(() => ['[UNIFORMITY_V2] 🔍 FFT Results após processamento:', {
         magnitudeSpectrumLength: fftResults.magnitudeSpectrum?.length || 0,
         firstMagnitudeLength: fftResults.magnitudeSpectrum?.[0]?.length || 0,
         processedFrames: fftResults.processedFrames
-      });
+      }]);
 
       return fftResults;
 
@@ -1562,20 +1616,33 @@ class CoreMetricsProcessor {
    * 🌈 Calcular bandas espectrais corrigidas (7 bandas profissionais)
    */
   async calculateSpectralBandsMetrics(framesFFT, options = {}) {
-    const { jobId } = options;
+    const { jobId, spectralBatch } = options;
     
     try {
+      // ⚡ Caminho em lote: séries já calculadas sobre a matriz frames×bins
+      if (spectralBatch) {
+        const aggregatedBands = SpectralBandsAggregator.aggregateBatch(spectralBatch);
+        logAudio('spectral_bands', 'completed', {
+          mode: 'batch',
+          totalFrames: spectralBatch.numFrames,
+          framesUsed: aggregatedBands?.framesUsed || 0,
+          totalPercentage: aggregatedBands?.totalPercentage || null,
+          jobId
+        });
+        return aggregatedBands;
+      }
+      
       // 🎯 DEBUG CRÍTICO: Rastrear por que bandas não são calculadas
-      console.log('🔍 [SPECTRAL_BANDS_CRITICAL] Início do cálculo:', {
+      logger.debug(() => ['🔍 [SPECTRAL_BANDS_CRITICAL] Início do cálculo:', {
         hasFramesFFT: !!framesFFT,
         hasFrames: !!(framesFFT && framesFFT.frames),
         frameCount: framesFFT?.frames?.length || 0,
         framesFFTKeys: framesFFT ? Object.keys(framesFFT) : null,
         jobId 
-      });
+      }]);
 
       if (!framesFFT || !framesFFT.frames || framesFFT.frames.length === 0) {
-        console.error('❌ [SPECTRAL_BANDS_CRITICAL] SEM FRAMES FFT:', { 
+        logger.error('❌ [SPECTRAL_BANDS_CRITICAL] SEM FRAMES FFT:', { 
           reason: !framesFFT ? 'no_framesFFT' : !framesFFT.frames ? 'no_frames_array' : 'empty_frames_array',
           jobId 
         });
@@ -1584,7 +1651,7 @@ class CoreMetricsProcessor {
 
       // 🔍 Debug: verificar estrutura dos frames em detalhes
       const firstFrame = framesFFT.frames[0];
-      console.log('🔍 [SPECTRAL_BANDS_CRITICAL] Estrutura dos frames:', { 
+      logger.debug(() => ['🔍 [SPECTRAL_BANDS_CRITICAL] Estrutura dos frames:', { 
         frameCount: framesFFT.frames.length,
         firstFrameKeys: Object.keys(firstFrame),
         hasLeftFFT: !!firstFrame.leftFFT,
@@ -1593,7 +1660,7 @@ class CoreMetricsProcessor {
         hasMagnitude: !!firstFrame.leftFFT?.magnitude,
         magnitudeLength: firstFrame.leftFFT?.magnitude?.length || 0,
         magnitudeSample: firstFrame.leftFFT?.magnitude?.slice(0, 5) || null // Primeira amostra
-      });
+      }]);
 
       const bandsResults = [];
       let validFrames = 0;
@@ -1604,7 +1671,7 @@ class CoreMetricsProcessor {
         
         // 🔍 Debug mais detalhado dos frames críticos
         if (frameIndex < 5) { // Log dos primeiros 5 frames
-          console.log(`🔍 [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex}:`, {
+          logger.trace(() => [`🔍 [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex}:`, {
             frameKeys: Object.keys(frame),
             hasLeftFFT: !!frame.leftFFT,
             hasRightFFT: !!frame.rightFFT,
@@ -1614,36 +1681,34 @@ class CoreMetricsProcessor {
             leftMagnitudeSample: frame.leftFFT?.magnitude?.slice(0, 3) || null,
             leftMagnitudeMax: frame.leftFFT?.magnitude ? Math.max(...frame.leftFFT.magnitude) : null,
             jobId
-          });
+          }]);
         }
         
         // 🎯 CORREÇÃO CRÍTICA: Acessar magnitude corretamente
         // A estrutura é: frame.leftFFT.magnitude e frame.rightFFT.magnitude
         if (frame.leftFFT?.magnitude && frame.rightFFT?.magnitude) {
-          console.log(`✅ [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex} VÁLIDO - Analisando bandas...`);
-          
           const result = this.spectralBandsCalculator.analyzeBands(
             frame.leftFFT.magnitude,
             frame.rightFFT.magnitude,
             frameIndex
           );
           
-          console.log(`🎯 [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex} resultado:`, {
+          frameLogger.trace(() => [`🎯 [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex} VÁLIDO, resultado:`, {
             valid: result.valid,
             totalPercentage: result.totalPercentage,
             bandsKeys: result.bands ? Object.keys(result.bands) : null,
             sampleBand: result.bands?.sub || null
-          });
+          }]);
           
           if (result.valid) {
             bandsResults.push(result);
             validFrames++;
           } else {
-            console.warn(`⚠️ [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex} inválido:`, result);
+            logger.warn(`⚠️ [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex} inválido:`, result);
             invalidFrames++;
           }
         } else {
-          console.error(`❌ [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex} SEM DADOS FFT:`, {
+          logger.error(`❌ [SPECTRAL_BANDS_CRITICAL] Frame ${frameIndex} SEM DADOS FFT:`, {
             hasLeftFFT: !!frame.leftFFT,
             hasRightFFT: !!frame.rightFFT,
             leftMagnitude: !!frame.leftFFT?.magnitude,
@@ -1659,22 +1724,22 @@ class CoreMetricsProcessor {
         }
       }
 
-      console.log('🎯 [SPECTRAL_BANDS_CRITICAL] Agregando resultados:', {
+      logger.debug(() => ['🎯 [SPECTRAL_BANDS_CRITICAL] Agregando resultados:', {
         bandsResultsCount: bandsResults.length,
         validFrames,
         invalidFrames,
         totalFrames: framesFFT.frames.length
-      });
+      }]);
 
       // Agregar resultados
       const aggregatedBands = SpectralBandsAggregator.aggregate(bandsResults);
       
-      console.log('🎯 [SPECTRAL_BANDS_CRITICAL] Resultado final da agregação:', {
+      logger.debug(() => ['🎯 [SPECTRAL_BANDS_CRITICAL] Resultado final da agregação:', {
         aggregatedBands,
         valid: aggregatedBands?.valid,
         totalPercentage: aggregatedBands?.totalPercentage,
         bandsKeys: aggregatedBands?.bands ? Object.keys(aggregatedBands.bands) : null
-      });
+      }]);
 
       logAudio('spectral_bands', 'completed', {
         validFrames,
@@ -1688,7 +1753,7 @@ class CoreMetricsProcessor {
       return aggregatedBands;
 
     } catch (error) {
-      console.error('💥 [SPECTRAL_BANDS_CRITICAL] ERRO CRÍTICO:', { error: error.message, stack: error.stack, jobId });
+      logger.error('💥 [SPECTRAL_BANDS_CRITICAL] ERRO CRÍTICO:', { error: error.message, stack: error.stack, jobId });
       logAudio('spectral_bands', 'error', { error: error.message, jobId });
       return this.spectralBandsCalculator.getNullBands();
     }
@@ -1698,9 +1763,22 @@ class CoreMetricsProcessor {
    * 🎵 Calcular spectral centroid corrigido (Hz)
    */
   async calculateSpectralCentroidMetrics(framesFFT, options = {}) {
-    const { jobId } = options;
+    const { jobId, spectralBatch } = options;
     
     try {
+      // ⚡ Caminho em lote: centróide por frame já calculado sobre a matriz frames×bins
+      if (spectralBatch) {
+        const aggregatedCentroid = SpectralCentroidAggregator.aggregateBatch(spectralBatch);
+        logAudio('spectral_centroid', 'completed', {
+          mode: 'batch',
+          totalFrames: spectralBatch.numFrames,
+          centroidResultsCount: aggregatedCentroid?.framesUsed || 0,
+          centroidHz: aggregatedCentroid?.centroidHz || null,
+          jobId
+        });
+        return aggregatedCentroid;
+      }
+      
       // Debug detalhado da estrutura recebida
       logAudio('spectral_centroid', 'input_debug', { 
         hasFramesFFT: !!framesFFT,
@@ -1776,11 +1854,13 @@ class CoreMetricsProcessor {
    * 🎭 Análise estéreo corrigida
    */
   async calculateStereoMetricsCorrect(leftChannel, rightChannel, options = {}) {
-    const { jobId } = options;
+    const { jobId, timeDomainStats } = options;
     
     try {
-      // Usar novo calculador de métricas estéreo
-      const result = this.stereoMetricsCalculator.analyzeStereoMetrics(leftChannel, rightChannel);
+      // Usar novo calculador de métricas estéreo (somas do kernel quando disponíveis)
+      const result = timeDomainStats
+        ? this.stereoMetricsCalculator.analyzeStereoMetricsFromStats(timeDomainStats)
+        : this.stereoMetricsCalculator.analyzeStereoMetrics(leftChannel, rightChannel);
       
       if (!result.valid) {
         logAudio('stereo_metrics', 'invalid_result', { jobId });
@@ -1956,8 +2036,69 @@ class CoreMetricsProcessor {
     if (!arr || arr.length === 0) {
       return 0;
     }
-    const sum = arr.reduce((acc, val) => acc + val, 0);
-    return sum / arr.length;
+    const stats = new RunningStats();
+    for (let i = 0; i < arr.length; i++) stats.add(arr[i]);
+    return stats.average;
+  }
+
+  /**
+   * 📊 Acumular frames RMS válidos (> 0 e finitos) em uma passada, sem arrays filtrados
+   * @param {number[]|Float32Array} frames
+   * @returns {RunningStats}
+   */
+  accumulateValidRMS(frames) {
+    const stats = new RunningStats();
+    for (let i = 0; i < frames.length; i++) {
+      if (frames[i] > 0) stats.add(frames[i]);
+    }
+    return stats;
+  }
+
+  /**
+   * 🎚️ Resumir trechos re-analisados em hop fino (perfil fast)
+   * Bandas por trecho saem do mesmo SpectralBatchAnalyzer; os frames são descartados depois.
+   */
+  summarizeRefinedSegments(analysisProfile, options = {}) {
+    if (!analysisProfile) {
+      return null;
+    }
+
+    const refinedSegments = (analysisProfile.refinedSegments || []).map(segment => {
+      let bands = null;
+      try {
+        const series = this.spectralBatchAnalyzer.analyzeFrames(segment.framesFFT, { jobId: options.jobId });
+        const aggregated = SpectralBandsAggregator.aggregateBatch(series);
+        if (aggregated?.valid) {
+          bands = {};
+          for (const [key, band] of Object.entries(aggregated.bands)) {
+            bands[key] = { energy_db: band.energy_db, percentage: band.percentage };
+          }
+        }
+      } catch (error) {
+        logAudio('core_metrics', 'refined_segment_error', { error: error.message, jobId: options.jobId });
+      }
+
+      return {
+        startTime: Number(segment.startTime.toFixed(2)),
+        endTime: Number(segment.endTime.toFixed(2)),
+        reasons: segment.reasons,
+        clippedHops: segment.clippedHops,
+        peak: segment.peak,
+        subImbalanceFrames: segment.subImbalanceFrames,
+        maxSubImbalanceDb: segment.maxSubImbalanceDb !== null ? Number(segment.maxSubImbalanceDb.toFixed(1)) : null,
+        framesUsed: segment.framesFFT.count,
+        bands
+      };
+    });
+
+    return {
+      name: analysisProfile.name,
+      fftHopSize: analysisProfile.fftHopSize,
+      refinementHopSize: analysisProfile.refinementHopSize,
+      truncated: analysisProfile.truncated,
+      accuracy: analysisProfile.accuracy,
+      refinedSegments
+    };
   }
 
   /**
@@ -1980,19 +2121,19 @@ class CoreMetricsProcessor {
       const leftFrames = framesRMS.left;
       const rightFrames = framesRMS.right;
       
-      // Filtrar apenas valores válidos (não-zero, não-NaN, não-Infinity)
-      const validLeftFrames = leftFrames.filter(val => val > 0 && isFinite(val));
-      const validRightFrames = rightFrames.filter(val => val > 0 && isFinite(val));
+      // Apenas valores válidos (não-zero, não-NaN, não-Infinity) — média/peak em streaming
+      const leftStats = this.accumulateValidRMS(leftFrames);
+      const rightStats = this.accumulateValidRMS(rightFrames);
       
-      if (validLeftFrames.length === 0 || validRightFrames.length === 0) {
+      if (leftStats.count === 0 || rightStats.count === 0) {
         // ✅ LOG DETALHADO: Por que todos os frames foram filtrados?
-        console.warn(`[RMS FILTER] Todos os frames filtrados! leftTotal=${leftFrames.length}, rightTotal=${rightFrames.length}, validLeft=${validLeftFrames.length}, validRight=${validRightFrames.length}`);
-        console.warn(`[RMS FILTER] Primeiros 5 valores L:`, leftFrames.slice(0, 5));
-        console.warn(`[RMS FILTER] Primeiros 5 valores R:`, rightFrames.slice(0, 5));
+        logger.warn(`[RMS FILTER] Todos os frames filtrados! leftTotal=${leftFrames.length}, rightTotal=${rightFrames.length}, validLeft=${leftStats.count}, validRight=${rightStats.count}`);
+        logger.warn(`[RMS FILTER] Primeiros 5 valores L:`, leftFrames.slice(0, 5));
+        logger.warn(`[RMS FILTER] Primeiros 5 valores R:`, rightFrames.slice(0, 5));
         
         logAudio('core_metrics', 'rms_no_valid_frames', { 
-          leftValid: validLeftFrames.length, 
-          rightValid: validRightFrames.length,
+          leftValid: leftStats.count, 
+          rightValid: rightStats.count,
           leftTotal: leftFrames.length,
           rightTotal: rightFrames.length 
         });
@@ -2006,17 +2147,14 @@ class CoreMetricsProcessor {
       }
       
       // RMS médio por canal (já são valores RMS por frame)
-      const leftRMS = this.calculateArrayAverage(validLeftFrames);
-      const rightRMS = this.calculateArrayAverage(validRightFrames);
+      const leftRMS = leftStats.average;
+      const rightRMS = rightStats.average;
       
       // RMS médio total
       const averageRMS = (leftRMS + rightRMS) / 2;
       
       // Peak RMS (maior valor RMS entre todos os frames válidos)
-      const peakRMS = Math.max(
-        Math.max(...validLeftFrames),
-        Math.max(...validRightFrames)
-      );
+      const peakRMS = Math.max(leftStats.max, rightStats.max);
 
       // Converter para dB (com segurança)
       const leftRMSDb = leftRMS > 0 ? 20 * Math.log10(leftRMS) : -120; // Floor -120dB
@@ -2030,11 +2168,11 @@ class CoreMetricsProcessor {
         averageRMSDb: averageRMSDb.toFixed(2),
         peakRMSDb: peakRMSDb.toFixed(2),
         frameCount: framesRMS.count,
-        validFrames: Math.min(validLeftFrames.length, validRightFrames.length)
+        validFrames: Math.min(leftStats.count, rightStats.count)
       });
       
       // ✅ DEBUG RMS: Log crítico antes do return
-      console.log(`[DEBUG RMS RETURN] average=${averageRMSDb.toFixed(2)} dB, peak=${peakRMSDb.toFixed(2)} dB, validFrames L/R=${validLeftFrames.length}/${validRightFrames.length}`);
+      logger.debug(() => [`[DEBUG RMS RETURN] average=${averageRMSDb.toFixed(2)} dB, peak=${peakRMSDb.toFixed(2)} dB, validFrames L/R=${leftStats.count}/${rightStats.count}`]);
 
       return {
         left: leftRMSDb,
@@ -2095,4 +2233,4 @@ export async function calculateCoreMetrics(segmentedAudio, options = {}) {
 // Exportar classe para testes
 export { CoreMetricsProcessor };
 
-console.log('✅ Core Metrics Processor inicializado (Fase 5.3) - CORRIGIDO com fail-fast');
\ No newline at end of file
+logger.debug('✅ Core Metrics Processor inicializado (Fase 5.3) - CORRIGIDO com fail-fast');
\ No newline at end of file
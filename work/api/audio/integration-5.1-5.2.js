@@ -8,6 +8,9 @@
 import { decodeAudioFile } from './audio-decoder.js';
 import { segmentAudioTemporal, calculateFrameTiming } from './temporal-segmentation.js';
 import { generateTestWav } from './test-audio-decoder.js';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:integration-5.1-5.2');
 
 /**
  * Pipeline completo: Decodificação + Segmentação
@@ -20,32 +23,32 @@ export async function processAudioComplete(audioFileBuffer, filename) {
   const startTime = Date.now();
   
   try {
-    console.log(`[PIPELINE] Iniciando processamento completo: ${filename}`);
+    logger.debug(() => [`[PIPELINE] Iniciando processamento completo: ${filename}`]);
     
     // FASE 5.1: Decodificação
-    console.log(`[PIPELINE] Fase 5.1: Decodificação...`);
+    logger.debug(`[PIPELINE] Fase 5.1: Decodificação...`);
     const audioData = await decodeAudioFile(audioFileBuffer, filename);
     
-    console.log(`[PIPELINE] Fase 5.1 concluída:`, {
+    logger.debug(() => [`[PIPELINE] Fase 5.1 concluída:`, {
       sampleRate: audioData.sampleRate,
       channels: audioData.numberOfChannels,
       duration: audioData.duration,
       samples: audioData.length
-    });
+    }]);
     
     // FASE 5.2: Segmentação Temporal
-    console.log(`[PIPELINE] Fase 5.2: Segmentação temporal...`);
+    logger.debug(`[PIPELINE] Fase 5.2: Segmentação temporal...`);
     const segmentedData = segmentAudioTemporal(audioData);
     
-    console.log(`[PIPELINE] Fase 5.2 concluída:`, {
+    logger.debug(() => [`[PIPELINE] Fase 5.2 concluída:`, {
       fftFrames: segmentedData.framesFFT.count,
       rmsFrames: segmentedData.framesRMS.count,
       fftFrameSize: segmentedData.framesFFT.frameSize,
       rmsFrameSize: segmentedData.framesRMS.frameSize
-    });
+    }]);
     
     const totalTime = Date.now() - startTime;
-    console.log(`[PIPELINE] Pipeline completo executado em ${totalTime}ms`);
+    logger.debug(() => [`[PIPELINE] Pipeline completo executado em ${totalTime}ms`]);
     
     // Estrutura de retorno com dados das duas fases
     return {
@@ -74,7 +77,7 @@ export async function processAudioComplete(audioFileBuffer, filename) {
     
   } catch (error) {
     const totalTime = Date.now() - startTime;
-    console.error(`[PIPELINE] Erro após ${totalTime}ms:`, error);
+    logger.error(`[PIPELINE] Erro após ${totalTime}ms:`, error);
     
     // Re-throw com contexto do pipeline
     const enhancedError = new Error(`PIPELINE_FAILED: ${error.message}`);
@@ -90,43 +93,43 @@ export async function processAudioComplete(audioFileBuffer, filename) {
  * Exemplo prático: Processar arquivo WAV sintético
  */
 export async function demonstrateFullPipeline() {
-  console.log('🎵 DEMONSTRAÇÃO DO PIPELINE COMPLETO (5.1 + 5.2)');
-  console.log('═'.repeat(60));
+  logger.debug('🎵 DEMONSTRAÇÃO DO PIPELINE COMPLETO (5.1 + 5.2)');
+  logger.debug(() => ['═'.repeat(60)]);
   
   try {
     // Gerar WAV de teste (3 segundos, estéreo, 440Hz)
-    console.log('1️⃣ Gerando arquivo WAV de teste...');
+    logger.debug('1️⃣ Gerando arquivo WAV de teste...');
     const testWav = generateTestWav(3.0, 440);
-    console.log(`   WAV gerado: ${testWav.length} bytes, 3.0s, estéreo, 440Hz`);
+    logger.debug(() => [`   WAV gerado: ${testWav.length} bytes, 3.0s, estéreo, 440Hz`]);
     
     // Processar através do pipeline completo
-    console.log('\n2️⃣ Executando pipeline completo...');
+    logger.debug('\n2️⃣ Executando pipeline completo...');
     const result = await processAudioComplete(testWav, 'demo-pipeline.wav');
     
     // Analisar resultados
-    console.log('\n3️⃣ Analisando resultados...');
-    
-    console.log('\n📊 RESULTADOS DA FASE 5.1 (Decodificação):');
-    console.log(`   ✅ Sample Rate: ${result.original.sampleRate} Hz`);
-    console.log(`   ✅ Canais: ${result.original.numberOfChannels}`);
-    console.log(`   ✅ Duração: ${result.original.duration.toFixed(3)}s`);
-    console.log(`   ✅ Samples: ${result.original.length} por canal`);
-    console.log(`   ✅ Tempo decodificação: ${result.original.decodingTime}ms`);
-    
-    console.log('\n📊 RESULTADOS DA FASE 5.2 (Segmentação):');
-    console.log(`   ✅ Frames FFT: ${result.segmented.framesFFT.count} (${result.segmented.framesFFT.frameSize} samples cada)`);
-    console.log(`   ✅ Frames RMS: ${result.segmented.framesRMS.count} (${result.segmented.framesRMS.frameSize} samples cada)`);
-    console.log(`   ✅ FFT Hop: ${result.segmented.framesFFT.hopSize} samples (${result.segmented.framesFFT.windowType} window)`);
-    console.log(`   ✅ RMS Hop: ${result.segmented.framesRMS.hopSize} samples (${result.segmented.framesRMS.hopDurationMs}ms)`);
-    console.log(`   ✅ Tempo segmentação: ${result.segmented._metadata.processingTime}ms`);
-    
-    console.log('\n📊 PIPELINE GERAL:');
-    console.log(`   ✅ Tempo total: ${result.pipeline.totalProcessingTime}ms`);
-    console.log(`   ✅ Fases completas: 5.1 + 5.2`);
-    console.log(`   ✅ Próximas fases: ${result.pipeline.readyForPhases.join(', ')}`);
+    logger.debug('\n3️⃣ Analisando resultados...');
+    
+    logger.debug('\n📊 RESULTADOS DA FASE 5.1 (Decodificação):');
+    logger.debug(() => [`   ✅ Sample Rate: ${result.original.sampleRate} Hz`]);
+    logger.debug(() => [`   ✅ Canais: ${result.original.numberOfChannels}`]);
+    logger.debug(() => [`   ✅ Duração: ${result.original.duration.toFixed(3)}s`]);
+    logger.debug(() => [`   ✅ Samples: ${result.original.length} por canal`]);
+    logger.debug(() => [`   ✅ Tempo decodificação: ${result.original.decodingTime}ms`]);
+    
+    logger.debug('\n📊 RESULTADOS DA FASE 5.2 (Segmentação):');
+    logger.debug(() => [`   ✅ Frames FFT: ${result.segmented.framesFFT.count} (${result.segmented.framesFFT.frameSize} samples cada)`]);
+    logger.debug(() => [`   ✅ Frames RMS: ${result.segmented.framesRMS.count} (${result.segmented.framesRMS.frameSize} samples cada)`]);
+    logger.debug(() => [`   ✅ FFT Hop: ${result.segmented.framesFFT.hopSize} samples (${result.segmented.framesFFT.windowType} window)`]);
+    logger.debug(() => [`   ✅ RMS Hop: ${result.segmented.framesRMS.hopSize} samples (${result.segmented.framesRMS.hopDurationMs}ms)`]);
+    logger.debug(() => [`   ✅ Tempo segmentação: ${result.segmented._metadata.processingTime}ms`]);
+    
+    logger.debug('\n📊 PIPELINE GERAL:');
+    logger.debug(() => [`   ✅ Tempo total: ${result.pipeline.totalProcessingTime}ms`]);
+    logger.debug(`   ✅ Fases completas: 5.1 + 5.2`);
+    logger.debug(() => [`   ✅ Próximas fases: ${result.pipeline.readyForPhases.join(', ')}`]);
     
     // Validações específicas
-    console.log('\n4️⃣ Validações específicas...');
+    logger.debug('\n4️⃣ Validações específicas...');
     
     // Validar cálculo de frames para 3 segundos (144000 samples)
     const expectedFFT = Math.floor((144000 - 4096) / 1024) + 1; // 137 frames
@@ -140,8 +143,8 @@ export async function demonstrateFullPipeline() {
       throw new Error(`RMS frames incorreto: ${result.segmented.framesRMS.count} !== ${expectedRMS}`);
     }
     
-    console.log(`   ✅ FFT frames: ${result.segmented.framesFFT.count} (esperado: ${expectedFFT})`);
-    console.log(`   ✅ RMS frames: ${result.segmented.framesRMS.count} (esperado: ${expectedRMS})`);
+    logger.debug(() => [`   ✅ FFT frames: ${result.segmented.framesFFT.count} (esperado: ${expectedFFT})`]);
+    logger.debug(() => [`   ✅ RMS frames: ${result.segmented.framesRMS.count} (esperado: ${expectedRMS})`]);
     
     // Verificar que os frames têm os tamanhos corretos
     const firstFFTFrame = result.segmented.framesFFT.left[0];
@@ -155,18 +158,18 @@ export async function demonstrateFullPipeline() {
       throw new Error(`RMS frame size incorreto: ${firstRMSFrame.length} !== 14400`);
     }
     
-    console.log(`   ✅ FFT frame size: ${firstFFTFrame.length} samples`);
-    console.log(`   ✅ RMS frame size: ${firstRMSFrame.length} samples`);
+    logger.debug(() => [`   ✅ FFT frame size: ${firstFFTFrame.length} samples`]);
+    logger.debug(() => [`   ✅ RMS frame size: ${firstRMSFrame.length} samples`]);
     
     // Verificar janela Hann aplicada
     if (Math.abs(firstFFTFrame[0]) > 0.01 || Math.abs(firstFFTFrame[4095]) > 0.01) {
       throw new Error('Janela Hann não foi aplicada corretamente');
     }
     
-    console.log(`   ✅ Janela Hann aplicada (bordas ~0)`);
+    logger.debug(`   ✅ Janela Hann aplicada (bordas ~0)`);
     
-    console.log('\n🎉 DEMONSTRAÇÃO CONCLUÍDA COM SUCESSO!');
-    console.log('Pipeline 5.1 + 5.2 está funcionando perfeitamente.');
+    logger.debug('\n🎉 DEMONSTRAÇÃO CONCLUÍDA COM SUCESSO!');
+    logger.debug('Pipeline 5.1 + 5.2 está funcionando perfeitamente.');
     
     return {
       success: true,
@@ -177,8 +180,8 @@ export async function demonstrateFullPipeline() {
     };
     
   } catch (error) {
-    console.error('\n❌ ERRO NA DEMONSTRAÇÃO:', error.message);
-    console.error('Stack:', error.stack);
+    logger.error('\n❌ ERRO NA DEMONSTRAÇÃO:', error.message);
+    logger.error('Stack:', error.stack);
     
     return {
       success: false,
@@ -237,7 +240,7 @@ if (import.meta.url === `file://${process.argv[1]}`) {
       process.exit(result.success ? 0 : 1);
     })
     .catch((error) => {
-      console.error('❌ ERRO CRÍTICO:', error);
+      logger.error('❌ ERRO CRÍTICO:', error);
       process.exit(1);
     });
 }
@@ -6,10 +6,15 @@
 import { computeMixScore } from "../../lib/audio/features/scoring.js";
 import { makeErr, logAudio, assertFinite } from '../../lib/audio/error-handling.js';
 import { normalizeGenreTargets, calculateMetricSeverity, calculateBandSeverity } from '../../lib/audio/utils/normalize-genre-targets.js';
+import { classifyGenre } from '../../lib/audio/features/genre-classifier.js';
 
 // 🎯 NOVO PIPELINE CENTRAL: resolveTargets + compareWithTargets
 // Este módulo é a FONTE ÚNICA DA VERDADE para tabela, sugestões e score
 import { resolveTargets, compareWithTargets, validateTargets, TRUE_PEAK_HARD_CAP as CORE_TRUE_PEAK_HARD_CAP } from '../../lib/audio/core/index.js';
+import { createLogger } from '../../lib/logger.js';
+import { profileStage } from '../../lib/job-profiler.js';
+
+const logger = createLogger('audio:json-output');
 
 // 🎯 CONSTANTE FÍSICA - True Peak NUNCA > 0 dBTP
 const TRUE_PEAK_HARD_CAP = 0.0;
@@ -25,13 +30,13 @@ function FORCE_TYPE_FIELD(suggestions) {
     const result = { ...s };
     if (!result.type && result.metric) {
       result.type = result.metric;
-      console.log(`🚨 FORÇANDO type="${result.metric}" para sugestão:`, result.message?.substring(0, 50));
+      logger.debug(() => [`🚨 FORÇANDO type="${result.metric}" para sugestão:`, result.message?.substring(0, 50)]);
     }
     return result;
   });
 }
 
-console.log("📦 JSON Output & Scoring (Fase 5.4) carregado - Equal Weight V3 COMPLETO + FONTE ÚNICA TARGETS");
+logger.debug("📦 JSON Output & Scoring (Fase 5.4) carregado - Equal Weight V3 COMPLETO + FONTE ÚNICA TARGETS");
 
 export function generateJSONOutput(coreMetrics, reference = null, metadata = {}, options = {}) {
   const jobId = options.jobId || 'unknown';
@@ -56,28 +61,28 @@ export function generateJSONOutput(coreMetrics, reference = null, metadata = {},
     }
 
     // 🚨 LOG CRÍTICO: Verificar reference recebido pelo scoring
-    console.error('\n╔═════════════════════════════════════════════════════════════╗');
-    console.error('║  🎯 JSON-OUTPUT: CHAMANDO computeMixScore                  ║');
-    console.error('╚═════════════════════════════════════════════════════════════╝');
-    console.error('[JSON-OUTPUT] LUFS medido:', technicalData.lufsIntegrated);
-    console.error('[JSON-OUTPUT] Reference recebido:', {
+    logger.error('\n╔═════════════════════════════════════════════════════════════╗');
+    logger.error('║  🎯 JSON-OUTPUT: CHAMANDO computeMixScore                  ║');
+    logger.error('╚═════════════════════════════════════════════════════════════╝');
+    logger.error('[JSON-OUTPUT] LUFS medido:', technicalData.lufsIntegrated);
+    logger.error('[JSON-OUTPUT] Reference recebido:', {
       tipo: reference ? (reference.lufs_target ? 'FLAT' : reference.lufs ? 'NESTED' : 'UNKNOWN') : 'NULL',
       lufs_target_flat: reference?.lufs_target,
       lufs_nested: reference?.lufs?.target,
       true_peak_flat: reference?.true_peak_target,
       true_peak_nested: reference?.truePeak?.target
     });
-    console.error('\n');
+    logger.error('\n');
     
-    const scoringResult = computeMixScore(technicalData, reference);
+    const scoringResult = profileStage('scoring', () => computeMixScore(technicalData, reference));
     const scoreValue = scoringResult.score || scoringResult.scorePct;
     
-    console.error('╔═════════════════════════════════════════════════════════════╗');
-    console.error('║  📊 SCORING RESULT                                         ║');
-    console.error('╚═════════════════════════════════════════════════════════════╝');
-    console.error('[JSON-OUTPUT] Score final:', scoreValue);
-    console.error('[JSON-OUTPUT] Breakdown:', scoringResult.breakdown);
-    console.error('\n');
+    logger.error('╔═════════════════════════════════════════════════════════════╗');
+    logger.error('║  📊 SCORING RESULT                                         ║');
+    logger.error('╚═════════════════════════════════════════════════════════════╝');
+    logger.error('[JSON-OUTPUT] Score final:', scoreValue);
+    logger.error('[JSON-OUTPUT] Breakdown:', scoringResult.breakdown);
+    logger.error('\n');
 
     if (!scoringResult || typeof scoreValue !== 'number' || !isFinite(scoreValue)) {
       throw makeErr('output_scoring', `Invalid scoring result: ${JSON.stringify(scoringResult)}`, 'invalid_scoring_result');
@@ -145,18 +150,18 @@ function validateCoreMetricsStructure(coreMetrics) {
 }
 
 function extractTechnicalData(coreMetrics, jobId = 'unknown') {
-  console.log('[JSON-OUTPUT] 🔍 INÍCIO extractTechnicalData');
+  logger.debug('[JSON-OUTPUT] 🔍 INÍCIO extractTechnicalData');
   
   // 📊 DEBUG CRÍTICO: Verificar estado do samplePeak logo no início
   if (coreMetrics.samplePeak) {
-    console.log('[JSON-OUTPUT] 📊 Sample Peak recebido de coreMetrics:', {
+    logger.debug(() => ['[JSON-OUTPUT] 📊 Sample Peak recebido de coreMetrics:', {
       maxDbfs: coreMetrics.samplePeak.maxDbfs,
       leftDbfs: coreMetrics.samplePeak.leftDbfs,
       rightDbfs: coreMetrics.samplePeak.rightDbfs,
       estruturaCompleta: Object.keys(coreMetrics.samplePeak)
-    });
+    }]);
   } else {
-    console.warn('[JSON-OUTPUT] ⚠️ coreMetrics.samplePeak é NULL/UNDEFINED no início de extractTechnicalData');
+    logger.warn('[JSON-OUTPUT] ⚠️ coreMetrics.samplePeak é NULL/UNDEFINED no início de extractTechnicalData');
   }
   
   const technicalData = {};
@@ -190,10 +195,10 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
     technicalData.gainAppliedDB = safeSanitize(coreMetrics.lufs.gainAppliedDB);
     
     // 🎯 LOG DE CONFIRMAÇÃO: Valores RAW sendo usados
-    console.log('[JSON-OUTPUT] ✅ Valores RAW extraídos para technicalData:', {
+    logger.debug(() => ['[JSON-OUTPUT] ✅ Valores RAW extraídos para technicalData:', {
       lufsIntegrated: technicalData.lufsIntegrated,
       sourceIsRaw: coreMetrics.metadata?.usesRawMetrics || false
-    });
+    }]);
   }
 
   // ===== True Peak =====
@@ -210,10 +215,10 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
     technicalData.clippingPct = safeSanitize(coreMetrics.truePeak.clippingPct, 0);
     
     // 🎯 LOG DE CONFIRMAÇÃO: True Peak RAW
-    console.log('[JSON-OUTPUT] ✅ True Peak RAW extraído:', {
+    logger.debug(() => ['[JSON-OUTPUT] ✅ True Peak RAW extraído:', {
       truePeakDbtp: technicalData.truePeakDbtp,
       sourceIsRaw: coreMetrics.metadata?.usesRawMetrics || false
-    });
+    }]);
   }
 
   // ===== Dynamics =====
@@ -225,10 +230,10 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
     technicalData.drCategory = safeSanitize(coreMetrics.dynamics.drCategory, 'unknown');
     
     // 🎯 LOG DE CONFIRMAÇÃO: DR RAW
-    console.log('[JSON-OUTPUT] ✅ Dynamic Range RAW extraído:', {
+    logger.debug(() => ['[JSON-OUTPUT] ✅ Dynamic Range RAW extraído:', {
       dynamicRange: technicalData.dynamicRange,
       sourceIsRaw: coreMetrics.metadata?.usesRawMetrics || false
-    });
+    }]);
   }
 
   // ===== Stereo =====
@@ -270,14 +275,14 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
     const b = coreMetrics.spectralBands;
     
     // 🔍 Debug detalhado da estrutura recebida
-    console.log('🎯 [SPECTRAL_BANDS_DEBUG] Estrutura completa recebida:', {
+    logger.debug(() => ['🎯 [SPECTRAL_BANDS_DEBUG] Estrutura completa recebida:', {
       hasBands: !!b.bands,
       bandsKeys: b?.bands ? Object.keys(b.bands) : null,
       sampleBandData: b?.bands?.sub || null,
       totalPercentage: b?.totalPercentage || null,
       isValid: b?.valid || null,
       rawBandsData: b?.bands // Debug específico das bandas
-    });
+    }]);
     
     // 🎯 MAPEAMENTO CORRETO: Estrutura final padronizada com energy_db
     let extractedBands = null;
@@ -340,7 +345,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
       };
       
       extractedBands = bandsData;
-      console.log('✅ [SPECTRAL_BANDS] Usando estrutura .bands com energy_db e percentage calculados');
+      logger.debug('✅ [SPECTRAL_BANDS] Usando estrutura .bands com energy_db e percentage calculados');
     }
     // Tentativa 2: Estrutura direta para compatibilidade
     else if (b.sub !== undefined || b.bass !== undefined) {
@@ -354,7 +359,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
         air: { energy_db: safeSanitize(b.air), percentage: safeSanitize(b.air), range: "10000-20000Hz" },
         totalPercentage: safeSanitize(b.totalPercentage, 100)
       };
-      console.log('✅ [SPECTRAL_BANDS] Usando estrutura direta com energy_db');
+      logger.debug('✅ [SPECTRAL_BANDS] Usando estrutura direta com energy_db');
     }
     // Tentativa 3: Busca flexível por valores numéricos válidos
     else {
@@ -369,7 +374,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
         air: { energy_db: safeSanitize(findNumericValue(b, ['air', 'ultra_high'])), range: "10000-20000Hz" },
         totalPercentage: safeSanitize(b.totalPercentage || 100)
       };
-      console.log('⚠️ [SPECTRAL_BANDS] Usando busca flexível por valores numéricos');
+      logger.debug('⚠️ [SPECTRAL_BANDS] Usando busca flexível por valores numéricos');
     }
     
     // Verificar se temos valores válidos (energy_db ou percentage)
@@ -386,7 +391,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
       technicalData.spectral_balance = extractedBands;
       
       // 📊 Log de exportação para debug
-      console.log('[BANDS_EXPORT] Bandas mapeadas para JSON:', {
+      logger.debug(() => ['[BANDS_EXPORT] Bandas mapeadas para JSON:', {
         bandsWithEnergyDb: extractedBands,
         hasAllBands: !!(
           extractedBands.sub?.energy_db !== null && 
@@ -402,7 +407,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
         ).length,
         totalPercentage: extractedBands.totalPercentage,
         status: extractedBands._status
-      });
+      }]);
     } else {
       // Fallback com status específico (não zeros falsos)
       technicalData.spectral_balance = {
@@ -417,7 +422,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
         _status: 'data_structure_invalid',
         _debug: { receivedKeys: Object.keys(b), receivedData: b }
       };
-      console.error('❌ [SPECTRAL_BANDS] Estrutura de dados inválida, usando null em vez de zeros');
+      logger.error('❌ [SPECTRAL_BANDS] Estrutura de dados inválida, usando null em vez de zeros');
     }
   } else {
     // 🚨 Pipeline não calculou bandas OU condição de acesso estava errada
@@ -428,7 +433,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
       hasAggregated: !!(coreMetrics.spectralBands?.aggregated)
     };
     
-    console.warn('⚠️ [SPECTRAL_BANDS] Condição de acesso falhou:', debugInfo);
+    logger.warn('⚠️ [SPECTRAL_BANDS] Condição de acesso falhou:', debugInfo);
     
     technicalData.spectral_balance = {
       sub: { energy_db: null, percentage: null, range: "20-60Hz", status: "not_calculated" },
@@ -442,7 +447,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
       _status: 'not_calculated',
       _debug: debugInfo
     };
-    console.log('⚠️ [SPECTRAL_BANDS] Bandas não calculadas ou condição de acesso incorreta');
+    logger.debug('⚠️ [SPECTRAL_BANDS] Bandas não calculadas ou condição de acesso incorreta');
   }
   
   // 🔧 Função auxiliar para buscar valores numéricos
@@ -472,7 +477,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
 
   // ===== RMS =====
   if (coreMetrics.rms) {
-    console.log(`[DEBUG JSON RMS] coreMetrics.rms.average=${coreMetrics.rms.average}, left=${coreMetrics.rms.left}, right=${coreMetrics.rms.right}, peak=${coreMetrics.rms.peak}`);
+    logger.debug(() => [`[DEBUG JSON RMS] coreMetrics.rms.average=${coreMetrics.rms.average}, left=${coreMetrics.rms.left}, right=${coreMetrics.rms.right}, peak=${coreMetrics.rms.peak}`]);
     
     technicalData.rmsLevels = {
       left: safeSanitize(coreMetrics.rms.left),
@@ -495,9 +500,9 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
     technicalData.rms = technicalData.rmsLevels.average;  // @deprecated use rmsAvgDbfs
     technicalData.avgLoudness = technicalData.rmsLevels.average;  // @deprecated use rmsAvgDbfs
     
-    console.log(`[DEBUG JSON FINAL] rmsPeak300msDb=${technicalData.rmsPeak300msDb}, rmsAverageDb=${technicalData.rmsAverageDb}, avgLoudness=${technicalData.avgLoudness}`);
+    logger.debug(() => [`[DEBUG JSON FINAL] rmsPeak300msDb=${technicalData.rmsPeak300msDb}, rmsAverageDb=${technicalData.rmsAverageDb}, avgLoudness=${technicalData.avgLoudness}`]);
   } else {
-    console.error(`[DEBUG JSON ERROR] coreMetrics.rms é ${typeof coreMetrics.rms} (${coreMetrics.rms})`);
+    logger.error(`[DEBUG JSON ERROR] coreMetrics.rms é ${typeof coreMetrics.rms} (${coreMetrics.rms})`);
   }
 
   // 🎯 SAMPLE PEAK: Exportar valores canônicos (max absolute sample)
@@ -520,7 +525,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
     // Alias aggregate (manter para compatibilidade)
     technicalData.samplePeakDb = technicalData.samplePeakDbfs;  // @deprecated use samplePeakDbfs
     
-    console.log(`[JSON-OUTPUT] ✅ Sample Peak REAL exportado: max=${technicalData.samplePeakDbfs}, L=${technicalData.samplePeakLeftDbfs}, R=${technicalData.samplePeakRightDbfs}`);
+    logger.debug(() => [`[JSON-OUTPUT] ✅ Sample Peak REAL exportado: max=${technicalData.samplePeakDbfs}, L=${technicalData.samplePeakLeftDbfs}, R=${technicalData.samplePeakRightDbfs}`]);
   } else {
     // Fail-soft: setar null mas não quebrar pipeline
     technicalData.samplePeakDbfs = null;
@@ -528,18 +533,18 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
     technicalData.samplePeakLeftDbfs = null;
     technicalData.samplePeakRightDbfs = null;
     technicalData.samplePeakLinear = null;
-    console.warn('[JSON-OUTPUT] ⚠️ samplePeak não disponível (coreMetrics.samplePeak = null) - continuando...');
+    logger.warn('[JSON-OUTPUT] ⚠️ samplePeak não disponível (coreMetrics.samplePeak = null) - continuando...');
   }
 
   // 🎯 LOG FINAL: Métricas canônicas market-ready
-  console.log('[METRICS-EXPORT] 📊 CHAVES CANÔNICAS:', {
+  logger.debug(() => ['[METRICS-EXPORT] 📊 CHAVES CANÔNICAS:', {
     rmsAvgDbfs: technicalData.rmsAvgDbfs,
     rmsPeak300msDbfs: technicalData.rmsPeak300msDbfs,
     samplePeakDbfs: technicalData.samplePeakDbfs,
     samplePeakLeftDbfs: technicalData.samplePeakLeftDbfs,
     samplePeakRightDbfs: technicalData.samplePeakRightDbfs,
     truePeakDbtp: technicalData.truePeakDbtp
-  });
+  }]);
   
   // 🔍 SANITY-CHECK: Validação de invariantes matemáticas (log-only, não aborta job)
   const rmsPeak = technicalData.rmsPeak300msDbfs;
@@ -549,25 +554,25 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
   
   if (rmsPeak !== null && rmsAvg !== null) {
     if (rmsPeak < rmsAvg - 0.5) {
-      console.warn(`[SANITY-CHECK] ⚠️ VIOLAÇÃO: RMS Peak (${rmsPeak.toFixed(2)}) < RMS Average (${rmsAvg.toFixed(2)}) - Esperado: Peak >= Average`);
+      logger.warn(`[SANITY-CHECK] ⚠️ VIOLAÇÃO: RMS Peak (${rmsPeak.toFixed(2)}) < RMS Average (${rmsAvg.toFixed(2)}) - Esperado: Peak >= Average`);
     } else {
-      console.log(`[SANITY-CHECK] ✅ RMS Average (${rmsAvg.toFixed(2)}) <= RMS Peak (${rmsPeak.toFixed(2)})`);
+      logger.debug(() => [`[SANITY-CHECK] ✅ RMS Average (${rmsAvg.toFixed(2)}) <= RMS Peak (${rmsPeak.toFixed(2)})`]);
     }
   }
   
   if (samplePeak !== null && truePeak !== null) {
     if (truePeak < samplePeak - 0.5) {
-      console.warn(`[SANITY-CHECK] ⚠️ VIOLAÇÃO: True Peak (${truePeak.toFixed(2)}) < Sample Peak (${samplePeak.toFixed(2)}) - Esperado: TruePeak >= SamplePeak`);
+      logger.warn(`[SANITY-CHECK] ⚠️ VIOLAÇÃO: True Peak (${truePeak.toFixed(2)}) < Sample Peak (${samplePeak.toFixed(2)}) - Esperado: TruePeak >= SamplePeak`);
     } else {
-      console.log(`[SANITY-CHECK] ✅ True Peak (${truePeak.toFixed(2)}) >= Sample Peak (${samplePeak.toFixed(2)})`);
+      logger.debug(() => [`[SANITY-CHECK] ✅ True Peak (${truePeak.toFixed(2)}) >= Sample Peak (${samplePeak.toFixed(2)})`]);
     }
   }
   
   if (samplePeak !== null && rmsPeak !== null) {
     if (samplePeak < rmsPeak - 0.5) {
-      console.warn(`[SANITY-CHECK] ⚠️ VIOLAÇÃO: Sample Peak (${samplePeak.toFixed(2)}) < RMS Peak (${rmsPeak.toFixed(2)}) - Esperado: SamplePeak >= RMSPeak`);
+      logger.warn(`[SANITY-CHECK] ⚠️ VIOLAÇÃO: Sample Peak (${samplePeak.toFixed(2)}) < RMS Peak (${rmsPeak.toFixed(2)}) - Esperado: SamplePeak >= RMSPeak`);
     } else {
-      console.log(`[SANITY-CHECK] ✅ Sample Peak (${samplePeak.toFixed(2)}) >= RMS Peak (${rmsPeak.toFixed(2)})`);
+      logger.debug(() => [`[SANITY-CHECK] ✅ Sample Peak (${samplePeak.toFixed(2)}) >= RMS Peak (${rmsPeak.toFixed(2)})`]);
     }
   }
 
@@ -592,26 +597,26 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
   technicalData.bpmSource = safeSanitize(coreMetrics.bpmSource, 'UNKNOWN'); // ✅ NOVO: Fonte do cálculo BPM
   
   // ✅ Log de debug para confirmar valores finais
-  console.log('[WORKER][BPM] Final JSON:', technicalData.bpm, technicalData.bpmConfidence, 'source:', technicalData.bpmSource);
+  logger.debug(() => ['[WORKER][BPM] Final JSON:', technicalData.bpm, technicalData.bpmConfidence, 'source:', technicalData.bpmSource]);
 
   // ===== Dominant Frequencies =====
   // REMOVED: Export processing for dominantFrequencies
   // Reason: REMOVAL_SKIPPED_USED_BY_SCORE:dominantFrequencies - mantendo cálculo interno apenas
   // O cálculo continua acontecendo em enhanced-suggestion-engine.js para análise interna
-  console.log('🎵 [DOMINANT_FREQ] Processamento de export removido - mantendo apenas cálculo interno');
+  logger.debug('🎵 [DOMINANT_FREQ] Processamento de export removido - mantendo apenas cálculo interno');
   
   // ===== Spectral Uniformity =====
   // 🔧 CORREÇÃO AUDITORIA DSP 2025-12-29: Restaurar export com valor agregado corrigido
   // Problema anterior: cálculo usava apenas 1º frame FFT, agora usa agregação de todos frames
   
   // 🔍 DEBUG CRÍTICO: Log do que está chegando de coreMetrics
-  console.log('[UNIFORMITY_PIPELINE] 🔍 coreMetrics.spectralUniformity recebido:', {
+  logger.debug(() => ['[UNIFORMITY_PIPELINE] 🔍 coreMetrics.spectralUniformity recebido:', {
     hasSpectralUniformity: !!coreMetrics.spectralUniformity,
     type: typeof coreMetrics.spectralUniformity,
     value: coreMetrics.spectralUniformity,
     uniformityPercent: coreMetrics.spectralUniformity?.uniformityPercent,
     aggregation: coreMetrics.spectralUniformity?.aggregation
-  });
+  }]);
   
   if (coreMetrics.spectralUniformity) {
     const su = coreMetrics.spectralUniformity;
@@ -651,12 +656,12 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
       };
     }
     
-    console.log('[UNIFORMITY_PIPELINE] ✅ Exportado valor corrigido:', {
+    logger.debug(() => ['[UNIFORMITY_PIPELINE] ✅ Exportado valor corrigido:', {
       uniformityPercent: technicalData.spectralUniformityPercent,
       normalized: technicalData.spectralUniformity,
       rating: su.rating,
       meta: technicalData.spectralUniformityMeta
-    });
+    }]);
   } else {
     technicalData.spectralUniformity = null;
     technicalData.spectralUniformityPercent = null;
@@ -668,7 +673,7 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
       rating: 'unknown',
       error: 'coreMetrics.spectralUniformity is null or undefined'
     };
-    console.log('[UNIFORMITY_PIPELINE] ⚠️ Não disponível - retornando null com meta de erro');
+    logger.debug('[UNIFORMITY_PIPELINE] ⚠️ Não disponível - retornando null com meta de erro');
   }
 
   // ===== Problems / Suggestions =====
@@ -693,9 +698,9 @@ function extractTechnicalData(coreMetrics, jobId = 'unknown') {
 function normalizeGenreTargetsForFrontend(targets) {
   if (!targets || typeof targets !== 'object' || Object.keys(targets).length === 0) return null;
 
-  console.log('[JSON-OUTPUT-NORMALIZE] ----------');
-  console.log('[JSON-OUTPUT-NORMALIZE] Entrada - keys:', Object.keys(targets));
-  console.log('[JSON-OUTPUT-NORMALIZE] Entrada - tipo detectado:', targets.lufs ? 'NESTED (backend)' : 'FLAT (frontend payload)');
+  logger.debug('[JSON-OUTPUT-NORMALIZE] ----------');
+  logger.debug(() => ['[JSON-OUTPUT-NORMALIZE] Entrada - keys:', Object.keys(targets)]);
+  logger.debug(() => ['[JSON-OUTPUT-NORMALIZE] Entrada - tipo detectado:', targets.lufs ? 'NESTED (backend)' : 'FLAT (frontend payload)']);
 
   const normalized = {
     // Converter nested para flat (lufs.target → lufs_target)
@@ -736,13 +741,13 @@ function normalizeGenreTargetsForFrontend(targets) {
   // CASO 1: Formato NESTED do backend (loadGenreTargets)
   // { lufs: {...}, bands: { low_bass: {...}, presenca: {...} } }
   if (targets.bands && typeof targets.bands === 'object') {
-    console.log('[JSON-OUTPUT-NORMALIZE] 📦 Fonte: targets.bands (nested backend)');
+    logger.debug('[JSON-OUTPUT-NORMALIZE] 📦 Fonte: targets.bands (nested backend)');
     sourceBands = targets.bands;
   }
   // CASO 2: Formato FLAT do frontend (payload direto)
   // { sub: {...}, low_bass: {...}, presenca: {...} }
   else {
-    console.log('[JSON-OUTPUT-NORMALIZE] 📦 Fonte: targets direto (flat frontend payload)');
+    logger.debug('[JSON-OUTPUT-NORMALIZE] 📦 Fonte: targets direto (flat frontend payload)');
     sourceBands = targets;
   }
 
@@ -751,35 +756,76 @@ function normalizeGenreTargetsForFrontend(targets) {
     !['lufs', 'truePeak', 'dr', 'lra', 'stereo', 'lufs_target', 'true_peak_target', 'dr_target', 'lra_target', 'stereo_target', 'lufs_tolerance', 'true_peak_tolerance', 'dr_tolerance', 'lra_tolerance', 'stereo_tolerance'].includes(k)
   );
 
-  console.log('[JSON-OUTPUT-NORMALIZE] 🎵 Bandas a processar:', bandKeys);
+  logger.debug(() => ['[JSON-OUTPUT-NORMALIZE] 🎵 Bandas a processar:', bandKeys]);
 
   bandKeys.forEach(key => {
     // Usar BAND_NAME_MAP para conversão completa
     const normalizedKey = BAND_NAME_MAP[key] || key;
     normalized.bands[normalizedKey] = sourceBands[key];
-    console.log(`[JSON-OUTPUT-NORMALIZE]    ✓ ${key} → ${normalizedKey}`);
+    logger.debug(() => [`[JSON-OUTPUT-NORMALIZE]    ✓ ${key} → ${normalizedKey}`]);
   });
 
-  console.log('[JSON-OUTPUT-NORMALIZE] Saída - keys:', Object.keys(normalized));
-  console.log('[JSON-OUTPUT-NORMALIZE] Bandas normalizadas:', Object.keys(normalized.bands));
-  console.log('[JSON-OUTPUT-NORMALIZE] Total de bandas:', Object.keys(normalized.bands).length);
-  console.log('[JSON-OUTPUT-NORMALIZE] ----------');
+  logger.debug(() => ['[JSON-OUTPUT-NORMALIZE] Saída - keys:', Object.keys(normalized)]);
+  logger.debug(() => ['[JSON-OUTPUT-NORMALIZE] Bandas normalizadas:', Object.keys(normalized.bands)]);
+  logger.debug(() => ['[JSON-OUTPUT-NORMALIZE] Total de bandas:', Object.keys(normalized.bands).length]);
+  logger.debug('[JSON-OUTPUT-NORMALIZE] ----------');
 
   return normalized;
 }
 
+/**
+ * 🎼 Detecção de gênero sobre technicalData (sem decode extra); nunca derruba o JSON final
+ */
+function detectGenre(technicalData, jobId) {
+  try {
+    return classifyGenre(technicalData);
+  } catch (error) {
+    logger.warn(`⚠️ [GENRE-DETECT] Falha na classificação (job ${jobId}):`, error.message);
+    return null;
+  }
+}
+
+/**
+ * Campos de score do JSON final (score, classification, scores, scoring)
+ * Também usado pelo backfill de re-scoring (lib/rescoring/rescoreAnalysis.js)
+ * @param {Object} scoringResult - retorno de computeMixScore
+ */
+export function buildScoreFields(scoringResult) {
+  const scoreValue = scoringResult.score || scoringResult.scorePct;
+  return {
+    score: Math.round(scoreValue * 10) / 10,
+    classification: scoringResult.classification || 'unknown',
+    scores: {
+      dynamicRange: scoringResult.breakdown?.dynamics || 0,
+      stereo: scoringResult.breakdown?.stereo || 0,
+      loudness: scoringResult.breakdown?.loudness || 0,
+      frequency: scoringResult.breakdown?.frequency || 0,
+      technical: scoringResult.breakdown?.technical || 0
+    },
+    scoring: {
+      method: scoringResult.method || 'Equal Weight V3',
+      score: scoreValue,
+      breakdown: scoringResult.breakdown || {
+        dynamics: null, technical: null, stereo: null, loudness: null, frequency: null
+      },
+      penalties: scoringResult.penalties || {},
+      bonuses: scoringResult.bonuses || {}
+    }
+  };
+}
+
 function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, options = {}) {
   const jobId = options.jobId || 'unknown';
-  const scoreValue = scoringResult.score || scoringResult.scorePct;
+  const scoreFields = buildScoreFields(scoringResult);
   
   // 🔥 LOG CIRÚRGICO: ENTRADA do buildFinalJSON
-  console.log('[GENRE-DEEP-TRACE][JSON-OUTPUT-PRE]', {
+  logger.debug(() => ['[GENRE-DEEP-TRACE][JSON-OUTPUT-PRE]', {
     ponto: 'json-output.js buildFinalJSON - ENTRADA',
     'options.genre': options.genre,
     'options.data?.genre': options.data?.genre,
     'options.genre_detected': options.genre_detected,
     'options.mode': options.mode
-  });
+  }]);
   
   // 🎯 CORREÇÃO: Resolver genre baseado no modo
   const isGenreMode = (options.mode || 'genre') === 'genre';
@@ -790,7 +836,7 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
 
   // 🚨 BLINDAGEM ABSOLUTA: Modo genre NÃO pode ter finalGenre null/default
   if (isGenreMode && (!finalGenre || finalGenre === 'default')) {
-    console.error('[JSON-OUTPUT-ERROR] Modo genre mas finalGenre inválido:', {
+    logger.error('[JSON-OUTPUT-ERROR] Modo genre mas finalGenre inválido:', {
       finalGenre,
       resolvedGenre,
       optionsGenre: options.genre,
@@ -800,14 +846,14 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
   }
 
   // 🚨 LOG DE AUDITORIA
-  console.log('[AUDIT-JSON-OUTPUT] finalGenre:', {
+  logger.debug(() => ['[AUDIT-JSON-OUTPUT] finalGenre:', {
     finalGenre,
     isGenreMode,
     optionsGenre: options.genre
-  });
+  }]);
   
   // 🔥 LOG CIRÚRGICO: DEPOIS de resolver finalGenre
-  console.log('[GENRE-DEEP-TRACE][JSON-OUTPUT-POST]', {
+  logger.debug(() => ['[GENRE-DEEP-TRACE][JSON-OUTPUT-POST]', {
     ponto: 'json-output.js buildFinalJSON - DEPOIS resolução',
     'isGenreMode': isGenreMode,
     'resolvedGenre': resolvedGenre,
@@ -815,7 +861,7 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
     'isNull': finalGenre === null,
     'isEmpty': finalGenre === '',
     'isDefault': finalGenre === 'default'
-  });
+  }]);
 
   return {
     // 🎯 CORREÇÃO CRÍTICA: Incluir genre, mode, soundDestination e referenceStage no JSON final
@@ -831,8 +877,8 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
     soundDestination: options.soundDestination || 'pista', // 🚨 CRÍTICO para override
     referenceStage: options.referenceStage || options.data?.referenceStage || null, // 🆕 BASE ou COMPARE
     referenceJobId: options.referenceJobId || null, // 🆕 ID da primeira música (se compare)
-    score: Math.round(scoreValue * 10) / 10,
-    classification: scoringResult.classification || 'unknown',
+    score: scoreFields.score,
+    classification: scoreFields.classification,
 
     loudness: {
       integrated: technicalData.lufsIntegrated,
@@ -967,23 +1013,9 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
     suggestionMetadata: null,
 
     // ===== SCORES (Subscores) =====
-    scores: {
-      dynamicRange: scoringResult.breakdown?.dynamics || 0,
-      stereo: scoringResult.breakdown?.stereo || 0,
-      loudness: scoringResult.breakdown?.loudness || 0,
-      frequency: scoringResult.breakdown?.frequency || 0,
-      technical: scoringResult.breakdown?.technical || 0
-    },
+    scores: scoreFields.scores,
 
-    scoring: {
-      method: scoringResult.method || 'Equal Weight V3',
-      score: scoreValue,
-      breakdown: scoringResult.breakdown || {
-        dynamics: null, technical: null, stereo: null, loudness: null, frequency: null
-      },
-      penalties: scoringResult.penalties || {},
-      bonuses: scoringResult.bonuses || {}
-    },
+    scoring: scoreFields.scoring,
 
     // ===== REFERENCE COMPARISON =====
     // 🎯 MODO REFERENCE: Comparar com métricas preloaded da faixa de referência
@@ -991,7 +1023,7 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
     referenceComparison: (() => {
       // 🔒 APENAS criar referenceComparison em modo reference COM métricas preloaded
       if (options.mode === 'reference' && options.preloadedReferenceMetrics) {
-        console.log('🎯 [JSON-OUTPUT] Gerando comparação por REFERÊNCIA (faixa real)');
+        logger.debug('🎯 [JSON-OUTPUT] Gerando comparação por REFERÊNCIA (faixa real)');
         
         // Passar opções completas para a função de comparação
         const comparisonOptions = {
@@ -1005,7 +1037,7 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
       }
       
       // 🛡️ MODO GÊNERO: Retornar undefined para NÃO criar o campo
-      console.log('🎵 [JSON-OUTPUT] Modo gênero detectado - referenceComparison NÃO será criado');
+      logger.debug('🎵 [JSON-OUTPUT] Modo gênero detectado - referenceComparison NÃO será criado');
       return undefined;
     })(),
 
@@ -1190,6 +1222,12 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
       timestamp: new Date().toISOString()
     },
 
+    // 🎚️ Perfil de análise (fast/detailed) e trechos re-analisados em hop fino
+    analysisProfile: coreMetrics.analysisProfile || null,
+
+    // 🎼 Gênero sugerido (top-3 + confiança) a partir das métricas já calculadas
+    genreDetection: detectGenre(technicalData, jobId),
+
     // 🔥 CAMPO OBRIGATÓRIO: data com genre, genreTargets e metrics
     // ✅ CORREÇÃO CRÍTICA: Adicionar metrics consolidado para sugestões
     // Frontend acessa: analysis.data.metrics e analysis.data.genreTargets
@@ -1252,12 +1290,12 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
         };
         
         // Log resumido (evitar flood)
-        console.log('[JSON-OUTPUT] 🎯 referenceTargetsNormalized gerado:', {
+        logger.debug(() => ['[JSON-OUTPUT] 🎯 referenceTargetsNormalized gerado:', {
           lufs: `[${normalized.metrics.lufs.min.toFixed(1)}, ${normalized.metrics.lufs.max.toFixed(1)}] → ${preCalculatedSeverities.metrics.lufs.severity}`,
           truePeak: `[${normalized.metrics.truePeak.min.toFixed(1)}, ${normalized.metrics.truePeak.max.toFixed(1)}] hardCap=${normalized.metrics.truePeak.hardCap} → ${preCalculatedSeverities.metrics.truePeak.severity}`,
           dr: `[${normalized.metrics.dr.min.toFixed(1)}, ${normalized.metrics.dr.max.toFixed(1)}] → ${preCalculatedSeverities.metrics.dr.severity}`,
           bandsWithSeverity: Object.keys(preCalculatedSeverities.bands).length
-        });
+        }]);
         
         return {
           ...normalized,
@@ -1370,13 +1408,13 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
           }
         };
         
-        console.log('[JSON-OUTPUT] 🎯 targetProfile gerado:', {
+        logger.debug(() => ['[JSON-OUTPUT] 🎯 targetProfile gerado:', {
           genre: profile._genre,
           truePeak: `[${profile.truePeak.tp_min}, ${profile.truePeak.tp_max}] target=${profile.truePeak.tp_target}`,
           lufs: `[${profile.lufs.min}, ${profile.lufs.max}] target=${profile.lufs.target}`,
           dr: `[${profile.dr.min}, ${profile.dr.max}] target=${profile.dr.target}`,
           bandCount: profile.bands ? Object.keys(profile.bands).length : 0
-        });
+        }]);
         
         return profile;
       })(),
@@ -1430,7 +1468,7 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
       // ════════════════════════════════════════════════════════════════════════════
       comparisonResult: (() => {
         if (!options.genreTargets) {
-          console.warn('[JSON-OUTPUT] ⚠️ comparisonResult: genreTargets ausente');
+          logger.warn('[JSON-OUTPUT] ⚠️ comparisonResult: genreTargets ausente');
           return null;
         }
         
@@ -1439,14 +1477,14 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
           const resolvedTargets = resolveTargets(finalGenre, 'pista', options.genreTargets);
           
           // 🔍 LOG DIAGNÓSTICO: rastrear valores finais de DR (deve mostrar min:7, max:12 para pop)
-          console.log('[JSON-OUTPUT] DR RANGE FINAL:', resolvedTargets.dr?.min, resolvedTargets.dr?.max,
+          logger.debug(() => ['[JSON-OUTPUT] DR RANGE FINAL:', resolvedTargets.dr?.min, resolvedTargets.dr?.max,
             '| LUFS:', resolvedTargets.lufs?.min, resolvedTargets.lufs?.max,
-            '| TP:', resolvedTargets.truePeak?.min, resolvedTargets.truePeak?.max);
+            '| TP:', resolvedTargets.truePeak?.min, resolvedTargets.truePeak?.max]);
           
           // Validar targets (guardrail)
           const validation = validateTargets(resolvedTargets);
           if (!validation.valid) {
-            console.error('[JSON-OUTPUT] ❌ Targets inválidos:', validation.errors);
+            logger.error('[JSON-OUTPUT] ❌ Targets inválidos:', validation.errors);
             // Continuar mesmo com erros (log apenas)
           }
           
@@ -1462,23 +1500,23 @@ function buildFinalJSON(coreMetrics, technicalData, scoringResult, metadata, opt
           // 🎯 EXECUTAR COMPARAÇÃO CENTRAL
           const result = compareWithTargets(metricsForComparison, resolvedTargets);
           
-          console.log('[JSON-OUTPUT] 🎯 comparisonResult gerado:', {
+          logger.debug(() => ['[JSON-OUTPUT] 🎯 comparisonResult gerado:', {
             rowsCount: result.rows.length,
             issuesCount: result.issues.length,
             score: result.score.total,
             classification: result.score.classification
-          });
+          }]);
           
           // Verificar invariante: TP > 0 = CRÍTICA
           const tpRow = result.rows.find(r => r.key === 'truePeak');
           if (tpRow && technicalData.truePeakDbtp > 0 && tpRow.severity !== 'CRÍTICA') {
-            console.error('[JSON-OUTPUT] 🚨 INVARIANTE VIOLADO: TP > 0 mas severity != CRÍTICA');
+            logger.error('[JSON-OUTPUT] 🚨 INVARIANTE VIOLADO: TP > 0 mas severity != CRÍTICA');
           }
           
           return result;
           
         } catch (error) {
-          console.error('[JSON-OUTPUT] ❌ Erro ao gerar comparisonResult:', error.message);
+          logger.error('[JSON-OUTPUT] ❌ Erro ao gerar comparisonResult:', error.message);
           return null;
         }
       })()
@@ -1553,10 +1591,10 @@ function validateFinalJSON(finalJSON) {
  * @returns {Object} - Estrutura completa com userTrack, referenceTrack, diff, suggestions
  */
 function generateReferenceComparison(userMetrics, referenceMetrics, options = {}) {
-  console.log('🎯 [REFERENCE-COMPARISON] Gerando comparação UserTrack vs ReferenceTrack');
+  logger.debug('🎯 [REFERENCE-COMPARISON] Gerando comparação UserTrack vs ReferenceTrack');
   
   if (!referenceMetrics || !referenceMetrics.technicalData) {
-    console.warn('⚠️ [REFERENCE-COMPARISON] Métricas de referência inválidas');
+    logger.warn('⚠️ [REFERENCE-COMPARISON] Métricas de referência inválidas');
     return null;
   }
 
@@ -1650,7 +1688,7 @@ function generateReferenceComparison(userMetrics, referenceMetrics, options = {}
   // Gerar sugestões baseadas nas diferenças
   const suggestions = generateReferenceSuggestions(comparison);
   
-  console.log(`✅ [REFERENCE-COMPARISON] Comparação gerada: ${suggestions.length} sugestões`);
+  logger.debug(() => [`✅ [REFERENCE-COMPARISON] Comparação gerada: ${suggestions.length} sugestões`]);
   
   // 🎯 NOVA ESTRUTURA COMPLETA: userTrack vs referenceTrack
   return {
@@ -2070,9 +2108,9 @@ function generateGenreReference(technicalData, genre) {
   // ===== 🎵 FREQUÊNCIAS DOMINANTES =====
   // REMOVED: Dominant Frequencies reference processing
   // Reason: REMOVAL_SKIPPED_USED_BY_SCORE:dominantFrequencies - removendo do export/referência
-  console.warn('REMOVAL_SKIPPED_USED_BY_SCORE:dominantFrequencies - removendo da referência por gênero');
+  logger.warn('REMOVAL_SKIPPED_USED_BY_SCORE:dominantFrequencies - removendo da referência por gênero');
   
   return references;
 }
 
-console.log("✅ JSON Output & Scoring (Fase 5.4) carregado - 100% compatível com frontend");
+logger.debug("✅ JSON Output & Scoring (Fase 5.4) carregado - 100% compatível com frontend");
@@ -1,13 +1,16 @@
 // 🎯 PIPELINE COMPLETO FASES 5.1 - 5.4 - CORRIGIDO
 // Integração completa com tratamento de erros padronizado e fail-fast
 
-import decodeAudioFile, { decodeAudioFromFile } from "./audio-decoder.js";              // Fase 5.1
+import decodeAudioFile, { decodeAudioFromFile, decodeAudioFromStream } from "./audio-decoder.js";              // Fase 5.1
 import { segmentAudioTemporal } from "./temporal-segmentation.js"; // Fase 5.2  
 import { calculateCoreMetrics } from "./core-metrics.js";      // Fase 5.3
 import { generateJSONOutput } from "./json-output.js";         // Fase 5.4
 import { analyzeProblemsAndSuggestionsV2 } from "../../lib/audio/features/problems-suggestions-v2.js"; // Fase 5.4.1
 import { loadGenreTargets, loadGenreTargetsFromWorker } from "../../lib/audio/utils/genre-targets-loader.js";
 import { normalizeGenreTargets } from "../../lib/audio/utils/normalize-genre-targets.js";
+import { applySoundDestinationOverride, toScoringReference, toFrontendFlatTargets } from "../../lib/audio/utils/scoring-targets.js";
+import { orderSuggestionsForUser } from "../../lib/audio/utils/suggestion-order.js";
+import { maskReducedSuggestions } from "../../lib/audio/utils/reduced-mode-mask.js";
 import fs from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
@@ -17,22 +20,25 @@ import { makeErr, logAudio, assertFinite } from '../../lib/audio/error-handling.
 
 // 🔬 MEMORY MONITOR — diagnóstico de retenção de RAM por etapa
 import { logMemoryDelta, clearMemoryDelta } from '../../lib/memory-monitor.js';
+import { profileStage, startProfileStage } from '../../lib/job-profiler.js';
+import { getAnalysisProfileName } from '../../lib/entitlements.js';
 
 // ✅ Banco de dados para buscar análise de referência
 import pool from '../../db.js';
 
 // 🔮 Sistema de enriquecimento IA (ULTRA V2)
 import { enrichSuggestionsWithAI } from '../../lib/ai/suggestion-enricher.js';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:pipeline-complete');
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-console.log('🎵 Pipeline Completo (Fases 5.1-5.4) carregado - Node.js Backend CORRIGIDO');
+logger.debug('🎵 Pipeline Completo (Fases 5.1-5.4) carregado - Node.js Backend CORRIGIDO');
 
-// 🔕 DEBUG CONTROLADO POR VARIÁVEL DE AMBIENTE
-// Para ativar: DEBUG_AUDIO=true node worker-redis.js
-const DEBUG_AUDIO = process.env.DEBUG_AUDIO === 'true';
-const debugLog = (...args) => { if (DEBUG_AUDIO) console.log(...args); };
+// 🔕 Dumps de entrada do pipeline em trace
+// Para ativar: LOG_LEVEL=trace (ou DEBUG_AUDIO=true) node worker-redis.js
 
 // 🎯 NORMALIZAÇÃO DE CHAVES DE BANDA - Resolve mismatch PT↔EN
 // spectralBands usa: sub, bass, lowMid, mid, highMid, presence, air (EN)
@@ -91,108 +97,13 @@ function getBandWithAlias(obj, bandKey) {
 }
 
 // 🚨 LOG DE INICIALIZAÇÃO DO PIPELINE
-console.error('\n\n');
-console.error('╔══════════════════════════════════════════════════════════════╗');
-console.error('║  🔥 PIPELINE-COMPLETE.JS INICIALIZADO                       ║');
-console.error('╚══════════════════════════════════════════════════════════════╝');
-console.error('[PIPELINE-INIT] Módulo carregado em:', new Date().toISOString());
-console.error('[PIPELINE-INIT] loadGenreTargetsFromWorker importado:', typeof loadGenreTargetsFromWorker);
-console.error('\n\n');
-
-/**
- * 🎯 FUNÇÃO DE ORDENAÇÃO PROFISSIONAL DE SUGESTÕES
- * Ordena sugestões seguindo prioridade técnica profissional:
- * 1. True Peak (mais crítico)
- * 2. LUFS
- * 3. Dynamic Range
- * 4. Headroom
- * 5. Bandas espectrais (sub → brilho)
- * 6. Stereo Width
- * 7. Outros
- */
-function orderSuggestionsForUser(suggestions) {
-  if (!Array.isArray(suggestions) || suggestions.length === 0) {
-    return suggestions;
-  }
-  
-  const weights = {
-    // Métricas críticas
-    'true_peak': 1,
-    'truePeak': 1,
-    'truePeakDbtp': 1,
-    
-    // Loudness
-    'lufs': 2,
-    'lufsIntegrated': 2,
-    
-    // Dinâmica
-    'dynamic_range': 3,
-    'dynamicRange': 3,
-    'dr': 3,
-    
-    // Headroom
-    'headroom': 4,
-    
-    // Bandas espectrais (ordem profissional: graves → agudos)
-    'sub': 5,
-    'low_bass': 6,
-    'bass': 6,
-    'upper_bass': 7,
-    'lowMid': 8,
-    'low_mid': 8,
-    'mid': 9,
-    'highMid': 10,
-    'high_mid': 10,
-    'presence': 11,
-    'presenca': 11,
-    'brilho': 12,
-    'air': 12,
-    
-    // Stereo
-    'stereo_width': 13,
-    'stereo': 13,
-    'stereoCorrelation': 13,
-    
-    // LRA
-    'lra': 14,
-    
-    // EQ genérico
-    'eq': 15,
-    'band': 15,
-    
-    // Outros
-    'other': 99
-  };
-  
-  return suggestions.sort((a, b) => {
-    // Determinar peso de cada sugestão
-    const getWeight = (sug) => {
-      // Tentar diferentes campos onde o tipo pode estar
-      const type = sug.type || sug.metric || sug.category || 'other';
-      
-      // Normalizar para minúsculas e remover espaços
-      const normalizedType = String(type).toLowerCase().replace(/\s+/g, '_');
-      
-      // Buscar peso, fallback para 99 (outros)
-      return weights[normalizedType] || weights[type] || 99;
-    };
-    
-    const wA = getWeight(a);
-    const wB = getWeight(b);
-    
-    // Ordenar por peso (menor peso = maior prioridade)
-    if (wA !== wB) {
-      return wA - wB;
-    }
-    
-    // Se pesos iguais, ordenar por severidade (se existir)
-    const severityOrder = { 'critical': 0, 'crítica': 0, 'high': 1, 'alta': 1, 'medium': 2, 'média': 2, 'low': 3, 'baixa': 3 };
-    const sevA = severityOrder[a.severity] || severityOrder[a.priority] || 99;
-    const sevB = severityOrder[b.severity] || severityOrder[b.priority] || 99;
-    
-    return sevA - sevB;
-  });
-}
+logger.error('\n\n');
+logger.error('╔══════════════════════════════════════════════════════════════╗');
+logger.error('║  🔥 PIPELINE-COMPLETE.JS INICIALIZADO                       ║');
+logger.error('╚══════════════════════════════════════════════════════════════╝');
+logger.error('[PIPELINE-INIT] Módulo carregado em:', new Date().toISOString());
+logger.error('[PIPELINE-INIT] loadGenreTargetsFromWorker importado:', typeof loadGenreTargetsFromWorker);
+logger.error('\n\n');
 
 /**
  * 🗂️ Criar arquivo temporário WAV para FFmpeg True Peak
@@ -209,17 +120,17 @@ function createTempWavFile(audioBuffer, audioData, fileName, jobId) {
     const tempFileName = `${jobId}_${Date.now()}_${path.parse(fileName).name}.wav`;
     const tempFilePath = path.join(tempDir, tempFileName);
     
-    console.log(`[TEMP_WAV] Criando arquivo temporário: ${tempFileName}`);
+    logger.debug(() => [`[TEMP_WAV] Criando arquivo temporário: ${tempFileName}`]);
     
     // Escrever o audioBuffer original no arquivo temporário
     fs.writeFileSync(tempFilePath, audioBuffer);
     
-    console.log(`[TEMP_WAV] ✅ Arquivo temporário criado: ${tempFilePath}`);
+    logger.debug(() => [`[TEMP_WAV] ✅ Arquivo temporário criado: ${tempFilePath}`]);
     
     return tempFilePath;
     
   } catch (error) {
-    console.error(`[TEMP_WAV] ❌ Erro ao criar arquivo temporário: ${error.message}`);
+    logger.error(`[TEMP_WAV] ❌ Erro ao criar arquivo temporário: ${error.message}`);
     throw new Error(`Failed to create temp WAV file: ${error.message}`);
   }
 }
@@ -231,10 +142,10 @@ function cleanupTempFile(tempFilePath) {
   try {
     if (tempFilePath && fs.existsSync(tempFilePath)) {
       fs.unlinkSync(tempFilePath);
-      console.log(`[TEMP_WAV] 🗑️ Arquivo temporário removido: ${path.basename(tempFilePath)}`);
+      logger.debug(() => [`[TEMP_WAV] 🗑️ Arquivo temporário removido: ${path.basename(tempFilePath)}`]);
     }
   } catch (error) {
-    console.warn(`[TEMP_WAV] ⚠️ Erro ao remover arquivo temporário: ${error.message}`);
+    logger.warn(`[TEMP_WAV] ⚠️ Erro ao remover arquivo temporário: ${error.message}`);
   }
 }
 
@@ -258,36 +169,36 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       }
     }
   }
-  console.log('[TARGETS] carregado: ' + (options.genre || 'N/A') + '.json');
-
-  debugLog('\n\n===== [DEBUG-PIPELINE-GENRE] Início do pipeline (WORK) =====');
-  debugLog('mode:', options?.mode);
-  debugLog('genre (options.genre):', options?.genre);
-  debugLog('finalGenre:', options?.finalGenre);
-  debugLog('selectedGenre:', options?.selectedGenre);
-  debugLog('genreTargets keys:', options?.genreTargets ? Object.keys(options.genreTargets) : null);
-  debugLog('jobId:', jobId);
-  debugLog('=====================================================\n\n');
+  logger.debug(() => ['[TARGETS] carregado: ' + (options.genre || 'N/A') + '.json']);
+
+  logger.trace('\n\n===== [DEBUG-PIPELINE-GENRE] Início do pipeline (WORK) =====');
+  logger.trace(() => ['mode:', options?.mode]);
+  logger.trace(() => ['genre (options.genre):', options?.genre]);
+  logger.trace(() => ['finalGenre:', options?.finalGenre]);
+  logger.trace(() => ['selectedGenre:', options?.selectedGenre]);
+  logger.trace(() => ['genreTargets keys:', options?.genreTargets ? Object.keys(options.genreTargets) : null]);
+  logger.trace(() => ['jobId:', jobId]);
+  logger.trace('=====================================================\n\n');
   
-  debugLog(`🚀 [${jobId.substring(0,8)}] Iniciando pipeline completo para: ${fileName}`);
-  debugLog(`📊 [${jobId.substring(0,8)}] Buffer size: ${audioBuffer != null ? audioBuffer.length + ' bytes' : 'N/A (file path mode)'}`);
-  debugLog(`🔧 [${jobId.substring(0,8)}] Opções:`, options);
+  logger.trace(() => [`🚀 [${jobId.substring(0,8)}] Iniciando pipeline completo para: ${fileName}`]);
+  logger.trace(() => [`📊 [${jobId.substring(0,8)}] Buffer size: ${audioBuffer != null ? audioBuffer.length + ' bytes' : 'N/A (file path mode)'}`]);
+  logger.trace(() => [`🔧 [${jobId.substring(0,8)}] Opções:`, options]);
   
   // 🔥 LOG OBRIGATÓRIO: ENTRADA DO PIPELINE
-  debugLog('[GENRE-TRACE][PIPELINE-INPUT]', {
+  logger.trace(() => ['[GENRE-TRACE][PIPELINE-INPUT]', {
     jobId: jobId.substring(0, 8),
     incomingGenre: options.genre,
     incomingTargets: options.genreTargets ? Object.keys(options.genreTargets) : null,
     mode: options.mode
-  });
+  }]);
   
   // PASSO 2: GARANTIR QUE O MODO NÃO VAZA PARA REFERÊNCIA
-  debugLog('[MODE-FLOW] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-  debugLog('[MODE-FLOW] MODO DETECTADO:', options.mode || 'genre');
-  debugLog('[MODE-FLOW] GENRE DETECTADO:', options.genre || '(null)');
-  debugLog('[MODE-FLOW] referenceJobId:', options.referenceJobId || 'null');
-  debugLog('[MODE-FLOW] isReferenceBase:', options.isReferenceBase || false);
-  debugLog('[MODE-FLOW] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.trace('[MODE-FLOW] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.trace(() => ['[MODE-FLOW] MODO DETECTADO:', options.mode || 'genre']);
+  logger.trace(() => ['[MODE-FLOW] GENRE DETECTADO:', options.genre || '(null)']);
+  logger.trace(() => ['[MODE-FLOW] referenceJobId:', options.referenceJobId || 'null']);
+  logger.trace(() => ['[MODE-FLOW] isReferenceBase:', options.isReferenceBase || false]);
+  logger.trace('[MODE-FLOW] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
 
   let audioData, segmentedData, coreMetrics, finalJSON;
   let audioBufferSize = 0; // 🧹 MEMORY FIX: capturado antes de liberar audioBuffer
@@ -310,13 +221,27 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     try {
       logAudio('decode', 'start', { fileName, jobId });
       const phase1StartTime = Date.now();
+      const endDecodeStage = startProfileStage('decode');
       
       // 🧹 MEMORY OPT: Se inputFilePath disponível, FFmpeg lê do disco (evita ~100MB na RAM)
       const inputFilePath = options.inputFilePath || null;
+      // 🌊 STREAMING: Body do bucket direto no stdin do FFmpeg (download + decode sobrepostos)
+      const inputStream = options.inputStream || null;
       
-      if (inputFilePath) {
-        console.log(`🧹 [${jobId.substring(0,8)}] Fase 5.1: decode via ARQUIVO (memory-optimized)`);
-        audioData = await decodeAudioFromFile(inputFilePath, fileName, { jobId });
+      if (inputStream) {
+        logger.debug(() => [`🌊 [${jobId.substring(0,8)}] Fase 5.1: decode via STREAM (download sobreposto)`]);
+        audioData = await decodeAudioFromStream(inputStream, fileName, { jobId, spillPath: options.spillPath || null });
+        
+        // A cópia em disco (gravada durante o decode) serve ao True Peak
+        tempFilePath = options.spillPath || null;
+        tempFileOwned = false; // NÃO deletar — o caller (worker.js) faz cleanup
+        
+        audioBufferSize = 0;
+        audioBuffer = null;
+      } else if (inputFilePath) {
+        logger.debug(() => [`🧹 [${jobId.substring(0,8)}] Fase 5.1: decode via ARQUIVO (memory-optimized)`]);
+        // expectedFrames (upgrade do quick-scan): duração já medida, sem ffprobe
+        audioData = await decodeAudioFromFile(inputFilePath, fileName, { jobId, expectedFrames: options.expectedFrames || null });
         
         // Usar o arquivo original como tempFile para True Peak (evita reescrever no disco)
         tempFilePath = inputFilePath;
@@ -338,8 +263,9 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       }
       
       timings.phase1_decode = Date.now() - phase1StartTime;
-      console.log(`✅ [${jobId.substring(0,8)}] Fase 5.1 concluída em ${timings.phase1_decode}ms`);
-      console.log(`📊 [${jobId.substring(0,8)}] Audio: ${audioData.sampleRate}Hz, ${audioData.numberOfChannels}ch, ${audioData.duration.toFixed(2)}s`);
+      endDecodeStage();
+      logger.debug(() => [`✅ [${jobId.substring(0,8)}] Fase 5.1 concluída em ${timings.phase1_decode}ms`]);
+      logger.debug(() => [`📊 [${jobId.substring(0,8)}] Audio: ${audioData.sampleRate}Hz, ${audioData.numberOfChannels}ch, ${audioData.duration.toFixed(2)}s`]);
 
       // 🔬 [MEM] Ponto 1 — após decode + liberação do audioBuffer original
       logMemoryDelta('pipeline', '1-after-decode', jobId);
@@ -354,11 +280,15 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       logAudio('segmentation', 'start', { fileName, jobId });
       const phase2StartTime = Date.now();
       
-      segmentedData = segmentAudioTemporal(audioData, { jobId, fileName });
+      // 🎚️ Perfil de análise: explícito > plano (lib/entitlements.js) > detailed
+      const analysisProfile = options.analysisProfile
+        || (options.planContext ? getAnalysisProfileName(options.planContext.plan, options.planContext.analysisMode) : null);
+      
+      segmentedData = profileStage('segmentation', () => segmentAudioTemporal(audioData, { jobId, fileName, analysisProfile }));
       
       timings.phase2_segmentation = Date.now() - phase2StartTime;
-      console.log(`✅ [${jobId.substring(0,8)}] Fase 5.2 concluída em ${timings.phase2_segmentation}ms`);
-      console.log(`📊 [${jobId.substring(0,8)}] Frames: FFT=${segmentedData.framesFFT.count}, RMS=${segmentedData.framesRMS.count}`);
+      logger.debug(() => [`✅ [${jobId.substring(0,8)}] Fase 5.2 concluída em ${timings.phase2_segmentation}ms`]);
+      logger.debug(() => [`📊 [${jobId.substring(0,8)}] Frames: FFT=${segmentedData.framesFFT.count}, RMS=${segmentedData.framesRMS.count}`]);
 
       // 🔬 [MEM] Ponto 2 — após segmentação: ~14k frames FFT × 4 Float32Arrays cada
       logMemoryDelta('pipeline', '2-after-segmentation', jobId);
@@ -380,21 +310,21 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       logAudio('core_metrics', 'start', { fileName, jobId });
       const phase3StartTime = Date.now();
       
-      coreMetrics = await calculateCoreMetrics(segmentedData, { 
+      coreMetrics = await profileStage('core_metrics', () => calculateCoreMetrics(segmentedData, { 
         jobId, 
         fileName,
         tempFilePath // Passar arquivo temporário para FFmpeg True Peak
-      });
+      }));
       
       timings.phase3_core_metrics = Date.now() - phase3StartTime;
-      console.log(`✅ [${jobId.substring(0,8)}] Fase 5.3 concluída em ${timings.phase3_core_metrics}ms`);
+      logger.debug(() => [`✅ [${jobId.substring(0,8)}] Fase 5.3 concluída em ${timings.phase3_core_metrics}ms`]);
       
       // Logs condicionais para evitar erros se métricas não existirem
       const lufsStr = coreMetrics.lufs?.integrated ? coreMetrics.lufs.integrated.toFixed(1) : 'N/A';
       const peakStr = coreMetrics.truePeak?.maxDbtp ? coreMetrics.truePeak.maxDbtp.toFixed(1) : 'N/A';
       const corrStr = coreMetrics.stereo?.correlation ? coreMetrics.stereo.correlation.toFixed(3) : 'N/A';
       
-      console.log(`📊 [${jobId.substring(0,8)}] LUFS: ${lufsStr}, Peak: ${peakStr}dBTP, Corr: ${corrStr}`);
+      logger.debug(() => [`📊 [${jobId.substring(0,8)}] LUFS: ${lufsStr}, Peak: ${peakStr}dBTP, Corr: ${corrStr}`]);
 
       // 🔬 [MEM] Ponto 3 — após core metrics
       logMemoryDelta('pipeline', '3-after-core-metrics', jobId);
@@ -429,6 +359,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     try {
       logAudio('output_scoring', 'start', { fileName, jobId });
       const phase4StartTime = Date.now();
+      const endJSONOutputStage = startProfileStage('json_output');
       
       // Construir metadata completo e seguro
       const metadata = {
@@ -465,20 +396,20 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       const isGenreMode = mode === 'genre';
       
       // 🔥 LOG CIRÚRGICO: ANTES de resolver genre (JSON Output)
-      console.log('[GENRE-DEEP-TRACE][PIPELINE-JSON-PRE]', {
+      logger.debug(() => ['[GENRE-DEEP-TRACE][PIPELINE-JSON-PRE]', {
         ponto: 'pipeline-complete.js linha ~197 - ANTES resolução',
         'options.genre': options.genre,
         'options.data?.genre': options.data?.genre,
         'options.genre_detected': options.genre_detected,
         'isGenreMode': isGenreMode
-      });
+      }]);
       
       // 🎯 CORREÇÃO: Resolver genre baseado no modo
       let resolvedGenre = options.genre || options.data?.genre || options.genre_detected || null;
 
       // 🚨 BLINDAGEM ABSOLUTA BUG #1: Modo genre exige gênero válido SEMPRE
       if (isGenreMode && (!resolvedGenre || resolvedGenre === 'default')) {
-        console.error('[PIPELINE-ERROR] Modo genre recebeu options.genre inválido:', {
+        logger.error('[PIPELINE-ERROR] Modo genre recebeu options.genre inválido:', {
           optionsGenre: options.genre,
           dataGenre: options.data?.genre,
           mode: options.mode,
@@ -492,50 +423,50 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         : (options.genre || 'default');
 
       // ── AUDIT STEP 1 ──
-      console.log("AUDIT GENRE →", detectedGenre);
+      logger.debug(() => ["AUDIT GENRE →", detectedGenre]);
 
       // 🚨 LOG DE AUDITORIA
-      console.log('[AUDIT-PIPELINE] Genre resolvido:', {
+      logger.debug(() => ['[AUDIT-PIPELINE] Genre resolvido:', {
         isGenreMode,
         resolvedGenre,
         detectedGenre,
         optionsGenre: options.genre
-      });
+      }]);
       
       // 🔥 LOG CIRÚRGICO: DEPOIS de resolver genre (JSON Output)
-      console.log('[GENRE-DEEP-TRACE][PIPELINE-JSON-POST]', {
+      logger.debug(() => ['[GENRE-DEEP-TRACE][PIPELINE-JSON-POST]', {
         ponto: 'pipeline-complete.js linha ~197 - DEPOIS resolução',
         'resolvedGenre': resolvedGenre,
         'detectedGenre': detectedGenre,
         'isNull': detectedGenre === null,
         'isDefault': detectedGenre === 'default'
-      });
+      }]);
       
-      console.log('[GENRE-FLOW][PIPELINE] Genre detectado (linha 195):', {
+      logger.debug(() => ['[GENRE-FLOW][PIPELINE] Genre detectado (linha 195):', {
         'options.genre': options.genre,
         'detectedGenre': detectedGenre,
         'isDefault': detectedGenre === 'default',
         'mode': mode,
         'isGenreMode': isGenreMode
-      });
+      }]);
       
       // 🔥 CARREGAR TARGETS DO FILESYSTEM (ANTES de usar)
       // 🎯 CRÍTICO: Definir soundDestination ANTES de qualquer lógica condicional
       // Esta variável deve estar SEMPRE disponível, independente do mode
       const soundDestination = options.soundDestination || 'pista';
       
-      console.log('[PIPELINE] 🎯 Sound Destination:', soundDestination);
+      logger.debug(() => ['[PIPELINE] 🎯 Sound Destination:', soundDestination]);
       
       if (mode !== 'reference' && detectedGenre && detectedGenre !== 'default') {
         // 🎯 PRIORIZAR TARGETS OFICIAIS DO FILESYSTEM (formato interno completo)
-        console.log('[TARGET-DEBUG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-        console.log('[TARGET-DEBUG] ANTES DE CARREGAR TARGETS:');
-        console.log('[TARGET-DEBUG] detectedGenre:', detectedGenre);
-        console.log('[TARGET-DEBUG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+        logger.debug('[TARGET-DEBUG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+        logger.debug('[TARGET-DEBUG] ANTES DE CARREGAR TARGETS:');
+        logger.debug(() => ['[TARGET-DEBUG] detectedGenre:', detectedGenre]);
+        logger.debug('[TARGET-DEBUG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
         
         // 🎯 CORREÇÃO DEFINITIVA: USAR loadGenreTargetsFromWorker (SEGURO)
         // Esta função NUNCA retorna fallback - sempre lança erro se arquivo não existir
-        console.log('[TARGETS] genre exato para carregamento:', detectedGenre);
+        logger.debug(() => ['[TARGETS] genre exato para carregamento:', detectedGenre]);
         try {
           let baseTargets = await loadGenreTargetsFromWorker(detectedGenre);
           if (!baseTargets) {
@@ -543,66 +474,50 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
           }
           
           // 🚨 LOG DE SUCESSO
-          console.error('\n');
-          console.error('╔═══════════════════════════════════════════════════════════╗');
-          console.error('║  ✅ TARGETS OFICIAIS CARREGADOS NO PIPELINE              ║');
-          console.error('╚═══════════════════════════════════════════════════════════╝');
-          console.error('[PIPELINE] Genre:', detectedGenre);
-          console.error('[PIPELINE] LUFS base:', baseTargets.lufs?.target);
-          console.error('[PIPELINE] TruePeak base:', baseTargets.truePeak?.target);
-          console.error('[PIPELINE] DR oficial:', baseTargets.dr?.target);
-          console.error('[PIPELINE] Bands disponíveis:', baseTargets.bands ? Object.keys(baseTargets.bands).length : 0);
-          console.error('\n');
+          logger.error('\n');
+          logger.error('╔═══════════════════════════════════════════════════════════╗');
+          logger.error('║  ✅ TARGETS OFICIAIS CARREGADOS NO PIPELINE              ║');
+          logger.error('╚═══════════════════════════════════════════════════════════╝');
+          logger.error('[PIPELINE] Genre:', detectedGenre);
+          logger.error('[PIPELINE] LUFS base:', baseTargets.lufs?.target);
+          logger.error('[PIPELINE] TruePeak base:', baseTargets.truePeak?.target);
+          logger.error('[PIPELINE] DR oficial:', baseTargets.dr?.target);
+          logger.error('[PIPELINE] Bands disponíveis:', baseTargets.bands ? Object.keys(baseTargets.bands).length : 0);
+          logger.error('\n');
           
           // 🎯 APLICAR OVERRIDE POR DESTINO DE ÁUDIO (runtime - único ponto)
-          customTargets = structuredClone(baseTargets);
+          customTargets = applySoundDestinationOverride(baseTargets, soundDestination);
           
           if (soundDestination === 'streaming') {
-            console.error('╔═══════════════════════════════════════════════════════════╗');
-            console.error('║  📡 APLICANDO OVERRIDE DE STREAMING                      ║');
-            console.error('╚═══════════════════════════════════════════════════════════╝');
-            
-            // Override LUFS para padrão de streaming
-            if (!customTargets.lufs) customTargets.lufs = {};
-            customTargets.lufs.target = -14;
-            customTargets.lufs.min = -14;
-            customTargets.lufs.max = -14;
-            customTargets.lufs.tolerance = 1.0;
-            customTargets.lufs.critical = 1.5;
-            
-            // Override True Peak para padrão de streaming
-            if (!customTargets.truePeak) customTargets.truePeak = {};
-            customTargets.truePeak.target = -1.0;
-            customTargets.truePeak.min = -1.5;
-            customTargets.truePeak.max = -1.0;
-            customTargets.truePeak.tolerance = 0.5;
-            customTargets.truePeak.critical = 0.75;
+            logger.error('╔═══════════════════════════════════════════════════════════╗');
+            logger.error('║  📡 APLICANDO OVERRIDE DE STREAMING                      ║');
+            logger.error('╚═══════════════════════════════════════════════════════════╝');
             
-            console.error('[PIPELINE] ✅ Override aplicado: LUFS =', customTargets.lufs.target, ', TruePeak =', customTargets.truePeak.target);
-            console.error('\n');
+            logger.error('[PIPELINE] ✅ Override aplicado: LUFS =', customTargets.lufs.target, ', TruePeak =', customTargets.truePeak.target);
+            logger.error('\n');
           }
           
         } catch (error) {
           const errorMsg = `[PIPELINE-ERROR] Falha ao carregar targets para "${detectedGenre}": ${error.message}`;
-          console.error(errorMsg);
+          logger.error(errorMsg);
           throw new Error(errorMsg);
         }
         
-        console.log(`[SUGGESTIONS_V1] ✅ Usando targets de ${detectedGenre} do filesystem (formato interno completo)`);
+        logger.debug(() => [`[SUGGESTIONS_V1] ✅ Usando targets de ${detectedGenre} do filesystem (formato interno completo)`]);
       } else if (mode === 'reference') {
-        console.log(`[SUGGESTIONS_V1] 🔒 Modo referência - ignorando targets de gênero`);
+        logger.debug(`[SUGGESTIONS_V1] 🔒 Modo referência - ignorando targets de gênero`);
       }
       
-      console.log('[GENRE-TARGETS-PATCH-V2] ----------');
-      console.log('[GENRE-TARGETS-PATCH-V2] customTargets presente?', !!customTargets);
+      logger.debug('[GENRE-TARGETS-PATCH-V2] ----------');
+      logger.debug(() => ['[GENRE-TARGETS-PATCH-V2] customTargets presente?', !!customTargets]);
       if (customTargets) {
-        console.log('[GENRE-TARGETS-PATCH-V2] keys:', Object.keys(customTargets));
-        console.log('[GENRE-TARGETS-PATCH-V2] lufs:', customTargets.lufs);
-        console.log('[GENRE-TARGETS-PATCH-V2] truePeak:', customTargets.truePeak);
-        console.log('[GENRE-TARGETS-PATCH-V2] dr:', customTargets.dr);
+        logger.debug(() => ['[GENRE-TARGETS-PATCH-V2] keys:', Object.keys(customTargets)]);
+        logger.debug(() => ['[GENRE-TARGETS-PATCH-V2] lufs:', customTargets.lufs]);
+        logger.debug(() => ['[GENRE-TARGETS-PATCH-V2] truePeak:', customTargets.truePeak]);
+        logger.debug(() => ['[GENRE-TARGETS-PATCH-V2] dr:', customTargets.dr]);
       }
-      console.log('[GENRE-TARGETS-PATCH-V2] usando:', customTargets ? 'customTargets (completo)' : 'options.genreTargets (fallback)');
-      console.log('[GENRE-TARGETS-PATCH-V2] ----------');
+      logger.debug(() => ['[GENRE-TARGETS-PATCH-V2] usando:', customTargets ? 'customTargets (completo)' : 'options.genreTargets (fallback)']);
+      logger.debug('[GENRE-TARGETS-PATCH-V2] ----------');
       
       // 🎯 CRÍTICO: Converter customTargets do formato aninhado {lufs: {target}} para flat {lufs_target}
       // O scoring.js espera formato FLAT (lufs_target, tol_lufs, etc.)
@@ -610,41 +525,21 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       
       // Se customTargets existe e tem formato aninhado, normalizar para flat
       if (customTargets && customTargets.lufs && typeof customTargets.lufs === 'object') {
-        console.log('[SCORING-FORMAT] 🔄 Convertendo formato aninhado → flat para scoring');
+        logger.debug('[SCORING-FORMAT] 🔄 Convertendo formato aninhado → flat para scoring');
         
-        referenceForScoring = {
-          lufs_target: customTargets.lufs?.target ?? -14,
-          tol_lufs: customTargets.lufs?.tolerance ?? 3.0,
-          tol_lufs_min: customTargets.lufs?.tolerance ?? 3.0,
-          tol_lufs_max: customTargets.lufs?.tolerance ?? 3.0,
-          
-          true_peak_target: customTargets.truePeak?.target ?? -1.0,
-          tol_true_peak: customTargets.truePeak?.tolerance ?? 0.5,
-          
-          dr_target: customTargets.dr?.target ?? 10,
-          tol_dr: customTargets.dr?.tolerance ?? 5,
-          
-          lra_target: customTargets.lra?.target ?? 7,
-          tol_lra: customTargets.lra?.tolerance ?? 5,
-          
-          stereo_target: customTargets.stereoWidth?.target ?? 0.3,
-          tol_stereo: customTargets.stereoWidth?.tolerance ?? 0.7,
-          
-          // Copiar bands se existirem
-          bands: customTargets.bands || {}
-        };
+        referenceForScoring = toScoringReference(customTargets);
         
-        console.log('[SCORING-FORMAT] ✅ Convertido:', {
+        logger.debug(() => ['[SCORING-FORMAT] ✅ Convertido:', {
           lufs_target: referenceForScoring.lufs_target,
           true_peak_target: referenceForScoring.true_peak_target
-        });
+        }]);
       }
       
-      console.log('[SCORING-DEBUG] 🎯 Reference passado para scoring:', {
+      logger.debug(() => ['[SCORING-DEBUG] 🎯 Reference passado para scoring:', {
         hasCustomTargets: !!customTargets,
         lufsTarget: referenceForScoring?.lufs_target,
         truePeakTarget: referenceForScoring?.true_peak_target
-      });
+      }]);
       
       // 🎯 CRÍTICO: customTargets está em formato NESTED mas JSON/frontend precisam AMBOS os formatos
       // O genreTargets (nested) é usado para exibir tabela, o data.targets (flat) é usado para scoring do frontend
@@ -654,25 +549,14 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       // O frontend precisa do formato flat (lufs_target) para aplicar os gates corretamente
       let flatTargetsForFrontend = null;
       if (genreTargetsForJSON) {
-        flatTargetsForFrontend = {
-          lufs_target: genreTargetsForJSON.lufs?.target ?? -14,
-          tol_lufs: genreTargetsForJSON.lufs?.tolerance ?? 3.0,
-          true_peak_target: genreTargetsForJSON.truePeak?.target ?? -1.0,
-          tol_true_peak: genreTargetsForJSON.truePeak?.tolerance ?? 0.5,
-          dr_target: genreTargetsForJSON.dr?.target ?? 10,
-          tol_dr: genreTargetsForJSON.dr?.tolerance ?? 5,
-          lra_target: genreTargetsForJSON.lra?.target ?? 7,
-          tol_lra: genreTargetsForJSON.lra?.tolerance ?? 5,
-          stereo_target: genreTargetsForJSON.stereoWidth?.target ?? 0.3,
-          tol_stereo: genreTargetsForJSON.stereoWidth?.tolerance ?? 0.7
-        };
+        flatTargetsForFrontend = toFrontendFlatTargets(genreTargetsForJSON);
         
-        console.error('╔═══════════════════════════════════════════════════════════╗');
-        console.error('║  🎯 FLAT TARGETS PARA FRONTEND (GATES)                   ║');
-        console.error('╚═══════════════════════════════════════════════════════════╝');
-        console.error('[PIPELINE] lufs_target:', flatTargetsForFrontend.lufs_target);
-        console.error('[PIPELINE] true_peak_target:', flatTargetsForFrontend.true_peak_target);
-        console.error('\n');
+        logger.error('╔═══════════════════════════════════════════════════════════╗');
+        logger.error('║  🎯 FLAT TARGETS PARA FRONTEND (GATES)                   ║');
+        logger.error('╚═══════════════════════════════════════════════════════════╝');
+        logger.error('[PIPELINE] lufs_target:', flatTargetsForFrontend.lufs_target);
+        logger.error('[PIPELINE] true_peak_target:', flatTargetsForFrontend.true_peak_target);
+        logger.error('\n');
       }
       
       finalJSON = generateJSONOutput(coreMetrics, referenceForScoring, metadata, { 
@@ -687,12 +571,13 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         referenceStage: options.referenceStage || options.analysisType === 'reference' ? (options.referenceJobId ? 'compare' : 'base') : null // 🆕 Detectar estágio
       });
       
-      console.log('[GENRE-FLOW][PIPELINE] ✅ Genre adicionado ao finalJSON:', {
+      logger.debug(() => ['[GENRE-FLOW][PIPELINE] ✅ Genre adicionado ao finalJSON:', {
         genre: finalJSON.genre,
         mode: finalJSON.mode
-      });
+      }]);
       
       timings.phase4_json_output = Date.now() - phase4StartTime;
+      endJSONOutputStage();
       
       // Atualizar o breakdown de tempo no metadata final
       if (finalJSON && finalJSON.metadata && finalJSON.metadata.phaseBreakdown) {
@@ -704,12 +589,12 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         score: finalJSON.score,
         classification: finalJSON.classification 
       });
-      console.log(`✅ [${jobId.substring(0,8)}] Fase 5.4 (JSON Output) concluída em ${timings.phase4_json_output}ms`);
+      logger.debug(() => [`✅ [${jobId.substring(0,8)}] Fase 5.4 (JSON Output) concluída em ${timings.phase4_json_output}ms`]);
       
       // Log seguro do score
       const scoreStr = finalJSON.score !== undefined ? finalJSON.score : 'N/A';
       const classStr = finalJSON.classification || 'N/A';
-      console.log(`🎯 [${jobId.substring(0,8)}] Score: ${scoreStr}% (${classStr})`);
+      logger.debug(() => [`🎯 [${jobId.substring(0,8)}] Score: ${scoreStr}% (${classStr})`]);
       
     } catch (error) {
       if (error.stage === 'output_scoring') {
@@ -724,12 +609,12 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     const isGenreMode = mode === 'genre';
     
     // 🔥 LOG CIRÚRGICO: ANTES de resolver genre (Suggestions V1)
-    console.log('[GENRE-DEEP-TRACE][PIPELINE-V1-PRE]', {
+    logger.debug(() => ['[GENRE-DEEP-TRACE][PIPELINE-V1-PRE]', {
       ponto: 'pipeline-complete.js linha ~260 - ANTES resolução V1',
       'options.genre': options.genre,
       'options.data?.genre': options.data?.genre,
       'isGenreMode': isGenreMode
-    });
+    }]);
     
     // 🎯 CORREÇÃO: Resolver genre baseado no modo
     const resolvedGenre = options.genre || options.data?.genre || options.genre_detected || null;
@@ -738,35 +623,35 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       : (options.genre || 'default');
     
     // 🔥 LOG CIRÚRGICO: DEPOIS de resolver genre (Suggestions V1)
-    console.log('[GENRE-DEEP-TRACE][PIPELINE-V1-POST]', {
+    logger.debug(() => ['[GENRE-DEEP-TRACE][PIPELINE-V1-POST]', {
       ponto: 'pipeline-complete.js linha ~260 - DEPOIS resolução V1',
       'resolvedGenre': resolvedGenre,
       'detectedGenre': detectedGenre,
       'isNull': detectedGenre === null,
       'isDefault': detectedGenre === 'default'
-    });
+    }]);
     
-    console.log('[GENRE-FLOW][PIPELINE] Genre detectado (linha 246):', {
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] Genre detectado (linha 246):', {
       'options.genre': options.genre,
       'detectedGenre': detectedGenre,
       'isDefault': detectedGenre === 'default',
       'mode': mode,
       'isGenreMode': isGenreMode
-    });
+    }]);
     
-    console.log('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-    console.log('[GENRE-FLOW][PIPELINE] 📊 Contexto recebido:');
-    console.log('[GENRE-FLOW][PIPELINE] mode:', mode);
-    console.log('[GENRE-FLOW][PIPELINE] detectedGenre:', detectedGenre);
-    console.log('[GENRE-FLOW][PIPELINE] options.genre:', options.genre);
-    console.log('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[GENRE-FLOW][PIPELINE] 📊 Contexto recebido:');
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] mode:', mode]);
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] detectedGenre:', detectedGenre]);
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] options.genre:', options.genre]);
+    logger.debug('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
     
-    console.log('[SUGGESTIONS_V1] 📊 Contexto:', {
+    logger.debug(() => ['[SUGGESTIONS_V1] 📊 Contexto:', {
       mode,
       detectedGenre,
       hasCoreMetrics: !!coreMetrics,
       coreMetricsKeys: Object.keys(coreMetrics || {})
-    });
+    }]);
     
     // 🛡️ BLINDAGEM PRIMÁRIA CORRIGIDA: Preservar genre correto, sem fallback 'default'
     // 🔥 PATCH 2: RESOLVER CORRETAMENTE O GÊNERO PARA O ANALYZER
@@ -781,15 +666,15 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     const finalGenreForAnalyzer = genreForAnalyzer || detectedGenre || options.genre || 'default';
     
     // 🧠 FASE 5.4.1 – Análise de problemas e sugestões V2 (fail-fast)
-    console.log('[DEBUG-SUGGESTIONS] =================================================');
-    console.log('[DEBUG-SUGGESTIONS] Entrando na FASE 5.4.1 – analyzeProblemsAndSuggestionsV2');
-    console.log('[DEBUG-SUGGESTIONS] finalGenreForAnalyzer:', finalGenreForAnalyzer);
-    console.log('[DEBUG-SUGGESTIONS] has customTargets?', !!customTargets);
-    console.log('[DEBUG-SUGGESTIONS] customTargets keys:', customTargets ? Object.keys(customTargets) : 'null');
-    console.log('[DEBUG-SUGGESTIONS] coreMetrics keys:', coreMetrics ? Object.keys(coreMetrics) : 'null');
-    console.log('[DEBUG-SUGGESTIONS] coreMetrics.lufs?.integrated:', coreMetrics?.lufs?.integrated);
-    console.log('[DEBUG-SUGGESTIONS] coreMetrics.dynamics?.dynamicRange:', coreMetrics?.dynamics?.dynamicRange);
-    console.log('[DEBUG-SUGGESTIONS] =================================================');
+    logger.debug('[DEBUG-SUGGESTIONS] =================================================');
+    logger.debug('[DEBUG-SUGGESTIONS] Entrando na FASE 5.4.1 – analyzeProblemsAndSuggestionsV2');
+    logger.debug(() => ['[DEBUG-SUGGESTIONS] finalGenreForAnalyzer:', finalGenreForAnalyzer]);
+    logger.debug(() => ['[DEBUG-SUGGESTIONS] has customTargets?', !!customTargets]);
+    logger.debug(() => ['[DEBUG-SUGGESTIONS] customTargets keys:', customTargets ? Object.keys(customTargets) : 'null']);
+    logger.debug(() => ['[DEBUG-SUGGESTIONS] coreMetrics keys:', coreMetrics ? Object.keys(coreMetrics) : 'null']);
+    logger.debug(() => ['[DEBUG-SUGGESTIONS] coreMetrics.lufs?.integrated:', coreMetrics?.lufs?.integrated]);
+    logger.debug(() => ['[DEBUG-SUGGESTIONS] coreMetrics.dynamics?.dynamicRange:', coreMetrics?.dynamics?.dynamicRange]);
+    logger.debug('[DEBUG-SUGGESTIONS] =================================================');
     
     // 🎯 CORREÇÃO CRÍTICA: Suggestion Engine SOMENTE para mode === 'genre'
     // Para mode === 'reference', definir aiSuggestions = [] e pular validação de targets
@@ -803,8 +688,8 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     }
 
     if (mode !== 'genre') {
-      console.log('[DEBUG-SUGGESTIONS] ⏭️ SKIP: Modo não é "genre", pulando Suggestion Engine');
-      console.log('[DEBUG-SUGGESTIONS] mode atual:', mode);
+      logger.debug('[DEBUG-SUGGESTIONS] ⏭️ SKIP: Modo não é "genre", pulando Suggestion Engine');
+      logger.debug(() => ['[DEBUG-SUGGESTIONS] mode atual:', mode]);
       
       // Definir estruturas vazias para reference mode
       finalJSON.problemsAnalysis = {
@@ -841,10 +726,10 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         skipped: true
       };
       
-      console.log('[DEBUG-SUGGESTIONS] ✅ Estruturas vazias definidas para reference mode');
+      logger.debug('[DEBUG-SUGGESTIONS] ✅ Estruturas vazias definidas para reference mode');
     } else {
       // 🎯 MODO GENRE: Executar Suggestion Engine normalmente
-      console.log('[DEBUG-SUGGESTIONS] ▶️ Executando Suggestion Engine para mode="genre"');
+      logger.debug('[DEBUG-SUGGESTIONS] ▶️ Executando Suggestion Engine para mode="genre"');
     
     try {
       // 🔥 CONSTRUIR consolidatedData a partir do finalJSON já criado
@@ -854,18 +739,18 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         // 🔧 NORMALIZAR TARGETS: Converter formato JSON real → formato analyzer
         let normalizedTargets = finalJSON.data.genreTargets || customTargets;
         
-        console.log('[DEBUG-SUGGESTIONS] 🔍 Formato original dos targets:', {
+        logger.debug(() => ['[DEBUG-SUGGESTIONS] 🔍 Formato original dos targets:', {
           hasLufsTarget: 'lufs_target' in (normalizedTargets || {}),
           hasLufsObject: normalizedTargets && normalizedTargets.lufs && 'target' in normalizedTargets.lufs
-        });
+        }]);
         
         // ✅ Aplicar normalização
         normalizedTargets = normalizeGenreTargets(normalizedTargets);
         
-        console.log('[DEBUG-SUGGESTIONS] ✅ Targets normalizados:', {
+        logger.debug(() => ['[DEBUG-SUGGESTIONS] ✅ Targets normalizados:', {
           lufsTarget: normalizedTargets && normalizedTargets.lufs && normalizedTargets.lufs.target,
           lufsTolerance: normalizedTargets && normalizedTargets.lufs && normalizedTargets.lufs.tolerance
-        });
+        }]);
         
         consolidatedData = {
           metrics: finalJSON.data.metrics || null,
@@ -873,32 +758,32 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         };
         
         // REGRA 9: Logs de auditoria mostrando consolidatedData
-        console.log('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
-        console.log('[AUDIT-CORRECTION] 📊 CONSOLIDATED DATA (pipeline-complete.js)');
-        console.log('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
-        console.log('[AUDIT-CORRECTION] Origem: finalJSON.data.metrics + finalJSON.data.genreTargets');
-        console.log('[AUDIT-CORRECTION] consolidatedData.metrics:', JSON.stringify({
+        logger.debug('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
+        logger.debug('[AUDIT-CORRECTION] 📊 CONSOLIDATED DATA (pipeline-complete.js)');
+        logger.debug('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
+        logger.debug('[AUDIT-CORRECTION] Origem: finalJSON.data.metrics + finalJSON.data.genreTargets');
+        logger.debug(() => ['[AUDIT-CORRECTION] consolidatedData.metrics:', JSON.stringify({
           loudness: consolidatedData.metrics?.loudness,
           truePeak: consolidatedData.metrics?.truePeak,
           dr: consolidatedData.metrics?.dr,
           stereo: consolidatedData.metrics?.stereo,
           hasBands: !!consolidatedData.metrics?.bands
-        }, null, 2));
-        console.log('[AUDIT-CORRECTION] consolidatedData.genreTargets:', JSON.stringify({
+        }, null, 2)]);
+        logger.debug(() => ['[AUDIT-CORRECTION] consolidatedData.genreTargets:', JSON.stringify({
           lufs: consolidatedData.genreTargets?.lufs,
           truePeak: consolidatedData.genreTargets?.truePeak,
           dr: consolidatedData.genreTargets?.dr,
           stereo: consolidatedData.genreTargets?.stereo,
           hasBands: !!consolidatedData.genreTargets?.bands
-        }, null, 2));
-        console.log('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
+        }, null, 2)]);
+        logger.debug('[AUDIT-CORRECTION] ════════════════════════════════════════════════════════════════');
         
-        console.log('[DEBUG-SUGGESTIONS] 🎯 consolidatedData construído a partir de finalJSON.data:', {
+        logger.debug(() => ['[DEBUG-SUGGESTIONS] 🎯 consolidatedData construído a partir de finalJSON.data:', {
           hasMetrics: !!consolidatedData.metrics,
           hasGenreTargets: !!consolidatedData.genreTargets,
           lufsValue: consolidatedData.metrics && consolidatedData.metrics.loudness && consolidatedData.metrics.loudness.value,
           lufsTarget: consolidatedData.genreTargets && consolidatedData.genreTargets.lufs && consolidatedData.genreTargets.lufs.target
-        });
+        }]);
       }
       
       // 🆕 STREAMING MODE: Passar soundDestination para o analyzer aplicar override
@@ -907,7 +792,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       // 🎯 UNIFICAÇÃO TABELA-CARDS: Extrair comparisonResult do finalJSON para garantir paridade
       const comparisonResult = finalJSON?.data?.comparisonResult || null;
       
-      const problemsAndSuggestions = analyzeProblemsAndSuggestionsV2(
+      const problemsAndSuggestions = profileStage('suggestions', () => analyzeProblemsAndSuggestionsV2(
         coreMetrics,
         finalGenreForAnalyzer,
         customTargets,
@@ -916,12 +801,12 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
           soundDestination: soundDestination,
           comparisonResult: comparisonResult  // 🎯 Passar comparisonResult para garantir paridade Tabela=Cards
         }
-      );
+      ));
       
-      console.log('[DEBUG-SUGGESTIONS] ✅ analyzeProblemsAndSuggestionsV2 retornou com sucesso');
-      console.log('[DEBUG-SUGGESTIONS] problems length:', problemsAndSuggestions?.problems?.length || 0);
-      console.log('[DEBUG-SUGGESTIONS] suggestions length:', problemsAndSuggestions?.suggestions?.length || 0);
-      console.log('[DEBUG-SUGGESTIONS] aiSuggestions length:', problemsAndSuggestions?.aiSuggestions?.length || 0);
+      logger.debug('[DEBUG-SUGGESTIONS] ✅ analyzeProblemsAndSuggestionsV2 retornou com sucesso');
+      logger.debug(() => ['[DEBUG-SUGGESTIONS] problems length:', problemsAndSuggestions?.problems?.length || 0]);
+      logger.debug(() => ['[DEBUG-SUGGESTIONS] suggestions length:', problemsAndSuggestions?.suggestions?.length || 0]);
+      logger.debug(() => ['[DEBUG-SUGGESTIONS] aiSuggestions length:', problemsAndSuggestions?.aiSuggestions?.length || 0]);
       
       // Garantir que o resultado seja atribuído corretamente no finalJSON
       if (problemsAndSuggestions) {
@@ -965,17 +850,17 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
           if (finalJSON.suggestionMetadata && typeof finalJSON.suggestionMetadata === 'object') {
             finalJSON.suggestionMetadata.genre = detectedGenre;
           }
-          console.log('[GENRE-BLINDAGEM-V1] Genre forçado em V1:', detectedGenre);
+          logger.debug(() => ['[GENRE-BLINDAGEM-V1] Genre forçado em V1:', detectedGenre]);
         }
       } else {
-        console.warn('[DEBUG-SUGGESTIONS] ⚠️ analyzeProblemsAndSuggestionsV2 retornou null/undefined. Mantendo estruturas atuais.');
+        logger.warn('[DEBUG-SUGGESTIONS] ⚠️ analyzeProblemsAndSuggestionsV2 retornou null/undefined. Mantendo estruturas atuais.');
       }
       
     } catch (suggestionsError) {
-      console.error('[SUGGESTIONS_V2] ❌ ERRO CRÍTICO ao gerar sugestões base');
-      console.error('[SUGGESTIONS_V2] Mensagem:', suggestionsError.message);
-      console.error('[SUGGESTIONS_V2] Stack:', suggestionsError.stack);
-      console.error('[SUGGESTIONS_V2] Contexto:', {
+      logger.error('[SUGGESTIONS_V2] ❌ ERRO CRÍTICO ao gerar sugestões base');
+      logger.error('[SUGGESTIONS_V2] Mensagem:', suggestionsError.message);
+      logger.error('[SUGGESTIONS_V2] Stack:', suggestionsError.stack);
+      logger.error('[SUGGESTIONS_V2] Contexto:', {
         finalGenreForAnalyzer,
         hasCustomTargets: !!customTargets,
         customTargetsKeys: customTargets ? Object.keys(customTargets) : 'null',
@@ -1001,16 +886,16 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         null;
       
       finalJSON.genre = genreFromData || finalGenreForAnalyzer || null;
-      console.log('[AUDIT-FIX] finalJSON.genre antes de enviar para o worker:', finalJSON.genre);
+      logger.debug(() => ['[AUDIT-FIX] finalJSON.genre antes de enviar para o worker:', finalJSON.genre]);
     }
 
     // ========= FASE 5.5: GERAÇÃO DE SUGESTÕES =========
     try {
-      console.log(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][ULTRA_DIAG] 🎯 INICIANDO FASE DE GERAÇÃO DE SUGESTÕES`);
-      console.log(`[AI-AUDIT][ULTRA_DIAG] Arquivo: ${fileName}`);
-      console.log(`[AI-AUDIT][ULTRA_DIAG] JobId: ${jobId}`);
-      console.log(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(`[AI-AUDIT][ULTRA_DIAG] 🎯 INICIANDO FASE DE GERAÇÃO DE SUGESTÕES`);
+      logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] Arquivo: ${fileName}`]);
+      logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] JobId: ${jobId}`]);
+      logger.debug(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
       
       // Gerar sugestões baseadas nas métricas técnicas
       const genre = options.genre || finalJSON.metadata?.genre || 'unknown';
@@ -1018,42 +903,42 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       const referenceJobId = options.referenceJobId;
       const isReferenceBase = options.isReferenceBase === true; // 🔧 FIX: Flag do frontend
       
-      console.log(`[AI-AUDIT][ULTRA_DIAG] 📊 Parâmetros:`, {
+      logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] 📊 Parâmetros:`, {
         genre,
         mode,
         hasReferenceJobId: !!referenceJobId,
         referenceJobId: referenceJobId,
         isReferenceBase: isReferenceBase // 🔧 FIX: Log da flag
-      });
+      }]);
       
-      console.log(`[AI-AUDIT][FLOW-CHECK] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][FLOW-CHECK] 🔍 VALIDAÇÃO DE FLUXO DE EXECUÇÃO`);
-      console.log(`[AI-AUDIT][FLOW-CHECK] mode === 'genre'?`, mode === 'genre');
-      console.log(`[AI-AUDIT][FLOW-CHECK] isReferenceBase === true?`, isReferenceBase === true);
-      console.log(`[AI-AUDIT][FLOW-CHECK] isReferenceBase === false?`, isReferenceBase === false);
-      console.log(`[AI-AUDIT][FLOW-CHECK] isReferenceBase === undefined?`, isReferenceBase === undefined);
-      console.log(`[AI-AUDIT][FLOW-CHECK] mode === 'reference'?`, mode === 'reference');
-      console.log(`[AI-AUDIT][FLOW-CHECK] hasReferenceJobId?`, !!referenceJobId);
-      console.log(`[AI-AUDIT][FLOW-CHECK] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(`[AI-AUDIT][FLOW-CHECK] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(`[AI-AUDIT][FLOW-CHECK] 🔍 VALIDAÇÃO DE FLUXO DE EXECUÇÃO`);
+      logger.debug(() => [`[AI-AUDIT][FLOW-CHECK] mode === 'genre'?`, mode === 'genre']);
+      logger.debug(() => [`[AI-AUDIT][FLOW-CHECK] isReferenceBase === true?`, isReferenceBase === true]);
+      logger.debug(() => [`[AI-AUDIT][FLOW-CHECK] isReferenceBase === false?`, isReferenceBase === false]);
+      logger.debug(() => [`[AI-AUDIT][FLOW-CHECK] isReferenceBase === undefined?`, isReferenceBase === undefined]);
+      logger.debug(() => [`[AI-AUDIT][FLOW-CHECK] mode === 'reference'?`, mode === 'reference']);
+      logger.debug(() => [`[AI-AUDIT][FLOW-CHECK] hasReferenceJobId?`, !!referenceJobId]);
+      logger.debug(`[AI-AUDIT][FLOW-CHECK] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
 
       
       // ========= NOVO SISTEMA DE SUGESTÕES V2 =========
       // ⚠️ IMPORTANTE: V1 já gerou suggestions base na fase 5.4.1
       // V2 aqui serve para complementar V1 no modo gênero
       
-      console.log('[V2-SYSTEM] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-      console.log('[V2-SYSTEM] 🎯 Executando Motor V2 para complementar V1');
-      console.log('[V2-SYSTEM] mode:', mode, 'isReferenceBase:', isReferenceBase);
-      console.log('[V2-SYSTEM] V1 já gerou:', finalJSON.suggestions?.length || 0, 'sugestões');
+      logger.debug('[V2-SYSTEM] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug('[V2-SYSTEM] 🎯 Executando Motor V2 para complementar V1');
+      logger.debug(() => ['[V2-SYSTEM] mode:', mode, 'isReferenceBase:', isReferenceBase]);
+      logger.debug(() => ['[V2-SYSTEM] V1 já gerou:', finalJSON.suggestions?.length || 0, 'sugestões']);
       
       // 🎯 CARREGAR TARGETS DO FILESYSTEM (APENAS MODO GÊNERO)
       // 🔥 LOG CIRÚRGICO: ANTES de resolver genre (Suggestions V2)
-      console.log('[GENRE-DEEP-TRACE][PIPELINE-V2-PRE]', {
+      logger.debug(() => ['[GENRE-DEEP-TRACE][PIPELINE-V2-PRE]', {
         ponto: 'pipeline-complete.js linha ~400 - ANTES resolução V2',
         'options.genre': options.genre,
         'options.data?.genre': options.data?.genre,
         'mode': mode
-      });
+      }]);
       
       // 🎯 CORREÇÃO: Resolver genre baseado no modo (reutilizar lógica)
       const resolvedGenreV2 = options.genre || options.data?.genre || options.genre_detected || null;
@@ -1062,70 +947,53 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         : (options.genre || 'default');
       
       // 🔥 LOG CIRÚRGICO: DEPOIS de resolver genre (Suggestions V2)
-      console.log('[GENRE-DEEP-TRACE][PIPELINE-V2-POST]', {
+      logger.debug(() => ['[GENRE-DEEP-TRACE][PIPELINE-V2-POST]', {
         ponto: 'pipeline-complete.js linha ~400 - DEPOIS resolução V2',
         'resolvedGenreV2': resolvedGenreV2,
         'detectedGenreV2': detectedGenreV2,
         'isNull': detectedGenreV2 === null,
         'isDefault': detectedGenreV2 === 'default'
-      });
+      }]);
       
       let customTargetsV2 = null;
       
-      console.log('[GENRE-FLOW][PIPELINE] Genre detectado (linha 376):', {
+      logger.debug(() => ['[GENRE-FLOW][PIPELINE] Genre detectado (linha 376):', {
         'options.genre': options.genre,
         'detectedGenreV2': detectedGenreV2,
         'isDefault': detectedGenreV2 === 'default',
         'mode': mode
-      });
+      }]);
       
       if (mode !== 'reference' && detectedGenreV2 && detectedGenreV2 !== 'default') {
         // 🎯 CORREÇÃO DEFINITIVA: USAR loadGenreTargetsFromWorker (SEGURO)
-        console.log('[TARGETS] [V2] genre exato para carregamento:', detectedGenreV2);
+        logger.debug(() => ['[TARGETS] [V2] genre exato para carregamento:', detectedGenreV2]);
         try {
           let baseTargetsV2 = await loadGenreTargetsFromWorker(detectedGenreV2);
           if (!baseTargetsV2) {
             throw new Error(`[PIPELINE-CRITICAL] loadGenreTargetsFromWorker retornou vazio para: ${detectedGenreV2}`);
           }
-          console.log(`[V2-SYSTEM] ✅ Targets base carregados de work/refs/out/${detectedGenreV2}.json`);
-          console.log(`[V2-SYSTEM] 📊 LUFS base: ${baseTargetsV2.lufs?.target}, TruePeak base: ${baseTargetsV2.truePeak?.target}`);
+          logger.debug(() => [`[V2-SYSTEM] ✅ Targets base carregados de work/refs/out/${detectedGenreV2}.json`]);
+          logger.debug(() => [`[V2-SYSTEM] 📊 LUFS base: ${baseTargetsV2.lufs?.target}, TruePeak base: ${baseTargetsV2.truePeak?.target}`]);
           
           // 🎯 APLICAR OVERRIDE POR DESTINO DE ÁUDIO (runtime - único ponto)
           // Usar soundDestination que já foi definido no escopo superior
-          customTargetsV2 = structuredClone(baseTargetsV2);
+          customTargetsV2 = applySoundDestinationOverride(baseTargetsV2, soundDestination);
           
           if (soundDestination === 'streaming') {
-            console.log('[V2-SYSTEM] 📡 Aplicando override de Streaming...');
-            
-            // Override LUFS
-            if (!customTargetsV2.lufs) customTargetsV2.lufs = {};
-            customTargetsV2.lufs.target = -14;
-            customTargetsV2.lufs.min = -14;
-            customTargetsV2.lufs.max = -14;
-            customTargetsV2.lufs.tolerance = 1.0;
-            customTargetsV2.lufs.critical = 1.5;
-            
-            // Override True Peak
-            if (!customTargetsV2.truePeak) customTargetsV2.truePeak = {};
-            customTargetsV2.truePeak.target = -1.0;
-            customTargetsV2.truePeak.min = -1.5;
-            customTargetsV2.truePeak.max = -1.0;
-            customTargetsV2.truePeak.tolerance = 0.5;
-            customTargetsV2.truePeak.critical = 0.75;
-            
-            console.log(`[V2-SYSTEM] ✅ Override aplicado: LUFS = ${customTargetsV2.lufs.target}, TruePeak = ${customTargetsV2.truePeak.target}`);
+            logger.debug('[V2-SYSTEM] 📡 Aplicando override de Streaming...');
+            logger.debug(() => [`[V2-SYSTEM] ✅ Override aplicado: LUFS = ${customTargetsV2.lufs.target}, TruePeak = ${customTargetsV2.truePeak.target}`]);
           }
         } catch (error) {
           const errorMsg = `[V2-SYSTEM-ERROR] Falha ao carregar targets para "${detectedGenreV2}": ${error.message}`;
-          console.error(errorMsg);
+          logger.error(errorMsg);
           throw new Error(errorMsg);
         }
       } else if (mode === 'reference') {
-        console.log(`[V2-SYSTEM] 🔒 Modo referência - ignorando targets de gênero`);
+        logger.debug(`[V2-SYSTEM] 🔒 Modo referência - ignorando targets de gênero`);
       }
       
       // 🔧 REINTEGRAÇÃO DO MOTOR V2
-      console.log('[V2-SYSTEM] 🔍 Validando coreMetrics antes de gerar V2...');
+      logger.debug('[V2-SYSTEM] 🔍 Validando coreMetrics antes de gerar V2...');
       if (!coreMetrics || typeof coreMetrics !== 'object') {
         throw new Error('coreMetrics inválido para Motor V2');
       }
@@ -1138,7 +1006,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         finalJSON?.genre ||
         'default';
       
-      console.log('[GENRE-BLINDAGEM-V2] genreForAnalyzerV2:', genreForAnalyzerV2);
+      logger.debug(() => ['[GENRE-BLINDAGEM-V2] genreForAnalyzerV2:', genreForAnalyzerV2]);
       
       // 🔥 CONSTRUIR consolidatedData para V2 também
       let consolidatedDataV2 = null;
@@ -1148,12 +1016,12 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
           genreTargets: finalJSON.data.genreTargets || customTargetsV2
         };
         
-        console.log('[V2-SYSTEM] 🎯 consolidatedDataV2 construído:', {
+        logger.debug(() => ['[V2-SYSTEM] 🎯 consolidatedDataV2 construído:', {
           hasMetrics: !!consolidatedDataV2.metrics,
           hasGenreTargets: !!consolidatedDataV2.genreTargets,
           lufsValue: consolidatedDataV2.metrics?.loudness?.value,
           lufsTarget: consolidatedDataV2.genreTargets?.lufs?.target
-        });
+        }]);
       }
       
       // 🆕 STREAMING MODE: Passar soundDestination para V2 também
@@ -1162,11 +1030,11 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       // 🎯 UNIFICAÇÃO TABELA-CARDS V2: Extrair comparisonResult
       const comparisonResultV2 = finalJSON?.data?.comparisonResult || null;
       
-      const v2 = analyzeProblemsAndSuggestionsV2(coreMetrics, genreForAnalyzerV2, customTargetsV2, { 
+      const v2 = profileStage('suggestions', () => analyzeProblemsAndSuggestionsV2(coreMetrics, genreForAnalyzerV2, customTargetsV2, { 
         data: consolidatedDataV2,
         soundDestination: soundDestinationV2,
         comparisonResult: comparisonResultV2  // 🎯 Passar comparisonResult para garantir paridade
-      });
+      }));
       
       const v2Suggestions = v2.suggestions || [];
       const v2Problems = v2.problems || [];
@@ -1174,25 +1042,25 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       const v2Metadata = v2.metadata || {};
       
       // PASSO 5: LOGS PARA VALIDAÇÃO DO MOTOR V2
-      console.log('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-      console.log('[SUGGESTIONS] V2 count:', v2Suggestions.length);
-      console.log('[SUGGESTIONS] V2 sample:', v2Suggestions[0]);
-      console.log('[V2-SYSTEM] 📊 Dados do V2:', {
+      logger.debug('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug(() => ['[SUGGESTIONS] V2 count:', v2Suggestions.length]);
+      logger.debug(() => ['[SUGGESTIONS] V2 sample:', v2Suggestions[0]]);
+      logger.debug(() => ['[V2-SYSTEM] 📊 Dados do V2:', {
         suggestions: v2Suggestions.length,
         problems: v2Problems.length,
         hasMetadata: !!Object.keys(v2Metadata).length,
         hasSummary: !!Object.keys(v2Summary).length
-      });
-      console.log('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      }]);
+      logger.debug('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
       
       // 🛡️ GUARDIÃO: Primeira música da referência NÃO gera sugestões absolutas
       if (mode === 'genre' && isReferenceBase === true) {
-        console.log('[V2-SYSTEM] Primeira música da referência - mantemos json neutro, mas NÃO apagamos sugestões futuras');
+        logger.debug('[V2-SYSTEM] Primeira música da referência - mantemos json neutro, mas NÃO apagamos sugestões futuras');
         // Não gera V2 e não gera AI aqui. Apenas deixa como está.
       } else if (mode === 'genre' && isReferenceBase !== true) {
         // ✅ MODO GÊNERO: Aplicar Motor V2 ao JSON final
         // 🔧 CORREÇÃO FASE 2: NÃO duplicar V1+V2, usar APENAS V2 (Enhanced Engine)
-        console.log('[SUGGESTIONS_V2] ✔ Aplicando Motor V2 ao JSON final (sem V1)');
+        logger.debug('[SUGGESTIONS_V2] ✔ Aplicando Motor V2 ao JSON final (sem V1)');
         const v1Count = finalJSON.suggestions?.length || 0;
         
         // ✅ USAR APENAS V2: Sistema Enhanced Engine é o único oficial
@@ -1200,29 +1068,29 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         finalJSON.problemsAnalysis.suggestions = v2Suggestions;
         finalJSON.diagnostics.suggestions = v2Suggestions;
         
-        console.log('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-        console.log('[SUGGESTIONS] 🛠️ CORREÇÃO FASE 2: V1 DESABILITADO');
-        console.log('[SUGGESTIONS] V1 original count (ignorado):', v1Count);
-        console.log('[SUGGESTIONS] V2 Enhanced count (USADO):', v2Suggestions.length);
-        console.log('[SUGGESTIONS] Final count:', finalJSON.suggestions.length);
-        console.log('[SUGGESTIONS] ✅ Duplicação eliminada: apenas V2 ativo');
-        console.log('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-        console.log(`[V2-SYSTEM] ✅ V2 integrado: ${v2Suggestions.length} sugestões (V1 desabilitado)`);
-        console.log(`[V2-SYSTEM] 📊 Total suggestions: ${finalJSON.suggestions.length}`);
+        logger.debug('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+        logger.debug('[SUGGESTIONS] 🛠️ CORREÇÃO FASE 2: V1 DESABILITADO');
+        logger.debug(() => ['[SUGGESTIONS] V1 original count (ignorado):', v1Count]);
+        logger.debug(() => ['[SUGGESTIONS] V2 Enhanced count (USADO):', v2Suggestions.length]);
+        logger.debug(() => ['[SUGGESTIONS] Final count:', finalJSON.suggestions.length]);
+        logger.debug('[SUGGESTIONS] ✅ Duplicação eliminada: apenas V2 ativo');
+        logger.debug('[SUGGESTIONS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+        logger.debug(() => [`[V2-SYSTEM] ✅ V2 integrado: ${v2Suggestions.length} sugestões (V1 desabilitado)`]);
+        logger.debug(() => [`[V2-SYSTEM] 📊 Total suggestions: ${finalJSON.suggestions.length}`]);
       } else {
         // Modo reference - ignora V1 e V2 (usa apenas comparação)
-        console.log('[V2-SYSTEM] Modo reference - ignorando V1 e V2');
+        logger.debug('[V2-SYSTEM] Modo reference - ignorando V1 e V2');
       }
       
       // 🤖 ENRIQUECIMENTO IA OBRIGATÓRIO - MODO GENRE
       // ✅ REGRA: SEMPRE enriquecer sugestões, NUNCA pular esta etapa
       // 🚀 OTIMIZAÇÃO PERFORMANCE: Iniciar chamada IA em paralelo
-      console.log('[AI-AUDIT][ULTRA_DIAG] 🚀 Enviando sugestões base para IA (modo genre)...');
-      console.log('[AI-AUDIT][ULTRA_DIAG] Sugestões base count:', finalJSON.suggestions?.length || 0);
+      logger.debug('[AI-AUDIT][ULTRA_DIAG] 🚀 Enviando sugestões base para IA (modo genre)...');
+      logger.debug(() => ['[AI-AUDIT][ULTRA_DIAG] Sugestões base count:', finalJSON.suggestions?.length || 0]);
       
       // ❌ VALIDAÇÃO: Garantir que há sugestões para enriquecer
       if (!finalJSON.suggestions || finalJSON.suggestions.length === 0) {
-        console.warn('[AI-AUDIT][ULTRA_DIAG] ⚠️ Nenhuma sugestão base para enriquecer - criando fallback');
+        logger.warn('[AI-AUDIT][ULTRA_DIAG] ⚠️ Nenhuma sugestão base para enriquecer - criando fallback');
         finalJSON.suggestions = [{
           metric: 'info',
           severity: 'info',
@@ -1249,32 +1117,32 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       // 🚀 PERFORMANCE: Iniciar chamada IA agora (não-bloqueante)
       // A promise roda em paralelo enquanto fazemos outras operações de logging
       const aiPromiseStartTime = Date.now();
-      const aiEnrichmentPromise = enrichSuggestionsWithAI(finalJSON.suggestions, aiContext);
+      const aiEnrichmentPromise = profileStage('ai', () => enrichSuggestionsWithAI(finalJSON.suggestions, aiContext));
       
-      console.log('[PIPELINE][AI-CONTEXT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-      console.log('[PIPELINE][AI-CONTEXT] 🚀 IA iniciada em paralelo (não-bloqueante)');
-      console.log('[PIPELINE][AI-CONTEXT] aiContext enviado ao enrichment:', {
+      logger.debug('[PIPELINE][AI-CONTEXT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug('[PIPELINE][AI-CONTEXT] 🚀 IA iniciada em paralelo (não-bloqueante)');
+      logger.debug(() => ['[PIPELINE][AI-CONTEXT] aiContext enviado ao enrichment:', {
         hasCustomTargets: !!aiContext.customTargets,
         hasGenreTargets: !!aiContext.genreTargets,
         customTargetsKeys: aiContext.customTargets ? Object.keys(aiContext.customTargets) : [],
         hasBands: !!aiContext.customTargets?.bands
-      });
-      console.log('[PIPELINE][AI-CONTEXT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      }]);
+      logger.debug('[PIPELINE][AI-CONTEXT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
       
       try {
         // 🚀 AWAIT apenas quando necessário - IA pode ter terminado enquanto logávamos
         finalJSON.aiSuggestions = await aiEnrichmentPromise;
-        console.log(`[PIPELINE][AI-PERF] ✅ IA completou em ${Date.now() - aiPromiseStartTime}ms`);
+        logger.debug(() => [`[PIPELINE][AI-PERF] ✅ IA completou em ${Date.now() - aiPromiseStartTime}ms`]);
         
         // ❌ VALIDAÇÃO CRÍTICA: IA DEVE retornar sugestões
         if (!finalJSON.aiSuggestions || finalJSON.aiSuggestions.length === 0) {
           throw new Error('enrichSuggestionsWithAI retornou array vazio ou null');
         }
         
-        console.log(`[AI-AUDIT][ULTRA_DIAG] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões enriquecidas`);
+        logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões enriquecidas`]);
       } catch (aiError) {
-        console.error('[AI-AUDIT][ULTRA_DIAG] ❌ ERRO CRÍTICO ao executar enrichSuggestionsWithAI:', aiError.message);
-        console.error('[AI-AUDIT][ULTRA_DIAG] Stack:', aiError.stack);
+        logger.error('[AI-AUDIT][ULTRA_DIAG] ❌ ERRO CRÍTICO ao executar enrichSuggestionsWithAI:', aiError.message);
+        logger.error('[AI-AUDIT][ULTRA_DIAG] Stack:', aiError.stack);
         
         // ✅ FALLBACK OBRIGATÓRIO: Manter sugestões base com flag de erro
         finalJSON.aiSuggestions = finalJSON.suggestions.map(sug => ({
@@ -1287,36 +1155,36 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
           solucao: sug.action || 'Consulte sugestão base'
         }));
         
-        console.warn('[AI-AUDIT][ULTRA_DIAG] ⚠️ Usando fallback: sugestões base sem enriquecimento');
+        logger.warn('[AI-AUDIT][ULTRA_DIAG] ⚠️ Usando fallback: sugestões base sem enriquecimento');
       }
       
-      console.log('[V2-SYSTEM] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-      console.log('[V2-SYSTEM] 📊 Resultado final:', {
+      logger.debug('[V2-SYSTEM] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug(() => ['[V2-SYSTEM] 📊 Resultado final:', {
         suggestions: finalJSON.suggestions?.length || 0,
         aiSuggestions: finalJSON.aiSuggestions?.length || 0,
         problems: finalJSON.problems?.length || 0
-      });
+      }]);
       
       // ✅ MODO REFERENCE: Comparar com análise de referência
       // 🔒 SEGURANÇA: Só criar referenceComparison quando for REALMENTE modo reference E tiver referenceJobId
       if (mode === "reference" && referenceJobId) {
-        console.log("[REFERENCE-MODE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
-        console.log("[REFERENCE-MODE] 🎯 MODO REFERENCE ATIVADO");
-        console.log("[REFERENCE-MODE] ReferenceJobId:", options.referenceJobId);
-        console.log("[REFERENCE-MODE] ✅ Condições: mode='reference' + referenceJobId presente");
-        console.log("[REFERENCE-MODE] ⚠️ V1 e V2 serão IGNORADOS - apenas comparação A/B");
-        console.log("[REFERENCE-MODE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+        logger.debug("[REFERENCE-MODE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
+        logger.debug("[REFERENCE-MODE] 🎯 MODO REFERENCE ATIVADO");
+        logger.debug(() => ["[REFERENCE-MODE] ReferenceJobId:", options.referenceJobId]);
+        logger.debug("[REFERENCE-MODE] ✅ Condições: mode='reference' + referenceJobId presente");
+        logger.debug("[REFERENCE-MODE] ⚠️ V1 e V2 serão IGNORADOS - apenas comparação A/B");
+        logger.debug("[REFERENCE-MODE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━");
         
         // 🔍 AUDITORIA PONTO 1: Confirmação de contexto inicial
-        console.log('[AI-AUDIT][REF] 🔍 referenceJobId detectado:', options.referenceJobId);
-        console.log('[AI-AUDIT][REF] 🔍 mode inicial:', mode);
+        logger.debug(() => ['[AI-AUDIT][REF] 🔍 referenceJobId detectado:', options.referenceJobId]);
+        logger.debug(() => ['[AI-AUDIT][REF] 🔍 mode inicial:', mode]);
         
         try {
           // REGRA 1: Usar SEMPRE results (coluna correta do PostgreSQL)
-          console.log('[AUDIT-CORRECTION] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-          console.log('[AUDIT-CORRECTION] 🔍 Buscando job de referência');
-          console.log('[AUDIT-CORRECTION] referenceJobId:', options.referenceJobId);
-          console.log('[AUDIT-CORRECTION] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+          logger.debug('[AUDIT-CORRECTION] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+          logger.debug('[AUDIT-CORRECTION] 🔍 Buscando job de referência');
+          logger.debug(() => ['[AUDIT-CORRECTION] referenceJobId:', options.referenceJobId]);
+          logger.debug('[AUDIT-CORRECTION] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
           
           const refJob = await pool.query("SELECT results FROM jobs WHERE id = $1", [options.referenceJobId]);
           
@@ -1326,25 +1194,25 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
               ? JSON.parse(refJob.rows[0].results)
               : refJob.rows[0].results;
             
-            console.log('[AUDIT-CORRECTION] ✅ Job de referência encontrado');
-            console.log('[AUDIT-CORRECTION] refData.data.metrics:', !!refData.data?.metrics);
-            console.log('[AUDIT-CORRECTION] refData.data.genreTargets:', !!refData.data?.genreTargets);
+            logger.debug('[AUDIT-CORRECTION] ✅ Job de referência encontrado');
+            logger.debug(() => ['[AUDIT-CORRECTION] refData.data.metrics:', !!refData.data?.metrics]);
+            logger.debug(() => ['[AUDIT-CORRECTION] refData.data.genreTargets:', !!refData.data?.genreTargets]);
             
-            console.log("[REFERENCE-MODE] Análise de referência encontrada:", {
+            logger.debug(() => ["[REFERENCE-MODE] Análise de referência encontrada:", {
               jobId: options.referenceJobId,
               hasMetrics: !!(refData.lufs && refData.truePeak),
               fileName: refData.fileName || refData.metadata?.fileName
-            });
+            }]);
             
             // 🔍 AUDITORIA: Validar métricas antes de calcular deltas
-            console.log("[REFERENCE-MODE] Validando métricas de referência:", {
+            logger.debug(() => ["[REFERENCE-MODE] Validando métricas de referência:", {
               hasLufs: !!refData.lufs,
               lufsValue: refData.lufs?.integrated,
               hasTruePeak: !!refData.truePeak,
               truePeakValue: refData.truePeak?.maxDbtp,
               hasDynamics: !!refData.dynamics,
               dynamicsValue: refData.dynamics?.range
-            });
+            }]);
             
             // Gerar deltas A/B
             const referenceComparison = generateReferenceDeltas(coreMetrics, {
@@ -1361,8 +1229,8 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
             });
             
             if (hasInvalidDeltas) {
-              console.error("[REFERENCE-MODE] ❌ CRÍTICO: Deltas inválidos detectados!");
-              console.error("[REFERENCE-MODE] referenceComparison:", JSON.stringify(referenceComparison, null, 2));
+              logger.error("[REFERENCE-MODE] ❌ CRÍTICO: Deltas inválidos detectados!");
+              logger.error("[REFERENCE-MODE] referenceComparison:", JSON.stringify(referenceComparison, null, 2));
               throw new Error("Invalid deltas detected in referenceComparison");
             }
             
@@ -1372,57 +1240,57 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
             finalJSON.referenceFileName = refData.fileName || refData.metadata?.fileName;
             
             // 🔍 AUDITORIA PONTO 2: Persistência do objeto de comparação
-            console.log('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-            console.log('[AI-AUDIT][REF] 📦 OBJETO referenceComparison CRIADO E SALVO');
-            console.log('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-            console.log('[AI-AUDIT][REF] Contexto de comparação salvo:', !!referenceComparison);
-            console.log('[AI-AUDIT][REF] Campos em finalJSON:', {
+            logger.debug('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+            logger.debug('[AI-AUDIT][REF] 📦 OBJETO referenceComparison CRIADO E SALVO');
+            logger.debug('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+            logger.debug(() => ['[AI-AUDIT][REF] Contexto de comparação salvo:', !!referenceComparison]);
+            logger.debug(() => ['[AI-AUDIT][REF] Campos em finalJSON:', {
               hasReferenceComparison: !!finalJSON.referenceComparison,
               hasReferenceJobId: !!finalJSON.referenceJobId,
               hasReferenceFileName: !!finalJSON.referenceFileName,
               referenceComparisonKeys: Object.keys(referenceComparison || {}),
               sampleDelta: referenceComparison?.lufs?.delta
-            });
-            console.log('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+            }]);
+            logger.debug('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
             
             // Gerar sugestões comparativas
             finalJSON.suggestions = generateComparisonSuggestions(referenceComparison);
             
-            console.log("[REFERENCE-MODE] ✅ Comparação A/B gerada:", {
+            logger.debug(() => ["[REFERENCE-MODE] ✅ Comparação A/B gerada:", {
               deltasCalculados: Object.keys(referenceComparison).length,
               suggestoesComparativas: finalJSON.suggestions.length,
               hasIsComparisonFlag: finalJSON.suggestions.some(s => s.isComparison)
-            });
+            }]);
             
             // � LOG DE DIAGNÓSTICO: Sugestões base geradas
-            console.log(`[AI-AUDIT][ULTRA_DIAG] ✅ Sugestões base detectadas: ${finalJSON.suggestions.length} itens`);
-            console.log(`[AI-AUDIT][ULTRA_DIAG] 📋 Sample de sugestão base:`, {
+            logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] ✅ Sugestões base detectadas: ${finalJSON.suggestions.length} itens`]);
+            logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] 📋 Sample de sugestão base:`, {
               type: finalJSON.suggestions[0]?.type,
               category: finalJSON.suggestions[0]?.category,
               message: finalJSON.suggestions[0]?.message?.substring(0, 50) + '...',
               isComparison: finalJSON.suggestions[0]?.isComparison,
               priority: finalJSON.suggestions[0]?.priority
-            });
+            }]);
             
             // �🔮 ENRIQUECIMENTO IA ULTRA V2
             try {
-              console.log('[AI-AUDIT][ULTRA_DIAG] 🚀 Enviando sugestões base para IA...');
+              logger.debug('[AI-AUDIT][ULTRA_DIAG] 🚀 Enviando sugestões base para IA...');
               
               // 🔍 AUDITORIA PONTO 3: Verificação antes do enrich
-              console.log('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-              console.log('[AI-AUDIT][REF] 🤖 PRÉ-ENRICH: Verificando contexto');
-              console.log('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-              console.log('[AI-AUDIT][REF] Mode antes do enrich:', mode);
-              console.log('[AI-AUDIT][REF] referenceComparison existe?', !!referenceComparison);
-              console.log('[AI-AUDIT][REF] referenceComparison em finalJSON?', !!finalJSON.referenceComparison);
-              console.log('[AI-AUDIT][REF] Será enviado para enrichSuggestionsWithAI:', {
+              logger.debug('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+              logger.debug('[AI-AUDIT][REF] 🤖 PRÉ-ENRICH: Verificando contexto');
+              logger.debug('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+              logger.debug(() => ['[AI-AUDIT][REF] Mode antes do enrich:', mode]);
+              logger.debug(() => ['[AI-AUDIT][REF] referenceComparison existe?', !!referenceComparison]);
+              logger.debug(() => ['[AI-AUDIT][REF] referenceComparison em finalJSON?', !!finalJSON.referenceComparison]);
+              logger.debug(() => ['[AI-AUDIT][REF] Será enviado para enrichSuggestionsWithAI:', {
                 hasReferenceComparison: !!referenceComparison,
                 referenceComparisonKeys: Object.keys(referenceComparison || {}),
                 mode: mode || 'reference'
-              });
-              console.log('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+              }]);
+              logger.debug('[AI-AUDIT][REF] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
               
-              console.log('[AI-AUDIT][ULTRA_DIAG] 🚀 Enviando para IA com contexto de comparação...');
+              logger.debug('[AI-AUDIT][ULTRA_DIAG] 🚀 Enviando para IA com contexto de comparação...');
               
               // 🤖 ENRIQUECIMENTO IA ULTRA V2 - MODO REFERENCE COM COMPARAÇÃO
               try {
@@ -1437,12 +1305,12 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
                   deltas: referenceComparison
                 };
                 
-                finalJSON.aiSuggestions = await enrichSuggestionsWithAI(finalJSON.suggestions, aiContext);
+                finalJSON.aiSuggestions = await profileStage('ai', () => enrichSuggestionsWithAI(finalJSON.suggestions, aiContext));
                 
-                console.log(`[AI-AUDIT][ULTRA_DIAG] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões enriquecidas`);
+                logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões enriquecidas`]);
               } catch (aiError) {
-                console.error('[AI-AUDIT][ULTRA_DIAG] ❌ Falha ao executar enrichSuggestionsWithAI:', aiError.message);
-                console.error('[AI-AUDIT][ULTRA_DIAG] Stack:', aiError.stack);
+                logger.error('[AI-AUDIT][ULTRA_DIAG] ❌ Falha ao executar enrichSuggestionsWithAI:', aiError.message);
+                logger.error('[AI-AUDIT][ULTRA_DIAG] Stack:', aiError.stack);
                 finalJSON.aiSuggestions = finalJSON.suggestions.map(sug => ({
                   ...sug,
                   aiEnhanced: false,
@@ -1451,7 +1319,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
                 }));
               }
             } catch (aiError) {
-              console.error('[AI-AUDIT][ULTRA_DIAG] ❌ Erro ao processar referência:', aiError.message);
+              logger.error('[AI-AUDIT][ULTRA_DIAG] ❌ Erro ao processar referência:', aiError.message);
               finalJSON.aiSuggestions = finalJSON.suggestions.map(sug => ({
                 ...sug,
                 aiEnhanced: false,
@@ -1460,33 +1328,33 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
               }));
             }
           } else {
-            console.warn("[REFERENCE-MODE] ⚠️ Job de referência não encontrado - gerando sugestões genéricas");
+            logger.warn("[REFERENCE-MODE] ⚠️ Job de referência não encontrado - gerando sugestões genéricas");
             finalJSON.suggestions = generateAdvancedSuggestionsFromScoring(coreMetrics, coreMetrics.scoring, genre, mode, customTargets);
             
             // � LOG DE DIAGNÓSTICO: Sugestões base geradas (fallback)
-            console.log(`[AI-AUDIT][ULTRA_DIAG] ✅ Sugestões base detectadas (fallback): ${finalJSON.suggestions.length} itens`);
+            logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] ✅ Sugestões base detectadas (fallback): ${finalJSON.suggestions.length} itens`]);
             
             // �🔮 ENRIQUECIMENTO IA ULTRA V2 (fallback mode)
             try {
-              console.log('[AI-AUDIT][FALLBACK] Suggestions base prontas, IA sera processada de forma assincrona');
+              logger.debug('[AI-AUDIT][FALLBACK] Suggestions base prontas, IA sera processada de forma assincrona');
               finalJSON.aiSuggestions = [];
             } catch (aiError) {
-              console.error('[AI-AUDIT][ULTRA_DIAG] ❌ Falha ao executar enrichSuggestionsWithAI:', aiError.message);
+              logger.error('[AI-AUDIT][ULTRA_DIAG] ❌ Falha ao executar enrichSuggestionsWithAI:', aiError.message);
               finalJSON.aiSuggestions = [];
             }
           }
         } catch (refError) {
-          console.error("[REFERENCE-MODE] ❌ Erro ao buscar referência:", refError.message);
-          console.warn("[REFERENCE-MODE] Gerando sugestões avançadas como fallback");
-          console.log('[REFERENCE-MODE-ERROR-FALLBACK] 🚀 Usando sistema avançado de sugestões com scoring.penalties');
+          logger.error("[REFERENCE-MODE] ❌ Erro ao buscar referência:", refError.message);
+          logger.warn("[REFERENCE-MODE] Gerando sugestões avançadas como fallback");
+          logger.debug('[REFERENCE-MODE-ERROR-FALLBACK] 🚀 Usando sistema avançado de sugestões com scoring.penalties');
           finalJSON.suggestions = generateAdvancedSuggestionsFromScoring(coreMetrics, coreMetrics.scoring, genre, mode, customTargets);
           
           // 🔍 LOG DE DIAGNÓSTICO: Sugestões avançadas geradas (error fallback)
-          console.log(`[AI-AUDIT][ULTRA_DIAG] ✅ Sugestões avançadas detectadas (error fallback): ${finalJSON.suggestions.length} itens`);
+          logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] ✅ Sugestões avançadas detectadas (error fallback): ${finalJSON.suggestions.length} itens`]);
           
           // 🤖 ENRIQUECIMENTO IA ULTRA V2 (error fallback)
           try {
-            console.log('[AI-AUDIT][ERROR-FALLBACK] 🚀 Enviando para IA (error fallback)...');
+            logger.debug('[AI-AUDIT][ERROR-FALLBACK] 🚀 Enviando para IA (error fallback)...');
             
             const aiContext = {
               genre: finalGenreForAnalyzer,
@@ -1499,11 +1367,11 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
               deltas: null
             };
             
-            finalJSON.aiSuggestions = await enrichSuggestionsWithAI(finalJSON.suggestions, aiContext);
+            finalJSON.aiSuggestions = await profileStage('ai', () => enrichSuggestionsWithAI(finalJSON.suggestions, aiContext));
             
-            console.log(`[AI-AUDIT][ERROR-FALLBACK] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões`);
+            logger.debug(() => [`[AI-AUDIT][ERROR-FALLBACK] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões`]);
           } catch (aiError) {
-            console.error('[AI-AUDIT][ERROR-FALLBACK] ❌ Erro no enriquecimento IA:', aiError.message);
+            logger.error('[AI-AUDIT][ERROR-FALLBACK] ❌ Erro no enriquecimento IA:', aiError.message);
             finalJSON.aiSuggestions = finalJSON.suggestions.map(sug => ({
               ...sug,
               aiEnhanced: false,
@@ -1516,70 +1384,70 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       
       // 🔒 GARANTIA ADICIONAL: Remover referenceComparison se não for modo reference
       if (mode !== "reference" && finalJSON.referenceComparison) {
-        console.log("[SECURITY] ⚠️ referenceComparison detectado em modo não-reference - removendo!");
-        console.log("[SECURITY] mode atual:", mode);
-        console.log("[SECURITY] isReferenceBase:", isReferenceBase);
+        logger.debug("[SECURITY] ⚠️ referenceComparison detectado em modo não-reference - removendo!");
+        logger.debug(() => ["[SECURITY] mode atual:", mode]);
+        logger.debug(() => ["[SECURITY] isReferenceBase:", isReferenceBase]);
         delete finalJSON.referenceComparison;
         delete finalJSON.referenceJobId;
         delete finalJSON.referenceFileName;
-        console.log("[SECURITY] ✅ referenceComparison removido - modo gênero limpo");
+        logger.debug("[SECURITY] ✅ referenceComparison removido - modo gênero limpo");
       }
       
       // 🔍 LOG DE DIAGNÓSTICO: Estrutura final do JSON
-      console.log(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][ULTRA_DIAG] 🔁 ESTRUTURA FINAL DO JSON`);
-      console.log(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][ULTRA_DIAG] 📦 Campos principais:`, Object.keys(finalJSON));
-      console.log(`[AI-AUDIT][ULTRA_DIAG] 📊 Métricas:`, {
+      logger.debug(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(`[AI-AUDIT][ULTRA_DIAG] 🔁 ESTRUTURA FINAL DO JSON`);
+      logger.debug(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] 📦 Campos principais:`, Object.keys(finalJSON)]);
+      logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] 📊 Métricas:`, {
         hasLufs: !!finalJSON.lufs,
         hasTruePeak: !!finalJSON.truePeak,
         hasDynamics: !!finalJSON.dynamics,
         hasSpectralBands: !!finalJSON.spectralBands
-      });
-      console.log(`[AI-AUDIT][ULTRA_DIAG] 💡 Sugestões:`, {
+      }]);
+      logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] 💡 Sugestões:`, {
         hasSuggestions: Array.isArray(finalJSON.suggestions),
         suggestionsCount: finalJSON.suggestions?.length || 0,
         hasAISuggestions: Array.isArray(finalJSON.aiSuggestions),
         aiSuggestionsCount: finalJSON.aiSuggestions?.length || 0
-      });
-      console.log(`[AI-AUDIT][ULTRA_DIAG] 🔄 Comparação:`, {
+      }]);
+      logger.debug(() => [`[AI-AUDIT][ULTRA_DIAG] 🔄 Comparação:`, {
         hasReferenceComparison: !!finalJSON.referenceComparison,
         hasReferenceJobId: !!finalJSON.referenceJobId,
         hasReferenceFileName: !!finalJSON.referenceFileName
-      });
-      console.log(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      }]);
+      logger.debug(`[AI-AUDIT][ULTRA_DIAG] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
       
       // 🔥 LOG ADICIONAL: Confirmar se algum array está vazio quando não deveria
       if (mode === 'genre' && !isReferenceBase) {
         if (!finalJSON.suggestions || finalJSON.suggestions.length === 0) {
-          console.error(`[AI-AUDIT][CRITICAL] ❌❌❌ SUGGESTIONS VAZIO EM MODO GENRE!`);
-          console.error(`[AI-AUDIT][CRITICAL] Isso indica que generateAdvancedSuggestionsFromScoring falhou`);
+          logger.error(`[AI-AUDIT][CRITICAL] ❌❌❌ SUGGESTIONS VAZIO EM MODO GENRE!`);
+          logger.error(`[AI-AUDIT][CRITICAL] Isso indica que generateAdvancedSuggestionsFromScoring falhou`);
         }
         if (!finalJSON.aiSuggestions || finalJSON.aiSuggestions.length === 0) {
-          console.error(`[AI-AUDIT][CRITICAL] ❌❌❌ AI_SUGGESTIONS VAZIO EM MODO GENRE!`);
-          console.error(`[AI-AUDIT][CRITICAL] Isso indica que enrichSuggestionsWithAI falhou ou não foi chamado`);
+          logger.error(`[AI-AUDIT][CRITICAL] ❌❌❌ AI_SUGGESTIONS VAZIO EM MODO GENRE!`);
+          logger.error(`[AI-AUDIT][CRITICAL] Isso indica que enrichSuggestionsWithAI falhou ou não foi chamado`);
         }
       }
       
       if (mode === 'reference' && referenceJobId) {
         if (!finalJSON.suggestions || finalJSON.suggestions.length === 0) {
-          console.error(`[AI-AUDIT][CRITICAL] ❌❌❌ SUGGESTIONS VAZIO EM MODO REFERENCE!`);
-          console.error(`[AI-AUDIT][CRITICAL] Isso indica que generateComparisonSuggestions falhou`);
+          logger.error(`[AI-AUDIT][CRITICAL] ❌❌❌ SUGGESTIONS VAZIO EM MODO REFERENCE!`);
+          logger.error(`[AI-AUDIT][CRITICAL] Isso indica que generateComparisonSuggestions falhou`);
         }
         if (!finalJSON.aiSuggestions || finalJSON.aiSuggestions.length === 0) {
-          console.error(`[AI-AUDIT][CRITICAL] ❌❌❌ AI_SUGGESTIONS VAZIO EM MODO REFERENCE!`);
-          console.error(`[AI-AUDIT][CRITICAL] Isso indica que enrichSuggestionsWithAI falhou ou não foi chamado`);
+          logger.error(`[AI-AUDIT][CRITICAL] ❌❌❌ AI_SUGGESTIONS VAZIO EM MODO REFERENCE!`);
+          logger.error(`[AI-AUDIT][CRITICAL] Isso indica que enrichSuggestionsWithAI falhou ou não foi chamado`);
         }
       }
       
-      console.log(`[AI-AUDIT][ASSIGN.inputType] suggestions:`, typeof finalJSON.suggestions, Array.isArray(finalJSON.suggestions));
-      console.log(`[AI-AUDIT][ASSIGN.sample]`, finalJSON.suggestions?.slice(0, 2));
+      logger.debug(() => [`[AI-AUDIT][ASSIGN.inputType] suggestions:`, typeof finalJSON.suggestions, Array.isArray(finalJSON.suggestions)]);
+      logger.debug(() => [`[AI-AUDIT][ASSIGN.sample]`, finalJSON.suggestions?.slice(0, 2)]);
       
     } catch (error) {
       // 🔧 FIX: Remover catch que zerava aiSuggestions silenciosamente
       // Qualquer erro REAL deve ser propagado, mas garantir arrays vazios
-      console.error(`[SUGGESTIONS_ERROR] ❌ ERRO CRÍTICO ao gerar sugestões:`, error.message);
-      console.error(`[SUGGESTIONS_ERROR] ❌ Stack:`, error.stack);
+      logger.error(`[SUGGESTIONS_ERROR] ❌ ERRO CRÍTICO ao gerar sugestões:`, error.message);
+      logger.error(`[SUGGESTIONS_ERROR] ❌ Stack:`, error.stack);
       
       // Garantir arrays vazios em caso de erro REAL
       if (!Array.isArray(finalJSON.suggestions)) {
@@ -1589,7 +1457,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
         // 🤖 Tentar enriquecer mesmo com erro (se há suggestions base)
         if (finalJSON.suggestions.length > 0) {
           try {
-            console.log('[AI-AUDIT][CATCH] 🚀 Tentando enriquecer após erro...');
+            logger.debug('[AI-AUDIT][CATCH] 🚀 Tentando enriquecer após erro...');
             const aiContext = {
               genre: finalGenreForAnalyzer || 'default',
               mode: mode || 'genre',
@@ -1600,10 +1468,10 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
               referenceFileName: null,
               deltas: null
             };
-            finalJSON.aiSuggestions = await enrichSuggestionsWithAI(finalJSON.suggestions, aiContext);
-            console.log(`[AI-AUDIT][CATCH] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões`);
+            finalJSON.aiSuggestions = await profileStage('ai', () => enrichSuggestionsWithAI(finalJSON.suggestions, aiContext));
+            logger.debug(() => [`[AI-AUDIT][CATCH] ✅ IA retornou ${finalJSON.aiSuggestions.length} sugestões`]);
           } catch (aiError) {
-            console.error('[AI-AUDIT][CATCH] ❌ Falha final ao enriquecer:', aiError.message);
+            logger.error('[AI-AUDIT][CATCH] ❌ Falha final ao enriquecer:', aiError.message);
             finalJSON.aiSuggestions = [];
           }
         } else {
@@ -1615,7 +1483,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       }
       
       // 🚨 IMPORTANTE: Não silenciar erro - logar para debug
-      console.error('[SUGGESTIONS_ERROR] ❌ Continuando com arrays vazios mas erro será investigado');
+      logger.error('[SUGGESTIONS_ERROR] ❌ Continuando com arrays vazios mas erro será investigado');
     }
 
     // ========= FINALIZAÇÃO =========
@@ -1635,7 +1503,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     
     // ✅ FALLBACK OBRIGATÓRIO: Sempre exibir pelo menos uma sugestão
     if (!Array.isArray(finalJSON.suggestions) || finalJSON.suggestions.length === 0) {
-      console.warn('[FALLBACK] ⚠️ Nenhuma sugestão gerada - criando mensagem padrão');
+      logger.warn('[FALLBACK] ⚠️ Nenhuma sugestão gerada - criando mensagem padrão');
       finalJSON.suggestions = [{
         type: 'info',
         metric: 'info',
@@ -1649,7 +1517,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     }
     
     if (!Array.isArray(finalJSON.aiSuggestions) || finalJSON.aiSuggestions.length === 0) {
-      console.warn('[FALLBACK] ⚠️ Nenhuma sugestão AI - usando sugestões base');
+      logger.warn('[FALLBACK] ⚠️ Nenhuma sugestão AI - usando sugestões base');
       finalJSON.aiSuggestions = finalJSON.suggestions.map(sug => ({
         ...sug,
         problema: sug.message || 'Análise concluída',
@@ -1661,9 +1529,9 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       }));
     }
     
-    console.log('[ORDERING] ✅ Sugestões ordenadas por prioridade profissional');
-    console.log('[ORDERING] suggestions:', finalJSON.suggestions.length, 'itens');
-    console.log('[ORDERING] aiSuggestions:', finalJSON.aiSuggestions.length, 'itens');
+    logger.debug('[ORDERING] ✅ Sugestões ordenadas por prioridade profissional');
+    logger.debug(() => ['[ORDERING] suggestions:', finalJSON.suggestions.length, 'itens']);
+    logger.debug(() => ['[ORDERING] aiSuggestions:', finalJSON.aiSuggestions.length, 'itens']);
     
     // Validação final - garantir que não temos NaN/Infinity
     try {
@@ -1674,15 +1542,15 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
 
     // 🔒 GARANTIA FINAL: Validar estrutura obrigatória antes de retornar
     if (!Array.isArray(finalJSON.suggestions)) {
-      console.error("[SUGGESTIONS_ERROR] suggestions ausente no retorno final - forçando array vazio");
+      logger.error("[SUGGESTIONS_ERROR] suggestions ausente no retorno final - forçando array vazio");
       finalJSON.suggestions = [];
     }
     if (!Array.isArray(finalJSON.aiSuggestions)) {
-      console.error("[SUGGESTIONS_ERROR] aiSuggestions ausente no retorno final - forçando array vazio");
+      logger.error("[SUGGESTIONS_ERROR] aiSuggestions ausente no retorno final - forçando array vazio");
       finalJSON.aiSuggestions = [];
     }
     if (!finalJSON.problemsAnalysis || typeof finalJSON.problemsAnalysis !== 'object') {
-      console.error("[SUGGESTIONS_ERROR] problemsAnalysis ausente no retorno final - forçando objeto padrão");
+      logger.error("[SUGGESTIONS_ERROR] problemsAnalysis ausente no retorno final - forçando objeto padrão");
       finalJSON.problemsAnalysis = { 
         problems: [], 
         suggestions: finalJSON.suggestions || [],
@@ -1699,24 +1567,24 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     }
     
     // 🔥 LOG CIRÚRGICO: ANTES de validar summary/metadata (final)
-    console.log('[GENRE-DEEP-TRACE][FINAL-VALIDATION-PRE]', {
+    logger.debug(() => ['[GENRE-DEEP-TRACE][FINAL-VALIDATION-PRE]', {
       ponto: 'pipeline-complete.js linha ~860 - ANTES validação final',
       'finalJSON.summary existe?': !!finalJSON.summary,
       'finalJSON.summary.genre': finalJSON.summary?.genre,
       'finalJSON.suggestionMetadata existe?': !!finalJSON.suggestionMetadata,
       'finalJSON.suggestionMetadata.genre': finalJSON.suggestionMetadata?.genre
-    });
+    }]);
     
     if (!finalJSON.summary || typeof finalJSON.summary !== 'object') {
-      console.log('[GENRE-DEEP-TRACE][FINAL-VALIDATION-RESET-SUMMARY]', {
+      logger.debug(() => ['[GENRE-DEEP-TRACE][FINAL-VALIDATION-RESET-SUMMARY]', {
         alerta: 'summary era inválido - RESETANDO (genre perdido)'
-      });
+      }]);
       finalJSON.summary = {};
     }
     if (!finalJSON.suggestionMetadata || typeof finalJSON.suggestionMetadata !== 'object') {
-      console.log('[GENRE-DEEP-TRACE][FINAL-VALIDATION-RESET-METADATA]', {
+      logger.debug(() => ['[GENRE-DEEP-TRACE][FINAL-VALIDATION-RESET-METADATA]', {
         alerta: 'suggestionMetadata era inválido - RESETANDO (genre perdido)'
-      });
+      }]);
       finalJSON.suggestionMetadata = {};
     }
     
@@ -1730,44 +1598,44 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       }
     }
 
-    console.log(`🏁 [${jobId.substring(0,8)}] Pipeline completo finalizado em ${totalTime}ms`);
-    console.log(`✅ [${jobId.substring(0,8)}] JSON final pronto para salvar no banco`);
-    console.log(`[✅ FINAL_STRUCTURE] Estrutura validada:`, {
+    logger.debug(() => [`🏁 [${jobId.substring(0,8)}] Pipeline completo finalizado em ${totalTime}ms`]);
+    logger.debug(() => [`✅ [${jobId.substring(0,8)}] JSON final pronto para salvar no banco`]);
+    logger.debug(() => [`[✅ FINAL_STRUCTURE] Estrutura validada:`, {
       suggestions: finalJSON.suggestions.length,
       aiSuggestions: finalJSON.aiSuggestions.length,
       hasProblemAnalysis: !!finalJSON.problemsAnalysis,
       hasDiagnostics: !!finalJSON.diagnostics,
       hasSummary: !!finalJSON.summary,
       hasSuggestionMetadata: !!finalJSON.suggestionMetadata
-    });
+    }]);
     
     // 📊 LOG DE AUDITORIA FINAL: Status completo das sugestões
-    console.log('[AI-AUDIT][SUGGESTIONS_STATUS] 🎯 PIPELINE COMPLETO:', {
+    logger.debug(() => ['[AI-AUDIT][SUGGESTIONS_STATUS] 🎯 PIPELINE COMPLETO:', {
       problems: finalJSON.problemsAnalysis?.problems?.length || finalJSON.problems?.length || 0,
       baseSuggestions: finalJSON.suggestions?.length || 0,
       aiSuggestions: finalJSON.aiSuggestions?.length || 0,
       mode: finalJSON.mode || 'unknown',
       hasScore: finalJSON.score !== undefined,
       hasTechnicalData: !!(finalJSON.lufs || finalJSON.truePeak)
-    });
+    }]);
     
     // ✅ VALIDAÇÃO FINAL: Verificar se genre foi propagado corretamente
-    console.log('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-    console.log('[GENRE-FLOW][PIPELINE] 🎯 VALIDAÇÃO FINAL DO GÊNERO:');
-    console.log('[GENRE-FLOW][PIPELINE] finalJSON.genre:', finalJSON.genre);
-    console.log('[GENRE-FLOW][PIPELINE] finalJSON.summary.genre:', finalJSON.summary?.genre);
-    console.log('[GENRE-FLOW][PIPELINE] finalJSON.suggestionMetadata.genre:', finalJSON.suggestionMetadata?.genre);
-    console.log('[GENRE-FLOW][PIPELINE] finalJSON.mode:', finalJSON.mode);
-    console.log('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[GENRE-FLOW][PIPELINE] 🎯 VALIDAÇÃO FINAL DO GÊNERO:');
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] finalJSON.genre:', finalJSON.genre]);
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] finalJSON.summary.genre:', finalJSON.summary?.genre]);
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] finalJSON.suggestionMetadata.genre:', finalJSON.suggestionMetadata?.genre]);
+    logger.debug(() => ['[GENRE-FLOW][PIPELINE] finalJSON.mode:', finalJSON.mode]);
+    logger.debug('[GENRE-FLOW][PIPELINE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
     
     // 🔥 LOG OBRIGATÓRIO: SAÍDA DO PIPELINE
-    console.log('[GENRE-TRACE][PIPELINE-OUTPUT]', {
+    logger.debug(() => ['[GENRE-TRACE][PIPELINE-OUTPUT]', {
       jobId: jobId.substring(0, 8),
       resultGenre: finalJSON.genre,
       summaryGenre: finalJSON.summary?.genre,
       metadataGenre: finalJSON.metadata?.genre,
       suggestionMetadataGenre: finalJSON.suggestionMetadata?.genre
-    });
+    }]);
     
     logAudio('pipeline', 'done', {
       ms: totalTime,
@@ -1783,19 +1651,19 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       finalJSON.data = finalJSON.data || {};
       finalJSON.data.genreTargets = customTargets;
 
-      console.log("[PIPELINE-FIX] ✅ Genre targets inseridos no JSON final", {
+      logger.debug(() => ["[PIPELINE-FIX] ✅ Genre targets inseridos no JSON final", {
         hasTargets: !!customTargets,
         keys: Object.keys(customTargets || {}),
         hasBands: !!customTargets?.bands,
         topLevelBands: customTargets?.bands ? Object.keys(customTargets.bands) : []
-      });
+      }]);
     }
 
     // ✅ FASE FINAL: ADICIONAR FLAGS DE PLANO (SEM MUTILAÇÃO DO JSON)
     const planContext = options.planContext || null;
     
     if (planContext) {
-      console.log('[PLAN-FILTER] 📊 Plan Context detectado:', planContext);
+      logger.debug(() => ['[PLAN-FILTER] 📊 Plan Context detectado:', planContext]);
       
       // ✅ SEMPRE incluir analysisMode e flags no JSON final
       finalJSON.analysisMode = planContext.analysisMode;
@@ -1803,90 +1671,35 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       finalJSON.plan = planContext.plan;
       finalJSON.planFeatures = planContext.features;
       
-      console.log('[PLAN-FILTER] ✅ Flags de plano adicionadas ao JSON:', {
+      logger.debug(() => ['[PLAN-FILTER] ✅ Flags de plano adicionadas ao JSON:', {
         analysisMode: finalJSON.analysisMode,
         isReduced: finalJSON.isReduced,
         plan: finalJSON.plan
-      });
+      }]);
       
       // ⚠️ MODO REDUZIDO: Adicionar warning MAS manter JSON completo
       if (planContext.analysisMode === 'reduced') {
-        console.log('[PLAN-FILTER] ⚠️ MODO REDUZIDO DETECTADO - Adicionando limitWarning (JSON completo preservado)');
-        console.log('[PLAN-FILTER] Plano:', planContext.plan, '| Features:', planContext.features);
+        logger.debug('[PLAN-FILTER] ⚠️ MODO REDUZIDO DETECTADO - Adicionando limitWarning (JSON completo preservado)');
+        logger.debug(() => ['[PLAN-FILTER] Plano:', planContext.plan, '| Features:', planContext.features]);
         
         // ✅ Adicionar warning ao JSON (sem mutilação)
         finalJSON.limitWarning = `Você atingiu o limite de análises completas do plano ${planContext.plan.toUpperCase()}. Atualize seu plano para desbloquear análise completa.`;
         
-        console.log('[PLAN-FILTER] ✅ limitWarning adicionado - JSON completo será retornado para o frontend aplicar máscara visual');
+        logger.debug('[PLAN-FILTER] ✅ limitWarning adicionado - JSON completo será retornado para o frontend aplicar máscara visual');
         
-        // 🔐 REMOVER TEXTO DAS SUGESTÕES IA (SEGURANÇA ABSOLUTA)
+        // 🔐 REMOVER TEXTO DAS SUGESTÕES (SEGURANÇA ABSOLUTA)
         // Garantir que NENHUM texto real seja enviado ao frontend em modo reduced
-        if (Array.isArray(finalJSON.aiSuggestions) && finalJSON.aiSuggestions.length > 0) {
-          console.log(`[PLAN-FILTER] 🔒 Removendo texto de ${finalJSON.aiSuggestions.length} sugestões IA (modo reduced)`);
-          
-          finalJSON.aiSuggestions = finalJSON.aiSuggestions.map(suggestion => ({
-            // ✅ Manter estrutura e metadados
-            id: suggestion.id,
-            categoria: suggestion.categoria || suggestion.category,
-            nivel: suggestion.nivel || suggestion.priority || 'média',
-            metric: suggestion.metric,
-            severity: suggestion.severity,
-            aiEnhanced: suggestion.aiEnhanced,
-            _validated: suggestion._validated,
-            _realTarget: suggestion._realTarget,
-            
-            // 🔒 REMOVER TODO O TEXTO (substituir por null)
-            problema: null,
-            causaProvavel: null,
-            solucao: null,
-            pluginRecomendado: null,
-            dicaExtra: null,
-            parametros: null,
-            
-            // Aliases também devem ser null
-            message: null,
-            action: null,
-            observation: null,
-            recommendation: null,
-            
-            // Flag indicando bloqueio
-            blocked: true
-          }));
-          
-          console.log('[PLAN-FILTER] ✅ Texto das sugestões IA removido - apenas estrutura preservada');
-          console.log('[PLAN-FILTER] 🔐 Frontend renderizará placeholders via Security Guard');
-        }
-        
-        // 🔐 REMOVER TEXTO DE OUTRAS SUGESTÕES (suggestions base, comparative, etc)
-        if (Array.isArray(finalJSON.suggestions) && finalJSON.suggestions.length > 0) {
-          console.log(`[PLAN-FILTER] 🔒 Removendo texto de ${finalJSON.suggestions.length} sugestões base (modo reduced)`);
-          
-          finalJSON.suggestions = finalJSON.suggestions.map(suggestion => ({
-            id: suggestion.id,
-            category: suggestion.category || suggestion.type,
-            metric: suggestion.metric,
-            priority: suggestion.priority,
-            _validated: suggestion._validated,
-            
-            // 🔒 REMOVER TODO O TEXTO
-            message: null,
-            title: null,
-            action: null,
-            description: null,
-            
-            // Flag indicando bloqueio
-            blocked: true
-          }));
-          
-          console.log('[PLAN-FILTER] ✅ Texto das sugestões base removido');
-        }
+        // (IA, base, problemsAnalysis e diagnostics - mesma máscara do backfill de re-scoring)
+        maskReducedSuggestions(finalJSON);
+        logger.debug('[PLAN-FILTER] ✅ Texto das sugestões removido - apenas estrutura preservada');
+        logger.debug('[PLAN-FILTER] 🔐 Frontend renderizará placeholders via Security Guard');
       }
     } else {
       // Se não há planContext, modo padrão é "full"
       finalJSON.analysisMode = 'full';
       finalJSON.isReduced = false;
       finalJSON.plan = 'free'; // fallback
-      console.log('[PLAN-FILTER] ℹ️ Sem planContext - definindo analysisMode como "full"');
+      logger.debug('[PLAN-FILTER] ℹ️ Sem planContext - definindo analysisMode como "full"');
     }
 
     // 🔬 [MEM] Ponto 4 — antes do return: tudo calculado, variáveis grandes devem estar nulas
@@ -1906,8 +1719,8 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
       stackSnippet: error.stackSnippet
     });
     
-    console.error(`💥 [${jobId.substring(0,8)}] Pipeline falhou após ${totalTime}ms:`, error.message);
-    console.error(`📍 [${jobId.substring(0,8)}] Stage: ${error.stage || 'unknown'}, Code: ${error.code || 'unknown'}`);
+    logger.error(`💥 [${jobId.substring(0,8)}] Pipeline falhou após ${totalTime}ms:`, error.message);
+    logger.error(`📍 [${jobId.substring(0,8)}] Stage: ${error.stage || 'unknown'}, Code: ${error.code || 'unknown'}`);
     
     // Re-propagar para camada de jobs (nunca engolir o erro silenciosamente)
     if (error.stage) {
@@ -1923,7 +1736,7 @@ export async function processAudioComplete(audioBuffer, fileName, options = {})
     // ============================================================================
     if (tempFilePath && tempFileOwned) {
       cleanupTempFile(tempFilePath);
-      console.log(`[CLEANUP] ✅ Temp file cleanup executado (finally): ${tempFilePath}`);
+      logger.debug(() => [`[CLEANUP] ✅ Temp file cleanup executado (finally): ${tempFilePath}`]);
     }
     // 🔬 [MEM] Ponto final — após cleanup do temp file
     logMemoryDelta('pipeline', '5-finally-end', jobId);
@@ -1944,7 +1757,7 @@ export async function processAudio(file, options = {}) {
  * Compara duas análises de áudio e gera sugestões automáticas
  */
 export async function compareMetrics(userMetrics, refMetrics) {
-  console.log("🔍 [Compare] Calculando diferenças entre métricas...");
+  logger.debug("🔍 [Compare] Calculando diferenças entre métricas...");
 
   const diff = {};
 
@@ -2045,13 +1858,13 @@ function generateReferenceDeltas(userMetrics, referenceMetrics) {
   }
 
   // 🔍 LOG DE DIAGNÓSTICO: Auditoria de deltas calculados
-  console.log("[DELTA-AUDIT] Deltas calculados:", {
+  logger.debug(() => ["[DELTA-AUDIT] Deltas calculados:", {
     lufs: deltas.lufs,
     truePeak: deltas.truePeak,
     dynamics: deltas.dynamics,
     spectralBandsCount: Object.keys(deltas.spectralBands).length,
     spectralBands: deltas.spectralBands
-  });
+  }]);
 
   return deltas;
 }
@@ -2156,11 +1969,11 @@ function generateComparisonSuggestions(deltas) {
     }
   }
 
-  console.log(`[COMPARISON-SUGGESTIONS] Geradas ${suggestions.length} sugestões comparativas.`);
+  logger.debug(() => [`[COMPARISON-SUGGESTIONS] Geradas ${suggestions.length} sugestões comparativas.`]);
   
   // 🛡️ FALLBACK: Garantir que sempre retornamos ao menos 1 suggestion
   if (!suggestions || suggestions.length === 0) {
-    console.warn('[COMPARISON-SUGGESTIONS] ⚠️ Nenhuma sugestão gerada - retornando fallback');
+    logger.warn('[COMPARISON-SUGGESTIONS] ⚠️ Nenhuma sugestão gerada - retornando fallback');
     suggestions.push({
       type: 'comparison_incomplete',
       category: 'Diagnóstico',
@@ -2209,31 +2022,31 @@ function generateComparisonSuggestions(deltas) {
  * @returns {Array} Sugestões estruturadas prontas para ULTRA-V2
  */
 function generateAdvancedSuggestionsFromScoring(technicalData, scoring, genre = 'unknown', mode = 'genre', genreTargets = null) {
-  console.log(`[ADVANCED-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-  console.log(`[ADVANCED-SUGGEST] 🎯 Iniciando geração avançada`);
-  console.log(`[ADVANCED-SUGGEST] Genre: ${genre}, Mode: ${mode}`);
-  console.log(`[ADVANCED-SUGGEST] Penalties disponíveis: ${scoring?.penalties?.length || 0}`);
-  console.log(`[ADVANCED-SUGGEST] genreTargets disponíveis: ${genreTargets ? 'SIM' : 'NÃO'}`)  ;
+  logger.debug(`[ADVANCED-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+  logger.debug(`[ADVANCED-SUGGEST] 🎯 Iniciando geração avançada`);
+  logger.debug(() => [`[ADVANCED-SUGGEST] Genre: ${genre}, Mode: ${mode}`]);
+  logger.debug(() => [`[ADVANCED-SUGGEST] Penalties disponíveis: ${scoring?.penalties?.length || 0}`]);
+  logger.debug(() => [`[ADVANCED-SUGGEST] genreTargets disponíveis: ${genreTargets ? 'SIM' : 'NÃO'}`])  ;
   
   // 🔍 AUDITORIA LOG 4: genreTargets NA ENTRADA DE generateAdvancedSuggestionsFromScoring
-  console.log('[AUDIT-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-  console.log('[AUDIT-SUGGEST] LOG 4: genreTargets NA ENTRADA DE generateAdvancedSuggestionsFromScoring');
-  console.log('[AUDIT-SUGGEST] Genre:', genre);
-  console.log('[AUDIT-SUGGEST] genreTargets existe?', !!genreTargets);
+  logger.debug('[AUDIT-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.debug('[AUDIT-SUGGEST] LOG 4: genreTargets NA ENTRADA DE generateAdvancedSuggestionsFromScoring');
+  logger.debug(() => ['[AUDIT-SUGGEST] Genre:', genre]);
+  logger.debug(() => ['[AUDIT-SUGGEST] genreTargets existe?', !!genreTargets]);
   if (genreTargets) {
-    console.log('[AUDIT-SUGGEST] Top-level keys:', Object.keys(genreTargets));
-    console.log('[AUDIT-SUGGEST] Tem .bands?', 'bands' in genreTargets);
-    console.log('[AUDIT-SUGGEST] Tem .low_bass?', 'low_bass' in genreTargets);
-    console.log('[AUDIT-SUGGEST] Tem .sub?', 'sub' in genreTargets);
+    logger.debug(() => ['[AUDIT-SUGGEST] Top-level keys:', Object.keys(genreTargets)]);
+    logger.debug(() => ['[AUDIT-SUGGEST] Tem .bands?', 'bands' in genreTargets]);
+    logger.debug(() => ['[AUDIT-SUGGEST] Tem .low_bass?', 'low_bass' in genreTargets]);
+    logger.debug(() => ['[AUDIT-SUGGEST] Tem .sub?', 'sub' in genreTargets]);
     if (genreTargets.bands) {
-      console.log('[AUDIT-SUGGEST] genreTargets.bands keys:', Object.keys(genreTargets.bands));
-      console.log('[AUDIT-SUGGEST] genreTargets.bands.low_bass:', JSON.stringify(genreTargets.bands.low_bass, null, 2));
+      logger.debug(() => ['[AUDIT-SUGGEST] genreTargets.bands keys:', Object.keys(genreTargets.bands)]);
+      logger.debug(() => ['[AUDIT-SUGGEST] genreTargets.bands.low_bass:', JSON.stringify(genreTargets.bands.low_bass, null, 2)]);
     }
     if (genreTargets.low_bass) {
-      console.log('[AUDIT-SUGGEST] genreTargets.low_bass (achatado):', JSON.stringify(genreTargets.low_bass, null, 2));
+      logger.debug(() => ['[AUDIT-SUGGEST] genreTargets.low_bass (achatado):', JSON.stringify(genreTargets.low_bass, null, 2)]);
     }
   }
-  console.log('[AUDIT-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.debug('[AUDIT-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
   
   const suggestions = [];
   const penalties = scoring?.penalties || [];
@@ -2438,9 +2251,9 @@ function generateAdvancedSuggestionsFromScoring(technicalData, scoring, genre =
   };
   
   // 🎯 FASE 1: PROCESSAR PENALTIES E GERAR SUGESTÕES BASE
-  console.log('[ADVANCED-SUGGEST] 📋 Listando todas as penalties a processar:');
+  logger.debug('[ADVANCED-SUGGEST] 📋 Listando todas as penalties a processar:');
   penalties.forEach((p, i) => {
-    console.log(`[ADVANCED-SUGGEST]   ${i+1}. ${p.key}: status=${p.status}, severity=${p.severity}, n=${p.n?.toFixed(2)}`);
+    logger.debug(() => [`[ADVANCED-SUGGEST]   ${i+1}. ${p.key}: status=${p.status}, severity=${p.severity}, n=${p.n?.toFixed(2)}`]);
   });
   
   for (const penalty of penalties) {
@@ -2448,11 +2261,11 @@ function generateAdvancedSuggestionsFromScoring(technicalData, scoring, genre =
     
     // Pular métricas OK (sem problemas)
     if (status === 'OK') {
-      console.log(`[ADVANCED-SUGGEST] ⏭️ Pulando ${key}: status=OK`);
+      logger.debug(() => [`[ADVANCED-SUGGEST] ⏭️ Pulando ${key}: status=OK`]);
       continue;
     }
     
-    console.log(`[ADVANCED-SUGGEST] 🔧 Processando penalty: ${key} (status=${status}, severity=${severity})`);
+    logger.debug(() => [`[ADVANCED-SUGGEST] 🔧 Processando penalty: ${key} (status=${status}, severity=${severity})`]);
     
     // Determinar prioridade baseada no tipo de métrica
     let priority = 'média';
@@ -2487,7 +2300,7 @@ function generateAdvancedSuggestionsFromScoring(technicalData, scoring, genre =
       const originalDelta = delta;
       if (Math.abs(delta) > MAX_ADJUSTMENT) {
         delta = delta > 0 ? MAX_ADJUSTMENT : -MAX_ADJUSTMENT;
-        console.log(`[ADVANCED-SUGGEST] ⚠️ Delta original ${originalDelta.toFixed(1)} limitado a ${delta.toFixed(1)} (max ±${MAX_ADJUSTMENT} dB)`);
+        logger.debug(() => [`[ADVANCED-SUGGEST] ⚠️ Delta original ${originalDelta.toFixed(1)} limitado a ${delta.toFixed(1)} (max ±${MAX_ADJUSTMENT} dB)`]);
       }
       
       // Construir problema técnico
@@ -2554,14 +2367,14 @@ function generateAdvancedSuggestionsFromScoring(technicalData, scoring, genre =
       // 🔧 CORREÇÃO: Buscar bandInfo usando nome normalizado OU original
       const bandInfo = bandKnowledge[canonicalBandKey] || bandKnowledge[bandKey];
       if (!bandInfo) {
-        console.log(`[ADVANCED-SUGGEST] ⚠️ bandKnowledge não encontrado para: ${bandKey} (canônico: ${canonicalBandKey})`);
+        logger.debug(() => [`[ADVANCED-SUGGEST] ⚠️ bandKnowledge não encontrado para: ${bandKey} (canônico: ${canonicalBandKey})`]);
         continue;
       }
       
       // 🔧 Usar nome canônico para buscar dados reais
       const bandData = getBandValue(technicalData, canonicalBandKey, genreTargets);
       if (!bandData) {
-        console.log(`[ADVANCED-SUGGEST] ⚠️ getBandValue retornou null para: ${canonicalBandKey}`);
+        logger.debug(() => [`[ADVANCED-SUGGEST] ⚠️ getBandValue retornou null para: ${canonicalBandKey}`]);
         continue;
       }
       
@@ -2574,7 +2387,7 @@ function generateAdvancedSuggestionsFromScoring(technicalData, scoring, genre =
       const originalDelta = delta;
       if (Math.abs(delta) > MAX_ADJUSTMENT_BAND) {
         delta = delta > 0 ? MAX_ADJUSTMENT_BAND : -MAX_ADJUSTMENT_BAND;
-        console.log(`[ADVANCED-SUGGEST] ⚠️ Delta banda ${bandKey}: ${originalDelta.toFixed(1)} limitado a ${delta.toFixed(1)} (max ±${MAX_ADJUSTMENT_BAND} dB)`);
+        logger.debug(() => [`[ADVANCED-SUGGEST] ⚠️ Delta banda ${bandKey}: ${originalDelta.toFixed(1)} limitado a ${delta.toFixed(1)} (max ±${MAX_ADJUSTMENT_BAND} dB)`]);
       }
       
       const problema = `${bandInfo.nome} está em ${value.toFixed(1)} dB quando deveria estar entre ${targetMin} e ${targetMax} dB (${isBelow ? 'abaixo' : 'acima'} em ${originalDelta.toFixed(1)} dB)`;
@@ -2632,22 +2445,22 @@ function generateAdvancedSuggestionsFromScoring(technicalData, scoring, genre =
     return typeA - typeB;
   });
   
-  console.log(`[ADVANCED-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-  console.log(`[ADVANCED-SUGGEST] ✅ ${suggestions.length} sugestões avançadas geradas`);
+  logger.debug(`[ADVANCED-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+  logger.debug(() => [`[ADVANCED-SUGGEST] ✅ ${suggestions.length} sugestões avançadas geradas`]);
   suggestions.forEach((sug, i) => {
-    console.log(`[ADVANCED-SUGGEST] ${i + 1}. [${sug.priority}] ${sug.problema.substring(0, 70)}...`);
+    logger.debug(() => [`[ADVANCED-SUGGEST] ${i + 1}. [${sug.priority}] ${sug.problema.substring(0, 70)}...`]);
   });
   
   // 🔍 DEBUG: Log de metricKeys para diagnóstico (desativar em produção com LOG_LEVEL)
   const metricKeys = suggestions.map(s => s.metricKey).filter(Boolean);
-  console.log(`[ADVANCED-SUGGEST] 🔑 metricKeys gerados:`, metricKeys);
+  logger.debug(() => [`[ADVANCED-SUGGEST] 🔑 metricKeys gerados:`, metricKeys]);
   
   // 🔍 DEBUG: Verificar se air/presence foram incluídos
   const hasAir = metricKeys.includes('band_air');
   const hasPresence = metricKeys.includes('band_presence');
-  console.log(`[ADVANCED-SUGGEST] 🎯 Bandas críticas: air=${hasAir}, presence=${hasPresence}`);
+  logger.debug(() => [`[ADVANCED-SUGGEST] 🎯 Bandas críticas: air=${hasAir}, presence=${hasPresence}`]);
   
-  console.log(`[ADVANCED-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+  logger.debug(`[ADVANCED-SUGGEST] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
   
   return suggestions;
 }
@@ -2675,7 +2488,7 @@ function getMetricValue(technicalData, key, genreTargets) {
     const realTarget = getNestedValue(genreTargets, config.targetPath);
     if (Number.isFinite(realTarget)) {
       target = realTarget;
-      console.log(`[ADVANCED-SUGGEST] ✅ Usando target REAL para ${key}: ${target}`);
+      logger.debug(() => [`[ADVANCED-SUGGEST] ✅ Usando target REAL para ${key}: ${target}`]);
     }
   }
   
@@ -2692,7 +2505,7 @@ function getBandValue(technicalData, bandKey, genreTargets) {
   // 🔧 CORREÇÃO: Usar getBandWithAlias para resolver mismatch de chaves
   const bandData = getBandWithAlias(bands, bandKey);
   if (!bandData) {
-    console.log(`[ADVANCED-SUGGEST] ⚠️ Banda ${bandKey} não encontrada em spectralBands (tentou aliases)`);
+    logger.debug(() => [`[ADVANCED-SUGGEST] ⚠️ Banda ${bandKey} não encontrada em spectralBands (tentou aliases)`]);
     return null;
   }
   
@@ -2703,23 +2516,23 @@ function getBandValue(technicalData, bandKey, genreTargets) {
   const canonicalBand = normalizeBandKey(bandKey);
   
   // 🔍 AUDITORIA LOG 5: genreTargets na ENTRADA do getBandValue
-  console.log('[AUDIT-GETBAND] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-  console.log('[AUDIT-GETBAND] LOG 5: genreTargets NA ENTRADA DE getBandValue');
-  console.log('[AUDIT-GETBAND] bandKey original:', bandKey);
-  console.log('[AUDIT-GETBAND] bandKey canônico:', canonicalBand);
-  console.log('[AUDIT-GETBAND] value (energy_db):', value);
-  console.log('[AUDIT-GETBAND] genreTargets existe?', !!genreTargets);
+  logger.debug('[AUDIT-GETBAND] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.debug('[AUDIT-GETBAND] LOG 5: genreTargets NA ENTRADA DE getBandValue');
+  logger.debug(() => ['[AUDIT-GETBAND] bandKey original:', bandKey]);
+  logger.debug(() => ['[AUDIT-GETBAND] bandKey canônico:', canonicalBand]);
+  logger.debug(() => ['[AUDIT-GETBAND] value (energy_db):', value]);
+  logger.debug(() => ['[AUDIT-GETBAND] genreTargets existe?', !!genreTargets]);
   if (genreTargets) {
-    console.log('[AUDIT-GETBAND] Top-level keys:', Object.keys(genreTargets));
-    console.log('[AUDIT-GETBAND] Tem .bands?', 'bands' in genreTargets);
+    logger.debug(() => ['[AUDIT-GETBAND] Top-level keys:', Object.keys(genreTargets)]);
+    logger.debug(() => ['[AUDIT-GETBAND] Tem .bands?', 'bands' in genreTargets]);
     
     // 🔧 CORREÇÃO: Testar ambos os formatos usando aliases
     const bandFromTargets = getBandWithAlias(genreTargets?.bands, bandKey);
     const bandFromTopLevel = getBandWithAlias(genreTargets, bandKey);
-    console.log('[AUDIT-GETBAND] getBandWithAlias(genreTargets.bands) encontrou?', !!bandFromTargets);
-    console.log('[AUDIT-GETBAND] getBandWithAlias(genreTargets) encontrou?', !!bandFromTopLevel);
+    logger.debug(() => ['[AUDIT-GETBAND] getBandWithAlias(genreTargets.bands) encontrou?', !!bandFromTargets]);
+    logger.debug(() => ['[AUDIT-GETBAND] getBandWithAlias(genreTargets) encontrou?', !!bandFromTopLevel]);
   }
-  console.log('[AUDIT-GETBAND] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.debug('[AUDIT-GETBAND] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
   
   // 🎯 Ler range REAL de genreTargets usando ALIASES
   let targetMin, targetMax;
@@ -2729,11 +2542,11 @@ function getBandValue(technicalData, bandKey, genreTargets) {
   if (bandTargetFromBands?.target_range) {
     targetMin = bandTargetFromBands.target_range.min;
     targetMax = bandTargetFromBands.target_range.max;
-    console.log(`[ADVANCED-SUGGEST] ✅ Usando range REAL (via alias) para ${bandKey} → ${canonicalBand}: [${targetMin}, ${targetMax}]`);
+    logger.debug(() => [`[ADVANCED-SUGGEST] ✅ Usando range REAL (via alias) para ${bandKey} → ${canonicalBand}: [${targetMin}, ${targetMax}]`]);
     
-    console.log('[AUDIT-GETBAND] 👉 CAMINHO USADO: ESTRUTURA PADRONIZADA COM ALIAS');
-    console.log('[AUDIT-GETBAND] targetMin:', targetMin);
-    console.log('[AUDIT-GETBAND] targetMax:', targetMax);
+    logger.debug('[AUDIT-GETBAND] 👉 CAMINHO USADO: ESTRUTURA PADRONIZADA COM ALIAS');
+    logger.debug(() => ['[AUDIT-GETBAND] targetMin:', targetMin]);
+    logger.debug(() => ['[AUDIT-GETBAND] targetMax:', targetMax]);
   } 
   // 🔧 FASE 3: Fallback de compatibilidade - estrutura achatada COM ALIASES
   else {
@@ -2741,11 +2554,11 @@ function getBandValue(technicalData, bandKey, genreTargets) {
     if (bandTargetFromTopLevel?.target_range) {
       targetMin = bandTargetFromTopLevel.target_range.min;
       targetMax = bandTargetFromTopLevel.target_range.max;
-      console.log(`[ADVANCED-SUGGEST] ⚠️ Usando range REAL (compatibilidade via alias) para ${bandKey}: [${targetMin}, ${targetMax}]`);
+      logger.debug(() => [`[ADVANCED-SUGGEST] ⚠️ Usando range REAL (compatibilidade via alias) para ${bandKey}: [${targetMin}, ${targetMax}]`]);
       
-      console.log('[AUDIT-GETBAND] 👉 CAMINHO USADO: COMPATIBILIDADE COM ALIAS');
-      console.log('[AUDIT-GETBAND] targetMin:', targetMin);
-      console.log('[AUDIT-GETBAND] targetMax:', targetMax);
+      logger.debug('[AUDIT-GETBAND] 👉 CAMINHO USADO: COMPATIBILIDADE COM ALIAS');
+      logger.debug(() => ['[AUDIT-GETBAND] targetMin:', targetMin]);
+      logger.debug(() => ['[AUDIT-GETBAND] targetMax:', targetMax]);
     } 
     // ❌ Último recurso: Fallback hardcoded
     else {
@@ -2769,11 +2582,11 @@ function getBandValue(technicalData, bandKey, genreTargets) {
       if (!range) return null;
       targetMin = range.min;
       targetMax = range.max;
-      console.log(`[ADVANCED-SUGGEST] ⚠️ Usando FALLBACK hardcoded para ${bandKey}: [${targetMin}, ${targetMax}]`);
+      logger.debug(() => [`[ADVANCED-SUGGEST] ⚠️ Usando FALLBACK hardcoded para ${bandKey}: [${targetMin}, ${targetMax}]`]);
       
-      console.log('[AUDIT-GETBAND] ⚠️⚠️⚠️ CAMINHO USADO: FALLBACK HARDCODED (VALORES GENÉRICOS)');
-      console.log('[AUDIT-GETBAND] targetMin:', targetMin);
-      console.log('[AUDIT-GETBAND] targetMax:', targetMax);
+      logger.debug('[AUDIT-GETBAND] ⚠️⚠️⚠️ CAMINHO USADO: FALLBACK HARDCODED (VALORES GENÉRICOS)');
+      logger.debug(() => ['[AUDIT-GETBAND] targetMin:', targetMin]);
+      logger.debug(() => ['[AUDIT-GETBAND] targetMax:', targetMax]);
     }
   }
   
@@ -2791,7 +2604,7 @@ function getNestedValue(obj, path) {
  * 🔧 FUNÇÃO LEGADA: Mantida para compatibilidade (agora usa o sistema avançado internamente)
  */
 function generateSuggestionsFromMetrics(technicalData, genre = 'unknown', mode = 'genre', genreTargets = null) {
-  console.log(`[LEGACY-SUGGEST] ⚠️ Função legada chamada - redirecionando para sistema avançado`);
+  logger.debug(`[LEGACY-SUGGEST] ⚠️ Função legada chamada - redirecionando para sistema avançado`);
   
   // Se houver scoring disponível, usar sistema avançado
   if (technicalData.scoring && technicalData.scoring.penalties) {
@@ -2799,7 +2612,7 @@ function generateSuggestionsFromMetrics(technicalData, genre = 'unknown', mode =
   }
   
   // Fallback: Sistema simples (apenas True Peak e LUFS)
-  console.log(`[LEGACY-SUGGEST] ⚠️ Scoring não disponível - usando fallback simples`);
+  logger.debug(`[LEGACY-SUGGEST] ⚠️ Scoring não disponível - usando fallback simples`);
   
   const suggestions = [];
   
@@ -2893,5 +2706,6 @@ export async function runPipeline(job) {
     planContext: planContext || null,
     soundDestination,
     inputFilePath,
+    expectedFrames: job._expectedFrames || null,
   });
 }
\ No newline at end of file
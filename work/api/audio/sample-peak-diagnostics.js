@@ -16,6 +16,9 @@ import { join } from 'path';
 import { randomBytes } from 'crypto';
 import { writeFile, unlink } from 'fs/promises';
 import ffmpegStatic from 'ffmpeg-static';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:sample-peak-diagnostics');
 
 const FFMPEG_PATH = process.env.FFMPEG_PATH || ffmpegStatic || 'ffmpeg';
 
@@ -42,34 +45,34 @@ export function analyzeBufferScale(leftChannel, rightChannel, context = '') {
     // Provável int24 sem normalização (full scale = 8388608)
     suspectedScale = 'int24_not_normalized';
     divisorNeeded = 8388608; // 2^23
-    console.error(`🚨 [SCALE_ERROR] Buffer parece int24 sem normalização! maxAbs=${maxAbsValue.toFixed(0)}, esperado divisor=8388608`);
+    logger.error(`🚨 [SCALE_ERROR] Buffer parece int24 sem normalização! maxAbs=${maxAbsValue.toFixed(0)}, esperado divisor=8388608`);
   } else if (maxAbsValue > 30000 && maxAbsValue < 40000) {
     // Provável int16 sem normalização (full scale = 32768)
     suspectedScale = 'int16_not_normalized';
     divisorNeeded = 32768; // 2^15
-    console.error(`🚨 [SCALE_ERROR] Buffer parece int16 sem normalização! maxAbs=${maxAbsValue.toFixed(0)}, esperado divisor=32768`);
+    logger.error(`🚨 [SCALE_ERROR] Buffer parece int16 sem normalização! maxAbs=${maxAbsValue.toFixed(0)}, esperado divisor=32768`);
   } else if (maxAbsValue > 1.0 && maxAbsValue < 2.0) {
     // Provável clipping ou erro de conversão leve
     suspectedScale = 'float32_slight_overflow';
     divisorNeeded = 1.0;
-    console.warn(`⚠️ [SCALE_WARNING] Valores ligeiramente acima de 1.0 (max=${maxAbsValue.toFixed(4)})`);
+    logger.warn(`⚠️ [SCALE_WARNING] Valores ligeiramente acima de 1.0 (max=${maxAbsValue.toFixed(4)})`);
   } else if (maxAbsValue <= 1.0) {
     // Escala correta
     suspectedScale = 'float32_normalized';
     divisorNeeded = 1.0;
-    console.log(`✅ [SCALE_OK] Buffer em escala Float32 normalizada [-1, 1], maxAbs=${maxAbsValue.toFixed(4)}`);
+    logger.debug(() => [`✅ [SCALE_OK] Buffer em escala Float32 normalizada [-1, 1], maxAbs=${maxAbsValue.toFixed(4)}`]);
   }
   
   // Log completo
-  console.log(`\n${'='.repeat(80)}`);
-  console.log(`🔍 [BUFFER_ANALYSIS] ${context}`);
-  console.log(`${'='.repeat(80)}`);
-  console.log(`📊 LEFT:  min=${analysis.left.min.toFixed(6)}, max=${analysis.left.max.toFixed(6)}, maxAbs=${analysis.left.maxAbs.toFixed(6)}`);
-  console.log(`📊 RIGHT: min=${analysis.right.min.toFixed(6)}, max=${analysis.right.max.toFixed(6)}, maxAbs=${analysis.right.maxAbs.toFixed(6)}`);
-  console.log(`⚠️  Out of range: L=${analysis.left.outOfRangePct.toFixed(2)}%, R=${analysis.right.outOfRangePct.toFixed(2)}%`);
-  console.log(`🎯 Suspected scale: ${suspectedScale}`);
-  console.log(`🔧 Divisor needed: ${divisorNeeded} ${divisorNeeded !== 1.0 ? '⚠️  CORRECTION NEEDED!' : '✅'}`);
-  console.log(`${'='.repeat(80)}\n`);
+  logger.debug(() => [`\n${'='.repeat(80)}`]);
+  logger.debug(() => [`🔍 [BUFFER_ANALYSIS] ${context}`]);
+  logger.debug(() => [`${'='.repeat(80)}`]);
+  logger.debug(() => [`📊 LEFT:  min=${analysis.left.min.toFixed(6)}, max=${analysis.left.max.toFixed(6)}, maxAbs=${analysis.left.maxAbs.toFixed(6)}`]);
+  logger.debug(() => [`📊 RIGHT: min=${analysis.right.min.toFixed(6)}, max=${analysis.right.max.toFixed(6)}, maxAbs=${analysis.right.maxAbs.toFixed(6)}`]);
+  logger.debug(() => [`⚠️  Out of range: L=${analysis.left.outOfRangePct.toFixed(2)}%, R=${analysis.right.outOfRangePct.toFixed(2)}%`]);
+  logger.debug(() => [`🎯 Suspected scale: ${suspectedScale}`]);
+  logger.debug(() => [`🔧 Divisor needed: ${divisorNeeded} ${divisorNeeded !== 1.0 ? '⚠️  CORRECTION NEEDED!' : '✅'}`]);
+  logger.debug(() => [`${'='.repeat(80)}\n`]);
   
   return {
     ...analysis,
@@ -115,7 +118,7 @@ function analyzeChannel(channel, label) {
  * 🔍 TAREFA 2: Confirma escala esperada do buffer
  */
 export function confirmExpectedScale(audioData, source = 'unknown') {
-  console.log(`\n🔍 [SCALE_CONFIRMATION] Source: ${source}`);
+  logger.debug(() => [`\n🔍 [SCALE_CONFIRMATION] Source: ${source}`]);
   
   const expected = {
     source,
@@ -132,11 +135,11 @@ export function confirmExpectedScale(audioData, source = 'unknown') {
     duration: audioData.duration || 0
   };
   
-  console.log(`Expected: scale=${expected.scale}, range=${expected.range}, sr=${expected.sampleRate}Hz, ch=${expected.channels}`);
-  console.log(`Actual:   sr=${actual.sampleRate}Hz, ch=${actual.channels}, length=${actual.length}, dur=${actual.duration.toFixed(2)}s`);
+  logger.debug(() => [`Expected: scale=${expected.scale}, range=${expected.range}, sr=${expected.sampleRate}Hz, ch=${expected.channels}`]);
+  logger.debug(() => [`Actual:   sr=${actual.sampleRate}Hz, ch=${actual.channels}, length=${actual.length}, dur=${actual.duration.toFixed(2)}s`]);
   
   const scaleOK = actual.sampleRate === expected.sampleRate && actual.channels === expected.channels;
-  console.log(scaleOK ? '✅ Scale confirmed' : '⚠️  Scale mismatch!');
+  logger.debug(() => [scaleOK ? '✅ Scale confirmed' : '⚠️  Scale mismatch!']);
   
   return { expected, actual, scaleOK };
 }
@@ -145,19 +148,19 @@ export function confirmExpectedScale(audioData, source = 'unknown') {
  * 🔍 TAREFA 3: Identifica caminho com divisor errado para PCM 24-bit
  */
 export function detectWrongPCM24Divisor(audioBuffer, metadata = {}) {
-  console.log(`\n🔍 [PCM24_CHECK] Verificando se buffer foi convertido com divisor errado`);
+  logger.debug(`\n🔍 [PCM24_CHECK] Verificando se buffer foi convertido com divisor errado`);
   
   // Analisar buffer
   const analysis = analyzeBufferScale(audioBuffer.leftChannel, audioBuffer.rightChannel, 'PCM24 Check');
   
   // Se maxAbs está na ordem de 8388608 (2^23), é PCM 24-bit sem normalização
   if (analysis.suspectedScale === 'int24_not_normalized') {
-    console.error(`❌ [PCM24_ERROR] Detectado PCM 24-bit sem normalização!`);
-    console.error(`   Full scale deveria ser: 2^23 = 8388608`);
-    console.error(`   Divisor necessário: 8388608`);
-    console.error(`   MaxAbs atual: ${analysis.maxAbsValue.toFixed(0)}`);
-    console.error(`   Sample Peak calculado sem correção seria: ${(20 * Math.log10(analysis.maxAbsValue)).toFixed(2)} dB ⚠️  ERRADO!`);
-    console.error(`   Sample Peak correto após divisão: ${(20 * Math.log10(analysis.maxAbsValue / 8388608)).toFixed(2)} dB ✅`);
+    logger.error(`❌ [PCM24_ERROR] Detectado PCM 24-bit sem normalização!`);
+    logger.error(`   Full scale deveria ser: 2^23 = 8388608`);
+    logger.error(`   Divisor necessário: 8388608`);
+    logger.error(`   MaxAbs atual: ${analysis.maxAbsValue.toFixed(0)}`);
+    logger.error(`   Sample Peak calculado sem correção seria: ${(20 * Math.log10(analysis.maxAbsValue)).toFixed(2)} dB ⚠️  ERRADO!`);
+    logger.error(`   Sample Peak correto após divisão: ${(20 * Math.log10(analysis.maxAbsValue / 8388608)).toFixed(2)} dB ✅`);
     
     return {
       hasPCM24Error: true,
@@ -169,7 +172,7 @@ export function detectWrongPCM24Divisor(audioBuffer, metadata = {}) {
     };
   }
   
-  console.log(`✅ [PCM24_OK] Buffer não parece ter erro de PCM 24-bit`);
+  logger.debug(`✅ [PCM24_OK] Buffer não parece ter erro de PCM 24-bit`);
   return { hasPCM24Error: false };
 }
 
@@ -178,7 +181,7 @@ export function detectWrongPCM24Divisor(audioBuffer, metadata = {}) {
  * Esta função garante que SEMPRE convertemos para Float32 normalizado
  */
 export async function decodeToFloat32Canonical(inputBuffer, tempPath = null) {
-  console.log(`\n🔍 [CANONICAL_DECODE] Decodificando via FFmpeg para f32le (Float32 normalizado)`);
+  logger.debug(`\n🔍 [CANONICAL_DECODE] Decodificando via FFmpeg para f32le (Float32 normalizado)`);
   
   // Criar arquivo temporário se necessário
   const needsTemp = !tempPath;
@@ -222,7 +225,7 @@ export async function decodeToFloat32Canonical(inputBuffer, tempPath = null) {
       }
       
       const wavBuffer = Buffer.concat(chunks);
-      console.log(`✅ [CANONICAL_DECODE] FFmpeg f32le decode OK: ${wavBuffer.length} bytes`);
+      logger.debug(() => [`✅ [CANONICAL_DECODE] FFmpeg f32le decode OK: ${wavBuffer.length} bytes`]);
       resolve(wavBuffer);
     });
     
@@ -239,9 +242,9 @@ export async function decodeToFloat32Canonical(inputBuffer, tempPath = null) {
  * 🔍 TAREFA 5: Sanity checks - detecta Sample Peak suspeito
  */
 export function samplePeakSanityCheck(samplePeakDbfs, truePeakDbtp, context = '') {
-  console.log(`\n🔍 [SANITY_CHECK] ${context}`);
-  console.log(`   Sample Peak: ${samplePeakDbfs?.toFixed(2)} dBFS`);
-  console.log(`   True Peak:   ${truePeakDbtp?.toFixed(2)} dBTP`);
+  logger.debug(() => [`\n🔍 [SANITY_CHECK] ${context}`]);
+  logger.debug(() => [`   Sample Peak: ${samplePeakDbfs?.toFixed(2)} dBFS`]);
+  logger.debug(() => [`   True Peak:   ${truePeakDbtp?.toFixed(2)} dBTP`]);
   
   const checks = {
     samplePeakDbfs,
@@ -256,14 +259,14 @@ export function samplePeakSanityCheck(samplePeakDbfs, truePeakDbtp, context = ''
   if (samplePeakDbfs > truePeakDbtp + 1.0) {
     checks.warnings.push(`Sample Peak (${samplePeakDbfs.toFixed(2)}) > True Peak (${truePeakDbtp.toFixed(2)}) + 1 dB`);
     checks.isSuspicious = true;
-    console.error(`❌ [SANITY_FAIL] Sample Peak > True Peak + 1 dB (impossível!)`);
+    logger.error(`❌ [SANITY_FAIL] Sample Peak > True Peak + 1 dB (impossível!)`);
   }
   
   // Check 2: Sample Peak não pode ser > +1 dBFS (max teórico é 0 dBFS)
   if (samplePeakDbfs > 1.0) {
     checks.warnings.push(`Sample Peak (${samplePeakDbfs.toFixed(2)}) > +1 dBFS (impossível em Float32 [-1,1])`);
     checks.isSuspicious = true;
-    console.error(`❌ [SANITY_FAIL] Sample Peak > +1 dBFS (escala errada!)`);
+    logger.error(`❌ [SANITY_FAIL] Sample Peak > +1 dBFS (escala errada!)`);
   }
   
   // Check 3: Sample Peak extremamente alto (> +10 dB indica erro grave)
@@ -271,7 +274,7 @@ export function samplePeakSanityCheck(samplePeakDbfs, truePeakDbtp, context = ''
     checks.warnings.push(`Sample Peak (${samplePeakDbfs.toFixed(2)}) > +10 dB (erro de escala grave)`);
     checks.isSuspicious = true;
     checks.needsFallback = true;
-    console.error(`❌ [SANITY_FAIL] Sample Peak > +10 dB - ERRO GRAVE DE ESCALA!`);
+    logger.error(`❌ [SANITY_FAIL] Sample Peak > +10 dB - ERRO GRAVE DE ESCALA!`);
   }
   
   // Check 4: Diferença muito grande entre Sample e True Peak
@@ -280,18 +283,18 @@ export function samplePeakSanityCheck(samplePeakDbfs, truePeakDbtp, context = ''
     checks.warnings.push(`Delta Sample-True Peak = ${delta.toFixed(2)} dB (> 30 dB é suspeito)`);
     checks.isSuspicious = true;
     checks.needsFallback = true;
-    console.error(`❌ [SANITY_FAIL] Delta > 30 dB entre Sample e True Peak!`);
+    logger.error(`❌ [SANITY_FAIL] Delta > 30 dB entre Sample e True Peak!`);
   }
   
   if (checks.warnings.length === 0) {
-    console.log(`✅ [SANITY_OK] Todos os checks passaram`);
+    logger.debug(`✅ [SANITY_OK] Todos os checks passaram`);
   } else {
-    console.error(`⚠️  [SANITY_WARNINGS] ${checks.warnings.length} problema(s) detectado(s)`);
-    checks.warnings.forEach((w, i) => console.error(`   ${i + 1}. ${w}`));
+    logger.error(`⚠️  [SANITY_WARNINGS] ${checks.warnings.length} problema(s) detectado(s)`);
+    checks.warnings.forEach((w, i) => logger.error(`   ${i + 1}. ${w}`));
   }
   
   if (checks.needsFallback) {
-    console.error(`🔧 [FALLBACK_NEEDED] Rodando FFmpeg astats/volumedetect para confirmar...`);
+    logger.error(`🔧 [FALLBACK_NEEDED] Rodando FFmpeg astats/volumedetect para confirmar...`);
   }
   
   return checks;
@@ -301,7 +304,7 @@ export function samplePeakSanityCheck(samplePeakDbfs, truePeakDbtp, context = ''
  * 🔍 TAREFA 6: Fallback FFmpeg - usa astats/volumedetect para pegar valor correto
  */
 export async function ffmpegSamplePeakFallback(audioFilePath) {
-  console.log(`\n🔧 [FALLBACK] Executando FFmpeg astats para obter Sample Peak confiável`);
+  logger.debug(`\n🔧 [FALLBACK] Executando FFmpeg astats para obter Sample Peak confiável`);
   
   return new Promise((resolve, reject) => {
     const args = [
@@ -327,10 +330,10 @@ export async function ffmpegSamplePeakFallback(audioFilePath) {
       // Parse astats output
       const result = parseAstatsOutput(stderr);
       
-      console.log(`✅ [FALLBACK] FFmpeg astats result:`);
-      console.log(`   Sample Peak L: ${result.samplePeakLeftDb?.toFixed(2)} dBFS`);
-      console.log(`   Sample Peak R: ${result.samplePeakRightDb?.toFixed(2)} dBFS`);
-      console.log(`   Sample Peak Max: ${result.samplePeakMaxDb?.toFixed(2)} dBFS`);
+      logger.debug(`✅ [FALLBACK] FFmpeg astats result:`);
+      logger.debug(() => [`   Sample Peak L: ${result.samplePeakLeftDb?.toFixed(2)} dBFS`]);
+      logger.debug(() => [`   Sample Peak R: ${result.samplePeakRightDb?.toFixed(2)} dBFS`]);
+      logger.debug(() => [`   Sample Peak Max: ${result.samplePeakMaxDb?.toFixed(2)} dBFS`]);
       
       resolve(result);
     });
@@ -394,13 +397,13 @@ function parseAstatsOutput(stderr) {
  */
 export function correctSamplePeakIfNeeded(samplePeakMetrics, bufferAnalysis) {
   if (!bufferAnalysis.needsCorrection) {
-    console.log(`✅ [CORRECTION] Nenhuma correção necessária`);
+    logger.debug(`✅ [CORRECTION] Nenhuma correção necessária`);
     return samplePeakMetrics;
   }
   
-  console.log(`\n🔧 [CORRECTION] Aplicando correção de escala`);
-  console.log(`   Divisor detectado: ${bufferAnalysis.divisorNeeded}`);
-  console.log(`   Sample Peak ANTES: ${samplePeakMetrics.maxDbfs?.toFixed(2)} dBFS`);
+  logger.debug(`\n🔧 [CORRECTION] Aplicando correção de escala`);
+  logger.debug(() => [`   Divisor detectado: ${bufferAnalysis.divisorNeeded}`]);
+  logger.debug(() => [`   Sample Peak ANTES: ${samplePeakMetrics.maxDbfs?.toFixed(2)} dBFS`]);
   
   // Aplicar correção: dividir valor linear pelo divisor
   const correctionDb = 20 * Math.log10(bufferAnalysis.divisorNeeded);
@@ -417,8 +420,8 @@ export function correctSamplePeakIfNeeded(samplePeakMetrics, bufferAnalysis) {
     _divisor: bufferAnalysis.divisorNeeded
   };
   
-  console.log(`   Sample Peak DEPOIS: ${corrected.maxDbfs?.toFixed(2)} dBFS`);
-  console.log(`   Correção aplicada: ${correctionDb.toFixed(2)} dB`);
+  logger.debug(() => [`   Sample Peak DEPOIS: ${corrected.maxDbfs?.toFixed(2)} dBFS`]);
+  logger.debug(() => [`   Correção aplicada: ${correctionDb.toFixed(2)} dB`]);
   
   return corrected;
 }
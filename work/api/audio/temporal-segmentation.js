@@ -10,11 +10,17 @@
 // Sistema de tratamento de erros padronizado
 import { makeErr, ensureFiniteArray, logAudio, assertFinite } from '../../lib/audio/error-handling.js';
 import { FastFFT } from '../../lib/audio/fft.js';
+import { computeTimeDomainStats, rmsBlocksFromStats } from '../../lib/audio/features/time-domain-kernel.js';
+import { resolveAnalysisProfile } from '../../lib/audio/analysis-profiles.js';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:temporal-segmentation');
 
 // ========= CONFIGURAÇÕES FIXAS (AUDITORIA) =========
 const SAMPLE_RATE = 48000;
 
 // Configurações FFT (explícitas e documentadas)
+// Hop padrão do perfil "detailed"; o perfil "fast" usa hop maior (lib/audio/analysis-profiles.js)
 const FFT_SIZE = 4096;
 const FFT_HOP_SIZE = 1024; // 75% overlap = (4096-1024)/4096 = 75%
 const WINDOW_TYPE = "hann";
@@ -92,8 +98,12 @@ function extractFrame(audioData, startSample, frameSize) {
 
 /**
  * Segmentar canal para FFT com validações
+ * @param {Float32Array} audioData
+ * @param {string} channelName
+ * @param {number} hopSize - hop do perfil de análise
+ * @param {{startSample:number, endSample:number}|null} range - restringe aos frames (da grade do hop) dentro do trecho
  */
-function segmentChannelForFFT(audioData, channelName) {
+function segmentChannelForFFT(audioData, channelName, hopSize = FFT_HOP_SIZE, range = null) {
   const frames = [];
   const hannWindow = generateHannWindow(FFT_SIZE);
   const totalSamples = audioData.length;
@@ -102,14 +112,17 @@ function segmentChannelForFFT(audioData, channelName) {
   const fftEngine = new FastFFT();
   
   // Calcular número de frames de forma determinística
-  const numFrames = Math.floor((totalSamples - FFT_SIZE) / FFT_HOP_SIZE) + 1;
+  const numFrames = Math.floor((totalSamples - FFT_SIZE) / hopSize) + 1;
   
   if (numFrames <= 0) {
     throw makeErr('segmentation', `Áudio muito curto para FFT: ${totalSamples} samples < ${FFT_SIZE} required`, 'audio_too_short_fft');
   }
   
-  for (let frameIndex = 0; frameIndex < numFrames; frameIndex++) {
-    const startSample = frameIndex * FFT_HOP_SIZE;
+  const firstFrame = range ? Math.max(0, Math.ceil(range.startSample / hopSize)) : 0;
+  const endFrame = range ? Math.min(numFrames, Math.floor((range.endSample - FFT_SIZE) / hopSize) + 1) : numFrames;
+  
+  for (let frameIndex = firstFrame; frameIndex < endFrame; frameIndex++) {
+    const startSample = frameIndex * hopSize;
     
     // Proteção contra overflow
     if (startSample >= totalSamples) {
@@ -131,13 +144,131 @@ function segmentChannelForFFT(audioData, channelName) {
     }
   }
   
-  if (frames.length === 0) {
+  if (frames.length === 0 && !range) {
     throw makeErr('segmentation', `Nenhum frame FFT gerado para canal ${channelName}`, 'no_fft_frames');
   }
   
   return frames;
 }
 
+/**
+ * Sinalizar trechos para a passada detalhada (perfil fast)
+ * - clipping: hop de 100ms do kernel com pico L/R >= clipPeakThreshold
+ * - sub_imbalance: frame grosso com sub (20-120 Hz) relevante e |L - R| > subImbalanceDb
+ * Trechos recebem padding, são unidos quando próximos e limitados em quantidade/duração.
+ */
+function flagSegmentsForRefinement(timeDomainStats, leftFFTFrames, rightFFTFrames, hopSize, refinement, totalSamples) {
+  const intervals = [];
+
+  // Clipping (sem revisitar amostras: pico por hop já vem do kernel)
+  const hopPeaks = timeDomainStats.hops.peak;
+  for (let h = 0; h < timeDomainStats.numHops; h++) {
+    if (hopPeaks[h] >= refinement.clipPeakThreshold) {
+      const start = h * timeDomainStats.hopSamples;
+      intervals.push({ start, end: Math.min(start + timeDomainStats.hopSamples, totalSamples), reason: 'clipping', peak: hopPeaks[h] });
+    }
+  }
+
+  // Desequilíbrio de sub nos frames grossos
+  const binHz = SAMPLE_RATE / FFT_SIZE;
+  const subFrom = Math.max(1, Math.ceil(refinement.subBandHz[0] / binHz));
+  const subTo = Math.floor(refinement.subBandHz[1] / binHz);
+  for (let f = 0; f < leftFFTFrames.length; f++) {
+    const magL = leftFFTFrames[f].magnitude;
+    const magR = rightFFTFrames[f].magnitude;
+    let subL = 0, subR = 0, total = 0;
+    for (let b = 1; b < magL.length; b++) {
+      const eL = magL[b] * magL[b];
+      const eR = magR[b] * magR[b];
+      total += eL + eR;
+      if (b >= subFrom && b <= subTo) {
+        subL += eL;
+        subR += eR;
+      }
+    }
+    if (total <= 0 || (subL + subR) / total < refinement.subMinShare) continue;
+    const imbalanceDb = subL > 0 && subR > 0 ? Math.abs(10 * Math.log10(subL / subR)) : Infinity;
+    if (imbalanceDb > refinement.subImbalanceDb) {
+      const start = f * hopSize;
+      intervals.push({ start, end: Math.min(start + FFT_SIZE, totalSamples), reason: 'sub_imbalance', imbalanceDb });
+    }
+  }
+
+  if (intervals.length === 0) return { segments: [], truncated: false };
+
+  // Padding + união de trechos próximos
+  const padding = Math.round(refinement.paddingSeconds * SAMPLE_RATE);
+  const mergeGap = Math.round(refinement.mergeGapSeconds * SAMPLE_RATE);
+  intervals.sort((a, b) => a.start - b.start);
+
+  const merged = [];
+  for (const interval of intervals) {
+    const start = Math.max(0, interval.start - padding);
+    const end = Math.min(totalSamples, interval.end + padding);
+    let segment = merged[merged.length - 1];
+    if (!segment || start - segment.endSample > mergeGap) {
+      segment = { startSample: start, endSample: end, reasons: [], clippedHops: 0, subImbalanceFrames: 0, maxSubImbalanceDb: 0, peak: 0 };
+      merged.push(segment);
+    }
+    segment.endSample = Math.max(segment.endSample, end);
+    if (!segment.reasons.includes(interval.reason)) segment.reasons.push(interval.reason);
+    if (interval.reason === 'clipping') {
+      segment.clippedHops++;
+      segment.peak = Math.max(segment.peak, interval.peak);
+    } else {
+      segment.subImbalanceFrames++;
+      segment.maxSubImbalanceDb = Math.max(segment.maxSubImbalanceDb, interval.imbalanceDb);
+    }
+  }
+
+  // Limites de custo: maiores trechos primeiro, depois em ordem temporal
+  const maxSamples = refinement.maxRefinedSeconds * SAMPLE_RATE;
+  const bySize = merged.slice().sort((a, b) => (b.endSample - b.startSample) - (a.endSample - a.startSample));
+  const kept = [];
+  let keptSamples = 0;
+  for (const segment of bySize) {
+    if (kept.length >= refinement.maxSegments) break;
+    const length = segment.endSample - segment.startSample;
+    if (keptSamples + length > maxSamples) continue;
+    kept.push(segment);
+    keptSamples += length;
+  }
+  kept.sort((a, b) => a.startSample - b.startSample);
+
+  return { segments: kept, truncated: kept.length < merged.length };
+}
+
+/**
+ * Passada detalhada (hop fino) apenas nos trechos sinalizados
+ */
+function refineSegments(leftChannel, rightChannel, segments, hopSize) {
+  const refined = [];
+  for (const segment of segments) {
+    const range = { startSample: segment.startSample, endSample: segment.endSample };
+    const left = segmentChannelForFFT(leftChannel, 'left', hopSize, range);
+    const right = segmentChannelForFFT(rightChannel, 'right', hopSize, range);
+    if (left.length === 0 || left.length !== right.length) continue;
+
+    const firstFrameIndex = Math.ceil(segment.startSample / hopSize);
+    refined.push({
+      ...segment,
+      startTime: segment.startSample / SAMPLE_RATE,
+      endTime: segment.endSample / SAMPLE_RATE,
+      maxSubImbalanceDb: Number.isFinite(segment.maxSubImbalanceDb) ? segment.maxSubImbalanceDb : null,
+      framesFFT: {
+        left,
+        right,
+        frameSize: FFT_SIZE,
+        hopSize,
+        count: left.length,
+        firstFrameIndex,
+        timestamps: left.map((_, i) => ((firstFrameIndex + i) * hopSize) / SAMPLE_RATE)
+      }
+    });
+  }
+  return refined;
+}
+
 /**
  * Segmentar canal para RMS/LUFS com validações
  */
@@ -169,7 +300,7 @@ function segmentChannelForRMS(audioData, channelName) {
     const rmsValue = Math.sqrt(sumSquares / RMS_BLOCK_SAMPLES);
     
     if (blockIndex === 0) {
-      console.log(`[DEBUG RMS CALC] Canal ${channelName}, Bloco 0: rmsValue=${rmsValue}, isFinite=${isFinite(rmsValue)}, blockLength=${blockLength}`);
+      logger.trace(() => [`[DEBUG RMS CALC] Canal ${channelName}, Bloco 0: rmsValue=${rmsValue}, isFinite=${isFinite(rmsValue)}, blockLength=${blockLength}`]);
     }
     
     if (isFinite(rmsValue)) {
@@ -183,7 +314,7 @@ function segmentChannelForRMS(audioData, channelName) {
     throw makeErr('segmentation', `Nenhum frame RMS gerado para canal ${channelName}`, 'no_rms_frames');
   }
   
-  console.log(`[DEBUG RMS FINAL] Canal ${channelName}: rmsValues=${rmsValues.length}, primeiro RMS=${rmsValues[0]?.toFixed(6)}, último RMS=${rmsValues[rmsValues.length-1]?.toFixed(6)}`);
+  logger.trace(() => [`[DEBUG RMS FINAL] Canal ${channelName}: rmsValues=${rmsValues.length}, primeiro RMS=${rmsValues[0]?.toFixed(6)}, último RMS=${rmsValues[rmsValues.length-1]?.toFixed(6)}`]);
   
   return { rmsValues };
 }
@@ -255,18 +386,29 @@ export function segmentAudioTemporal(audioBufferLike, options = {}) {
     const validatedAudio = validateAudioInput(audioBufferLike);
     const { leftChannel, rightChannel, sampleRate, duration, numberOfChannels } = validatedAudio;
 
+    // ========= PERFIL DE ANÁLISE =========
+    const profile = resolveAnalysisProfile(options.analysisProfile);
+    const fftHopSize = profile.hopSize;
+
     // ========= SEGMENTAÇÃO FFT =========
-    const leftFFTFrames = segmentChannelForFFT(leftChannel, 'left');
-    const rightFFTFrames = segmentChannelForFFT(rightChannel, 'right');
+    const leftFFTFrames = segmentChannelForFFT(leftChannel, 'left', fftHopSize);
+    const rightFFTFrames = segmentChannelForFFT(rightChannel, 'right', fftHopSize);
 
     // Validar consistência
     if (leftFFTFrames.length !== rightFFTFrames.length) {
       throw makeErr(stage, `FFT frames inconsistentes: L=${leftFFTFrames.length}, R=${rightFFTFrames.length}`, 'fft_frame_count_mismatch');
     }
 
+    // ========= KERNEL DE DOMÍNIO DO TEMPO (passada única) =========
+    // ⚡ Uma leitura de L/R alimenta RMS por bloco, sample peak, DC, estéreo e dinâmica no core-metrics
+    const timeDomainStats = computeTimeDomainStats(leftChannel, rightChannel, SAMPLE_RATE);
+
     // ========= SEGMENTAÇÃO RMS =========
-    const leftRMSResult = segmentChannelForRMS(leftChannel, 'left');
-    const rightRMSResult = segmentChannelForRMS(rightChannel, 'right');
+    const kernelRMSCompatible = timeDomainStats.hopSamples === RMS_HOP_SAMPLES && timeDomainStats.numHops > 0;
+    const leftRMSValues = kernelRMSCompatible ? rmsBlocksFromStats(timeDomainStats, 'left', RMS_BLOCK_SAMPLES) : null;
+    const rightRMSValues = kernelRMSCompatible ? rmsBlocksFromStats(timeDomainStats, 'right', RMS_BLOCK_SAMPLES) : null;
+    const leftRMSResult = leftRMSValues ? { rmsValues: leftRMSValues } : segmentChannelForRMS(leftChannel, 'left');
+    const rightRMSResult = rightRMSValues ? { rmsValues: rightRMSValues } : segmentChannelForRMS(rightChannel, 'right');
 
     // Validar consistência
     // 🧹 MEMORY OPT: segmentChannelForRMS retorna { rmsValues } apenas (sem .frames)
@@ -274,8 +416,24 @@ export function segmentAudioTemporal(audioBufferLike, options = {}) {
       throw makeErr(stage, `RMS frames inconsistentes: L=${leftRMSResult.rmsValues.length}, R=${rightRMSResult.rmsValues.length}`, 'rms_frame_count_mismatch');
     }
 
+    // ========= PASSADA DETALHADA (perfil fast) =========
+    let refinedSegments = [];
+    let refinementTruncated = false;
+    if (profile.refine) {
+      const flagged = flagSegmentsForRefinement(timeDomainStats, leftFFTFrames, rightFFTFrames, fftHopSize, profile.refinement, leftChannel.length);
+      refinedSegments = refineSegments(leftChannel, rightChannel, flagged.segments, profile.refinement.hopSize);
+      refinementTruncated = flagged.truncated;
+      logAudio(stage, 'refinement', {
+        jobId,
+        profile: profile.name,
+        segments: refinedSegments.length,
+        truncated: refinementTruncated,
+        refinedFrames: refinedSegments.reduce((sum, seg) => sum + seg.framesFFT.count, 0)
+      });
+    }
+
     // ========= GERAR TIMESTAMPS =========
-    const fftTimestamps = generateTimestamps(leftFFTFrames.length, FFT_HOP_SIZE, sampleRate);
+    const fftTimestamps = generateTimestamps(leftFFTFrames.length, fftHopSize, sampleRate);
     const rmsTimestamps = generateTimestamps(leftRMSResult.rmsValues.length, RMS_HOP_SAMPLES, sampleRate);
 
     // ========= RESULTADO ESTRUTURADO =========
@@ -294,16 +452,29 @@ export function segmentAudioTemporal(audioBufferLike, options = {}) {
         right: rightChannel
       },
 
+      // ⚡ Acumuladores do kernel de passada única (consumidos pelo core-metrics)
+      timeDomainStats,
+
+      // 🎚️ Perfil de análise + trechos re-analisados em hop fino (perfil fast)
+      analysisProfile: {
+        name: profile.name,
+        fftHopSize,
+        refinementHopSize: profile.refine ? profile.refinement.hopSize : null,
+        refinedSegments,
+        truncated: refinementTruncated,
+        accuracy: profile.accuracy
+      },
+
       // Frames FFT com metadados completos
       framesFFT: {
         left: leftFFTFrames,
         right: rightFFTFrames,
         frameSize: FFT_SIZE,
-        hopSize: FFT_HOP_SIZE,
+        hopSize: fftHopSize,
         windowType: WINDOW_TYPE,
         count: leftFFTFrames.length,
         timestamps: fftTimestamps,
-        overlapPercent: ((FFT_SIZE - FFT_HOP_SIZE) / FFT_SIZE) * 100,
+        overlapPercent: ((FFT_SIZE - fftHopSize) / FFT_SIZE) * 100,
         // 🔥 NOVO: Campo frames combinado para core-metrics
         frames: leftFFTFrames.map((leftFrame, index) => ({
           leftFFT: leftFrame,
@@ -341,11 +512,12 @@ export function segmentAudioTemporal(audioBufferLike, options = {}) {
         // Configurações explícitas (para auditoria)
         config: {
           sampleRate: SAMPLE_RATE,
+          profile: profile.name,
           fft: {
             size: FFT_SIZE,
-            hop: FFT_HOP_SIZE,
+            hop: fftHopSize,
             window: WINDOW_TYPE,
-            overlapPercent: ((FFT_SIZE - FFT_HOP_SIZE) / FFT_SIZE) * 100
+            overlapPercent: ((FFT_SIZE - fftHopSize) / FFT_SIZE) * 100
           },
           rms: {
             blockMs: RMS_BLOCK_DURATION_MS,
@@ -359,6 +531,7 @@ export function segmentAudioTemporal(audioBufferLike, options = {}) {
         counts: {
           originalSamples: leftChannel.length,
           fftFrames: leftFFTFrames.length,
+          refinedSegments: refinedSegments.length,
           rmsFrames: leftRMSResult.rmsValues.length,
           fftTimestamps: fftTimestamps.length,
           rmsTimestamps: rmsTimestamps.length
@@ -371,7 +544,7 @@ export function segmentAudioTemporal(audioBufferLike, options = {}) {
     if (result.framesFFT.count !== result.framesRMS.count) {
       // Isso é normal - números diferentes de frames
       // Apenas log para auditoria
-      console.log(`[SEGMENTATION] Frame counts: FFT=${result.framesFFT.count}, RMS=${result.framesRMS.count}`);
+      logger.debug(() => [`[SEGMENTATION] Frame counts: FFT=${result.framesFFT.count}, RMS=${result.framesRMS.count}`]);
     }
 
     // Validar timestamps
@@ -413,13 +586,15 @@ export function segmentAudioTemporal(audioBufferLike, options = {}) {
 /**
  * Validar configuração de segmentação (para testes)
  */
-export function validateSegmentationConfig() {
+export function validateSegmentationConfig(analysisProfile = null) {
+  const profile = resolveAnalysisProfile(analysisProfile);
   return {
     sampleRate: SAMPLE_RATE,
+    profile: profile.name,
     fft: {
       size: FFT_SIZE,
-      hop: FFT_HOP_SIZE,
-      overlap: `${(((FFT_SIZE - FFT_HOP_SIZE) / FFT_SIZE) * 100).toFixed(1)}%`,
+      hop: profile.hopSize,
+      overlap: `${(((FFT_SIZE - profile.hopSize) / FFT_SIZE) * 100).toFixed(1)}%`,
       window: WINDOW_TYPE,
     },
     rms: {
@@ -434,17 +609,17 @@ export function validateSegmentationConfig() {
 /**
  * Calcular timing dos frames (utilitário)
  */
-export function calculateFrameTiming(audioLengthSamples) {
+export function calculateFrameTiming(audioLengthSamples, fftHopSize = FFT_HOP_SIZE) {
   const audioDuration = audioLengthSamples / SAMPLE_RATE;
 
-  const fftFrameCount = Math.floor((audioLengthSamples - FFT_SIZE) / FFT_HOP_SIZE) + 1;
+  const fftFrameCount = Math.floor((audioLengthSamples - FFT_SIZE) / fftHopSize) + 1;
   const rmsFrameCount = Math.ceil(audioLengthSamples / RMS_HOP_SAMPLES);
 
   return {
     audioDuration,
     fft: {
       frameCount: fftFrameCount,
-      lastFrameAt: ((fftFrameCount - 1) * FFT_HOP_SIZE) / SAMPLE_RATE,
+      lastFrameAt: ((fftFrameCount - 1) * fftHopSize) / SAMPLE_RATE,
     },
     rms: {
       frameCount: rmsFrameCount,
@@ -3,6 +3,7 @@
 import { getAuth, getFirestore } from '../../firebase/admin.js';
 import { canUseChat, registerChat } from '../lib/user/userPlans.js'; // ✅ NOVO: Sistema de planos
 import { chatLimiter } from '../lib/rateLimiterRedis.js'; // ✅ V3: Rate limiting GLOBAL via Redis
+import { buildChatCacheKey, getOrComputeChatResponse } from '../lib/ai/chat-response-cache.js'; // 💾 Cache L1+Redis
 
 // 🔐 ENTITLEMENTS: Sistema de controle de acesso por plano
 import { getUserPlan, hasEntitlement, buildPlanRequiredResponse } from '../lib/entitlements.js';
@@ -263,10 +264,6 @@ const rateLimitMetrics = {
   lastCleanup: Date.now()
 };
 
-// Cache para respostas frequentes (Fase 2)
-const responseCache = new Map();
-const CACHE_TTL = 5 * 60 * 1000; // 5 minutos
-
 function checkRateLimit(uid) {
   const now = Date.now();
   rateLimitMetrics.totalRequests++;
@@ -290,7 +287,6 @@ function checkRateLimit(uid) {
   // Cleanup periódico (a cada 100 requests)
   if (rateLimitMetrics.totalRequests % 100 === 0) {
     cleanupRateLimit();
-    cleanupResponseCache();
   }
   
   return true;
@@ -318,60 +314,6 @@ function cleanupRateLimit() {
   rateLimitMetrics.lastCleanup = now;
 }
 
-// Cache inteligente para respostas (Fase 2)
-function getCachedResponse(messageHash) {
-  const cached = responseCache.get(messageHash);
-  if (cached && Date.now() - cached.timestamp < CACHE_TTL) {
-    console.log(`💾 Cache hit para mensagem: ${messageHash.substring(0, 8)}`);
-    return cached.response;
-  }
-  if (cached) {
-    responseCache.delete(messageHash);
-  }
-  return null;
-}
-
-function setCachedResponse(messageHash, response) {
-  // Limitar cache a 100 entradas
-  if (responseCache.size >= 100) {
-    const oldestKey = responseCache.keys().next().value;
-    responseCache.delete(oldestKey);
-  }
-  
-  responseCache.set(messageHash, {
-    response,
-    timestamp: Date.now()
-  });
-  console.log(`💾 Cache set para mensagem: ${messageHash.substring(0, 8)}`);
-}
-
-function cleanupResponseCache() {
-  const now = Date.now();
-  const beforeSize = responseCache.size;
-  
-  for (const [hash, data] of responseCache.entries()) {
-    if (now - data.timestamp > CACHE_TTL) {
-      responseCache.delete(hash);
-    }
-  }
-  
-  const cleaned = beforeSize - responseCache.size;
-  if (cleaned > 0) {
-    console.log(`🧹 Response cache cleanup: ${cleaned} entradas expiradas removidas`);
-  }
-}
-
-// Hash simples para mensagens (para cache)
-function hashMessage(message) {
-  let hash = 0;
-  for (let i = 0; i < message.length; i++) {
-    const char = message.charCodeAt(i);
-    hash = ((hash << 5) - hash) + char;
-    hash = hash & hash; // Convert to 32bit integer
-  }
-  return Math.abs(hash).toString(36);
-}
-
 // ✅ CORS usando configuração centralizada
 const corsMiddleware = cors(getCorsConfig());
 
@@ -1085,70 +1027,83 @@ async function handlerWithoutRateLimit(req, res) {
       hasImages: hasImages
     });
 
-    // ✅ TIMEOUT CONFIGURÁVEL baseado na complexidade
-    requestTimeout = hasImages ? 180000 : (modelSelection.model === 'gpt-4o' ? 120000 : 60000);
-    const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), requestTimeout);
-
-    // Chamar API da OpenAI
-    const response = await fetch('https://api.openai.com/v1/chat/completions', {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${process.env.OPENAI_API_KEY}`,
-        'Content-Type': 'application/json',
-      },
-      signal: controller.signal,
-      body: JSON.stringify({
-        model: modelSelection.model,
-        messages: messages,
-        max_tokens: modelSelection.maxTokens,
-        temperature: modelSelection.temperature,
-      }),
+    // 💾 CACHE: conversas só-texto idênticas (mesmo modelo/params) reutilizam a resposta
+    // Imagens nunca entram no cache (conteúdo único e chave custosa)
+    const cacheKey = hasImages ? null : buildChatCacheKey({
+      messages,
+      model: modelSelection.model,
+      temperature: modelSelection.temperature,
+      maxTokens: modelSelection.maxTokens
     });
 
-    // ✅ Limpar timeout após resposta
-    clearTimeout(timeoutId);
+    // ✅ TIMEOUT CONFIGURÁVEL baseado na complexidade (também dimensiona o lock do cache)
+    requestTimeout = hasImages ? 180000 : (modelSelection.model === 'gpt-4o' ? 120000 : 60000);
 
-    // ✅ MELHORIA: Tratamento de erro mais específico e retry em casos específicos
-    if (!response.ok) {
-      let errorDetails = 'Unknown error';
-      try {
-        errorDetails = await response.text();
-      } catch (parseErr) {
-        console.error('❌ Failed to parse OpenAI error response:', parseErr);
-      }
-      console.error('❌ OpenAI API Error:', {
-        status: response.status,
-        statusText: response.statusText,
-        details: errorDetails,
-        model: modelSelection.model,
-        hasImages: hasImages
+    const { value: reply, source: cacheSource } = await getOrComputeChatResponse(cacheKey, async () => {
+      const controller = new AbortController();
+      const timeoutId = setTimeout(() => controller.abort(), requestTimeout);
+
+      // Chamar API da OpenAI
+      const response = await fetch('https://api.openai.com/v1/chat/completions', {
+        method: 'POST',
+        headers: {
+          'Authorization': `Bearer ${process.env.OPENAI_API_KEY}`,
+          'Content-Type': 'application/json',
+        },
+        signal: controller.signal,
+        body: JSON.stringify({
+          model: modelSelection.model,
+          messages: messages,
+          max_tokens: modelSelection.maxTokens,
+          temperature: modelSelection.temperature,
+        }),
       });
+
+      // ✅ Limpar timeout após resposta
+      clearTimeout(timeoutId);
+
+      // ✅ MELHORIA: Tratamento de erro mais específico e retry em casos específicos
+      if (!response.ok) {
+        let errorDetails = 'Unknown error';
+        try {
+          errorDetails = await response.text();
+        } catch (parseErr) {
+          console.error('❌ Failed to parse OpenAI error response:', parseErr);
+        }
+        console.error('❌ OpenAI API Error:', {
+          status: response.status,
+          statusText: response.statusText,
+          details: errorDetails,
+          model: modelSelection.model,
+          hasImages: hasImages
+        });
       
-      // Mapear erros específicos da OpenAI
-      if (response.status === 401) {
-        throw new Error('OpenAI API key invalid or expired');
-      } else if (response.status === 429) {
-        // Rate limit - sugerir retry
-        throw new Error('OpenAI API rate limit exceeded. Please try again in a moment.');
-      } else if (response.status === 400 && errorDetails.includes('image')) {
-        // Erro específico de imagem
-        throw new Error('Image format not supported or corrupted. Please try a different image.');
-      } else if (response.status >= 500) {
-        throw new Error('OpenAI service temporarily unavailable');
-      } else {
-        throw new Error(`OpenAI API error: ${response.status}`);
+        // Mapear erros específicos da OpenAI
+        if (response.status === 401) {
+          throw new Error('OpenAI API key invalid or expired');
+        } else if (response.status === 429) {
+          // Rate limit - sugerir retry
+          throw new Error('OpenAI API rate limit exceeded. Please try again in a moment.');
+        } else if (response.status === 400 && errorDetails.includes('image')) {
+          // Erro específico de imagem
+          throw new Error('Image format not supported or corrupted. Please try a different image.');
+        } else if (response.status >= 500) {
+          throw new Error('OpenAI service temporarily unavailable');
+        } else {
+          throw new Error(`OpenAI API error: ${response.status}`);
+        }
       }
-    }
 
-    const data = await response.json();
-    const reply = data.choices[0].message.content;
+      const data = await response.json();
+      return data.choices[0].message.content;
+    }, { requestTimeoutMs: requestTimeout });
 
     console.log(`✅ [${requestId}] Resposta da IA gerada com sucesso`, {
       model: modelSelection ? modelSelection.model : 'unknown',
       hasImages: hasImages,
       responseLength: reply.length,
       tokenEstimate: Math.ceil(reply.length / 4),
+      cache: cacheSource || 'miss',
       userPlan: userData?.plan || 'demo'
     });
 
@@ -0,0 +1,117 @@
+// work/api/references/index.js
+// Biblioteca de referências: salvar uma referência já analisada e reutilizá-la no modo referência
+//
+// GET    /api/references        → lista referências do usuário + compartilhadas
+// POST   /api/references        → { jobId, name?, shared? } salva métricas de um job reference/base
+// DELETE /api/references/:id    → remove referência própria
+//
+// Para comparar: POST /api/audio/analyze com { mode: 'reference', referenceStage: 'compare', referenceId }
+
+import express from 'express';
+import { getAuth, getFirestore } from '../../../firebase/admin.js';
+import { getUserPlan, hasEntitlement, buildPlanRequiredResponse } from '../../lib/entitlements.js';
+import {
+  saveReferenceFromJob,
+  listReferences,
+  deleteReference
+} from '../../lib/references/referenceLibrary.js';
+
+const router = express.Router();
+
+// UIDs autorizados a publicar na biblioteca compartilhada (separados por vírgula)
+const SHARED_LIBRARY_ADMINS = (process.env.REFERENCE_LIBRARY_ADMINS || '')
+  .split(',')
+  .map(uid => uid.trim())
+  .filter(Boolean);
+
+const SAVE_ERROR_STATUS = {
+  MISSING_DATA: 400,
+  JOB_NOT_FOUND: 404,
+  JOB_NOT_COMPLETED: 409,
+  NOT_REFERENCE_JOB: 400,
+  INVALID_RESULTS: 422,
+  FORBIDDEN: 403,
+  LIBRARY_FULL: 409
+};
+
+/**
+ * Middleware: valida token Firebase (Authorization: Bearer <token>)
+ */
+async function requireAuth(req, res, next) {
+  const authHeader = req.headers.authorization;
+  if (!authHeader || !authHeader.startsWith('Bearer ')) {
+    return res.status(401).json({ success: false, error: 'AUTH_TOKEN_MISSING', message: 'Token de autenticação necessário' });
+  }
+
+  try {
+    const decoded = await getAuth().verifyIdToken(authHeader.split('Bearer ')[1]);
+    req.uid = decoded.uid;
+    next();
+  } catch (error) {
+    console.error('❌ [REF-LIBRARY] Token inválido:', error.message);
+    return res.status(401).json({ success: false, error: 'AUTH_ERROR', message: 'Token inválido ou expirado' });
+  }
+}
+
+router.use(requireAuth);
+
+/**
+ * GET /api/references
+ */
+router.get('/', async (req, res) => {
+  try {
+    const references = await listReferences(req.uid);
+    res.json({ success: true, references });
+  } catch (error) {
+    console.error('❌ [REF-LIBRARY] Erro ao listar:', error.message);
+    res.status(500).json({ success: false, error: 'LIBRARY_ERROR' });
+  }
+});
+
+/**
+ * POST /api/references
+ */
+router.post('/', async (req, res) => {
+  const { jobId, name, shared = false } = req.body || {};
+
+  try {
+    // 🔐 Mesmo entitlement do modo referência
+    const userDoc = await getFirestore().collection('usuarios').doc(req.uid).get();
+    const userPlan = getUserPlan(userDoc.exists ? userDoc.data() : null);
+    if (!hasEntitlement(userPlan, 'reference')) {
+      return res.status(403).json(buildPlanRequiredResponse('reference', userPlan));
+    }
+
+    if (shared && !SHARED_LIBRARY_ADMINS.includes(req.uid)) {
+      return res.status(403).json({ success: false, error: 'FORBIDDEN', message: 'Sem permissão para a biblioteca compartilhada' });
+    }
+
+    const result = await saveReferenceFromJob({ ownerUid: req.uid, jobId, name, shared: !!shared });
+    if (!result.success) {
+      return res.status(SAVE_ERROR_STATUS[result.error] || 400).json(result);
+    }
+
+    res.status(result.created ? 201 : 200).json(result);
+  } catch (error) {
+    console.error('❌ [REF-LIBRARY] Erro ao salvar:', error.message);
+    res.status(500).json({ success: false, error: 'LIBRARY_ERROR' });
+  }
+});
+
+/**
+ * DELETE /api/references/:id
+ */
+router.delete('/:id', async (req, res) => {
+  try {
+    const deleted = await deleteReference(req.params.id, req.uid);
+    if (!deleted) {
+      return res.status(404).json({ success: false, error: 'REFERENCE_NOT_FOUND' });
+    }
+    res.json({ success: true });
+  } catch (error) {
+    console.error('❌ [REF-LIBRARY] Erro ao remover:', error.message);
+    res.status(500).json({ success: false, error: 'LIBRARY_ERROR' });
+  }
+});
+
+export default router;
@@ -1,8 +1,8 @@
 import express from "express";
-import multer from "multer";
 import AWS from "aws-sdk";
 import cors from "cors";
 import pool from "../db.js";
+import multipartUploadRouter from "./uploads/multipart.js";
 import { getCorsConfig } from '../config/environment.js';
 
 const app = express();
@@ -10,6 +10,7 @@ const PORT = process.env.PORT || 3000;
 
 // ✅ CORS usando configuração centralizada
 app.use(cors(getCorsConfig()));
+app.use(express.json());
 
 // ---------- Configuração Backblaze ----------
 const s3 = new AWS.S3({
@@ -22,33 +23,6 @@ const s3 = new AWS.S3({
 
 const BUCKET_NAME = process.env.B2_BUCKET_NAME;
 
-// ---------- Middleware para upload ----------
-const storage = multer.memoryStorage();
-
-const fileFilter = (req, file, cb) => {
-  const allowedTypes = [
-    "audio/mpeg",   // mp3
-    "audio/wav",    // wav
-    "audio/x-wav",  // outra variação wav
-    "audio/wave",   // outra variação wav
-    "audio/x-m4a",  // m4a
-    "audio/mp4",    // m4a/mp4
-  ];
-  if (!allowedTypes.includes(file.mimetype)) {
-    return cb(
-      new Error("Tipo de arquivo não permitido. Envie apenas mp3, wav ou m4a."),
-      false
-    );
-  }
-  cb(null, true);
-};
-
-const upload = multer({
-  storage,
-  limits: { fileSize: 150 * 1024 * 1024 }, // 150 MB
-  fileFilter,
-});
-
 // ---------- Rotas ----------
 app.get("/health", (req, res) => {
   res.send("API está rodando 🚀");
@@ -117,41 +91,8 @@ app.get("/test", async (req, res) => {
   }
 });
 
-app.post("/upload", upload.single("file"), async (req, res) => {
-  try {
-    if (!req.file) {
-      return res
-        .status(400)
-        .json({ error: "Nenhum arquivo enviado ou tipo inválido." });
-    }
-
-    const key = `uploads/${Date.now()}-${req.file.originalname}`;
-
-    const params = {
-      Bucket: BUCKET_NAME,
-      Key: key,
-      Body: req.file.buffer,
-      ContentType: req.file.mimetype,
-    };
-
-    const data = await s3.upload(params).promise();
-    console.log("✅ Upload concluído:", key);
-
-    const result = await pool.query(
-      "INSERT INTO jobs (file_key, status) VALUES ($1, $2) RETURNING *",
-      [key, "queued"]
-    );
-
-    res.json({
-      message: "Arquivo enviado e job criado!",
-      fileUrl: `https://s3.us-east-005.backblazeb2.com/${BUCKET_NAME}/${key}`,
-      job: result.rows[0],
-    });
-  } catch (err) {
-    console.error("❌ Erro no upload:", err.message);
-    res.status(500).json({ error: err.message });
-  }
-});
+// ---------- Upload multipart (partes direto no bucket; API não recebe o arquivo) ----------
+app.use("/api/uploads/multipart", multipartUploadRouter);
 
 // ---------- Start ----------
 app.listen(PORT, () => {
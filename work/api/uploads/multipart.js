@@ -0,0 +1,106 @@
+// work/api/uploads/multipart.js
+// Upload multipart pré-assinado (substitui o /upload com multer.memoryStorage())
+//
+// POST   /api/uploads/multipart                     → { ext, contentType, size } cria upload + URLs das partes
+// POST   /api/uploads/multipart/:uploadId/parts     → { fileKey, size } retomada: partes recebidas + URLs das que faltam
+// POST   /api/uploads/multipart/:uploadId/complete  → { fileKey, size } conclui e confere o tamanho no bucket
+// DELETE /api/uploads/multipart/:uploadId           → { fileKey } cancela
+//
+// O cliente faz PUT de cada parte direto na URL assinada e depois usa o fileKey
+// normalmente em POST /api/audio/analyze.
+// UPLOAD_STORE=local usa o stand-in S3-compatível em disco (lib/uploads/localObjectStore.js).
+
+import express from 'express';
+import {
+  startMultipartUpload,
+  resumeMultipartUpload,
+  completeMultipartUpload,
+  abortMultipartUpload
+} from '../../lib/uploads/multipartUploads.js';
+import { createS3MultipartStore } from '../../lib/uploads/s3MultipartStore.js';
+import { createLocalObjectStore } from '../../lib/uploads/localObjectStore.js';
+
+const router = express.Router();
+
+const ERROR_STATUS = {
+  INVALID_EXTENSION: 400,
+  INVALID_SIZE: 400,
+  INVALID_KEY: 400,
+  FILE_TOO_LARGE: 413,
+  UPLOAD_NOT_FOUND: 404,
+  INCOMPLETE_UPLOAD: 409,
+  SIZE_MISMATCH: 409
+};
+
+let _store = null;
+function getStore() {
+  if (!_store) {
+    _store = (process.env.UPLOAD_STORE || '').toLowerCase() === 'local'
+      ? createLocalObjectStore()
+      : createS3MultipartStore();
+  }
+  return _store;
+}
+
+function respond(res, result, okStatus = 200) {
+  if (!result.success) {
+    return res.status(ERROR_STATUS[result.error] || 400).json(result);
+  }
+  res.status(okStatus).json(result);
+}
+
+/**
+ * POST /api/uploads/multipart
+ */
+router.post('/', async (req, res) => {
+  try {
+    const { ext, contentType, size } = req.body || {};
+    const result = await startMultipartUpload(getStore(), { ext, contentType, size });
+    if (result.success) console.log(`📤 [UPLOAD] Multipart iniciado: ${result.fileKey} (${result.partCount} partes)`);
+    respond(res, result, 201);
+  } catch (error) {
+    console.error('❌ [UPLOAD] Erro ao iniciar multipart:', error.message);
+    res.status(500).json({ success: false, error: 'UPLOAD_ERROR' });
+  }
+});
+
+/**
+ * POST /api/uploads/multipart/:uploadId/parts
+ */
+router.post('/:uploadId/parts', async (req, res) => {
+  try {
+    const { fileKey, size } = req.body || {};
+    respond(res, await resumeMultipartUpload(getStore(), { fileKey, uploadId: req.params.uploadId, size }));
+  } catch (error) {
+    console.error('❌ [UPLOAD] Erro ao assinar partes:', error.message);
+    res.status(500).json({ success: false, error: 'UPLOAD_ERROR' });
+  }
+});
+
+/**
+ * POST /api/uploads/multipart/:uploadId/complete
+ */
+router.post('/:uploadId/complete', async (req, res) => {
+  try {
+    const { fileKey, size } = req.body || {};
+    respond(res, await completeMultipartUpload(getStore(), { fileKey, uploadId: req.params.uploadId, size }));
+  } catch (error) {
+    console.error('❌ [UPLOAD] Erro ao concluir multipart:', error.message);
+    res.status(500).json({ success: false, error: 'UPLOAD_ERROR' });
+  }
+});
+
+/**
+ * DELETE /api/uploads/multipart/:uploadId
+ */
+router.delete('/:uploadId', async (req, res) => {
+  try {
+    const fileKey = (req.body && req.body.fileKey) || req.query.fileKey;
+    respond(res, await abortMultipartUpload(getStore(), { fileKey, uploadId: req.params.uploadId }));
+  } catch (error) {
+    console.error('❌ [UPLOAD] Erro ao cancelar multipart:', error.message);
+    res.status(500).json({ success: false, error: 'UPLOAD_ERROR' });
+  }
+});
+
+export default router;
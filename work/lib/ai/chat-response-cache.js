@@ -0,0 +1,227 @@
+/**
+ * 💾 CHAT RESPONSE CACHE - DUAS CAMADAS (MEMÓRIA + REDIS)
+ *
+ * Substitui o antigo Map de 100 entradas em api/chat.js.
+ *
+ * ARQUITETURA:
+ * - Armazenamento: CacheManager (lib/scaling/cache-manager.js), namespace "chat"
+ *   • L1: LRU em memória limitado por BYTES
+ *   • L2: Redis compartilhado entre todas as instâncias da API (sobrevive a restarts)
+ * - Chave: SHA-256 da conversa normalizada + parâmetros do modelo
+ * - Stampede protection:
+ *   • mesma instância → perguntas idênticas simultâneas compartilham a mesma Promise
+ *   • entre instâncias → lock SET NX no Redis; quem não pegou o lock aguarda o resultado
+ *     enquanto o lock existir (dono falhou ou não gravou → calcula na hora)
+ *
+ * FALLBACK:
+ * - Redis indisponível → apenas L1 (nunca bloqueia o chat)
+ *
+ * @version 2.0.0
+ */
+
+import Redis from 'ioredis';
+import crypto from 'crypto';
+import { CacheManager } from '../scaling/cache-manager.js';
+
+const CHAT_CACHE_CONFIG = {
+  ttlSeconds: 5 * 60,                 // 5 minutos (mesmo TTL do cache anterior)
+  maxMemoryBytes: 8 * 1024 * 1024,    // 8MB de respostas por instância
+  maxEntryBytes: 64 * 1024,           // respostas maiores não entram no L1
+  keyPrefix: 'chatcache:v2:',
+  // Lock e espera derivam do timeout da chamada à OpenAI (60s, 120s no gpt-4o):
+  // o lock não pode expirar enquanto o dono ainda aguarda a resposta
+  defaultRequestTimeoutMs: 60000,
+  lockMarginMs: 10000,
+  lockPollMs: 250,
+  redisCommandTimeout: 1500           // cache nunca pode atrasar o chat
+};
+
+const cache = new CacheManager({
+  maxMemoryBytes: CHAT_CACHE_CONFIG.maxMemoryBytes,
+  maxEntryBytes: CHAT_CACHE_CONFIG.maxEntryBytes,
+  keyPrefix: CHAT_CACHE_CONFIG.keyPrefix,
+  namespaces: { chat: { ttl: CHAT_CACHE_CONFIG.ttlSeconds } }
+});
+
+// ✅ Cliente Redis próprio (lazy) — mesmo padrão do rateLimiterRedis.js
+let redisClient = null;
+let redisAvailable = false;
+
+// ✅ Single-flight local: chave → Promise da chamada em andamento
+const inflight = new Map();
+
+function initRedis() {
+  if (redisClient) return;
+
+  if (!process.env.REDIS_URL) {
+    console.warn('⚠️ [CHAT_CACHE] REDIS_URL não configurado - usando apenas cache em memória');
+    redisAvailable = false;
+    return;
+  }
+
+  try {
+    const isTLS = process.env.REDIS_URL.startsWith('rediss://');
+
+    redisClient = new Redis(process.env.REDIS_URL, {
+      connectTimeout: 10000,
+      commandTimeout: CHAT_CACHE_CONFIG.redisCommandTimeout,
+      maxRetriesPerRequest: 1,
+      enableReadyCheck: false,
+      enableOfflineQueue: false,
+      lazyConnect: false,
+      ...(isTLS && { tls: { rejectUnauthorized: false } }),
+      retryStrategy: (times) => Math.min(times * 1000, 10000)
+    });
+
+    redisClient.on('ready', () => {
+      console.log('✅ [CHAT_CACHE] Redis conectado');
+      redisAvailable = true;
+      cache.connectRedis({ client: redisClient });
+    });
+
+    redisClient.on('error', (err) => {
+      if (redisAvailable) {
+        console.error('❌ [CHAT_CACHE] Erro Redis:', err.message);
+      }
+      redisAvailable = false;
+      cache.disconnectRedis(err);
+    });
+
+  } catch (err) {
+    console.error('❌ [CHAT_CACHE] Erro na inicialização do Redis:', err.message);
+    redisAvailable = false;
+  }
+}
+
+/**
+ * Sobrescrever configuração / injetar o cliente Redis (testes)
+ * @param {Object} overrides - campos de CHAT_CACHE_CONFIG e/ou { redisClient }
+ */
+export function configureChatCache({ redisClient: client, ...overrides } = {}) {
+  Object.assign(CHAT_CACHE_CONFIG, overrides);
+  if (client) {
+    redisClient = client;
+    redisAvailable = true;
+    cache.connectRedis({ client });
+  }
+}
+
+// ========= NORMALIZAÇÃO + CHAVE =========
+
+function normalizeText(text) {
+  return String(text ?? '').normalize('NFC').replace(/\s+/g, ' ').trim();
+}
+
+/**
+ * Gera a chave de cache para uma conversa
+ * @param {Object} params
+ * @param {Array<{role: string, content: string}>} params.messages - Mensagens enviadas à OpenAI (texto)
+ * @param {string} params.model
+ * @param {number} params.temperature
+ * @param {number} params.maxTokens
+ * @returns {string} hash hex
+ */
+export function buildChatCacheKey({ messages, model, temperature, maxTokens }) {
+  const hash = crypto.createHash('sha256');
+  hash.update(`${model}|${temperature}|${maxTokens}`);
+
+  for (const msg of messages) {
+    hash.update('\u0000');
+    hash.update(msg.role);
+    hash.update('\u0001');
+    hash.update(normalizeText(msg.content));
+  }
+
+  return hash.digest('hex');
+}
+
+// ========= ESPERA PELO DONO DO LOCK =========
+
+async function waitForRemoteResult(cacheKey, waitMs) {
+  const deadline = Date.now() + waitMs;
+
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, CHAT_CACHE_CONFIG.lockPollMs));
+    const hit = await cache.lookup(cacheKey, { track: false });
+    if (hit) return hit.value;
+    if (!redisAvailable) return null;
+
+    // Lock liberado sem resultado (dono falhou ou resposta vazia): não esperar o TTL.
+    // Última leitura cobre o dono que gravou e liberou entre o lookup e o EXISTS
+    if (!(await cache.lockExists(cacheKey))) {
+      const last = await cache.lookup(cacheKey, { track: false });
+      return last ? last.value : null;
+    }
+  }
+
+  return null;
+}
+
+// ========= API PÚBLICA =========
+
+async function resolveMiss(cacheKey, compute, ttlSeconds, requestTimeoutMs) {
+  const token = crypto.randomBytes(8).toString('hex');
+  const lockTtlMs = requestTimeoutMs + CHAT_CACHE_CONFIG.lockMarginMs;
+  const ownsLock = await cache.acquireLock(cacheKey, token, lockTtlMs);
+
+  if (!ownsLock) {
+    // Outra instância já está chamando a OpenAI para a mesma conversa:
+    // aguardar enquanto o lock dela existir antes de chamar de novo
+    const remote = await waitForRemoteResult(cacheKey, lockTtlMs);
+    if (remote !== null) {
+      return { value: remote, source: 'redis' };
+    }
+  }
+
+  try {
+    const value = await compute();
+    if (typeof value === 'string' && value.length > 0) {
+      await cache.set(cacheKey, value, ttlSeconds);
+    }
+    return { value, source: null };
+  } finally {
+    if (ownsLock) await cache.releaseLock(cacheKey, token);
+  }
+}
+
+/**
+ * Busca a resposta no cache (L1 → L2) ou executa compute() uma única vez
+ * @param {string|null} key - Chave de buildChatCacheKey (null = sem cache, ex: imagens)
+ * @param {() => Promise<string>} compute - Chamada real à OpenAI
+ * @param {Object} options - { ttlSeconds, requestTimeoutMs (timeout da chamada à OpenAI) }
+ * @returns {Promise<{value: string, source: 'memory'|'redis'|null}>}
+ */
+export async function getOrComputeChatResponse(key, compute, options = {}) {
+  const ttlSeconds = options.ttlSeconds || CHAT_CACHE_CONFIG.ttlSeconds;
+  const requestTimeoutMs = options.requestTimeoutMs || CHAT_CACHE_CONFIG.defaultRequestTimeoutMs;
+
+  if (!key) {
+    return { value: await compute(), source: null };
+  }
+
+  initRedis();
+
+  const pending = inflight.get(key);
+  if (pending) {
+    const result = await pending;
+    return { value: result.value, source: result.source || 'memory' };
+  }
+
+  const cacheKey = `chat:${key}`;
+  const promise = (async () => {
+    const hit = await cache.lookup(cacheKey);
+    if (hit) {
+      console.log(`💾 [CHAT_CACHE] Hit (${hit.source === 'memory' ? 'memória' : 'redis'}): ${key.substring(0, 8)}`);
+      return hit;
+    }
+
+    return resolveMiss(cacheKey, compute, ttlSeconds, requestTimeoutMs);
+  })();
+
+  inflight.set(key, promise);
+  try {
+    return await promise;
+  } finally {
+    inflight.delete(key);
+  }
+}
@@ -0,0 +1,62 @@
+// 🎚️ ANALYSIS PROFILES - Resolução da segmentação FFT por perfil
+// detailed: FFT 4096 / hop 1024 na faixa inteira (comportamento histórico)
+// fast:     FFT 4096 / hop 4096 (1/4 dos frames) + passada detalhada (hop 1024) só nos
+//           segmentos sinalizados pela passada rápida (clipping, desequilíbrio de sub)
+
+/**
+ * 🔧 Perfis disponíveis
+ * accuracy: deltas medidos contra o perfil detailed em test/analysis-profiles-accuracy-tests.js
+ * (sinais sintéticos musicais de 20-60s; valores máximos observados, com margem)
+ */
+export const ANALYSIS_PROFILES = {
+  detailed: {
+    name: 'detailed',
+    fftSize: 4096,
+    hopSize: 1024,
+    refine: false,
+    accuracy: null
+  },
+  fast: {
+    name: 'fast',
+    fftSize: 4096,
+    hopSize: 4096,
+    refine: true,
+    refinement: {
+      hopSize: 1024,
+      clipPeakThreshold: 0.999,   // pico (L/R) por hop de 100ms do kernel de domínio do tempo
+      subBandHz: [20, 120],       // faixa "sub" para o desequilíbrio L/R
+      subImbalanceDb: 3,          // |sub L - sub R| acima disso sinaliza o frame
+      subMinShare: 0.1,           // ... desde que o sub tenha >= 10% da energia do frame
+      paddingSeconds: 0.5,        // contexto antes/depois de cada segmento
+      mergeGapSeconds: 1,         // segmentos mais próximos que isso são unidos
+      maxSegments: 16,            // limite de custo: os maiores segmentos ficam
+      maxRefinedSeconds: 60       // teto de áudio re-analisado em hop 1024
+    },
+    accuracy: {
+      bandPercentagePoints: 1.5,  // |Δ| por banda (pontos percentuais) — pior caso em sub/bass com kick
+                                  // fora de fase com a grade de 4096 (90-174 BPM: 0.2-1.4 pp)
+      bandEnergyDb: 0.3,          // |Δ| energy_db por banda
+      centroidHz: 50,             // |Δ| mediana do spectral centroid
+      speedup: '~3-4x na segmentação FFT + bandas/centróide'
+    }
+  }
+};
+
+export const DEFAULT_ANALYSIS_PROFILE = 'detailed';
+
+/**
+ * 🎯 Resolver perfil de análise
+ * Prioridade: ANALYSIS_PROFILE (env, override global) > profile explícito > detailed
+ * @param {string|Object|null} profile - nome do perfil ou objeto já resolvido
+ * @returns {Object} perfil de ANALYSIS_PROFILES
+ */
+export function resolveAnalysisProfile(profile = null) {
+  const forced = process.env.ANALYSIS_PROFILE;
+  if (forced && ANALYSIS_PROFILES[forced]) {
+    return ANALYSIS_PROFILES[forced];
+  }
+  if (profile && typeof profile === 'object' && ANALYSIS_PROFILES[profile.name]) {
+    return ANALYSIS_PROFILES[profile.name];
+  }
+  return ANALYSIS_PROFILES[profile] || ANALYSIS_PROFILES[DEFAULT_ANALYSIS_PROFILE];
+}
@@ -24,6 +24,9 @@
  */
 
 import { resolveTargets, validateTargets, TRUE_PEAK_HARD_CAP } from './resolveTargets.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:compareWithTargets');
 
 // 🐛 DEBUG FLAG para instrumentação de True Peak
 const DEBUG_TP_ACTION = false;
@@ -76,25 +79,25 @@ const METRIC_CATEGORIES = {
  * @returns {Object} - { rows, issues, score }
  */
 export function compareWithTargets(metrics, targets) {
-  console.log('[COMPARE] 🔍 Iniciando comparação com targets');
+  logger.debug('[COMPARE] 🔍 Iniciando comparação com targets');
   
   // ════════════════════════════════════════════════════════════════════
   // 1️⃣ VALIDAÇÕES
   // ════════════════════════════════════════════════════════════════════
   if (!metrics || typeof metrics !== 'object') {
-    console.error('[COMPARE] ❌ Metrics inválido');
+    logger.error('[COMPARE] ❌ Metrics inválido');
     return createEmptyResult('Metrics inválido');
   }
   
   if (!targets || typeof targets !== 'object') {
-    console.error('[COMPARE] ❌ Targets inválido');
+    logger.error('[COMPARE] ❌ Targets inválido');
     return createEmptyResult('Targets inválido');
   }
   
   // Validar targets (guardrail)
   const validation = validateTargets(targets);
   if (!validation.valid) {
-    console.error('[COMPARE] ❌ Targets com erros:', validation.errors);
+    logger.error('[COMPARE] ❌ Targets com erros:', validation.errors);
     // Continuar mesmo com erros (mas logar)
   }
   
@@ -136,12 +139,12 @@ export function compareWithTargets(metrics, targets) {
   // === DR ===
   if (normalizedMetrics.dr !== null && targets.dr) {
     // 🔍 LOG DIAGNÓSTICO — confirmar que min/max vêm do JSON (esperado: min:7, max:12 para pop)
-    console.log('FINAL DR RANGE:', {
+    logger.debug(() => ['FINAL DR RANGE:', {
       min: targets.dr.min,
       max: targets.dr.max,
       target: targets.dr.target,
       source: 'compareWithTargets'
-    });
+    }]);
     const result = evaluateRangeMetric(
       normalizedMetrics.dr,
       targets.dr,
@@ -203,11 +206,11 @@ export function compareWithTargets(metrics, targets) {
   const severityOrder = { 'CRÍTICA': 0, 'ALTA': 1, 'ATENÇÃO': 2, 'OK': 3 };
   issues.sort((a, b) => (severityOrder[a.severity] ?? 99) - (severityOrder[b.severity] ?? 99));
   
-  console.log('[COMPARE] ✅ Comparação completa:', {
+  logger.debug(() => ['[COMPARE] ✅ Comparação completa:', {
     rowsCount: rows.length,
     issuesCount: issues.length,
     score: totalScore.toFixed(1)
-  });
+  }]);
   
   return {
     rows,
@@ -246,7 +249,7 @@ function evaluateTruePeak(value, target) {
     action = `🔴 CLIPPING! Reduzir ${delta.toFixed(1)} ${unit}`;
     scoreValue = 0;
     
-    console.log('[COMPARE][TRUE-PEAK] 🚨 CRÍTICA: TP > 0.0 dBTP detectado:', value);
+    logger.debug(() => ['[COMPARE][TRUE-PEAK] 🚨 CRÍTICA: TP > 0.0 dBTP detectado:', value]);
   }
   // WARNING ZONE: Acima de warnFrom
   else if (warnFrom !== null && value > warnFrom) {
@@ -293,7 +296,7 @@ function evaluateTruePeak(value, target) {
   // 🐛 DEBUG: Instrumentação para validar TP Action
   if (DEBUG_TP_ACTION) {
     const deltaToTarget = value - target.target;
-    console.log('[TP_ACTION]', {
+    logger.debug(() => ['[TP_ACTION]', {
       tp_value: value,
       tp_target: target.target,
       tp_hardCap: effectiveHardCap,
@@ -301,7 +304,7 @@ function evaluateTruePeak(value, target) {
       deltaToTarget,
       action: row.action,
       match: Math.abs(deltaToTarget - Math.abs(row.diff)) <= 0.1 ? '✅' : '❌'
-    });
+    }]);
   }
   
   // Issue só se não for OK
@@ -591,4 +594,4 @@ export {
   classifyScore
 };
 
-console.log('🎯 CompareWithTargets v1.0.0 carregado - FUNÇÃO ÚNICA de comparação');
+logger.debug('🎯 CompareWithTargets v1.0.0 carregado - FUNÇÃO ÚNICA de comparação');
@@ -20,6 +20,10 @@
  * ════════════════════════════════════════════════════════════════════════════════
  */
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:index');
+
 // Core functions
 export { 
   resolveTargets, 
@@ -69,4 +73,4 @@ export function analyzeWithTargets(metrics, genreId, mode = 'pista', rawTargets
   };
 }
 
-console.log('🎯 Core Audio Pipeline Index v1.0.0 carregado');
+logger.debug('🎯 Core Audio Pipeline Index v1.0.0 carregado');
@@ -29,6 +29,10 @@
  * ════════════════════════════════════════════════════════════════════════════════
  */
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:resolveTargets');
+
 // 🎯 CONSTANTE FÍSICA - True Peak NUNCA > 0 dBTP
 export const TRUE_PEAK_HARD_CAP = 0.0;
 
@@ -59,7 +63,7 @@ const SAFE_DEFAULTS = {
  * @throws {Error} - Se não houver targets válidos
  */
 export function resolveTargets(genreId, mode = 'pista', rawTargets = null) {
-  console.log('[RESOLVE-TARGETS] 🔍 Iniciando resolução de targets:', { genreId, mode, hasRaw: !!rawTargets });
+  logger.debug(() => ['[RESOLVE-TARGETS] 🔍 Iniciando resolução de targets:', { genreId, mode, hasRaw: !!rawTargets }]);
   
   // VALIDAÇÃO: Deve haver alguma fonte de targets
   if (!rawTargets && !genreId) {
@@ -74,27 +78,27 @@ export function resolveTargets(genreId, mode = 'pista', rawTargets = null) {
   if (rawTargets && typeof rawTargets === 'object') {
     // Verificar se já está no formato resolvido
     if (rawTargets._resolved === true) {
-      console.log('[RESOLVE-TARGETS] ✅ Targets já resolvidos, retornando direto');
+      logger.debug('[RESOLVE-TARGETS] ✅ Targets já resolvidos, retornando direto');
       return rawTargets;
     }
     
     // Verificar se está no formato normalizado (de normalize-genre-targets.js)
     if (rawTargets._normalized === true || rawTargets.metrics) {
-      console.log('[RESOLVE-TARGETS] ✅ Usando formato normalizado existente');
+      logger.debug('[RESOLVE-TARGETS] ✅ Usando formato normalizado existente');
       targets = convertFromNormalized(rawTargets);
     }
     // Formato JSON raw (lufs_target, true_peak_target, etc)
     else if ('lufs_target' in rawTargets || 'true_peak_target' in rawTargets) {
-      console.log('[RESOLVE-TARGETS] ✅ Convertendo formato JSON raw');
+      logger.debug('[RESOLVE-TARGETS] ✅ Convertendo formato JSON raw');
       targets = convertFromJsonRaw(rawTargets);
     }
     // Formato com objetos aninhados (lufs: { target }, truePeak: { target })
     else if (rawTargets.lufs?.target !== undefined || rawTargets.truePeak?.target !== undefined) {
-      console.log('[RESOLVE-TARGETS] ✅ Convertendo formato aninhado');
+      logger.debug('[RESOLVE-TARGETS] ✅ Convertendo formato aninhado');
       targets = convertFromNested(rawTargets);
     }
     else {
-      console.warn('[RESOLVE-TARGETS] ⚠️ Formato de targets desconhecido:', Object.keys(rawTargets));
+      logger.warn('[RESOLVE-TARGETS] ⚠️ Formato de targets desconhecido:', Object.keys(rawTargets));
     }
   }
   
@@ -114,7 +118,7 @@ export function resolveTargets(genreId, mode = 'pista', rawTargets = null) {
   // 4️⃣ GARANTIR HARD CAP TRUE PEAK = 0.0
   // ════════════════════════════════════════════════════════════════════
   if (targets.truePeak.max > TRUE_PEAK_HARD_CAP) {
-    console.warn('[RESOLVE-TARGETS] ⚠️ Corrigindo truePeak.max de', targets.truePeak.max, 'para', TRUE_PEAK_HARD_CAP);
+    logger.warn('[RESOLVE-TARGETS] ⚠️ Corrigindo truePeak.max de', targets.truePeak.max, 'para', TRUE_PEAK_HARD_CAP);
     targets.truePeak.max = TRUE_PEAK_HARD_CAP;
   }
   targets.truePeak.hardCap = TRUE_PEAK_HARD_CAP;
@@ -127,14 +131,14 @@ export function resolveTargets(genreId, mode = 'pista', rawTargets = null) {
   targets._mode = mode;
   targets._resolvedAt = new Date().toISOString();
   
-  console.log('[RESOLVE-TARGETS] ✅ Targets resolvidos:', {
+  logger.debug(() => ['[RESOLVE-TARGETS] ✅ Targets resolvidos:', {
     genre: targets._genre,
     mode: targets._mode,
     lufs: `[${targets.lufs.min.toFixed(1)}, ${targets.lufs.max.toFixed(1)}]`,
     truePeak: `[${targets.truePeak.min.toFixed(1)}, ${targets.truePeak.max.toFixed(1)}] hardCap=${targets.truePeak.hardCap}`,
     dr: `[${targets.dr.min.toFixed(1)}, ${targets.dr.max.toFixed(1)}]`,
     bandsCount: Object.keys(targets.bands || {}).length
-  });
+  }]);
   
   return targets;
 }
@@ -315,7 +319,7 @@ function convertBandsFromRaw(rawBands) {
  */
 function applyModeOverrides(targets, mode) {
   if (mode === 'streaming') {
-    console.log('[RESOLVE-TARGETS] 📡 Aplicando override STREAMING');
+    logger.debug('[RESOLVE-TARGETS] 📡 Aplicando override STREAMING');
     return {
       ...targets,
       lufs: { target: -14.0, min: -15.0, max: -13.0 },
@@ -333,7 +337,7 @@ function applyModeOverrides(targets, mode) {
   }
   
   if (mode === 'carro') {
-    console.log('[RESOLVE-TARGETS] 🚗 Aplicando override CARRO');
+    logger.debug('[RESOLVE-TARGETS] 🚗 Aplicando override CARRO');
     return {
       ...targets,
       lufs: { target: -10.0, min: -12.0, max: -8.0 },
@@ -424,9 +428,9 @@ export function validateTargets(targets) {
   const valid = errors.length === 0;
   
   if (!valid) {
-    console.error('[VALIDATE-TARGETS] ❌ Erros encontrados:', errors);
+    logger.error('[VALIDATE-TARGETS] ❌ Erros encontrados:', errors);
   } else {
-    console.log('[VALIDATE-TARGETS] ✅ Targets válidos');
+    logger.debug('[VALIDATE-TARGETS] ✅ Targets válidos');
   }
   
   return { valid, errors };
@@ -439,4 +443,4 @@ export function validateTargets(targets) {
  */
 export { SAFE_DEFAULTS };
 
-console.log('🎯 ResolveTargets v1.0.0 carregado - FONTE ÚNICA para targets');
+logger.debug('🎯 ResolveTargets v1.0.0 carregado - FONTE ÚNICA para targets');
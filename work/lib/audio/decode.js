@@ -1,6 +1,10 @@
 // 🎯 AUDIO DECODE - Conversão e preparação de áudio
 // Decodificação PCM Float32, 48kHz, stereo com DC removal
 
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:decode');
+
 // 📊 Estatísticas de decodificação
 const DECODE_STATS = {
   TARGET_SAMPLE_RATE: 48000,
@@ -26,7 +30,7 @@ async function decodeAndPrepareAudio(audioBuffer, audioContext = null) {
       });
     }
     
-    console.log('🎤 Decodificando áudio...');
+    logger.debug('🎤 Decodificando áudio...');
     
     // Decodificar áudio
     const decodedBuffer = await audioContext.decodeAudioData(
@@ -44,7 +48,7 @@ async function decodeAndPrepareAudio(audioBuffer, audioContext = null) {
     let rightProcessed = rightChannel;
     
     if (DECODE_STATS.DC_REMOVAL_ENABLED) {
-      console.log('🔧 Removendo DC offset...');
+      logger.debug('🔧 Removendo DC offset...');
       leftProcessed = removeDCOffset(leftChannel);
       rightProcessed = removeDCOffset(rightChannel);
     }
@@ -57,13 +61,13 @@ async function decodeAndPrepareAudio(audioBuffer, audioContext = null) {
     
     const decodeTime = Date.now() - startTime;
     
-    console.log('✅ Áudio decodificado:', {
+    logger.debug(() => ['✅ Áudio decodificado:', {
       duration: `${duration.toFixed(2)}s`,
       sampleRate: `${sampleRate}Hz`,
       channels: channels,
       samples: totalSamples.toLocaleString(),
       decodeTime: `${decodeTime}ms`
-    });
+    }]);
     
     return {
       leftChannel: leftProcessed,
@@ -81,7 +85,7 @@ async function decodeAndPrepareAudio(audioBuffer, audioContext = null) {
     };
     
   } catch (error) {
-    console.error('❌ Erro na decodificação:', error);
+    logger.error('❌ Erro na decodificação:', error);
     throw new Error(`Falha na decodificação de áudio: ${error.message}`);
   }
 }
@@ -106,7 +110,7 @@ function removeDCOffset(channelData) {
       result[i] = channelData[i] - dcOffset;
     }
     
-    console.log(`🧹 DC offset removido: ${(dcOffset * 1000).toFixed(3)}mV`);
+    logger.debug(() => [`🧹 DC offset removido: ${(dcOffset * 1000).toFixed(3)}mV`]);
     return result;
   }
   
@@ -1,6 +1,17 @@
 // 🚨 SISTEMA DE TRATAMENTO DE ERROS PADRONIZADO - FASES 5.1-5.4
 // Implementa makeErr() e guards para fail-fast sem valores fictícios
 
+import { createLogger } from '../logger.js';
+
+const logger = createLogger('audio');
+
+// Logs por frame (laços de FFT/bandas): 1º frame e depois 1 a cada N, por stage+ação
+const FRAME_LOG_SAMPLE_EVERY = 200;
+const frameLoggers = new Map();
+
+// Ações fora de start/done/error que indicam falha: continuam visíveis em produção
+const WARN_ACTIONS = /error|failed|timeout|warning/;
+
 /**
  * Cria erro padronizado com stage explícito
  * @param {string} stage - "decode" | "segmentation" | "core_metrics" | "output_scoring"
@@ -85,35 +96,60 @@ export function assertFinite(obj, stage) {
 
 /**
  * Logger estruturado para pipeline de áudio
+ * start/done → info, error → error, ações de falha → warn, demais → debug
+ * (JSON.stringify dos dados só acontece se o nível estiver ativo)
  * @param {string} stage - Stage atual
- * @param {string} action - "start" | "done" | "error"
+ * @param {string} action - "start" | "done" | "error" | ação livre
  * @param {Object} data - Dados adicionais
  */
 export function logAudio(stage, action, data = {}) {
-  const timestamp = new Date().toISOString();
   const baseLog = `[AUDIO] ${action} stage=${stage}`;
   
   switch (action) {
     case 'start':
-      console.log(`${baseLog} file=${data.fileName || 'unknown'} jobId=${data.jobId || 'unknown'}`);
+      logger.info(() => `${baseLog} file=${data.fileName || 'unknown'} jobId=${data.jobId || 'unknown'}`);
       break;
       
     case 'done':
-      const timing = data.ms ? ` ms=${data.ms}` : '';
-      const meta = data.meta ? ` meta=${JSON.stringify(data.meta)}` : '';
-      console.log(`${baseLog}${timing}${meta}`);
+      logger.info(() => {
+        const timing = data.ms ? ` ms=${data.ms}` : '';
+        const meta = data.meta ? ` meta=${JSON.stringify(data.meta)}` : '';
+        return `${baseLog}${timing}${meta}`;
+      });
       break;
       
     case 'error':
-      console.error(`${baseLog} code=${data.code || 'unknown'} msg="${data.message || 'Unknown error'}"`);
+      logger.error(`${baseLog} code=${data.code || 'unknown'} msg="${data.message || 'Unknown error'}"`);
       if (data.stackSnippet) {
-        console.error(`[AUDIO] stack snippet:\n${data.stackSnippet}`);
+        logger.error(`[AUDIO] stack snippet:\n${data.stackSnippet}`);
       }
       break;
       
     default:
-      console.log(`${baseLog} ${JSON.stringify(data)}`);
+      if (WARN_ACTIONS.test(action)) {
+        logger.warn(`${baseLog} ${JSON.stringify(data)}`);
+      } else {
+        logger.debug(() => `${baseLog} ${JSON.stringify(data)}`);
+      }
+  }
+}
+
+/**
+ * Log de dentro de laços por frame: trace, amostrado por stage+ação
+ * Com trace desligado custa uma comparação — os dados vêm num thunk e nem são montados
+ * @param {string} stage - Stage atual
+ * @param {string} action - Ação
+ * @param {Function} dataFn - () => dados do frame
+ */
+export function logAudioFrame(stage, action, dataFn) {
+  if (!logger.traceEnabled) return;
+  const key = `${stage}:${action}`;
+  let frameLogger = frameLoggers.get(key);
+  if (!frameLogger) {
+    frameLogger = logger.sampled(FRAME_LOG_SAMPLE_EVERY);
+    frameLoggers.set(key, frameLogger);
   }
+  frameLogger.trace(() => `[AUDIO] ${action} stage=${stage} ${JSON.stringify(dataFn())}`);
 }
 
 /**
@@ -2,6 +2,9 @@
 // Logs detalhados de normalização, LUFS, True Peak, correlação, FFT
 
 import { logAudio } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:audit-logging');
 
 /**
  * 🔍 Logs de auditoria para métricas de áudio
@@ -10,110 +13,110 @@ export function auditMetricsCorrections(coreMetrics, originalAudio, normalizatio
   const jobId = coreMetrics.metadata?.jobId || 'unknown';
   const jobIdShort = jobId.substring(0, 8);
   
-  console.log(`\n🔍 ===== AUDITORIA DE CORREÇÕES DE PRECISÃO [${jobIdShort}] =====`);
+  logger.debug(() => [`\n🔍 ===== AUDITORIA DE CORREÇÕES DE PRECISÃO [${jobIdShort}] =====`]);
   
   // 1. NORMALIZAÇÃO PRÉ-ANÁLISE
-  console.log(`\n1️⃣ NORMALIZAÇÃO PRÉ-ANÁLISE:`);
+  logger.debug(`\n1️⃣ NORMALIZAÇÃO PRÉ-ANÁLISE:`);
   if (normalization.applied) {
-    console.log(`   ✅ Normalização aplicada para -23.0 LUFS`);
-    console.log(`   📊 LUFS original: ${normalization.originalLUFS?.toFixed(2) || 'null'} LUFS`);
-    console.log(`   🎛️ Ganho aplicado: ${normalization.gainAppliedDB?.toFixed(2) || 'null'} dB`);
-    console.log(`   ⚠️ Clipping detectado: ${normalization.hasClipping ? 'SIM' : 'NÃO'}`);
-    console.log(`   🔇 Silêncio digital: ${normalization.isSilence ? 'SIM' : 'NÃO'}`);
+    logger.debug(`   ✅ Normalização aplicada para -23.0 LUFS`);
+    logger.debug(() => [`   📊 LUFS original: ${normalization.originalLUFS?.toFixed(2) || 'null'} LUFS`]);
+    logger.debug(() => [`   🎛️ Ganho aplicado: ${normalization.gainAppliedDB?.toFixed(2) || 'null'} dB`]);
+    logger.debug(() => [`   ⚠️ Clipping detectado: ${normalization.hasClipping ? 'SIM' : 'NÃO'}`]);
+    logger.debug(() => [`   🔇 Silêncio digital: ${normalization.isSilence ? 'SIM' : 'NÃO'}`]);
   } else {
-    console.log(`   ❌ Normalização NÃO aplicada`);
-    console.log(`   💾 Áudio original preservado`);
+    logger.debug(`   ❌ Normalização NÃO aplicada`);
+    logger.debug(`   💾 Áudio original preservado`);
     if (normalization.error) {
-      console.log(`   🚨 Erro: ${normalization.error}`);
+      logger.debug(() => [`   🚨 Erro: ${normalization.error}`]);
     }
   }
   
   // 2. TRUE PEAK CORRIGIDO
-  console.log(`\n2️⃣ TRUE PEAK REAL (dBTP):`);
+  logger.debug(`\n2️⃣ TRUE PEAK REAL (dBTP):`);
   const tp = coreMetrics.truePeak;
   if (tp.maxDbtp !== null && isFinite(tp.maxDbtp)) {
-    console.log(`   ✅ True Peak válido: ${tp.maxDbtp.toFixed(2)} dBTP`);
-    console.log(`   🔬 Oversampling: ${tp.oversamplingFactor}x`);
-    console.log(`   🚨 Clipping count: ${tp.clippingCount || 0}`);
-    console.log(`   📏 Excede -1dBTP: ${tp.exceedsThreshold ? 'SIM' : 'NÃO'}`);
+    logger.debug(() => [`   ✅ True Peak válido: ${tp.maxDbtp.toFixed(2)} dBTP`]);
+    logger.debug(() => [`   🔬 Oversampling: ${tp.oversamplingFactor}x`]);
+    logger.debug(() => [`   🚨 Clipping count: ${tp.clippingCount || 0}`]);
+    logger.debug(() => [`   📏 Excede -1dBTP: ${tp.exceedsThreshold ? 'SIM' : 'NÃO'}`]);
   } else {
-    console.log(`   🔇 True Peak: null (silêncio digital ou erro)`);
-    console.log(`   ✅ Correção aplicada: valores -Infinity eliminados`);
+    logger.debug(`   🔇 True Peak: null (silêncio digital ou erro)`);
+    logger.debug(`   ✅ Correção aplicada: valores -Infinity eliminados`);
   }
   
   // 3. LUFS ITU-R BS.1770-4
-  console.log(`\n3️⃣ LUFS ITU-R BS.1770-4:`);
+  logger.debug(`\n3️⃣ LUFS ITU-R BS.1770-4:`);
   const lufs = coreMetrics.lufs;
   if (lufs) {
-    console.log(`   📊 LUFS integrado (normalizado): ${lufs.integrated?.toFixed(2) || 'null'} LUFS`);
-    console.log(`   📊 LUFS original: ${lufs.originalLUFS?.toFixed(2) || 'null'} LUFS`);
-    console.log(`   🎯 Target normalização: ${lufs.normalizedTo?.toFixed(1) || 'null'} LUFS`);
-    console.log(`   🚪 Gating efficiency: ${lufs.gating_stats?.gating_efficiency?.toFixed(3) || 'null'}`);
-    console.log(`   📅 Short-term: ${lufs.short_term?.toFixed(2) || 'null'} LUFS`);
-    console.log(`   📏 LRA: ${lufs.lra?.toFixed(2) || 'null'} LU`);
+    logger.debug(() => [`   📊 LUFS integrado (normalizado): ${lufs.integrated?.toFixed(2) || 'null'} LUFS`]);
+    logger.debug(() => [`   📊 LUFS original: ${lufs.originalLUFS?.toFixed(2) || 'null'} LUFS`]);
+    logger.debug(() => [`   🎯 Target normalização: ${lufs.normalizedTo?.toFixed(1) || 'null'} LUFS`]);
+    logger.debug(() => [`   🚪 Gating efficiency: ${lufs.gating_stats?.gating_efficiency?.toFixed(3) || 'null'}`]);
+    logger.debug(() => [`   📅 Short-term: ${lufs.short_term?.toFixed(2) || 'null'} LUFS`]);
+    logger.debug(() => [`   📏 LRA: ${lufs.lra?.toFixed(2) || 'null'} LU`]);
   } else {
-    console.log(`   ❌ LUFS não calculado`);
+    logger.debug(`   ❌ LUFS não calculado`);
   }
   
   // 4. CORRELAÇÃO ESTÉREO CORRIGIDA
-  console.log(`\n4️⃣ CORRELAÇÃO ESTÉREO:`);
+  logger.debug(`\n4️⃣ CORRELAÇÃO ESTÉREO:`);
   const stereo = coreMetrics.stereo;
   if (stereo) {
     if (stereo.correlation !== null && isFinite(stereo.correlation)) {
-      console.log(`   ✅ Correlação válida: ${stereo.correlation.toFixed(3)}`);
-      console.log(`   📊 Range válido: ${Math.abs(stereo.correlation) <= 1 ? 'OK' : 'ERRO'}`);
+      logger.debug(() => [`   ✅ Correlação válida: ${stereo.correlation.toFixed(3)}`]);
+      logger.debug(() => [`   📊 Range válido: ${Math.abs(stereo.correlation) <= 1 ? 'OK' : 'ERRO'}`]);
     } else {
-      console.log(`   🔇 Correlação: null (canais constantes ou silêncio)`);
-      console.log(`   ✅ Correção aplicada: eliminado retorno 0 falso`);
+      logger.debug(`   🔇 Correlação: null (canais constantes ou silêncio)`);
+      logger.debug(`   ✅ Correção aplicada: eliminado retorno 0 falso`);
     }
-    console.log(`   ⚖️ Balance: ${stereo.balance?.toFixed(3) || 'null'}`);
-    console.log(`   📐 Phase: ${stereo.phase?.toFixed(1) || 'null'}°`);
+    logger.debug(() => [`   ⚖️ Balance: ${stereo.balance?.toFixed(3) || 'null'}`]);
+    logger.debug(() => [`   📐 Phase: ${stereo.phase?.toFixed(1) || 'null'}°`]);
   } else {
-    console.log(`   ❌ Análise estéreo não calculada`);
+    logger.debug(`   ❌ Análise estéreo não calculada`);
   }
   
   // 5. MÉTRICAS ESPECTRAIS COMPLETAS (8 MÉTRICAS)
-  console.log(`\n5️⃣ MÉTRICAS ESPECTRAIS CORRIGIDAS:`);
+  logger.debug(`\n5️⃣ MÉTRICAS ESPECTRAIS CORRIGIDAS:`);
   const fft = coreMetrics.fft;
   if (fft) {
-    console.log(`   ✅ Magnitude: RMS stereo (corrigido de média aritmética)`);
-    console.log(`   ✅ Energia: magnitude² para cálculos espectrais`);
+    logger.debug(`   ✅ Magnitude: RMS stereo (corrigido de média aritmética)`);
+    logger.debug(`   ✅ Energia: magnitude² para cálculos espectrais`);
     
     // Métricas de frequência (Hz)
-    console.log(`\n   📊 MÉTRICAS DE FREQUÊNCIA:`);
-    console.log(`   🎵 Spectral Centroid: ${fft.spectralCentroidHz?.toFixed(2) || 'null'} Hz`);
-    console.log(`   📈 Spectral Rolloff (85%): ${fft.spectralRolloffHz?.toFixed(2) || 'null'} Hz`);
-    console.log(`   📏 Spectral Bandwidth: ${fft.spectralBandwidthHz?.toFixed(2) || 'null'} Hz`);
-    console.log(`   📐 Spectral Spread: ${fft.spectralSpreadHz?.toFixed(2) || 'null'} Hz`);
+    logger.debug(`\n   📊 MÉTRICAS DE FREQUÊNCIA:`);
+    logger.debug(() => [`   🎵 Spectral Centroid: ${fft.spectralCentroidHz?.toFixed(2) || 'null'} Hz`]);
+    logger.debug(() => [`   📈 Spectral Rolloff (85%): ${fft.spectralRolloffHz?.toFixed(2) || 'null'} Hz`]);
+    logger.debug(() => [`   📏 Spectral Bandwidth: ${fft.spectralBandwidthHz?.toFixed(2) || 'null'} Hz`]);
+    logger.debug(() => [`   📐 Spectral Spread: ${fft.spectralSpreadHz?.toFixed(2) || 'null'} Hz`]);
     
     // Métricas adimensionais
-    console.log(`\n   � MÉTRICAS ESTATÍSTICAS:`);
-    console.log(`   📊 Spectral Flatness: ${fft.spectralFlatness?.toFixed(4) || 'null'} [0-1]`);
-    console.log(`   🏔️ Spectral Crest: ${fft.spectralCrest?.toFixed(2) || 'null'}`);
-    console.log(`   📈 Spectral Skewness: ${fft.spectralSkewness?.toFixed(4) || 'null'}`);
-    console.log(`   � Spectral Kurtosis: ${fft.spectralKurtosis?.toFixed(4) || 'null'}`);
+    logger.debug(`\n   � MÉTRICAS ESTATÍSTICAS:`);
+    logger.debug(() => [`   📊 Spectral Flatness: ${fft.spectralFlatness?.toFixed(4) || 'null'} [0-1]`]);
+    logger.debug(() => [`   🏔️ Spectral Crest: ${fft.spectralCrest?.toFixed(2) || 'null'}`]);
+    logger.debug(() => [`   📈 Spectral Skewness: ${fft.spectralSkewness?.toFixed(4) || 'null'}`]);
+    logger.debug(() => [`   � Spectral Kurtosis: ${fft.spectralKurtosis?.toFixed(4) || 'null'}`]);
     
     // Configurações FFT
-    console.log(`\n   ⚙️ CONFIGURAÇÕES FFT:`);
-    console.log(`   🔢 FFT Size: ${coreMetrics.metadata?.fftSize || 'unknown'}`);
-    console.log(`   🎵 Sample Rate: ${coreMetrics.metadata?.sampleRate || 'unknown'} Hz`);
-    console.log(`   🔄 Frames processados: ${fft.processedFrames || 'unknown'}`);
+    logger.debug(`\n   ⚙️ CONFIGURAÇÕES FFT:`);
+    logger.debug(() => [`   🔢 FFT Size: ${coreMetrics.metadata?.fftSize || 'unknown'}`]);
+    logger.debug(() => [`   🎵 Sample Rate: ${coreMetrics.metadata?.sampleRate || 'unknown'} Hz`]);
+    logger.debug(() => [`   🔄 Frames processados: ${fft.processedFrames || 'unknown'}`]);
     
     // Log detalhado se centroide válido
     if (fft.spectralCentroidHz !== null && isFinite(fft.spectralCentroidHz)) {
-      console.log(`\n   ✅ [AUDITORIA] Centroide espectral corrigido:`);
-      console.log(`      🧮 Fórmula: Σ(freq[i] * magnitude²[i]) / Σ magnitude²[i]`);
-      console.log(`      📊 Resultado: ${fft.spectralCentroidHz.toFixed(2)} Hz`);
+      logger.debug(`\n   ✅ [AUDITORIA] Centroide espectral corrigido:`);
+      logger.debug(`      🧮 Fórmula: Σ(freq[i] * magnitude²[i]) / Σ magnitude²[i]`);
+      logger.debug(() => [`      📊 Resultado: ${fft.spectralCentroidHz.toFixed(2)} Hz`]);
     } else {
-      console.log(`\n   🔇 [AUDITORIA] Métricas espectrais: null (energia insuficiente)`);
-      console.log(`      ✅ Correção aplicada: não mascarado com valores fixos`);
+      logger.debug(`\n   🔇 [AUDITORIA] Métricas espectrais: null (energia insuficiente)`);
+      logger.debug(`      ✅ Correção aplicada: não mascarado com valores fixos`);
     }
   } else {
-    console.log(`   ❌ Análise FFT não calculada`);
+    logger.debug(`   ❌ Análise FFT não calculada`);
   }
   
   // 6. RESUMO DE CORREÇÕES
-  console.log(`\n6️⃣ RESUMO DE CORREÇÕES APLICADAS:`);
+  logger.debug(`\n6️⃣ RESUMO DE CORREÇÕES APLICADAS:`);
   const corrections = [
     normalization.applied ? '✅ Normalização -23 LUFS' : '❌ Normalização',
     (tp.maxDbtp !== null) ? '✅ True Peak null-safe' : '❌ True Peak',
@@ -122,15 +125,15 @@ export function auditMetricsCorrections(coreMetrics, originalAudio, normalizatio
     lufs ? '✅ LUFS ITU-R BS.1770-4' : '❌ LUFS'
   ];
   
-  corrections.forEach(correction => console.log(`   ${correction}`));
+  corrections.forEach(correction => logger.debug(() => [`   ${correction}`]));
   
   // 7. TEMPO DE PROCESSAMENTO
-  console.log(`\n7️⃣ PERFORMANCE:`);
-  console.log(`   ⏱️ Normalização: ${normalization.processingTime || 0}ms`);
-  console.log(`   ⏱️ Core Metrics: ${coreMetrics.metadata?.processingTime || 0}ms`);
-  console.log(`   📦 Total Pipeline: ${(normalization.processingTime || 0) + (coreMetrics.metadata?.processingTime || 0)}ms`);
+  logger.debug(`\n7️⃣ PERFORMANCE:`);
+  logger.debug(() => [`   ⏱️ Normalização: ${normalization.processingTime || 0}ms`]);
+  logger.debug(() => [`   ⏱️ Core Metrics: ${coreMetrics.metadata?.processingTime || 0}ms`]);
+  logger.debug(() => [`   📦 Total Pipeline: ${(normalization.processingTime || 0) + (coreMetrics.metadata?.processingTime || 0)}ms`]);
   
-  console.log(`\n🔍 ===== FIM AUDITORIA [${jobIdShort}] =====\n`);
+  logger.debug(() => [`\n🔍 ===== FIM AUDITORIA [${jobIdShort}] =====\n`]);
   
   // Log estruturado para agregação
   logAudio('audit', 'corrections_summary', {
@@ -185,7 +188,7 @@ export function auditMetricsCorrections(coreMetrics, originalAudio, normalizatio
  * 🚨 Log de validação de métricas
  */
 export function auditMetricsValidation(metrics, expectedValues = {}) {
-  console.log(`\n🔬 ===== VALIDAÇÃO DE MÉTRICAS =====`);
+  logger.debug(`\n🔬 ===== VALIDAÇÃO DE MÉTRICAS =====`);
   
   const validations = [];
   
@@ -294,14 +297,14 @@ export function auditMetricsValidation(metrics, expectedValues = {}) {
   // Imprimir resultados
   validations.forEach(v => {
     const status = v.valid ? '✅' : '❌';
-    console.log(`   ${status} ${v.metric}: ${v.value} (${v.reason})`);
+    logger.debug(() => [`   ${status} ${v.metric}: ${v.value} (${v.reason})`]);
   });
   
   const allValid = validations.every(v => v.valid);
-  console.log(`\n📊 Resultado: ${allValid ? '✅ TODAS VÁLIDAS' : '❌ ALGUMAS INVÁLIDAS'}`);
-  console.log(`🔬 ===== FIM VALIDAÇÃO =====\n`);
+  logger.debug(() => [`\n📊 Resultado: ${allValid ? '✅ TODAS VÁLIDAS' : '❌ ALGUMAS INVÁLIDAS'}`]);
+  logger.debug(`🔬 ===== FIM VALIDAÇÃO =====\n`);
   
   return { allValid, validations };
 }
 
-console.log('📊 Audit Logging carregado - Sistema de auditoria de correções');
\ No newline at end of file
+logger.debug('📊 Audit Logging carregado - Sistema de auditoria de correções');
\ No newline at end of file
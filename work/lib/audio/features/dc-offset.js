@@ -2,6 +2,9 @@
 // Implementação para calcular DC offset nos canais de áudio
 
 import { logAudio } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:dc-offset');
 
 /**
  * 🎯 Configurações para análise de DC Offset
@@ -24,8 +27,9 @@ export class DCOffsetAnalyzer {
   
   /**
    * 📊 Analisar DC offset em canais de áudio
+   * @param {number} gain - Ganho linear virtual (DC é linear: média(x·g) = g·média(x))
    */
-  analyzeDCOffset(leftChannel, rightChannel) {
+  analyzeDCOffset(leftChannel, rightChannel, gain = 1) {
     try {
       if (!leftChannel || !rightChannel || 
           leftChannel.length < this.config.MIN_SAMPLES ||
@@ -38,13 +42,54 @@ export class DCOffsetAnalyzer {
       }
       
       // Análise básica (média geral)
-      const leftDC = this.calculateChannelDC(leftChannel);
-      const rightDC = this.calculateChannelDC(rightChannel);
+      const leftDC = this.calculateChannelDC(leftChannel) * gain;
+      const rightDC = this.calculateChannelDC(rightChannel) * gain;
       
       // Análise detalhada por janelas
-      const leftWindowed = this.calculateWindowedDC(leftChannel);
-      const rightWindowed = this.calculateWindowedDC(rightChannel);
+      const leftWindowed = this.calculateWindowedDC(leftChannel, gain);
+      const rightWindowed = this.calculateWindowedDC(rightChannel, gain);
+      
+      return this.buildResult(leftDC, rightDC, leftWindowed, rightWindowed,
+        Math.min(leftChannel.length, rightChannel.length));
+      
+    } catch (error) {
+      logAudio('dc_offset', 'analysis_error', { error: error.message });
+      return this.getNullResult();
+    }
+  }
+  
+  /**
+   * ⚡ Analisar DC offset a partir do kernel de passada única (time-domain-kernel.js)
+   * Médias globais e por janela já vêm acumuladas — nenhuma amostra é relida.
+   */
+  analyzeDCOffsetFromStats(stats, gain = 1) {
+    try {
+      if (!stats || stats.length < this.config.MIN_SAMPLES) {
+        logAudio('dc_offset', 'insufficient_samples', { 
+          leftLength: stats?.length || 0,
+          rightLength: stats?.length || 0
+        });
+        return this.getNullResult();
+      }
       
+      const leftDC = (stats.sums.left / stats.length) * gain;
+      const rightDC = (stats.sums.right / stats.length) * gain;
+      const leftWindowed = stats.dcWindows.left.map(dc => dc * gain);
+      const rightWindowed = stats.dcWindows.right.map(dc => dc * gain);
+      
+      return this.buildResult(leftDC, rightDC, leftWindowed, rightWindowed, stats.length);
+      
+    } catch (error) {
+      logAudio('dc_offset', 'analysis_error', { error: error.message });
+      return this.getNullResult();
+    }
+  }
+  
+  /**
+   * 🧩 Montar resultado a partir das médias globais e por janela
+   */
+  buildResult(leftDC, rightDC, leftWindowed, rightWindowed, samplesAnalyzed) {
+    try {
       // Determinar severidade
       const maxAbsDC = Math.max(Math.abs(leftDC), Math.abs(rightDC));
       const severity = this.determineSeverity(maxAbsDC);
@@ -96,7 +141,7 @@ export class DCOffsetAnalyzer {
         
         // Informações técnicas
         metadata: {
-          samplesAnalyzed: Math.min(leftChannel.length, rightChannel.length),
+          samplesAnalyzed,
           windowsAnalyzed: Math.min(leftWindowed.length, rightWindowed.length),
           analysisMethod: 'windowed_mean_with_temporal_analysis'
         }
@@ -131,16 +176,16 @@ export class DCOffsetAnalyzer {
   /**
    * 🪟 Calcular DC offset por janelas
    */
-  calculateWindowedDC(channel) {
+  calculateWindowedDC(channel, gain = 1) {
     const windowSize = this.config.SAMPLE_WINDOW;
     const windows = [];
     
     for (let i = 0; i < channel.length; i += windowSize) {
       const windowEnd = Math.min(i + windowSize, channel.length);
-      const window = channel.slice(i, windowEnd);
+      const window = channel.subarray ? channel.subarray(i, windowEnd) : channel.slice(i, windowEnd);
       
       if (window.length >= windowSize / 2) { // Aceitar janelas com pelo menos 50% do tamanho
-        windows.push(this.calculateChannelDC(window));
+        windows.push(this.calculateChannelDC(window) * gain);
       }
     }
     
@@ -257,9 +302,17 @@ export function serializeDCOffset(dcAnalysis) {
 /**
  * 🔧 Função auxiliar para análise rápida
  */
-export function calculateDCOffset(leftChannel, rightChannel) {
+export function calculateDCOffset(leftChannel, rightChannel, gain = 1) {
+  const analyzer = new DCOffsetAnalyzer();
+  return analyzer.analyzeDCOffset(leftChannel, rightChannel, gain);
+}
+
+/**
+ * ⚡ Análise rápida a partir do kernel de passada única
+ */
+export function calculateDCOffsetFromStats(stats, gain = 1) {
   const analyzer = new DCOffsetAnalyzer();
-  return analyzer.analyzeDCOffset(leftChannel, rightChannel);
+  return analyzer.analyzeDCOffsetFromStats(stats, gain);
 }
 
-console.log('⚡ DC Offset Analyzer carregado - Detecção de corrente contínua');
\ No newline at end of file
+logger.debug('⚡ DC Offset Analyzer carregado - Detecção de corrente contínua');
\ No newline at end of file
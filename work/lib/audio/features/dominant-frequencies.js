@@ -2,6 +2,10 @@
 // Implementação para identificar frequências dominantes no espectro
 
 import { logAudio } from '../error-handling.js';
+import { RunningStats, QuantileSketch } from '../utils/streaming-stats.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:dominant-frequencies');
 
 /**
  * 🎯 Configurações para análise de frequências dominantes
@@ -139,104 +143,119 @@ export class DominantFrequencyAnalyzer {
 }
 
 /**
- * 🔄 Agregador de Frequências Dominantes por múltiplos frames
+ * 🌊 Acumulador em streaming de frequências dominantes (memória constante por grupo)
+ * Cada grupo guarda apenas [minFreq, maxFreq] + sketches: como um pico só entra num grupo
+ * se estiver a ±tolerance de algum membro, os membros nunca têm lacunas > tolerance, então
+ * "algum membro a ±tolerance" equivale a "dentro de [minFreq - tol, maxFreq + tol]".
  */
-export class DominantFrequencyAggregator {
-  
+export class DominantFrequencyAccumulator {
+
+  constructor(tolerance = 25) {
+    this.tolerance = tolerance;
+    this.groups = [];
+    this.frameCount = 0;
+  }
+
   /**
-   * 📦 Agregar frequências dominantes de múltiplos frames
+   * ➕ Adicionar os picos de um frame (resultado de analyzeFrame)
    */
-  static aggregate(frameResults) {
-    if (!frameResults || frameResults.length === 0) {
-      return [];
-    }
-    
-    // Coletar todas as frequências de todos os frames
-    const allFrequencies = [];
-    frameResults.forEach(frameResult => {
-      if (Array.isArray(frameResult)) {
-        frameResult.forEach(freq => {
-          if (freq && typeof freq.frequency === 'number') {
-            allFrequencies.push(freq);
-          }
-        });
+  add(frameResult) {
+    this.frameCount++;
+    if (!Array.isArray(frameResult)) return this;
+
+    for (const freq of frameResult) {
+      if (freq && typeof freq.frequency === 'number') {
+        this.addPeak(freq);
       }
-    });
-    
-    if (allFrequencies.length === 0) {
-      return [];
     }
-    
-    // Agrupar frequências similares (±25Hz)
-    const groupedFrequencies = this.groupSimilarFrequencies(allFrequencies, 25);
-    
-    // Calcular estatísticas para cada grupo
-    const aggregatedFrequencies = groupedFrequencies.map(group => {
-      const frequencies = group.map(f => f.frequency);
-      const magnitudes = group.map(f => f.magnitude);
-      const prominences = group.map(f => f.prominence);
-      
-      return {
-        frequency: Math.round(this.median(frequencies) * 10) / 10,
-        meanMagnitude: Math.round(this.mean(magnitudes) * 1000) / 1000,
-        maxMagnitude: Math.round(Math.max(...magnitudes) * 1000) / 1000,
-        meanProminence: Math.round(this.mean(prominences) * 1000) / 1000,
-        occurrences: group.length,
-        consistency: Math.round((group.length / frameResults.length) * 100) / 100
+    return this;
+  }
+
+  /**
+   * 🔗 Encaixar pico no primeiro grupo compatível (mesma ordem do agrupamento original)
+   */
+  addPeak(freq) {
+    const tolerance = this.tolerance;
+    let group = this.groups.find(g =>
+      freq.frequency - g.maxFreq <= tolerance && g.minFreq - freq.frequency <= tolerance
+    );
+
+    if (!group) {
+      group = {
+        minFreq: freq.frequency,
+        maxFreq: freq.frequency,
+        frequencies: new QuantileSketch(),
+        magnitudes: new RunningStats(),
+        prominences: new RunningStats(),
+        count: 0
       };
-    });
-    
+      this.groups.push(group);
+    }
+
+    if (freq.frequency < group.minFreq) group.minFreq = freq.frequency;
+    if (freq.frequency > group.maxFreq) group.maxFreq = freq.frequency;
+    group.frequencies.add(freq.frequency);
+    group.magnitudes.add(freq.magnitude);
+    group.prominences.add(freq.prominence);
+    group.count++;
+  }
+
+  /**
+   * 📦 Estatísticas finais (top 10 por consistência * magnitude máxima)
+   */
+  finalize() {
+    if (this.frameCount === 0 || this.groups.length === 0) {
+      return [];
+    }
+
+    const aggregatedFrequencies = this.groups.map(group => ({
+      frequency: Math.round(group.frequencies.median() * 10) / 10,
+      meanMagnitude: Math.round(group.magnitudes.average * 1000) / 1000,
+      maxMagnitude: Math.round(group.magnitudes.max * 1000) / 1000,
+      meanProminence: Math.round(group.prominences.average * 1000) / 1000,
+      occurrences: group.count,
+      consistency: Math.round((group.count / this.frameCount) * 100) / 100
+    }));
+
     // Ordenar por consistência * magnitude máxima (frequências mais importantes)
     aggregatedFrequencies.sort((a, b) => {
       const scoreA = a.consistency * a.maxMagnitude;
       const scoreB = b.consistency * b.maxMagnitude;
       return scoreB - scoreA;
     });
-    
+
     // Retornar top 10
     return aggregatedFrequencies.slice(0, 10);
   }
+}
+
+/**
+ * 🔄 Agregador de Frequências Dominantes por múltiplos frames
+ */
+export class DominantFrequencyAggregator {
   
   /**
-   * 🔗 Agrupar frequências similares
-   */
-  static groupSimilarFrequencies(frequencies, tolerance) {
-    const groups = [];
-    
-    frequencies.forEach(freq => {
-      // Encontrar grupo existente
-      let group = groups.find(g => {
-        return g.some(existing => 
-          Math.abs(existing.frequency - freq.frequency) <= tolerance
-        );
-      });
-      
-      if (group) {
-        group.push(freq);
-      } else {
-        groups.push([freq]);
-      }
-    });
-    
-    return groups;
-  }
-  
-  /**
-   * 📊 Calcular mediana
+   * 🌊 Criar acumulador para pipelines em streaming (frame a frame)
    */
-  static median(values) {
-    const sorted = [...values].sort((a, b) => a - b);
-    const mid = Math.floor(sorted.length / 2);
-    return sorted.length % 2 === 0
-      ? (sorted[mid - 1] + sorted[mid]) / 2
-      : sorted[mid];
+  static createAccumulator(tolerance = 25) {
+    return new DominantFrequencyAccumulator(tolerance);
   }
   
   /**
-   * 📊 Calcular média
+   * 📦 Agregar frequências dominantes de múltiplos frames
    */
-  static mean(values) {
-    return values.reduce((sum, val) => sum + val, 0) / values.length;
+  static aggregate(frameResults) {
+    if (!frameResults || frameResults.length === 0) {
+      return [];
+    }
+    
+    // Agrupar frequências similares (±25Hz) sem materializar todos os picos
+    const accumulator = this.createAccumulator(25);
+    for (const frameResult of frameResults) {
+      accumulator.add(frameResult);
+    }
+    
+    return accumulator.finalize();
   }
 }
 
@@ -265,7 +284,7 @@ export function serializeDominantFrequencies(frequencies) {
 export function calculateDominantFrequencies(magnitudeSpectrum, sampleRate, fftSize) {
   try {
     if (!magnitudeSpectrum || !Array.isArray(magnitudeSpectrum) || magnitudeSpectrum.length === 0) {
-      console.warn('calculateDominantFrequencies: Spectrum inválido');
+      logger.warn('calculateDominantFrequencies: Spectrum inválido');
       return {
         value: null,
         unit: 'Hz',
@@ -311,7 +330,7 @@ export function calculateDominantFrequencies(magnitudeSpectrum, sampleRate, fftS
     };
 
   } catch (error) {
-    console.error('Erro em calculateDominantFrequencies:', error);
+    logger.error('Erro em calculateDominantFrequencies:', error);
     return {
       value: null,
       unit: 'Hz',
@@ -324,4 +343,4 @@ export function calculateDominantFrequencies(magnitudeSpectrum, sampleRate, fftS
   }
 }
 
-console.log('🎵 Dominant Frequency Analyzer carregado - Análise de picos espectrais');
\ No newline at end of file
+logger.debug('🎵 Dominant Frequency Analyzer carregado - Análise de picos espectrais');
\ No newline at end of file
@@ -2,6 +2,10 @@
 // Implementação profissional com valores realistas para produção musical
 
 import { logAudio, makeErr } from '../error-handling.js';
+import { windowsFromStats } from './time-domain-kernel.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:dynamics-corrected');
 
 /**
  * 🎯 Configurações para métricas de dinâmica
@@ -81,6 +85,42 @@ export class DynamicRangeCalculator {
         DYNAMICS_CONFIG.DR_HOP_MS
       );
       
+      return this.fromRmsValues(rmsValues);
+      
+    } catch (error) {
+      logAudio('dynamics', 'dr_error', { error: error.message });
+      return null;
+    }
+  }
+  
+  /**
+   * ⚡ Dynamic Range a partir do kernel de passada única (time-domain-kernel.js)
+   * @returns {Object|null|undefined} undefined = janelas incompatíveis com o hop do kernel
+   */
+  static calculateDynamicRangeFromStats(stats) {
+    const windowSamples = Math.round((DYNAMICS_CONFIG.DR_WINDOW_MS / 1000) * stats.sampleRate);
+    const hopSamples = Math.round((DYNAMICS_CONFIG.DR_HOP_MS / 1000) * stats.sampleRate);
+    if (hopSamples !== stats.hopSamples) return undefined;
+    
+    const windows = windowsFromStats(stats, windowSamples, 'monoSq');
+    if (!windows) return undefined;
+    
+    const rmsValues = [];
+    for (let w = 0; w < windows.sumSquares.length; w++) {
+      const rms = Math.sqrt(windows.sumSquares[w] / windowSamples);
+      if (rms > DYNAMICS_CONFIG.CREST_MIN_RMS) {
+        rmsValues.push(20 * Math.log10(rms));
+      }
+    }
+    
+    return this.fromRmsValues(rmsValues);
+  }
+  
+  /**
+   * 🎯 Finalizar Dynamic Range a partir dos RMS (dB) por janela
+   */
+  static fromRmsValues(rmsValues) {
+    try {
       if (rmsValues.length < DYNAMICS_CONFIG.DR_MIN_WINDOWS) {
         logAudio('dynamics', 'insufficient_windows', { 
           windows: rmsValues.length, 
@@ -221,7 +261,6 @@ export class CrestFactorCalculator {
       
       // ===== ANÁLISE POR JANELAS =====
       const crestValues = [];
-      let validWindows = 0;
       
       for (let start = 0; start + windowSamples <= length; start += hopSamples) {
         let peak = 0;
@@ -239,25 +278,84 @@ export class CrestFactorCalculator {
           sumSquares += midSample * midSample;
         }
         
-        // Validar valores mínimos da janela
-        if (peak >= DYNAMICS_CONFIG.CREST_MIN_PEAK && sumSquares > 0) {
-          const rms = Math.sqrt(sumSquares / windowSamples);
-          
-          if (rms >= DYNAMICS_CONFIG.CREST_MIN_RMS) {
-            // Converter para dB e calcular Crest Factor da janela
-            const peakDb = 20 * Math.log10(peak);
-            const rmsDb = 20 * Math.log10(rms);
-            const crestFactorDb = peakDb - rmsDb;
-            
-            // Validar resultado da janela
-            if (isFinite(crestFactorDb) && crestFactorDb >= 0) {
-              crestValues.push(crestFactorDb);
-              validWindows++;
-            }
-          }
-        }
+        this.pushWindowCrest(crestValues, peak, sumSquares, windowSamples);
       }
       
+      return this.fromWindowValues(crestValues, numWindows, sampleRate);
+      
+    } catch (error) {
+      logAudio('dynamics', 'crest_error', { error: error.message });
+      return null;
+    }
+  }
+  
+  /**
+   * ⚡ Crest Factor a partir do kernel de passada única (time-domain-kernel.js)
+   * @returns {Object|null|undefined} undefined = janelas incompatíveis com o hop do kernel
+   */
+  static calculateCrestFactorFromStats(stats, sampleRate = 48000) {
+    const windowSamples = Math.floor((DYNAMICS_CONFIG.CREST_WINDOW_MS / 1000) * sampleRate);
+    const hopSamples = Math.floor((DYNAMICS_CONFIG.CREST_HOP_MS / 1000) * sampleRate);
+    if (sampleRate !== stats.sampleRate || hopSamples !== stats.hopSamples) return undefined;
+    
+    const windows = windowsFromStats(stats, windowSamples, 'midSq');
+    if (!windows) return undefined;
+    
+    try {
+      const numWindows = Math.floor((stats.length - windowSamples) / hopSamples) + 1;
+      if (stats.length === 0 || numWindows < DYNAMICS_CONFIG.CREST_MIN_WINDOWS) {
+        logAudio('dynamics', 'crest_insufficient_windows', { 
+          length: stats.length, 
+          windowSamples, 
+          numWindows,
+          minRequired: DYNAMICS_CONFIG.CREST_MIN_WINDOWS
+        });
+        return null;
+      }
+      
+      const crestValues = [];
+      for (let w = 0; w < windows.sumSquares.length; w++) {
+        this.pushWindowCrest(crestValues, windows.peaks[w], windows.sumSquares[w], windowSamples);
+      }
+      
+      return this.fromWindowValues(crestValues, numWindows, sampleRate);
+      
+    } catch (error) {
+      logAudio('dynamics', 'crest_error', { error: error.message });
+      return null;
+    }
+  }
+  
+  /**
+   * 🪟 Validar janela e acumular Crest Factor (dB)
+   */
+  static pushWindowCrest(crestValues, peak, sumSquares, windowSamples) {
+    // Validar valores mínimos da janela
+    if (peak >= DYNAMICS_CONFIG.CREST_MIN_PEAK && sumSquares > 0) {
+      const rms = Math.sqrt(sumSquares / windowSamples);
+      
+      if (rms >= DYNAMICS_CONFIG.CREST_MIN_RMS) {
+        // Converter para dB e calcular Crest Factor da janela
+        const peakDb = 20 * Math.log10(peak);
+        const rmsDb = 20 * Math.log10(rms);
+        const crestFactorDb = peakDb - rmsDb;
+        
+        // Validar resultado da janela
+        if (isFinite(crestFactorDb) && crestFactorDb >= 0) {
+          crestValues.push(crestFactorDb);
+        }
+      }
+    }
+  }
+  
+  /**
+   * 🎯 Finalizar Crest Factor a partir dos valores por janela
+   */
+  static fromWindowValues(crestValues, numWindows, sampleRate) {
+    const windowMs = DYNAMICS_CONFIG.CREST_WINDOW_MS;
+    const hopMs = DYNAMICS_CONFIG.CREST_HOP_MS;
+    
+    try {
       // ===== VALIDAÇÃO DE RESULTADOS =====
       if (crestValues.length < DYNAMICS_CONFIG.CREST_MIN_WINDOWS) {
         logAudio('dynamics', 'crest_insufficient_valid_windows', { 
@@ -376,9 +474,18 @@ export class LRACalculator {
 /**
  * 🎛️ Agregador principal das métricas de dinâmica
  */
-export function calculateDynamicsMetrics(leftChannel, rightChannel, sampleRate = 48000, existingLRA = null) {
-  const dr = DynamicRangeCalculator.calculateDynamicRange(leftChannel, rightChannel, sampleRate);
-  const crest = CrestFactorCalculator.calculateCrestFactor(leftChannel, rightChannel);
+export function calculateDynamicsMetrics(leftChannel, rightChannel, sampleRate = 48000, existingLRA = null, timeDomainStats = null) {
+  // ⚡ Kernel de passada única quando disponível; cálculo direto como fallback
+  let dr = timeDomainStats ? DynamicRangeCalculator.calculateDynamicRangeFromStats(timeDomainStats) : undefined;
+  if (dr === undefined) {
+    dr = DynamicRangeCalculator.calculateDynamicRange(leftChannel, rightChannel, sampleRate);
+  }
+  
+  let crest = timeDomainStats ? CrestFactorCalculator.calculateCrestFactorFromStats(timeDomainStats) : undefined;
+  if (crest === undefined) {
+    crest = CrestFactorCalculator.calculateCrestFactor(leftChannel, rightChannel);
+  }
+  
   const lra = LRACalculator.validateAndEnhanceLRA(existingLRA);
   
   return {
@@ -392,4 +499,4 @@ export function calculateDynamicsMetrics(leftChannel, rightChannel, sampleRate =
   };
 }
 
-console.log('🎚️ Dynamics Metrics Calculator carregado - DR, Crest Factor e LRA profissionais');
\ No newline at end of file
+logger.debug('🎚️ Dynamics Metrics Calculator carregado - DR, Crest Factor e LRA profissionais');
\ No newline at end of file
@@ -0,0 +1,198 @@
+// 🎼 GENRE CLASSIFIER - Detecção automática de gênero sobre as métricas já calculadas
+// Sem decode extra: usa bandas espectrais (energy_db), LUFS, DR, correlação estéreo e LRA do
+// technicalData e compara com a tabela de centróides por gênero (refs/genre-centroids.json),
+// derivada dos mesmos targets refs/out/<genero>.json usados no scoring.
+// Tempo/centróide espectral não entram: os targets de gênero não trazem esses valores.
+
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+/**
+ * 🔧 Configuração
+ */
+export const GENRE_CLASSIFIER_CONFIG = {
+  TABLE_VERSION: 1,
+  TABLE_PATH: path.join(__dirname, '..', '..', '..', 'refs', 'genre-centroids.json'),
+  REFS_DIR: path.join(__dirname, '..', '..', '..', 'refs', 'out'),
+  TOP_K: 3,
+  MIN_FEATURES: 4,          // menos que isso → não classifica
+  TEMPERATURE: 0.1,         // softmax sobre -0.5·d²/T; centróides distam < 1 tolerância entre si
+  DEFAULT_BAND_SPREAD: 3.0, // dB quando o target não traz range/tolerância
+  // Peso de cada feature na distância (bandas dominam; loudness varia com o master)
+  WEIGHTS: {
+    sub: 1, bass: 1, lowMid: 1, mid: 1, highMid: 1, presence: 1, air: 1,
+    lufs: 0.5, dr: 0.5, stereo: 0.5, lra: 0.25
+  }
+};
+
+// Bandas dos targets (PT/snake_case) → bandas medidas em technicalData.spectral_balance
+const TARGET_BAND_MAP = {
+  sub: 'sub',
+  low_bass: 'bass',
+  low_mid: 'lowMid',
+  mid: 'mid',
+  high_mid: 'highMid',
+  presenca: 'presence',
+  brilho: 'air'
+};
+
+function isFiniteNumber(value) {
+  return typeof value === 'number' && Number.isFinite(value);
+}
+
+/**
+ * 📐 Centróide (média + dispersão por feature) de UM gênero a partir do JSON de targets
+ * Bandas: mesma fonte do genre-targets-loader (legacy_compatibility > hybrid_processing > raiz).
+ * Loudness/DR/estéreo/LRA: médias medidas (hybrid_processing.original_metrics) quando existem —
+ * os *_target legados são alvos de normalização, iguais para quase todos os gêneros.
+ * @param {Object} genreData - conteúdo de refs/out/<genero>.json já desembrulhado
+ * @returns {{ mean: Object, spread: Object }}
+ */
+export function extractGenreCentroid(genreData) {
+  const raw = genreData.legacy_compatibility || genreData.hybrid_processing || genreData;
+  const mean = {};
+  const spread = {};
+
+  const bands = raw.bands || raw.spectral_bands || genreData.hybrid_processing?.spectral_bands || {};
+  for (const [key, band] of Object.entries(bands)) {
+    const feature = TARGET_BAND_MAP[key];
+    if (!feature || !band) continue;
+    const range = band.target_range;
+    const hasRange = range && isFiniteNumber(range.min) && isFiniteNumber(range.max);
+    const target = isFiniteNumber(band.target_db) ? band.target_db : (hasRange ? (range.min + range.max) / 2 : null);
+    if (target === null) continue;
+    mean[feature] = target;
+    spread[feature] = isFiniteNumber(band.tol_db) && band.tol_db > 0
+      ? band.tol_db
+      : (hasRange ? Math.max(Number((Math.abs(range.max - range.min) / 2).toFixed(2)), 0.5) : GENRE_CLASSIFIER_CONFIG.DEFAULT_BAND_SPREAD);
+  }
+
+  const measured = genreData.hybrid_processing?.original_metrics || {};
+  const scalars = [
+    ['lufs', measured.lufs_integrated ?? raw.lufs_target, raw.tol_lufs, 2.5],
+    ['dr', measured.dynamic_range ?? raw.dr_target ?? raw.dynamic_range_target, raw.tol_dr, 3],
+    ['stereo', measured.stereo_correlation ?? raw.stereo_target, raw.tol_stereo, 0.25],
+    ['lra', measured.lra ?? raw.lra_target, raw.tol_lra, 3]
+  ];
+  for (const [feature, target, tolerance, fallback] of scalars) {
+    if (!isFiniteNumber(target)) continue;
+    mean[feature] = target;
+    spread[feature] = isFiniteNumber(tolerance) && tolerance > 0 ? tolerance : fallback;
+  }
+
+  return { mean, spread };
+}
+
+/**
+ * 🏗️ Gera a tabela de centróides a partir de refs/out (genres.json define os gêneros oficiais)
+ * @param {string} refsDir
+ * @returns {Object} tabela serializável
+ */
+export function buildCentroidTable(refsDir = GENRE_CLASSIFIER_CONFIG.REFS_DIR) {
+  const catalog = JSON.parse(fs.readFileSync(path.join(refsDir, 'genres.json'), 'utf8'));
+  const genres = {};
+
+  for (const { key, label } of catalog.genres || []) {
+    const filePath = path.join(refsDir, `${key}.json`);
+    if (!fs.existsSync(filePath)) continue;
+    const parsed = JSON.parse(fs.readFileSync(filePath, 'utf8'));
+    const centroid = extractGenreCentroid(parsed[key] || parsed);
+    if (Object.keys(centroid.mean).length >= GENRE_CLASSIFIER_CONFIG.MIN_FEATURES) {
+      genres[key] = { label: label || key, ...centroid };
+    }
+  }
+
+  return {
+    version: GENRE_CLASSIFIER_CONFIG.TABLE_VERSION,
+    generatedAt: new Date().toISOString(),
+    source: path.relative(path.join(__dirname, '..', '..', '..', '..'), refsDir),
+    genres
+  };
+}
+
+let cachedTable = null;
+
+/**
+ * 📥 Tabela de centróides (arquivo pré-computado; se ausente, gerada dos refs em memória)
+ */
+export function loadCentroidTable() {
+  if (cachedTable) return cachedTable;
+  try {
+    cachedTable = JSON.parse(fs.readFileSync(GENRE_CLASSIFIER_CONFIG.TABLE_PATH, 'utf8'));
+  } catch {
+    cachedTable = buildCentroidTable();
+  }
+  return cachedTable;
+}
+
+/**
+ * 🎚️ Features da análise (technicalData do JSON final)
+ */
+export function extractAnalysisFeatures(technicalData = {}) {
+  const features = {};
+  const balance = technicalData.spectral_balance || {};
+  for (const feature of Object.values(TARGET_BAND_MAP)) {
+    const value = balance[feature]?.energy_db;
+    if (isFiniteNumber(value)) features[feature] = value;
+  }
+  if (isFiniteNumber(technicalData.lufsIntegrated)) features.lufs = technicalData.lufsIntegrated;
+  if (isFiniteNumber(technicalData.dynamicRange)) features.dr = technicalData.dynamicRange;
+  if (isFiniteNumber(technicalData.stereoCorrelation)) features.stereo = technicalData.stereoCorrelation;
+  if (isFiniteNumber(technicalData.lra)) features.lra = technicalData.lra;
+  return features;
+}
+
+/**
+ * 🎯 Classificar gênero
+ * @param {Object} technicalData - technicalData do JSON final
+ * @param {Object} options - { table, topK }
+ * @returns {{ top: Array<{genre, label, confidence, distance}>, featuresUsed: string[], tableVersion: number }|null}
+ */
+export function classifyGenre(technicalData, { table = loadCentroidTable(), topK = GENRE_CLASSIFIER_CONFIG.TOP_K } = {}) {
+  const features = extractAnalysisFeatures(technicalData);
+  if (Object.keys(features).length < GENRE_CLASSIFIER_CONFIG.MIN_FEATURES) return null;
+
+  const { WEIGHTS, TEMPERATURE } = GENRE_CLASSIFIER_CONFIG;
+  const scored = [];
+  const used = new Set();
+
+  for (const [genre, { label, mean, spread }] of Object.entries(table.genres || {})) {
+    let sum = 0;
+    let weight = 0;
+    for (const [feature, value] of Object.entries(features)) {
+      if (!isFiniteNumber(mean[feature])) continue;
+      const w = WEIGHTS[feature] ?? 1;
+      const z = (value - mean[feature]) / (spread[feature] || 1);
+      sum += w * z * z;
+      weight += w;
+      used.add(feature);
+    }
+    if (weight === 0) continue;
+    // Distância média ponderada (em "tolerâncias"): gêneros com menos features não são favorecidos
+    scored.push({ genre, label, distance: Math.sqrt(sum / weight) });
+  }
+  if (scored.length === 0) return null;
+
+  // Confiança: softmax sobre -0.5·d² (estável: subtrai o melhor)
+  scored.sort((a, b) => a.distance - b.distance);
+  const best = scored[0].distance;
+  const logits = scored.map(s => -0.5 * (s.distance * s.distance - best * best) / TEMPERATURE);
+  const total = logits.reduce((acc, l) => acc + Math.exp(l), 0);
+
+  return {
+    top: scored.slice(0, topK).map((s, i) => ({
+      genre: s.genre,
+      label: s.label,
+      confidence: Number((Math.exp(logits[i]) / total).toFixed(3)),
+      distance: Number(s.distance.toFixed(3))
+    })),
+    featuresUsed: [...used],
+    tableVersion: table.version
+  };
+}
+
+export default { classifyGenre, buildCentroidTable, loadCentroidTable };
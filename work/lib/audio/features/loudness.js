@@ -1,6 +1,11 @@
 // 🔊 LOUDNESS & LRA - ITU-R BS.1770-4 / EBU R128
 // Implementação completa do padrão LUFS com K-weighting e gating
 
+import { LoudnessHistogram } from '../utils/streaming-stats.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:loudness');
+
 /**
  * 📊 K-weighting Filter Coefficients (ITU-R BS.1770-4)
  * H_pre (high-pass 60Hz) + H_shelf (shelving +4dB acima 4kHz)
@@ -35,6 +40,38 @@ const K_WEIGHTING_COEFFS_V2 = {
   }
 };
 
+/**
+ * 🔧 K-weighting para qualquer sample rate (protótipo analógico da BS.1770, mesma derivação da libebur128)
+ * Em 48kHz devolve a tabela fixa acima; outras taxas (ex: quick-scan a 32kHz) recalculam os biquads.
+ * @param {Number} sampleRate
+ * @returns {{PRE_FILTER: {b: number[], a: number[]}, RLB_FILTER: {b: number[], a: number[]}}}
+ */
+function kWeightingCoefficients(sampleRate = 48000) {
+  if (sampleRate === 48000) return K_WEIGHTING_COEFFS;
+
+  // Shelving (+4 dB acima de ~1.7kHz)
+  let K = Math.tan(Math.PI * 1681.974450955533 / sampleRate);
+  let Q = 0.7071752369554196;
+  const Vh = Math.pow(10, 3.999843853973347 / 20);
+  const Vb = Math.pow(Vh, 0.4996667741545416);
+  let a0 = 1 + K / Q + K * K;
+  const PRE_FILTER = {
+    b: [(Vh + Vb * K / Q + K * K) / a0, 2 * (K * K - Vh) / a0, (Vh - Vb * K / Q + K * K) / a0],
+    a: [1.0, 2 * (K * K - 1) / a0, (1 - K / Q + K * K) / a0]
+  };
+
+  // High-pass RLB (~38Hz)
+  K = Math.tan(Math.PI * 38.13547087602444 / sampleRate);
+  Q = 0.5003270373238773;
+  a0 = 1 + K / Q + K * K;
+  const RLB_FILTER = {
+    b: [1.0, -2.0, 1.0],
+    a: [1.0, 2 * (K * K - 1) / a0, (1 - K / Q + K * K) / a0]
+  };
+
+  return { PRE_FILTER, RLB_FILTER };
+}
+
 /**
  * 🎛️ LUFS Constants
  */
@@ -75,9 +112,8 @@ function applyIIRFilter(samples, b, a) {
  * @returns {Promise<object>} Resultado LUFS corrigido
  */
 async function analyzeLUFSv2(float32Samples, sampleRate, opts = {}) {
-  const debug = process.env.DEBUG_LUFS === 'true';
-  
-  if (debug) console.log('🔧 analyzeLUFSv2: Iniciando análise LUFS ITU-R BS.1770-4');
+  // Traces por etapa/bloco: LOG_LEVEL=trace ou LOG_TRACE=audio:loudness (antigo DEBUG_LUFS=true)
+  logger.trace('🔧 analyzeLUFSv2: Iniciando análise LUFS ITU-R BS.1770-4');
   
   // Determinar número de canais
   const channels = opts.channels || 2; // Assume estéreo por padrão
@@ -101,7 +137,7 @@ async function analyzeLUFSv2(float32Samples, sampleRate, opts = {}) {
     }
   }
   
-  if (debug) console.log(`🔍 Canais separados: L=${leftChannel.length}, R=${rightChannel.length}`);
+  logger.trace(() => [`🔍 Canais separados: L=${leftChannel.length}, R=${rightChannel.length}`]);
   
   // Aplicar K-weighting na ordem correta: H_pre → H_shelf
   const leftPreFiltered = applyIIRFilter(leftChannel, K_WEIGHTING_COEFFS_V2.H_PRE.b, K_WEIGHTING_COEFFS_V2.H_PRE.a);
@@ -110,13 +146,13 @@ async function analyzeLUFSv2(float32Samples, sampleRate, opts = {}) {
   const leftFiltered = applyIIRFilter(leftPreFiltered, K_WEIGHTING_COEFFS_V2.H_SHELF.b, K_WEIGHTING_COEFFS_V2.H_SHELF.a);
   const rightFiltered = applyIIRFilter(rightPreFiltered, K_WEIGHTING_COEFFS_V2.H_SHELF.b, K_WEIGHTING_COEFFS_V2.H_SHELF.a);
   
-  if (debug) console.log('🔍 K-weighting aplicado (H_pre → H_shelf)');
+  logger.trace('🔍 K-weighting aplicado (H_pre → H_shelf)');
   
   // Parâmetros de janelamento
   const blockSize = Math.floor(0.4 * sampleRate); // 400ms
   const hopSize = Math.floor(blockSize * 0.25); // 75% overlap
   
-  if (debug) console.log(`🔍 Janelamento: blockSize=${blockSize}, hopSize=${hopSize}`);
+  logger.trace(() => [`🔍 Janelamento: blockSize=${blockSize}, hopSize=${hopSize}`]);
   
   // Calcular energia por bloco
   const blocks = [];
@@ -151,12 +187,12 @@ async function analyzeLUFSv2(float32Samples, sampleRate, opts = {}) {
       timestamp: startSample / sampleRate
     });
     
-    if (debug && blockIdx < 3) {
-      console.log(`🔍 Block ${blockIdx}: meanSq=${totalMeanSquare.toExponential(2)}, loudness=${loudness.toFixed(1)} LUFS`);
+    if (blockIdx < 3) {
+      logger.trace(() => [`🔍 Block ${blockIdx}: meanSq=${totalMeanSquare.toExponential(2)}, loudness=${loudness.toFixed(1)} LUFS`]);
     }
   }
   
-  if (debug) console.log(`🔍 ${blocks.length} blocos processados`);
+  logger.trace(() => [`🔍 ${blocks.length} blocos processados`]);
   
   // Gating absoluto (-70 LUFS)
   const absoluteGated = blocks.filter(block => block.loudness >= -70.0);
@@ -203,9 +239,7 @@ async function analyzeLUFSv2(float32Samples, sampleRate, opts = {}) {
   const momentary = validLoudness.length > 0 ? 
     Math.max(...validLoudness) : integrated;
   
-  if (debug) {
-    console.log(`✅ analyzeLUFSv2 result: integrated=${integrated.toFixed(1)}, gated=${relativeGated.length}/${blocks.length}`);
-  }
+  logger.trace(() => [`✅ analyzeLUFSv2 result: integrated=${integrated.toFixed(1)}, gated=${relativeGated.length}/${blocks.length}`]);
   
   return {
     integrated,
@@ -254,9 +288,9 @@ class BiquadFilter {
  * 🎚️ K-weighting Filter Chain
  */
 class KWeightingFilter {
-  constructor() {
-    this.preFilter = new BiquadFilter(K_WEIGHTING_COEFFS.PRE_FILTER);
-    this.rlbFilter = new BiquadFilter(K_WEIGHTING_COEFFS.RLB_FILTER);
+  constructor(coeffs = K_WEIGHTING_COEFFS) {
+    this.preFilter = new BiquadFilter(coeffs.PRE_FILTER);
+    this.rlbFilter = new BiquadFilter(coeffs.RLB_FILTER);
   }
 
   reset() {
@@ -278,6 +312,16 @@ class KWeightingFilter {
   }
 }
 
+/**
+ * 📊 Normalizar série short-term (array ou histograma já alimentado) para LoudnessHistogram
+ */
+function toLoudnessHistogram(shortTermLoudness) {
+  if (shortTermLoudness instanceof LoudnessHistogram) return shortTermLoudness;
+  const histogram = new LoudnessHistogram();
+  for (const v of shortTermLoudness || []) histogram.add(v);
+  return histogram;
+}
+
 /**
  * 🎯 LUFS Loudness Meter (ITU-R BS.1770-4)
  */
@@ -285,18 +329,19 @@ class LUFSMeter {
   constructor(sampleRate = 48000) {
     this.sampleRate = sampleRate;
     
-    console.log(`🔍 DEBUG Constructor: sampleRate=${sampleRate}, BLOCK_DURATION=${LUFS_CONSTANTS.BLOCK_DURATION}, INTEGRATED_OVERLAP=${LUFS_CONSTANTS.INTEGRATED_OVERLAP}`);
+    logger.trace(() => [`🔍 DEBUG Constructor: sampleRate=${sampleRate}, BLOCK_DURATION=${LUFS_CONSTANTS.BLOCK_DURATION}, INTEGRATED_OVERLAP=${LUFS_CONSTANTS.INTEGRATED_OVERLAP}`]);
     
     this.blockSize = Math.round(sampleRate * LUFS_CONSTANTS.BLOCK_DURATION);
     this.shortTermSize = Math.round(sampleRate * LUFS_CONSTANTS.SHORT_TERM_DURATION);
     this.hopSize = Math.round(this.blockSize * (1 - LUFS_CONSTANTS.INTEGRATED_OVERLAP));
     
-    console.log(`🔍 DEBUG Calculado: blockSize=${this.blockSize}, hopSize=${this.hopSize}, shortTermSize=${this.shortTermSize}`);
+    logger.trace(() => [`🔍 DEBUG Calculado: blockSize=${this.blockSize}, hopSize=${this.hopSize}, shortTermSize=${this.shortTermSize}`]);
     
-    this.kWeightingL = new KWeightingFilter();
-    this.kWeightingR = new KWeightingFilter();
+    const kCoeffs = kWeightingCoefficients(sampleRate);
+    this.kWeightingL = new KWeightingFilter(kCoeffs);
+    this.kWeightingR = new KWeightingFilter(kCoeffs);
     
-    console.log(`📊 LUFS Meter configurado: block=${this.blockSize}, hop=${this.hopSize}, ST=${this.shortTermSize}`);
+    logger.debug(() => [`📊 LUFS Meter configurado: block=${this.blockSize}, hop=${this.hopSize}, ST=${this.shortTermSize}`]);
   }
 
   /**
@@ -306,7 +351,7 @@ class LUFSMeter {
    * @returns {Object} Métricas LUFS
    */
   calculateLUFS(leftChannel, rightChannel) {
-    console.log('🎛️ Calculando LUFS integrado...');
+    logger.debug('🎛️ Calculando LUFS integrado...');
     const startTime = Date.now();
     
     // K-weighting nos canais
@@ -315,19 +360,21 @@ class LUFSMeter {
     
     // Calcular loudness de cada block (M = 400ms)
     const blockLoudness = this.calculateBlockLoudness(leftFiltered, rightFiltered);
-    const shortTermLoudness = this.calculateShortTermLoudness(blockLoudness);
+    // Histograma alimentado junto com a série short-term: LRA e mediana sem sort (±0.01 LU)
+    const shortTermHistogram = new LoudnessHistogram();
+    const shortTermLoudness = this.calculateShortTermLoudness(blockLoudness, shortTermHistogram);
     
     // Gating para LUFS integrado
     const { integratedLoudness, gatedBlocks } = this.applyGating(blockLoudness);
     
     // LRA (Loudness Range) – duas variantes: legacy (sem gating) e R128 oficial com gating relativo (-20 LU)
-    const legacyLRA = this.calculateLRA(shortTermLoudness);
+    const legacyLRA = this.calculateLRA(shortTermHistogram);
     let lra = legacyLRA;
     let lraMeta = { algorithm: 'legacy', gated_count: null, used_count: shortTermLoudness.length };
     // 🎯 USE R128 LRA as DEFAULT (EBU 3342 compliant) - changed from opt-in to opt-out
     const useR128LRA = (typeof window !== 'undefined' ? window.USE_R128_LRA !== false : true);
     if (useR128LRA) {
-      const r128 = this.calculateR128LRA(shortTermLoudness, integratedLoudness);
+      const r128 = this.calculateR128LRA(shortTermHistogram, integratedLoudness);
       if (r128 && Number.isFinite(r128.lra)) {
         lra = r128.lra;
         lraMeta = { algorithm: 'EBU_R128', gated_count: r128.remaining, used_count: r128.remaining, rel_threshold: r128.relativeThreshold, abs_threshold: LUFS_CONSTANTS.ABSOLUTE_THRESHOLD };
@@ -339,23 +386,22 @@ class LUFSMeter {
     
     const processingTime = Date.now() - startTime;
     
-    console.log(`✅ LUFS calculado em ${processingTime}ms:`, {
+    logger.debug(() => [`✅ LUFS calculado em ${processingTime}ms:`, {
       integrated: `${integratedLoudness.toFixed(1)} LUFS`,
       lra: `${lra.toFixed(1)} LU`,
       gatedBlocks: `${gatedBlocks}/${blockLoudness.length}`
-    });
+    }]);
     
     // ===== Representatividade do Short-Term =====
     // Implementação anterior usava apenas o último valor, podendo pegar trecho silencioso (ex: fade out) e gerar valores irreais (ex: -50 LUFS)
     // Estratégia: filtrar janelas short-term "ativas" via mesmo gating relativo do integrado e escolher a mediana dessas janelas.
     const ABS_TH = LUFS_CONSTANTS.ABSOLUTE_THRESHOLD;
     const REL_TH = integratedLoudness + LUFS_CONSTANTS.RELATIVE_THRESHOLD; // (integrated -10 LU)
-    const activeShortTerm = shortTermLoudness.filter(v => v > ABS_TH && v >= REL_TH);
-    const median = (arr) => {
-      if (!arr.length) return null; const s = arr.slice().sort((a,b)=>a-b); const m = Math.floor(s.length/2); return s.length % 2 ? s[m] : (s[m-1]+s[m])/2;
-    };
-    const representativeST = activeShortTerm.length ? median(activeShortTerm) : (shortTermLoudness.length ? shortTermLoudness[shortTermLoudness.length - 1] : integratedLoudness);
-    const maxShortTerm = shortTermLoudness.length ? Math.max(...shortTermLoudness.filter(v=>v>-Infinity)) : integratedLoudness;
+    const activeThreshold = Math.max(ABS_TH, REL_TH);
+    const activeCount = shortTermHistogram.countAtLeast(activeThreshold);
+    const representativeST = activeCount ? shortTermHistogram.median(activeThreshold) : (shortTermLoudness.length ? shortTermLoudness[shortTermLoudness.length - 1] : integratedLoudness);
+    let maxShortTerm = shortTermLoudness.length ? -Infinity : integratedLoudness;
+    for (const v of shortTermLoudness) if (v > maxShortTerm) maxShortTerm = v;
     const lastShortTerm = shortTermLoudness.length ? shortTermLoudness[shortTermLoudness.length - 1] : integratedLoudness;
 
     return {
@@ -367,7 +413,7 @@ class LUFSMeter {
       lufs_short_term_raw_last: lastShortTerm,
       lufs_short_term_max: maxShortTerm,
       lufs_short_term_median_active: representativeST,
-      lufs_short_term_active_count: activeShortTerm.length,
+      lufs_short_term_active_count: activeCount,
   lra: lra,
   lra_legacy: legacyLRA,
   lra_meta: lraMeta,
@@ -387,7 +433,7 @@ class LUFSMeter {
     const blocks = [];
     const numBlocks = Math.floor((leftFiltered.length - this.blockSize) / this.hopSize) + 1;
     
-    console.log(`🔍 DEBUG Block: samples=${leftFiltered.length}, blockSize=${this.blockSize}, hopSize=${this.hopSize}, numBlocks=${numBlocks}`);
+    logger.trace(() => [`🔍 DEBUG Block: samples=${leftFiltered.length}, blockSize=${this.blockSize}, hopSize=${this.hopSize}, numBlocks=${numBlocks}`]);
     
     for (let blockIdx = 0; blockIdx < numBlocks; blockIdx++) {
       const startSample = blockIdx * this.hopSize;
@@ -420,18 +466,20 @@ class LUFSMeter {
       });
       
       if (blockIdx < 3) { // Log primeiros 3 blocos
-        console.log(`🔍 DEBUG Block ${blockIdx}: samples ${startSample}-${endSample}, meanSq=${totalMeanSquare.toExponential(2)}, loudness=${loudness.toFixed(1)}`);
+        logger.trace(() => [`🔍 DEBUG Block ${blockIdx}: samples ${startSample}-${endSample}, meanSq=${totalMeanSquare.toExponential(2)}, loudness=${loudness.toFixed(1)}`]);
       }
     }
     
-    console.log(`🔍 DEBUG: Gerados ${blocks.length} blocos com loudness válido`);
+    logger.trace(() => [`🔍 DEBUG: Gerados ${blocks.length} blocos com loudness válido`]);
     return blocks;
   }
 
   /**
    * ⏱️ Calcular Short-Term loudness (S = 3s)
+   * @param {Array} blockLoudness
+   * @param {LoudnessHistogram|null} histogram - opcional, recebe cada valor short-term (LRA/mediana em streaming)
    */
-  calculateShortTermLoudness(blockLoudness) {
+  calculateShortTermLoudness(blockLoudness, histogram = null) {
     const shortTerm = [];
     const blocksPerShortTerm = Math.ceil(LUFS_CONSTANTS.SHORT_TERM_DURATION / LUFS_CONSTANTS.BLOCK_DURATION);
     
@@ -454,6 +502,7 @@ class LUFSMeter {
           -0.691 + 10 * Math.log10(avgMeanSquare) : 
           -Infinity;
         shortTerm.push(stLoudness);
+        if (histogram) histogram.add(stLoudness);
       }
     }
     
@@ -466,15 +515,15 @@ class LUFSMeter {
   applyGating(blockLoudness) {
     // DEBUG: Verificar loudness dos blocos
     const loudnessValues = blockLoudness.map(b => b.loudness);
-    console.log(`🔍 DEBUG: ${blockLoudness.length} blocos, loudness range: ${Math.min(...loudnessValues.filter(v => v > -Infinity)).toFixed(1)} to ${Math.max(...loudnessValues.filter(v => v > -Infinity)).toFixed(1)} LUFS`);
-    console.log(`🔍 DEBUG: Threshold absoluto: ${LUFS_CONSTANTS.ABSOLUTE_THRESHOLD} LUFS`);
+    logger.trace(() => [`🔍 DEBUG: ${blockLoudness.length} blocos, loudness range: ${Math.min(...loudnessValues.filter(v => v > -Infinity)).toFixed(1)} to ${Math.max(...loudnessValues.filter(v => v > -Infinity)).toFixed(1)} LUFS`]);
+    logger.trace(() => [`🔍 DEBUG: Threshold absoluto: ${LUFS_CONSTANTS.ABSOLUTE_THRESHOLD} LUFS`]);
     
     // Stage 1: Absolute threshold (-70 LUFS)
     const absoluteGated = blockLoudness.filter(block => 
       block.loudness >= LUFS_CONSTANTS.ABSOLUTE_THRESHOLD
     );
     
-    console.log(`🔍 DEBUG: ${absoluteGated.length}/${blockLoudness.length} blocos passaram gating absoluto`);
+    logger.trace(() => [`🔍 DEBUG: ${absoluteGated.length}/${blockLoudness.length} blocos passaram gating absoluto`]);
     
     if (absoluteGated.length === 0) {
       return { integratedLoudness: -Infinity, gatedBlocks: 0 };
@@ -511,19 +560,14 @@ class LUFSMeter {
    * 📈 Calcular LRA (Loudness Range)
    */
   calculateLRA(shortTermLoudness) {
-    if (shortTermLoudness.length === 0) return 0;
+    const histogram = toLoudnessHistogram(shortTermLoudness);
     
-    // Filtrar valores válidos e ordenar
-    const validValues = shortTermLoudness.filter(v => v > -Infinity).sort((a, b) => a - b);
-    
-    if (validValues.length < 2) return 0;
+    // Apenas valores válidos (-Infinity fica fora do histograma)
+    if (histogram.count < 2) return 0;
     
     // Percentis 10% e 95%
-    const p10Index = Math.floor(validValues.length * 0.10);
-    const p95Index = Math.floor(validValues.length * 0.95);
-    
-    const p10 = validValues[p10Index];
-    const p95 = validValues[Math.min(p95Index, validValues.length - 1)];
+    const p10 = histogram.percentile(0.10);
+    const p95 = histogram.percentile(0.95);
     
     return p95 - p10; // LRA em LU
   }
@@ -534,28 +578,30 @@ class LUFSMeter {
    * 2. Gating absoluto: >= -70 LUFS
    * 3. Gating relativo para LRA: >= (L_integrated - 20 LU)
    * 4. LRA = P95 - P10 dos valores remanescentes
-   * @param {number[]} shortTermLoudness
+   * Percentis via LoudnessHistogram (resolução 0.01 LU, memória constante).
+   * @param {number[]|LoudnessHistogram} shortTermLoudness
    * @param {number} integratedLoudness
    * @returns {{lra:number, remaining:number, relativeThreshold:number}|null}
    */
   calculateR128LRA(shortTermLoudness, integratedLoudness) {
-    if (!Array.isArray(shortTermLoudness) || !shortTermLoudness.length || !Number.isFinite(integratedLoudness) || integratedLoudness === -Infinity) {
+    const isHistogram = shortTermLoudness instanceof LoudnessHistogram;
+    if ((!isHistogram && (!Array.isArray(shortTermLoudness) || !shortTermLoudness.length)) || !Number.isFinite(integratedLoudness) || integratedLoudness === -Infinity) {
       return null;
     }
+    const histogram = toLoudnessHistogram(shortTermLoudness);
+    if (isHistogram && histogram.count === 0) return null;
     // 1 & 2: Absoluto
-    const absFiltered = shortTermLoudness.filter(v => Number.isFinite(v) && v >= LUFS_CONSTANTS.ABSOLUTE_THRESHOLD);
-    if (!absFiltered.length) return { lra: 0, remaining: 0, relativeThreshold: null };
+    if (!histogram.countAtLeast(LUFS_CONSTANTS.ABSOLUTE_THRESHOLD)) return { lra: 0, remaining: 0, relativeThreshold: null };
     // 3: Relativo (para LRA usa -20 LU do integrado, diferente do -10 usado para gating do integrado)
     const relativeThreshold = integratedLoudness - 20.0;
-    const relFiltered = absFiltered.filter(v => v >= relativeThreshold);
-    if (!relFiltered.length) return { lra: 0, remaining: 0, relativeThreshold };
+    const gate = Math.max(LUFS_CONSTANTS.ABSOLUTE_THRESHOLD, relativeThreshold);
+    const remaining = histogram.countAtLeast(gate);
+    if (!remaining) return { lra: 0, remaining: 0, relativeThreshold };
     // 4: Percentis
-    const s = relFiltered.slice().sort((a,b)=>a-b);
-    const p = (arr, q) => arr[Math.min(arr.length-1, Math.max(0, Math.floor(arr.length * q)) )];
-    const p10 = p(s, 0.10);
-    const p95 = p(s, 0.95);
+    const p10 = histogram.percentile(0.10, gate);
+    const p95 = histogram.percentile(0.95, gate);
     const lra = p95 - p10;
-    return { lra, remaining: relFiltered.length, relativeThreshold };
+    return { lra, remaining, relativeThreshold };
   }
 
   /**
@@ -633,6 +679,7 @@ async function calculateLoudnessMetricsV2(leftChannel, rightChannel, sampleRate
     let lraRelThreshold = null;
     let lraAlgorithm = 'v2_corrected_fallback';
     let shortTermLoudness = []; // 🔧 Declarado fora do try para uso posterior no Short-Term
+    const shortTermHistogram = new LoudnessHistogram();
     
     try {
       const meter = new LUFSMeter(sampleRate);
@@ -643,24 +690,24 @@ async function calculateLoudnessMetricsV2(leftChannel, rightChannel, sampleRate
       
       // Calcular block loudness e short-term para LRA
       const blockLoudness = meter.calculateBlockLoudness(leftFiltered, rightFiltered);
-      shortTermLoudness = meter.calculateShortTermLoudness(blockLoudness); // 🔧 Atribui à variável externa
+      shortTermLoudness = meter.calculateShortTermLoudness(blockLoudness, shortTermHistogram); // 🔧 Atribui à variável externa
       
       // Calcular LRA conforme EBU R128 (usando integrated do LUFS V2)
       if (shortTermLoudness.length >= 10 && Number.isFinite(lufsResult.integrated)) {
-        const lraResult = meter.calculateR128LRA(shortTermLoudness, lufsResult.integrated);
+        const lraResult = meter.calculateR128LRA(shortTermHistogram, lufsResult.integrated);
         
         if (lraResult && Number.isFinite(lraResult.lra) && lraResult.lra >= 0) {
           lraValue = lraResult.lra;
           lraRemaining = lraResult.remaining || 0;
           lraRelThreshold = lraResult.relativeThreshold;
           lraAlgorithm = 'EBU_R128_V2';
-          console.log(`[LRA_V2] ✅ LRA calculado: ${lraValue.toFixed(2)} LU (${lraRemaining} blocos)`);
+          logger.debug(() => [`[LRA_V2] ✅ LRA calculado: ${lraValue.toFixed(2)} LU (${lraRemaining} blocos)`]);
         }
       } else {
-        console.log(`[LRA_V2] ⚠️ Short-term insuficiente: ${shortTermLoudness.length} blocos (mínimo 10)`);
+        logger.debug(() => [`[LRA_V2] ⚠️ Short-term insuficiente: ${shortTermLoudness.length} blocos (mínimo 10)`]);
       }
     } catch (lraError) {
-      console.warn(`[LRA_V2] ⚠️ Erro ao calcular LRA:`, lraError.message);
+      logger.warn(`[LRA_V2] ⚠️ Erro ao calcular LRA:`, lraError.message);
       // Continuar com lra = 0 como fallback
     }
     
@@ -676,28 +723,19 @@ async function calculateLoudnessMetricsV2(leftChannel, rightChannel, sampleRate
         const ABS_TH = LUFS_CONSTANTS.ABSOLUTE_THRESHOLD; // -70 LUFS
         const REL_TH = lufsResult.integrated + LUFS_CONSTANTS.RELATIVE_THRESHOLD; // integrated - 10 LU
         
-        // Filtrar janelas ativas (acima de ambos os thresholds)
-        const activeShortTerm = shortTermLoudness.filter(v => 
-          Number.isFinite(v) && v > ABS_TH && v >= REL_TH
-        );
-        
-        // Função mediana
-        const median = (arr) => {
-          if (!arr.length) return null;
-          const s = arr.slice().sort((a, b) => a - b);
-          const m = Math.floor(s.length / 2);
-          return s.length % 2 ? s[m] : (s[m - 1] + s[m]) / 2;
-        };
+        // Janelas ativas (acima de ambos os thresholds) contadas no histograma short-term
+        const activeThreshold = Number.isNaN(REL_TH) ? null : Math.max(ABS_TH, REL_TH);
+        const activeCount = activeThreshold === null ? 0 : shortTermHistogram.countAtLeast(activeThreshold);
         
         // Usar mediana se houver janelas ativas, senão fallback para integrated
-        representativeShortTerm = activeShortTerm.length > 0 
-          ? median(activeShortTerm) 
+        representativeShortTerm = activeCount > 0 
+          ? shortTermHistogram.median(activeThreshold) 
           : lufsResult.integrated;
         
-        console.log(`[LUFS_V2] ✅ Short-Term corrigido: ${representativeShortTerm?.toFixed(1)} LUFS (${activeShortTerm.length} janelas ativas de ${shortTermLoudness.length})`);
+        logger.debug(() => [`[LUFS_V2] ✅ Short-Term corrigido: ${representativeShortTerm?.toFixed(1)} LUFS (${activeCount} janelas ativas de ${shortTermLoudness.length})`]);
       }
     } catch (stError) {
-      console.warn(`[LUFS_V2] ⚠️ Erro ao calcular Short-Term representativo:`, stError.message);
+      logger.warn(`[LUFS_V2] ⚠️ Erro ao calcular Short-Term representativo:`, stError.message);
       // Mantém fallback para lufsResult.shortTerm
     }
     
@@ -760,5 +798,6 @@ export {
   analyzeLUFSv2,
   LUFS_CONSTANTS,
   K_WEIGHTING_COEFFS,
+  kWeightingCoefficients,
   K_WEIGHTING_COEFFS_V2
 };
@@ -9,12 +9,15 @@
  */
 
 import { logAudio } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:metrics-invariants');
 
 export function validateMetricsInvariants(coreMetrics, jobId = 'unknown') {
   const warnings = [];
   const tolerance = 0.5; // dB
   
-  console.log(`[INVARIANTS][${jobId}] 🔍 Validando invariantes matemáticas...`);
+  logger.debug(() => [`[INVARIANTS][${jobId}] 🔍 Validando invariantes matemáticas...`]);
   
   // ========== CHECK 1: RMS Average <= RMS Peak ==========
   if (coreMetrics.rms?.average && coreMetrics.rms?.peak) {
@@ -28,7 +31,7 @@ export function validateMetricsInvariants(coreMetrics, jobId = 'unknown') {
         impact: 'Violação matemática: média não pode exceder pico'
       });
     } else {
-      console.log(`[INVARIANTS][${jobId}] ✅ RMS Average <= RMS Peak OK`);
+      logger.debug(() => [`[INVARIANTS][${jobId}] ✅ RMS Average <= RMS Peak OK`]);
     }
   }
   
@@ -55,10 +58,10 @@ export function validateMetricsInvariants(coreMetrics, jobId = 'unknown') {
         impact: 'Diferença anormalmente alta'
       });
     } else {
-      console.log(`[INVARIANTS][${jobId}] ✅ True Peak >= Sample Peak OK (diff=+${diff.toFixed(2)} dB)`);
+      logger.debug(() => [`[INVARIANTS][${jobId}] ✅ True Peak >= Sample Peak OK (diff=+${diff.toFixed(2)} dB)`]);
     }
   } else if (coreMetrics.samplePeak) {
-    console.log(`[INVARIANTS][${jobId}] ℹ️ CHECK 2 parcial: Sample Peak existe mas True Peak ausente`);
+    logger.debug(() => [`[INVARIANTS][${jobId}] ℹ️ CHECK 2 parcial: Sample Peak existe mas True Peak ausente`]);
   }
   
   // ========== CHECK 3: Dynamic Range >= 0 ==========
@@ -84,7 +87,7 @@ export function validateMetricsInvariants(coreMetrics, jobId = 'unknown') {
         impact: 'Valor incomum, pode indicar erro ou áudio especial'
       });
     } else {
-      console.log(`[INVARIANTS][${jobId}] ✅ Dynamic Range dentro do range OK (${dr.toFixed(2)} dB)`);
+      logger.debug(() => [`[INVARIANTS][${jobId}] ✅ Dynamic Range dentro do range OK (${dr.toFixed(2)} dB)`]);
     }
   }
   
@@ -103,7 +106,7 @@ export function validateMetricsInvariants(coreMetrics, jobId = 'unknown') {
         impact: 'Sugere compressão extrema, limiter severo ou possível erro'
       });
     } else {
-      console.log(`[INVARIANTS][${jobId}] ✅ LRA OK (${lra.toFixed(2)} LU)`);
+      logger.debug(() => [`[INVARIANTS][${jobId}] ✅ LRA OK (${lra.toFixed(2)} LU)`]);
     }
   }
   
@@ -112,15 +115,15 @@ export function validateMetricsInvariants(coreMetrics, jobId = 'unknown') {
   const warning = warnings.filter(w => w.severity === 'WARNING');
   const info = warnings.filter(w => w.severity === 'INFO');
   
-  console.log(`[INVARIANTS][${jobId}] ========== RESUMO ==========`);
-  console.log(`[INVARIANTS][${jobId}] CRITICAL: ${critical.length}`);
-  console.log(`[INVARIANTS][${jobId}] WARNING: ${warning.length}`);
-  console.log(`[INVARIANTS][${jobId}] INFO: ${info.length}`);
-  console.log(`[INVARIANTS][${jobId}] ============================`);
+  logger.debug(() => [`[INVARIANTS][${jobId}] ========== RESUMO ==========`]);
+  logger.debug(() => [`[INVARIANTS][${jobId}] CRITICAL: ${critical.length}`]);
+  logger.debug(() => [`[INVARIANTS][${jobId}] WARNING: ${warning.length}`]);
+  logger.debug(() => [`[INVARIANTS][${jobId}] INFO: ${info.length}`]);
+  logger.debug(() => [`[INVARIANTS][${jobId}] ============================`]);
   
   if (critical.length > 0) {
-    console.error(`[INVARIANTS][${jobId}] ❌ Falhas críticas detectadas!`);
-    critical.forEach(w => console.error(`[INVARIANTS][${jobId}] [CRITICAL] ${w.check}: ${w.message}`));
+    logger.error(`[INVARIANTS][${jobId}] ❌ Falhas críticas detectadas!`);
+    critical.forEach(w => logger.error(`[INVARIANTS][${jobId}] [CRITICAL] ${w.check}: ${w.message}`));
   }
   
   return {
@@ -4,6 +4,9 @@
 
 import { calculateLoudnessMetricsCorrected as calculateLoudnessMetrics } from '../features/loudness.js';
 import { logAudio, makeErr } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:normalization');
 
 /**
  * 🎯 CONFIGURAÇÕES DE NORMALIZAÇÃO
@@ -54,11 +57,19 @@ async function calculateQuickLUFS(leftChannel, rightChannel, sampleRate) {
  * 🔥 AUDITORIA SÊNIOR: Receber originalLUFS como parâmetro obrigatório
  * ❌ REMOVIDO: calculateQuickLUFS (gambiarra de 1 segundo)
  * ✅ CORREÇÃO: Usar LUFS integrado REAL calculado em core-metrics.js
+ *
+ * 🧮 MODO VIRTUAL (options.virtual = true):
+ * Não cria cópias normalizadas dos canais. O ganho é devolvido como escalar
+ * (gainAppliedDB/gainAppliedLinear) e leftChannel/rightChannel vêm null —
+ * métricas lineares no ganho (LUFS, peaks, RMS, bandas em dB, DC) aplicam o
+ * offset analiticamente; métricas invariantes à escala (correlação, largura)
+ * usam o buffer RAW. Use getNormalizedChannels() só para métricas não lineares.
  * 
  * @param {Object} audioData - Dados de áudio com leftChannel e rightChannel
  * @param {number} sampleRate - Sample rate do áudio
  * @param {Object} options - Opções de normalização
  * @param {number} options.originalLUFS - LUFS integrado REAL (obrigatório)
+ * @param {boolean} options.virtual - Carregar ganho como escalar (sem cópias)
  * @returns {Object} Áudio normalizado + metadata de normalização
  */
 export async function normalizeAudioToTargetLUFS(audioData, sampleRate, options = {}) {
@@ -79,16 +90,16 @@ export async function normalizeAudioToTargetLUFS(audioData, sampleRate, options
   try {
     // 🛡️ VALIDAÇÃO CRÍTICA: originalLUFS deve ser fornecido
     if (!Number.isFinite(originalLUFS)) {
-      console.error('[AUDIT_FIX][NORMALIZATION] ❌ originalLUFS não fornecido ou inválido:', originalLUFS);
-      console.error('[AUDIT_FIX][NORMALIZATION] ❌ Normalização REQUER LUFS integrado real calculado previamente');
+      logger.error('[AUDIT_FIX][NORMALIZATION] ❌ originalLUFS não fornecido ou inválido:', originalLUFS);
+      logger.error('[AUDIT_FIX][NORMALIZATION] ❌ Normalização REQUER LUFS integrado real calculado previamente');
       throw new Error('AUDIT_FIX: originalLUFS obrigatório para normalização precisa - use rawLufsMetrics.integrated de core-metrics');
     }
     
-    console.log('[AUDIT_FIX][NORMALIZATION] ✅ Usando LUFS integrado REAL:', {
+    logger.debug(() => ['[AUDIT_FIX][NORMALIZATION] ✅ Usando LUFS integrado REAL:', {
       originalLUFS: originalLUFS.toFixed(2),
       source: 'core-metrics rawLufsMetrics.integrated',
       method: 'FULL_INTEGRATED (não Quick LUFS)'
-    });
+    }]);
     
     logAudio('normalization', 'original_lufs', { 
       originalLUFS: originalLUFS.toFixed(2),
@@ -145,6 +156,49 @@ export async function normalizeAudioToTargetLUFS(audioData, sampleRate, options
       gainLinear: gainLinear.toFixed(4) 
     });
     
+    // 6a. Modo virtual: apenas verificar clipping pelo pico (1 passada, zero alocação)
+    if (options.virtual) {
+      const leftPeak = channelPeak(audioData.leftChannel);
+      const rightPeak = channelPeak(audioData.rightChannel);
+      const leftClipping = leftPeak * gainLinear >= 0.99;
+      const rightClipping = rightPeak * gainLinear >= 0.99;
+      
+      if (leftClipping || rightClipping) {
+        logAudio('normalization', 'clipping_detected', { leftClipping, rightClipping });
+      }
+      
+      const processingTime = Date.now() - startTime;
+      
+      logAudio('normalization', 'completed', {
+        originalLUFS: originalLUFS.toFixed(2),
+        targetLUFS: targetLUFS.toFixed(2),
+        gainApplied: gainDB.toFixed(2),
+        processingTime,
+        hasClipping: leftClipping || rightClipping,
+        virtual: true
+      });
+      
+      return {
+        leftChannel: null,
+        rightChannel: null,
+        virtual: true,
+        normalizationApplied: true,
+        originalLUFS,
+        targetLUFS,
+        gainAppliedDB: gainDB,
+        gainAppliedLinear: gainLinear,
+        isSilence: false,
+        hasClipping: leftClipping || rightClipping,
+        processingTime,
+        metadata: {
+          stage: 'normalization',
+          status: 'success',
+          mode: 'virtual',
+          config: NORMALIZATION_CONFIG
+        }
+      };
+    }
+    
     // 6. Criar canais normalizados
     const normalizedLeft = new Float32Array(audioData.leftChannel.length);
     const normalizedRight = new Float32Array(audioData.rightChannel.length);
@@ -224,6 +278,45 @@ export async function normalizeAudioToTargetLUFS(audioData, sampleRate, options
   }
 }
 
+/**
+ * 🔧 Pico absoluto de um canal
+ */
+function channelPeak(channel) {
+  let peak = 0;
+  for (let i = 0; i < channel.length; i++) {
+    const abs = Math.abs(channel[i]);
+    if (abs > peak) peak = abs;
+  }
+  return peak;
+}
+
+/**
+ * 🧮 Obter canais normalizados (materializa cópias só quando o resultado é virtual)
+ * Para métricas genuinamente não lineares no ganho (limiares absolutos, clipping por amostra).
+ * @param {Object} audioData - { leftChannel, rightChannel } RAW
+ * @param {Object} normalizationResult - Retorno de normalizeAudioToTargetLUFS
+ * @returns {{ leftChannel: Float32Array, rightChannel: Float32Array }}
+ */
+export function getNormalizedChannels(audioData, normalizationResult) {
+  if (!normalizationResult.virtual) {
+    return {
+      leftChannel: normalizationResult.leftChannel,
+      rightChannel: normalizationResult.rightChannel
+    };
+  }
+  
+  const gain = normalizationResult.gainAppliedLinear;
+  const leftChannel = new Float32Array(audioData.leftChannel.length);
+  const rightChannel = new Float32Array(audioData.rightChannel.length);
+  for (let i = 0; i < leftChannel.length; i++) {
+    leftChannel[i] = audioData.leftChannel[i] * gain;
+  }
+  for (let i = 0; i < rightChannel.length; i++) {
+    rightChannel[i] = audioData.rightChannel[i] * gain;
+  }
+  return { leftChannel, rightChannel };
+}
+
 /**
  * 📊 Validar normalização aplicada
  */
@@ -261,4 +354,4 @@ export async function validateNormalization(normalizedAudio, sampleRate, expecte
   }
 }
 
-console.log('🎛️ Normalização Pré-Análise carregada - Target -23 LUFS');
\ No newline at end of file
+logger.debug('🎛️ Normalização Pré-Análise carregada - Target -23 LUFS');
\ No newline at end of file
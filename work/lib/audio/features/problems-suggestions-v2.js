@@ -22,6 +22,9 @@ import {
   getStatusText, 
   getCssClass 
 } from '../utils/metric-classifier.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:problems-suggestions-v2');
 
 /**
  * 🎨 Sistema de Criticidade com Cores - AUDITORIA ESPECÍFICA PARA DINÂMICA (LU RANGE)
@@ -232,11 +235,11 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
   getRangeBounds(threshold) {
     // ✅ PRIORIDADE 1: Usar min/max diretos (NOVO FORMATO)
     if (typeof threshold.min === 'number' && typeof threshold.max === 'number') {
-      console.log('[RANGE_BOUNDS][RANGE-MIGRATION] ✅ Usando min/max diretos:', {
+      logger.debug(() => ['[RANGE_BOUNDS][RANGE-MIGRATION] ✅ Usando min/max diretos:', {
         min: threshold.min,
         max: threshold.max,
         source: 'min_max_explicitos'
-      });
+      }]);
       return {
         min: threshold.min,
         max: threshold.max
@@ -250,18 +253,18 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       const maxValue = threshold.target_range.max ?? threshold.target_range.max_db;
       
       if (typeof minValue === 'number' && typeof maxValue === 'number') {
-        console.log('[RANGE_BOUNDS][RANGE-MIGRATION] ✅ Usando target_range (banda):', {
+        logger.debug(() => ['[RANGE_BOUNDS][RANGE-MIGRATION] ✅ Usando target_range (banda):', {
           min: minValue,
           max: maxValue,
           source: 'target_range',
           originalKeys: Object.keys(threshold.target_range)
-        });
+        }]);
         return {
           min: minValue,
           max: maxValue
         };
       } else {
-        console.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ target_range presente mas min/max inválidos:', {
+        logger.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ target_range presente mas min/max inválidos:', {
           target_range: threshold.target_range,
           minValue,
           maxValue
@@ -272,7 +275,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     // ⚠️ FALLBACK LEGADO: Calcular com target ± tolerance
     // Este método será DEPRECADO após migração completa
     if (typeof threshold.target !== 'number') {
-      console.error('[RANGE_BOUNDS] ❌ ERRO: target inválido e sem min/max:', {
+      logger.error('[RANGE_BOUNDS] ❌ ERRO: target inválido e sem min/max:', {
         target: threshold.target,
         tolerance: threshold.tolerance,
         hasMin: 'min' in threshold,
@@ -289,19 +292,19 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       : 0;
 
     if (effectiveTolerance === 0) {
-      console.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ tolerance = 0, usando target exato:', threshold.target);
+      logger.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ tolerance = 0, usando target exato:', threshold.target);
       return { min: threshold.target, max: threshold.target };
     }
     
-    console.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ FALLBACK LEGADO: Calculando range com target ± tolerance');
-    console.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ Este método será DEPRECADO - atualize genreTargets para incluir min/max');
-    console.log('[RANGE_BOUNDS][RANGE-MIGRATION] Cálculo:', {
+    logger.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ FALLBACK LEGADO: Calculando range com target ± tolerance');
+    logger.warn('[RANGE_BOUNDS][RANGE-MIGRATION] ⚠️ Este método será DEPRECADO - atualize genreTargets para incluir min/max');
+    logger.debug(() => ['[RANGE_BOUNDS][RANGE-MIGRATION] Cálculo:', {
       target: threshold.target,
       tolerance: threshold.tolerance,
       min: threshold.target - threshold.tolerance,
       max: threshold.target + threshold.tolerance,
       source: 'calculado_legacy'
-    });
+    }]);
     
     return {
       min: threshold.target - threshold.tolerance,
@@ -397,15 +400,15 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
    * @param {string} genre - Gênero musical (apenas para logging/metadata)
    */
   constructor(genre = 'default') {
-    console.log('[ANALYZER-CONSTRUCTOR] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-    console.log('[ANALYZER-CONSTRUCTOR] ✅ NOVA POLÍTICA: Sem customTargets no construtor');
-    console.log('[ANALYZER-CONSTRUCTOR] genre:', genre);
-    console.log('[ANALYZER-CONSTRUCTOR] Targets virão de consolidatedData em runtime');
-    console.log('[ANALYZER-CONSTRUCTOR] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[ANALYZER-CONSTRUCTOR] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[ANALYZER-CONSTRUCTOR] ✅ NOVA POLÍTICA: Sem customTargets no construtor');
+    logger.debug(() => ['[ANALYZER-CONSTRUCTOR] genre:', genre]);
+    logger.debug('[ANALYZER-CONSTRUCTOR] Targets virão de consolidatedData em runtime');
+    logger.debug('[ANALYZER-CONSTRUCTOR] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
     
     // 🛡️ Validar genre
     if (!genre || typeof genre !== 'string' || !genre.trim()) {
-      console.error('[ANALYZER-ERROR] Genre inválido recebido:', genre);
+      logger.error('[ANALYZER-ERROR] Genre inválido recebido:', genre);
       throw new Error('[ANALYZER-CONSTRUCTOR] Genre inválido - sistema requer gênero válido');
     }
     
@@ -435,14 +438,14 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     // ✅ REGRA ABSOLUTA: Usar APENAS consolidatedData.genreTargets
     const genreTargets = consolidatedData && consolidatedData.genreTargets;
     if (!genreTargets) {
-      console.error(`[TARGET-HELPER] ❌ consolidatedData.genreTargets ausente para ${metricKey}`);
-      console.error('[TARGET-HELPER] ❌ IMPOSSÍVEL GERAR SUGESTÃO - pulando');
+      logger.error(`[TARGET-HELPER] ❌ consolidatedData.genreTargets ausente para ${metricKey}`);
+      logger.error('[TARGET-HELPER] ❌ IMPOSSÍVEL GERAR SUGESTÃO - pulando');
       return null;
     }
 
     if (metricKey === 'bands') {
       if (!bandKey) {
-        console.warn(`[TARGET-HELPER] ⚠️ bandKey ausente para metricKey='bands'`);
+        logger.warn(`[TARGET-HELPER] ⚠️ bandKey ausente para metricKey='bands'`);
         return null;
       }
       
@@ -465,20 +468,20 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
         t = genreTargets.bands && genreTargets.bands[aliasKey];
         if (t) {
           resolvedKey = aliasKey;
-          console.log(`[TARGET-HELPER] 🔄 Alias aplicado: ${bandKey} → ${aliasKey}`);
+          logger.debug(() => [`[TARGET-HELPER] 🔄 Alias aplicado: ${bandKey} → ${aliasKey}`]);
         }
       }
       
       // ✅ CORREÇÃO: JSON usa "target_db" nas bandas, NÃO "target"
       if (!t) {
-        console.error(`[TARGET-HELPER] ❌ Banda ${bandKey} ausente em genreTargets.bands (tentou alias: ${TARGET_KEY_ALIASES[bandKey] || 'nenhum'})`);
-        console.error(`[TARGET-HELPER] Bandas disponíveis:`, Object.keys(genreTargets.bands || {}));
+        logger.error(`[TARGET-HELPER] ❌ Banda ${bandKey} ausente em genreTargets.bands (tentou alias: ${TARGET_KEY_ALIASES[bandKey] || 'nenhum'})`);
+        logger.error(`[TARGET-HELPER] Bandas disponíveis:`, Object.keys(genreTargets.bands || {}));
         return null;
       }
 
       // ✅ Validar target_db
       if (typeof t.target_db !== 'number') {
-        console.error(`[TARGET-HELPER] ❌ target_db inválido para banda ${bandKey}:`, {
+        logger.error(`[TARGET-HELPER] ❌ target_db inválido para banda ${bandKey}:`, {
           target_db: t.target_db,
           type: typeof t.target_db,
           actualKeys: Object.keys(t)
@@ -491,12 +494,12 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       const tolerance = t.tol_db ?? 3.0;
       const critical = t.critical ?? tolerance * 1.5;
 
-      console.log(`[TARGET-HELPER] ✅ Banda ${bandKey}:`, {
+      logger.debug(() => [`[TARGET-HELPER] ✅ Banda ${bandKey}:`, {
         target_db: t.target_db,
         tol_db: tolerance,
         target_range: t.target_range,
         critical: critical
-      });
+      }]);
 
       return {
         target: t.target_db,  // ✅ Usar target_db, não target
@@ -509,7 +512,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     // Para LUFS, TruePeak, DR, Stereo: estrutura é { target, tolerance }
     const t = genreTargets[metricKey];
     if (!t || typeof t.target !== 'number') {
-      console.warn(`[TARGET-HELPER] ⚠️ Target inválido para ${metricKey}:`, {
+      logger.warn(`[TARGET-HELPER] ⚠️ Target inválido para ${metricKey}:`, {
         exists: !!t,
         hasTarget: t ? 'target' in t : false,
         actualKeys: t ? Object.keys(t) : []
@@ -541,25 +544,25 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
    */
   analyzeWithEducationalSuggestions(audioMetrics, consolidatedData = null) {
     try {
-      console.log('[AUDIT-PROBLEMS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-      console.log('[AUDIT-PROBLEMS] DENTRO DO ANALYZER:');
-      console.log('[AUDIT-PROBLEMS] this._originalGenre:', this._originalGenre);
-      console.log('[AUDIT-PROBLEMS] this.genre:', this.genre);
-      console.log('[AUDIT-PROBLEMS] consolidatedData disponível:', !!consolidatedData);
+      logger.debug('[AUDIT-PROBLEMS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug('[AUDIT-PROBLEMS] DENTRO DO ANALYZER:');
+      logger.debug(() => ['[AUDIT-PROBLEMS] this._originalGenre:', this._originalGenre]);
+      logger.debug(() => ['[AUDIT-PROBLEMS] this.genre:', this.genre]);
+      logger.debug(() => ['[AUDIT-PROBLEMS] consolidatedData disponível:', !!consolidatedData]);
       
       if (consolidatedData) {
-        console.log('[AUDIT-PROBLEMS] 📊 Usando metrics consolidados:', {
+        logger.debug(() => ['[AUDIT-PROBLEMS] 📊 Usando metrics consolidados:', {
           loudness: consolidatedData.metrics && consolidatedData.metrics.loudness && consolidatedData.metrics.loudness.value,
           truePeak: consolidatedData.metrics && consolidatedData.metrics.truePeak && consolidatedData.metrics.truePeak.value,
           dr: consolidatedData.metrics && consolidatedData.metrics.dr && consolidatedData.metrics.dr.value
-        });
-        console.log('[AUDIT-PROBLEMS] 🎯 Usando genreTargets consolidados:', {
+        }]);
+        logger.debug(() => ['[AUDIT-PROBLEMS] 🎯 Usando genreTargets consolidados:', {
           lufs: consolidatedData.genreTargets && consolidatedData.genreTargets.lufs && consolidatedData.genreTargets.lufs.target,
           truePeak: consolidatedData.genreTargets && consolidatedData.genreTargets.truePeak && consolidatedData.genreTargets.truePeak.target,
           dr: consolidatedData.genreTargets && consolidatedData.genreTargets.dr && consolidatedData.genreTargets.dr.target
-        });
+        }]);
       }
-      console.log('[AUDIT-PROBLEMS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug('[AUDIT-PROBLEMS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
       
       logAudio('problems_v2', 'analysis_start', { genre: this.genre });
       
@@ -601,11 +604,11 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       // 🔥 PATCH CRÍTICO: Preservar genre original mesmo se this.genre foi convertido para 'default'
       const originalGenre = this._originalGenre || this.genre;  // Tentar recuperar genre original
       
-      console.log('[AUDIT-PROBLEMS-RESULT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-      console.log('[AUDIT-PROBLEMS-RESULT] ANTES DE RETORNAR RESULT:');
-      console.log('[AUDIT-PROBLEMS-RESULT] originalGenre:', originalGenre);
-      console.log('[AUDIT-PROBLEMS-RESULT] summary.genre:', summary && summary.genre);
-      console.log('[AUDIT-PROBLEMS-RESULT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug('[AUDIT-PROBLEMS-RESULT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+      logger.debug('[AUDIT-PROBLEMS-RESULT] ANTES DE RETORNAR RESULT:');
+      logger.debug(() => ['[AUDIT-PROBLEMS-RESULT] originalGenre:', originalGenre]);
+      logger.debug(() => ['[AUDIT-PROBLEMS-RESULT] summary.genre:', summary && summary.genre]);
+      logger.debug('[AUDIT-PROBLEMS-RESULT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
       
       const result = {
         genre: originalGenre,  // 🔥 Usar genre original, não this.genre
@@ -633,7 +636,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       if (hasCriticalTruePeak) {
         result.priority = 'tp_first';
         result.priorityMessage = '🔴 CORREÇÃO PRIORITÁRIA: Reduza o True Peak antes de realizar outros ajustes. Clipping digital impede análise precisa.';
-        console.log('[PROBLEMS_V2][PRIORITY] ⚠️ True Peak crítico detectado - marcado como prioridade');
+        logger.debug('[PROBLEMS_V2][PRIORITY] ⚠️ True Peak crítico detectado - marcado como prioridade');
       }
       
       logAudio('problems_v2', 'analysis_complete', {
@@ -645,19 +648,19 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
         usingConsolidatedData: !!consolidatedData
       });
       
-      console.error("\n\n");
-      console.error("╔════════════════════════════════════════════════════════════════╗");
-      console.error("║  ✅✅✅ SUGESTÕES GERADAS COM SUCESSO ✅✅✅                  ║");
-      console.error("╚════════════════════════════════════════════════════════════════╝");
-      console.error("[SUGGESTIONS RAW] ⏰ Timestamp:", new Date().toISOString());
-      console.error("[SUGGESTIONS RAW] 📊 Sugestões geradas:");
-      console.error("  - Total de sugestões:", suggestions.length);
-      console.error("  - Críticas:", result.metadata.criticalCount);
-      console.error("  - Avisos:", result.metadata.warningCount);
-      console.error("  - OK:", result.metadata.okCount);
-      console.error("[SUGGESTIONS RAW] 🔍 Primeiras 3 sugestões:", JSON.stringify(suggestions.slice(0, 3), null, 2));
-      console.error("[SUGGESTIONS RAW] ✅ Usando dados consolidados?:", !!consolidatedData);
-      console.error("════════════════════════════════════════════════════════════════\n\n");
+      logger.error("\n\n");
+      logger.error("╔════════════════════════════════════════════════════════════════╗");
+      logger.error("║  ✅✅✅ SUGESTÕES GERADAS COM SUCESSO ✅✅✅                  ║");
+      logger.error("╚════════════════════════════════════════════════════════════════╝");
+      logger.error("[SUGGESTIONS RAW] ⏰ Timestamp:", new Date().toISOString());
+      logger.error("[SUGGESTIONS RAW] 📊 Sugestões geradas:");
+      logger.error("  - Total de sugestões:", suggestions.length);
+      logger.error("  - Críticas:", result.metadata.criticalCount);
+      logger.error("  - Avisos:", result.metadata.warningCount);
+      logger.error("  - OK:", result.metadata.okCount);
+      logger.error("[SUGGESTIONS RAW] 🔍 Primeiras 3 sugestões:", JSON.stringify(suggestions.slice(0, 3), null, 2));
+      logger.error("[SUGGESTIONS RAW] ✅ Usando dados consolidados?:", !!consolidatedData);
+      logger.error("════════════════════════════════════════════════════════════════\n\n");
       
       return result;
       
@@ -837,14 +840,14 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     
     // 🎯 GATE: Bloquear sugestão se métrica está OK (dentro do range)
     if (diff === 0) {
-      console.log('[SUGGESTION_GATE] ✅ Sugestão OMITIDA (métrica OK):', {
+      logger.debug(() => ['[SUGGESTION_GATE] ✅ Sugestão OMITIDA (métrica OK):', {
         metric: 'True Peak',
         value: truePeak.toFixed(2),
         bounds: `${bounds.min.toFixed(2)} a ${bounds.max.toFixed(2)}`,
         delta: diff,
         severity: severity.level,
         reason: 'diff === 0 (dentro do range)'
-      });
+      }]);
       return;
     }
     
@@ -914,7 +917,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     
     // 🔥 VALIDAÇÃO CRÍTICA: DR nunca deve ter targetValue negativo
     if (bounds.min < 0 || bounds.max < 0) {
-      console.error('[DR] ❌❌❌ BUG CRÍTICO: Range negativo detectado!');
+      logger.error('[DR] ❌❌❌ BUG CRÍTICO: Range negativo detectado!');
       return;
     }
     
@@ -1067,13 +1070,13 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
   analyzeSpectralBands(suggestions, problems, consolidatedData) {
     // ✅ VALIDAÇÃO RIGOROSA: consolidatedData obrigatório
     if (!consolidatedData) {
-      console.error('[BANDS] ❌ consolidatedData ausente - IMPOSSÍVEL gerar sugestão');
+      logger.error('[BANDS] ❌ consolidatedData ausente - IMPOSSÍVEL gerar sugestão');
       return;
     }
 
     // ✅ REGRA ABSOLUTA: Exigir consolidatedData.metrics.bands
     if (!consolidatedData.metrics?.bands) {
-      console.error('[BANDS] ❌ consolidatedData.metrics.bands ausente - pulando análise');
+      logger.error('[BANDS] ❌ consolidatedData.metrics.bands ausente - pulando análise');
       return;
     }
 
@@ -1117,30 +1120,30 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     // 🔥 LOG CRÍTICO: Inventário completo de TODAS as bandas antes de análise
     const DEBUG = process.env.DEBUG_SUGGESTIONS === '1';
     if (DEBUG) {
-      console.log('[BANDS][INVENTORY] 📊 ═══════════════════════════════════════════');
-      console.log('[BANDS][INVENTORY] INVENTÁRIO COMPLETO DE BANDAS:');
-      console.log('[BANDS][INVENTORY] Bandas medidas:', Object.keys(bands));
-      console.log('[BANDS][INVENTORY] Bandas no target:', Object.keys(targetBands));
+      logger.debug('[BANDS][INVENTORY] 📊 ═══════════════════════════════════════════');
+      logger.debug('[BANDS][INVENTORY] INVENTÁRIO COMPLETO DE BANDAS:');
+      logger.debug(() => ['[BANDS][INVENTORY] Bandas medidas:', Object.keys(bands)]);
+      logger.debug(() => ['[BANDS][INVENTORY] Bandas no target:', Object.keys(targetBands)]);
       Object.keys(bands).forEach(key => {
         const band = bands[key];
         const normalizedKey = BAND_ALIAS_MAP[key] || key;
         const target = targetBands[key] || targetBands[normalizedKey];
-        console.log(`[BANDS][INVENTORY] 📍 ${key} (→ ${normalizedKey}):`, {
+        logger.debug(() => [`[BANDS][INVENTORY] 📍 ${key} (→ ${normalizedKey}):`, {
           hasValue: Number.isFinite(band?.value),
           value: band?.value?.toFixed(2),
           hasTarget: !!target,
           target_db: target?.target_db?.toFixed(2),
           target_range: target?.target_range ? `${target.target_range.min?.toFixed(2)} a ${target.target_range.max?.toFixed(2)}` : 'MISSING',
           will_analyze: Number.isFinite(band?.value) && !!target
-        });
+        }]);
       });
-      console.log('[BANDS][INVENTORY] ═══════════════════════════════════════════');
+      logger.debug('[BANDS][INVENTORY] ═══════════════════════════════════════════');
     }
     
-    console.log('[BANDS] ✅ Usando EXCLUSIVAMENTE consolidatedData.metrics.bands:', {
+    logger.debug(() => ['[BANDS] ✅ Usando EXCLUSIVAMENTE consolidatedData.metrics.bands:', {
       bandsCount: Object.keys(bands).length,
       source: 'consolidatedData'
-    });
+    }]);
     
     // 🔥 LOOP DINÂMICO: Iterar sobre TODAS as bandas medidas
     // Isso garante que NENHUMA banda seja esquecida (brilho, presenca, etc)
@@ -1150,7 +1153,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       const bandValue = bands[rawKey]?.value;
       
       if (!Number.isFinite(bandValue)) {
-        if (DEBUG) console.log(`[BANDS] ⏭️ Pulando ${rawKey}: valor não finito`);
+        if (DEBUG) logger.debug(() => [`[BANDS] ⏭️ Pulando ${rawKey}: valor não finito`]);
         continue;
       }
       
@@ -1159,7 +1162,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       
       // 🚫 EVITAR DUPLICATAS: Se já processamos essa banda normalizada, pular
       if (processedKeys.has(normalizedKey)) {
-        if (DEBUG) console.log(`[BANDS] ⏭️ Pulando ${rawKey}: já processado como ${normalizedKey}`);
+        if (DEBUG) logger.debug(() => [`[BANDS] ⏭️ Pulando ${rawKey}: já processado como ${normalizedKey}`]);
         continue;
       }
       
@@ -1171,14 +1174,14 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
         for (const [alias, canonical] of Object.entries(BAND_ALIAS_MAP)) {
           if (canonical === normalizedKey && targetBands[alias]) {
             targetInfo = targetBands[alias];
-            if (DEBUG) console.log(`[BANDS] ✅ Target encontrado via alias: ${alias} → ${normalizedKey}`);
+            if (DEBUG) logger.debug(() => [`[BANDS] ✅ Target encontrado via alias: ${alias} → ${normalizedKey}`]);
             break;
           }
         }
       }
       
       if (!targetInfo) {
-        if (DEBUG) console.log(`[BANDS] ⚠️ Pulando ${rawKey}: sem target disponível`);
+        if (DEBUG) logger.debug(() => [`[BANDS] ⚠️ Pulando ${rawKey}: sem target disponível`]);
         continue;
       }
       
@@ -1188,7 +1191,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       processedKeys.add(normalizedKey);
       
       if (DEBUG) {
-        console.log(`[BANDS] ✅ Processado: ${rawKey} → ${normalizedKey} (${label})`);
+        logger.debug(() => [`[BANDS] ✅ Processado: ${rawKey} → ${normalizedKey} (${label})`]);
       }
     }
     
@@ -1203,37 +1206,37 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     const presenceSuggestion = bandSuggestions.find(s => s.metric === 'band_presence');
     
     // 🚨 LOG SEMPRE VISÍVEL para bandas críticas (independente de DEBUG)
-    console.log('[BANDS][AUDIT] 🔍 ════════════════════════════════════════════');
-    console.log('[BANDS][AUDIT] AUDITORIA BANDAS CRÍTICAS (air/presence):');
-    console.log('[BANDS][AUDIT] Banda "air" (brilho):', {
+    logger.debug('[BANDS][AUDIT] 🔍 ════════════════════════════════════════════');
+    logger.debug('[BANDS][AUDIT] AUDITORIA BANDAS CRÍTICAS (air/presence):');
+    logger.debug(() => ['[BANDS][AUDIT] Banda "air" (brilho):', {
       processado: hasAir,
       sugestaoGerada: !!airSuggestion,
       metric: airSuggestion?.metric || 'NÃO GERADA',
       severity: airSuggestion?.severity?.level || 'N/A'
-    });
-    console.log('[BANDS][AUDIT] Banda "presence" (presenca):', {
+    }]);
+    logger.debug(() => ['[BANDS][AUDIT] Banda "presence" (presenca):', {
       processado: hasPresence,
       sugestaoGerada: !!presenceSuggestion,
       metric: presenceSuggestion?.metric || 'NÃO GERADA',
       severity: presenceSuggestion?.severity?.level || 'N/A'
-    });
-    console.log('[BANDS][AUDIT] ════════════════════════════════════════════');
+    }]);
+    logger.debug('[BANDS][AUDIT] ════════════════════════════════════════════');
     
     if (DEBUG) {
-      console.log('[BANDS][SUMMARY] 📊 ════════════════════════════════════════════');
-      console.log('[BANDS][SUMMARY] RESUMO DE SUGESTÕES GERADAS:');
-      console.log('[BANDS][SUMMARY] Total:', bandSuggestions.length);
-      console.log('[BANDS][SUMMARY] Keys processadas:', Array.from(processedKeys).join(', '));
+      logger.debug('[BANDS][SUMMARY] 📊 ════════════════════════════════════════════');
+      logger.debug('[BANDS][SUMMARY] RESUMO DE SUGESTÕES GERADAS:');
+      logger.debug(() => ['[BANDS][SUMMARY] Total:', bandSuggestions.length]);
+      logger.debug(() => ['[BANDS][SUMMARY] Keys processadas:', Array.from(processedKeys).join(', ')]);
       bandSuggestions.forEach(s => {
-        console.log(`[BANDS][SUMMARY] ✅ ${s.metric}:`, {
+        logger.debug(() => [`[BANDS][SUMMARY] ✅ ${s.metric}:`, {
           severity: s.severity?.level,
           delta: s.deltaNum?.toFixed(2),
           status: s.status
-        });
+        }]);
       });
-      console.log('[BANDS][SUMMARY] ════════════════════════════════════════════');
+      logger.debug('[BANDS][SUMMARY] ════════════════════════════════════════════');
     } else {
-      console.log('[BANDS][SUMMARY] 📊 Bandas processadas:', processedKeys.size, '| Sugestões geradas:', bandSuggestions.length);
+      logger.debug(() => ['[BANDS][SUMMARY] 📊 Bandas processadas:', processedKeys.size, '| Sugestões geradas:', bandSuggestions.length]);
     }
 
     logAudio('problems_v2', 'spectral_analysis', { 
@@ -1259,7 +1262,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     
     // ✅ VALIDAÇÃO RIGOROSA: consolidatedData obrigatório
     if (!consolidatedData) {
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData ausente - IMPOSSÍVEL gerar sugestão`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData ausente - IMPOSSÍVEL gerar sugestão`);
       return;
     }
 
@@ -1269,34 +1272,34 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     let bandData = consolidatedData.metrics?.bands?.[searchKey] || consolidatedData.metrics?.bands?.[bandKey];
     
     if (DEBUG) {
-      console.log(`[BAND-${bandKey.toUpperCase()}] 🔍 AUDITORIA CRÍTICA DE DADOS:`);
-      console.log(`[BAND-${bandKey.toUpperCase()}] - searchKey: ${searchKey} (rawKey: ${rawKey}, bandKey: ${bandKey})`);
-      console.log(`[BAND-${bandKey.toUpperCase()}] - bandData completo:`, JSON.stringify(bandData, null, 2));
-      console.log(`[BAND-${bandKey.toUpperCase()}] - bandData.value:`, bandData?.value);
-      console.log(`[BAND-${bandKey.toUpperCase()}] - bandData.unit:`, bandData?.unit);
-      console.log(`[BAND-${bandKey.toUpperCase()}] - typeof bandData.value:`, typeof bandData?.value);
-      console.log(`[BAND-${bandKey.toUpperCase()}] - bandData.value < 0:`, bandData?.value < 0);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] 🔍 AUDITORIA CRÍTICA DE DADOS:`]);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] - searchKey: ${searchKey} (rawKey: ${rawKey}, bandKey: ${bandKey})`]);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] - bandData completo:`, JSON.stringify(bandData, null, 2)]);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] - bandData.value:`, bandData?.value]);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] - bandData.unit:`, bandData?.unit]);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] - typeof bandData.value:`, typeof bandData?.value]);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] - bandData.value < 0:`, bandData?.value < 0]);
     }
     
     const measured = bandData?.value ?? value;  // Fallback para value passado por parâmetro
     
     if (DEBUG) {
-      console.log(`[BAND-${bandKey.toUpperCase()}] 🎯 VALOR MEDIDO FINAL: ${measured} ${bandData?.unit || 'NO_UNIT'}`);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] 🎯 VALOR MEDIDO FINAL: ${measured} ${bandData?.unit || 'NO_UNIT'}`]);
     }
     
     if (!Number.isFinite(measured)) {
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData.metrics.bands.${searchKey}.value ausente ou inválido`);
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ Valor encontrado:`, bandData);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData.metrics.bands.${searchKey}.value ausente ou inválido`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ Valor encontrado:`, bandData);
       return;
     }
     
     // 🔥 VALIDAÇÃO CRÍTICA: Valor deve ser negativo (dBFS)
     if (measured >= 0) {
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌❌❌ BUG CRÍTICO DETECTADO! ❌❌❌`);
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ Valor positivo ${measured} detectado quando deveria ser dBFS NEGATIVO!`);
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ Isso indica que .value está com PERCENTAGE ao invés de energy_db!`);
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData.metrics.bands[${searchKey}]:`, JSON.stringify(bandData, null, 2));
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ ABORTING SUGESTÃO - DADOS CORROMPIDOS`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌❌❌ BUG CRÍTICO DETECTADO! ❌❌❌`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ Valor positivo ${measured} detectado quando deveria ser dBFS NEGATIVO!`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ Isso indica que .value está com PERCENTAGE ao invés de energy_db!`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData.metrics.bands[${searchKey}]:`, JSON.stringify(bandData, null, 2));
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ ABORTING SUGESTÃO - DADOS CORROMPIDOS`);
       return;
     }
 
@@ -1306,17 +1309,17 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     if (rawKey) {
       targetInfo = this.getMetricTarget('bands', rawKey, consolidatedData);
       if (DEBUG && targetInfo) {
-        console.log(`[BAND-${bandKey.toUpperCase()}] ✅ Target encontrado com rawKey: ${rawKey}`);
+        logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] ✅ Target encontrado com rawKey: ${rawKey}`]);
       }
     }
     if (!targetInfo) {
       targetInfo = this.getMetricTarget('bands', bandKey, consolidatedData);
       if (DEBUG && targetInfo) {
-        console.log(`[BAND-${bandKey.toUpperCase()}] ✅ Target encontrado com bandKey: ${bandKey}`);
+        logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] ✅ Target encontrado com bandKey: ${bandKey}`]);
       }
     }
     if (!targetInfo) {
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData.genreTargets.bands.${bandKey} ausente - pulando sugestão`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ consolidatedData.genreTargets.bands.${bandKey} ausente - pulando sugestão`);
       return;
     }
 
@@ -1326,14 +1329,14 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     const target_range = targetInfo.target_range;  // ✅ Bandas SEMPRE têm target_range
 
     // ✅ LOG: Confirmar origem dos dados
-    console.log(`[BAND-${bandKey.toUpperCase()}] ✅ Usando consolidatedData:`, {
+    logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] ✅ Usando consolidatedData:`, {
       measured_db: measured.toFixed(2),
       target_db: target.toFixed(2),
       target_range_min: target_range && target_range.min && target_range.min.toFixed(2),
       target_range_max: target_range && target_range.max && target_range.max.toFixed(2),
       tolerance_db: tolerance.toFixed(2),
       source: 'consolidatedData'
-    });
+    }]);
     
     // 🎯 BANDAS: SEMPRE usar target_range.min/max, NUNCA calcular com tolerância
     // 🔥 CRÍTICO: Bandas não usam target ± tolerance, apenas target_range explícito
@@ -1347,13 +1350,13 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     
     // 🛡️ VALIDAÇÃO: Se target_range existia mas não foi usado, abortar
     if (target_range && (bounds.min === target - tolerance || bounds.max === target + tolerance)) {
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ BUG: target_range ignorado, usando target±tol!`);
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ target_range:`, target_range);
-      console.error(`[BAND-${bandKey.toUpperCase()}] ❌ bounds calculados:`, bounds);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ BUG: target_range ignorado, usando target±tol!`);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ target_range:`, target_range);
+      logger.error(`[BAND-${bandKey.toUpperCase()}] ❌ bounds calculados:`, bounds);
       // Forçar uso do target_range
       bounds.min = target_range.min ?? target_range.min_db;
       bounds.max = target_range.max ?? target_range.max_db;
-      console.log(`[BAND-${bandKey.toUpperCase()}] ✅ CORRIGIDO: bounds forçados para target_range:`, bounds);
+      logger.debug(() => [`[BAND-${bandKey.toUpperCase()}] ✅ CORRIGIDO: bounds forçados para target_range:`, bounds]);
     }
     
     // 🎯 Calcular delta: diferença até borda mais próxima do range
@@ -1367,14 +1370,14 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     }
     
     // 🔥 LOG MANDATÓRIO: Mostrar cálculo do delta ANTES de gerar sugestão
-    console.log(`[SUGGESTION_DEBUG][BANDS][${bandKey.toUpperCase()}] 📊 Cálculo do Delta:`, {
+    logger.debug(() => [`[SUGGESTION_DEBUG][BANDS][${bandKey.toUpperCase()}] 📊 Cálculo do Delta:`, {
       metric: bandName,
       measured: measured.toFixed(2),
       target: target.toFixed(2),
       bounds: `${bounds.min.toFixed(2)} a ${bounds.max.toFixed(2)}`,
       delta: rawDelta.toFixed(2),
       formula: rawDelta === 0 ? 'dentro do range' : (measured < bounds.min ? `${measured.toFixed(2)} - ${bounds.min.toFixed(2)} = ${rawDelta.toFixed(2)}` : `${measured.toFixed(2)} - ${bounds.max.toFixed(2)} = ${rawDelta.toFixed(2)}`)
-    });
+    }]);
     
     const diff = Math.abs(rawDelta);
     const severity = this.calculateSeverity(diff, tolerance, critical);
@@ -1407,7 +1410,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       }
     }
     
-    console.log('[GENRE-FLOW][S2_BUILDER]', {
+    logger.debug(() => ['[GENRE-FLOW][S2_BUILDER]', {
       metric: `BAND_${bandKey.toUpperCase()}`,
       genre: this.genre,
       currentValue: measured,
@@ -1416,7 +1419,7 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       deltaNum: rawDelta,
       rawMetricValue: measured,
       rawTargetObject: targetInfo
-    });
+    }]);
     
     const suggestion = {
       metric: `band_${bandKey}`,
@@ -1433,17 +1436,17 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       bandName
     };
     
-    console.log("[TRACE_S2_BUILDER]", {
+    logger.debug(() => ["[TRACE_S2_BUILDER]", {
       metric: `BAND_${bandKey.toUpperCase()}`,
       current: measured,
       target: target,
       rawTargetObject: consolidatedData?.genreTargets?.bands?.[bandKey],
       diff: rawDelta,
       suggestionPreview: suggestion
-    });
+    }]);
     
     // 🔍 DEBUG: Log completo ANTES do gate
-    console.log(`[DEBUG_GATE][BAND_${bandKey.toUpperCase()}] 🔬 Análise completa:`, {
+    logger.debug(() => [`[DEBUG_GATE][BAND_${bandKey.toUpperCase()}] 🔬 Análise completa:`, {
       measured: measured.toFixed(2),
       target: target.toFixed(2),
       bounds: { min: bounds.min.toFixed(2), max: bounds.max.toFixed(2) },
@@ -1457,11 +1460,11 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
       formula: measured < bounds.min ? `${measured.toFixed(2)} < ${bounds.min.toFixed(2)} → delta = ${rawDelta.toFixed(2)}` :
                measured > bounds.max ? `${measured.toFixed(2)} > ${bounds.max.toFixed(2)} → delta = ${rawDelta.toFixed(2)}` :
                `${bounds.min.toFixed(2)} ≤ ${measured.toFixed(2)} ≤ ${bounds.max.toFixed(2)} → delta = 0`
-    });
+    }]);
     
     // 🎯 GATE: Bloquear sugestão se banda está OK (dentro do range)
     if (rawDelta === 0) {
-      console.log('[SUGGESTION_GATE] ✅ Sugestão OMITIDA (banda OK):', {
+      logger.debug(() => ['[SUGGESTION_GATE] ✅ Sugestão OMITIDA (banda OK):', {
         metric: `BAND_${bandKey.toUpperCase()}`,
         bandName: bandName,
         value: measured.toFixed(2),
@@ -1469,15 +1472,15 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
         delta: rawDelta,
         severity: severity.level,
         reason: 'rawDelta === 0 (dentro do range)'
-      });
+      }]);
       return;
     }
     
-    console.log(`[DEBUG_GATE][BAND_${bandKey.toUpperCase()}] ✅ PASSOU pelo gate - gerando sugestão`, {
+    logger.debug(() => [`[DEBUG_GATE][BAND_${bandKey.toUpperCase()}] ✅ PASSOU pelo gate - gerando sugestão`, {
       bandKey,
       rawDelta: rawDelta.toFixed(2),
       severity: severity.level
-    });
+    }]);
     
     suggestions.push(suggestion);
   }
@@ -1488,11 +1491,11 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
    * REGRA: OK se diff ≤ tol, ATTENTION se diff ≤ 2×tol, CRITICAL se > 2×tol
    */
   calculateSeverity(diff, tolerance, critical) {
-    console.log('[AUDIT_FIX][CALC_SEVERITY] Usando classificador unificado:', {
+    logger.debug(() => ['[AUDIT_FIX][CALC_SEVERITY] Usando classificador unificado:', {
       diff: typeof diff === 'number' ? diff.toFixed(3) : diff,
       tolerance: typeof tolerance === 'number' ? tolerance.toFixed(3) : tolerance,
       critical_ignored: 'DEPRECATED - usando 2×tolerance sempre'
-    });
+    }]);
     
     // 🎯 Usar classificador unificado (ignora parâmetro 'critical' obsoleto)
     const classification = classifyMetric(diff, tolerance, { metricName: 'generic' });
@@ -1506,11 +1509,11 @@ export class ProblemsAndSuggestionsAnalyzerV2 {
     
     const result = severityMap[classification.level] || this.severity.CRITICAL;
     
-    console.log('[AUDIT_FIX][CALC_SEVERITY] Resultado:', {
+    logger.debug(() => ['[AUDIT_FIX][CALC_SEVERITY] Resultado:', {
       level: result.level,
       label: result.label,
       priority: result.priority
-    });
+    }]);
     
     return result;
   }
@@ -1785,4 +1788,4 @@ export function analyzeProblemsAndSuggestions(audioMetrics, genre = 'default') {
   return analyzeProblemsAndSuggestionsV2(audioMetrics, genre);
 }
 
-console.log('🎯 Problems & Suggestions Analyzer V2 carregado - Sistema educativo com criticidade por cores');
\ No newline at end of file
+logger.debug('🎯 Problems & Suggestions Analyzer V2 carregado - Sistema educativo com criticidade por cores');
\ No newline at end of file
@@ -2,30 +2,31 @@
 // Compatível com estrutura existente de referência. Apenas ativo se CAIAR_ENABLED.
 // Estratégia de distância: combinação de (sub)gênero, BPM, densidade (onsetRate, windowRmsMean) e fingerprint espectral.
 // Fingerprint espectral: vetor normalizado de energias por bandas + centroid + flatness.
+// Bibliotecas grandes: índice HNSW sobre os fingerprints seleciona os candidatos (top-k aproximado)
+// e só eles passam pela distância composta; abaixo de LINEAR_SCAN_LIMIT o scan linear é mantido.
 
 import { caiarLog } from './caiar-logger.js';
+import { VectorIndex } from '../utils/vector-index.js';
+
+const LINEAR_SCAN_LIMIT = 64;      // até aqui o scan completo é mais barato que o índice
+const CANDIDATES_PER_REF = 8;      // candidatos do índice por referência pedida (re-ranking)
+const FINGERPRINT_DIMENSIONS = 6;  // sub, low, mid, high, centroid, flatness
 
 function safeNum(x){ return Number.isFinite(x) ? x : 0; }
 
-function buildFingerprint(analysis) {
+function zNormalize(vec) {
+  const mean = vec.reduce((a,b)=>a+b,0)/vec.length;
+  const std = Math.sqrt(vec.reduce((a,b)=>a+(b-mean)*(b-mean),0)/vec.length)||1;
+  return vec.map(v=> (v-mean)/std);
+}
+
+// Fingerprint da análise no MESMO layout de buildRefFingerprint (comparável com as referências)
+function buildQueryFingerprint(analysis) {
   try {
     const td = analysis?.technicalData || {};
-    const bands = [];
-    const tb = td.tonalBalance;
-    if (tb) {
-      ['sub','low','mid','high'].forEach(b=> { const v = tb[b]?.rms_db; if (Number.isFinite(v)) bands.push(v); else bands.push(0); });
-    } else {
-      bands.push( safeNum(td.spectralCentroid), safeNum(td.spectralFlatness), 0,0 );
-    }
-    const centroid = safeNum(td.spectralCentroid);
-    const flatness = safeNum(td.spectralFlatness);
-    const crest = safeNum(td.crestFactor);
-    let onsetRate = null, rmsMean = null;
-    try { onsetRate = analysis?._contextDetection?.arrangementDensity?.onsetRate; rmsMean = analysis?._contextDetection?.arrangementDensity?.windowRmsMean; } catch {}
-    const vec = [ ...bands, centroid, flatness, crest, safeNum(onsetRate), safeNum(rmsMean) ];
-    const mean = vec.reduce((a,b)=>a+b,0)/vec.length;
-    const std = Math.sqrt(vec.reduce((a,b)=>a+(b-mean)*(b-mean),0)/vec.length) || 1;
-    return vec.map(v=> (v-mean)/std);
+    const tb = td.tonalBalance || {};
+    const bands = ['sub','low','mid','high'].map(b => safeNum(tb[b]?.rms_db));
+    return zNormalize([ ...bands, safeNum(td.spectralCentroid), safeNum(td.spectralFlatness) ]);
   } catch { return null; }
 }
 
@@ -71,10 +72,11 @@ export function matchAdaptiveReferences(analysis, options={ maxRefs:5, minRefs:3
       onsetRate: ctx.arrangementDensity?.onsetRate,
       rmsMean: ctx.arrangementDensity?.windowRmsMean,
       subgenre: window.PROD_AI_REF_GENRE || ctx.subgenre || null,
-      fp: buildFingerprint(analysis)
+      fp: buildQueryFingerprint(analysis)
     };
     const weights = { bpm: 2, density: 1.2, fingerprint: 3, subgenre: 0.8 };
-    const scored = lib.map(r => {
+    const candidates = selectCandidates(lib, sample.fp, options.maxRefs||5);
+    const scored = candidates.map(r => {
       const refFP = r._fingerprint || buildRefFingerprint(r);
       return { ref: r, distance: computeDistance(sample, { bpm: r.bpm, onsetRate: r.onsetRate, rmsMean: r.rmsMean, subgenre: r.subgenre || r.style || r.genre, fp: refFP }, weights) };
     }).sort((a,b)=> a.distance - b.distance);
@@ -121,16 +123,45 @@ function buildRefFingerprint(r) {
   try {
     if (r._fingerprint) return r._fingerprint;
     const bands = [];
-    if (r.bands) ['sub','low','mid','high'].forEach(b=> { const v = r.bands[b]?.target_db; bands.push(Number.isFinite(v)?v:0); });
+    ['sub','low','mid','high'].forEach(b=> { const v = r.bands?.[b]?.target_db; bands.push(Number.isFinite(v)?v:0); });
     const extra = [ safeNum(r.centroid_target), safeNum(r.flatness_target) ];
-    const vec = [...bands, ...extra];
-    const mean = vec.reduce((a,b)=>a+b,0)/vec.length;
-    const std = Math.sqrt(vec.reduce((a,b)=>a+(b-mean)*(b-mean),0)/vec.length)||1;
-    const norm = vec.map(v=> (v-mean)/std);
+    const norm = zNormalize([...bands, ...extra]);
     r._fingerprint = norm; return norm;
   } catch { return null; }
 }
 
+// Índice por biblioteca: reconstruído se a biblioteca mudar, incremental se ela só crescer
+let referenceIndexCache = null;
+
+/**
+ * Índice HNSW dos fingerprints da biblioteca de referências
+ * @param {Object[]} lib - referências (mesma estrutura de PROD_AI_REF_LIBRARY)
+ * @param {Object} options - { serialized }: índice salvo com index.toJSON() para evitar o build
+ * @returns {VectorIndex}
+ */
+export function getReferenceIndex(lib, options = {}) {
+  if (!referenceIndexCache || referenceIndexCache.lib !== lib || lib.length < referenceIndexCache.index.size) {
+    const index = options.serialized && options.serialized.nodes?.length <= lib.length
+      ? VectorIndex.fromJSON(options.serialized)
+      : new VectorIndex({ dimensions: FINGERPRINT_DIMENSIONS });
+    referenceIndexCache = { lib, index };
+  }
+  const { index } = referenceIndexCache;
+  // Inserção incremental das referências novas (id = posição na biblioteca)
+  for (let i = index.size; i < lib.length; i++) {
+    const fp = buildRefFingerprint(lib[i]);
+    index.add(i, fp && fp.length === FINGERPRINT_DIMENSIONS ? fp : new Array(FINGERPRINT_DIMENSIONS).fill(0));
+  }
+  return index;
+}
+
+function selectCandidates(lib, fingerprint, maxRefs) {
+  if (lib.length <= LINEAR_SCAN_LIMIT || !fingerprint) return lib;
+  const k = Math.max(CANDIDATES_PER_REF * maxRefs, LINEAR_SCAN_LIMIT / 2);
+  const index = getReferenceIndex(lib, { serialized: window.PROD_AI_REF_INDEX });
+  return index.search(fingerprint, k).map(hit => lib[hit.id]);
+}
+
 export function applyAdaptiveReference(analysis) {
   if (typeof window === 'undefined' || !window.CAIAR_ENABLED) return null;
   const adaptive = matchAdaptiveReferences(analysis) || null;
@@ -144,4 +175,4 @@ export function applyAdaptiveReference(analysis) {
   return adaptive;
 }
 
-export default { matchAdaptiveReferences, applyAdaptiveReference };
+export default { matchAdaptiveReferences, applyAdaptiveReference, getReferenceIndex };
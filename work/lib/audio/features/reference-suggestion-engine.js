@@ -18,6 +18,10 @@
  * - Bands (Low/Mid/High): ±2.0 dB
  */
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:reference-suggestion-engine');
+
 /**
  * Gera sugestões de comparação entre base e compare
  * @param {Object} baseMetrics - Métricas da música base (1ª)
@@ -25,9 +29,9 @@
  * @returns {Array} Array de sugestões no formato UI
  */
 export function referenceSuggestionEngine(baseMetrics, compareMetrics) {
-  console.log('[REFERENCE-ENGINE] Iniciando análise comparativa...');
-  console.log('[REFERENCE-ENGINE] Base:', baseMetrics?.metadata?.fileName || 'N/A');
-  console.log('[REFERENCE-ENGINE] Compare:', compareMetrics?.metadata?.fileName || 'N/A');
+  logger.debug('[REFERENCE-ENGINE] Iniciando análise comparativa...');
+  logger.debug(() => ['[REFERENCE-ENGINE] Base:', baseMetrics?.metadata?.fileName || 'N/A']);
+  logger.debug(() => ['[REFERENCE-ENGINE] Compare:', compareMetrics?.metadata?.fileName || 'N/A']);
 
   const suggestions = [];
 
@@ -35,9 +39,9 @@ export function referenceSuggestionEngine(baseMetrics, compareMetrics) {
   // VALIDAÇÃO: Verificar se métricas estão presentes + FALLBACK
   // ══════════════════════════════════════════════════════════
   if (!baseMetrics || !compareMetrics) {
-    console.error('[REFERENCE-ENGINE] ❌ Métricas ausentes!');
-    console.error('[REFERENCE-ENGINE] Base presente:', !!baseMetrics);
-    console.error('[REFERENCE-ENGINE] Compare presente:', !!compareMetrics);
+    logger.error('[REFERENCE-ENGINE] ❌ Métricas ausentes!');
+    logger.error('[REFERENCE-ENGINE] Base presente:', !!baseMetrics);
+    logger.error('[REFERENCE-ENGINE] Compare presente:', !!compareMetrics);
     
     // 🛡️ FALLBACK: Retornar sugestão de erro em vez de array vazio
     return [{
@@ -58,9 +62,9 @@ export function referenceSuggestionEngine(baseMetrics, compareMetrics) {
   }
 
   if (!baseMetrics.technicalData || !compareMetrics.technicalData) {
-    console.error('[REFERENCE-ENGINE] ❌ TechnicalData ausente!');
-    console.error('[REFERENCE-ENGINE] Base.technicalData:', !!baseMetrics.technicalData);
-    console.error('[REFERENCE-ENGINE] Compare.technicalData:', !!compareMetrics.technicalData);
+    logger.error('[REFERENCE-ENGINE] ❌ TechnicalData ausente!');
+    logger.error('[REFERENCE-ENGINE] Base.technicalData:', !!baseMetrics.technicalData);
+    logger.error('[REFERENCE-ENGINE] Compare.technicalData:', !!compareMetrics.technicalData);
     
     // 🛡️ FALLBACK: Retornar sugestão de erro em vez de array vazio
     return [{
@@ -106,12 +110,12 @@ export function referenceSuggestionEngine(baseMetrics, compareMetrics) {
   const baseBands = baseMetrics.metrics?.spectralBalance?.bands;
   const compareBands = compareMetrics.metrics?.spectralBalance?.bands;
 
-  console.log('[REFERENCE-ENGINE] Deltas:', {
+  logger.debug(() => ['[REFERENCE-ENGINE] Deltas:', {
     LUFS: (compareLUFS - baseLUFS).toFixed(2),
     TP: (compareTP - baseTP).toFixed(2),
     DR: (compareDR - baseDR).toFixed(2),
     LRA: compareLRA && baseLRA ? (compareLRA - baseLRA).toFixed(2) : 'N/A'
-  });
+  }]);
 
   // ══════════════════════════════════════════════════════════
   // 1️⃣ COMPARAÇÃO: LOUDNESS (LUFS)
@@ -292,11 +296,11 @@ export function referenceSuggestionEngine(baseMetrics, compareMetrics) {
   // ══════════════════════════════════════════════════════════
   // RESULTADO FINAL + FALLBACK OBRIGATÓRIO
   // ══════════════════════════════════════════════════════════
-  console.log('[REFERENCE-ENGINE] ✅ Geradas', suggestions.length, 'sugestões comparativas');
+  logger.debug(() => ['[REFERENCE-ENGINE] ✅ Geradas', suggestions.length, 'sugestões comparativas']);
   
   // 🛡️ FALLBACK OBRIGATÓRIO: Se nenhuma sugestão foi gerada, criar sugestão de ajuste fino
   if (suggestions.length === 0) {
-    console.log('[REFERENCE-ENGINE] ⚠️ Músicas muito similares - gerando fallback de ajuste fino');
+    logger.debug('[REFERENCE-ENGINE] ⚠️ Músicas muito similares - gerando fallback de ajuste fino');
     
     // Calcular diferenças absolutas para contexto
     const diffLUFS = Math.abs((compareLUFS || 0) - (baseLUFS || 0));
@@ -337,7 +341,7 @@ export function referenceSuggestionEngine(baseMetrics, compareMetrics) {
       enrichmentStatus: 'fallback-check-generated'
     });
     
-    console.log('[REFERENCE-ENGINE] ✅ Fallback gerado:', suggestions.length, 'sugestões mínimas');
+    logger.debug(() => ['[REFERENCE-ENGINE] ✅ Fallback gerado:', suggestions.length, 'sugestões mínimas']);
   }
 
   return suggestions;
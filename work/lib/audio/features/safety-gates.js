@@ -2,6 +2,10 @@
 // Implementação ULTRA CONSERVADORA - apenas warnings, nunca hard fails
 // Não afeta funcionamento do TT-DR ou sistema de scoring existente
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:safety-gates');
+
 /**
  * 🚨 CONFIGURAÇÃO DE GATES DE SEGURANÇA
  * PRINCÍPIO: Avisar, nunca bloquear
@@ -53,7 +57,7 @@ class SafetyGates {
       dynamicRange: 0
     };
     
-    console.log('🛡️ Safety Gates System inicializado (warning-only mode)');
+    logger.debug('🛡️ Safety Gates System inicializado (warning-only mode)');
   }
 
   /**
@@ -69,7 +73,7 @@ class SafetyGates {
     const truePeak = Number(truePeakValue);
     
     if (!Number.isFinite(truePeak)) {
-      console.warn('🛡️ [SAFETY-GATE] True Peak inválido:', truePeakValue);
+      logger.warn('🛡️ [SAFETY-GATE] True Peak inválido:', truePeakValue);
       return null;
     }
     
@@ -120,11 +124,11 @@ class SafetyGates {
     
     // Log baseado na severidade
     if (severity === 'critical') {
-      console.error('🚨 [SAFETY-GATE]', message);
-      console.error('💡 [RECOMMENDATION]', recommendation);
+      logger.error('🚨 [SAFETY-GATE]', message);
+      logger.error('💡 [RECOMMENDATION]', recommendation);
     } else {
-      console.warn('⚠️ [SAFETY-GATE]', message);
-      console.info('💡 [RECOMMENDATION]', recommendation);
+      logger.warn('⚠️ [SAFETY-GATE]', message);
+      logger.debug(() => ['💡 [RECOMMENDATION]', recommendation]);
     }
     
     // Adicionar à lista de warnings
@@ -139,7 +143,7 @@ class SafetyGates {
    * Executa todos os gates habilitados
    */
   analyzeAudio(audioMetrics) {
-    console.log('🛡️ [SAFETY-GATES] Iniciando análise de segurança...');
+    logger.debug('🛡️ [SAFETY-GATES] Iniciando análise de segurança...');
     
     // Reset warnings da análise anterior
     this.warnings = [];
@@ -166,7 +170,7 @@ class SafetyGates {
       allClear: this.warnings.length === 0
     };
     
-    console.log('🛡️ [SAFETY-GATES] Análise completa:', summary);
+    logger.debug(() => ['🛡️ [SAFETY-GATES] Análise completa:', summary]);
     
     return {
       results,
@@ -195,7 +199,7 @@ class SafetyGates {
    */
   updateConfig(newConfig) {
     this.config = { ...this.config, ...newConfig };
-    console.log('🛡️ [SAFETY-GATES] Configuração atualizada:', this.config);
+    logger.debug(() => ['🛡️ [SAFETY-GATES] Configuração atualizada:', this.config]);
   }
 }
 
@@ -215,7 +219,7 @@ function initializeSafetyGates(config) {
       window.SAFETY_GATES_CONFIG = SAFETY_GATES_CONFIG;
     }
     
-    console.log('🛡️ Safety Gates System disponível globalmente');
+    logger.debug('🛡️ Safety Gates System disponível globalmente');
   }
   
   return globalSafetyGates;
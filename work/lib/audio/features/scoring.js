@@ -27,6 +27,10 @@
 // - Não falha se métricas ausentes; ignora e ajusta pesos dinamicamente
 // - Usa tolerâncias da referência sempre que disponível; senão aplica fallbacks sensatos
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:scoring');
+
 // FIXME: Código órfão comentado - precisa ser reorganizado
 // console.log('[COLOR_RATIO_V2_INTERNAL] Contagens:', { total, green, yellow, red });
     
@@ -252,24 +256,24 @@ const CATEGORY_WEIGHTS_LEGACY = {
 
 // 🎯 NOVO SISTEMA DE SCORING: PESOS IGUAIS V3
 function _computeEqualWeightV3(analysisData) {
-  console.log('[EQUAL_WEIGHT_V3] 🎯 Iniciando cálculo com pesos iguais');
-  console.log('[EQUAL_WEIGHT_V3] 📊 analysisData recebido:', analysisData);
+  logger.debug('[EQUAL_WEIGHT_V3] 🎯 Iniciando cálculo com pesos iguais');
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] 📊 analysisData recebido:', analysisData]);
   
   // Validação robusta dos dados de entrada
   if (!analysisData) {
-    console.error('[EQUAL_WEIGHT_V3] ❌ analysisData é null/undefined');
+    logger.error('[EQUAL_WEIGHT_V3] ❌ analysisData é null/undefined');
     return { score: 50, classification: 'Básico', method: 'equal_weight_v3_fallback', error: 'analysisData null' };
   }
   
   const metrics = analysisData.metrics || {};
   const reference = analysisData.reference || {};
   
-  console.log('[EQUAL_WEIGHT_V3] 📊 Metrics keys:', Object.keys(metrics));
-  console.log('[EQUAL_WEIGHT_V3] 📋 Reference keys:', Object.keys(reference));
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] 📊 Metrics keys:', Object.keys(metrics)]);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] 📋 Reference keys:', Object.keys(reference)]);
   
   // Se não tem métricas, retorna fallback
   if (Object.keys(metrics).length === 0) {
-    console.warn('[EQUAL_WEIGHT_V3] ⚠️ Nenhuma métrica disponível, usando fallback');
+    logger.warn('[EQUAL_WEIGHT_V3] ⚠️ Nenhuma métrica disponível, usando fallback');
     return { score: 50, classification: 'Básico', method: 'equal_weight_v3_fallback', error: 'no metrics' };
   }
   
@@ -323,7 +327,7 @@ function _computeEqualWeightV3(analysisData) {
     clippingPct: 0.5
   };
   
-  console.log('[EQUAL_WEIGHT_V3] Valores das métricas:', metricValues);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] Valores das métricas:', metricValues]);
   
   let totalScore = 0;
   let metricCount = 0;
@@ -365,7 +369,7 @@ function _computeEqualWeightV3(analysisData) {
         metricScore: parseFloat(metricScore.toFixed(1))
       });
       
-      console.log(`[EQUAL_WEIGHT_V3] ${key}: ${value} -> ${metricScore.toFixed(1)}% (dev: ${deviationRatio.toFixed(2)}x)`);
+      logger.debug(() => [`[EQUAL_WEIGHT_V3] ${key}: ${value} -> ${metricScore.toFixed(1)}% (dev: ${deviationRatio.toFixed(2)}x)`]);
     }
   }
   
@@ -373,11 +377,11 @@ function _computeEqualWeightV3(analysisData) {
   const finalScore = metricCount > 0 ? totalScore / metricCount : 50; // Fallback para 50% se nenhuma métrica
   const scoreDecimal = parseFloat(finalScore.toFixed(1));
   
-  console.log('[EQUAL_WEIGHT_V3] 📊 Cálculo final:');
-  console.log('[EQUAL_WEIGHT_V3]   - totalScore:', totalScore);
-  console.log('[EQUAL_WEIGHT_V3]   - metricCount:', metricCount);
-  console.log('[EQUAL_WEIGHT_V3]   - finalScore:', finalScore);
-  console.log('[EQUAL_WEIGHT_V3]   - scoreDecimal:', scoreDecimal);
+  logger.debug('[EQUAL_WEIGHT_V3] 📊 Cálculo final:');
+  logger.debug(() => ['[EQUAL_WEIGHT_V3]   - totalScore:', totalScore]);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3]   - metricCount:', metricCount]);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3]   - finalScore:', finalScore]);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3]   - scoreDecimal:', scoreDecimal]);
   
   // Garantir que o score é válido com múltiplas verificações
   let validScore = Number.isFinite(scoreDecimal) ? scoreDecimal : 50;
@@ -387,7 +391,7 @@ function _computeEqualWeightV3(analysisData) {
   if (validScore > 100) validScore = 100;
   if (isNaN(validScore)) validScore = 50;
   
-  console.log('[EQUAL_WEIGHT_V3] 📊 Score validado:', validScore);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] 📊 Score validado:', validScore]);
   
   // Classificação otimizada
   let classification = 'Básico';
@@ -395,7 +399,7 @@ function _computeEqualWeightV3(analysisData) {
   else if (validScore >= 70) classification = 'Avançado';
   else if (validScore >= 55) classification = 'Intermediário';
   
-  console.log('[EQUAL_WEIGHT_V3] 🏷️ Classificação:', classification);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] 🏷️ Classificação:', classification]);
   
   const result = {
     score: validScore,
@@ -416,12 +420,12 @@ function _computeEqualWeightV3(analysisData) {
     }
   };
   
-  console.log('[EQUAL_WEIGHT_V3] ✅ Resultado final completo:', result);
-  console.log('[EQUAL_WEIGHT_V3] ✅ Score verificação final:', Number.isFinite(result.score));
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] ✅ Resultado final completo:', result]);
+  logger.debug(() => ['[EQUAL_WEIGHT_V3] ✅ Score verificação final:', Number.isFinite(result.score)]);
   
   // Garantia absoluta de que nunca retorna null
   if (!result || !Number.isFinite(result.score)) {
-    console.error('[EQUAL_WEIGHT_V3] ❌ ERRO CRÍTICO: Resultado inválido, forçando fallback');
+    logger.error('[EQUAL_WEIGHT_V3] ❌ ERRO CRÍTICO: Resultado inválido, forçando fallback');
     return {
       score: 50,
       classification: 'Básico',
@@ -434,8 +438,8 @@ function _computeEqualWeightV3(analysisData) {
 }
 
 function _computeMixScoreInternal(technicalData = {}, reference = null, force = { AUDIT_MODE:false, SCORING_V2:false, AUTO_V2:true }) {
-  console.log('[SCORING_INTERNAL] 🚀 _computeMixScoreInternal iniciado');
-  console.log('[SCORING_INTERNAL] 📊 Flags recebidas:', force);
+  logger.debug('[SCORING_INTERNAL] 🚀 _computeMixScoreInternal iniciado');
+  logger.debug(() => ['[SCORING_INTERNAL] 📊 Flags recebidas:', force]);
   
   const __caiarLog = (typeof window !== 'undefined' && window.__caiarLog) ? window.__caiarLog : function(){};
   __caiarLog('SCORING_START','Iniciando cálculo de mix score', { metrics: Object.keys(technicalData||{}).length, ref: !!reference, modeFlags: force });
@@ -453,7 +457,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
     )) {
       SCORING_V2 = true;
       force._autoPromoted = true;
-      console.log('🏆 AUTO-PROMOÇÃO SCORING_V2: TT-DR detectado!');
+      logger.debug('🏆 AUTO-PROMOÇÃO SCORING_V2: TT-DR detectado!');
     }
   }
   const ref = reference;
@@ -471,7 +475,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
     if (opts.target_range && typeof opts.target_range === 'object') {
       // Sistema de intervalos: qualquer valor dentro do range = score máximo
       s = scoreToleranceRange(value, opts.target_range, target, tol);
-      console.log(`[SCORING_RANGE] ${key}: valor=${value}, range=[${opts.target_range.min}, ${opts.target_range.max}], score=${s?.toFixed(3)}`);
+      logger.debug(() => [`[SCORING_RANGE] ${key}: valor=${value}, range=[${opts.target_range.min}, ${opts.target_range.max}], score=${s?.toFixed(3)}`]);
     } else {
       // Sistema antigo: target fixo + tolerância
       const tolMin = Number.isFinite(opts.tolMin) && opts.tolMin > 0 ? opts.tolMin : null;
@@ -571,15 +575,15 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
   const lufsTolMax = Number.isFinite(ref?.tol_lufs_max) ? ref.tol_lufs_max : lufsTol;
   
   // 🚨 LOG CRÍTICO: Ver o que está sendo usado no scoring de loudness
-  console.error('\n╔═════════════════════════════════════════════════════════════╗');
-  console.error('║  🎯 SCORING.JS: CALCULANDO LOUDNESS SUBSCORE               ║');
-  console.error('╚═════════════════════════════════════════════════════════════╝');
-  console.error('[SCORING] LUFS medido:', metrics.lufsIntegrated);
-  console.error('[SCORING] LUFS TARGET usado:', lufsTarget);
-  console.error('[SCORING] ref?.lufs_target:', ref?.lufs_target);
-  console.error('[SCORING] DEFAULT usado?', !ref?.lufs_target);
-  console.error('[SCORING] Tolerância:', { lufsTolMin, lufsTolMax, avg: (lufsTolMin + lufsTolMax)/2 });
-  console.error('\n');
+  logger.error('\n╔═════════════════════════════════════════════════════════════╗');
+  logger.error('║  🎯 SCORING.JS: CALCULANDO LOUDNESS SUBSCORE               ║');
+  logger.error('╚═════════════════════════════════════════════════════════════╝');
+  logger.error('[SCORING] LUFS medido:', metrics.lufsIntegrated);
+  logger.error('[SCORING] LUFS TARGET usado:', lufsTarget);
+  logger.error('[SCORING] ref?.lufs_target:', ref?.lufs_target);
+  logger.error('[SCORING] DEFAULT usado?', !ref?.lufs_target);
+  logger.error('[SCORING] Tolerância:', { lufsTolMin, lufsTolMax, avg: (lufsTolMin + lufsTolMax)/2 });
+  logger.error('\n');
   
   addMetric('loudness', 'lufsIntegrated', metrics.lufsIntegrated, lufsTarget, (lufsTolMin + lufsTolMax)/2, { tolMin: lufsTolMin, tolMax: lufsTolMax });
   
@@ -614,7 +618,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
       // targets podem ter 'presenca'/'brilho' mas bandEnergies tem 'presence'/'air'
       const mBand = getBandWithAlias(metrics.bandEnergies, band);
       if (!mBand) {
-        console.log(`[SCORING_BAND_ALIAS] ⚠️ Banda ${band} não encontrada em bandEnergies (tentou aliases)`);
+        logger.debug(() => [`[SCORING_BAND_ALIAS] ⚠️ Banda ${band} não encontrada em bandEnergies (tentou aliases)`]);
         continue;
       }
       const val = Number.isFinite(mBand.rms_db) ? mBand.rms_db : null;
@@ -622,7 +626,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
       
       // 🔧 Normalizar nome da banda para penalties (usar formato canônico EN)
       const canonicalBand = normalizeBandKey(band);
-      console.log(`[SCORING_BAND_ALIAS] ✅ Banda ${band} → ${canonicalBand}, valor=${val}`);
+      logger.debug(() => [`[SCORING_BAND_ALIAS] ✅ Banda ${band} → ${canonicalBand}, valor=${val}`]);
       
       // 🎯 NOVA LÓGICA: Suporte a target_range para bandas espectrais
       // Prioridade: target_range > target_db (fallback)
@@ -639,7 +643,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
           tolMax: null 
         });
         
-        console.log(`[SCORING_BAND_RANGE] ${canonicalBand}: valor=${val}, range=[${refBand.target_range.min}, ${refBand.target_range.max}], target_fallback=${target}, tol=${tol}`);
+        logger.debug(() => [`[SCORING_BAND_RANGE] ${canonicalBand}: valor=${val}, range=[${refBand.target_range.min}, ${refBand.target_range.max}], target_fallback=${target}, tol=${tol}`]);
         
       } else if (Number.isFinite(refBand?.target_db) && (Number.isFinite(refBand?.tol_db) || (Number.isFinite(refBand?.tol_min) && Number.isFinite(refBand?.tol_max))) && refBand.target_db != null) {
         
@@ -650,7 +654,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
         
         addMetric('tonal', `band_${canonicalBand}`, val, refBand.target_db, tolAvg, { tolMin, tolMax });
         
-        console.log(`[SCORING_BAND_FIXED] ${canonicalBand}: valor=${val}, target=${refBand.target_db}, tol=${tolAvg}`);
+        logger.debug(() => [`[SCORING_BAND_FIXED] ${canonicalBand}: valor=${val}, target=${refBand.target_db}, tol=${tolAvg}`]);
       }
     }
   } else if (metrics.tonalBalance) {
@@ -807,20 +811,20 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
   // 🔥 FORÇAR NOVO SISTEMA: DESABILITAR COLOR_RATIO_V2 PARA USAR EQUAL_WEIGHT_V3
   const colorRatioEnabled = (() => {
     // FORÇAR DESABILITAÇÃO do color_ratio_v2 para usar equal_weight_v3
-    console.log('[EQUAL_WEIGHT_V3] ⚡ Sistema antigo color_ratio_v2 DESABILITADO - usando novo sistema');
-    console.log('[EQUAL_WEIGHT_V3] 🎯 Retornando FALSE para forçar novo sistema');
+    logger.debug('[EQUAL_WEIGHT_V3] ⚡ Sistema antigo color_ratio_v2 DESABILITADO - usando novo sistema');
+    logger.debug('[EQUAL_WEIGHT_V3] 🎯 Retornando FALSE para forçar novo sistema');
     return false; // ⭐ FORÇA USO DO NOVO SISTEMA
   })();
   
-  console.log('[SCORING_INTERNAL] 🎯 colorRatioEnabled resultado:', colorRatioEnabled);
+  logger.debug(() => ['[SCORING_INTERNAL] 🎯 colorRatioEnabled resultado:', colorRatioEnabled]);
   
   if (colorRatioEnabled) {
     try {
   // 🎯 NOVO SISTEMA: PESO IGUAL PARA TODAS AS MÉTRICAS
-  console.log('[NEW_EQUAL_WEIGHT_SCORING] Iniciando cálculo com pesos iguais');
+  logger.debug('[NEW_EQUAL_WEIGHT_SCORING] Iniciando cálculo com pesos iguais');
   
   if (perMetric.length === 0) {
-    console.warn('[NEW_EQUAL_WEIGHT_SCORING] Nenhuma métrica disponível');
+    logger.warn('[NEW_EQUAL_WEIGHT_SCORING] Nenhuma métrica disponível');
     throw new Error('Nenhuma métrica processada');
   }
   
@@ -861,7 +865,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
   const totalMetrics = metricScores.length;
   const equalWeight = 100 / totalMetrics;
   
-  console.log(`[NEW_EQUAL_WEIGHT_SCORING] ${totalMetrics} métricas, peso cada: ${equalWeight.toFixed(2)}%`);
+  logger.debug(() => [`[NEW_EQUAL_WEIGHT_SCORING] ${totalMetrics} métricas, peso cada: ${equalWeight.toFixed(2)}%`]);
   
   // 🎯 SCORE FINAL COM DECIMAIS REALÍSTICOS
   const rawScore = metricScores.reduce((sum, metric) => {
@@ -871,7 +875,7 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
   // 🔥 PRESERVAR DECIMAIS: Usar 1 casa decimal para realismo
   const finalScore = parseFloat(rawScore.toFixed(1));
   
-  console.log(`[NEW_EQUAL_WEIGHT_SCORING] Score final: ${finalScore}% (era ${Math.round(rawScore)}%)`);
+  logger.debug(() => [`[NEW_EQUAL_WEIGHT_SCORING] Score final: ${finalScore}% (era ${Math.round(rawScore)}%)`]);
   
   // Manter compatibilidade com sistema de cores para interface
   const total = perMetric.length;
@@ -930,12 +934,12 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
   }
   } else {
     // 🎯 NOVO SISTEMA EQUAL_WEIGHT_V3 ATIVADO!
-    console.log('[EQUAL_WEIGHT_V3] Color ratio v2 desabilitado - usando novo sistema de pesos iguais');
+    logger.debug('[EQUAL_WEIGHT_V3] Color ratio v2 desabilitado - usando novo sistema de pesos iguais');
     
     try {
       // 🔧 CORREÇÃO: Preparar dados corretamente com validação robusta
-      console.log('[EQUAL_WEIGHT_V3] 📊 technicalData keys:', Object.keys(technicalData || {}));
-      console.log('[EQUAL_WEIGHT_V3] 📋 reference:', reference);
+      logger.debug(() => ['[EQUAL_WEIGHT_V3] 📊 technicalData keys:', Object.keys(technicalData || {})]);
+      logger.debug(() => ['[EQUAL_WEIGHT_V3] 📋 reference:', reference]);
       
       // Garantir que technicalData não é null/undefined
       const safeMetrics = technicalData || {};
@@ -947,17 +951,17 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
         runId: safeMetrics.runId || 'scoring-' + Date.now()
       };
       
-      console.log('[EQUAL_WEIGHT_V3] 🎯 Chamando _computeEqualWeightV3 com:', analysisData);
+      logger.debug(() => ['[EQUAL_WEIGHT_V3] 🎯 Chamando _computeEqualWeightV3 com:', analysisData]);
       
       const equalWeightResult = _computeEqualWeightV3(analysisData);
       
-      console.log('[EQUAL_WEIGHT_V3] 📊 Resultado bruto:', equalWeightResult);
+      logger.debug(() => ['[EQUAL_WEIGHT_V3] 📊 Resultado bruto:', equalWeightResult]);
       
       // Verificar se o resultado é válido com logs detalhados
       if (equalWeightResult) {
-        console.log('[EQUAL_WEIGHT_V3] ✅ Resultado existe');
-        console.log('[EQUAL_WEIGHT_V3] 📊 Score:', equalWeightResult.score);
-        console.log('[EQUAL_WEIGHT_V3] 📊 Score é finite?', Number.isFinite(equalWeightResult.score));
+        logger.debug('[EQUAL_WEIGHT_V3] ✅ Resultado existe');
+        logger.debug(() => ['[EQUAL_WEIGHT_V3] 📊 Score:', equalWeightResult.score]);
+        logger.debug(() => ['[EQUAL_WEIGHT_V3] 📊 Score é finite?', Number.isFinite(equalWeightResult.score)]);
         
         if (Number.isFinite(equalWeightResult.score)) {
           result.scorePct = parseFloat(equalWeightResult.score.toFixed(1)); // Preservar decimal
@@ -966,19 +970,19 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
           result.classification = equalWeightResult.classification;
           result.equalWeightDetails = equalWeightResult.details;
           
-          console.log('[EQUAL_WEIGHT_V3] ✅ Score calculado:', result.scorePct + '%', 'Classificação:', result.classification);
+          logger.debug(() => ['[EQUAL_WEIGHT_V3] ✅ Score calculado:', result.scorePct + '%', 'Classificação:', result.classification]);
         } else {
-          console.error('[EQUAL_WEIGHT_V3] ❌ Score não é finite:', equalWeightResult.score);
+          logger.error('[EQUAL_WEIGHT_V3] ❌ Score não é finite:', equalWeightResult.score);
           throw new Error('Score não é finite: ' + equalWeightResult.score);
         }
       } else {
-        console.error('[EQUAL_WEIGHT_V3] ❌ Resultado é null/undefined:', equalWeightResult);
+        logger.error('[EQUAL_WEIGHT_V3] ❌ Resultado é null/undefined:', equalWeightResult);
         throw new Error('equalWeightResult é null/undefined');
       }
       
     } catch (error) {
-      console.error('[EQUAL_WEIGHT_V3] ❌ Erro no novo sistema, fallback para advanced:', error);
-      console.error('[EQUAL_WEIGHT_V3] ❌ Stack trace:', error.stack);
+      logger.error('[EQUAL_WEIGHT_V3] ❌ Erro no novo sistema, fallback para advanced:', error);
+      logger.error('[EQUAL_WEIGHT_V3] ❌ Stack trace:', error.stack);
       result.scorePct = result.advancedScorePct;
       result.method = 'advanced_fallback';
       result.scoringMethod = 'advanced_fallback';
@@ -1001,8 +1005,8 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
       window.__LAST_MIX_SCORE = result;
       if (window.DEBUG_SCORE === true) {
         // Log compacto + detalhado em grupo
-        console.log('[MIX_SCORE]', result.scorePct + '%', 'mode=' + result.scoreMode, 'class=' + result.classification);
-        if (window.DEBUG_SCORE_VERBOSE) console.log('[MIX_SCORE_FULL]', result);
+        logger.debug(() => ['[MIX_SCORE]', result.scorePct + '%', 'mode=' + result.scoreMode, 'class=' + result.classification]);
+        if (window.DEBUG_SCORE_VERBOSE) logger.debug(() => ['[MIX_SCORE_FULL]', result]);
       }
     }
   } catch {}
@@ -1010,16 +1014,16 @@ function _computeMixScoreInternal(technicalData = {}, reference = null, force =
 }
 
 function computeMixScore(technicalData = {}, reference = null) {
-  console.log('[SCORING_ENTRY] 🎯 computeMixScore chamado com:', {
+  logger.debug(() => ['[SCORING_ENTRY] 🎯 computeMixScore chamado com:', {
     metricas: Object.keys(technicalData || {}),
     hasReference: !!reference,
     timestamp: Date.now(),
     technicalDataSample: technicalData
-  });
+  }]);
   
   // 🚨 DIAGNÓSTICO CRÍTICO - Verificar se dados são válidos
   if (!technicalData || typeof technicalData !== 'object') {
-    console.error('[SCORING_ENTRY] ❌ technicalData inválido:', technicalData);
+    logger.error('[SCORING_ENTRY] ❌ technicalData inválido:', technicalData);
     return {
       scorePct: 50,
       classification: 'Básico',
@@ -1036,22 +1040,22 @@ function computeMixScore(technicalData = {}, reference = null) {
   const overrideAuditBypass = win.FORCE_SCORING_V2 === true; // permite V2 mesmo sem AUDIT_MODE
   const SCORING_V2 = (!explicitLegacy) && (explicitV2 || (AUDIT_MODE && win.SCORING_V2 !== false) || overrideAuditBypass);
   
-  console.log('[SCORING_ENTRY] 🔧 Flags calculadas:', {
+  logger.debug(() => ['[SCORING_ENTRY] 🔧 Flags calculadas:', {
     AUDIT_MODE,
     SCORING_V2,
     AUTO_V2,
     overrideAuditBypass,
     explicitV2,
     explicitLegacy
-  });
+  }]);
   
   // 🚨 GARANTIA: Sempre tenta _computeMixScoreInternal
   let result;
   try {
     result = _computeMixScoreInternal(technicalData, reference, { AUDIT_MODE, SCORING_V2, AUTO_V2, overrideAuditBypass });
-    console.log('[SCORING_ENTRY] ✅ _computeMixScoreInternal sucesso:', result);
+    logger.debug(() => ['[SCORING_ENTRY] ✅ _computeMixScoreInternal sucesso:', result]);
   } catch (error) {
-    console.error('[SCORING_ENTRY] ❌ Erro em _computeMixScoreInternal:', error);
+    logger.error('[SCORING_ENTRY] ❌ Erro em _computeMixScoreInternal:', error);
     result = {
       scorePct: 50,
       classification: 'Básico',
@@ -1062,7 +1066,7 @@ function computeMixScore(technicalData = {}, reference = null) {
   
   // 🚨 VALIDAÇÃO FINAL ABSOLUTA
   if (!result) {
-    console.error('[SCORING_ENTRY] ❌ Result é null/undefined!');
+    logger.error('[SCORING_ENTRY] ❌ Result é null/undefined!');
     result = {
       scorePct: 50,
       classification: 'Básico',
@@ -1071,17 +1075,17 @@ function computeMixScore(technicalData = {}, reference = null) {
   }
   
   if (!Number.isFinite(result.scorePct)) {
-    console.error('[SCORING_ENTRY] ❌ scorePct inválido:', result.scorePct);
+    logger.error('[SCORING_ENTRY] ❌ scorePct inválido:', result.scorePct);
     result.scorePct = 50;
     result.classification = 'Básico';
     result.method = 'invalid_score_fallback';
   }
   
-  console.log('[SCORING_ENTRY] 📊 Resultado final garantido:', {
+  logger.debug(() => ['[SCORING_ENTRY] 📊 Resultado final garantido:', {
     score: result.scorePct,
     method: result.method,
     classification: result.classification
-  });
+  }]);
   
   return result;
 }
@@ -1108,7 +1112,7 @@ try {
     
     // FUNÇÃO DE DIAGNÓSTICO COMPLETO
     window.__DIAGNOSE_SCORE_ISSUE = function() {
-      console.log('🔍 DIAGNÓSTICO COMPLETO DO SCORE...');
+      logger.debug('🔍 DIAGNÓSTICO COMPLETO DO SCORE...');
       
       // Testar função interna diretamente
       const testData = {
@@ -1155,34 +1159,34 @@ try {
         }
       };
       
-      console.log('📊 Testando internamente _computeMixScoreInternal...');
+      logger.debug('📊 Testando internamente _computeMixScoreInternal...');
       const result = _computeMixScoreInternal(testData, testRef, { AUDIT_MODE: true, SCORING_V2: true });
       
-      console.log('📈 RESULTADO DO TESTE:');
-      console.log('  Score:', result.scorePct + '%');
-      console.log('  Método:', result.method);
-      console.log('  Color counts:', result.colorCounts);
-      console.log('  Weights:', result.weights);
-      console.log('  Yellow keys:', result.yellowKeys);
-      console.log('  Denominador info:', result.denominator_info);
+      logger.debug('📈 RESULTADO DO TESTE:');
+      logger.debug(() => ['  Score:', result.scorePct + '%']);
+      logger.debug(() => ['  Método:', result.method]);
+      logger.debug(() => ['  Color counts:', result.colorCounts]);
+      logger.debug(() => ['  Weights:', result.weights]);
+      logger.debug(() => ['  Yellow keys:', result.yellowKeys]);
+      logger.debug(() => ['  Denominador info:', result.denominator_info]);
       
       // Validar se está usando color_ratio_v2
       if (result.method !== 'color_ratio_v2') {
-        console.error('❌ PROBLEMA: Não está usando color_ratio_v2!');
-        console.log('Fallback info:', result.fallback_used, result._colorRatioError);
+        logger.error('❌ PROBLEMA: Não está usando color_ratio_v2!');
+        logger.debug(() => ['Fallback info:', result.fallback_used, result._colorRatioError]);
       }
       
       // Validar contagem
       const expectedScore = Math.round(100 * (5*1.0 + 4*0.5 + 3*0.0) / 12); // = 58
-      console.log('✅ Score esperado:', expectedScore + '%');
-      console.log('✅ Score obtido:', result.scorePct + '%');
-      console.log('✅ Match:', result.scorePct === expectedScore ? '✓' : '✗');
+      logger.debug(() => ['✅ Score esperado:', expectedScore + '%']);
+      logger.debug(() => ['✅ Score obtido:', result.scorePct + '%']);
+      logger.debug(() => ['✅ Match:', result.scorePct === expectedScore ? '✓' : '✗']);
       
       // Diagnóstico das métricas
-      console.log('� BREAKDOWN POR MÉTRICA:');
+      logger.debug('� BREAKDOWN POR MÉTRICA:');
       result.perMetric.forEach(m => {
         const color = m.status === 'OK' ? '🟢' : (m.severity === 'leve' ? '🟡' : '🔴');
-        console.log(`  ${color} ${m.key}: ${m.value} vs ${m.target}±${m.tol} → status:${m.status}, severity:${m.severity}, n:${m.n}`);
+        logger.debug(() => [`  ${color} ${m.key}: ${m.value} vs ${m.target}±${m.tol} → status:${m.status}, severity:${m.severity}, n:${m.n}`]);
       });
       
       return result;
@@ -1192,23 +1196,23 @@ try {
     window.__PRINT_LAST_MIX_SCORE = function() {
       const score = window.__LAST_MIX_SCORE;
       if (!score) {
-        console.log('❌ Nenhum __LAST_MIX_SCORE disponível');
+        logger.debug('❌ Nenhum __LAST_MIX_SCORE disponível');
         return;
       }
       
-      console.log('🎯 ÚLTIMO MIX SCORE:');
-      console.log('  Método:', score.method || score.scoringMethod);
-      console.log('  Score:', score.scorePct + '%');
-      console.log('  Cores:', score.colorCounts);
-      console.log('  Amarelos:', score.yellowKeys);
-      console.log('  Pesos:', score.weights);
+      logger.debug('🎯 ÚLTIMO MIX SCORE:');
+      logger.debug(() => ['  Método:', score.method || score.scoringMethod]);
+      logger.debug(() => ['  Score:', score.scorePct + '%']);
+      logger.debug(() => ['  Cores:', score.colorCounts]);
+      logger.debug(() => ['  Amarelos:', score.yellowKeys]);
+      logger.debug(() => ['  Pesos:', score.weights]);
       
       return score;
     };
     
     // TESTES OBRIGATÓRIOS PARA VALIDAÇÃO COLOR_RATIO_V2
     window.__TEST_COLOR_RATIO_V2 = function() {
-      console.log('🧪 TESTES OBRIGATÓRIOS COLOR_RATIO_V2...');
+      logger.debug('🧪 TESTES OBRIGATÓRIOS COLOR_RATIO_V2...');
       
       // Função helper para criar mock de perMetric
       const createMockData = (greenCount, yellowCount, redCount) => {
@@ -1254,19 +1258,19 @@ try {
       const { mockData: dataA, mockRef: refA } = createMockData(7, 0, 7);
       const resultA = _computeMixScoreInternal(dataA, refA, { AUDIT_MODE: true, SCORING_V2: true });
       const expectedA = Math.round(100 * (7 * 1.0 + 0 * 0.5 + 7 * 0.0) / 14); // = 50
-      console.log(`✅ Caso A: G=7, Y=0, R=7, T=14 → Expected: ${expectedA}, Got: ${resultA.scorePct}`, resultA.colorCounts);
+      logger.debug(() => [`✅ Caso A: G=7, Y=0, R=7, T=14 → Expected: ${expectedA}, Got: ${resultA.scorePct}`, resultA.colorCounts]);
       
       // Caso B: G=5, Y=0, R=9, T=14 → mixScorePct = 36
       const { mockData: dataB, mockRef: refB } = createMockData(5, 0, 9);
       const resultB = _computeMixScoreInternal(dataB, refB, { AUDIT_MODE: true, SCORING_V2: true });
       const expectedB = Math.round(100 * (5 * 1.0 + 0 * 0.5 + 9 * 0.0) / 14); // = 36
-      console.log(`✅ Caso B: G=5, Y=0, R=9, T=14 → Expected: ${expectedB}, Got: ${resultB.scorePct}`, resultB.colorCounts);
+      logger.debug(() => [`✅ Caso B: G=5, Y=0, R=9, T=14 → Expected: ${expectedB}, Got: ${resultB.scorePct}`, resultB.colorCounts]);
       
       // Caso C: G=5, Y=4, R=3, T=12 → mixScorePct = round(100*((5 + 0.5*4)/12)) = 58
       const { mockData: dataC, mockRef: refC } = createMockData(5, 4, 3);
       const resultC = _computeMixScoreInternal(dataC, refC, { AUDIT_MODE: true, SCORING_V2: true });
       const expectedC = Math.round(100 * (5 * 1.0 + 4 * 0.5 + 3 * 0.0) / 12); // = 58
-      console.log(`✅ Caso C: G=5, Y=4, R=3, T=12 → Expected: ${expectedC}, Got: ${resultC.scorePct}`, resultC.colorCounts);
+      logger.debug(() => [`✅ Caso C: G=5, Y=4, R=3, T=12 → Expected: ${expectedC}, Got: ${resultC.scorePct}`, resultC.colorCounts]);
       
       // Validações
       const tests = [
@@ -1283,21 +1287,21 @@ try {
         const methodMatch = test.result.method === 'color_ratio_v2';
         
         if (!scoreMatch || !countsMatch || !denominatorMatch || !methodMatch) {
-          console.error(`❌ ${test.name} FALHOU:`, {
+          logger.error(`❌ ${test.name} FALHOU:`, {
             scoreMatch, countsMatch, denominatorMatch, methodMatch,
             expected: test.expected, got: test.result.scorePct,
             expectedCounts: test.counts, gotCounts: test.result.colorCounts
           });
           allPassed = false;
         } else {
-          console.log(`✅ ${test.name} PASSOU`);
+          logger.debug(() => [`✅ ${test.name} PASSOU`]);
         }
       });
       
       if (allPassed) {
-        console.log('🎉 TODOS OS TESTES PASSARAM! Color ratio v2 funcionando corretamente.');
+        logger.debug('🎉 TODOS OS TESTES PASSARAM! Color ratio v2 funcionando corretamente.');
       } else {
-        console.error('❌ Alguns testes falharam. Verificar implementação.');
+        logger.error('❌ Alguns testes falharam. Verificar implementação.');
       }
       
       return { resultA, resultB, resultC, allPassed };
@@ -1307,7 +1311,7 @@ try {
 
 if (typeof window !== 'undefined') { 
   window.__MIX_SCORING_VERSION__ = '2.0.0-equal-weight-v3-FORCED'; 
-  console.log('🎯 NOVO SISTEMA CARREGADO - Versão:', window.__MIX_SCORING_VERSION__);
+  logger.debug(() => ['🎯 NOVO SISTEMA CARREGADO - Versão:', window.__MIX_SCORING_VERSION__]);
 }
 
 // Export das funções principais
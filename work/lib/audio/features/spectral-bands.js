@@ -1,7 +1,10 @@
 // 🌈 SPECTRAL BANDS CORRECTED - 7 Bandas Profissionais
 // Sub, Bass, Low-Mid, Mid, High-Mid, Presence, Air com soma ≈ 100%
 
-import { logAudio, makeErr } from '../error-handling.js';
+import { logAudio, logAudioFrame, makeErr } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:spectral-bands');
 
 /**
  * 🎯 Definição das 7 bandas espectrais profissionais
@@ -117,9 +120,9 @@ export class SpectralBandsCalculator {
     
     // Validar energia total
     if (totalEnergy < SPECTRAL_CONFIG.MIN_ENERGY_THRESHOLD) {
-      logAudio('spectral_bands', 'insufficient_energy', { 
+      logAudioFrame('spectral_bands', 'insufficient_energy', () => ({ 
         totalEnergy: totalEnergy.toExponential(3) 
-      });
+      }));
       return null;
     }
     
@@ -201,7 +204,7 @@ export class SpectralBandsCalculator {
       // Calcular energias das bandas
       const energyResult = this.calculateBandEnergies(magnitude);
       if (!energyResult) {
-        console.error(`❌ [SPECTRAL_CRITICAL] calculateBandEnergies FALHOU Frame ${frameIndex}`);
+        logger.error(`❌ [SPECTRAL_CRITICAL] calculateBandEnergies FALHOU Frame ${frameIndex}`);
         return this.getNullBands();
       }
       
@@ -228,7 +231,7 @@ export class SpectralBandsCalculator {
         
         // Clamp de segurança (deve ser sempre ≤ 0)
         if (energyDb > 0) {
-          console.warn(`[SPECTRAL_BANDS] ${band.name}: dB positivo detectado (${energyDb.toFixed(1)}), clamping para 0`);
+          logger.warn(`[SPECTRAL_BANDS] ${band.name}: dB positivo detectado (${energyDb.toFixed(1)}), clamping para 0`);
           energyDb = 0;
         }
         
@@ -255,7 +258,7 @@ export class SpectralBandsCalculator {
       const isValid = Math.abs(totalPercentage - 100) < 0.1; // Tolerância de 0.1%
 
       // Log para auditoria
-      logAudio('spectral_bands', 'calculated', {
+      logAudioFrame('spectral_bands', 'calculated', () => ({
         frame: frameIndex,
         totalEnergy: totalEnergy.toExponential(3),
         totalPercentage: totalPercentage.toFixed(1),
@@ -264,7 +267,7 @@ export class SpectralBandsCalculator {
         mid: result.mid.percentage + '% (' + result.mid.energy_db + 'dB)',
         presence: result.presence.percentage + '% (' + result.presence.energy_db + 'dB)',
         air: result.air.percentage + '% (' + result.air.energy_db + 'dB)'
-      });
+      }));
       
       const finalResult = {
         bands: result,
@@ -275,11 +278,11 @@ export class SpectralBandsCalculator {
       };
       
       if (frameIndex < 3) {
-        console.log(`✅ [SPECTRAL_CRITICAL] Frame ${frameIndex} calculado:`, {
+        logger.trace(() => [`✅ [SPECTRAL_CRITICAL] Frame ${frameIndex} calculado:`, {
           totalPercentage: finalResult.totalPercentage,
           valid: finalResult.valid,
           sub: result.sub.percentage
-        });
+        }]);
       }
       
       return finalResult;
@@ -329,30 +332,30 @@ export class SpectralBandsAggregator {
    * 📊 Agregar resultados de múltiplos frames
    */
   static aggregate(bandsArray) {
-    console.log('🎯 [SPECTRAL_CRITICAL] SpectralBandsAggregator.aggregate ENTRADA:', {
+    logger.debug(() => ['🎯 [SPECTRAL_CRITICAL] SpectralBandsAggregator.aggregate ENTRADA:', {
       hasBandsArray: !!bandsArray,
       bandsArrayLength: bandsArray?.length || 0,
       firstBand: bandsArray?.[0] || null,
       allBandsValid: bandsArray ? bandsArray.map(b => b.valid) : null
-    });
+    }]);
 
     if (!bandsArray || bandsArray.length === 0) {
-      console.error('❌ [SPECTRAL_CRITICAL] aggregate: SEM DADOS DE ENTRADA');
+      logger.error('❌ [SPECTRAL_CRITICAL] aggregate: SEM DADOS DE ENTRADA');
       return new SpectralBandsCalculator().getNullBands();
     }
     
     // Filtrar apenas resultados válidos
     const validBands = bandsArray.filter(b => b.valid);
     
-    console.log('🔍 [SPECTRAL_CRITICAL] aggregate: Filtro de válidos:', {
+    logger.debug(() => ['🔍 [SPECTRAL_CRITICAL] aggregate: Filtro de válidos:', {
       totalBands: bandsArray.length,
       validBands: validBands.length,
       invalidBands: bandsArray.length - validBands.length,
       validSample: validBands[0] || null
-    });
+    }]);
     
     if (validBands.length === 0) {
-      console.error('❌ [SPECTRAL_CRITICAL] aggregate: NENHUMA BANDA VÁLIDA');
+      logger.error('❌ [SPECTRAL_CRITICAL] aggregate: NENHUMA BANDA VÁLIDA');
       return new SpectralBandsCalculator().getNullBands();
     }
     
@@ -378,7 +381,78 @@ export class SpectralBandsAggregator {
       }
     }
     
-    // ETAPA 2: Calcular % global a partir das energias agregadas
+    // ETAPA 2: Agregar dB por banda (mediana)
+    const medianEnergyDbs = {};
+    for (const key of bandKeys) {
+      const energyDbs = validBands
+        .map(b => b.bands[key].energy_db)
+        .filter(db => db !== null && isFinite(db))
+        .sort((a, b) => a - b);
+      
+      let medianEnergyDb = null;
+      if (energyDbs.length > 0) {
+        const medianDbIndex = Math.floor(energyDbs.length / 2);
+        medianEnergyDb = energyDbs.length % 2 === 0
+          ? (energyDbs[medianDbIndex - 1] + energyDbs[medianDbIndex]) / 2
+          : energyDbs[medianDbIndex];
+      }
+      medianEnergyDbs[key] = medianEnergyDb;
+    }
+    
+    return this.finalize(aggregatedEnergies, medianEnergyDbs, validBands.length, bandsArray.length);
+  }
+  
+  /**
+   * ⚡ Agregar a partir das séries do SpectralBatchAnalyzer (spectral-batch.js)
+   * Mesmas regras de aggregate(): mediana das energias lineares e do energy_db por frame.
+   */
+  static aggregateBatch(series) {
+    const { numFrames, numBands, bandMap, bandEnergies, totalEnergy, frameValid } = series;
+    const validFrames = [];
+    for (let f = 0; f < numFrames; f++) {
+      if (frameValid[f] && totalEnergy[f] >= SPECTRAL_CONFIG.MIN_ENERGY_THRESHOLD) validFrames.push(f);
+    }
+    
+    if (validFrames.length === 0) {
+      logger.error('❌ [SPECTRAL_CRITICAL] aggregateBatch: NENHUM FRAME VÁLIDO');
+      return new SpectralBandsCalculator().getNullBands();
+    }
+    
+    const aggregatedEnergies = {};
+    const medianEnergyDbs = {};
+    const energies = new Float64Array(validFrames.length);
+    const energyDbs = new Float64Array(validFrames.length);
+    
+    bandMap.keys.forEach((key, b) => {
+      let energyCount = 0;
+      let dbCount = 0;
+      
+      for (const f of validFrames) {
+        const energy = bandEnergies[f * numBands + b];
+        if (isFinite(energy) && energy > 0) energies[energyCount++] = energy;
+        
+        // energy_db por frame idêntico ao analyzeBands (clamp ≤ 0, null abaixo de -80)
+        const bandRMS = energy > 0 ? Math.sqrt(energy / bandMap.binCount[b]) : 1e-12;
+        let energyDb = -40 + 10 * Math.log10(Math.max(bandRMS, 1e-12));
+        if (energyDb > 0) energyDb = 0;
+        if (energyDb >= -80) energyDbs[dbCount++] = Number(energyDb.toFixed(1));
+      }
+      
+      aggregatedEnergies[key] = energyCount > 0 ? median(energies.subarray(0, energyCount).sort()) : 0;
+      medianEnergyDbs[key] = dbCount > 0 ? median(energyDbs.subarray(0, dbCount).sort()) : null;
+    });
+    
+    return this.finalize(aggregatedEnergies, medianEnergyDbs, validFrames.length, numFrames);
+  }
+  
+  /**
+   * 🧩 Percentuais globais + montagem do resultado agregado
+   */
+  static finalize(aggregatedEnergies, medianEnergyDbs, framesValid, framesTotal) {
+    const aggregated = {};
+    const bandKeys = Object.keys(SPECTRAL_BANDS);
+    
+    // ETAPA 3: Calcular % global a partir das energias agregadas
     const totalAggEnergy = Object.values(aggregatedEnergies).reduce((sum, e) => sum + e, 0);
     const aggregatedPercentages = {};
     
@@ -392,20 +466,8 @@ export class SpectralBandsAggregator {
       }
     }
     
-    // ETAPA 3: Agregar dB por banda (mediana)
     for (const key of bandKeys) {
-      const energyDbs = validBands
-        .map(b => b.bands[key].energy_db)
-        .filter(db => db !== null && isFinite(db))
-        .sort((a, b) => a - b);
-      
-      let medianEnergyDb = null;
-      if (energyDbs.length > 0) {
-        const medianDbIndex = Math.floor(energyDbs.length / 2);
-        medianEnergyDb = energyDbs.length % 2 === 0
-          ? (energyDbs[medianDbIndex - 1] + energyDbs[medianDbIndex]) / 2
-          : energyDbs[medianDbIndex];
-      }
+      const medianEnergyDb = medianEnergyDbs[key];
       
       aggregated[key] = {
         energy: aggregatedEnergies[key],
@@ -424,11 +486,11 @@ export class SpectralBandsAggregator {
     
     // 🚨 SANITY CHECK: Validar soma de percentuais
     if (totalPercentage < 99 || totalPercentage > 101) {
-      console.warn('[SPECTRAL_BANDS] ⚠️ Soma de percentuais fora do esperado:', {
+      logger.warn('[SPECTRAL_BANDS] ⚠️ Soma de percentuais fora do esperado:', {
         totalPercentage: totalPercentage.toFixed(2),
         totalAggEnergy,
-        framesValid: validBands.length,
-        framesTotal: bandsArray.length,
+        framesValid,
+        framesTotal,
         bandPercentages: Object.fromEntries(
           Object.entries(aggregated).map(([k, v]) => [k, v.percentage])
         )
@@ -441,23 +503,33 @@ export class SpectralBandsAggregator {
       totalPercentage: Number(totalPercentage.toFixed(1)),
       algorithm: 'RMS_7_Band_Normalized_Aggregated',
       valid: Math.abs(totalPercentage - 100) < 1.0, // Tolerância maior para agregação
-      framesUsed: validBands.length,
-      processedFrames: validBands.length  // ← CORRIGE: json-output.js busca processedFrames
+      framesUsed: framesValid,
+      processedFrames: framesValid  // ← CORRIGE: json-output.js busca processedFrames
     };
     
-    console.log('🎯 [SPECTRAL_CRITICAL] aggregate RESULTADO FINAL:', {
+    logger.debug(() => ['🎯 [SPECTRAL_CRITICAL] aggregate RESULTADO FINAL:', {
       totalPercentage,
       valid: finalResult.valid,
       framesUsed: finalResult.framesUsed,
       aggregatedKeys: Object.keys(aggregated),
       subPercentage: aggregated.sub?.percentage || null,
       bassPercentage: aggregated.bass?.percentage || null
-    });
+    }]);
     
     return finalResult;
   }
 }
 
+/**
+ * 🎯 Mediana de valores já ordenados
+ */
+function median(sorted) {
+  const medianIndex = Math.floor(sorted.length / 2);
+  return sorted.length % 2 === 0
+    ? (sorted[medianIndex - 1] + sorted[medianIndex]) / 2
+    : sorted[medianIndex];
+}
+
 /**
  * 📦 Função principal de exportação
  */
@@ -466,4 +538,4 @@ export function calculateSpectralBands(leftMagnitude, rightMagnitude, sampleRate
   return calculator.analyzeBands(leftMagnitude, rightMagnitude);
 }
 
-console.log('🌈 Spectral Bands Calculator carregado - 7 bandas profissionais com soma 100%');
\ No newline at end of file
+logger.debug('🌈 Spectral Bands Calculator carregado - 7 bandas profissionais com soma 100%');
\ No newline at end of file
@@ -0,0 +1,320 @@
+// 📦 SPECTRAL BATCH - Análise vetorizada do espectrograma inteiro
+// Uma passada por frame sobre a matriz frames×bins (magnitude RMS estéreo) calcula
+// energia por banda, centróide, rolloff e flatness em typed arrays. As séries por frame
+// alimentam os agregadores existentes (SpectralBandsAggregator / SpectralCentroidAggregator)
+// sem montar um objeto de resultado por frame.
+
+import { logAudio, makeErr } from '../error-handling.js';
+import { SpectralBandsCalculator } from './spectral-bands.js';
+
+/**
+ * 🔧 Configurações do batch (limiares idênticos aos calculadores por frame)
+ */
+const SPECTRAL_BATCH_CONFIG = {
+  CHUNK_FRAMES: 256,              // frames por bloco da matriz (memória limitada ao bloco)
+  BAND_MIN_ENERGY: 1e-12,         // = SpectralBandsCalculator MIN_ENERGY_THRESHOLD
+  CENTROID_MIN_MAGNITUDE: 1e-10,  // = SpectralCentroidCalculator MIN_MAGNITUDE_THRESHOLD
+  CENTROID_MIN_TOTAL: 1e-8,       // = SpectralCentroidCalculator MIN_TOTAL_MAGNITUDE
+  CENTROID_MIN_BINS: 10,
+  FREQUENCY_MIN: 20,
+  FREQUENCY_MAX: 20000,
+  ROLLOFF_THRESHOLD: 0.85,
+  MIN_VALID_ENERGY: 1e-10,
+  EPS: 1e-12,
+  PERCENTILES: [10, 50, 90]
+};
+
+/**
+ * 🗺️ Mapa banda → intervalo de bins (typed arrays, pronto para loops apertados)
+ * @param {Object} bandBins - SpectralBandsCalculator.bandBins
+ * @param {number} numBins - Bins disponíveis por frame
+ * @returns {{ keys: string[], start: Int32Array, end: Int32Array, binCount: Int32Array }}
+ */
+export function buildBandIndexMap(bandBins, numBins) {
+  const keys = Object.keys(bandBins);
+  const start = new Int32Array(keys.length);
+  const end = new Int32Array(keys.length);
+  const binCount = new Int32Array(keys.length);
+
+  keys.forEach((key, b) => {
+    start[b] = bandBins[key].minBin;
+    end[b] = Math.min(bandBins[key].maxBin, numBins - 1); // inclusivo
+    binCount[b] = bandBins[key].binCount;                 // largura nominal (usada no energy_db)
+  });
+
+  return { keys, start, end, binCount };
+}
+
+/**
+ * 📦 Analisador vetorizado do espectrograma
+ */
+export class SpectralBatchAnalyzer {
+
+  constructor(sampleRate = 48000, fftSize = 4096, bandsCalculator = null) {
+    this.sampleRate = sampleRate;
+    this.fftSize = fftSize;
+    this.frequencyResolution = sampleRate / fftSize;
+    this.numBins = Math.floor(fftSize / 2);
+    this.bandMap = buildBandIndexMap(
+      (bandsCalculator || new SpectralBandsCalculator(sampleRate, fftSize)).bandBins,
+      this.numBins
+    );
+
+    this.frequencies = new Float64Array(this.numBins);
+    for (let bin = 0; bin < this.numBins; bin++) {
+      this.frequencies[bin] = bin * this.frequencyResolution;
+    }
+
+    // Faixa audível do centróide como intervalo contíguo de bins (pula DC)
+    this.centroidStartBin = this.numBins;
+    this.centroidEndBin = 0;
+    for (let bin = 1; bin < this.numBins; bin++) {
+      const frequency = this.frequencies[bin];
+      if (frequency >= SPECTRAL_BATCH_CONFIG.FREQUENCY_MIN && frequency <= SPECTRAL_BATCH_CONFIG.FREQUENCY_MAX) {
+        if (bin < this.centroidStartBin) this.centroidStartBin = bin;
+        this.centroidEndBin = bin;
+      }
+    }
+  }
+
+  /**
+   * 🧱 Séries por frame pré-alocadas
+   */
+  allocateSeries(numFrames) {
+    const numBands = this.bandMap.keys.length;
+    return {
+      numFrames,
+      numBands,
+      bandMap: this.bandMap,
+      bandEnergies: new Float64Array(numFrames * numBands), // [frame * numBands + band]
+      totalEnergy: new Float64Array(numFrames),
+      centroidHz: new Float64Array(numFrames),               // NaN = frame inválido
+      rolloffHz: new Float64Array(numFrames),
+      flatness: new Float64Array(numFrames),
+      frameValid: new Uint8Array(numFrames)                  // 0 = frame ausente/sem FFT
+    };
+  }
+
+  /**
+   * ⚡ Analisar uma matriz frames×bins de magnitude RMS estéreo
+   * @param {Float32Array} matrix - Linha por frame, numBins colunas
+   * @param {number} numFrames - Frames presentes na matriz
+   * @param {Object} [series] - Saída de allocateSeries (reaproveitada entre blocos)
+   * @param {number} [frameOffset] - Índice do primeiro frame da matriz nas séries
+   * @returns {Object} series
+   */
+  analyzeMatrix(matrix, numFrames, series = null, frameOffset = 0) {
+    const out = series || this.allocateSeries(numFrames);
+    const numBins = this.numBins;
+    const { start, end } = this.bandMap;
+    const numBands = start.length;
+    const frequencies = this.frequencies;
+    const cStart = this.centroidStartBin;
+    const cEnd = this.centroidEndBin;
+    const cfg = SPECTRAL_BATCH_CONFIG;
+
+    if (matrix.length < numFrames * numBins) {
+      throw makeErr('spectral_batch', `Matriz menor que ${numFrames}×${numBins}`, 'matrix_size_mismatch');
+    }
+
+    for (let f = 0; f < numFrames; f++) {
+      const row = f * numBins;
+      const frame = frameOffset + f;
+
+      // Energia por banda (bins de borda contam nas duas bandas, como em calculateBandEnergies)
+      let bandTotal = 0;
+      for (let b = 0; b < numBands; b++) {
+        let energy = 0;
+        for (let bin = start[b]; bin <= end[b]; bin++) {
+          const mag = matrix[row + bin];
+          energy += mag * mag;
+        }
+        out.bandEnergies[frame * numBands + b] = energy;
+        bandTotal += energy;
+      }
+      out.totalEnergy[frame] = bandTotal;
+
+      // Centróide ponderado por magnitude na faixa audível
+      let weightedSum = 0;
+      let totalMagnitude = 0;
+      let validBins = 0;
+      for (let bin = cStart; bin <= cEnd; bin++) {
+        const mag = matrix[row + bin];
+        if (mag > cfg.CENTROID_MIN_MAGNITUDE) {
+          weightedSum += frequencies[bin] * mag;
+          totalMagnitude += mag;
+          validBins++;
+        }
+      }
+      const centroid = weightedSum / totalMagnitude;
+      out.centroidHz[frame] = (totalMagnitude >= cfg.CENTROID_MIN_TOTAL && validBins >= cfg.CENTROID_MIN_BINS &&
+        isFinite(centroid) && centroid >= cfg.FREQUENCY_MIN && centroid <= cfg.FREQUENCY_MAX) ? centroid : NaN;
+
+      // Energia total, flatness (sem DC) e rolloff 85%
+      let spectrumEnergy = 0;
+      let arithmeticSum = 0;
+      let logSum = 0;
+      let flatBins = 0;
+      for (let bin = 0; bin < numBins; bin++) {
+        const mag2 = matrix[row + bin] * matrix[row + bin];
+        spectrumEnergy += mag2;
+        if (bin > 0 && mag2 > cfg.EPS) {
+          arithmeticSum += mag2;
+          logSum += Math.log(mag2 + cfg.EPS);
+          flatBins++;
+        }
+      }
+
+      if (flatBins > 0) {
+        const flatness = Math.exp(logSum / flatBins) / (arithmeticSum / flatBins + cfg.EPS);
+        out.flatness[frame] = isFinite(flatness) ? Math.min(flatness, 1.0) : NaN;
+      } else {
+        out.flatness[frame] = NaN;
+      }
+
+      if (spectrumEnergy > cfg.MIN_VALID_ENERGY) {
+        const target = cfg.ROLLOFF_THRESHOLD * spectrumEnergy;
+        let cumulative = 0;
+        let rolloff = this.sampleRate / 2;
+        for (let bin = 0; bin < numBins; bin++) {
+          cumulative += matrix[row + bin] * matrix[row + bin];
+          if (cumulative >= target) {
+            rolloff = frequencies[bin];
+            break;
+          }
+        }
+        out.rolloffHz[frame] = rolloff;
+      } else {
+        out.rolloffHz[frame] = NaN;
+      }
+
+      out.frameValid[frame] = 1;
+    }
+
+    return out;
+  }
+
+  /**
+   * 🎞️ Analisar framesFFT da segmentação montando a matriz em blocos
+   * Magnitude combinada = sqrt((L² + R²) / 2) em Float32 (mesma do cálculo por frame)
+   * @param {Object} framesFFT - segmentedAudio.framesFFT ({ left, right, count })
+   * @returns {Object} series + aggregates
+   */
+  analyzeFrames(framesFFT, options = {}) {
+    const startTime = Date.now();
+    const { left, right } = framesFFT || {};
+    const numFrames = Math.min(left?.length || 0, right?.length || 0);
+    if (numFrames === 0) {
+      throw makeErr('spectral_batch', 'Sem frames FFT para análise em lote', 'no_fft_frames');
+    }
+
+    const numBins = this.numBins;
+    const chunkFrames = options.chunkFrames || SPECTRAL_BATCH_CONFIG.CHUNK_FRAMES;
+    const series = this.allocateSeries(numFrames);
+    const matrix = new Float32Array(chunkFrames * numBins);
+    let missingFrames = 0;
+
+    for (let chunkStart = 0; chunkStart < numFrames; chunkStart += chunkFrames) {
+      const chunkSize = Math.min(chunkFrames, numFrames - chunkStart);
+      matrix.fill(0);
+
+      for (let f = 0; f < chunkSize; f++) {
+        const leftMag = left[chunkStart + f]?.magnitude;
+        const rightMag = right[chunkStart + f]?.magnitude;
+        if (!leftMag || !rightMag) {
+          missingFrames++;
+          continue;
+        }
+        const row = f * numBins;
+        const bins = Math.min(numBins, leftMag.length, rightMag.length);
+        for (let bin = 0; bin < bins; bin++) {
+          matrix[row + bin] = Math.sqrt((leftMag[bin] * leftMag[bin] + rightMag[bin] * rightMag[bin]) / 2);
+        }
+      }
+
+      this.analyzeMatrix(matrix, chunkSize, series, chunkStart);
+
+      for (let f = 0; f < chunkSize; f++) {
+        if (!left[chunkStart + f]?.magnitude || !right[chunkStart + f]?.magnitude) {
+          series.frameValid[chunkStart + f] = 0;
+          series.centroidHz[chunkStart + f] = NaN;
+        }
+      }
+    }
+
+    series.missingFrames = missingFrames;
+    series.aggregates = this.aggregate(series, options.percentiles);
+
+    logAudio('spectral_batch', 'completed', {
+      frames: numFrames,
+      missingFrames,
+      bins: numBins,
+      bands: series.numBands,
+      processingTime: Date.now() - startTime,
+      jobId: options.jobId
+    });
+
+    return series;
+  }
+
+  /**
+   * 📊 Agregados das séries (média, min, max e percentis) — custo O(frames log frames) por série
+   */
+  aggregate(series, percentiles = SPECTRAL_BATCH_CONFIG.PERCENTILES) {
+    const bands = {};
+    const values = new Float64Array(series.numFrames);
+
+    series.bandMap.keys.forEach((key, b) => {
+      let count = 0;
+      for (let f = 0; f < series.numFrames; f++) {
+        if (series.frameValid[f] && series.totalEnergy[f] >= SPECTRAL_BATCH_CONFIG.BAND_MIN_ENERGY) {
+          values[count++] = series.bandEnergies[f * series.numBands + b];
+        }
+      }
+      bands[key] = summarizeSeries(values.subarray(0, count), percentiles);
+    });
+
+    return {
+      bands,
+      centroidHz: summarizeSeries(series.centroidHz, percentiles),
+      rolloffHz: summarizeSeries(series.rolloffHz, percentiles),
+      flatness: summarizeSeries(series.flatness, percentiles)
+    };
+  }
+}
+
+/**
+ * 📈 Resumo estatístico de uma série (ignora NaN)
+ * @param {Float64Array} series
+ * @param {number[]} percentiles - Ex.: [10, 50, 90]
+ * @returns {{ count: number, mean: number|null, min: number|null, max: number|null, percentiles: Object }}
+ */
+export function summarizeSeries(series, percentiles = SPECTRAL_BATCH_CONFIG.PERCENTILES) {
+  const sorted = new Float64Array(series.length);
+  let count = 0;
+  let sum = 0;
+  for (let i = 0; i < series.length; i++) {
+    const value = series[i];
+    if (!Number.isNaN(value)) {
+      sorted[count++] = value;
+      sum += value;
+    }
+  }
+
+  const result = { count, mean: null, min: null, max: null, percentiles: {} };
+  if (count === 0) return result;
+
+  const valid = sorted.subarray(0, count).sort();
+  result.mean = sum / count;
+  result.min = valid[0];
+  result.max = valid[count - 1];
+  for (const p of percentiles) {
+    const rank = (p / 100) * (count - 1);
+    const lower = Math.floor(rank);
+    const upper = Math.min(lower + 1, count - 1);
+    result.percentiles[`p${p}`] = valid[lower] + (valid[upper] - valid[lower]) * (rank - lower);
+  }
+
+  return result;
+}
+
@@ -1,13 +1,10 @@
 // 🎵 SPECTRAL CENTROID CORRECTED - Centro de brilho em Hz
 // Conversão correta para Hz refletindo o "centro de brilho" da música
 
-import { logAudio, makeErr } from '../error-handling.js';
+import { logAudio, logAudioFrame, makeErr } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
 
-/**
- * 🎯 DEBUG THROTTLING GLOBAL
- * Controla logging de dados frame-by-frame para evitar sobrecarga no Railway
- */
-const shouldLogFrame = (frame) => process.env.SOUNDY_DEBUG === 'true' && frame % 200 === 0;
+const logger = createLogger('audio:spectral-centroid');
 
 /**
  * 🔧 Configurações do Spectral Centroid
@@ -109,13 +106,11 @@ export class SpectralCentroidCalculator {
       
       // Validar energia total suficiente
       if (totalMagnitude < CENTROID_CONFIG.MIN_TOTAL_MAGNITUDE || validBins < 10) {
-        if (shouldLogFrame(frameIndex)) {
-          logAudio('spectral_centroid', 'insufficient_energy', {
-            frame: frameIndex,
-            totalMagnitude: totalMagnitude.toExponential(3),
-            validBins
-          });
-        }
+        logAudioFrame('spectral_centroid', 'insufficient_energy', () => ({
+          frame: frameIndex,
+          totalMagnitude: totalMagnitude.toExponential(3),
+          validBins
+        }));
         return null;
       }
       
@@ -126,29 +121,25 @@ export class SpectralCentroidCalculator {
       if (!isFinite(centroidHz) || 
           centroidHz < CENTROID_CONFIG.FREQUENCY_MIN || 
           centroidHz > CENTROID_CONFIG.FREQUENCY_MAX) {
-        if (shouldLogFrame(frameIndex)) {
-          logAudio('spectral_centroid', 'invalid_result', {
-            frame: frameIndex,
-            centroidHz,
-            weightedSum,
-            totalMagnitude
-          });
-        }
+        logAudioFrame('spectral_centroid', 'invalid_result', () => ({
+          frame: frameIndex,
+          centroidHz,
+          weightedSum,
+          totalMagnitude
+        }));
         return null;
       }
       
       const roundedCentroid = Number(centroidHz.toFixed(CENTROID_CONFIG.PRECISION_DIGITS));
       
-      // 🎯 Log throttled: apenas quando SOUNDY_DEBUG=true e a cada 200 frames
-      if (shouldLogFrame(frameIndex)) {
-        logAudio('spectral_centroid', 'calculated', {
-          frame: frameIndex,
-          centroidHz: roundedCentroid,
-          totalMagnitude: totalMagnitude.toExponential(3),
-          validBins,
-          brightnessCategory: this.categorizeBrightness(roundedCentroid)
-        });
-      }
+      // 🎯 Log throttled: só em trace, 1 a cada 200 frames
+      logAudioFrame('spectral_centroid', 'calculated', () => ({
+        frame: frameIndex,
+        centroidHz: roundedCentroid,
+        totalMagnitude: totalMagnitude.toExponential(3),
+        validBins,
+        brightnessCategory: this.categorizeBrightness(roundedCentroid)
+      }));
       
       return {
         centroidHz: roundedCentroid,
@@ -201,6 +192,29 @@ export class SpectralCentroidAggregator {
       .map(c => c.centroidHz)
       .sort((a, b) => a - b);
     
+    return this.fromSortedValues(validCentroids);
+  }
+  
+  /**
+   * ⚡ Agregar a partir das séries do SpectralBatchAnalyzer (spectral-batch.js)
+   * NaN = frame inválido; cada centróide é arredondado como no cálculo por frame.
+   */
+  static aggregateBatch(series) {
+    const validCentroids = [];
+    for (let f = 0; f < series.numFrames; f++) {
+      const centroidHz = series.centroidHz[f];
+      if (!Number.isNaN(centroidHz)) {
+        validCentroids.push(Number(centroidHz.toFixed(CENTROID_CONFIG.PRECISION_DIGITS)));
+      }
+    }
+    
+    return this.fromSortedValues(validCentroids.sort((a, b) => a - b));
+  }
+  
+  /**
+   * 🧩 Estatísticas finais a partir dos centróides válidos ordenados
+   */
+  static fromSortedValues(validCentroids) {
     if (validCentroids.length === 0) {
       return null;
     }
@@ -244,6 +258,4 @@ export function calculateSpectralCentroid(leftMagnitude, rightMagnitude, sampleR
 }
 
 // 🎯 Log de inicialização (executado apenas 1x na importação do módulo)
-if (process.env.SOUNDY_DEBUG === 'true') {
-  console.log('🎵 Spectral Centroid Calculator carregado - Centro de brilho em Hz');
-}
\ No newline at end of file
+logger.trace('🎵 Spectral Centroid Calculator carregado - Centro de brilho em Hz');
\ No newline at end of file
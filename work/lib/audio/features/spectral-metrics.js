@@ -1,7 +1,10 @@
 // 🎵 SPECTRAL METRICS - Implementação correta com fórmulas matemáticas padrão
 // Schema numérico único, sem objetos/arrays/strings
 
-import { logAudio, makeErr } from '../error-handling.js';
+import { logAudio, logAudioFrame, makeErr } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:spectral-metrics');
 
 /**
  * 🎯 Configurações e constantes
@@ -74,10 +77,10 @@ export class SpectralMetricsCalculator {
       
       // Verificar energia mínima
       if (totalEnergy <= SPECTRAL_CONFIG.MIN_VALID_ENERGY) {
-        logAudio('spectral', 'low_energy', { 
+        logAudioFrame('spectral', 'low_energy', () => ({ 
           frame: frameIndex, 
           energy: totalEnergy.toExponential(3) 
-        });
+        }));
         return this.getNullMetrics();
       }
       
@@ -91,20 +94,20 @@ export class SpectralMetricsCalculator {
       
       // Log temporário para auditoria
       if (centroidHz !== null) {
-        logAudio('spectral', 'centroid_calculated', {
+        logAudioFrame('spectral', 'centroid_calculated', () => ({
           frame: frameIndex,
           energy: totalEnergy.toFixed(6),
           meanMag2: (totalEnergy / this.numBins).toFixed(6),
           centroidHz: centroidHz.toFixed(2)
-        });
+        }));
       }
       
       if (rolloffHz !== null) {
-        logAudio('spectral', 'rolloff_calculated', {
+        logAudioFrame('spectral', 'rolloff_calculated', () => ({
           frame: frameIndex,
           threshold: (0.85 * totalEnergy).toFixed(6),
           rolloffHz: rolloffHz.toFixed(2)
-        });
+        }));
       }
       
       return {
@@ -345,4 +348,4 @@ export function serializeSpectralMetrics(metrics) {
   };
 }
 
-console.log('🎵 Spectral Metrics Calculator carregado - Schema numérico padrão');
\ No newline at end of file
+logger.debug('🎵 Spectral Metrics Calculator carregado - Schema numérico padrão');
\ No newline at end of file
@@ -2,6 +2,9 @@
 // Implementação para calcular uniformidade e equilíbrio do espectro de frequência
 
 import { logAudio } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:spectral-uniformity');
 
 /**
  * 🎯 Configurações para análise de uniformidade espectral
@@ -181,7 +184,7 @@ export class SpectralUniformityAnalyzer {
     
     // 🔧 DEBUG PRODUÇÃO 2025-12-29: Log para identificar problema de bandas insuficientes
     if (validEnergies.length < 3) {
-      console.log('[UNIFORMITY_BANDS] ⚠️ Menos de 3 bandas válidas:', {
+      logger.debug(() => ['[UNIFORMITY_BANDS] ⚠️ Menos de 3 bandas válidas:', {
         totalBands: energyValues.length,
         validBands: validEnergies.length,
         threshold: this.config.ENERGY_THRESHOLD,
@@ -190,7 +193,7 @@ export class SpectralUniformityAnalyzer {
           energyDB: band.energy.toFixed(1),
           valid: band.energy > this.config.ENERGY_THRESHOLD
         }))
-      });
+      }]);
       return { coefficient: 0, standardDeviation: 0, variance: 0, range: 0, meanDeviation: 0 };
     }
     
@@ -458,4 +461,4 @@ export function calculateSpectralUniformity(fftData, frequencyBins, sampleRate =
   return analyzer.analyzeSpectralUniformity(fftData, frequencyBins);
 }
 
-console.log('🎵 Spectral Uniformity Analyzer carregado - Análise de uniformidade espectral');
\ No newline at end of file
+logger.debug('🎵 Spectral Uniformity Analyzer carregado - Análise de uniformidade espectral');
\ No newline at end of file
@@ -2,6 +2,9 @@
 // Centroide, rolloff, flux, harmonics e envelope espectral
 
 import { STFTEngine } from '../fft.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:spectrum');
 
 /**
  * 🌈 Spectrum Analyzer Engine
@@ -12,7 +15,7 @@ class SpectrumAnalyzer {
     this.hopSize = hopSize;
     this.stft = new STFTEngine(fftSize, hopSize, windowType);
     
-    console.log(`🌈 Spectrum Analyzer: FFT=${fftSize}, hop=${hopSize}, window=${windowType}`);
+    logger.debug(() => [`🌈 Spectrum Analyzer: FFT=${fftSize}, hop=${hopSize}, window=${windowType}`]);
   }
 
   /**
@@ -22,7 +25,7 @@ class SpectrumAnalyzer {
    * @returns {Object} Features espectrais
    */
   analyze(signal, sampleRate = 48000) {
-    console.log('🌈 Executando análise espectral...');
+    logger.debug('🌈 Executando análise espectral...');
     const startTime = Date.now();
     
     // STFT
@@ -49,7 +52,7 @@ class SpectrumAnalyzer {
     
     const processingTime = Date.now() - startTime;
     
-    console.log(`✅ Análise espectral concluída em ${processingTime}ms`);
+    logger.debug(() => [`✅ Análise espectral concluída em ${processingTime}ms`]);
     
     return {
       // Features básicas
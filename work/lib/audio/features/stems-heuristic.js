@@ -0,0 +1,61 @@
+// 🎵 STEMS HEURISTIC - Núcleo DSP da separação heurística (bass / drums / vocals / other)
+// Mesmas fórmulas de stems-manager.js / stems-worker.js, com estado dos filtros explícito
+// para processar em chunks (worker_threads com progresso) sem alterar o resultado.
+
+export const STEM_NAMES = ['bass', 'drums', 'vocals', 'other'];
+
+/**
+ * 🔧 Estado inicial dos filtros de UM canal
+ */
+export function createSeparationState(sampleRate) {
+  const fcBass = 200;
+  const hpVoc = 180;
+  const lpVoc = 4000;
+  return {
+    alphaBass: Math.exp(-2 * Math.PI * fcBass / sampleRate),
+    aHP: Math.exp(-2 * Math.PI * hpVoc / sampleRate),
+    aLP: Math.exp(-2 * Math.PI * lpVoc / sampleRate),
+    transientThresh: 0.18,
+    lpBass: 0,
+    hpStage: 0,
+    lpStage: 0,
+    prev: 0
+  };
+}
+
+/**
+ * ⚙️ Separar amostras [start, end) de um canal, continuando do estado anterior
+ * @param {Float32Array} src - canal de entrada
+ * @param {{bass:Float32Array, drums:Float32Array, vocals:Float32Array, other:Float32Array}} out
+ * @param {number} start
+ * @param {number} end
+ * @param {Object} state - retorno de createSeparationState (mutado)
+ */
+export function separateChunk(src, out, start, end, state) {
+  const { alphaBass, aHP, aLP, transientThresh } = state;
+  const b = out.bass;
+  const d = out.drums;
+  const v = out.vocals;
+  const o = out.other;
+  let { lpBass, hpStage, lpStage, prev } = state;
+
+  for (let i = start; i < end; i++) {
+    const x = src[i];
+    lpBass = (1 - alphaBass) * x + alphaBass * lpBass;
+    b[i] = lpBass;
+    hpStage = (1 - aHP) * hpStage + (1 - aHP) * (x - hpStage);
+    lpStage = (1 - aLP) * x + aLP * lpStage;
+    const band = hpStage - (hpStage - lpStage);
+    v[i] = band;
+    const diff = x - prev;
+    prev = x;
+    if (Math.abs(diff) > transientThresh) d[i] = x;
+    else d[i] = 0;
+    o[i] = x - (b[i] + v[i] + d[i]);
+  }
+
+  state.lpBass = lpBass;
+  state.hpStage = hpStage;
+  state.lpStage = lpStage;
+  state.prev = prev;
+}
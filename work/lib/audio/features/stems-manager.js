@@ -1,19 +1,35 @@
 /**
- * 🎵 STEMS MANAGER - iOS Safe + Web Workers
+ * 🎵 STEMS MANAGER - iOS Safe + Web Workers + worker_threads (Node)
  * Gerencia separação de stems com fallback automático
  * Funcionalidade 100% preservada em todos os dispositivos
+ * 
+ * Stems são caros: use getStemsLazy/createLazyStems para calcular apenas quando uma
+ * sugestão precisar deles — o resultado fica em cache pelo fingerprint da análise.
+ *
+ * ⚠️ Ainda sem chamador no servidor: as sugestões com targetStem/triggerStem só nascem no
+ * rules-engine do navegador (public/audio-analyzer.js, CAIAR_ENABLED), que tem cópia própria
+ * deste módulo. Chamador previsto: a etapa CAIAR do pipeline no worker
+ * (api/audio/pipeline-complete.js, após o Motor V2) com
+ * createLazyStems(hash do arquivo, loadAudio).forSuggestions(suggestions).
  */
 
 import { caiarLog } from './caiar-logger.js';
+import { STEM_NAMES, createSeparationState, separateChunk } from './stems-heuristic.js';
 
 // Cache de workers para reutilização
 let workerPool = [];
-const MAX_WORKERS = 2;
+let nodeWorkerPool = [];
+let MAX_WORKERS = 2;
+
+// Cache de stems por fingerprint da análise (LRU por inserção; 3 min estéreo ≈ 4 stems × 69 MB)
+const stemsCache = new Map();
+let STEMS_CACHE_MAX_ENTRIES = 4;
 
 // Detecção de capacidades do dispositivo
 function detectCapabilities() {
-  const isIOS = /iPad|iPhone|iPod/.test(navigator.userAgent);
-  const hasWebWorkers = typeof Worker !== 'undefined';
+  const isNode = typeof window === 'undefined' && typeof process !== 'undefined' && !!process.versions?.node;
+  const isIOS = typeof navigator !== 'undefined' && /iPad|iPhone|iPod/.test(navigator.userAgent || '');
+  const hasWebWorkers = !isNode && typeof Worker !== 'undefined';
   const supportsOfflineContext = (() => {
     try {
       new OfflineAudioContext(1, 1024, 44100);
@@ -23,7 +39,7 @@ function detectCapabilities() {
     }
   })();
   
-  return { isIOS, hasWebWorkers, supportsOfflineContext };
+  return { isNode, isIOS, hasWebWorkers, supportsOfflineContext };
 }
 
 // Criar worker do pool
@@ -66,6 +82,57 @@ function releaseWorker(worker) {
   worker.busy = false;
 }
 
+// Criar worker_threads do pool (Node)
+async function createNodeStemsWorker() {
+  try {
+    const { Worker: NodeWorker } = await import('worker_threads');
+    const worker = new NodeWorker(new URL('../workers/stems-worker-node.js', import.meta.url));
+    worker.unref(); // worker ocioso não segura o processo
+    return worker;
+  } catch (error) {
+    caiarLog('WORKER_CREATE_ERROR', 'Falha ao criar worker_threads', { error: error.message });
+    return null;
+  }
+}
+
+// Obter worker_threads disponível (mesma política do pool de Web Workers)
+async function getAvailableNodeWorker() {
+  for (const worker of nodeWorkerPool) {
+    if (!worker.busy) {
+      worker.busy = true;
+      return worker;
+    }
+  }
+  
+  if (nodeWorkerPool.length < MAX_WORKERS) {
+    const worker = await createNodeStemsWorker();
+    if (worker) {
+      worker.busy = true;
+      worker.id = Date.now() + Math.random();
+      nodeWorkerPool.push(worker);
+      return worker;
+    }
+  }
+  
+  return null;
+}
+
+// Canais de entrada em SharedArrayBuffer (sem cópia se o decode já entregou memória compartilhada)
+function toSharedChannels(audioBuffer) {
+  const channels = [];
+  for (let ch = 0; ch < audioBuffer.numberOfChannels; ch++) {
+    const data = audioBuffer.getChannelData ? audioBuffer.getChannelData(ch) : audioBuffer.channels[ch];
+    if (data.buffer instanceof SharedArrayBuffer && data.byteOffset === 0 && data.length === audioBuffer.length) {
+      channels.push(data.buffer);
+    } else {
+      const shared = new SharedArrayBuffer(audioBuffer.length * Float32Array.BYTES_PER_ELEMENT);
+      new Float32Array(shared).set(data.subarray(0, audioBuffer.length));
+      channels.push(shared);
+    }
+  }
+  return channels;
+}
+
 // Converter AudioBuffer para transferable data
 function audioBufferToTransferable(audioBuffer) {
   const transferableData = {
@@ -94,6 +161,7 @@ function transferableToAudioBuffer(transferableData) {
     numberOfChannels: transferableData.numberOfChannels,
     length: transferableData.length,
     duration: transferableData.duration,
+    channels: transferableData.channels,
     getChannelData: (channel) => transferableData.channels[channel]
   };
   
@@ -173,6 +241,96 @@ async function separateViaWorker(audioBuffer, options = {}) {
   });
 }
 
+// Separação via worker_threads (Node): entrada e saída em SharedArrayBuffer, progresso por chunk
+async function separateViaNodeWorker(audioBuffer, options = {}) {
+  const worker = await getAvailableNodeWorker();
+  
+  if (!worker) {
+    throw new Error('No workers available');
+  }
+  
+  const { sampleRate, numberOfChannels, length } = audioBuffer;
+  const channels = toSharedChannels(audioBuffer);
+  const outputs = {};
+  for (const stem of STEM_NAMES) {
+    outputs[stem] = Array.from({ length: numberOfChannels }, () => new SharedArrayBuffer(length * Float32Array.BYTES_PER_ELEMENT));
+  }
+  
+  return new Promise((resolve, reject) => {
+    const requestId = Date.now() + Math.random();
+    
+    const finish = () => {
+      clearTimeout(timeout);
+      worker.off('message', onMessage);
+      worker.off('error', onError);
+      worker.unref();
+    };
+    
+    // Timeout handler
+    const timeout = setTimeout(() => {
+      finish();
+      worker.terminate();
+      const index = nodeWorkerPool.findIndex(w => w.id === worker.id);
+      if (index >= 0) nodeWorkerPool.splice(index, 1);
+      reject(new Error('Worker timeout'));
+    }, options.timeoutMs || 90000);
+    
+    const onMessage = (message) => {
+      const { id, type, result, error } = message;
+      if (id !== requestId) return;
+      
+      if (type === 'progress') {
+        if (options.onProgress) {
+          options.onProgress(message.percentage);
+        }
+        
+      } else if (type === 'complete') {
+        finish();
+        releaseWorker(worker);
+        
+        // Stems como AudioBuffer-like sobre a memória compartilhada (zero cópia)
+        const stems = {};
+        for (const stem of STEM_NAMES) {
+          stems[stem] = transferableToAudioBuffer({
+            sampleRate,
+            numberOfChannels,
+            length,
+            duration: length / sampleRate,
+            channels: outputs[stem].map(buffer => new Float32Array(buffer))
+          });
+        }
+        
+        resolve({ ...result, stems });
+        
+      } else if (type === 'error') {
+        finish();
+        releaseWorker(worker);
+        reject(new Error(error.message));
+      }
+    };
+    
+    const onError = (error) => {
+      finish();
+      const index = nodeWorkerPool.findIndex(w => w.id === worker.id);
+      if (index >= 0) nodeWorkerPool.splice(index, 1);
+      reject(error);
+    };
+    
+    worker.on('message', onMessage);
+    worker.on('error', onError);
+    worker.ref();
+    worker.postMessage({
+      id: requestId,
+      type: 'process',
+      sampleRate,
+      length,
+      channels,
+      outputs,
+      chunkSize: options.chunkSize
+    });
+  });
+}
+
 // Separação fallback original (heuristic inline)
 function heuristicsSeparationInline(audioBuffer, opts = {}) {
   const t0 = performance.now();
@@ -283,37 +441,11 @@ function heuristicsSeparationPure(audioBuffer, opts = {}) {
     stem.getChannelData = (channel) => stem.channels[channel];
   }
   
-  const fcBass = 200;
-  const alphaBass = Math.exp(-2 * Math.PI * fcBass / sr);
-  const hpVoc = 180;
-  const lpVoc = 4000;
-  const aHP = Math.exp(-2 * Math.PI * hpVoc / sr);
-  const aLP = Math.exp(-2 * Math.PI * lpVoc / sr);
-  const transientThresh = 0.18;
-  
   for (let ch = 0; ch < numberOfChannels; ch++) {
-    const src = audioBuffer.getChannelData(ch);
-    const b = stems.bass.channels[ch];
-    const d = stems.drums.channels[ch];
-    const v = stems.vocals.channels[ch];
-    const o = stems.other.channels[ch];
-    
-    let lpBass = 0, hpStage = 0, lpStage = 0, prev = 0;
-    
-    for (let i = 0; i < src.length; i++) {
-      const x = src[i];
-      lpBass = (1 - alphaBass) * x + alphaBass * lpBass;
-      b[i] = lpBass;
-      hpStage = (1 - aHP) * hpStage + (1 - aHP) * (x - hpStage);
-      lpStage = (1 - aLP) * x + aLP * lpStage;
-      const band = hpStage - (hpStage - lpStage);
-      v[i] = band;
-      const diff = x - prev;
-      prev = x;
-      if (Math.abs(diff) > transientThresh) d[i] = x;
-      else d[i] = 0;
-      o[i] = x - (b[i] + v[i] + d[i]);
-    }
+    const src = audioBuffer.getChannelData ? audioBuffer.getChannelData(ch) : audioBuffer.channels[ch];
+    const out = {};
+    for (const stem of STEM_NAMES) out[stem] = stems[stem].channels[ch];
+    separateChunk(src, out, 0, Math.min(src.length, length), createSeparationState(sr));
   }
   
   const t1 = performance.now();
@@ -348,6 +480,7 @@ export async function separateStems(audioBuffer, options = { timeoutMs: 90000 })
   
   try {
     caiarLog('STEMS_START', 'Iniciando separação adaptativa', {
+      isNode: capabilities.isNode,
       isIOS: capabilities.isIOS,
       hasWebWorkers: capabilities.hasWebWorkers,
       duration: audioBuffer.duration
@@ -355,6 +488,19 @@ export async function separateStems(audioBuffer, options = { timeoutMs: 90000 })
     
     let result = null;
     
+    // ESTRATÉGIA 0: worker_threads (Node) com SharedArrayBuffer
+    if (capabilities.isNode && !options.forceInline) {
+      try {
+        caiarLog('STEMS_STRATEGY', 'Tentando worker_threads');
+        result = await separateViaNodeWorker(audioBuffer, options);
+        caiarLog('STEMS_SUCCESS', 'worker_threads executado com sucesso');
+      } catch (workerError) {
+        caiarLog('STEMS_WORKER_FALLBACK', 'worker_threads falhou, tentando fallback', {
+          error: workerError.message
+        });
+      }
+    }
+    
     // ESTRATÉGIA 1: Web Workers (preferência)
     if (capabilities.hasWebWorkers && !options.forceInline) {
       try {
@@ -375,7 +521,9 @@ export async function separateStems(audioBuffer, options = { timeoutMs: 90000 })
     // ESTRATÉGIA 2: Fallback inline
     if (!result) {
       caiarLog('STEMS_STRATEGY', 'Usando processamento inline');
-      result = heuristicsSeparationInline(audioBuffer, options);
+      result = capabilities.isNode
+        ? heuristicsSeparationPure(audioBuffer, options)
+        : heuristicsSeparationInline(audioBuffer, options);
     }
     
     // Calcular métricas
@@ -401,6 +549,76 @@ export async function separateStems(audioBuffer, options = { timeoutMs: 90000 })
   }
 }
 
+// ========= STEMS SOB DEMANDA =========
+
+/**
+ * Sugestão depende de stems? (regras contextuais usam targetStem/triggerStem ≠ 'mix')
+ */
+export function suggestionNeedsStems(suggestion) {
+  if (!suggestion) return false;
+  return [suggestion.targetStem, suggestion.triggerStem].some(stem => stem && stem !== 'mix');
+}
+
+/**
+ * Stems da análise, calculados na primeira chamada e reaproveitados depois
+ * Chamadas concorrentes com o mesmo fingerprint compartilham a mesma separação.
+ * @param {string} fingerprint - identificador da análise (ex.: hash do arquivo / jobId)
+ * @param {Function|Object} loadAudio - AudioBuffer-like ou função (async) que o carrega só quando necessário
+ * @param {Object} options - mesmas opções de separateStems (onProgress, timeoutMs, forceInline...)
+ * @returns {Promise<Object|null>}
+ */
+export function getStemsLazy(fingerprint, loadAudio, options = {}) {
+  if (!fingerprint) {
+    return Promise.reject(new Error('fingerprint obrigatório para cache de stems'));
+  }
+  
+  const cached = stemsCache.get(fingerprint);
+  if (cached) {
+    // LRU: reinserir como mais recente
+    stemsCache.delete(fingerprint);
+    stemsCache.set(fingerprint, cached);
+    caiarLog('STEMS_CACHE_HIT', 'Stems reaproveitados do cache', { fingerprint });
+    return cached;
+  }
+  
+  const pending = (async () => {
+    const audioBuffer = typeof loadAudio === 'function' ? await loadAudio() : loadAudio;
+    return separateStems(audioBuffer, options);
+  })();
+  
+  stemsCache.set(fingerprint, pending);
+  while (stemsCache.size > STEMS_CACHE_MAX_ENTRIES) {
+    stemsCache.delete(stemsCache.keys().next().value);
+  }
+  
+  // Falhas (null/erro) não ficam em cache
+  const evict = () => {
+    if (stemsCache.get(fingerprint) === pending) stemsCache.delete(fingerprint);
+  };
+  pending.then(result => { if (!result) evict(); }, evict);
+  
+  return pending;
+}
+
+/**
+ * Handle preguiçoso por análise: nada é calculado até alguém pedir os stems
+ * @returns {{ fingerprint: string, isCached: boolean, get: Function, forSuggestions: Function }}
+ */
+export function createLazyStems(fingerprint, loadAudio, options = {}) {
+  return {
+    fingerprint,
+    get isCached() {
+      return stemsCache.has(fingerprint);
+    },
+    get: (overrides = {}) => getStemsLazy(fingerprint, loadAudio, { ...options, ...overrides }),
+    // Só separa se alguma sugestão realmente depender de stems
+    forSuggestions(suggestions = [], overrides = {}) {
+      if (!suggestions.some(suggestionNeedsStems)) return Promise.resolve(null);
+      return this.get(overrides);
+    }
+  };
+}
+
 // Cleanup function
 export function cleanupStemsManager() {
   workerPool.forEach(worker => {
@@ -408,7 +626,10 @@ export function cleanupStemsManager() {
       worker.terminate();
     }
   });
+  nodeWorkerPool.forEach(worker => worker.terminate());
   workerPool = [];
+  nodeWorkerPool = [];
+  stemsCache.clear();
   caiarLog('STEMS_CLEANUP', 'Workers terminados');
 }
 
@@ -418,6 +639,10 @@ export function configureStemsManager(options = {}) {
     MAX_WORKERS = options.maxWorkers;
     caiarLog('STEMS_CONFIG', 'Configuração atualizada', { maxWorkers: MAX_WORKERS });
   }
+  if (options.cacheEntries && options.cacheEntries > 0) {
+    STEMS_CACHE_MAX_ENTRIES = options.cacheEntries;
+    caiarLog('STEMS_CONFIG', 'Configuração atualizada', { cacheEntries: STEMS_CACHE_MAX_ENTRIES });
+  }
 }
 
 export default separateStems;
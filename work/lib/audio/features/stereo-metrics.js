@@ -2,6 +2,9 @@
 // Implementação correta de correlação (-1 a +1) e largura estéreo (0 a 1)
 
 import { logAudio, makeErr } from '../error-handling.js';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:stereo-metrics');
 
 /**
  * 🔧 Configurações das métricas estéreo
@@ -62,6 +65,34 @@ export class StereoMetricsCalculator {
     };
   }
   
+  /**
+   * ⚡ Validar entrada a partir do kernel de passada única (time-domain-kernel.js)
+   */
+  validateStereoStats(stats) {
+    if (!stats || !stats.sums) {
+      return { valid: false, reason: 'missing_channels' };
+    }
+    
+    if (stats.length < STEREO_CONFIG.MIN_SAMPLES) {
+      return { valid: false, reason: 'insufficient_samples' };
+    }
+    
+    const leftRMS = Math.sqrt(stats.sums.leftSq / stats.length);
+    const rightRMS = Math.sqrt(stats.sums.rightSq / stats.length);
+    
+    if (leftRMS < STEREO_CONFIG.MIN_RMS_THRESHOLD && 
+        rightRMS < STEREO_CONFIG.MIN_RMS_THRESHOLD) {
+      return { valid: false, reason: 'insufficient_signal' };
+    }
+    
+    return { 
+      valid: true, 
+      length: stats.length,
+      leftRMS,
+      rightRMS
+    };
+  }
+  
   /**
    * 📈 Calcular RMS de um canal
    */
@@ -110,6 +141,48 @@ export class StereoMetricsCalculator {
         rightVariance += rightDiff * rightDiff;
       }
       
+      return this.finalizeCorrelation(numerator, leftVariance, rightVariance, validation);
+      
+    } catch (error) {
+      logAudio('stereo_correlation', 'calculation_error', { error: error.message });
+      return null;
+    }
+  }
+  
+  /**
+   * ⚡ Correlação a partir das somas do kernel (Pearson em uma passada)
+   * cov = ΣLR − ΣL·ΣR/n, var = ΣX² − (ΣX)²/n
+   */
+  calculateStereoCorrelationFromStats(stats) {
+    const validation = this.validateStereoStats(stats);
+    if (!validation.valid) {
+      logAudio('stereo_correlation', 'validation_failed', { reason: validation.reason });
+      return null;
+    }
+    
+    try {
+      const { left, right, leftSq, rightSq, lr } = stats.sums;
+      const n = stats.length;
+      
+      const numerator = lr - (left * right) / n;
+      const leftVariance = Math.max(0, leftSq - (left * left) / n);
+      const rightVariance = Math.max(0, rightSq - (right * right) / n);
+      
+      return this.finalizeCorrelation(numerator, leftVariance, rightVariance, validation);
+      
+    } catch (error) {
+      logAudio('stereo_correlation', 'calculation_error', { error: error.message });
+      return null;
+    }
+  }
+  
+  /**
+   * 🎯 Finalizar correlação (clamp, arredondamento, categoria)
+   */
+  finalizeCorrelation(numerator, leftVariance, rightVariance, validation) {
+    const length = validation.length;
+    
+    try {
       const denominator = Math.sqrt(leftVariance * rightVariance);
       
       if (denominator < STEREO_CONFIG.MIN_RMS_THRESHOLD) {
@@ -180,8 +253,34 @@ export class StereoMetricsCalculator {
         sideRMS += side * side;
       }
       
-      midRMS = Math.sqrt(midRMS / length);
-      sideRMS = Math.sqrt(sideRMS / length);
+      return this.finalizeWidth(midRMS, sideRMS, length);
+      
+    } catch (error) {
+      logAudio('stereo_width', 'calculation_error', { error: error.message });
+      return null;
+    }
+  }
+  
+  /**
+   * ⚡ Largura a partir das energias Mid/Side do kernel
+   */
+  calculateStereoWidthFromStats(stats) {
+    const validation = this.validateStereoStats(stats);
+    if (!validation.valid) {
+      logAudio('stereo_width', 'validation_failed', { reason: validation.reason });
+      return null;
+    }
+    
+    return this.finalizeWidth(stats.sums.midSq, stats.sums.sideSq, stats.length);
+  }
+  
+  /**
+   * 🎯 Finalizar largura a partir das somas de energia Mid/Side
+   */
+  finalizeWidth(midSumSquares, sideSumSquares, length) {
+    try {
+      const midRMS = Math.sqrt(midSumSquares / length);
+      const sideRMS = Math.sqrt(sideSumSquares / length);
       
       // Calcular largura baseada na proporção Side/Mid
       let width;
@@ -306,6 +405,23 @@ export class StereoMetricsCalculator {
     const correlation = this.calculateStereoCorrelation(leftChannel, rightChannel);
     const width = this.calculateStereoWidth(leftChannel, rightChannel);
     
+    return this.buildStereoResult(correlation, width, frameIndex);
+  }
+  
+  /**
+   * ⚡ Análise completa a partir do kernel de passada única (sem reler as amostras)
+   */
+  analyzeStereoMetricsFromStats(stats, frameIndex = 0) {
+    const correlation = this.calculateStereoCorrelationFromStats(stats);
+    const width = this.calculateStereoWidthFromStats(stats);
+    
+    return this.buildStereoResult(correlation, width, frameIndex);
+  }
+  
+  /**
+   * 🧩 Montar resultado estéreo (correlação + largura + abertura)
+   */
+  buildStereoResult(correlation, width, frameIndex) {
     // 🔧 CORREÇÃO: Calcular abertura estéreo baseada na correlação (OPÇÃO C)
     const opening = correlation ? this.calculateStereoOpening(correlation.correlation) : null;
     
@@ -430,4 +546,4 @@ export function analyzeStereoMetrics(leftChannel, rightChannel) {
   return calculator.analyzeStereoMetrics(leftChannel, rightChannel);
 }
 
-console.log('🎭 Stereo Metrics Calculator carregado - Correlação (-1 a +1) e Largura (0 a 1)');
\ No newline at end of file
+logger.debug('🎭 Stereo Metrics Calculator carregado - Correlação (-1 a +1) e Largura (0 a 1)');
\ No newline at end of file
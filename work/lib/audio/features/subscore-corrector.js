@@ -1,6 +1,10 @@
 // 🎯 CORREÇÃO DEFINITIVA - SUB-SCORES 100% PRECISOS
 // Garante que os 4 sub-scores (dynamics, technical, loudness, frequency) sejam fiéis às análises
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:subscore-corrector');
+
 /**
  * 🔧 Corrector para Sub-Scores
  * Este módulo garante que os qualityBreakdown sejam 100% precisos e consistentes
@@ -19,7 +23,7 @@ class SubScoreCorrector {
      */
     correctSubScores(baseAnalysis, reference = null) {
         if (!baseAnalysis || !baseAnalysis.technicalData) {
-            console.warn('⚠️ [SUB-SCORE] Dados técnicos ausentes para correção');
+            logger.warn('⚠️ [SUB-SCORE] Dados técnicos ausentes para correção');
             return baseAnalysis;
         }
 
@@ -27,10 +31,10 @@ class SubScoreCorrector {
         const ref = reference || this.getDefaultReference();
 
         if (this.DEBUG) {
-            console.log('🎯 [SUB-SCORE] Iniciando correção:', { 
+            logger.debug(() => ['🎯 [SUB-SCORE] Iniciando correção:', { 
                 hasQualityBreakdown: !!baseAnalysis.qualityBreakdown,
                 technicalDataKeys: Object.keys(td)
-            });
+            }]);
         }
 
         // 1. Calcular sub-scores usando método avançado (Category-Based)
@@ -50,10 +54,10 @@ class SubScoreCorrector {
         baseAnalysis.subScoreValidation = validation;
         
         if (this.DEBUG) {
-            console.log('✅ [SUB-SCORE] Correção aplicada:', {
+            logger.debug(() => ['✅ [SUB-SCORE] Correção aplicada:', {
                 final: finalScores,
                 validation: validation.summary
-            });
+            }]);
         }
 
         return baseAnalysis;
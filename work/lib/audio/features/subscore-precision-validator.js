@@ -1,6 +1,10 @@
 // 🎯 VALIDADOR DE PRECISÃO DOS SUB-SCORES
 // Verifica se os 4 sub-scores (dynamics, technical, loudness, frequency) são 100% precisos e fieis às análises
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:subscore-precision-validator');
+
 class SubScorePrecisionValidator {
     constructor() {
         this.tolerance = 0.01; // Tolerância para comparações de ponto flutuante
@@ -13,7 +17,7 @@ class SubScorePrecisionValidator {
      * @returns {Object} Relatório de validação completo
      */
     validateSubScorePrecision(technicalData, referenceData = null) {
-        console.log('🎯 [PRECISION] Iniciando validação de precisão dos sub-scores');
+        logger.debug('🎯 [PRECISION] Iniciando validação de precisão dos sub-scores');
         
         // 1. Calcular scores usando método Fallback (current)
         const fallbackScores = this.calculateFallbackScores(technicalData, referenceData);
@@ -36,7 +40,7 @@ class SubScorePrecisionValidator {
             technicalData
         );
         
-        console.log('✅ [PRECISION] Validação concluída:', report);
+        logger.debug(() => ['✅ [PRECISION] Validação concluída:', report]);
         return report;
     }
 
@@ -0,0 +1,200 @@
+// ⚡ TIME-DOMAIN KERNEL - Passada única sobre L/R
+// Acumula em UMA leitura de cada par de amostras tudo que as métricas de domínio do tempo usam:
+// sample peak, RMS por bloco, DC (global + janelas), correlação/largura/balanço estéreo,
+// crest factor e dynamic range. Os módulos de features continuam donos das fórmulas finais.
+
+import { logAudio, makeErr } from '../error-handling.js';
+
+/**
+ * 🎯 Configurações do kernel
+ * HOP é a granularidade dos sub-acumuladores: janelas de RMS/DR (300ms) e crest (400ms)
+ * são reconstruídas somando hops de 100ms (sem revisitar amostras).
+ */
+const KERNEL_CONFIG = {
+  HOP_MS: 100,
+  DC_WINDOW_SAMPLES: 4096,   // mesmo SAMPLE_WINDOW de dc-offset.js
+  NEAR_FULL_SCALE: 0.995     // diagnóstico de sample peak
+};
+
+/**
+ * ⚡ Calcular estatísticas de domínio do tempo em uma passada
+ * @param {Float32Array} leftChannel
+ * @param {Float32Array} rightChannel
+ * @param {number} sampleRate
+ * @returns {Object} Somas globais + sub-acumuladores por hop + médias de DC por janela
+ */
+export function computeTimeDomainStats(leftChannel, rightChannel, sampleRate = 48000) {
+  if (!leftChannel || !rightChannel || leftChannel.length !== rightChannel.length) {
+    throw makeErr('time_domain_kernel', 'Canais ausentes ou com tamanhos diferentes', 'invalid_channels');
+  }
+
+  const startTime = Date.now();
+  const length = leftChannel.length;
+  const hopSamples = Math.round((KERNEL_CONFIG.HOP_MS / 1000) * sampleRate);
+  const numHops = Math.ceil(length / hopSamples);
+  const dcWindow = KERNEL_CONFIG.DC_WINDOW_SAMPLES;
+  const nearFull = KERNEL_CONFIG.NEAR_FULL_SCALE;
+
+  // Sub-acumuladores por hop
+  const hopLeftSq = new Float64Array(numHops);
+  const hopRightSq = new Float64Array(numHops);
+  const hopMonoSq = new Float64Array(numHops);   // mono em Float32 (como DynamicRangeCalculator)
+  const hopMidSq = new Float64Array(numHops);    // mid em double (como CrestFactorCalculator)
+  const hopMidPeak = new Float64Array(numHops);
+  const hopPeak = new Float64Array(numHops);     // max(|L|, |R|) — sinaliza clipping por trecho
+
+  // Acumuladores globais
+  let peakLeft = 0, peakRight = 0, countExact1 = 0, countNear1 = 0;
+  let sumLeft = 0, sumRight = 0, sumLeftSq = 0, sumRightSq = 0;
+  let sumLR = 0, sumMidSq = 0, sumSideSq = 0;
+
+  // DC por janela
+  const dcLeft = [];
+  const dcRight = [];
+  let dcSumLeft = 0, dcSumRight = 0, dcCount = 0;
+
+  for (let h = 0; h < numHops; h++) {
+    const start = h * hopSamples;
+    const end = Math.min(start + hopSamples, length);
+
+    let sL = 0, sR = 0, qL = 0, qR = 0, lr = 0;
+    let qMono = 0, qMid = 0, qSide = 0, pMid = 0, pHop = 0;
+
+    for (let i = start; i < end; i++) {
+      const l = leftChannel[i];
+      const r = rightChannel[i];
+
+      const absL = l < 0 ? -l : l;
+      const absR = r < 0 ? -r : r;
+      if (absL > peakLeft) peakLeft = absL;
+      if (absR > peakRight) peakRight = absR;
+      if (absL > pHop) pHop = absL;
+      if (absR > pHop) pHop = absR;
+      if (absL === 1.0) countExact1++;
+      if (absR === 1.0) countExact1++;
+      if (absL >= nearFull) countNear1++;
+      if (absR >= nearFull) countNear1++;
+
+      sL += l;
+      sR += r;
+      qL += l * l;
+      qR += r * r;
+      lr += l * r;
+
+      const mid = (l + r) / 2;
+      const side = (l - r) / 2;
+      const mono = Math.fround(mid);
+      const absMid = mid < 0 ? -mid : mid;
+      qMid += mid * mid;
+      qSide += side * side;
+      qMono += mono * mono;
+      if (absMid > pMid) pMid = absMid;
+
+      dcSumLeft += l;
+      dcSumRight += r;
+      if (++dcCount === dcWindow) {
+        dcLeft.push(dcSumLeft / dcWindow);
+        dcRight.push(dcSumRight / dcWindow);
+        dcSumLeft = 0;
+        dcSumRight = 0;
+        dcCount = 0;
+      }
+    }
+
+    hopLeftSq[h] = qL;
+    hopRightSq[h] = qR;
+    hopMonoSq[h] = qMono;
+    hopMidSq[h] = qMid;
+    hopMidPeak[h] = pMid;
+    hopPeak[h] = pHop;
+
+    sumLeft += sL;
+    sumRight += sR;
+    sumLeftSq += qL;
+    sumRightSq += qR;
+    sumLR += lr;
+    sumMidSq += qMid;
+    sumSideSq += qSide;
+  }
+
+  // Janela final de DC aceita com >= 50% do tamanho (mesma regra de dc-offset.js)
+  if (dcCount >= dcWindow / 2) {
+    dcLeft.push(dcSumLeft / dcCount);
+    dcRight.push(dcSumRight / dcCount);
+  }
+
+  logAudio('time_domain_kernel', 'completed', {
+    samples: length,
+    hops: numHops,
+    dcWindows: dcLeft.length,
+    processingTime: Date.now() - startTime
+  });
+
+  return {
+    length,
+    sampleRate,
+    hopSamples,
+    numHops,
+    peak: { left: peakLeft, right: peakRight, countExact1, countNear1 },
+    sums: { left: sumLeft, right: sumRight, leftSq: sumLeftSq, rightSq: sumRightSq, lr: sumLR, midSq: sumMidSq, sideSq: sumSideSq },
+    hops: { leftSq: hopLeftSq, rightSq: hopRightSq, monoSq: hopMonoSq, midSq: hopMidSq, midPeak: hopMidPeak, peak: hopPeak },
+    dcWindows: { left: dcLeft, right: dcRight, windowSamples: dcWindow }
+  };
+}
+
+/**
+ * 📊 RMS por bloco a partir dos hops (equivalente a segmentChannelForRMS)
+ * Bloco parcial no fim = zero-padding (divide sempre por blockSamples)
+ * @param {Object} stats - Retorno de computeTimeDomainStats
+ * @param {'left'|'right'} channel
+ * @param {number} blockSamples - Deve ser múltiplo de stats.hopSamples
+ * @returns {number[]|null} null se o bloco não for múltiplo do hop
+ */
+export function rmsBlocksFromStats(stats, channel, blockSamples) {
+  const hopsPerBlock = blockSamples / stats.hopSamples;
+  if (!Number.isInteger(hopsPerBlock)) return null;
+
+  const hopSq = channel === 'left' ? stats.hops.leftSq : stats.hops.rightSq;
+  const rmsValues = new Array(stats.numHops);
+
+  for (let b = 0; b < stats.numHops; b++) {
+    let sumSquares = 0;
+    const last = Math.min(b + hopsPerBlock, stats.numHops);
+    for (let h = b; h < last; h++) sumSquares += hopSq[h];
+    const rms = Math.sqrt(sumSquares / blockSamples);
+    rmsValues[b] = isFinite(rms) ? rms : 0;
+  }
+
+  return rmsValues;
+}
+
+/**
+ * 🪟 Janelas completas (start + window <= length) reconstruídas a partir dos hops
+ * @param {Object} stats
+ * @param {number} windowSamples - Deve ser múltiplo de stats.hopSamples
+ * @param {'monoSq'|'midSq'} field - Acumulador de energia usado
+ * @returns {{ sumSquares: Float64Array, peaks: Float64Array }|null}
+ */
+export function windowsFromStats(stats, windowSamples, field) {
+  const hopsPerWindow = windowSamples / stats.hopSamples;
+  if (!Number.isInteger(hopsPerWindow)) return null;
+
+  const fullHops = Math.floor(stats.length / stats.hopSamples);
+  const count = Math.max(0, fullHops - hopsPerWindow + 1);
+  const energy = stats.hops[field];
+  const sumSquares = new Float64Array(count);
+  const peaks = new Float64Array(count);
+
+  for (let w = 0; w < count; w++) {
+    let sum = 0;
+    let peak = 0;
+    for (let h = w; h < w + hopsPerWindow; h++) {
+      sum += energy[h];
+      if (stats.hops.midPeak[h] > peak) peak = stats.hops.midPeak[h];
+    }
+    sumSquares[w] = sum;
+    peaks[w] = peak;
+  }
+
+  return { sumSquares, peaks };
+}
@@ -7,6 +7,9 @@ import { promisify } from 'util';
 import ffmpegPath from 'ffmpeg-static';
 import path from 'path';
 import fs from 'fs';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:truepeak-ffmpeg');
 
 const execFileAsync = promisify(execFile);
 
@@ -19,7 +22,7 @@ export async function calculateTruePeakFFmpeg(filePath) {
   const startTime = Date.now();
   
   try {
-    console.log(`[FFMPEG_TP] Calculando True Peak para: ${path.basename(filePath)}`);
+    logger.debug(() => [`[FFMPEG_TP] Calculando True Peak para: ${path.basename(filePath)}`]);
     
     // Verificar se o arquivo existe
     if (!fs.existsSync(filePath)) {
@@ -34,7 +37,7 @@ export async function calculateTruePeakFFmpeg(filePath) {
       '-'
     ];
     
-    console.log(`[FFMPEG_TP] Executando: ffmpeg ${args.join(' ')}`);
+    logger.debug(() => [`[FFMPEG_TP] Executando: ffmpeg ${args.join(' ')}`]);
     
     // Executar FFmpeg com timeout e buffer grande
     const { stdout, stderr } = await execFileAsync(ffmpegPath, args, {
@@ -42,15 +45,15 @@ export async function calculateTruePeakFFmpeg(filePath) {
       timeout: 60000 // 60s timeout
     });
     
-    console.log(`[FFMPEG_TP] FFmpeg executado com sucesso em ${Date.now() - startTime}ms`);
+    logger.debug(() => [`[FFMPEG_TP] FFmpeg executado com sucesso em ${Date.now() - startTime}ms`]);
     
     // Parse do stderr (FFmpeg escreve informações no stderr)
     const result = parseTruePeakFromStderr(stderr);
     
     if (result.truePeakDbtp !== null) {
-      console.log(`[FFMPEG_TP] ✅ True Peak encontrado: ${result.truePeakDbtp.toFixed(2)} dBTP`);
+      logger.debug(() => [`[FFMPEG_TP] ✅ True Peak encontrado: ${result.truePeakDbtp.toFixed(2)} dBTP`]);
     } else {
-      console.log(`[FFMPEG_TP] ⚠️ True Peak não encontrado no output do FFmpeg`);
+      logger.debug(`[FFMPEG_TP] ⚠️ True Peak não encontrado no output do FFmpeg`);
     }
     
     return {
@@ -62,7 +65,7 @@ export async function calculateTruePeakFFmpeg(filePath) {
     
   } catch (error) {
     const processingTime = Date.now() - startTime;
-    console.error(`[FFMPEG_TP] ❌ Erro ao calcular True Peak: ${error.message}`);
+    logger.error(`[FFMPEG_TP] ❌ Erro ao calcular True Peak: ${error.message}`);
     
     // Retornar todos os campos como null em caso de erro
     return {
@@ -86,13 +89,13 @@ export async function calculateTruePeakFFmpeg(filePath) {
  */
 function parseTruePeakFromStderr(stderr) {
   try {
-    console.log(`[FFMPEG_TP] Parseando stderr (${stderr.length} chars)...`);
+    logger.debug(() => [`[FFMPEG_TP] Parseando stderr (${stderr.length} chars)...`]);
     
     // Debug: Log primeiras e últimas linhas do stderr
     const lines = stderr.split('\n');
-    console.log(`[FFMPEG_TP] Stderr tem ${lines.length} linhas`);
-    console.log(`[FFMPEG_TP] Primeiras 3 linhas:`, lines.slice(0, 3));
-    console.log(`[FFMPEG_TP] Últimas 3 linhas:`, lines.slice(-3));
+    logger.debug(() => [`[FFMPEG_TP] Stderr tem ${lines.length} linhas`]);
+    logger.debug(() => [`[FFMPEG_TP] Primeiras 3 linhas:`, lines.slice(0, 3)]);
+    logger.debug(() => [`[FFMPEG_TP] Últimas 3 linhas:`, lines.slice(-3)]);
     
     // Regex para capturar True Peak
     // FFmpeg pode reportar em diferentes formatos:
@@ -107,21 +110,21 @@ function parseTruePeakFromStderr(stderr) {
       const truePeakDbtp = parseFloat(match[1] || match[2]);
       const unit = match[1] ? 'dBTP' : 'dBFS';
       
-      console.log(`[FFMPEG_TP] ✅ Regex encontrou True Peak: ${truePeakDbtp} ${unit}`);
+      logger.debug(() => [`[FFMPEG_TP] ✅ Regex encontrou True Peak: ${truePeakDbtp} ${unit}`]);
       
       // Se for dBFS, converter para dBTP (assumindo que são equivalentes para True Peak)
       const finalTruePeakDbtp = truePeakDbtp;
       
       // Verificar se o valor é realista
       if (!isFinite(finalTruePeakDbtp) || finalTruePeakDbtp < -200 || finalTruePeakDbtp > 50) {
-        console.warn(`[FFMPEG_TP] ⚠️ True Peak fora do range esperado: ${finalTruePeakDbtp} ${unit}`);
+        logger.warn(`[FFMPEG_TP] ⚠️ True Peak fora do range esperado: ${finalTruePeakDbtp} ${unit}`);
         return createNullResult();
       }
       
       // Converter para linear (20 * log10(linear) = dBTP)
       const truePeakLinear = Math.pow(10, finalTruePeakDbtp / 20);
       
-      console.log(`[FFMPEG_TP] ✅ True Peak linear: ${truePeakLinear.toFixed(6)}`);
+      logger.debug(() => [`[FFMPEG_TP] ✅ True Peak linear: ${truePeakLinear.toFixed(6)}`]);
       
       // Retornar todos os campos necessários para compatibilidade
       return {
@@ -133,7 +136,7 @@ function parseTruePeakFromStderr(stderr) {
       };
       
     } else {
-      console.log(`[FFMPEG_TP] ❌ Regex não encontrou True Peak no stderr`);
+      logger.debug(`[FFMPEG_TP] ❌ Regex não encontrou True Peak no stderr`);
       
       // Debug: procurar por linhas que contenham "peak" (case insensitive)
       const peakLines = lines.filter(line => 
@@ -142,16 +145,16 @@ function parseTruePeakFromStderr(stderr) {
       );
       
       if (peakLines.length > 0) {
-        console.log(`[FFMPEG_TP] 🔍 Linhas com "peak" encontradas:`, peakLines);
+        logger.debug(() => [`[FFMPEG_TP] 🔍 Linhas com "peak" encontradas:`, peakLines]);
       } else {
-        console.log(`[FFMPEG_TP] 🔍 Nenhuma linha com "peak" encontrada`);
+        logger.debug(`[FFMPEG_TP] 🔍 Nenhuma linha com "peak" encontrada`);
       }
       
       return createNullResult();
     }
     
   } catch (error) {
-    console.error(`[FFMPEG_TP] ❌ Erro ao parsear stderr: ${error.message}`);
+    logger.error(`[FFMPEG_TP] ❌ Erro ao parsear stderr: ${error.message}`);
     return createNullResult();
   }
 }
@@ -189,10 +192,10 @@ export async function analyzeTruePeaksFFmpeg(leftChannel, rightChannel, sampleRa
       throw new Error('tempFilePath é obrigatório para análise FFmpeg');
     }
     
-    console.log(`[FFMPEG_TP] Analisando True Peak via FFmpeg...`);
-    console.log(`[FFMPEG_TP] - Arquivo: ${path.basename(tempFilePath)}`);
-    console.log(`[FFMPEG_TP] - Canais: L=${leftChannel.length}, R=${rightChannel.length}`);
-    console.log(`[FFMPEG_TP] - Sample Rate: ${sampleRate}Hz`);
+    logger.debug(`[FFMPEG_TP] Analisando True Peak via FFmpeg...`);
+    logger.debug(() => [`[FFMPEG_TP] - Arquivo: ${path.basename(tempFilePath)}`]);
+    logger.debug(() => [`[FFMPEG_TP] - Canais: L=${leftChannel.length}, R=${rightChannel.length}`]);
+    logger.debug(() => [`[FFMPEG_TP] - Sample Rate: ${sampleRate}Hz`]);
     
     // Calcular True Peak usando FFmpeg
     const ffmpegResult = await calculateTruePeakFFmpeg(tempFilePath);
@@ -251,15 +254,15 @@ export async function analyzeTruePeaksFFmpeg(leftChannel, rightChannel, sampleRa
       error: ffmpegResult.error || null
     };
     
-    console.log(`[FFMPEG_TP] ✅ Análise concluída em ${Date.now() - startTime}ms`);
-    console.log(`[FFMPEG_TP] - True Peak: ${compatibleResult.truePeakDbtp?.toFixed(2) || 'null'} dBTP`);
-    console.log(`[FFMPEG_TP] - Broadcast compliant: ${compatibleResult.broadcast_compliant ? '✅' : '❌'}`);
+    logger.debug(() => [`[FFMPEG_TP] ✅ Análise concluída em ${Date.now() - startTime}ms`]);
+    logger.debug(() => [`[FFMPEG_TP] - True Peak: ${compatibleResult.truePeakDbtp?.toFixed(2) || 'null'} dBTP`]);
+    logger.debug(() => [`[FFMPEG_TP] - Broadcast compliant: ${compatibleResult.broadcast_compliant ? '✅' : '❌'}`]);
     
     return compatibleResult;
     
   } catch (error) {
     const processingTime = Date.now() - startTime;
-    console.error(`[FFMPEG_TP] ❌ Erro na análise: ${error.message}`);
+    logger.error(`[FFMPEG_TP] ❌ Erro na análise: ${error.message}`);
     
     // Retornar estrutura compatível com todos os campos como null
     return {
@@ -295,4 +298,4 @@ export async function analyzeTruePeaksFFmpeg(leftChannel, rightChannel, sampleRa
   }
 }
 
-console.log('✅ True Peak FFmpeg implementação carregada');
\ No newline at end of file
+logger.debug('✅ True Peak FFmpeg implementação carregada');
\ No newline at end of file
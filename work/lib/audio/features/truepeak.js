@@ -2,6 +2,10 @@
 // ✅ Implementação simplificada e correta
 // 🎯 True Peak >= Sample Peak com diferença mínima
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:truepeak');
+
 // Threshold para clipping em domínio True Peak (>-1 dBTP)
 const TRUE_PEAK_CLIP_THRESHOLD_DBTP = -1.0;
 const TRUE_PEAK_CLIP_THRESHOLD_LINEAR = Math.pow(10, TRUE_PEAK_CLIP_THRESHOLD_DBTP / 20); // ≈0.891
@@ -12,7 +16,7 @@ const TRUE_PEAK_CLIP_THRESHOLD_LINEAR = Math.pow(10, TRUE_PEAK_CLIP_THRESHOLD_DB
 class TruePeakDetector {
   constructor(sampleRate = 48000) {
     this.sampleRate = sampleRate;
-    console.log(`🏔️ True Peak Detector: Interpolação linear 4x (${sampleRate}Hz)`);
+    logger.debug(() => [`🏔️ True Peak Detector: Interpolação linear 4x (${sampleRate}Hz)`]);
   }
 
   /**
@@ -21,7 +25,7 @@ class TruePeakDetector {
    * @returns {Object} Métricas de true peak
    */
   detectTruePeak(channel) {
-    console.log('🏔️ Detectando true peaks (interpolação linear)...');
+    logger.debug('🏔️ Detectando true peaks (interpolação linear)...');
     const startTime = Date.now();
     
     let maxTruePeak = 0;
@@ -75,17 +79,17 @@ class TruePeakDetector {
     const samplePeakdB = maxSamplePeak > 0 ? 20 * Math.log10(maxSamplePeak) : -Infinity;
     const processingTime = Date.now() - startTime;
     
-    console.log(`🔍 [DEBUG] Sample Peak: ${samplePeakdB.toFixed(2)} dB, True Peak: ${dBTP.toFixed(2)} dBTP`);
-    console.log(`🔍 [DEBUG] Diferença: ${(dBTP - samplePeakdB).toFixed(2)} dB (interpolação linear)`);
+    logger.debug(() => [`🔍 [DEBUG] Sample Peak: ${samplePeakdB.toFixed(2)} dB, True Peak: ${dBTP.toFixed(2)} dBTP`]);
+    logger.debug(() => [`🔍 [DEBUG] Diferença: ${(dBTP - samplePeakdB).toFixed(2)} dB (interpolação linear)`]);
     
     // True Peak deve ser >= Sample Peak
     if (isFinite(dBTP) && isFinite(samplePeakdB) && dBTP < samplePeakdB) {
-      console.warn(`⚠️ [TRUE_PEAK_ANOMALY] True Peak menor que Sample Peak - corrigindo`);
+      logger.warn(`⚠️ [TRUE_PEAK_ANOMALY] True Peak menor que Sample Peak - corrigindo`);
       dBTP = samplePeakdB; // Garantir que TP >= SP
       maxTruePeak = maxSamplePeak;
     }
 
-    console.log(`✅ True Peak (linear) em ${processingTime}ms: ${dBTP.toFixed(2)} dBTP`);
+    logger.debug(() => [`✅ True Peak (linear) em ${processingTime}ms: ${dBTP.toFixed(2)} dBTP`]);
 
     return {
       maxDbtp: dBTP,
@@ -156,7 +160,7 @@ function analyzeTruePeaks(leftChannel, rightChannel, sampleRate = 48000) {
   // Validação final
   if (isFinite(maxTruePeakdBTP) && isFinite(maxSamplePeakdBFS)) {
     if (maxTruePeakdBTP < maxSamplePeakdBFS) {
-      console.warn(`⚠️ [TRUE_PEAK_ANOMALY] True Peak corrigido para igualar Sample Peak`);
+      logger.warn(`⚠️ [TRUE_PEAK_ANOMALY] True Peak corrigido para igualar Sample Peak`);
       maxTruePeakdBTP = maxSamplePeakdBFS;
     }
   }
@@ -23,6 +23,9 @@
  */
 
 import FFT from 'fft-js';
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:fft-optimized');
 
 /**
  * 🧮 Classe OptimizedFFT - Wrapper compatível com FastFFT
@@ -47,7 +50,7 @@ class OptimizedFFT {
     // Cache mock para compatibilidade com API antiga
     this._cache = new Map();
     
-    console.log(`[FFT_OPTIMIZED] ✅ Inicializado com size=${size} (fft-js engine)`);
+    logger.debug(() => [`[FFT_OPTIMIZED] ✅ Inicializado com size=${size} (fft-js engine)`]);
   }
   
   /**
@@ -182,7 +185,7 @@ class STFTEngine {
     const spectrogram = [];
     const powerSpectrum = new Float32Array(this.fftSize / 2);
     
-    console.log(`🎵 STFT: ${numFrames} frames, FFT=${this.fftSize}, hop=${this.hopSize}`);
+    logger.debug(() => [`🎵 STFT: ${numFrames} frames, FFT=${this.fftSize}, hop=${this.hopSize}`]);
     
     // Processar cada frame
     for (let frame = 0; frame < numFrames; frame++) {
@@ -1,6 +1,10 @@
 // 🌊 FFT ENGINE - Transformada rápida de Fourier via WASM
 // Motor FFT otimizado com windowing e análise espectral
 
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:fft');
+
 // 🚀 OTIMIZAÇÃO PERFORMANCE: Cache GLOBAL de twiddle factors
 // Reutilizado entre todas as instâncias FFT (evita recálculo)
 // Twiddle factors são valores matemáticos determinísticos
@@ -204,7 +208,7 @@ class STFTEngine {
     const spectrogram = [];
     const powerSpectrum = new Float32Array(this.fftSize / 2);
     
-    console.log(`🎵 STFT: ${numFrames} frames, FFT=${this.fftSize}, hop=${this.hopSize}`);
+    logger.debug(() => [`🎵 STFT: ${numFrames} frames, FFT=${this.fftSize}, hop=${this.hopSize}`]);
     
     // Processar cada frame
     for (let frame = 0; frame < numFrames; frame++) {
@@ -0,0 +1,376 @@
+// ⚡ QUICK-SCAN - Análise leve para visitantes anônimos
+// Decodifica só um trecho central do arquivo, reamostrado (padrão: 45s a 32kHz), e mede
+// LUFS integrado, True Peak, DR e 4 bandas grossas. Sem segmentação FFT completa, estéreo,
+// scoring, sugestões ou IA — ordem de grandeza menos CPU que o pipeline completo.
+// Upgrade: o resultado guarda fileKey, tamanho e duração medida; a análise completa pedida
+// após o cadastro reaproveita o upload, a cópia local (lib/audio/source-cache.js) e a duração
+// (pré-aloca o decode sem ffprobe). O upgrade exige o token devolvido só ao visitante
+// (results guarda apenas o hash).
+
+import { createHash, timingSafeEqual } from 'crypto';
+import { calculateLoudnessMetrics } from './features/loudness.js';
+import { DynamicRangeCalculator } from './features/dynamics-corrected.js';
+import { FastFFT, WindowFunctions } from './fft.js';
+import { createLogger } from '../logger.js';
+
+const logger = createLogger('audio:quick-scan');
+
+/**
+ * 🔧 Configuração (env sobrescreve taxa e tamanho do trecho)
+ */
+export const QUICK_SCAN_CONFIG = {
+  sampleRate: Number(process.env.QUICK_SCAN_SAMPLE_RATE) || 32000,
+  excerptSeconds: Number(process.env.QUICK_SCAN_EXCERPT_SECONDS) || 45,
+  wholeFileFactor: 1.3,       // arquivo até 1.3× o trecho: decodifica inteiro (sem -ss/-t)
+  fftSize: 2048,              // 15.6 Hz/bin em 32kHz: suficiente para 4 bandas
+  bandHop: 4096,              // um frame a cada 2: espectro médio de 45s não precisa de todos
+  truePeakRateHz: 192000,     // superamostragem até ~192kHz (6x em 32kHz, 4x em 48kHz)
+  truePeakTaps: 8,            // meia-largura do kernel sinc janelado (amostras de entrada)
+  truePeakCandidateDb: -6,    // só interpola ao redor de amostras a até 6 dB do pico de amostra
+  fullSampleRate: 48000       // taxa do decode completo (expectedFrames do upgrade)
+};
+
+export const QUICK_SCAN_VERSION = 1;
+
+/**
+ * 🌈 Bandas grossas (4 em vez das 7 do pipeline completo)
+ * high termina no Nyquist da taxa do quick-scan (16kHz em 32kHz)
+ */
+export const QUICK_SCAN_BANDS = {
+  low: { min: 20, max: 150, name: 'Low', description: 'Sub + graves' },
+  lowMid: { min: 150, max: 500, name: 'Low-Mid', description: 'Médios graves' },
+  mid: { min: 500, max: 4000, name: 'Mid', description: 'Médios' },
+  high: { min: 4000, max: 20000, name: 'High', description: 'Agudos (até o Nyquist do trecho)' }
+};
+
+/**
+ * 🎯 Janela do trecho: centro da faixa (evita intro/fade-out)
+ * @param {number|null} sourceDurationSeconds - duração pelo ffprobe (null = desconhecida)
+ * @param {number} excerptSeconds
+ * @returns {{startSeconds: number, durationSeconds: number|null, coverage: number|null}}
+ *   durationSeconds null = arquivo inteiro
+ */
+export function selectExcerptWindow(sourceDurationSeconds, excerptSeconds = QUICK_SCAN_CONFIG.excerptSeconds) {
+  if (!Number.isFinite(sourceDurationSeconds) || sourceDurationSeconds <= 0) {
+    // Sem duração: começo do arquivo, limitado ao tamanho do trecho
+    return { startSeconds: 0, durationSeconds: excerptSeconds, coverage: null };
+  }
+  if (sourceDurationSeconds <= excerptSeconds * QUICK_SCAN_CONFIG.wholeFileFactor) {
+    return { startSeconds: 0, durationSeconds: null, coverage: 1 };
+  }
+  const startSeconds = Math.round((sourceDurationSeconds - excerptSeconds) / 2 * 1000) / 1000;
+  return {
+    startSeconds,
+    durationSeconds: excerptSeconds,
+    coverage: Math.round(excerptSeconds / sourceDurationSeconds * 1000) / 1000
+  };
+}
+
+// Kernels por fase: sinc janelado (Hann) com meia-largura `taps`, fase p/L entre x[n] e x[n+1]
+const kernelCache = new Map();
+
+function interpolationKernels(oversample, taps) {
+  const key = `${oversample}:${taps}`;
+  let kernels = kernelCache.get(key);
+  if (kernels) return kernels;
+
+  kernels = [];
+  for (let p = 1; p < oversample; p++) {
+    const frac = p / oversample;
+    const kernel = new Float64Array(2 * taps);
+    for (let k = -taps + 1; k <= taps; k++) {
+      const t = k - frac;
+      const sinc = Math.sin(Math.PI * t) / (Math.PI * t);
+      const window = 0.5 * (1 + Math.cos(Math.PI * t / taps));
+      kernel[k + taps - 1] = sinc * window;
+    }
+    kernels.push(kernel);
+  }
+  kernelCache.set(key, kernels);
+  return kernels;
+}
+
+/**
+ * 🏔️ True Peak por interpolação sinc (polifásica), só ao redor dos picos de amostra
+ * Amostras abaixo de truePeakCandidateDb do pico não geram inter-sample peak relevante
+ * @param {Float32Array} left
+ * @param {Float32Array} right
+ * @param {number} sampleRate
+ * @returns {{truePeakLinear: number, truePeakDbtp: number, samplePeakLinear: number, samplePeakDb: number, oversample: number, candidates: number}}
+ */
+export function computeTruePeak(left, right, sampleRate, {
+  rateHz = QUICK_SCAN_CONFIG.truePeakRateHz,
+  taps = QUICK_SCAN_CONFIG.truePeakTaps,
+  candidateDb = QUICK_SCAN_CONFIG.truePeakCandidateDb
+} = {}) {
+  const oversample = Math.max(1, Math.round(rateHz / sampleRate));
+  const kernels = interpolationKernels(oversample, taps);
+
+  let samplePeak = 0;
+  for (const channel of [left, right]) {
+    for (let i = 0; i < channel.length; i++) {
+      const abs = Math.abs(channel[i]);
+      if (abs > samplePeak) samplePeak = abs;
+    }
+  }
+
+  let truePeak = samplePeak;
+  let candidates = 0;
+  const threshold = samplePeak * Math.pow(10, candidateDb / 20);
+
+  if (samplePeak > 0 && kernels.length) {
+    for (const channel of [left, right]) {
+      const n = channel.length;
+      let lastInterval = -1;
+      for (let i = 0; i < n; i++) {
+        if (Math.abs(channel[i]) < threshold) continue;
+        candidates++;
+        // Intervalos (i-1, i) e (i, i+1): o pico entre amostras fica ao lado de uma amostra alta
+        for (let start = Math.max(0, i - 1, lastInterval + 1); start <= i && start < n - 1; start++) {
+          lastInterval = start;
+          for (const kernel of kernels) {
+            let acc = 0;
+            for (let k = -taps + 1; k <= taps; k++) {
+              const idx = start + k;
+              if (idx >= 0 && idx < n) acc += channel[idx] * kernel[k + taps - 1];
+            }
+            const abs = Math.abs(acc);
+            if (abs > truePeak) truePeak = abs;
+          }
+        }
+      }
+    }
+  }
+
+  const toDb = (linear) => (linear > 0 ? 20 * Math.log10(linear) : -Infinity);
+  return {
+    truePeakLinear: truePeak,
+    truePeakDbtp: toDb(truePeak),
+    samplePeakLinear: samplePeak,
+    samplePeakDb: toDb(samplePeak),
+    oversample,
+    candidates
+  };
+}
+
+/**
+ * 🌈 Bandas grossas: espectro médio do canal mid (L+R)/2, um frame de fftSize a cada hop
+ * energy_db: nível médio da banda (dBFS; senoide de amplitude 1 ≈ -3 dB)
+ * percentage: fração da energia 20Hz-Nyquist
+ * @param {Float32Array} left
+ * @param {Float32Array} right
+ * @param {number} sampleRate
+ * @param {Object} options - { fftSize, hop }
+ * @returns {Object} { low, lowMid, mid, high, frames, _status }
+ */
+export function computeCoarseBands(left, right, sampleRate, { fftSize = QUICK_SCAN_CONFIG.fftSize, hop = QUICK_SCAN_CONFIG.bandHop } = {}) {
+  const length = Math.min(left.length, right.length);
+  const frames = length >= fftSize ? Math.floor((length - fftSize) / hop) + 1 : 0;
+  const nyquist = sampleRate / 2;
+  const binHz = sampleRate / fftSize;
+  const keys = Object.keys(QUICK_SCAN_BANDS);
+
+  const ranges = keys.map((key) => {
+    const band = QUICK_SCAN_BANDS[key];
+    const max = Math.min(band.max, nyquist);
+    return {
+      key,
+      min: band.min,
+      max,
+      // [min, max): bins exatamente na fronteira ficam só na banda de cima
+      fromBin: Math.max(1, Math.ceil(band.min / binHz)),
+      toBin: Math.min(fftSize / 2 - 1, Math.ceil(max / binHz) - 1)
+    };
+  });
+
+  if (frames === 0) {
+    return { _status: 'insufficient_audio', frames: 0 };
+  }
+
+  const fft = new FastFFT();
+  const window = WindowFunctions.hann(fftSize);
+  let windowPower = 0;
+  for (let i = 0; i < fftSize; i++) windowPower += window[i] * window[i];
+
+  const frame = new Float32Array(fftSize);
+  const sums = new Float64Array(ranges.length);
+
+  for (let f = 0; f < frames; f++) {
+    const offset = f * hop;
+    for (let i = 0; i < fftSize; i++) {
+      frame[i] = 0.5 * (left[offset + i] + right[offset + i]) * window[i];
+    }
+    const { magnitude } = fft.fft(frame);
+    for (let b = 0; b < ranges.length; b++) {
+      const { fromBin, toBin } = ranges[b];
+      let acc = 0;
+      for (let k = fromBin; k <= toBin; k++) acc += magnitude[k] * magnitude[k];
+      sums[b] += acc;
+    }
+  }
+
+  // Parseval (espectro de um lado): média quadrática = 2·Σ|X|² / (N·Σw²)
+  const scale = 2 / (fftSize * windowPower * frames);
+  let total = 0;
+  for (let b = 0; b < sums.length; b++) total += sums[b];
+
+  const result = { _status: 'calculated', frames };
+  ranges.forEach(({ key, min, max }, b) => {
+    const meanSquare = sums[b] * scale;
+    result[key] = {
+      energy_db: meanSquare > 0 ? 10 * Math.log10(meanSquare) : null,
+      percentage: total > 0 ? (sums[b] / total) * 100 : 0,
+      range: `${min}-${Math.round(max)}Hz`,
+      name: QUICK_SCAN_BANDS[key].name
+    };
+  });
+  return result;
+}
+
+/**
+ * ⚡ Métricas do quick-scan sobre o trecho decodificado
+ * @param {Object} audio - saída de decodeAudioExcerpt (leftChannel/rightChannel/sampleRate)
+ * @returns {Object} { lufsIntegrated, truePeakDbtp, truePeakLinear, samplePeakDb, dynamicRange, bands, timings }
+ */
+export function runQuickScan(audio) {
+  const { leftChannel: left, rightChannel: right, sampleRate } = audio;
+  const timings = {};
+  const timed = (name, fn) => {
+    const start = Date.now();
+    const value = fn();
+    timings[`${name}Ms`] = Date.now() - start;
+    return value;
+  };
+
+  const loudness = timed('loudness', () => calculateLoudnessMetrics(left, right, sampleRate));
+  const truePeak = timed('truePeak', () => computeTruePeak(left, right, sampleRate));
+  const dynamics = timed('dynamics', () => DynamicRangeCalculator.calculateDynamicRange(left, right, sampleRate));
+  const bands = timed('bands', () => computeCoarseBands(left, right, sampleRate));
+
+  logger.debug(() => ['[QUICK-SCAN] métricas', {
+    lufs: loudness.lufs_integrated,
+    truePeakDbtp: truePeak.truePeakDbtp,
+    dr: dynamics?.dynamicRange ?? null,
+    timings
+  }]);
+
+  return {
+    lufsIntegrated: Number.isFinite(loudness.lufs_integrated) ? loudness.lufs_integrated : null,
+    truePeakDbtp: Number.isFinite(truePeak.truePeakDbtp) ? truePeak.truePeakDbtp : null,
+    truePeakLinear: truePeak.truePeakLinear,
+    samplePeakDb: Number.isFinite(truePeak.samplePeakDb) ? truePeak.samplePeakDb : null,
+    dynamicRange: dynamics?.dynamicRange ?? null,
+    bands,
+    timings
+  };
+}
+
+/**
+ * 📦 JSON do quick-scan (subconjunto do JSON completo + bloco quickScan para o upgrade)
+ * @param {Object} metrics - saída de runQuickScan
+ * @param {Object} ctx - { jobId, fileKey, fileName, genre, soundDestination, excerpt, sampleRate,
+ *   sourceDurationSeconds, sourceBytes, processingMs, upgradeTokenHash }
+ */
+export function buildQuickScanResult(metrics, ctx) {
+  const { lufsIntegrated, truePeakDbtp, truePeakLinear, samplePeakDb, dynamicRange, bands } = metrics;
+
+  return {
+    analysisTier: 'quick',
+    mode: 'genre',
+    genre: ctx.genre || null,
+    soundDestination: ctx.soundDestination || 'pista',
+    score: null,
+    technicalData: {
+      lufsIntegrated,
+      truePeakDbtp,
+      truePeakLinear,
+      samplePeakDb,
+      dynamicRange,
+      coarseBands: bands
+    },
+    loudness: { integrated: lufsIntegrated, unit: 'LUFS' },
+    truePeak: { maxDbtp: truePeakDbtp, maxLinear: truePeakLinear },
+    dynamics: { range: dynamicRange },
+    metadata: {
+      fileName: ctx.fileName || null,
+      jobId: ctx.jobId,
+      stage: 'quick-scan',
+      timestamp: new Date().toISOString(),
+      duration: ctx.sourceDurationSeconds ?? null,
+      sampleRate: ctx.sampleRate,
+      channels: 2,
+      processingTime: ctx.processingMs ?? null
+    },
+    quickScan: {
+      version: QUICK_SCAN_VERSION,
+      excerpt: ctx.excerpt,
+      sampleRate: ctx.sampleRate,
+      timings: metrics.timings,
+      upgrade: {
+        fileKey: ctx.fileKey,
+        sourceBytes: ctx.sourceBytes ?? null,
+        sourceDurationSeconds: ctx.sourceDurationSeconds ?? null,
+        tokenHash: ctx.upgradeTokenHash || null
+      }
+    },
+    suggestions: [],
+    aiSuggestions: []
+  };
+}
+
+/**
+ * 🔑 Hash do token de upgrade (o token vai só na resposta ao visitante; o job guarda o hash)
+ * Mesmo hash calculado em api/audio/analyze-anonymous.js
+ * @param {string} token
+ */
+export function hashUpgradeToken(token) {
+  return createHash('sha256').update(String(token)).digest('hex');
+}
+
+function upgradeTokenMatches(tokenHash, token) {
+  if (typeof tokenHash !== 'string' || typeof token !== 'string' || !token) return false;
+  const expected = Buffer.from(tokenHash, 'hex');
+  const actual = Buffer.from(hashUpgradeToken(token), 'hex');
+  return expected.length === actual.length && timingSafeEqual(expected, actual);
+}
+
+/**
+ * 🔁 Upgrade: valida o job do quick-scan e monta o que a análise completa reaproveita
+ * @param {Object|null} row - linha de jobs (id, file_key, status, results)
+ * @param {string|null} fileKey - fileKey enviado no pedido (opcional: vazio = reaproveita o upload)
+ * @param {string|null} upgradeToken - token devolvido ao visitante na criação do quick-scan
+ * @returns {{upgrade: Object}|{error: string, message: string}}
+ */
+export function resolveQuickScanUpgrade(row, fileKey = null, upgradeToken = null) {
+  if (!row) {
+    return { error: 'QUICK_SCAN_NOT_FOUND', message: 'Análise rápida não encontrada' };
+  }
+  const results = typeof row.results === 'string' ? JSON.parse(row.results) : row.results;
+  if (row.status !== 'completed' || results?.analysisTier !== 'quick' || !results.quickScan?.upgrade) {
+    return { error: 'QUICK_SCAN_NOT_UPGRADABLE', message: 'O job informado não é uma análise rápida concluída' };
+  }
+
+  const source = results.quickScan.upgrade;
+  // Quem só conhece o jobId (ex.: jobs sem token, anteriores a esta checagem) não faz upgrade
+  if (!upgradeTokenMatches(source.tokenHash, upgradeToken)) {
+    return { error: 'QUICK_SCAN_FORBIDDEN', message: 'Token de upgrade inválido para esta análise rápida' };
+  }
+
+  const sourceFileKey = source.fileKey || row.file_key;
+  if (fileKey && fileKey !== sourceFileKey) {
+    return { error: 'QUICK_SCAN_FILE_MISMATCH', message: 'O arquivo enviado não corresponde à análise rápida' };
+  }
+
+  const seconds = source.sourceDurationSeconds;
+  const { fullSampleRate } = QUICK_SCAN_CONFIG;
+  return {
+    upgrade: {
+      quickScanJobId: row.id,
+      fileKey: sourceFileKey,
+      sourceBytes: source.sourceBytes ?? null,
+      sourceDurationSeconds: seconds ?? null,
+      // Mesma folga do decoder (+1s para VBR)
+      expectedFrames: Number.isFinite(seconds) && seconds > 0 ? Math.ceil(seconds * fullSampleRate) + fullSampleRate : null
+    }
+  };
+}
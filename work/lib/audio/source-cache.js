@@ -0,0 +1,142 @@
+// 🔁 SOURCE CACHE - Cópia local do arquivo baixado pelo quick-scan
+// O quick-scan move o download para cá em vez de apagar; se o visitante se cadastrar e pedir a
+// análise completa (quickScanUpgrade no payload), analysis-job.js "toma" a cópia (rename atômico)
+// e pula o download do bucket. Entradas expiram por TTL e o diretório tem teto de bytes;
+// em outra máquina (ou após expirar) o worker simplesmente baixa de novo.
+
+import fs from 'fs/promises';
+import path from 'path';
+import { createHash } from 'crypto';
+import { fileURLToPath } from 'url';
+import { createLogger } from '../logger.js';
+
+const logger = createLogger('audio:source-cache');
+
+const WORK_DIR = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '../..');
+
+/**
+ * 🔧 Configuração (env: SOURCE_CACHE_DIR, SOURCE_CACHE_TTL_MS, SOURCE_CACHE_MAX_MB)
+ */
+export const SOURCE_CACHE_CONFIG = {
+  dir: process.env.SOURCE_CACHE_DIR || path.join(WORK_DIR, 'temp', 'source-cache'),
+  ttlMs: Number(process.env.SOURCE_CACHE_TTL_MS) || 2 * 60 * 60 * 1000,   // 2h para o cadastro + upgrade
+  maxBytes: (Number(process.env.SOURCE_CACHE_MAX_MB) || 2048) * 1024 * 1024
+};
+
+/**
+ * Sobrescrever configuração (testes)
+ * @param {Object} overrides
+ */
+export function configureSourceCache(overrides = {}) {
+  Object.assign(SOURCE_CACHE_CONFIG, overrides);
+}
+
+/**
+ * Caminho da entrada: hash do fileKey (keys têm '/') + extensão original (o decoder valida pela extensão)
+ * @param {string} fileKey
+ */
+export function sourceCachePath(fileKey) {
+  const digest = createHash('sha1').update(fileKey).digest('hex');
+  return path.join(SOURCE_CACHE_CONFIG.dir, `${digest}${path.extname(fileKey).toLowerCase()}`);
+}
+
+// rename entre volumes (EXDEV) cai para cópia + remoção
+async function moveFile(from, to) {
+  try {
+    await fs.rename(from, to);
+  } catch (err) {
+    if (err.code !== 'EXDEV') throw err;
+    await fs.copyFile(from, to);
+    await fs.unlink(from);
+  }
+}
+
+/**
+ * Guardar o arquivo baixado (move; o caller não deve mais apagá-lo)
+ * @param {string} fileKey
+ * @param {string} filePath - arquivo local já baixado
+ * @returns {Promise<string>} caminho no cache
+ */
+export async function putCachedSource(fileKey, filePath) {
+  await fs.mkdir(SOURCE_CACHE_CONFIG.dir, { recursive: true });
+  const target = sourceCachePath(fileKey);
+  await moveFile(filePath, target);
+  await pruneSourceCache().catch((err) => logger.warn(`⚠️ [SOURCE-CACHE] Falha ao podar: ${err.message}`));
+  return target;
+}
+
+/**
+ * Tomar a cópia para um job (move para destPath; a entrada sai do cache)
+ * @param {string} fileKey
+ * @param {string} destPath
+ * @param {Object} options - { expectedBytes, now }
+ * @returns {Promise<boolean>} false = ausente, expirada ou tamanho diferente (baixar do bucket)
+ */
+export async function takeCachedSource(fileKey, destPath, { expectedBytes = null, now = Date.now() } = {}) {
+  const source = sourceCachePath(fileKey);
+  let stats;
+  try {
+    stats = await fs.stat(source);
+  } catch (_) {
+    return false;
+  }
+
+  if (now - stats.mtimeMs > SOURCE_CACHE_CONFIG.ttlMs || (expectedBytes && stats.size !== expectedBytes)) {
+    await fs.unlink(source).catch(() => {});
+    return false;
+  }
+
+  try {
+    await moveFile(source, destPath);
+    return true;
+  } catch (_) {
+    return false; // outro job tomou a mesma entrada
+  }
+}
+
+/**
+ * Remover entradas expiradas e, acima do teto, as mais antigas
+ * @param {Object} options - { now }
+ * @returns {Promise<{removed: number, bytes: number}>} bytes = total que ficou no cache
+ */
+export async function pruneSourceCache({ now = Date.now() } = {}) {
+  let names;
+  try {
+    names = await fs.readdir(SOURCE_CACHE_CONFIG.dir);
+  } catch (_) {
+    return { removed: 0, bytes: 0 };
+  }
+
+  const entries = [];
+  for (const name of names) {
+    const file = path.join(SOURCE_CACHE_CONFIG.dir, name);
+    try {
+      const stats = await fs.stat(file);
+      if (stats.isFile()) entries.push({ file, size: stats.size, mtimeMs: stats.mtimeMs });
+    } catch (_) {}
+  }
+
+  let removed = 0;
+  let bytes = 0;
+  const kept = [];
+  for (const entry of entries) {
+    if (now - entry.mtimeMs > SOURCE_CACHE_CONFIG.ttlMs) {
+      await fs.unlink(entry.file).catch(() => {});
+      removed++;
+    } else {
+      kept.push(entry);
+      bytes += entry.size;
+    }
+  }
+
+  kept.sort((a, b) => a.mtimeMs - b.mtimeMs);
+  while (bytes > SOURCE_CACHE_CONFIG.maxBytes && kept.length) {
+    const oldest = kept.shift();
+    await fs.unlink(oldest.file).catch(() => {});
+    bytes -= oldest.size;
+    removed++;
+  }
+
+  if (removed) logger.debug(() => [`[SOURCE-CACHE] ${removed} entrada(s) removida(s); ${(bytes / 1024 / 1024).toFixed(1)}MB em cache`]);
+  return { removed, bytes };
+}
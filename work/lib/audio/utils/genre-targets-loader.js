@@ -5,19 +5,22 @@
 import fs from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:genre-targets-loader');
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
 // 🚨 LOG DE INICIALIZAÇÃO DO MÓDULO
-console.error('\n\n');
-console.error('╔══════════════════════════════════════════════════════════════╗');
-console.error('║  🔥 GENRE-TARGETS-LOADER.JS INICIALIZADO                    ║');
-console.error('╚══════════════════════════════════════════════════════════════╝');
-console.error('[LOADER-INIT] Módulo carregado em:', new Date().toISOString());
-console.error('[LOADER-INIT] __dirname:', __dirname);
-console.error('[LOADER-INIT] __filename:', __filename);
-console.error('\n\n');
+logger.error('\n\n');
+logger.error('╔══════════════════════════════════════════════════════════════╗');
+logger.error('║  🔥 GENRE-TARGETS-LOADER.JS INICIALIZADO                    ║');
+logger.error('╚══════════════════════════════════════════════════════════════╝');
+logger.error('[LOADER-INIT] Módulo carregado em:', new Date().toISOString());
+logger.error('[LOADER-INIT] __dirname:', __dirname);
+logger.error('[LOADER-INIT] __filename:', __filename);
+logger.error('\n\n');
 
 // Cache global para evitar leituras repetidas
 const targetsCache = new Map();
@@ -97,26 +100,26 @@ export function loadGenreTargets(genre) {
  * @returns {null} - Sempre retorna null (fallback desabilitado)
  */
 async function loadFromHardcodedFallback(normalizedGenre) {
-  console.error('\n\n\n\n\n');
-  console.error('╔═══════════════════════════════════════════════════════════╗');
-  console.error('║  🚨 ERRO CRÍTICO: ARQUIVO JSON NÃO ENCONTRADO 🚨         ║');
-  console.error('║  ❌ FALLBACK HARDCODED FOI DESABILITADO ❌               ║');
-  console.error('╚═══════════════════════════════════════════════════════════╝');
-  console.error('[TARGETS] Genre solicitado:', normalizedGenre);
-  console.error('[TARGETS] Arquivo esperado: work/refs/out/' + normalizedGenre + '.json');
-  console.error('[TARGETS] ⚠️ O sistema NÃO usará valores hardcoded desatualizados');
-  console.error('[TARGETS] ⚠️ Verifique se o arquivo JSON existe e está correto');
-  console.error('[TARGETS] ⚠️ Se necessário, execute o script de geração de targets');
-  console.error('╚═══════════════════════════════════════════════════════════╝');
-  console.error('\n\n\n\n\n');
+  logger.error('\n\n\n\n\n');
+  logger.error('╔═══════════════════════════════════════════════════════════╗');
+  logger.error('║  🚨 ERRO CRÍTICO: ARQUIVO JSON NÃO ENCONTRADO 🚨         ║');
+  logger.error('║  ❌ FALLBACK HARDCODED FOI DESABILITADO ❌               ║');
+  logger.error('╚═══════════════════════════════════════════════════════════╝');
+  logger.error('[TARGETS] Genre solicitado:', normalizedGenre);
+  logger.error('[TARGETS] Arquivo esperado: work/refs/out/' + normalizedGenre + '.json');
+  logger.error('[TARGETS] ⚠️ O sistema NÃO usará valores hardcoded desatualizados');
+  logger.error('[TARGETS] ⚠️ Verifique se o arquivo JSON existe e está correto');
+  logger.error('[TARGETS] ⚠️ Se necessário, execute o script de geração de targets');
+  logger.error('╚═══════════════════════════════════════════════════════════╝');
+  logger.error('\n\n\n\n\n');
   
   // 🚨 LOG DE AUDITORIA CRÍTICO: Fallback desabilitado
-  console.error('[AUDIT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-  console.error('[AUDIT] 🚨 FALLBACK HARDCODED DESABILITADO');
-  console.error('[AUDIT] Genre:', normalizedGenre);
-  console.error('[AUDIT] ❌ Sistema falhou explicitamente');
-  console.error('[AUDIT] ✅ Garantido: Nenhum valor hardcoded usado');
-  console.error('[AUDIT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.error('[AUDIT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.error('[AUDIT] 🚨 FALLBACK HARDCODED DESABILITADO');
+  logger.error('[AUDIT] Genre:', normalizedGenre);
+  logger.error('[AUDIT] ❌ Sistema falhou explicitamente');
+  logger.error('[AUDIT] ✅ Garantido: Nenhum valor hardcoded usado');
+  logger.error('[AUDIT] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
   
   // Retornar null - o sistema upstream deve tratar isso como erro
   return null;
@@ -127,7 +130,7 @@ async function loadFromHardcodedFallback(normalizedGenre) {
  */
 function validateTargetsStructure(targets) {
   if (!targets || typeof targets !== 'object') {
-    console.error('[TARGETS] Targets não é um objeto válido');
+    logger.error('[TARGETS] Targets não é um objeto válido');
     return false;
   }
   
@@ -135,25 +138,25 @@ function validateTargetsStructure(targets) {
   const requiredFields = ['lufs_target', 'true_peak_target', 'dr_target', 'bands'];
   for (const field of requiredFields) {
     if (targets[field] === undefined) {
-      console.error(`[TARGETS] Campo obrigatório ausente: ${field}`);
+      logger.error(`[TARGETS] Campo obrigatório ausente: ${field}`);
       return false;
     }
   }
   
   // Validar que bands é um objeto
   if (!targets.bands || typeof targets.bands !== 'object') {
-    console.error('[TARGETS] Campo "bands" não é um objeto válido');
+    logger.error('[TARGETS] Campo "bands" não é um objeto válido');
     return false;
   }
   
   // Validar que há pelo menos uma banda
   const bandsCount = Object.keys(targets.bands).length;
   if (bandsCount === 0) {
-    console.error('[TARGETS] Nenhuma banda espectral encontrada');
+    logger.error('[TARGETS] Nenhuma banda espectral encontrada');
     return false;
   }
   
-  console.log(`[TARGETS] ✅ Estrutura válida: ${bandsCount} bandas encontradas`);
+  logger.debug(() => [`[TARGETS] ✅ Estrutura válida: ${bandsCount} bandas encontradas`]);
   return true;
 }
 
@@ -241,7 +244,7 @@ function convertToInternalFormat(rawTargets, genre) {
         
         // Validar dados da banda
         if (!bandData || typeof bandData !== 'object') {
-          console.warn(`[TARGETS] Banda ${bandKey} tem estrutura inválida - ignorando`);
+          logger.warn(`[TARGETS] Banda ${bandKey} tem estrutura inválida - ignorando`);
           continue;
         }
         
@@ -257,7 +260,7 @@ function convertToInternalFormat(rawTargets, genre) {
         }
         
         if (target === null) {
-          console.warn(`[TARGETS] Banda ${bandKey} sem target válido - ignorando`);
+          logger.warn(`[TARGETS] Banda ${bandKey} sem target válido - ignorando`);
           continue;
         }
         
@@ -287,37 +290,37 @@ function convertToInternalFormat(rawTargets, genre) {
     
     // Validar que pelo menos algumas métricas foram convertidas
     if (Object.keys(converted).length === 0) {
-      console.error(`[TARGETS] Nenhuma métrica válida foi convertida para ${genre}`);
+      logger.error(`[TARGETS] Nenhuma métrica válida foi convertida para ${genre}`);
       return null;
     }
     
-    console.log(`[TARGETS] ✅ Conversão concluída: ${Object.keys(converted).length} métricas`);
+    logger.debug(() => [`[TARGETS] ✅ Conversão concluída: ${Object.keys(converted).length} métricas`]);
     
     // 🔍 AUDITORIA LOG 2: Estrutura DEPOIS da conversão
-    console.log('[AUDIT-TARGETS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-    console.log('[AUDIT-TARGETS] LOG 2: ESTRUTURA DEPOIS DE convertToInternalFormat');
-    console.log('[AUDIT-TARGETS] Genre:', genre);
-    console.log('[AUDIT-TARGETS] Top-level keys:', Object.keys(converted));
-    console.log('[AUDIT-TARGETS] Tem .bands?', 'bands' in converted);
-    console.log('[AUDIT-TARGETS] Tem .low_bass?', 'low_bass' in converted);
-    console.log('[AUDIT-TARGETS] Tem .sub?', 'sub' in converted);
+    logger.debug('[AUDIT-TARGETS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[AUDIT-TARGETS] LOG 2: ESTRUTURA DEPOIS DE convertToInternalFormat');
+    logger.debug(() => ['[AUDIT-TARGETS] Genre:', genre]);
+    logger.debug(() => ['[AUDIT-TARGETS] Top-level keys:', Object.keys(converted)]);
+    logger.debug(() => ['[AUDIT-TARGETS] Tem .bands?', 'bands' in converted]);
+    logger.debug(() => ['[AUDIT-TARGETS] Tem .low_bass?', 'low_bass' in converted]);
+    logger.debug(() => ['[AUDIT-TARGETS] Tem .sub?', 'sub' in converted]);
     if (converted.bands) {
-      console.log('[AUDIT-TARGETS] converted.bands keys:', Object.keys(converted.bands));
-      console.log('[AUDIT-TARGETS] converted.bands.low_bass:', JSON.stringify(converted.bands.low_bass, null, 2));
-      console.log('[AUDIT-TARGETS] converted.bands.sub:', JSON.stringify(converted.bands.sub, null, 2));
+      logger.debug(() => ['[AUDIT-TARGETS] converted.bands keys:', Object.keys(converted.bands)]);
+      logger.debug(() => ['[AUDIT-TARGETS] converted.bands.low_bass:', JSON.stringify(converted.bands.low_bass, null, 2)]);
+      logger.debug(() => ['[AUDIT-TARGETS] converted.bands.sub:', JSON.stringify(converted.bands.sub, null, 2)]);
     }
     if (converted.low_bass) {
-      console.log('[AUDIT-TARGETS] converted.low_bass (achatado):', JSON.stringify(converted.low_bass, null, 2));
+      logger.debug(() => ['[AUDIT-TARGETS] converted.low_bass (achatado):', JSON.stringify(converted.low_bass, null, 2)]);
     }
     if (converted.sub) {
-      console.log('[AUDIT-TARGETS] converted.sub (achatado):', JSON.stringify(converted.sub, null, 2));
+      logger.debug(() => ['[AUDIT-TARGETS] converted.sub (achatado):', JSON.stringify(converted.sub, null, 2)]);
     }
-    console.log('[AUDIT-TARGETS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+    logger.debug('[AUDIT-TARGETS] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
     
     return converted;
     
   } catch (error) {
-    console.error(`[TARGETS] ❌ Erro na conversão:`, error.message);
+    logger.error(`[TARGETS] ❌ Erro na conversão:`, error.message);
     return null;
   }
 }
@@ -387,7 +390,7 @@ export function normalizeGenreId(genreId) {
   
   // Se é um ID legado, converter para oficial
   if (LEGACY_TO_OFFICIAL[normalized]) {
-    console.log(`[GENRE-NORMALIZE] 🔄 Convertendo legado: "${normalized}" → "${LEGACY_TO_OFFICIAL[normalized]}"`);
+    logger.debug(() => [`[GENRE-NORMALIZE] 🔄 Convertendo legado: "${normalized}" → "${LEGACY_TO_OFFICIAL[normalized]}"`]);
     return LEGACY_TO_OFFICIAL[normalized];
   }
   
@@ -408,7 +411,7 @@ function isFiniteNumber(value) {
 export function clearTargetsCache() {
   const size = targetsCache.size;
   targetsCache.clear();
-  console.log(`[TARGETS] 🗑️ Cache cleared (${size} entries removed)`);
+  logger.debug(() => [`[TARGETS] 🗑️ Cache cleared (${size} entries removed)`]);
 }
 
 /**
@@ -425,36 +428,36 @@ export function clearTargetsCache() {
  * Caminho base: work/refs/out/<genre>.json
  */
 export async function loadGenreTargetsFromWorker(genre) {
-  console.error('\n');
-  console.error('╔═══════════════════════════════════════════════════════════╗');
-  console.error('║  🎯 LOADGENRETARGETSFROMWORKER - MODO SEGURO            ║');
-  console.error('╚═══════════════════════════════════════════════════════════╝');
-  console.error('[TARGETS-WORKER] Genre recebido:', genre);
-  console.error('[TARGETS-WORKER] Timestamp:', new Date().toISOString());
+  logger.error('\n');
+  logger.error('╔═══════════════════════════════════════════════════════════╗');
+  logger.error('║  🎯 LOADGENRETARGETSFROMWORKER - MODO SEGURO            ║');
+  logger.error('╚═══════════════════════════════════════════════════════════╝');
+  logger.error('[TARGETS-WORKER] Genre recebido:', genre);
+  logger.error('[TARGETS-WORKER] Timestamp:', new Date().toISOString());
   
   // 1. VALIDAR GÊNERO
   if (!genre || typeof genre !== 'string') {
     const error = `[TARGET-ERROR] Gênero inválido: ${genre}`;
-    console.error(error);
+    logger.error(error);
     throw new Error(error);
   }
 
   // 🎯 Usar gênero exatamente como recebido (sem normalização ou mapeamento legado)
   const normalizedGenre = genre.trim();
-  console.error('[TARGETS-WORKER] Genre exato (sem normalização):', normalizedGenre);
+  logger.error('[TARGETS-WORKER] Genre exato (sem normalização):', normalizedGenre);
 
   // 2. VERIFICAR CACHE
   if (targetsCache.has(normalizedGenre)) {
-    console.error('[TARGETS-WORKER] ✅ Cache HIT:', normalizedGenre);
+    logger.error('[TARGETS-WORKER] ✅ Cache HIT:', normalizedGenre);
     return targetsCache.get(normalizedGenre);
   }
   
   // 3. DETECTAR PATH CORRETO AUTOMATICAMENTE (MULTI-TENTATIVA)
-  console.error('[TARGETS-WORKER] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
-  console.error('[TARGETS-WORKER] 🔍 INICIANDO DETECÇÃO AUTOMÁTICA DE PATH');
-  console.error('[TARGETS-WORKER] process.cwd():', process.cwd());
-  console.error('[TARGETS-WORKER] __dirname:', __dirname);
-  console.error('[TARGETS-WORKER] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.error('[TARGETS-WORKER] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.error('[TARGETS-WORKER] 🔍 INICIANDO DETECÇÃO AUTOMÁTICA DE PATH');
+  logger.error('[TARGETS-WORKER] process.cwd():', process.cwd());
+  logger.error('[TARGETS-WORKER] __dirname:', __dirname);
+  logger.error('[TARGETS-WORKER] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
   
   // Lista de caminhos candidatos (ordem de prioridade)
   const candidatePaths = [
@@ -477,7 +480,7 @@ export async function loadGenreTargetsFromWorker(genre) {
     path.resolve(process.cwd(), '..', 'work', 'refs', 'out')
   ];
   
-  console.error('[TARGETS-WORKER] 🔎 Testando caminhos candidatos:');
+  logger.error('[TARGETS-WORKER] 🔎 Testando caminhos candidatos:');
   
   let foundPath = null;
   let jsonPath = null;
@@ -486,55 +489,55 @@ export async function loadGenreTargetsFromWorker(genre) {
     const candidatePath = candidatePaths[i];
     const testJsonPath = path.join(candidatePath, `${normalizedGenre}.json`);
     
-    console.error(`[TARGETS-WORKER] [${i + 1}/${candidatePaths.length}] Testando:`, candidatePath);
+    logger.error(`[TARGETS-WORKER] [${i + 1}/${candidatePaths.length}] Testando:`, candidatePath);
     
     // Verificar se diretório existe
     const dirExists = fs.existsSync(candidatePath);
-    console.error(`[TARGETS-WORKER]   → Diretório existe? ${dirExists}`);
+    logger.error(`[TARGETS-WORKER]   → Diretório existe? ${dirExists}`);
     
     if (dirExists) {
       // Listar arquivos no diretório
       try {
         const files = fs.readdirSync(candidatePath);
-        console.error(`[TARGETS-WORKER]   → Arquivos encontrados (${files.length}):`, files.slice(0, 5).join(', '));
+        logger.error(`[TARGETS-WORKER]   → Arquivos encontrados (${files.length}):`, files.slice(0, 5).join(', '));
         
         // Verificar se o JSON específico existe
         if (fs.existsSync(testJsonPath)) {
-          console.error(`[TARGETS-WORKER]   → ✅ ARQUIVO ENCONTRADO!`);
+          logger.error(`[TARGETS-WORKER]   → ✅ ARQUIVO ENCONTRADO!`);
           foundPath = candidatePath;
           jsonPath = testJsonPath;
           break;
         } else {
-          console.error(`[TARGETS-WORKER]   → ❌ ${normalizedGenre}.json não encontrado neste diretório`);
+          logger.error(`[TARGETS-WORKER]   → ❌ ${normalizedGenre}.json não encontrado neste diretório`);
         }
       } catch (e) {
-        console.error(`[TARGETS-WORKER]   → Erro listando diretório:`, e.message);
+        logger.error(`[TARGETS-WORKER]   → Erro listando diretório:`, e.message);
       }
     } else {
-      console.error(`[TARGETS-WORKER]   → ❌ Diretório não existe`);
+      logger.error(`[TARGETS-WORKER]   → ❌ Diretório não existe`);
     }
   }
   
   // 4. VALIDAR SE ENCONTROU O ARQUIVO
   if (!foundPath || !jsonPath) {
     const error = `[TARGET-ERROR] JSON oficial não encontrado para o gênero: ${genre} (${normalizedGenre}). Todos os caminhos testados falharam.`;
-    console.error('╔═══════════════════════════════════════════════════════════╗');
-    console.error('║  ❌ ERRO CRÍTICO: ARQUIVO NÃO ENCONTRADO                ║');
-    console.error('╚═══════════════════════════════════════════════════════════╝');
-    console.error(error);
-    console.error('[TARGETS-WORKER] Caminhos testados:');
+    logger.error('╔═══════════════════════════════════════════════════════════╗');
+    logger.error('║  ❌ ERRO CRÍTICO: ARQUIVO NÃO ENCONTRADO                ║');
+    logger.error('╚═══════════════════════════════════════════════════════════╝');
+    logger.error(error);
+    logger.error('[TARGETS-WORKER] Caminhos testados:');
     candidatePaths.forEach((p, i) => {
-      console.error(`  [${i + 1}] ${p}`);
+      logger.error(`  [${i + 1}] ${p}`);
     });
     throw new Error(error);
   }
   
-  console.error('╔═══════════════════════════════════════════════════════════╗');
-  console.error('║  ✅ PATH ENCONTRADO COM SUCESSO                          ║');
-  console.error('╚═══════════════════════════════════════════════════════════╝');
-  console.error('[TARGETS-WORKER] 🎯 Path base encontrado:', foundPath);
-  console.error('[TARGETS-WORKER] 📄 Arquivo completo:', jsonPath);
-  console.error('[TARGETS-WORKER] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
+  logger.error('╔═══════════════════════════════════════════════════════════╗');
+  logger.error('║  ✅ PATH ENCONTRADO COM SUCESSO                          ║');
+  logger.error('╚═══════════════════════════════════════════════════════════╝');
+  logger.error('[TARGETS-WORKER] 🎯 Path base encontrado:', foundPath);
+  logger.error('[TARGETS-WORKER] 📄 Arquivo completo:', jsonPath);
+  logger.error('[TARGETS-WORKER] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━');
 
   
   // 5. LER E PARSEAR JSON
@@ -542,11 +545,11 @@ export async function loadGenreTargetsFromWorker(genre) {
   try {
     rawData = fs.readFileSync(jsonPath, 'utf-8');
     parsed = JSON.parse(rawData);
-    console.error('[TARGETS-WORKER] ✅ JSON parseado com sucesso');
-    console.error('[TARGETS-WORKER] Tamanho:', rawData.length, 'bytes');
+    logger.error('[TARGETS-WORKER] ✅ JSON parseado com sucesso');
+    logger.error('[TARGETS-WORKER] Tamanho:', rawData.length, 'bytes');
   } catch (error) {
     const errorMsg = `[TARGET-ERROR] Erro ao ler/parsear JSON para ${genre}: ${error.message}`;
-    console.error(errorMsg);
+    logger.error(errorMsg);
     throw new Error(errorMsg);
   }
   
@@ -555,28 +558,28 @@ export async function loadGenreTargetsFromWorker(genre) {
   const rawTargets = genreData.legacy_compatibility || genreData.hybrid_processing || genreData;
 
   // ── AUDIT STEP 2 ──
-  console.log("AUDIT RAW GENRE DATA →", JSON.stringify(genreData).slice(0, 300));
-  console.log("AUDIT RAW TARGET SOURCE →",
+  logger.debug(() => ["AUDIT RAW GENRE DATA →", JSON.stringify(genreData).slice(0, 300)]);
+  logger.debug(() => ["AUDIT RAW TARGET SOURCE →",
     genreData.legacy_compatibility ? "legacy_compatibility"
     : genreData.hybrid_processing   ? "hybrid_processing"
     : "root"
-  );
-  console.log("AUDIT RAW TARGET VALUES →", {
+  ]);
+  logger.debug(() => ["AUDIT RAW TARGET VALUES →", {
     lufs_target: rawTargets.lufs_target,
     tol_lufs:    rawTargets.tol_lufs,
     lufs_min:    rawTargets.lufs_min,
     lufs_max:    rawTargets.lufs_max
-  });
+  }]);
 
-  console.error('[TARGETS-WORKER] Top-level keys:', Object.keys(rawTargets));
-  console.error('[TARGETS-WORKER] lufs_target:', rawTargets.lufs_target);
-  console.error('[TARGETS-WORKER] true_peak_target:', rawTargets.true_peak_target);
-  console.error('[TARGETS-WORKER] dr_target:', rawTargets.dr_target);
+  logger.error('[TARGETS-WORKER] Top-level keys:', Object.keys(rawTargets));
+  logger.error('[TARGETS-WORKER] lufs_target:', rawTargets.lufs_target);
+  logger.error('[TARGETS-WORKER] true_peak_target:', rawTargets.true_peak_target);
+  logger.error('[TARGETS-WORKER] dr_target:', rawTargets.dr_target);
   
   // 7. VALIDAR ESTRUTURA MÍNIMA
   if (!validateTargetsStructure(rawTargets)) {
     const error = `[TARGET-ERROR] Estrutura inválida no JSON de ${genre}`;
-    console.error(error);
+    logger.error(error);
     throw new Error(error);
   }
   
@@ -585,7 +588,7 @@ export async function loadGenreTargetsFromWorker(genre) {
   
   if (!convertedTargets || Object.keys(convertedTargets).length === 0) {
     const error = `[TARGET-ERROR] Conversão falhou para ${genre}`;
-    console.error(error);
+    logger.error(error);
     throw new Error(error);
   }
   
@@ -593,19 +596,19 @@ export async function loadGenreTargetsFromWorker(genre) {
   targetsCache.set(normalizedGenre, convertedTargets);
   
   // 10. LOG DE SUCESSO
-  console.error('╔═══════════════════════════════════════════════════════════╗');
-  console.error('║  ✅✅✅ TARGETS CARREGADOS COM SUCESSO ✅✅✅            ║');
-  console.error('╚═══════════════════════════════════════════════════════════╝');
-  console.error('[TARGETS-WORKER] Genre:', normalizedGenre);
-  console.error('[TARGETS-WORKER] Path:', jsonPath);
-  console.error('[TARGETS-WORKER] LUFS:', convertedTargets.lufs?.target);
-  console.error('[TARGETS-WORKER] TruePeak:', convertedTargets.truePeak?.target);
-  console.error('[TARGETS-WORKER] DR:', convertedTargets.dr?.target);
-  console.error('[TARGETS-WORKER] Bands:', convertedTargets.bands ? Object.keys(convertedTargets.bands).length : 0);
-  console.error('[TARGETS-WORKER] ✅ Targets retornados com garantia de integridade');
-  console.error('\n');
+  logger.error('╔═══════════════════════════════════════════════════════════╗');
+  logger.error('║  ✅✅✅ TARGETS CARREGADOS COM SUCESSO ✅✅✅            ║');
+  logger.error('╚═══════════════════════════════════════════════════════════╝');
+  logger.error('[TARGETS-WORKER] Genre:', normalizedGenre);
+  logger.error('[TARGETS-WORKER] Path:', jsonPath);
+  logger.error('[TARGETS-WORKER] LUFS:', convertedTargets.lufs?.target);
+  logger.error('[TARGETS-WORKER] TruePeak:', convertedTargets.truePeak?.target);
+  logger.error('[TARGETS-WORKER] DR:', convertedTargets.dr?.target);
+  logger.error('[TARGETS-WORKER] Bands:', convertedTargets.bands ? Object.keys(convertedTargets.bands).length : 0);
+  logger.error('[TARGETS-WORKER] ✅ Targets retornados com garantia de integridade');
+  logger.error('\n');
   
   return convertedTargets;
 }
 
-console.log('🎯 Genre Targets Loader carregado - Sistema de carregamento dinâmico ativo');
+logger.debug('🎯 Genre Targets Loader carregado - Sistema de carregamento dinâmico ativo');
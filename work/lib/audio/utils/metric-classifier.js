@@ -2,6 +2,10 @@
 // Garante consistência entre Tabela, Score e Sugestões
 // Baseado no mesmo threshold: OK / ATTENTION (2× tol) / CRITICAL (> 2× tol)
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:metric-classifier');
+
 /**
  * 🎨 Sistema de Classificação Unificado
  * REGRA: OK se diff ≤ tol, ATTENTION se diff ≤ 2*tol, CRITICAL se diff > 2*tol
@@ -55,7 +59,7 @@ const EPS = 1e-6;
 export function classifyMetric(diff, tolerance, options = {}) {
   // 🛡️ Validação de entrada
   if (!Number.isFinite(diff) || !Number.isFinite(tolerance)) {
-    console.error('[AUDIT_FIX][CLASSIFIER] ❌ Valores inválidos:', { diff, tolerance });
+    logger.error('[AUDIT_FIX][CLASSIFIER] ❌ Valores inválidos:', { diff, tolerance });
     return CLASSIFICATION_LEVELS.CRITICAL; // Fail-safe
   }
 
@@ -63,27 +67,27 @@ export function classifyMetric(diff, tolerance, options = {}) {
   
   // 🔥 LOG PARA AUDITORIA
   const metricName = options.metricName || 'unknown';
-  console.log(`[AUDIT_FIX][CLASSIFIER] Classificando ${metricName}:`, {
+  logger.debug(() => [`[AUDIT_FIX][CLASSIFIER] Classificando ${metricName}:`, {
     absDiff: absDiff.toFixed(3),
     tolerance: tolerance.toFixed(3),
     multiplicador: (absDiff / tolerance).toFixed(2)
-  });
+  }]);
 
   // ✅ ZONA OK: diff ≤ tolerance
   if (absDiff <= tolerance + EPS) {
-    console.log(`[AUDIT_FIX][CLASSIFIER] → OK (diff ≤ tol)`);
+    logger.debug(`[AUDIT_FIX][CLASSIFIER] → OK (diff ≤ tol)`);
     return CLASSIFICATION_LEVELS.OK;
   }
 
   // 🟡 ZONA ATTENTION: diff ≤ 2 × tolerance
   const multiplicador = absDiff / tolerance;
   if (multiplicador <= 2 + EPS) {
-    console.log(`[AUDIT_FIX][CLASSIFIER] → ATTENTION (diff ≤ 2×tol, multiplicador=${multiplicador.toFixed(2)})`);
+    logger.debug(() => [`[AUDIT_FIX][CLASSIFIER] → ATTENTION (diff ≤ 2×tol, multiplicador=${multiplicador.toFixed(2)})`]);
     return CLASSIFICATION_LEVELS.ATTENTION;
   }
 
   // 🔴 ZONA CRITICAL: diff > 2 × tolerance
-  console.log(`[AUDIT_FIX][CLASSIFIER] → CRITICAL (diff > 2×tol, multiplicador=${multiplicador.toFixed(2)})`);
+  logger.debug(() => [`[AUDIT_FIX][CLASSIFIER] → CRITICAL (diff > 2×tol, multiplicador=${multiplicador.toFixed(2)})`]);
   return CLASSIFICATION_LEVELS.CRITICAL;
 }
 
@@ -107,7 +111,7 @@ const TRUE_PEAK_HARD_CAP = 0.0;
 export function classifyTruePeak(truePeakValue, target = {}, options = {}) {
   // 🛡️ Validação
   if (!Number.isFinite(truePeakValue)) {
-    console.error('[CLASSIFIER][TRUE_PEAK] ❌ Valor inválido:', truePeakValue);
+    logger.error('[CLASSIFIER][TRUE_PEAK] ❌ Valor inválido:', truePeakValue);
     return {
       classification: CLASSIFICATION_LEVELS.CRITICAL,
       diff: NaN,
@@ -118,12 +122,12 @@ export function classifyTruePeak(truePeakValue, target = {}, options = {}) {
   // 🚨 REGRA ABSOLUTA: TP > 0.0 = CRÍTICA SEMPRE
   if (truePeakValue > TRUE_PEAK_HARD_CAP) {
     const diff = truePeakValue - TRUE_PEAK_HARD_CAP;
-    console.log('[CLASSIFIER][TRUE_PEAK] 🚨 CRÍTICA ABSOLUTA: TP > 0.0 dBTP', {
+    logger.debug(() => ['[CLASSIFIER][TRUE_PEAK] 🚨 CRÍTICA ABSOLUTA: TP > 0.0 dBTP', {
       value: truePeakValue.toFixed(2),
       hardCap: TRUE_PEAK_HARD_CAP,
       excesso: diff.toFixed(2),
       reasonCode: 'TP_ABOVE_ZERO'
-    });
+    }]);
     
     return {
       classification: CLASSIFICATION_LEVELS.CRITICAL,
@@ -147,11 +151,11 @@ export function classifyTruePeak(truePeakValue, target = {}, options = {}) {
   if (truePeakValue > warnFrom) {
     diff = truePeakValue - warnFrom;
     reasonCode = 'TP_NEAR_CLIP';
-    console.log('[CLASSIFIER][TRUE_PEAK] ⚠️ Próximo do limite:', {
+    logger.debug(() => ['[CLASSIFIER][TRUE_PEAK] ⚠️ Próximo do limite:', {
       value: truePeakValue.toFixed(2),
       warnFrom,
       diff: diff.toFixed(2)
-    });
+    }]);
     return {
       classification: CLASSIFICATION_LEVELS.ATTENTION,
       diff,
@@ -166,11 +170,11 @@ export function classifyTruePeak(truePeakValue, target = {}, options = {}) {
   if (truePeakValue < min) {
     diff = truePeakValue - min;
     reasonCode = 'TP_TOO_LOW';
-    console.log('[CLASSIFIER][TRUE_PEAK] ℹ️ Abaixo do mínimo:', {
+    logger.debug(() => ['[CLASSIFIER][TRUE_PEAK] ℹ️ Abaixo do mínimo:', {
       value: truePeakValue.toFixed(2),
       min,
       diff: diff.toFixed(2)
-    });
+    }]);
     // TP baixo é OK (margem de segurança), não penalizar
     return {
       classification: CLASSIFICATION_LEVELS.OK,
@@ -185,10 +189,10 @@ export function classifyTruePeak(truePeakValue, target = {}, options = {}) {
   // Dentro do range [min, warnFrom]
   diff = 0;
   reasonCode = 'TP_OK';
-  console.log('[CLASSIFIER][TRUE_PEAK] ✅ OK:', {
+  logger.debug(() => ['[CLASSIFIER][TRUE_PEAK] ✅ OK:', {
     value: truePeakValue.toFixed(2),
     range: `${min} a ${warnFrom}`
-  });
+  }]);
   
   return {
     classification: CLASSIFICATION_LEVELS.OK,
@@ -211,7 +215,7 @@ export function classifyTruePeak(truePeakValue, target = {}, options = {}) {
 export function classifyMetricWithRange(value, target, options = {}) {
   // 🛡️ Validação de entrada
   if (!Number.isFinite(value)) {
-    console.error('[AUDIT_FIX][CLASSIFIER_RANGE] ❌ Valor inválido:', value);
+    logger.error('[AUDIT_FIX][CLASSIFIER_RANGE] ❌ Valor inválido:', value);
     return { 
       classification: CLASSIFICATION_LEVELS.CRITICAL, 
       diff: NaN 
@@ -243,7 +247,7 @@ export function classifyMetricWithRange(value, target, options = {}) {
   }
   // ❌ Caso inválido
   else {
-    console.error('[AUDIT_FIX][CLASSIFIER_RANGE] ❌ Target inválido:', target);
+    logger.error('[AUDIT_FIX][CLASSIFIER_RANGE] ❌ Target inválido:', target);
     return { 
       classification: CLASSIFICATION_LEVELS.CRITICAL, 
       diff: NaN 
@@ -311,4 +315,4 @@ export function calculateScore(classification) {
   }
 }
 
-console.log('[AUDIT_FIX] ✅ Metric Classifier carregado - Sistema unificado OK/ATTENTION(2×tol)/CRITICAL');
+logger.debug('[AUDIT_FIX] ✅ Metric Classifier carregado - Sistema unificado OK/ATTENTION(2×tol)/CRITICAL');
@@ -33,6 +33,10 @@
  * - truePeak > 0 dBTP => severidade CRÍTICA sempre
  */
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:normalize-genre-targets');
+
 // 🎯 CONSTANTES FÍSICAS
 const TRUE_PEAK_HARD_CAP = 0.0; // dBTP - NUNCA ultrapassar
 
@@ -43,19 +47,19 @@ const TRUE_PEAK_HARD_CAP = 0.0; // dBTP - NUNCA ultrapassar
  */
 export function normalizeGenreTargets(rawTargets) {
   if (!rawTargets || typeof rawTargets !== 'object') {
-    console.error('[NORMALIZE-TARGETS] ❌ rawTargets inválido:', rawTargets);
+    logger.error('[NORMALIZE-TARGETS] ❌ rawTargets inválido:', rawTargets);
     return null;
   }
 
   // ✅ Se já estiver no formato normalizado, retornar direto
   if (rawTargets._normalized === true || (rawTargets.metrics && rawTargets.metrics.lufs)) {
-    console.log('[NORMALIZE-TARGETS] ✅ Targets já estão normalizados');
+    logger.debug('[NORMALIZE-TARGETS] ✅ Targets já estão normalizados');
     return rawTargets;
   }
   
   // ✅ Detectar formato antigo (lufs.target em vez de lufs_target)
   if (rawTargets.lufs && typeof rawTargets.lufs === 'object' && 'target' in rawTargets.lufs) {
-    console.log('[NORMALIZE-TARGETS] ⚠️ Formato intermediário detectado - convertendo para novo formato');
+    logger.debug('[NORMALIZE-TARGETS] ⚠️ Formato intermediário detectado - convertendo para novo formato');
     return convertIntermediateFormat(rawTargets);
   }
 
@@ -173,16 +177,16 @@ export function normalizeGenreTargets(rawTargets) {
   normalized.stereo = { ...normalized.metrics.stereo };
 
   // ── AUDIT STEP 3 ──
-  console.log("AUDIT NORMALIZED TARGETS →", normalized.metrics?.lufs);
+  logger.debug(() => ["AUDIT NORMALIZED TARGETS →", normalized.metrics?.lufs]);
 
   // 📊 Log resumido (evitar flood)
-  console.log('[NORMALIZE-TARGETS] ✅ Normalização completa:', {
+  logger.debug(() => ['[NORMALIZE-TARGETS] ✅ Normalização completa:', {
     version: normalized._version,
     lufs: `[${normalized.metrics.lufs.min.toFixed(1)}, ${normalized.metrics.lufs.max.toFixed(1)}]`,
     truePeak: `[${normalized.metrics.truePeak.min.toFixed(1)}, ${normalized.metrics.truePeak.max.toFixed(1)}] hardCap=${normalized.metrics.truePeak.hardCap}`,
     dr: `[${normalized.metrics.dr.min.toFixed(1)}, ${normalized.metrics.dr.max.toFixed(1)}]`,
     bandsCount: Object.keys(normalized.bands).length
-  });
+  }]);
 
   return normalized;
 }
@@ -203,7 +207,7 @@ export function normalizeGenreTargets(rawTargets) {
  */
 export function applyStreamingOverride(normalizedTargets, destination = 'pista') {
   if (!normalizedTargets || !normalizedTargets._normalized) {
-    console.error('[STREAMING-OVERRIDE] ❌ Targets não normalizados');
+    logger.error('[STREAMING-OVERRIDE] ❌ Targets não normalizados');
     return normalizedTargets;
   }
 
@@ -246,11 +250,11 @@ export function applyStreamingOverride(normalizedTargets, destination = 'pista')
   overridden._destination = destination;
   overridden._overrideApplied = true;
 
-  console.log('[STREAMING-OVERRIDE] ✅ Override aplicado:', {
+  logger.debug(() => ['[STREAMING-OVERRIDE] ✅ Override aplicado:', {
     destination,
     lufs: `[${overridden.metrics.lufs.min.toFixed(1)}, ${overridden.metrics.lufs.max.toFixed(1)}]`,
     truePeak: `[${overridden.metrics.truePeak.min.toFixed(1)}, ${overridden.metrics.truePeak.max.toFixed(1)}]`
-  });
+  }]);
 
   return overridden;
 }
@@ -312,13 +316,13 @@ function convertIntermediateFormat(intermediate) {
  */
 export function validateNormalizedTargets(targets) {
   if (!targets || typeof targets !== 'object') {
-    console.error('[VALIDATE-TARGETS] ❌ Targets ausente');
+    logger.error('[VALIDATE-TARGETS] ❌ Targets ausente');
     return false;
   }
 
   // Verificar flag de normalização
   if (!targets._normalized && !targets.metrics) {
-    console.error('[VALIDATE-TARGETS] ❌ Targets não estão normalizados');
+    logger.error('[VALIDATE-TARGETS] ❌ Targets não estão normalizados');
     return false;
   }
 
@@ -333,17 +337,17 @@ export function validateNormalizedTargets(targets) {
   });
 
   if (missingMetrics.length > 0) {
-    console.error('[VALIDATE-TARGETS] ❌ Métricas inválidas:', missingMetrics);
+    logger.error('[VALIDATE-TARGETS] ❌ Métricas inválidas:', missingMetrics);
     return false;
   }
 
   // Verificar hard cap do True Peak
   if (metrics.truePeak && metrics.truePeak.max > TRUE_PEAK_HARD_CAP) {
-    console.error('[VALIDATE-TARGETS] ❌ True Peak max excede hard cap:', metrics.truePeak.max);
+    logger.error('[VALIDATE-TARGETS] ❌ True Peak max excede hard cap:', metrics.truePeak.max);
     return false;
   }
 
-  console.log('[VALIDATE-TARGETS] ✅ Targets válidos');
+  logger.debug('[VALIDATE-TARGETS] ✅ Targets válidos');
   return true;
 }
 
@@ -473,7 +477,7 @@ export function calculateBandSeverity(bandKey, value, normalizedTargets) {
   };
 }
 
-console.log('🔧 Normalize Genre Targets v3.0.0 carregado (Mix-Oriented: classifySeverity central, 3 níveis: OK/ATENÇÃO/CRÍTICA)');
+logger.debug('🔧 Normalize Genre Targets v3.0.0 carregado (Mix-Oriented: classifySeverity central, 3 níveis: OK/ATENÇÃO/CRÍTICA)');
 
 /**
  * ═══════════════════════════════════════════════════════════════════════════
@@ -619,13 +623,13 @@ export function evaluateMetricByKey(metricKey, value, normalizedTargets) {
 
   // ── AUDIT STEP 4 ──
   if (metricKey === 'lufs') {
-    console.log("AUDIT LOUDNESS CHECK →", {
+    logger.debug(() => ["AUDIT LOUDNESS CHECK →", {
       value,
       target: target.target,
       tol:    target.tolerance,
       min:    target.min,
       max:    target.max
-    });
+    }]);
   }
 
   const _auditResult = evaluateMetric(value, {
@@ -641,7 +645,7 @@ export function evaluateMetricByKey(metricKey, value, normalizedTargets) {
 
   // ── AUDIT STEP 5 ──
   if (metricKey === 'lufs') {
-    console.log("AUDIT RESULT →", _auditResult);
+    logger.debug(() => ["AUDIT RESULT →", _auditResult]);
   }
 
   return _auditResult;
@@ -0,0 +1,143 @@
+// 🎚️ PCM CHANNEL SINK - Deinterleave incremental de f32le bruto (saída do FFmpeg)
+// Cada chunk do stdout é escrito direto nos Float32Array por canal, conforme chega:
+// nada de Buffer com o arquivo inteiro, nem parse de RIFF, nem segunda cópia.
+// - Chunks que cortam uma amostra/frame no meio ficam num carry de ≤ 1 frame
+// - Chunk alinhado em 4 bytes é lido por uma view Float32Array (sem cópia)
+// - Mesmas regras do parser WAV: amostra não finita = erro, clamp em [-1, 1]
+// - Teto de frames (duração máxima) verificado a cada chunk → fail-fast sem esperar o fim
+// - finish() devolve subarray() da capacidade (zero-copy) — só re-copia se sobrar > 25%
+
+import { makeErr } from '../error-handling.js';
+
+/**
+ * 🔧 Configurações padrão do sink
+ */
+export const PCM_SINK_CONFIG = {
+  DEFAULT_INITIAL_SECONDS: 60, // capacidade inicial quando não há estimativa de duração
+  GROWTH_FACTOR: 2,            // crescimento geométrico (cópias amortizadas ≤ 1x o total)
+  MAX_SLACK_RATIO: 0.25        // acima disso finish() devolve cópia justa em vez de view
+};
+
+const BYTES_PER_SAMPLE = 4;
+const HOST_LITTLE_ENDIAN = new Uint8Array(new Uint32Array([1]).buffer)[0] === 1;
+
+export class PcmChannelSink {
+
+  /**
+   * @param {Object} options
+   * @param {number} [options.channels=2]
+   * @param {number} [options.sampleRate=48000]
+   * @param {number} [options.expectedFrames] - estimativa (ex: ffprobe); sem ela usa DEFAULT_INITIAL_SECONDS
+   * @param {number} [options.maxFrames=Infinity] - acima disso write() lança wav_duration_too_long
+   * @param {string} [options.stage='decode'] - stage dos erros (makeErr)
+   */
+  constructor({ channels = 2, sampleRate = 48000, expectedFrames = null, maxFrames = Infinity, stage = 'decode' } = {}) {
+    this.channels = channels;
+    this.sampleRate = sampleRate;
+    this.maxFrames = maxFrames;
+    this.stage = stage;
+    this.frameBytes = channels * BYTES_PER_SAMPLE;
+
+    const initial = expectedFrames > 0 ? Math.ceil(expectedFrames) : sampleRate * PCM_SINK_CONFIG.DEFAULT_INITIAL_SECONDS;
+    this.capacity = Math.max(1, Math.min(initial, maxFrames));
+    this.buffers = Array.from({ length: channels }, () => new Float32Array(this.capacity));
+    this.frames = 0;
+    this.reallocations = 0;
+
+    this.carry = Buffer.alloc(this.frameBytes);
+    this.carryBytes = 0;
+  }
+
+  /**
+   * Consumir um chunk f32le intercalado (qualquer tamanho/alinhamento)
+   * @param {Buffer} chunk
+   */
+  write(chunk) {
+    let offset = 0;
+
+    // Completar o frame cortado no chunk anterior
+    if (this.carryBytes > 0) {
+      const take = Math.min(this.frameBytes - this.carryBytes, chunk.length);
+      chunk.copy(this.carry, this.carryBytes, 0, take);
+      this.carryBytes += take;
+      offset = take;
+      if (this.carryBytes < this.frameBytes) return;
+      this.appendFrames(this.carry, 0, 1);
+      this.carryBytes = 0;
+    }
+
+    const frames = Math.floor((chunk.length - offset) / this.frameBytes);
+    if (frames > 0) {
+      this.appendFrames(chunk, offset, frames);
+      offset += frames * this.frameBytes;
+    }
+
+    if (offset < chunk.length) {
+      chunk.copy(this.carry, 0, offset);
+      this.carryBytes = chunk.length - offset;
+    }
+  }
+
+  /**
+   * Deintercalar `frames` frames completos de buf[byteOffset...]
+   */
+  appendFrames(buf, byteOffset, frames) {
+    this.ensureCapacity(this.frames + frames);
+
+    const channels = this.channels;
+    const absoluteOffset = buf.byteOffset + byteOffset;
+    const view = HOST_LITTLE_ENDIAN && absoluteOffset % BYTES_PER_SAMPLE === 0
+      ? new Float32Array(buf.buffer, absoluteOffset, frames * channels)
+      : null;
+
+    for (let c = 0; c < channels; c++) {
+      const out = this.buffers[c];
+      let dst = this.frames;
+      for (let i = 0, src = c; i < frames; i++, src += channels, dst++) {
+        const v = view ? view[src] : buf.readFloatLE(byteOffset + src * BYTES_PER_SAMPLE);
+        if (!Number.isFinite(v)) {
+          throw makeErr(this.stage, `PCM: amostra não finita no canal ${c}, frame ${dst}: ${v}`, 'wav_non_finite_sample');
+        }
+        out[dst] = v > 1 ? 1 : (v < -1 ? -1 : v);
+      }
+    }
+
+    this.frames += frames;
+  }
+
+  ensureCapacity(needed) {
+    if (needed > this.maxFrames) {
+      const seconds = needed / this.sampleRate;
+      const maxSeconds = this.maxFrames / this.sampleRate;
+      throw makeErr(this.stage, `PCM: duração muito longa: ${seconds.toFixed(1)}s > ${maxSeconds}s`, 'wav_duration_too_long');
+    }
+    if (needed <= this.capacity) return;
+
+    const grown = Math.ceil(this.capacity * PCM_SINK_CONFIG.GROWTH_FACTOR);
+    this.capacity = Math.min(this.maxFrames, Math.max(needed, grown));
+    this.buffers = this.buffers.map(old => {
+      const next = new Float32Array(this.capacity);
+      next.set(old.subarray(0, this.frames));
+      return next;
+    });
+    this.reallocations++;
+  }
+
+  /**
+   * Canais finais com `frames` amostras (bytes de frame incompleto no fim são descartados,
+   * como o Math.floor do parser WAV)
+   * @returns {{ channels: Float32Array[], frames: number, reallocations: number }}
+   */
+  finish() {
+    const frames = this.frames;
+    const slack = (this.capacity - frames) / this.capacity;
+    const channels = this.buffers.map(buffer =>
+      slack > PCM_SINK_CONFIG.MAX_SLACK_RATIO ? buffer.slice(0, frames) : buffer.subarray(0, frames));
+
+    this.buffers = [];
+    this.carryBytes = 0;
+    return { channels, frames, reallocations: this.reallocations };
+  }
+}
+
+export default PcmChannelSink;
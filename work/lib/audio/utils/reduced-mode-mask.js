@@ -0,0 +1,79 @@
+// work/lib/audio/utils/reduced-mode-mask.js
+// Máscara de texto das sugestões em análises de modo reduzido (limite do plano atingido)
+// Usada no fim do pipeline (api/audio/pipeline-complete.js) e no backfill de re-scoring
+// (lib/rescoring/rescoreAnalysis.js) - nenhum texto pago sai do backend nos dois caminhos
+
+/**
+ * Análise em modo reduzido?
+ * @param {Object} results - JSON final (jobs.results)
+ */
+export function isReducedAnalysis(results) {
+  return !!results && (results.isReduced === true || results.analysisMode === 'reduced');
+}
+
+// 🔐 Sugestão IA: mantém estrutura e metadados, remove TODO o texto (e aliases)
+function maskAiSuggestion(suggestion = {}) {
+  return {
+    id: suggestion.id,
+    categoria: suggestion.categoria || suggestion.category,
+    nivel: suggestion.nivel || suggestion.priority || 'média',
+    metric: suggestion.metric,
+    severity: suggestion.severity,
+    aiEnhanced: suggestion.aiEnhanced,
+    _validated: suggestion._validated,
+    _realTarget: suggestion._realTarget,
+
+    problema: null,
+    causaProvavel: null,
+    solucao: null,
+    pluginRecomendado: null,
+    dicaExtra: null,
+    parametros: null,
+
+    message: null,
+    action: null,
+    observation: null,
+    recommendation: null,
+
+    blocked: true
+  };
+}
+
+// 🔐 Sugestão base (suggestions, problemsAnalysis, diagnostics)
+function maskBaseSuggestion(suggestion = {}) {
+  return {
+    id: suggestion.id,
+    category: suggestion.category || suggestion.type,
+    metric: suggestion.metric,
+    priority: suggestion.priority,
+    _validated: suggestion._validated,
+
+    message: null,
+    title: null,
+    action: null,
+    description: null,
+
+    blocked: true
+  };
+}
+
+/**
+ * Remover o texto de todas as listas de sugestões (altera e retorna o próprio objeto)
+ * @param {Object} results - JSON final em modo reduzido
+ * @returns {Object} results
+ */
+export function maskReducedSuggestions(results) {
+  if (Array.isArray(results.aiSuggestions)) {
+    results.aiSuggestions = results.aiSuggestions.map(maskAiSuggestion);
+  }
+  if (Array.isArray(results.suggestions)) {
+    results.suggestions = results.suggestions.map(maskBaseSuggestion);
+  }
+  // Frontend usa diagnostics.suggestions como fallback quando suggestions está vazio
+  for (const section of [results.problemsAnalysis, results.diagnostics]) {
+    if (Array.isArray(section?.suggestions)) {
+      section.suggestions = section.suggestions.map(maskBaseSuggestion);
+    }
+  }
+  return results;
+}
@@ -0,0 +1,83 @@
+/**
+ * 🎯 SCORING TARGETS - Conversões dos targets de gênero usadas no scoring
+ *
+ * Compartilhado entre o pipeline (api/audio/pipeline-complete.js) e o backfill de
+ * re-scoring (lib/rescoring/rescoreAnalysis.js): os dois precisam chegar EXATAMENTE
+ * nos mesmos targets para que o score re-calculado bata com o de uma análise nova.
+ */
+
+/**
+ * Override por destino do áudio (runtime - único ponto)
+ * Streaming normaliza em -14 LUFS / -1 dBTP; pista usa os targets do gênero.
+ * @param {Object} baseTargets - targets nested do gênero (loadGenreTargetsFromWorker)
+ * @param {string} [soundDestination='pista'] - 'pista' | 'streaming'
+ * @returns {Object} cópia com override aplicado (baseTargets não é alterado)
+ */
+export function applySoundDestinationOverride(baseTargets, soundDestination = 'pista') {
+  const targets = structuredClone(baseTargets);
+
+  if (soundDestination === 'streaming') {
+    if (!targets.lufs) targets.lufs = {};
+    targets.lufs.target = -14;
+    targets.lufs.min = -14;
+    targets.lufs.max = -14;
+    targets.lufs.tolerance = 1.0;
+    targets.lufs.critical = 1.5;
+
+    if (!targets.truePeak) targets.truePeak = {};
+    targets.truePeak.target = -1.0;
+    targets.truePeak.min = -1.5;
+    targets.truePeak.max = -1.0;
+    targets.truePeak.tolerance = 0.5;
+    targets.truePeak.critical = 0.75;
+  }
+
+  return targets;
+}
+
+/**
+ * Formato aninhado {lufs: {target}} → flat {lufs_target} esperado por computeMixScore
+ * @param {Object} customTargets - targets nested (com override aplicado)
+ */
+export function toScoringReference(customTargets) {
+  return {
+    lufs_target: customTargets.lufs?.target ?? -14,
+    tol_lufs: customTargets.lufs?.tolerance ?? 3.0,
+    tol_lufs_min: customTargets.lufs?.tolerance ?? 3.0,
+    tol_lufs_max: customTargets.lufs?.tolerance ?? 3.0,
+
+    true_peak_target: customTargets.truePeak?.target ?? -1.0,
+    tol_true_peak: customTargets.truePeak?.tolerance ?? 0.5,
+
+    dr_target: customTargets.dr?.target ?? 10,
+    tol_dr: customTargets.dr?.tolerance ?? 5,
+
+    lra_target: customTargets.lra?.target ?? 7,
+    tol_lra: customTargets.lra?.tolerance ?? 5,
+
+    stereo_target: customTargets.stereoWidth?.target ?? 0.3,
+    tol_stereo: customTargets.stereoWidth?.tolerance ?? 0.7,
+
+    // Copiar bands se existirem
+    bands: customTargets.bands || {}
+  };
+}
+
+/**
+ * Targets flat COM override para os gates do frontend (data.targets)
+ * @param {Object} genreTargets - targets nested
+ */
+export function toFrontendFlatTargets(genreTargets) {
+  return {
+    lufs_target: genreTargets.lufs?.target ?? -14,
+    tol_lufs: genreTargets.lufs?.tolerance ?? 3.0,
+    true_peak_target: genreTargets.truePeak?.target ?? -1.0,
+    tol_true_peak: genreTargets.truePeak?.tolerance ?? 0.5,
+    dr_target: genreTargets.dr?.target ?? 10,
+    tol_dr: genreTargets.dr?.tolerance ?? 5,
+    lra_target: genreTargets.lra?.target ?? 7,
+    tol_lra: genreTargets.lra?.tolerance ?? 5,
+    stereo_target: genreTargets.stereoWidth?.target ?? 0.3,
+    tol_stereo: genreTargets.stereoWidth?.tolerance ?? 0.7
+  };
+}
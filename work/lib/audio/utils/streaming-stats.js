@@ -0,0 +1,317 @@
+// 📉 STREAMING STATS - Sketches de memória constante para agregação por frame
+// Substituem "guardar todos os valores + sort" nos agregadores:
+// - RunningStats: média/variância de Welford + min/max (exato, O(1) memória)
+// - QuantileSketch: percentis exatos até EXACT_LIMIT valores, depois t-digest (merging, k1)
+// - LoudnessHistogram: histograma de loudness em passos de 0.01 LU para LRA / mediana short-term
+
+/**
+ * 🔧 Configurações padrão dos sketches
+ */
+export const STREAMING_STATS_CONFIG = {
+  COMPRESSION: 100,          // δ do t-digest (≈ δ·π/2 centróides no máximo)
+  EXACT_LIMIT: 512,          // abaixo disso os percentis são exatos (buffer simples)
+  LOUDNESS_MIN: -150,        // LUFS - limite inferior do histograma (abaixo = primeiro bin)
+  LOUDNESS_MAX: 20,          // LUFS - limite superior
+  LOUDNESS_RESOLUTION: 0.01  // LU por bin → erro máximo de percentil = 0.01 LU
+};
+
+/**
+ * 📊 Média, variância (Welford), min e max em uma passada
+ * `total` guarda a soma na ordem de inserção: total / count é idêntico ao reduce + divisão
+ * dos agregadores antigos; `mean` (Welford) fica para variância numericamente estável.
+ */
+export class RunningStats {
+
+  constructor() {
+    this.count = 0;
+    this.total = 0;
+    this.mean = 0;
+    this.m2 = 0;
+    this.min = Infinity;
+    this.max = -Infinity;
+  }
+
+  /**
+   * Adicionar valor (não finitos são ignorados)
+   */
+  add(value) {
+    if (!Number.isFinite(value)) return this;
+    this.count++;
+    this.total += value;
+    const delta = value - this.mean;
+    this.mean += delta / this.count;
+    this.m2 += delta * (value - this.mean);
+    if (value < this.min) this.min = value;
+    if (value > this.max) this.max = value;
+    return this;
+  }
+
+  /**
+   * Combinar com outro acumulador (Chan et al.) — permite agregação paralela por bloco
+   */
+  merge(other) {
+    if (!other || other.count === 0) return this;
+    if (this.count === 0) {
+      Object.assign(this, { count: other.count, total: other.total, mean: other.mean, m2: other.m2, min: other.min, max: other.max });
+      return this;
+    }
+    const count = this.count + other.count;
+    const delta = other.mean - this.mean;
+    this.m2 += other.m2 + delta * delta * (this.count * other.count) / count;
+    this.mean += delta * other.count / count;
+    this.count = count;
+    this.total += other.total;
+    this.min = Math.min(this.min, other.min);
+    this.max = Math.max(this.max, other.max);
+    return this;
+  }
+
+  /** Variância populacional (÷ n) */
+  get variance() {
+    return this.count > 0 ? this.m2 / this.count : 0;
+  }
+
+  /** Variância amostral (÷ n-1) */
+  get sampleVariance() {
+    return this.count > 1 ? this.m2 / (this.count - 1) : 0;
+  }
+
+  get std() {
+    return Math.sqrt(this.variance);
+  }
+
+  /** Média pela soma direta (mesmo resultado de reduce((a, v) => a + v, 0) / n) */
+  get average() {
+    return this.count > 0 ? this.total / this.count : 0;
+  }
+}
+
+/**
+ * 🎯 Percentis em memória limitada
+ * Até exactLimit valores guarda o buffer e responde exato (mesma mediana par/ímpar dos agregadores);
+ * acima disso comprime em um t-digest e o erro fica concentrado no meio da distribuição
+ * (tipicamente < 0.5% de rank para δ=100; caudas mais precisas).
+ */
+export class QuantileSketch {
+
+  constructor({ compression = STREAMING_STATS_CONFIG.COMPRESSION, exactLimit = STREAMING_STATS_CONFIG.EXACT_LIMIT } = {}) {
+    this.compression = compression;
+    this.exactLimit = exactLimit;
+    this.buffer = [];
+    this.means = null;     // Float64Array dos centróides (modo digest)
+    this.weights = null;
+    this.centroidCount = 0;
+    this.count = 0;
+    this.min = Infinity;
+    this.max = -Infinity;
+  }
+
+  /**
+   * Adicionar valor (não finitos são ignorados)
+   */
+  add(value) {
+    if (!Number.isFinite(value)) return this;
+    this.count++;
+    if (value < this.min) this.min = value;
+    if (value > this.max) this.max = value;
+    this.buffer.push(value);
+    if (this.buffer.length >= this.exactLimit && (this.means !== null || this.count > this.exactLimit)) {
+      this.compress();
+    }
+    return this;
+  }
+
+  /** true enquanto os percentis são exatos */
+  get isExact() {
+    return this.means === null;
+  }
+
+  /**
+   * Funde buffer + centróides existentes (merging t-digest, escala k1)
+   */
+  compress() {
+    const total = this.centroidCount + this.buffer.length;
+    if (total === 0) return;
+
+    const items = new Array(total);
+    for (let i = 0; i < this.centroidCount; i++) items[i] = [this.means[i], this.weights[i]];
+    for (let i = 0; i < this.buffer.length; i++) items[this.centroidCount + i] = [this.buffer[i], 1];
+    items.sort((a, b) => a[0] - b[0]);
+
+    const totalWeight = this.count;
+    const delta = this.compression;
+    const k = (q) => (delta / (2 * Math.PI)) * Math.asin(2 * q - 1);
+    const kInv = (value) => (Math.sin((2 * Math.PI * value) / delta) + 1) / 2;
+
+    const maxCentroids = Math.ceil(delta * Math.PI / 2) + 2;
+    const means = new Float64Array(Math.min(total, maxCentroids * 2));
+    const weights = new Float64Array(means.length);
+    let n = 0;
+    let curMean = items[0][0];
+    let curWeight = items[0][1];
+    let weightSoFar = 0;
+    let qLimit = kInv(k(0) + 1);
+
+    for (let i = 1; i < total; i++) {
+      const [mean, weight] = items[i];
+      const q = (weightSoFar + curWeight + weight) / totalWeight;
+      if (q <= qLimit) {
+        curWeight += weight;
+        curMean += (mean - curMean) * weight / curWeight;
+      } else {
+        means[n] = curMean;
+        weights[n] = curWeight;
+        n++;
+        weightSoFar += curWeight;
+        qLimit = kInv(k(weightSoFar / totalWeight) + 1);
+        curMean = mean;
+        curWeight = weight;
+      }
+    }
+    means[n] = curMean;
+    weights[n] = curWeight;
+    n++;
+
+    this.means = means;
+    this.weights = weights;
+    this.centroidCount = n;
+    this.buffer = [];
+  }
+
+  /**
+   * Percentil com interpolação linear (q em [0, 1]; rank = q·(n-1) no modo exato)
+   * @returns {number|null}
+   */
+  quantile(q) {
+    if (this.count === 0) return null;
+    if (q <= 0) return this.min;
+    if (q >= 1) return this.max;
+
+    if (this.isExact) {
+      const sorted = Float64Array.from(this.buffer).sort();
+      const rank = q * (sorted.length - 1);
+      const lower = Math.floor(rank);
+      const upper = Math.min(lower + 1, sorted.length - 1);
+      return sorted[lower] + (sorted[upper] - sorted[lower]) * (rank - lower);
+    }
+
+    if (this.buffer.length > 0) this.compress();
+
+    const target = q * this.count;
+    let cumulative = 0;
+    let prevCenter = 0;
+    let prevMean = this.min;
+    for (let i = 0; i < this.centroidCount; i++) {
+      const center = cumulative + this.weights[i] / 2;
+      if (target < center) {
+        const span = center - prevCenter;
+        const t = span > 0 ? (target - prevCenter) / span : 0;
+        return prevMean + (this.means[i] - prevMean) * t;
+      }
+      cumulative += this.weights[i];
+      prevCenter = center;
+      prevMean = this.means[i];
+    }
+    const span = this.count - prevCenter;
+    const t = span > 0 ? (target - prevCenter) / span : 1;
+    return prevMean + (this.max - prevMean) * t;
+  }
+
+  /**
+   * Mediana (modo exato: média dos dois centrais em n par, como os agregadores)
+   */
+  median() {
+    if (this.count === 0) return null;
+    if (this.isExact) {
+      const sorted = Float64Array.from(this.buffer).sort();
+      const mid = Math.floor(sorted.length / 2);
+      return sorted.length % 2 === 0 ? (sorted[mid - 1] + sorted[mid]) / 2 : sorted[mid];
+    }
+    return this.quantile(0.5);
+  }
+}
+
+/**
+ * 🔊 Histograma de loudness (LUFS) para LRA e mediana short-term em memória constante
+ * Percentis seguem a regra de loudness.js: valor de índice floor(n·q) entre os selecionados.
+ */
+export class LoudnessHistogram {
+
+  constructor({
+    min = STREAMING_STATS_CONFIG.LOUDNESS_MIN,
+    max = STREAMING_STATS_CONFIG.LOUDNESS_MAX,
+    resolution = STREAMING_STATS_CONFIG.LOUDNESS_RESOLUTION
+  } = {}) {
+    this.min = min;
+    this.resolution = resolution;
+    this.numBins = Math.ceil((max - min) / resolution) + 1;
+    this.counts = new Uint32Array(this.numBins);
+    this.count = 0;
+  }
+
+  binIndex(value) {
+    const index = Math.round((value - this.min) / this.resolution);
+    return index < 0 ? 0 : index >= this.numBins ? this.numBins - 1 : index;
+  }
+
+  binValue(index) {
+    return this.min + index * this.resolution;
+  }
+
+  /**
+   * Adicionar valor em LUFS (-Infinity / NaN ignorados)
+   */
+  add(value) {
+    if (!Number.isFinite(value)) return this;
+    this.counts[this.binIndex(value)]++;
+    this.count++;
+    return this;
+  }
+
+  /**
+   * Quantidade de valores >= threshold
+   */
+  countAtLeast(threshold = -Infinity) {
+    let total = 0;
+    for (let i = this.firstBin(threshold); i < this.numBins; i++) total += this.counts[i];
+    return total;
+  }
+
+  firstBin(threshold) {
+    return Number.isFinite(threshold) ? Math.max(0, Math.ceil((threshold - this.min) / this.resolution - 1e-9)) : 0;
+  }
+
+  /**
+   * k-ésimo menor valor (0-based) entre os valores >= threshold
+   */
+  valueAtRank(rank, threshold = -Infinity) {
+    let cumulative = 0;
+    for (let i = this.firstBin(threshold); i < this.numBins; i++) {
+      cumulative += this.counts[i];
+      if (cumulative > rank) return this.binValue(i);
+    }
+    return null;
+  }
+
+  /**
+   * Percentil no estilo loudness.js: sorted[min(n-1, floor(n·q))]
+   * @returns {number|null}
+   */
+  percentile(q, threshold = -Infinity) {
+    const n = this.countAtLeast(threshold);
+    if (n === 0) return null;
+    return this.valueAtRank(Math.min(n - 1, Math.max(0, Math.floor(n * q))), threshold);
+  }
+
+  /**
+   * Mediana (média dos dois centrais em n par)
+   */
+  median(threshold = -Infinity) {
+    const n = this.countAtLeast(threshold);
+    if (n === 0) return null;
+    const mid = Math.floor(n / 2);
+    return n % 2 === 0
+      ? (this.valueAtRank(mid - 1, threshold) + this.valueAtRank(mid, threshold)) / 2
+      : this.valueAtRank(mid, threshold);
+  }
+}
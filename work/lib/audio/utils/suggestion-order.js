@@ -0,0 +1,99 @@
+// work/lib/audio/utils/suggestion-order.js
+// Ordem final das sugestões exibidas ao usuário
+// Usada no fim do pipeline (api/audio/pipeline-complete.js) e no backfill de re-scoring
+// (lib/rescoring/rescoreAnalysis.js) - mesma ordem nos dois caminhos
+
+/**
+ * 🎯 FUNÇÃO DE ORDENAÇÃO PROFISSIONAL DE SUGESTÕES
+ * Ordena sugestões seguindo prioridade técnica profissional:
+ * 1. True Peak (mais crítico)
+ * 2. LUFS
+ * 3. Dynamic Range
+ * 4. Headroom
+ * 5. Bandas espectrais (sub → brilho)
+ * 6. Stereo Width
+ * 7. Outros
+ */
+export function orderSuggestionsForUser(suggestions) {
+  if (!Array.isArray(suggestions) || suggestions.length === 0) {
+    return suggestions;
+  }
+  
+  const weights = {
+    // Métricas críticas
+    'true_peak': 1,
+    'truePeak': 1,
+    'truePeakDbtp': 1,
+    
+    // Loudness
+    'lufs': 2,
+    'lufsIntegrated': 2,
+    
+    // Dinâmica
+    'dynamic_range': 3,
+    'dynamicRange': 3,
+    'dr': 3,
+    
+    // Headroom
+    'headroom': 4,
+    
+    // Bandas espectrais (ordem profissional: graves → agudos)
+    'sub': 5,
+    'low_bass': 6,
+    'bass': 6,
+    'upper_bass': 7,
+    'lowMid': 8,
+    'low_mid': 8,
+    'mid': 9,
+    'highMid': 10,
+    'high_mid': 10,
+    'presence': 11,
+    'presenca': 11,
+    'brilho': 12,
+    'air': 12,
+    
+    // Stereo
+    'stereo_width': 13,
+    'stereo': 13,
+    'stereoCorrelation': 13,
+    
+    // LRA
+    'lra': 14,
+    
+    // EQ genérico
+    'eq': 15,
+    'band': 15,
+    
+    // Outros
+    'other': 99
+  };
+  
+  return suggestions.sort((a, b) => {
+    // Determinar peso de cada sugestão
+    const getWeight = (sug) => {
+      // Tentar diferentes campos onde o tipo pode estar
+      const type = sug.type || sug.metric || sug.category || 'other';
+      
+      // Normalizar para minúsculas e remover espaços
+      const normalizedType = String(type).toLowerCase().replace(/\s+/g, '_');
+      
+      // Buscar peso, fallback para 99 (outros)
+      return weights[normalizedType] || weights[type] || 99;
+    };
+    
+    const wA = getWeight(a);
+    const wB = getWeight(b);
+    
+    // Ordenar por peso (menor peso = maior prioridade)
+    if (wA !== wB) {
+      return wA - wB;
+    }
+    
+    // Se pesos iguais, ordenar por severidade (se existir)
+    const severityOrder = { 'critical': 0, 'crítica': 0, 'high': 1, 'alta': 1, 'medium': 2, 'média': 2, 'low': 3, 'baixa': 3 };
+    const sevA = severityOrder[a.severity] || severityOrder[a.priority] || 99;
+    const sevB = severityOrder[b.severity] || severityOrder[b.priority] || 99;
+    
+    return sevA - sevB;
+  });
+}
@@ -12,6 +12,10 @@
  * - Detecção automática de dB vs % em bandas espectrais
  */
 
+import { createLogger } from '../../../lib/logger.js';
+
+const logger = createLogger('audio:suggestion-text-builder');
+
 /**
  * 📐 Formata número com precisão específica
  */
@@ -317,21 +321,21 @@ export function buildBandSuggestion({
   // ═══════════════════════════════════════════════════════════════════════════
   
   // 🔥 LOG CRÍTICO: AUDITORIA DO VALOR RECEBIDO
-  console.log(`[BUILD-BAND-SUGGESTION] 🔍 buildBandSuggestion() chamado para banda ${bandKey}:`);
-  console.log(`[BUILD-BAND-SUGGESTION] - value: ${value}`);
-  console.log(`[BUILD-BAND-SUGGESTION] - target: ${target}`);
-  console.log(`[BUILD-BAND-SUGGESTION] - tolerance: ${tolerance}`);
-  console.log(`[BUILD-BAND-SUGGESTION] - unit: ${unit}`);
-  console.log(`[BUILD-BAND-SUGGESTION] - typeof value: ${typeof value}`);
-  console.log(`[BUILD-BAND-SUGGESTION] - value < 0: ${value < 0}`);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] 🔍 buildBandSuggestion() chamado para banda ${bandKey}:`]);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] - value: ${value}`]);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] - target: ${target}`]);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] - tolerance: ${tolerance}`]);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] - unit: ${unit}`]);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] - typeof value: ${typeof value}`]);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] - value < 0: ${value < 0}`]);
   
   // 🎯 VALIDAÇÃO CRÍTICA: Se value não for negativo (dBFS), algo está MUITO errado
   if (value >= 0) {
-    console.error(`[BAND-SUGGESTION-CRITICAL] ❌❌❌ BUG CRÍTICO DETECTADO! ❌❌❌`);
-    console.error(`[BAND-SUGGESTION-CRITICAL] ❌ Valor POSITIVO ${value} recebido para banda ${bandKey}!`);
-    console.error(`[BAND-SUGGESTION-CRITICAL] ❌ Bandas devem ter valores dBFS NEGATIVOS (ex: -23.8 dB)!`);
-    console.error(`[BAND-SUGGESTION-CRITICAL] ❌ Isso indica que analyzeBand() passou PERCENTAGE ao invés de energy_db!`);
-    console.error(`[BAND-SUGGESTION-CRITICAL] ❌ Parâmetros recebidos:`, { bandKey, value, target, tolerance, unit });
+    logger.error(`[BAND-SUGGESTION-CRITICAL] ❌❌❌ BUG CRÍTICO DETECTADO! ❌❌❌`);
+    logger.error(`[BAND-SUGGESTION-CRITICAL] ❌ Valor POSITIVO ${value} recebido para banda ${bandKey}!`);
+    logger.error(`[BAND-SUGGESTION-CRITICAL] ❌ Bandas devem ter valores dBFS NEGATIVOS (ex: -23.8 dB)!`);
+    logger.error(`[BAND-SUGGESTION-CRITICAL] ❌ Isso indica que analyzeBand() passou PERCENTAGE ao invés de energy_db!`);
+    logger.error(`[BAND-SUGGESTION-CRITICAL] ❌ Parâmetros recebidos:`, { bandKey, value, target, tolerance, unit });
     
     // 🔥 CRIAR SUGESTÃO DE ERRO VISUAL PARA DEBUGGING
     return {
@@ -345,7 +349,7 @@ export function buildBandSuggestion({
   const rangeMin = (min !== undefined && min !== null) ? min : (target - tolerance);
   const rangeMax = (max !== undefined && max !== null) ? max : (target + tolerance);
   
-  console.log(`[BUILD-BAND] 🔍 Range para ${bandKey}:`, {
+  logger.debug(() => [`[BUILD-BAND] 🔍 Range para ${bandKey}:`, {
     receivedMin: min,
     receivedMax: max,
     calculatedMin: target - tolerance,
@@ -353,7 +357,7 @@ export function buildBandSuggestion({
     usedMin: rangeMin,
     usedMax: rangeMax,
     source: (min !== undefined && max !== undefined) ? 'target_range (REAL)' : 'calculated (FALLBACK)'
-  });
+  }]);
   
   // === ÍCONES POR BANDA ===
   const icons = {
@@ -385,7 +389,7 @@ export function buildBandSuggestion({
   message += `• Alvo recomendado: ${target.toFixed(1)} dB`;
   
   // 🔥 LOG CRÍTICO: MENSAGEM FINAL GERADA
-  console.log(`[BUILD-BAND-SUGGESTION] ✅ Mensagem gerada para ${bandKey}:`, message);
+  logger.debug(() => [`[BUILD-BAND-SUGGESTION] ✅ Mensagem gerada para ${bandKey}:`, message]);
   
   // === CONSTRUIR EXPLICAÇÃO ===
   let explanation = '';
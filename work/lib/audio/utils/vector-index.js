@@ -0,0 +1,341 @@
+// 🧭 VECTOR INDEX - Índice de vizinhos mais próximos (HNSW) para fingerprints de análise
+// Hierarchical Navigable Small World (Malkov & Yashunin): grafo em camadas, inserção incremental,
+// top-k em O(log n) em vez do scan linear. Distância de cosseno sobre vetores normalizados.
+// Serializável (toJSON / fromJSON) para persistir o índice entre processos/sessões.
+
+/**
+ * 🔧 Parâmetros padrão
+ */
+export const VECTOR_INDEX_CONFIG = {
+  M: 16,                 // vizinhos por nó nas camadas superiores (camada 0: 2·M)
+  EF_CONSTRUCTION: 100,  // largura da busca durante a inserção
+  EF_SEARCH: 64,         // largura da busca nas consultas (>= k)
+  SEED: 1337             // RNG determinístico para os níveis (índice reprodutível)
+};
+
+// RNG determinístico (mulberry32)
+function createRandom(seed) {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function normalize(vector) {
+  const out = new Float64Array(vector.length);
+  let norm = 0;
+  for (let i = 0; i < vector.length; i++) norm += vector[i] * vector[i];
+  norm = Math.sqrt(norm) || 1;
+  for (let i = 0; i < vector.length; i++) out[i] = (Number.isFinite(vector[i]) ? vector[i] : 0) / norm;
+  return out;
+}
+
+/**
+ * Heap binário de { id, distance } (min-heap; max-heap com sign = -1)
+ */
+class DistanceHeap {
+
+  constructor(sign = 1) {
+    this.sign = sign;
+    this.items = [];
+  }
+
+  get size() {
+    return this.items.length;
+  }
+
+  peek() {
+    return this.items[0];
+  }
+
+  push(item) {
+    const items = this.items;
+    items.push(item);
+    let i = items.length - 1;
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (this.sign * (items[parent].distance - items[i].distance) <= 0) break;
+      [items[parent], items[i]] = [items[i], items[parent]];
+      i = parent;
+    }
+  }
+
+  pop() {
+    const items = this.items;
+    const top = items[0];
+    const last = items.pop();
+    if (items.length > 0) {
+      items[0] = last;
+      let i = 0;
+      for (;;) {
+        const left = 2 * i + 1;
+        const right = left + 1;
+        let best = i;
+        if (left < items.length && this.sign * (items[left].distance - items[best].distance) < 0) best = left;
+        if (right < items.length && this.sign * (items[right].distance - items[best].distance) < 0) best = right;
+        if (best === i) break;
+        [items[best], items[i]] = [items[i], items[best]];
+        i = best;
+      }
+    }
+    return top;
+  }
+}
+
+/**
+ * 🧭 Índice HNSW
+ */
+export class VectorIndex {
+
+  /**
+   * @param {Object} options
+   * @param {number} options.dimensions - tamanho dos vetores
+   * @param {number} [options.M]
+   * @param {number} [options.efConstruction]
+   * @param {number} [options.efSearch]
+   * @param {number} [options.seed]
+   */
+  constructor({ dimensions, M = VECTOR_INDEX_CONFIG.M, efConstruction = VECTOR_INDEX_CONFIG.EF_CONSTRUCTION, efSearch = VECTOR_INDEX_CONFIG.EF_SEARCH, seed = VECTOR_INDEX_CONFIG.SEED } = {}) {
+    if (!Number.isInteger(dimensions) || dimensions <= 0) {
+      throw new Error('VectorIndex: dimensions deve ser inteiro positivo');
+    }
+    this.dimensions = dimensions;
+    this.M = M;
+    this.M0 = 2 * M;
+    this.efConstruction = Math.max(efConstruction, M);
+    this.efSearch = efSearch;
+    this.seed = seed;
+    this.levelMultiplier = 1 / Math.log(M);
+    this.random = createRandom(seed);
+
+    this.ids = [];          // índice interno → id externo
+    this.payloads = [];     // índice interno → payload (opcional)
+    this.vectors = [];      // índice interno → Float64Array normalizado
+    this.links = [];        // índice interno → [camada] → number[]
+    this.positions = new Map(); // id externo → índice interno
+    this.entryPoint = -1;
+    this.maxLevel = -1;
+  }
+
+  get size() {
+    return this.ids.length;
+  }
+
+  has(id) {
+    return this.positions.has(id);
+  }
+
+  distance(a, b) {
+    let dot = 0;
+    for (let i = 0; i < a.length; i++) dot += a[i] * b[i];
+    return 1 - dot;
+  }
+
+  randomLevel() {
+    return Math.floor(-Math.log(1 - this.random()) * this.levelMultiplier);
+  }
+
+  /**
+   * Busca gulosa em uma camada a partir de entryPoints (retorna até ef mais próximos, ordenados)
+   */
+  searchLayer(query, entryPoints, ef, level) {
+    const visited = new Set(entryPoints);
+    const candidates = new DistanceHeap(1);
+    const results = new DistanceHeap(-1);
+
+    for (const node of entryPoints) {
+      const item = { node, distance: this.distance(query, this.vectors[node]) };
+      candidates.push(item);
+      results.push(item);
+    }
+
+    while (candidates.size > 0) {
+      const current = candidates.pop();
+      if (current.distance > results.peek().distance && results.size >= ef) break;
+
+      for (const neighbor of this.links[current.node][level]) {
+        if (visited.has(neighbor)) continue;
+        visited.add(neighbor);
+        const distance = this.distance(query, this.vectors[neighbor]);
+        if (results.size < ef || distance < results.peek().distance) {
+          const item = { node: neighbor, distance };
+          candidates.push(item);
+          results.push(item);
+          if (results.size > ef) results.pop();
+        }
+      }
+    }
+
+    return results.items.sort((a, b) => a.distance - b.distance);
+  }
+
+  /**
+   * Heurística de seleção de vizinhos (diversidade), completando com os descartados até max
+   */
+  selectNeighbors(candidates, max) {
+    if (candidates.length <= max) return candidates.map(c => c.node);
+
+    const selected = [];
+    const discarded = [];
+    for (const candidate of candidates) {
+      if (selected.length >= max) break;
+      const vector = this.vectors[candidate.node];
+      const diverse = selected.every(s => this.distance(vector, this.vectors[s.node]) > candidate.distance);
+      (diverse ? selected : discarded).push(candidate);
+    }
+    for (const candidate of discarded) {
+      if (selected.length >= max) break;
+      selected.push(candidate);
+    }
+    return selected.map(c => c.node);
+  }
+
+  /**
+   * ➕ Inserção incremental
+   * @param {string|number} id - identificador externo (duplicado é ignorado)
+   * @param {number[]|Float64Array} vector
+   * @param {*} payload - dado associado devolvido nas buscas
+   * @returns {boolean} true se inserido
+   */
+  add(id, vector, payload = null) {
+    if (!vector || vector.length !== this.dimensions) {
+      throw new Error(`VectorIndex: vetor com ${vector?.length} dimensões (esperado ${this.dimensions})`);
+    }
+    if (this.positions.has(id)) return false;
+
+    const node = this.ids.length;
+    const level = this.randomLevel();
+    const normalized = normalize(vector);
+
+    this.ids.push(id);
+    this.payloads.push(payload);
+    this.vectors.push(normalized);
+    this.links.push(Array.from({ length: level + 1 }, () => []));
+    this.positions.set(id, node);
+
+    if (this.entryPoint < 0) {
+      this.entryPoint = node;
+      this.maxLevel = level;
+      return true;
+    }
+
+    // Descer pelas camadas acima do nível do nó com ef = 1
+    let entry = [this.entryPoint];
+    for (let l = this.maxLevel; l > level; l--) {
+      entry = [this.searchLayer(normalized, entry, 1, l)[0].node];
+    }
+
+    for (let l = Math.min(level, this.maxLevel); l >= 0; l--) {
+      const candidates = this.searchLayer(normalized, entry, this.efConstruction, l);
+      const max = l === 0 ? this.M0 : this.M;
+      const neighbors = this.selectNeighbors(candidates, this.M);
+      this.links[node][l] = neighbors;
+
+      // Conexões bidirecionais (podando quem passar do limite)
+      for (const neighbor of neighbors) {
+        const list = this.links[neighbor][l];
+        list.push(node);
+        if (list.length > max) {
+          const vector = this.vectors[neighbor];
+          const ranked = list
+            .map(n => ({ node: n, distance: this.distance(vector, this.vectors[n]) }))
+            .sort((a, b) => a.distance - b.distance);
+          this.links[neighbor][l] = this.selectNeighbors(ranked, max);
+        }
+      }
+      entry = candidates.map(c => c.node);
+    }
+
+    if (level > this.maxLevel) {
+      this.maxLevel = level;
+      this.entryPoint = node;
+    }
+    return true;
+  }
+
+  /**
+   * 🔍 Top-k aproximado
+   * @param {number[]} vector
+   * @param {number} k
+   * @param {Object} options - { ef }
+   * @returns {Array<{id, distance, payload}>} ordenado por distância
+   */
+  search(vector, k = 5, { ef = this.efSearch } = {}) {
+    if (this.entryPoint < 0) return [];
+    const query = normalize(vector);
+
+    let entry = [this.entryPoint];
+    for (let l = this.maxLevel; l > 0; l--) {
+      entry = [this.searchLayer(query, entry, 1, l)[0].node];
+    }
+
+    return this.searchLayer(query, entry, Math.max(ef, k), 0)
+      .slice(0, k)
+      .map(({ node, distance }) => ({ id: this.ids[node], distance, payload: this.payloads[node] }));
+  }
+
+  /**
+   * 🐢 Top-k exato (scan linear) — referência para medir recall
+   */
+  bruteForce(vector, k = 5) {
+    const query = normalize(vector);
+    return this.vectors
+      .map((v, node) => ({ node, distance: this.distance(query, v) }))
+      .sort((a, b) => a.distance - b.distance)
+      .slice(0, k)
+      .map(({ node, distance }) => ({ id: this.ids[node], distance, payload: this.payloads[node] }));
+  }
+
+  /**
+   * 💾 Serializar (vetores já normalizados + grafo)
+   */
+  toJSON() {
+    return {
+      version: 1,
+      dimensions: this.dimensions,
+      M: this.M,
+      efConstruction: this.efConstruction,
+      efSearch: this.efSearch,
+      seed: this.seed,
+      entryPoint: this.entryPoint,
+      maxLevel: this.maxLevel,
+      nodes: this.ids.map((id, node) => ({
+        id,
+        payload: this.payloads[node],
+        vector: Array.from(this.vectors[node]),
+        links: this.links[node]
+      }))
+    };
+  }
+
+  /**
+   * 📂 Restaurar índice serializado (inserções continuam incrementais após o load)
+   */
+  static fromJSON(data) {
+    const index = new VectorIndex({
+      dimensions: data.dimensions,
+      M: data.M,
+      efConstruction: data.efConstruction,
+      efSearch: data.efSearch,
+      seed: data.seed
+    });
+    for (const { id, payload, vector, links } of data.nodes) {
+      index.positions.set(id, index.ids.length);
+      index.ids.push(id);
+      index.payloads.push(payload);
+      index.vectors.push(Float64Array.from(vector));
+      index.links.push(links.map(l => l.slice()));
+    }
+    index.entryPoint = data.entryPoint;
+    index.maxLevel = data.maxLevel;
+    // Avançar o RNG para não repetir os níveis já sorteados
+    for (let i = 0; i < index.ids.length; i++) index.random();
+    return index;
+  }
+}
+
+export default VectorIndex;
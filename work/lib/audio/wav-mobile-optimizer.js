@@ -4,6 +4,10 @@
  * Inclui feedback de progresso, timeouts estendidos e fallbacks
  */
 
+import { createLogger } from '../../lib/logger.js';
+
+const logger = createLogger('audio:wav-mobile-optimizer');
+
 // Configurações específicas para WAV mobile
 const WAV_MOBILE_CONFIG = {
   LARGE_FILE_THRESHOLD: 20 * 1024 * 1024, // 20MB
@@ -74,12 +78,12 @@ function showWAVProcessingFeedback(analysis) {
     `;
     
     // Log detalhado
-    console.log('🎵 WAV Mobile Processing:', {
+    logger.debug(() => ['🎵 WAV Mobile Processing:', {
       size: analysis.sizeInMB + 'MB',
       estimated: analysis.estimatedSeconds + 's',
       timeout: analysis.recommendedTimeout + 'ms',
       env: analysis.environment
-    });
+    }]);
     
   } else if (analysis.isLarge) {
     // WAV grande no desktop
@@ -105,7 +109,7 @@ function applyWAVOptimizations(file) {
       window.__WAV_MOBILE_TIMEOUT__ = analysis.recommendedTimeout;
       window.__WAV_PROCESSING_START__ = Date.now();
       
-      console.log(`🔧 WAV mobile optimizations applied: ${analysis.recommendedTimeout}ms timeout`);
+      logger.debug(() => [`🔧 WAV mobile optimizations applied: ${analysis.recommendedTimeout}ms timeout`]);
     }
     
     // Mostrar feedback imediato
@@ -139,11 +143,11 @@ function validateWAVProgress() {
     const elapsed = Date.now() - window.__WAV_PROCESSING_START__;
     const elapsedSeconds = Math.ceil(elapsed / 1000);
     
-    console.log(`🎵 WAV processing progress: ${elapsedSeconds}s elapsed`);
+    logger.debug(() => [`🎵 WAV processing progress: ${elapsedSeconds}s elapsed`]);
     
     // Detectar possível travamento
     if (elapsed > 90000) { // >90s
-      console.warn('⚠️ WAV processing taking longer than expected');
+      logger.warn('⚠️ WAV processing taking longer than expected');
       
       const progressText = document.getElementById('audioProgressText');
       if (progressText) {
@@ -177,7 +181,7 @@ if (typeof window !== 'undefined') {
     config: WAV_MOBILE_CONFIG
   };
   
-  console.log('🎵 WAV Mobile Optimizer carregado');
+  logger.debug('🎵 WAV Mobile Optimizer carregado');
 }
 
 export {
@@ -0,0 +1,59 @@
+/**
+ * 🎵 STEMS SEPARATION WORKER - Node (worker_threads)
+ * Backend do stems-manager no servidor: canais de entrada e stems de saída vivem em
+ * SharedArrayBuffer, então nada é copiado entre threads. Processa em chunks e reporta progresso.
+ */
+
+import { parentPort } from 'worker_threads';
+import { performance } from 'perf_hooks';
+import { STEM_NAMES, createSeparationState, separateChunk } from '../features/stems-heuristic.js';
+
+const DEFAULT_CHUNK_SIZE = 65536;
+const PROGRESS_STEP = 5; // %
+
+function processRequest({ id, sampleRate, length, channels, outputs, chunkSize = DEFAULT_CHUNK_SIZE }) {
+  const t0 = performance.now();
+  const numberOfChannels = channels.length;
+  const totalSamples = length * numberOfChannels;
+  let processed = 0;
+  let lastReported = 0;
+
+  for (let ch = 0; ch < numberOfChannels; ch++) {
+    const src = new Float32Array(channels[ch], 0, length);
+    const out = {};
+    for (const stem of STEM_NAMES) {
+      out[stem] = new Float32Array(outputs[stem][ch], 0, length);
+    }
+    const state = createSeparationState(sampleRate);
+
+    for (let start = 0; start < length; start += chunkSize) {
+      const end = Math.min(start + chunkSize, length);
+      separateChunk(src, out, start, end, state);
+      processed += end - start;
+
+      const percentage = (processed / totalSamples) * 100;
+      if (percentage - lastReported >= PROGRESS_STEP) {
+        lastReported = percentage;
+        parentPort.postMessage({ type: 'progress', id, percentage });
+      }
+    }
+  }
+
+  return {
+    method: 'heuristic_worker_threads_v1',
+    elapsedMs: +(performance.now() - t0).toFixed(1),
+    fallbackUsed: false,
+    processedInWorker: true
+  };
+}
+
+parentPort.on('message', (message) => {
+  if (!message || message.type !== 'process') return;
+
+  try {
+    const result = processRequest(message);
+    parentPort.postMessage({ type: 'complete', id: message.id, result });
+  } catch (error) {
+    parentPort.postMessage({ type: 'error', id: message.id, error: { message: error.message } });
+  }
+});
@@ -70,6 +70,34 @@ export const PLAN_ENTITLEMENTS = {
   },
 };
 
+/**
+ * Peso de fila por plano (fair-share do BullMQ 'audio-analyzer')
+ * Peso maior = jobs furam a fila mais cedo, mas nunca monopolizam (ver lib/queue-fair-share.js)
+ * STUDIO tem priorityProcessing → maior peso
+ */
+export const PLAN_QUEUE_WEIGHTS = {
+  anonymous: 0.5,
+  free: 1,
+  plus: 2,
+  pro: 3,
+  dj: 3,
+  studio: 4,
+};
+
+/**
+ * Perfil de análise por plano (ver lib/audio/analysis-profiles.js)
+ * fast = hop FFT 4x maior + passada detalhada só em segmentos sinalizados (clipping, sub)
+ * Deltas de precisão documentados no perfil; suficientes para score/sugestões
+ */
+export const PLAN_ANALYSIS_PROFILES = {
+  anonymous: 'fast',
+  free: 'fast',
+  plus: 'detailed',
+  pro: 'detailed',
+  dj: 'detailed',
+  studio: 'detailed',
+};
+
 /**
  * Mensagens de erro por feature (para o frontend)
  * ATUALIZADO 2026-01-06: correctionPlan agora é DJ/STUDIO
@@ -195,6 +223,26 @@ export function assertEntitled(plan, feature) {
   return true;
 }
 
+/**
+ * Peso de fila do plano (fallback: free)
+ * @param {string} plan - "anonymous" | "free" | "plus" | "pro" | "studio" | "dj"
+ * @returns {number}
+ */
+export function getQueueWeight(plan) {
+  return PLAN_QUEUE_WEIGHTS[plan] || PLAN_QUEUE_WEIGHTS.free;
+}
+
+/**
+ * Perfil de análise do plano (fallback: free). Análises "reduced" usam sempre o perfil rápido.
+ * @param {string} plan - "anonymous" | "free" | "plus" | "pro" | "studio" | "dj"
+ * @param {string} [analysisMode] - "full" | "reduced"
+ * @returns {string} "fast" | "detailed"
+ */
+export function getAnalysisProfileName(plan, analysisMode = 'full') {
+  if (analysisMode === 'reduced') return 'fast';
+  return PLAN_ANALYSIS_PROFILES[plan] || PLAN_ANALYSIS_PROFILES.free;
+}
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // 🛡️ RESPONSE HELPERS (para uso nos endpoints)
 // ═══════════════════════════════════════════════════════════════════════════════
@@ -273,10 +321,14 @@ export default {
   PLAN_ENTITLEMENTS,
   FEATURE_MESSAGES,
   FEATURE_DISPLAY_NAMES,
+  PLAN_QUEUE_WEIGHTS,
+  PLAN_ANALYSIS_PROFILES,
   getUserPlan,
   hasEntitlement,
   checkEntitlement,
   assertEntitled,
   buildPlanRequiredResponse,
   requireEntitlement,
+  getQueueWeight,
+  getAnalysisProfileName,
 };
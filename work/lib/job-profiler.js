@@ -0,0 +1,506 @@
+// work/lib/job-profiler.js
+// Profiling por estágio dos jobs de análise (complementa o memory-monitor, que só loga snapshots)
+// ✅ Ligado por job: PROFILE_JOB_IDS (prefixos de jobId, os 8 chars dos logs bastam) ou amostragem
+//    PROFILE_SAMPLE_RATE (0-1). Desligado, profileStage() custa um getStore() do AsyncLocalStorage.
+// ✅ Por estágio (decode, segmentation, metrics:*, scoring, json_output, suggestions, ai):
+//    wall/CPU (user+system), heapUsed/external/arrayBuffers (valor final e delta) e pausas de GC
+// ✅ PROFILE_CPU=true → .cpuprofile (inspector) do job; PROFILE_HEAP_SNAPSHOT=true → heap snapshot
+//    no fim do job. Só são gravados se o job estiver entre os PROFILE_KEEP_SLOWEST mais lentos
+//    (o limiar vem do orquestrador, que apaga os arquivos que saem do top N).
+// ✅ Orquestrador: recordJobProfile() agrega por estágio (p50/p95/máx) para o health server.
+//
+// Estágios aninhados/paralelos são inclusivos: json_output contém scoring, e as métricas do
+// Promise.all (bandas/centróide/estéreo) se sobrepõem. CPU é do processo inteiro (um job por
+// processo no worker-redis), GC é atribuído a todo estágio aberto durante a pausa.
+//
+// Variáveis de ambiente:
+//   PROFILE_JOB_IDS=3f2a9c1b,77aa    PROFILE_SAMPLE_RATE=0.05
+//   PROFILE_CPU=true                 PROFILE_HEAP_SNAPSHOT=true
+//   PROFILE_KEEP_SLOWEST=5           PROFILE_DIR=/tmp/soundy-profiles
+
+import { AsyncLocalStorage } from 'async_hooks';
+import { PerformanceObserver, performance } from 'perf_hooks';
+import inspector from 'inspector';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import v8 from 'v8';
+import { QuantileSketch, RunningStats } from './audio/utils/streaming-stats.js';
+import { createLogger } from './logger.js';
+
+const logger = createLogger('profiler');
+
+const MB = 1024 * 1024;
+
+export const JOB_PROFILER_CONFIG = {
+  JOB_IDS: [],
+  SAMPLE_RATE: 0,
+  CPU_PROFILE: false,
+  HEAP_SNAPSHOT: false,
+  KEEP_SLOWEST: 5,
+  DIR: path.join(os.tmpdir(), 'soundy-profiles'),
+  MAX_GC_EVENTS: 10000          // por job: evita crescer sem limite em jobs patológicos
+};
+
+const storage = new AsyncLocalStorage();
+
+/**
+ * Reconfigura a partir do ambiente (+ overrides em testes/benchmarks)
+ * @param {Object} [overrides] - { JOB_IDS, SAMPLE_RATE, CPU_PROFILE, HEAP_SNAPSHOT, KEEP_SLOWEST, DIR }
+ */
+export function configureJobProfiler(overrides = {}) {
+  const env = process.env;
+  const rate = Number(overrides.SAMPLE_RATE ?? env.PROFILE_SAMPLE_RATE ?? 0);
+  const keep = Number(overrides.KEEP_SLOWEST ?? env.PROFILE_KEEP_SLOWEST ?? 5);
+
+  JOB_PROFILER_CONFIG.JOB_IDS = overrides.JOB_IDS
+    ?? String(env.PROFILE_JOB_IDS || '').split(',').map(id => id.trim()).filter(Boolean);
+  JOB_PROFILER_CONFIG.SAMPLE_RATE = Number.isFinite(rate) ? Math.min(1, Math.max(0, rate)) : 0;
+  JOB_PROFILER_CONFIG.CPU_PROFILE = overrides.CPU_PROFILE ?? env.PROFILE_CPU === 'true';
+  JOB_PROFILER_CONFIG.HEAP_SNAPSHOT = overrides.HEAP_SNAPSHOT ?? env.PROFILE_HEAP_SNAPSHOT === 'true';
+  JOB_PROFILER_CONFIG.KEEP_SLOWEST = Number.isFinite(keep) ? Math.max(0, Math.floor(keep)) : 5;
+  JOB_PROFILER_CONFIG.DIR = overrides.DIR ?? env.PROFILE_DIR ?? path.join(os.tmpdir(), 'soundy-profiles');
+  return { ...JOB_PROFILER_CONFIG, JOB_IDS: [...JOB_PROFILER_CONFIG.JOB_IDS] };
+}
+
+configureJobProfiler();
+
+/**
+ * Job deve ser perfilado? (lista explícita primeiro, depois amostragem)
+ * @param {string} jobId
+ * @param {() => number} [random]
+ */
+export function shouldProfileJob(jobId, random = Math.random) {
+  const id = String(jobId || '');
+  if (id && JOB_PROFILER_CONFIG.JOB_IDS.some(prefix => id.startsWith(prefix))) return true;
+  return JOB_PROFILER_CONFIG.SAMPLE_RATE > 0 && random() < JOB_PROFILER_CONFIG.SAMPLE_RATE;
+}
+
+// ============================================================================
+// GC: um observer compartilhado enquanto houver job perfilado ativo
+// ============================================================================
+
+const activeProfiles = new Set();
+let gcObserver = null;
+
+function dispatchGCEntries(entries) {
+  for (const entry of entries) {
+    for (const profile of activeProfiles) profile.addGCEvent(entry.startTime, entry.duration);
+  }
+}
+
+function attachGCObserver(profile) {
+  activeProfiles.add(profile);
+  if (gcObserver) return;
+  gcObserver = new PerformanceObserver(list => dispatchGCEntries(list.getEntries()));
+  gcObserver.observe({ entryTypes: ['gc'] });
+}
+
+function detachGCObserver(profile) {
+  // Entradas já enfileiradas mas ainda não entregues ao callback vão para os jobs ativos agora
+  if (gcObserver) dispatchGCEntries(gcObserver.takeRecords());
+  activeProfiles.delete(profile);
+  if (activeProfiles.size === 0 && gcObserver) {
+    gcObserver.disconnect();
+    gcObserver = null;
+  }
+}
+
+// ============================================================================
+// PERFIL DE UM JOB
+// ============================================================================
+
+function inspectorPost(session, method, params) {
+  return new Promise((resolve, reject) => {
+    session.post(method, params, (error, result) => (error ? reject(error) : resolve(result)));
+  });
+}
+
+const round = (value, digits = 1) => +value.toFixed(digits);
+const toMB = bytes => round(bytes / MB);
+
+/**
+ * Estágios e GC de um job; criado por startJobProfile()
+ */
+export class JobProfile {
+  /**
+   * @param {string} jobId
+   * @param {Object} [options]
+   * @param {boolean} [options.cpuProfile] - gravar .cpuprofile (inspector)
+   * @param {boolean} [options.heapSnapshot] - gravar heap snapshot no fim
+   * @param {number} [options.keepAboveMs] - só grava artefatos se o job demorar mais que isso
+   * @param {string} [options.dir]
+   */
+  constructor(jobId, { cpuProfile = false, heapSnapshot = false, keepAboveMs = 0, dir = JOB_PROFILER_CONFIG.DIR } = {}) {
+    this.jobId = String(jobId || 'unknown');
+    this.options = { cpuProfile, heapSnapshot, keepAboveMs, dir };
+    this.stages = [];
+    this.gcEvents = [];
+    this.startedAt = performance.now();
+    this.cpuStart = process.cpuUsage();
+    this.peakHeapUsed = process.memoryUsage().heapUsed;
+    this.session = null;
+    this.finished = false;
+    attachGCObserver(this);
+  }
+
+  addGCEvent(startTime, duration) {
+    if (this.gcEvents.length < JOB_PROFILER_CONFIG.MAX_GC_EVENTS) this.gcEvents.push({ startTime, duration });
+  }
+
+  async startCPUProfile() {
+    try {
+      this.session = new inspector.Session();
+      this.session.connect();
+      await inspectorPost(this.session, 'Profiler.enable');
+      await inspectorPost(this.session, 'Profiler.start');
+    } catch (error) {
+      logger.warn(`[PROFILER] ⚠️ CPU profile indisponível para ${this.jobId.substring(0, 8)}:`, error.message);
+      this.session = null;
+    }
+  }
+
+  /**
+   * Abre um estágio; devolve a função que o fecha (idempotente)
+   * @param {string} name
+   * @returns {() => void}
+   */
+  startStage(name) {
+    const mem = process.memoryUsage();
+    const stage = {
+      name,
+      start: performance.now(),
+      end: null,
+      cpu: process.cpuUsage(),
+      mem
+    };
+    this.stages.push(stage);
+    return () => this.endStage(stage);
+  }
+
+  endStage(stage) {
+    if (stage.end !== null) return;
+    const mem = process.memoryUsage();
+    const cpu = process.cpuUsage(stage.cpu);
+    stage.end = performance.now();
+    stage.cpuUserMs = cpu.user / 1000;
+    stage.cpuSystemMs = cpu.system / 1000;
+    stage.heapUsed = mem.heapUsed;
+    stage.heapDelta = mem.heapUsed - stage.mem.heapUsed;
+    stage.externalDelta = mem.external - stage.mem.external;
+    stage.arrayBuffersDelta = mem.arrayBuffers - stage.mem.arrayBuffers;
+    stage.mem = null;
+    if (mem.heapUsed > this.peakHeapUsed) this.peakHeapUsed = mem.heapUsed;
+  }
+
+  /**
+   * Executa fn com este perfil como contexto (profileStage/startProfileStage passam a registrar)
+   */
+  run(fn) {
+    return storage.run(this, fn);
+  }
+
+  /**
+   * Fecha o perfil: estágios abertos (job que falhou no meio) saem como aborted,
+   * GC atribuído por janela de tempo, artefatos gravados se o job for lento o bastante
+   * @param {Object} [options] - { status }
+   * @returns {Promise<Object>} resumo serializável (vai no IPC para o orquestrador)
+   */
+  async finish({ status = 'completed' } = {}) {
+    if (this.finished) return this.summary;
+    this.finished = true;
+
+    const aborted = new Set();
+    for (const stage of this.stages) {
+      if (stage.end === null) {
+        aborted.add(stage);
+        this.endStage(stage);
+      }
+    }
+    // Entradas de GC são enfileiradas pelo V8 depois da pausa: uma volta do event loop antes de ler
+    await new Promise(resolve => setImmediate(resolve));
+    detachGCObserver(this);
+
+    const totalMs = performance.now() - this.startedAt;
+    const cpu = process.cpuUsage(this.cpuStart);
+
+    // Estágios com o mesmo nome (ex.: ai chamado em dois pontos) somados numa entrada
+    const byName = new Map();
+    for (const stage of this.stages) {
+      let entry = byName.get(stage.name);
+      if (!entry) {
+        entry = {
+          name: stage.name,
+          calls: 0,
+          wallMs: 0,
+          cpuUserMs: 0,
+          cpuSystemMs: 0,
+          heapUsedMB: 0,
+          heapDeltaMB: 0,
+          externalDeltaMB: 0,
+          arrayBuffersDeltaMB: 0,
+          gcCount: 0,
+          gcPauseMs: 0
+        };
+        byName.set(stage.name, entry);
+      }
+      entry.calls++;
+      entry.wallMs += stage.end - stage.start;
+      entry.cpuUserMs += stage.cpuUserMs;
+      entry.cpuSystemMs += stage.cpuSystemMs;
+      entry.heapUsedMB = stage.heapUsed / MB;
+      entry.heapDeltaMB += stage.heapDelta / MB;
+      entry.externalDeltaMB += stage.externalDelta / MB;
+      entry.arrayBuffersDeltaMB += stage.arrayBuffersDelta / MB;
+      for (const gc of this.gcEvents) {
+        if (gc.startTime >= stage.start && gc.startTime <= stage.end) {
+          entry.gcCount++;
+          entry.gcPauseMs += gc.duration;
+        }
+      }
+      if (aborted.has(stage)) entry.aborted = true;
+    }
+
+    const stages = [...byName.values()].map(entry => ({
+      ...entry,
+      wallMs: round(entry.wallMs),
+      cpuUserMs: round(entry.cpuUserMs),
+      cpuSystemMs: round(entry.cpuSystemMs),
+      heapUsedMB: round(entry.heapUsedMB),
+      heapDeltaMB: round(entry.heapDeltaMB),
+      externalDeltaMB: round(entry.externalDeltaMB),
+      arrayBuffersDeltaMB: round(entry.arrayBuffersDeltaMB),
+      gcPauseMs: round(entry.gcPauseMs, 2)
+    }));
+
+    const gcPauseMs = this.gcEvents.reduce((sum, gc) => sum + gc.duration, 0);
+    this.summary = {
+      jobId: this.jobId,
+      status,
+      totalMs: round(totalMs),
+      cpuUserMs: round(cpu.user / 1000),
+      cpuSystemMs: round(cpu.system / 1000),
+      peakHeapUsedMB: toMB(this.peakHeapUsed),
+      gc: {
+        count: this.gcEvents.length,
+        pauseMs: round(gcPauseMs, 2),
+        maxPauseMs: round(this.gcEvents.reduce((max, gc) => Math.max(max, gc.duration), 0), 2)
+      },
+      stages,
+      artifacts: await this.writeArtifacts(totalMs)
+    };
+    return this.summary;
+  }
+
+  async writeArtifacts(totalMs) {
+    const artifacts = {};
+    const keep = totalMs > this.options.keepAboveMs;
+    const base = path.join(this.options.dir, `${this.jobId}-${Date.now()}`);
+
+    try {
+      if (keep && (this.session || this.options.heapSnapshot)) {
+        fs.mkdirSync(this.options.dir, { recursive: true });
+      }
+      if (this.session) {
+        const { profile } = await inspectorPost(this.session, 'Profiler.stop');
+        if (keep) {
+          artifacts.cpuProfile = `${base}.cpuprofile`;
+          fs.writeFileSync(artifacts.cpuProfile, JSON.stringify(profile));
+        }
+      }
+      if (keep && this.options.heapSnapshot) {
+        // Síncrono e pesado (segundos): só no fim do job, com o resultado ainda em memória
+        artifacts.heapSnapshot = v8.writeHeapSnapshot(`${base}.heapsnapshot`);
+      }
+    } catch (error) {
+      logger.warn(`[PROFILER] ⚠️ Falha ao gravar artefatos de ${this.jobId.substring(0, 8)}:`, error.message);
+    } finally {
+      if (this.session) {
+        this.session.disconnect();
+        this.session = null;
+      }
+    }
+
+    if (artifacts.cpuProfile || artifacts.heapSnapshot) {
+      logger.info(() => [`[PROFILER] 💾 Artefatos do job ${this.jobId.substring(0, 8)} (${Math.round(totalMs)}ms):`, artifacts]);
+    }
+    return artifacts;
+  }
+}
+
+/**
+ * Inicia o perfil de um job se ele foi selecionado (PROFILE_JOB_IDS / PROFILE_SAMPLE_RATE)
+ * @param {string} jobId
+ * @param {Object} [options] - { force, keepAboveMs } (keepAboveMs vem do orquestrador)
+ * @returns {Promise<JobProfile|null>}
+ */
+export async function startJobProfile(jobId, { force = false, keepAboveMs = 0 } = {}) {
+  if (!force && !shouldProfileJob(jobId)) return null;
+
+  const profile = new JobProfile(jobId, {
+    cpuProfile: JOB_PROFILER_CONFIG.CPU_PROFILE,
+    heapSnapshot: JOB_PROFILER_CONFIG.HEAP_SNAPSHOT,
+    keepAboveMs
+  });
+  if (profile.options.cpuProfile) await profile.startCPUProfile();
+  logger.info(`[PROFILER] 🔬 Perfilando job ${profile.jobId.substring(0, 8)}`);
+  return profile;
+}
+
+/**
+ * Perfil do job em execução (null fora de um profile.run())
+ * @returns {JobProfile|null}
+ */
+export function getActiveJobProfile() {
+  return storage.getStore() || null;
+}
+
+const noop = () => {};
+
+/**
+ * Abre um estágio no perfil ativo (para blocos longos sem reestruturar o código)
+ * @param {string} name
+ * @returns {() => void} fecha o estágio; no-op sem perfil ativo
+ */
+export function startProfileStage(name) {
+  const profile = storage.getStore();
+  return profile ? profile.startStage(name) : noop;
+}
+
+/**
+ * Executa fn como um estágio (síncrona ou async; o estágio fecha quando a promise resolver/rejeitar)
+ * @template T
+ * @param {string} name
+ * @param {() => T} fn
+ * @returns {T}
+ */
+export function profileStage(name, fn) {
+  const profile = storage.getStore();
+  if (!profile) return fn();
+
+  const end = profile.startStage(name);
+  let result;
+  try {
+    result = fn();
+  } catch (error) {
+    end();
+    throw error;
+  }
+  if (result && typeof result.then === 'function') {
+    return result.finally(end);
+  }
+  end();
+  return result;
+}
+
+// ============================================================================
+// AGREGAÇÃO NO ORQUESTRADOR (worker-redis)
+// ============================================================================
+
+const aggregates = {
+  jobs: 0,
+  since: new Date().toISOString(),
+  total: new QuantileSketch(),
+  stages: new Map(),
+  slowest: []   // [{ jobId, totalMs, status, artifacts }] em ordem decrescente de totalMs
+};
+
+function stageAggregate(name) {
+  let entry = aggregates.stages.get(name);
+  if (!entry) {
+    entry = {
+      wallMs: new QuantileSketch(),
+      cpuMs: new RunningStats(),
+      heapDeltaMB: new RunningStats(),
+      gcPauseMs: new RunningStats(),
+      aborted: 0
+    };
+    aggregates.stages.set(name, entry);
+  }
+  return entry;
+}
+
+function removeArtifacts(artifacts = {}) {
+  for (const file of Object.values(artifacts)) {
+    fs.promises.unlink(file).catch(() => {});
+  }
+}
+
+/**
+ * Limiar para o filho gravar artefatos: duração do N-ésimo job mais lento já visto
+ * (0 enquanto o top N não estiver cheio)
+ */
+export function getProfileKeepThreshold() {
+  const keep = JOB_PROFILER_CONFIG.KEEP_SLOWEST;
+  if (keep === 0) return Infinity;
+  return aggregates.slowest.length < keep ? 0 : aggregates.slowest[keep - 1].totalMs;
+}
+
+/**
+ * Registra o resumo de um job perfilado (msg.metrics.profile do analysis-job)
+ * @param {Object} summary - retorno de JobProfile.finish()
+ */
+export function recordJobProfile(summary) {
+  if (!summary || !Array.isArray(summary.stages)) return;
+
+  aggregates.jobs++;
+  aggregates.total.add(summary.totalMs);
+  for (const stage of summary.stages) {
+    const entry = stageAggregate(stage.name);
+    entry.wallMs.add(stage.wallMs);
+    entry.cpuMs.add(stage.cpuUserMs + stage.cpuSystemMs);
+    entry.heapDeltaMB.add(stage.heapDeltaMB);
+    entry.gcPauseMs.add(stage.gcPauseMs);
+    if (stage.aborted) entry.aborted++;
+  }
+
+  // Top N mais lentos: quem sai da lista leva os artefatos junto
+  const keep = JOB_PROFILER_CONFIG.KEEP_SLOWEST;
+  const record = { jobId: summary.jobId, totalMs: summary.totalMs, status: summary.status, artifacts: summary.artifacts || {} };
+  aggregates.slowest.push(record);
+  aggregates.slowest.sort((a, b) => b.totalMs - a.totalMs);
+  for (const dropped of aggregates.slowest.splice(keep)) removeArtifacts(dropped.artifacts);
+}
+
+/**
+ * Agregados por estágio para o health server (/metrics/profiling)
+ */
+export function getProfilingAggregates() {
+  const quantiles = sketch => (sketch.count > 0
+    ? { p50: round(sketch.quantile(0.5)), p95: round(sketch.quantile(0.95)), max: round(sketch.quantile(1)) }
+    : { p50: null, p95: null, max: null });
+  const mean = stats => (stats.count > 0 ? round(stats.total / stats.count, 2) : null);
+
+  const stages = {};
+  for (const [name, entry] of aggregates.stages) {
+    stages[name] = {
+      count: entry.wallMs.count,
+      wallMs: quantiles(entry.wallMs),
+      cpuMsMean: mean(entry.cpuMs),
+      heapDeltaMBMean: mean(entry.heapDeltaMB),
+      gcPauseMsMean: mean(entry.gcPauseMs),
+      aborted: entry.aborted
+    };
+  }
+
+  return {
+    enabled: JOB_PROFILER_CONFIG.JOB_IDS.length > 0 || JOB_PROFILER_CONFIG.SAMPLE_RATE > 0,
+    sampleRate: JOB_PROFILER_CONFIG.SAMPLE_RATE,
+    jobs: aggregates.jobs,
+    since: aggregates.since,
+    totalMs: quantiles(aggregates.total),
+    stages,
+    slowest: aggregates.slowest.map(entry => ({ ...entry }))
+  };
+}
+
+/**
+ * Zera os agregados (testes / endpoint de reset); artefatos em disco são mantidos
+ */
+export function resetProfilingAggregates() {
+  aggregates.jobs = 0;
+  aggregates.since = new Date().toISOString();
+  aggregates.total = new QuantileSketch();
+  aggregates.stages.clear();
+  aggregates.slowest = [];
+}
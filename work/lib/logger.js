@@ -0,0 +1,226 @@
+// work/lib/logger.js
+// Logger com níveis para os módulos de áudio e do worker
+// ✅ Níveis: error < warn < info < debug < trace (LOG_LEVEL; produção = info, dev = debug)
+// ✅ Debug desligado custa uma comparação: mensagens podem ser thunks () => [...args],
+//    avaliados só se o nível estiver ativo (nada de JSON.stringify/toFixed de trace em produção)
+// ✅ Amostragem para traces de laço (por chunk, por bloco, por canal): logger.sampled(n)
+// ✅ Saída legível (mesmo formato do console.log de antes) ou JSON por linha (LOG_FORMAT=json)
+//
+// Variáveis de ambiente:
+//   LOG_LEVEL=error|warn|info|debug|trace|silent
+//   LOG_FORMAT=pretty|json
+//   LOG_DEBUG=audio:decode,worker*   → escopos em debug mesmo com LOG_LEVEL=info
+//   LOG_TRACE=audio:loudness         → idem para trace (dumps por frame/bloco/chunk)
+//   DEBUG_AUDIO=true                 → atalho legado para LOG_LEVEL=trace (era o flag dos dumps de DSP)
+//
+// Loggers ficam registrados para sempre (reconfigureLogger atualiza todos): crie-os no topo do
+// módulo, nunca dentro de funções chamadas por job/frame.
+
+import { format } from 'util';
+
+export const LOG_LEVELS = {
+  silent: 0,
+  error: 1,
+  warn: 2,
+  info: 3,
+  debug: 4,
+  trace: 5
+};
+
+const CONSOLE_METHOD = {
+  error: 'error',
+  warn: 'warn',
+  info: 'log',
+  debug: 'log',
+  trace: 'log'
+};
+
+const config = {
+  level: LOG_LEVELS.info,
+  format: 'pretty',
+  debugScopes: [],
+  traceScopes: []
+};
+
+// Loggers criados: reconfigureLogger() atualiza as flags de todos
+const registry = new Set();
+
+function parseLevel(value, fallback) {
+  const level = LOG_LEVELS[String(value || '').toLowerCase()];
+  return level === undefined ? fallback : level;
+}
+
+function scopeMatches(scope, pattern) {
+  return pattern.endsWith('*') ? scope.startsWith(pattern.slice(0, -1)) : scope === pattern;
+}
+
+function parseScopes(value) {
+  return String(value || '').split(',').map(s => s.trim()).filter(Boolean);
+}
+
+/**
+ * Nível efetivo de um escopo (LOG_DEBUG/LOG_TRACE elevam escopos específicos)
+ */
+function levelFor(scope) {
+  const matches = pattern => scopeMatches(scope, pattern);
+  if (config.level < LOG_LEVELS.trace && config.traceScopes.some(matches)) return LOG_LEVELS.trace;
+  if (config.level < LOG_LEVELS.debug && config.debugScopes.some(matches)) return LOG_LEVELS.debug;
+  return config.level;
+}
+
+/**
+ * Argumentos finais: thunk avaliado aqui (só para níveis ativos)
+ */
+function resolveArgs(args) {
+  if (args.length === 1 && typeof args[0] === 'function') {
+    const value = args[0]();
+    return Array.isArray(value) ? value : [value];
+  }
+  return args;
+}
+
+function toJSONLine(level, scope, args, extra) {
+  const record = { ts: new Date().toISOString(), level, scope };
+  if (extra) Object.assign(record, extra);
+
+  // Primeiro argumento string vira msg (com %s/%d do console); objetos restantes vão em data
+  let rest = args;
+  if (typeof args[0] === 'string') {
+    const objects = args.slice(1).filter(arg => arg !== null && typeof arg === 'object');
+    const scalars = args.slice(1).filter(arg => arg === null || typeof arg !== 'object');
+    record.msg = scalars.length > 0 ? format(args[0], ...scalars) : args[0];
+    rest = objects;
+  }
+  if (rest.length === 1) record.data = rest[0];
+  else if (rest.length > 1) record.data = rest;
+
+  try {
+    return JSON.stringify(record, (key, value) => (value instanceof Error
+      ? { name: value.name, message: value.message, stack: value.stack }
+      : value));
+  } catch {
+    // Estruturas circulares: cai para o texto formatado
+    return JSON.stringify({ ts: record.ts, level, scope, msg: format(...args) });
+  }
+}
+
+function write(level, scope, args, extra) {
+  if (config.format === 'json') {
+    const line = toJSONLine(level, scope, args, extra) + '\n';
+    if (level === 'error' || level === 'warn') process.stderr.write(line);
+    else process.stdout.write(line);
+    return;
+  }
+  console[CONSOLE_METHOD[level]](...args);
+}
+
+class Logger {
+  /**
+   * @param {string} scope - ex.: 'audio:decode', 'worker'
+   * @param {Object} [options]
+   * @param {number} [options.sampleEvery] - debug/trace: emite 1 a cada N chamadas
+   */
+  constructor(scope, { sampleEvery = 1 } = {}) {
+    this.scope = scope;
+    this.sampleEvery = Math.max(1, Math.floor(sampleEvery));
+    this.sampleCount = 0;
+    this.refresh();
+    registry.add(this);
+  }
+
+  /**
+   * Recalcula as flags de nível (chamado na criação e em reconfigureLogger)
+   */
+  refresh() {
+    const level = levelFor(this.scope);
+    this.level = level;
+    this.errorEnabled = level >= LOG_LEVELS.error;
+    this.warnEnabled = level >= LOG_LEVELS.warn;
+    this.infoEnabled = level >= LOG_LEVELS.info;
+    this.debugEnabled = level >= LOG_LEVELS.debug;
+    this.traceEnabled = level >= LOG_LEVELS.trace;
+  }
+
+  /**
+   * @param {'error'|'warn'|'info'|'debug'|'trace'} level
+   */
+  isEnabled(level) {
+    return this.level >= LOG_LEVELS[level];
+  }
+
+  error(...args) {
+    if (this.errorEnabled) write('error', this.scope, resolveArgs(args));
+  }
+
+  warn(...args) {
+    if (this.warnEnabled) write('warn', this.scope, resolveArgs(args));
+  }
+
+  info(...args) {
+    if (this.infoEnabled) write('info', this.scope, resolveArgs(args));
+  }
+
+  debug(...args) {
+    if (!this.debugEnabled || !this.takeSample()) return;
+    write('debug', this.scope, resolveArgs(args), this.sampleEvery > 1 ? { sampleEvery: this.sampleEvery } : null);
+  }
+
+  trace(...args) {
+    if (!this.traceEnabled || !this.takeSample()) return;
+    write('trace', this.scope, resolveArgs(args), this.sampleEvery > 1 ? { sampleEvery: this.sampleEvery } : null);
+  }
+
+  takeSample() {
+    if (this.sampleEvery === 1) return true;
+    return this.sampleCount++ % this.sampleEvery === 0;
+  }
+
+  /**
+   * Logger filho com escopo 'pai:nome'
+   * @param {string} name
+   */
+  child(name) {
+    return new Logger(`${this.scope}:${name}`, { sampleEvery: this.sampleEvery });
+  }
+
+  /**
+   * Mesmo escopo, mas debug/trace amostrados (1ª chamada e depois 1 a cada N)
+   * @param {number} every
+   */
+  sampled(every) {
+    return new Logger(this.scope, { sampleEvery: every });
+  }
+}
+
+/**
+ * Cria um logger para um módulo
+ * @param {string} scope - ex.: 'audio:decode'
+ * @param {Object} [options] - { sampleEvery }
+ * @returns {Logger}
+ */
+export function createLogger(scope, options) {
+  return new Logger(scope, options);
+}
+
+/**
+ * Reconfigura nível/formato em runtime (testes, benchmarks, endpoint de debug)
+ * @param {Object} [overrides] - { level, format, debugScopes, traceScopes }
+ */
+export function reconfigureLogger(overrides = {}) {
+  const env = typeof process !== 'undefined' ? process.env : {};
+  const defaultLevel = env.DEBUG_AUDIO === 'true'
+    ? LOG_LEVELS.trace
+    : env.NODE_ENV === 'production' ? LOG_LEVELS.info : LOG_LEVELS.debug;
+
+  config.level = parseLevel(overrides.level ?? env.LOG_LEVEL, defaultLevel);
+  config.format = (overrides.format ?? env.LOG_FORMAT) === 'json' ? 'json' : 'pretty';
+  config.debugScopes = overrides.debugScopes ?? parseScopes(env.LOG_DEBUG);
+  config.traceScopes = overrides.traceScopes ?? parseScopes(env.LOG_TRACE);
+
+  for (const logger of registry) logger.refresh();
+  return { ...config, debugScopes: [...config.debugScopes], traceScopes: [...config.traceScopes] };
+}
+
+reconfigureLogger();
+
+export default createLogger;
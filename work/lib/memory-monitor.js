@@ -11,6 +11,8 @@
  *
  * Filtrar nos logs:
  *   grep '\[MEM\]' railway.log | jq .
+ *
+ * Tempo/CPU/GC por estágio e .cpuprofile dos jobs lentos: lib/job-profiler.js
  */
 
 // Snapshots anteriores por jobId para calcular delta
@@ -0,0 +1,197 @@
+/**
+ * ⚖️ FAIR-SHARE SCHEDULING - FILA 'audio-analyzer'
+ *
+ * Problema: a fila era FIFO com prioridade fixa (1 logado, 5 anônimo).
+ * Um usuário subindo 30 faixas atrasava todo mundo e plano pago não ganhava latência.
+ *
+ * PRODUTOR (API) — prioridade por "tempo virtual de término":
+ *   priority = 1 + (jobsNaFilaDoTenant + 1) × STRIDE / pesoDoPlano
+ *   - 1º job de qualquer usuário entra na frente do 10º job de outro usuário
+ *   - planos com peso maior (entitlements.js → PLAN_QUEUE_WEIGHTS) avançam mais rápido
+ *   - empate de prioridade no BullMQ = FIFO
+ *
+ * CONSUMIDOR (worker) — teto de jobs simultâneos por tenant:
+ *   - ao ativar um job, tenta reservar slot (Lua atômico, ZSET com timestamp)
+ *   - sem slot → job volta para delayed por alguns segundos (DelayedError)
+ *   - slots órfãos (worker morto) expiram após slotTtlMs
+ *
+ * MÉTRICAS:
+ *   - histograma de tempo de espera na fila por plano (HINCRBY por bucket)
+ *
+ * FALLBACK: qualquer erro de Redis aqui nunca bloqueia o enfileiramento/processamento.
+ *
+ * @version 1.0.0
+ */
+
+import { getQueueWeight } from './entitlements.js';
+
+export const FAIR_SHARE_CONFIG = {
+  keyPrefix: 'fairshare:',
+  stride: 100,                      // distância de prioridade entre jobs do mesmo tenant (peso 1)
+  maxPriority: 2097152,             // limite do BullMQ (2^21)
+  queuedTtlMs: 60 * 60 * 1000,      // entradas "na fila" mais velhas que 1h são descartadas
+  maxInFlightPerTenant: Number(process.env.FAIR_SHARE_MAX_INFLIGHT) || 2,
+  slotTtlMs: 6 * 60 * 1000,         // > timeout do job (5min) no worker
+  deferMs: 3000,                    // quanto um job sem slot espera antes de voltar à fila
+  waitBucketsMs: [1000, 5000, 15000, 30000, 60000, 120000, 300000]
+};
+
+const ENQUEUE_LUA = `
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+local ahead = redis.call('ZCARD', KEYS[1])
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return ahead
+`;
+
+const ACQUIRE_SLOT_LUA = `
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZSCORE', KEYS[1], ARGV[3]) then
+  return 1
+end
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[4]) then
+  return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+redis.call('PEXPIRE', KEYS[1], ARGV[5])
+redis.call('ZREM', KEYS[2], ARGV[3])
+return 1
+`;
+
+function defineCommands(redis) {
+  if (typeof redis.fairShareEnqueue !== 'function') {
+    redis.defineCommand('fairShareEnqueue', { numberOfKeys: 1, lua: ENQUEUE_LUA });
+  }
+  if (typeof redis.fairShareAcquire !== 'function') {
+    redis.defineCommand('fairShareAcquire', { numberOfKeys: 2, lua: ACQUIRE_SLOT_LUA });
+  }
+}
+
+/**
+ * Identifica o tenant e o plano de um payload de job
+ * @param {Object} data - job.data
+ * @returns {{ tenantId: string|null, plan: string }}
+ */
+export function getJobTenant(data = {}) {
+  const plan = data.planContext?.plan || (data.anonymous ? 'anonymous' : 'free');
+  const tenantId = data.planContext?.uid || (data.visitorId ? `anon:${data.visitorId}` : null);
+  return { tenantId, plan };
+}
+
+/**
+ * Calcula a prioridade BullMQ do próximo job do tenant e o registra como "na fila"
+ * @param {import('ioredis').Redis} redis
+ * @param {Object} params - { tenantId, plan, jobId }
+ * @returns {Promise<number>} prioridade (1 = mais alta)
+ */
+export async function computeFairPriority(redis, { tenantId, plan, jobId }) {
+  const weight = getQueueWeight(plan);
+  let ahead = 0;
+
+  if (tenantId && redis) {
+    try {
+      defineCommands(redis);
+      const now = Date.now();
+      ahead = await redis.fairShareEnqueue(
+        `${FAIR_SHARE_CONFIG.keyPrefix}queued:${tenantId}`,
+        now - FAIR_SHARE_CONFIG.queuedTtlMs, now, jobId, FAIR_SHARE_CONFIG.queuedTtlMs
+      );
+    } catch (err) {
+      console.warn(`⚠️ [FAIR-SHARE] Falha ao registrar job na fila do tenant: ${err.message}`);
+    }
+  }
+
+  const priority = 1 + Math.round((ahead + 1) * FAIR_SHARE_CONFIG.stride / weight);
+  return Math.min(priority, FAIR_SHARE_CONFIG.maxPriority);
+}
+
+/**
+ * Tenta reservar um slot de processamento para o tenant
+ * @returns {Promise<boolean>} false = tenant já está no teto de jobs simultâneos
+ */
+export async function acquireTenantSlot(redis, tenantId, jobId) {
+  if (!tenantId) return true;
+
+  try {
+    defineCommands(redis);
+    const now = Date.now();
+    const acquired = await redis.fairShareAcquire(
+      `${FAIR_SHARE_CONFIG.keyPrefix}active:${tenantId}`,
+      `${FAIR_SHARE_CONFIG.keyPrefix}queued:${tenantId}`,
+      now - FAIR_SHARE_CONFIG.slotTtlMs, now, jobId,
+      FAIR_SHARE_CONFIG.maxInFlightPerTenant, FAIR_SHARE_CONFIG.slotTtlMs
+    );
+    return acquired === 1;
+  } catch (err) {
+    console.warn(`⚠️ [FAIR-SHARE] Falha ao reservar slot (liberando job): ${err.message}`);
+    return true;
+  }
+}
+
+/**
+ * Libera o slot do tenant ao fim do job (sucesso ou falha)
+ */
+export async function releaseTenantSlot(redis, tenantId, jobId) {
+  if (!tenantId) return;
+
+  try {
+    await redis.zrem(`${FAIR_SHARE_CONFIG.keyPrefix}active:${tenantId}`, jobId);
+  } catch (err) {
+    console.warn(`⚠️ [FAIR-SHARE] Falha ao liberar slot: ${err.message}`);
+  }
+}
+
+/**
+ * Bucket do histograma de espera (le_<ms> ou le_inf)
+ * @param {number} waitMs
+ */
+export function waitBucket(waitMs) {
+  const bound = FAIR_SHARE_CONFIG.waitBucketsMs.find((b) => waitMs <= b);
+  return bound ? `le_${bound}` : 'le_inf';
+}
+
+/**
+ * Registra o tempo de espera na fila (enfileiramento → início do processamento)
+ */
+export async function recordQueueWait(redis, plan, waitMs) {
+  try {
+    await redis.multi()
+      .hincrby(`${FAIR_SHARE_CONFIG.keyPrefix}wait:${plan}`, waitBucket(waitMs), 1)
+      .hincrby(`${FAIR_SHARE_CONFIG.keyPrefix}wait:${plan}`, 'count', 1)
+      .hincrby(`${FAIR_SHARE_CONFIG.keyPrefix}wait:${plan}`, 'sumMs', Math.round(waitMs))
+      .exec();
+  } catch (err) {
+    console.warn(`⚠️ [FAIR-SHARE] Falha ao registrar espera: ${err.message}`);
+  }
+}
+
+/**
+ * Histogramas de espera por plano (buckets não cumulativos + média)
+ * @returns {Promise<Object>} { [plan]: { count, avgMs, buckets: { le_1000: n, ... } } }
+ */
+export async function getQueueWaitHistograms(redis, plans = ['anonymous', 'free', 'plus', 'pro', 'dj', 'studio']) {
+  const pipeline = redis.pipeline();
+  for (const plan of plans) {
+    pipeline.hgetall(`${FAIR_SHARE_CONFIG.keyPrefix}wait:${plan}`);
+  }
+  const results = await pipeline.exec();
+
+  const histograms = {};
+  plans.forEach((plan, i) => {
+    const raw = results[i][1] || {};
+    const count = Number(raw.count || 0);
+    const buckets = {};
+    for (const bound of FAIR_SHARE_CONFIG.waitBucketsMs) {
+      buckets[`le_${bound}`] = Number(raw[`le_${bound}`] || 0);
+    }
+    buckets.le_inf = Number(raw.le_inf || 0);
+
+    histograms[plan] = {
+      count,
+      avgMs: count > 0 ? Math.round(Number(raw.sumMs || 0) / count) : 0,
+      buckets
+    };
+  });
+
+  return histograms;
+}
@@ -6,6 +6,7 @@
 
 import Redis from 'ioredis';
 import { Queue, QueueEvents } from 'bullmq';
+import { computeFairPriority, getJobTenant } from './queue-fair-share.js';
 
 // 🔑 SINGLETON GLOBAL para evitar múltiplas conexões
 const GLOBAL_KEY = Symbol.for('soundyai.redis.connection');
@@ -254,6 +255,26 @@ export function getQueueEvents() {
   return events;
 }
 
+/**
+ * Enfileirar job de análise com prioridade fair-share (plano + backlog do tenant)
+ * A prioridade passada em opts é ignorada: ela é derivada de job.data.planContext/visitorId
+ * @param {string} name - Nome do job (ex: 'process-audio')
+ * @param {Object} data - Payload do job
+ * @param {Object} opts - Opções BullMQ (jobId obrigatório para rastrear o tenant)
+ */
+export async function addAudioJob(name, data, opts = {}) {
+  const queue = getAudioQueue();
+  const { tenantId, plan } = getJobTenant(data);
+  const priority = await computeFairPriority(globalThis[GLOBAL_KEY], {
+    tenantId,
+    plan,
+    jobId: opts.jobId
+  });
+
+  console.log(`⚖️ [QUEUE] Fair-share: plan=${plan} tenant=${tenantId ? tenantId.substring(0, 12) : 'n/a'} priority=${priority}`);
+  return queue.add(name, data, { ...opts, priority });
+}
+
 /**
  * Promise que resolve quando toda infraestrutura estiver pronta
  */
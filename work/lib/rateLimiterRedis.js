@@ -12,25 +12,32 @@
  * 
  * ARQUITETURA:
  * - Chave por UID (se autenticado) com fallback para IP
- * - Sliding window usando Redis INCR + EXPIRE
- * - TTL automático (60 segundos)
- * - Formato de chave: rate:{tipo}:{uid|ip}:{YYYYMMDDHHMM}
+ * - Sliding window (ou token bucket) via script Lua atômico: 1 round trip por verificação
+ * - Cache local curto para chaves claramente abaixo do limite (ver redisRateLimit.js)
+ * - TTL automático (2 janelas)
+ * - Formato de chave: rate:{tipo}:{uid|ip}:{janela}
  * 
  * LIMITES (IGUAIS AO SISTEMA ANTERIOR):
  * - Chat (texto + imagens): 30 req/min
  * - Análise de áudio: 10 req/min
  * - Webhook de pagamento: 10 req/min
  * 
- * @version 3.0.0 (Redis - distribuído)
+ * @version 3.1.0 (Redis - Lua, 1 round trip)
  * @date 2025-12-14
  */
 
 import Redis from 'ioredis';
+import { RedisRateLimiter } from './redisRateLimit.js';
 
 // ✅ Cliente Redis global (compartilhado)
 let redisClient = null;
 let redisAvailable = false;
 
+// ✅ Limitadores Lua por algoritmo (criados sob demanda sobre o mesmo cliente)
+const scriptLimiters = new Map();
+
+const RATE_LIMIT_WINDOW_MS = 60 * 1000;
+
 // ✅ Métricas globais
 let totalRequests = 0;
 let blockedRequests = 0;
@@ -118,15 +125,28 @@ function getIdentifier(req) {
   return { identifier: `ip_${ip}`, type: 'IP' };
 }
 
+/**
+ * Obter limitador Lua para o algoritmo (sliding | token_bucket)
+ */
+function getScriptLimiter(algorithm) {
+  let limiter = scriptLimiters.get(algorithm);
+  if (!limiter) {
+    limiter = new RedisRateLimiter(redisClient, { algorithm, windowMs: RATE_LIMIT_WINDOW_MS });
+    scriptLimiters.set(algorithm, limiter);
+  }
+  return limiter;
+}
+
 /**
  * Verificar rate limit usando Redis
  * 
  * @param {Object} req - Request Express
  * @param {string} limitType - Tipo do limite (chat, analysis, webhook)
  * @param {number} maxRequests - Máximo de requisições permitidas
+ * @param {string} algorithm - 'sliding' (padrão) ou 'token_bucket'
  * @returns {Promise<Object>} { allowed, current, identifier }
  */
-async function checkRateLimit(req, limitType, maxRequests) {
+async function checkRateLimit(req, limitType, maxRequests, algorithm = 'sliding') {
   // Inicializar Redis se necessário
   if (!redisClient) {
     initRedis();
@@ -143,24 +163,15 @@ async function checkRateLimit(req, limitType, maxRequests) {
   // Obter identificador (UID ou IP)
   const { identifier, type } = getIdentifier(req);
   
-  // Obter minuto atual (YYYYMMDDHHMM)
-  const now = new Date();
-  const minute = `${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}`;
-  
-  // Chave Redis: rate:{tipo}:{uid|ip}:{minuto}
-  const key = `rate:${limitType}:${identifier}:${minute}`;
+  // Prefixo Redis: rate:{tipo}:{uid|ip} (o script acrescenta a janela)
+  const key = `rate:${limitType}:${identifier}`;
   
   try {
-    // ✅ REDIS INCR: Incrementa contador atomicamente
-    const current = await redisClient.incr(key);
-    
-    // ✅ Se é a primeira requisição deste minuto, setar TTL de 60 segundos
-    if (current === 1) {
-      await redisClient.expire(key, 60);
-    }
+    // ✅ LUA: leitura + incremento + TTL em um único round trip
+    const { allowed, current } = await getScriptLimiter(algorithm).check(key, maxRequests);
     
     // ✅ Verificar se excedeu o limite
-    if (current > maxRequests) {
+    if (!allowed) {
       blockedRequests++;
       console.warn(`⚠️ [RATE_LIMIT_REDIS] Bloqueado: ${limitType} | ${type}: ${identifier.replace('uid_', '').replace('ip_', '')} | ${current}/${maxRequests} req/min`);
       return { allowed: false, current, identifier, type };
@@ -185,12 +196,15 @@ async function checkRateLimit(req, limitType, maxRequests) {
  * 
  * @param {string} limitType - Tipo do limite (chat, analysis, webhook)
  * @param {number} maxRequests - Máximo de requisições por minuto
+ * @param {Object} options - { algorithm: 'sliding' | 'token_bucket' }
  * @returns {Function} Middleware Express
  */
-function createRateLimiter(limitType, maxRequests) {
+function createRateLimiter(limitType, maxRequests, options = {}) {
+  const algorithm = options.algorithm || 'sliding';
+  
   return async function rateLimiterMiddleware(req, res, next) {
     try {
-      const result = await checkRateLimit(req, limitType, maxRequests);
+      const result = await checkRateLimit(req, limitType, maxRequests, algorithm);
       
       if (!result.allowed) {
         // ✅ Log detalhado de bloqueio
@@ -258,7 +272,8 @@ export function getRateLimitStats() {
     redisErrors,
     redisAvailable,
     blockRate: totalRequests > 0 ? (blockedRequests / totalRequests * 100).toFixed(2) + '%' : '0%',
-    errorRate: totalRequests > 0 ? (redisErrors / totalRequests * 100).toFixed(2) + '%' : '0%'
+    errorRate: totalRequests > 0 ? (redisErrors / totalRequests * 100).toFixed(2) + '%' : '0%',
+    scripts: Object.fromEntries([...scriptLimiters].map(([algo, limiter]) => [algo, limiter.getMetrics()]))
   };
 }
 
@@ -266,7 +281,7 @@ export function getRateLimitStats() {
  * NOTAS TÉCNICAS:
  * 
  * 1. ✅ Rate limiting GLOBAL via Redis (compartilhado entre instâncias)
- * 2. ✅ Sliding window usando INCR + EXPIRE (eficiente e preciso)
+ * 2. ✅ Sliding window via script Lua (GET + INCR + PEXPIRE atômicos, 1 round trip)
  * 3. ✅ Chave por UID (se autenticado) com fallback para IP
  * 4. ✅ TTL automático de 60 segundos (limpa automaticamente)
  * 5. ✅ Fallback permissivo se Redis falhar (não bloqueia tudo)
@@ -283,17 +298,16 @@ export function getRateLimitStats() {
  * - ✅ Ataque burst → bloqueio em segundos
  * - ✅ Compatível com sistema de planos (FREE/PLUS/PRO)
  * 
- * CHAVES REDIS:
- * - rate:chat:uid_abc123:202512141230
- * - rate:analysis:ip_189.10.20.30:202512141231
- * - rate:webhook:ip_203.45.67.89:202512141232
+ * CHAVES REDIS (sufixo = índice da janela de 60s):
+ * - rate:chat:uid_abc123:29401234
+ * - rate:analysis:ip_189.10.20.30:29401235
+ * - rate:webhook:ip_203.45.67.89:tb (token bucket)
  * 
  * EXEMPLO DE FLUXO:
  * 1. Requisição chega → extrair UID ou IP
- * 2. Gerar chave: rate:chat:uid_xyz:202512141230
- * 3. INCR na chave (incrementa contador)
- * 4. Se contador = 1 → EXPIRE 60s
- * 5. Se contador > 30 → bloquear (HTTP 429)
- * 6. Se contador <= 30 → permitir
- * 7. Após 60s → chave expira automaticamente
+ * 2. Cache local diz "claramente abaixo do limite"? → permitir sem Redis
+ * 3. Senão: EVALSHA com janela atual + anterior (ponderada)
+ * 4. Estimativa >= 30 → bloquear (HTTP 429)
+ * 5. Senão → INCR + PEXPIRE no mesmo script e permitir
+ * 6. Após 2 janelas → chave expira automaticamente
  */
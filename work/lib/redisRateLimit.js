@@ -0,0 +1,194 @@
+/**
+ * ⚡ REDIS RATE LIMIT CORE - LUA ATÔMICO (1 ROUND TRIP)
+ *
+ * Núcleo compartilhado por rateLimiterRedis.js e scaling/distributed-rate-limiter.js.
+ *
+ * ALGORITMOS:
+ * - 'sliding': janela deslizante aproximada (janela atual + anterior ponderada)
+ *   Chaves: {prefix}:{janela}  → 2 contadores por identificador, O(1) memória
+ * - 'token_bucket': balde de tokens (capacidade = limite, recarga contínua)
+ *   Chave: {prefix}:tb  → hash { tokens, ts }
+ *
+ * Cada verificação = 1 EVALSHA (ioredis defineCommand faz fallback para EVAL).
+ *
+ * CACHE LOCAL DE DECISÃO:
+ * - Quando uma chave está CLARAMENTE abaixo do limite (uso <= 50%), a instância
+ *   recebe um pequeno orçamento local (25% do restante) válido por ~1s.
+ * - Requisições dentro do orçamento são liberadas sem ir ao Redis; elas ficam
+ *   pendentes e são somadas ao contador na próxima ida ao Redis (pending).
+ * - Pior caso de excesso global: réplicas × orçamento durante o TTL do cache.
+ *
+ * @version 1.0.0
+ */
+
+const SLIDING_WINDOW_LUA = `
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local pending = tonumber(ARGV[4])
+
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if pending > 0 then
+  current = redis.call('INCRBY', KEYS[1], pending)
+  redis.call('PEXPIRE', KEYS[1], window * 2)
+end
+
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local weighted = math.floor(previous * (window - elapsed) / window)
+
+if weighted + current >= limit then
+  return {0, weighted + current, window - elapsed}
+end
+
+current = redis.call('INCR', KEYS[1])
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return {1, weighted + current, 0}
+`;
+
+const TOKEN_BUCKET_LUA = `
+local capacity = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local pending = tonumber(ARGV[4])
+local rate = capacity / window
+
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1])
+local ts = tonumber(data[2])
+if tokens == nil then
+  tokens = capacity
+  ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - pending
+
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], window * 2)
+
+local used = math.ceil(capacity - tokens)
+if allowed == 1 then
+  return {1, used, 0}
+end
+return {0, used, math.ceil((1 - tokens) / rate)}
+`;
+
+const LOCAL_CACHE_CONFIG = {
+  ttlMs: 1000,            // decisão local vale por 1s
+  clearRatio: 0.5,        // "claramente abaixo": uso <= 50% do limite
+  budgetRatio: 0.25,      // orçamento local = 25% do restante
+  maxEntries: 10000
+};
+
+/**
+ * Limitador Redis de 1 round trip por verificação
+ */
+export class RedisRateLimiter {
+  /**
+   * @param {import('ioredis').Redis} redis - Cliente ioredis
+   * @param {Object} options - { algorithm: 'sliding'|'token_bucket', windowMs, localCache }
+   */
+  constructor(redis, options = {}) {
+    this.redis = redis;
+    this.algorithm = options.algorithm || 'sliding';
+    this.windowMs = options.windowMs || 60000;
+    this.localCacheEnabled = options.localCache !== false;
+    this.localDecisions = new Map();
+    this.metrics = {
+      checks: 0,
+      redisCalls: 0,
+      localHits: 0,
+      blocked: 0
+    };
+
+    if (typeof redis.rateLimitSliding !== 'function') {
+      redis.defineCommand('rateLimitSliding', { numberOfKeys: 2, lua: SLIDING_WINDOW_LUA });
+    }
+    if (typeof redis.rateLimitTokenBucket !== 'function') {
+      redis.defineCommand('rateLimitTokenBucket', { numberOfKeys: 1, lua: TOKEN_BUCKET_LUA });
+    }
+  }
+
+  /**
+   * Verifica e consome 1 requisição para a chave
+   * @param {string} key - Prefixo da chave (ex: rate:chat:uid_abc)
+   * @param {number} limit - Máximo de requisições por janela
+   * @returns {Promise<{allowed: boolean, current: number, remaining: number, retryAfterMs: number, local: boolean}>}
+   */
+  async check(key, limit) {
+    this.metrics.checks++;
+    const now = Date.now();
+    const cacheKey = `${key}|${limit}`;
+
+    // ✅ CACHE LOCAL: chave claramente abaixo do limite
+    const cached = this.localDecisions.get(cacheKey);
+    if (cached && cached.expiresAt > now && cached.budget > 0) {
+      cached.budget--;
+      cached.pending++;
+      cached.current++;
+      this.metrics.localHits++;
+      return { allowed: true, current: cached.current, remaining: limit - cached.current, retryAfterMs: 0, local: true };
+    }
+
+    const pending = cached ? cached.pending : 0;
+    if (cached) this.localDecisions.delete(cacheKey);
+
+    this.metrics.redisCalls++;
+    const [allowedFlag, current, retryAfterMs] = await this.runScript(key, limit, now, pending);
+    const allowed = allowedFlag === 1;
+
+    if (!allowed) {
+      this.metrics.blocked++;
+    } else if (this.localCacheEnabled && current <= limit * LOCAL_CACHE_CONFIG.clearRatio) {
+      const budget = Math.floor((limit - current) * LOCAL_CACHE_CONFIG.budgetRatio);
+      if (budget > 0) {
+        this.rememberDecision(cacheKey, { expiresAt: now + LOCAL_CACHE_CONFIG.ttlMs, budget, pending: 0, current });
+      }
+    }
+
+    return { allowed, current, remaining: Math.max(0, limit - current), retryAfterMs, local: false };
+  }
+
+  runScript(key, limit, now, pending) {
+    if (this.algorithm === 'token_bucket') {
+      return this.redis.rateLimitTokenBucket(`${key}:tb`, limit, this.windowMs, now, pending);
+    }
+
+    const windowIndex = Math.floor(now / this.windowMs);
+    const elapsed = now - windowIndex * this.windowMs;
+    return this.redis.rateLimitSliding(
+      `${key}:${windowIndex}`,
+      `${key}:${windowIndex - 1}`,
+      limit, this.windowMs, elapsed, pending
+    );
+  }
+
+  rememberDecision(cacheKey, decision) {
+    if (this.localDecisions.size >= LOCAL_CACHE_CONFIG.maxEntries) {
+      const now = Date.now();
+      for (const [k, v] of this.localDecisions) {
+        if (v.expiresAt <= now) this.localDecisions.delete(k);
+      }
+      if (this.localDecisions.size >= LOCAL_CACHE_CONFIG.maxEntries) return;
+    }
+    this.localDecisions.set(cacheKey, decision);
+  }
+
+  getMetrics() {
+    return {
+      ...this.metrics,
+      algorithm: this.algorithm,
+      localDecisions: this.localDecisions.size,
+      localHitRate: this.metrics.checks > 0
+        ? (this.metrics.localHits / this.metrics.checks * 100).toFixed(2) + '%'
+        : '0%'
+    };
+  }
+}
+
+export default RedisRateLimiter;
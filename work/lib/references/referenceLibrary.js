@@ -0,0 +1,292 @@
+// work/lib/references/referenceLibrary.js
+// Biblioteca de Faixas de Referência (por usuário + compartilhada)
+// ✅ A referência é analisada UMA vez; jobs de comparação carregam as métricas pelo id
+//    e analisam apenas a faixa do usuário (1 job em vez de 2 no modo referência)
+
+import pool from '../../db.js';
+
+const LIBRARY_TABLE = 'reference_library';
+const SHARED_OWNER = 'shared';            // owner_uid das referências da biblioteca compartilhada
+const MAX_REFERENCES_PER_USER = 50;       // Limite de referências salvas por usuário
+const SNAPSHOT_VERSION = 1;
+
+// Campos do JSON final que NÃO são métricas da referência (sugestões, diagnóstico, runtime)
+const NON_METRIC_FIELDS = [
+  'suggestions',
+  'aiSuggestions',
+  'problemsAnalysis',
+  'diagnostics',
+  'referenceComparison',
+  'performance',
+  '_worker',
+  'limitWarning',
+  'ownerUid'
+];
+
+// ═══════════════════════════════════════════════════════════════════
+// INICIALIZAÇÃO DA TABELA (AUTO-CREATE)
+// ═══════════════════════════════════════════════════════════════════
+
+let tableInitialized = false;
+
+/**
+ * Criar tabela reference_library se não existir
+ * 🛡️ PROTEÇÃO: Só executa em ambiente DEV (produção/teste: ver SQL_CREATE_TABLES_TESTE.sql)
+ */
+async function ensureTable() {
+  if (tableInitialized) return;
+
+  const env = process.env.NODE_ENV || process.env.RAILWAY_ENVIRONMENT;
+  if (env === 'production' || env === 'test') {
+    tableInitialized = true;
+    return;
+  }
+
+  try {
+    await pool.query(`
+      CREATE TABLE IF NOT EXISTS ${LIBRARY_TABLE} (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        owner_uid VARCHAR(128) NOT NULL,
+        name VARCHAR(255) NOT NULL,
+        file_name VARCHAR(255),
+        fingerprint VARCHAR(128) NOT NULL,
+        source_job_id UUID,
+        snapshot_version INTEGER NOT NULL DEFAULT 1,
+        metrics JSONB NOT NULL,
+        use_count INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+        last_used_at TIMESTAMP WITH TIME ZONE,
+
+        -- Mesma faixa não é salva duas vezes pelo mesmo dono
+        CONSTRAINT unique_reference_owner_fingerprint UNIQUE (owner_uid, fingerprint)
+      );
+
+      CREATE INDEX IF NOT EXISTS idx_reference_library_owner ON ${LIBRARY_TABLE}(owner_uid);
+    `);
+
+    tableInitialized = true;
+    console.log(`✅ [REF-LIBRARY] Tabela ${LIBRARY_TABLE} verificada/criada`);
+  } catch (err) {
+    console.error('❌ [REF-LIBRARY] Erro ao criar tabela:', err.message);
+    tableInitialized = true; // Não tentar novamente (pode ser permissão)
+  }
+}
+
+// ═══════════════════════════════════════════════════════════════════
+// SNAPSHOT DE MÉTRICAS
+// ═══════════════════════════════════════════════════════════════════
+
+/**
+ * 📸 Extrai do JSON final apenas o que a comparação consome
+ * (technicalData, metrics, metadata, bandas...) — mesmo formato de jobs.results,
+ * então generateReferenceComparison / referenceSuggestionEngine funcionam sem adaptação.
+ * @param {Object} results - JSON final de um job reference/base
+ * @returns {Object|null}
+ */
+export function buildReferenceSnapshot(results) {
+  if (!results || typeof results !== 'object' || !results.technicalData) {
+    return null;
+  }
+
+  const snapshot = {};
+  for (const [key, value] of Object.entries(results)) {
+    if (!NON_METRIC_FIELDS.includes(key)) {
+      snapshot[key] = value;
+    }
+  }
+  return snapshot;
+}
+
+/**
+ * 🔒 Só o dono do job reference/base pode salvá-lo na biblioteca
+ * O dono vem de results.ownerUid (planContext.uid gravado pelo analysis-job);
+ * jobs sem dono registrado são recusados.
+ * @param {Object} results - JSON final do job
+ * @param {string} ownerUid - UID de quem está salvando
+ * @returns {string|null} 'FORBIDDEN' ou null
+ */
+export function checkReferenceJobOwner(results, ownerUid) {
+  const jobOwner = results?.ownerUid || null;
+  if (!jobOwner || jobOwner !== ownerUid) {
+    return 'FORBIDDEN';
+  }
+  return null;
+}
+
+/**
+ * 🔑 Fingerprint da referência: hash do arquivo (analysis-job) ou, em jobs antigos, o fileKey
+ */
+function resolveFingerprint(results, job) {
+  return results?.audioFingerprint || (job?.file_key ? `file:${job.file_key}` : `job:${job?.id}`);
+}
+
+function toEntry(row, { withMetrics = false } = {}) {
+  const entry = {
+    id: row.id,
+    name: row.name,
+    fileName: row.file_name,
+    fingerprint: row.fingerprint,
+    shared: row.owner_uid === SHARED_OWNER,
+    sourceJobId: row.source_job_id,
+    useCount: row.use_count,
+    createdAt: row.created_at,
+    lastUsedAt: row.last_used_at
+  };
+  if (withMetrics) {
+    entry.metrics = row.metrics;
+  }
+  return entry;
+}
+
+// ═══════════════════════════════════════════════════════════════════
+// OPERAÇÕES
+// ═══════════════════════════════════════════════════════════════════
+
+/**
+ * 💾 Salva na biblioteca as métricas de um job reference/base já concluído
+ * Idempotente por (dono, fingerprint): salvar a mesma faixa de novo devolve a entrada existente.
+ *
+ * @param {Object} params
+ * @param {string} params.ownerUid - UID do usuário
+ * @param {string} params.jobId - Job reference/base concluído
+ * @param {string} [params.name] - Nome exibido (default: nome do arquivo)
+ * @param {boolean} [params.shared=false] - Salvar na biblioteca compartilhada
+ * @returns {Promise<{success: boolean, reference?: Object, created?: boolean, error?: string}>}
+ */
+export async function saveReferenceFromJob({ ownerUid, jobId, name = null, shared = false }) {
+  if (!ownerUid || !jobId) {
+    return { success: false, error: 'MISSING_DATA' };
+  }
+
+  await ensureTable();
+
+  const jobResult = await pool.query(
+    'SELECT id, file_key, status, results FROM jobs WHERE id = $1',
+    [jobId]
+  );
+  const job = jobResult.rows[0];
+  if (!job) {
+    return { success: false, error: 'JOB_NOT_FOUND' };
+  }
+  if (job.status !== 'completed' || !job.results) {
+    return { success: false, error: 'JOB_NOT_COMPLETED' };
+  }
+
+  const results = typeof job.results === 'string' ? JSON.parse(job.results) : job.results;
+  if (results.mode !== 'reference') {
+    return { success: false, error: 'NOT_REFERENCE_JOB' };
+  }
+  const ownershipError = checkReferenceJobOwner(results, ownerUid);
+  if (ownershipError) {
+    return { success: false, error: ownershipError };
+  }
+
+  const metrics = buildReferenceSnapshot(results);
+  if (!metrics) {
+    return { success: false, error: 'INVALID_RESULTS' };
+  }
+
+  const owner = shared ? SHARED_OWNER : ownerUid;
+  const fingerprint = resolveFingerprint(results, job);
+  const fileName = results.metadata?.fileName || null;
+
+  if (!shared) {
+    const countResult = await pool.query(
+      `SELECT COUNT(*)::int AS total FROM ${LIBRARY_TABLE} WHERE owner_uid = $1`,
+      [owner]
+    );
+    if (countResult.rows[0].total >= MAX_REFERENCES_PER_USER) {
+      const existing = await pool.query(
+        `SELECT * FROM ${LIBRARY_TABLE} WHERE owner_uid = $1 AND fingerprint = $2`,
+        [owner, fingerprint]
+      );
+      if (existing.rows.length === 0) {
+        return { success: false, error: 'LIBRARY_FULL', max: MAX_REFERENCES_PER_USER };
+      }
+    }
+  }
+
+  // ON CONFLICT: mesma faixa → mantém a entrada (e o id) e só atualiza o nome
+  const upsert = await pool.query(
+    `INSERT INTO ${LIBRARY_TABLE} (owner_uid, name, file_name, fingerprint, source_job_id, snapshot_version, metrics)
+     VALUES ($1, $2, $3, $4, $5, $6, $7)
+     ON CONFLICT (owner_uid, fingerprint)
+     DO UPDATE SET name = COALESCE($8, ${LIBRARY_TABLE}.name)
+     RETURNING *, (xmax = 0) AS inserted`,
+    [owner, name || fileName || 'Referência', fileName, fingerprint, job.id, SNAPSHOT_VERSION, metrics, name]
+  );
+
+  const row = upsert.rows[0];
+  console.log(`📚 [REF-LIBRARY] Referência ${row.inserted ? 'salva' : 'já existente'}: ${row.id} (owner=${shared ? SHARED_OWNER : ownerUid.slice(0, 8) + '...'})`);
+
+  return { success: true, created: row.inserted, reference: toEntry(row) };
+}
+
+/**
+ * 📋 Lista referências do usuário + compartilhadas (sem as métricas)
+ * @param {string} ownerUid
+ * @returns {Promise<Object[]>}
+ */
+export async function listReferences(ownerUid) {
+  await ensureTable();
+
+  const result = await pool.query(
+    `SELECT id, owner_uid, name, file_name, fingerprint, source_job_id, use_count, created_at, last_used_at
+     FROM ${LIBRARY_TABLE}
+     WHERE owner_uid = $1 OR owner_uid = $2
+     ORDER BY (owner_uid = $2), COALESCE(last_used_at, created_at) DESC`,
+    [ownerUid, SHARED_OWNER]
+  );
+  return result.rows.map(row => toEntry(row));
+}
+
+/**
+ * 🔍 Busca uma referência acessível ao usuário (própria ou compartilhada)
+ * @param {string} referenceId
+ * @param {string} ownerUid
+ * @returns {Promise<Object|null>} entrada sem métricas
+ */
+export async function getReference(referenceId, ownerUid) {
+  await ensureTable();
+
+  const result = await pool.query(
+    `SELECT id, owner_uid, name, file_name, fingerprint, source_job_id, use_count, created_at, last_used_at
+     FROM ${LIBRARY_TABLE}
+     WHERE id = $1 AND (owner_uid = $2 OR owner_uid = $3)`,
+    [referenceId, ownerUid, SHARED_OWNER]
+  );
+  return result.rows[0] ? toEntry(result.rows[0]) : null;
+}
+
+/**
+ * 📥 Carrega as métricas pré-computadas para um job de comparação
+ * (acesso já validado na API via getReference) e registra o uso.
+ * @param {string} referenceId
+ * @returns {Promise<Object|null>} entrada com metrics no formato de jobs.results
+ */
+export async function loadReferenceMetrics(referenceId) {
+  const result = await pool.query(
+    `UPDATE ${LIBRARY_TABLE}
+     SET use_count = use_count + 1, last_used_at = NOW()
+     WHERE id = $1
+     RETURNING *`,
+    [referenceId]
+  );
+  return result.rows[0] ? toEntry(result.rows[0], { withMetrics: true }) : null;
+}
+
+/**
+ * 🗑️ Remove uma referência do próprio usuário (compartilhadas não são removidas por aqui)
+ * @returns {Promise<boolean>}
+ */
+export async function deleteReference(referenceId, ownerUid) {
+  await ensureTable();
+
+  const result = await pool.query(
+    `DELETE FROM ${LIBRARY_TABLE} WHERE id = $1 AND owner_uid = $2`,
+    [referenceId, ownerUid]
+  );
+  return result.rowCount > 0;
+}
+
+export { SHARED_OWNER, MAX_REFERENCES_PER_USER };
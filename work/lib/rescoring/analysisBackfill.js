@@ -0,0 +1,168 @@
+// work/lib/rescoring/analysisBackfill.js
+// Backfill em lotes sobre as análises salvas em jobs.results
+// ✅ Paginação por cursor (created_at, id) - sem OFFSET, custo constante por lote
+// ✅ Throttling: tamanho do lote + pausa entre lotes (não disputa o banco com os workers)
+// ✅ Escrita otimista: só grava se o job não mudou desde a leitura (updated_at igual)
+// ✅ Progresso (taxa/ETA) e cursor por lote para retomar de onde parou
+//
+// A origem dos dados é injetada (mesma interface nos dois):
+//   - createJobsSource(pool)  → PostgreSQL (tabela jobs)
+//   - fonte em memória        → testes
+
+import { serializeResultJSON } from '../serialization/result-schema.js';
+
+export const BACKFILL_CONFIG = {
+  BATCH_SIZE: 100,
+  DELAY_MS: 250,              // pausa entre lotes
+  STATUSES: ['done', 'completed']
+};
+
+/**
+ * Origem PostgreSQL: jobs concluídos, em ordem (created_at, id)
+ * @param {import('pg').Pool} db
+ * @param {Object} [filters]
+ * @param {string} [filters.genre] - só análises deste gênero
+ * @param {string} [filters.mode='genre']
+ */
+export function createJobsSource(db, { genre = null, mode = 'genre' } = {}) {
+  const where = ['status = ANY($1)', 'mode = $2'];
+  const params = [BACKFILL_CONFIG.STATUSES, mode];
+  if (genre) {
+    // ::jsonb funciona com a coluna results em jsonb ou text
+    params.push(genre);
+    where.push(`results::jsonb ->> 'genre' = $${params.length}`);
+  }
+  const filterSql = where.join(' AND ');
+
+  const afterCursor = (cursor, queryParams) => {
+    if (!cursor) return '';
+    queryParams.push(cursor.createdAt, cursor.id);
+    return ` AND (created_at, id) > ($${queryParams.length - 1}::timestamptz, $${queryParams.length}::uuid)`;
+  };
+
+  return {
+    async count(cursor) {
+      const countParams = [...params];
+      const cursorSql = afterCursor(cursor, countParams);
+      const { rows } = await db.query(`SELECT COUNT(*)::int AS total FROM jobs WHERE ${filterSql}${cursorSql}`, countParams);
+      return rows[0].total;
+    },
+
+    async fetchBatch(cursor, limit) {
+      const batchParams = [...params];
+      const cursorSql = afterCursor(cursor, batchParams);
+      batchParams.push(limit);
+      // Timestamps como texto: Date do JS perde os microssegundos (cursor repetiria linhas
+      // e a comparação otimista de updated_at nunca bateria)
+      const { rows } = await db.query(
+        `SELECT id, results, updated_at::text AS version, created_at::text AS cursor_at
+           FROM jobs
+          WHERE ${filterSql}${cursorSql}
+          ORDER BY created_at, id
+          LIMIT $${batchParams.length}`,
+        batchParams
+      );
+      return rows.map(row => ({
+        id: row.id,
+        results: row.results,
+        version: row.version,
+        cursor: { createdAt: row.cursor_at, id: row.id }
+      }));
+    },
+
+    async save(row, results) {
+      const json = serializeResultJSON(results);
+      // result (legado do worker.js) só é atualizado onde existia
+      const { rowCount } = await db.query(
+        `UPDATE jobs
+            SET results = $1,
+                result = CASE WHEN result IS NULL THEN NULL ELSE $2 END,
+                updated_at = NOW()
+          WHERE id = $3 AND updated_at IS NOT DISTINCT FROM $4::timestamptz`,
+        [json, json, row.id, row.version]
+      );
+      return rowCount === 1;
+    }
+  };
+}
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+function parseResults(results) {
+  return typeof results === 'string' ? JSON.parse(results) : results;
+}
+
+/**
+ * Percorre a origem em lotes aplicando transform a cada análise
+ * @param {Object} source - { count(cursor), fetchBatch(cursor, limit), save(row, results) }
+ * @param {Object} params
+ * @param {Function} params.transform - async (results, row) → { status: 'updated'|'skipped', results?, reason? }
+ * @param {Object} [params.cursor] - { createdAt, id } para retomar após a última linha processada
+ * @param {number} [params.batchSize]
+ * @param {number} [params.delayMs]
+ * @param {number} [params.limit] - máximo de análises lidas nesta execução
+ * @param {boolean} [params.dryRun] - calcula mas não grava
+ * @param {Function} [params.onBatch] - (progress) após cada lote (checkpoint do cursor)
+ * @param {Function} [params.onError] - ({ id, error }) por análise que falhou
+ * @param {Function} [params.shouldStop] - () → true interrompe após o lote atual
+ * @returns {Promise<Object>} estatísticas finais + cursor
+ */
+export async function runBackfill(source, {
+  transform,
+  cursor = null,
+  batchSize = BACKFILL_CONFIG.BATCH_SIZE,
+  delayMs = BACKFILL_CONFIG.DELAY_MS,
+  limit = Infinity,
+  dryRun = false,
+  onBatch,
+  onError,
+  shouldStop
+}) {
+  const startedAt = Date.now();
+  const total = Math.min(await source.count(cursor), limit);
+  const stats = { total, scanned: 0, updated: 0, skipped: 0, conflicts: 0, failed: 0, batches: 0, skippedBy: {} };
+  let position = cursor;
+
+  while (stats.scanned < limit) {
+    const size = Math.min(batchSize, limit - stats.scanned);
+    const rows = await source.fetchBatch(position, size);
+    if (rows.length === 0) break;
+
+    for (const row of rows) {
+      stats.scanned++;
+      try {
+        const outcome = await transform(parseResults(row.results), row);
+        if (outcome.status !== 'updated') {
+          stats.skipped++;
+          stats.skippedBy[outcome.reason || 'unknown'] = (stats.skippedBy[outcome.reason || 'unknown'] || 0) + 1;
+        } else if (dryRun || await source.save(row, outcome.results)) {
+          stats.updated++;
+        } else {
+          // Job re-processado/alterado durante o backfill: a versão nova já usa os targets atuais
+          stats.conflicts++;
+        }
+      } catch (error) {
+        stats.failed++;
+        onError?.({ id: row.id, error });
+      }
+    }
+
+    position = rows[rows.length - 1].cursor;
+    stats.batches++;
+
+    const elapsedMs = Date.now() - startedAt;
+    const rate = stats.scanned / Math.max(elapsedMs / 1000, 0.001);
+    await onBatch?.({
+      ...stats,
+      cursor: position,
+      elapsedMs,
+      rate,
+      etaSeconds: total > stats.scanned ? Math.round((total - stats.scanned) / rate) : 0
+    });
+
+    if (rows.length < size || shouldStop?.()) break;
+    if (delayMs > 0) await sleep(delayMs);
+  }
+
+  return { ...stats, cursor: position, dryRun, elapsedMs: Date.now() - startedAt };
+}
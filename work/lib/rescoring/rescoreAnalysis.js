@@ -0,0 +1,137 @@
+// work/lib/rescoring/rescoreAnalysis.js
+// Re-scoring de uma análise salva contra os targets ATUAIS do gênero
+// ✅ Sem decode de áudio: usa apenas technicalData/data.metrics já gravados em jobs.results
+// ✅ Mesmas funções do pipeline: computeMixScore (via reference flat) + Motor V2 de sugestões
+// ❌ Não chama a IA: aiSuggestions voltam ao fallback das sugestões base (aiEnhanced: false)
+// 🔐 Modo reduzido: texto das sugestões mascarado como no pipeline (reduced-mode-mask.js)
+
+import { computeMixScore } from '../audio/features/scoring.js';
+import { analyzeProblemsAndSuggestionsV2 } from '../audio/features/problems-suggestions-v2.js';
+import { normalizeGenreTargets } from '../audio/utils/normalize-genre-targets.js';
+import { applySoundDestinationOverride, toScoringReference, toFrontendFlatTargets } from '../audio/utils/scoring-targets.js';
+import { orderSuggestionsForUser } from '../audio/utils/suggestion-order.js';
+import { isReducedAnalysis, maskReducedSuggestions } from '../audio/utils/reduced-mode-mask.js';
+import { buildScoreFields } from '../../api/audio/json-output.js';
+import { normalizeValuePrecision } from '../serialization/result-schema.js';
+
+export const RESCORE_VERSION = 1;
+
+/**
+ * JSON com chaves ordenadas: jsonb não preserva a ordem das chaves, então a comparação
+ * "targets salvos == targets atuais" precisa ignorar a ordem
+ */
+function stableStringify(value) {
+  if (Array.isArray(value)) return `[${value.map(stableStringify).join(',')}]`;
+  if (value && typeof value === 'object') {
+    return `{${Object.keys(value).sort().map(k => `${JSON.stringify(k)}:${stableStringify(value[k])}`).join(',')}}`;
+  }
+  return JSON.stringify(value);
+}
+
+/**
+ * Motivo para NÃO re-scorar a análise (ou null se ela é elegível)
+ * @param {Object} results - JSON final salvo em jobs.results
+ */
+export function skipReason(results) {
+  if (!results || typeof results !== 'object') return 'invalid_results';
+  if ((results.mode || 'genre') !== 'genre') return 'not_genre_mode';
+  if (results.referenceStage) return 'reference_flow';
+  if (!results.genre || results.genre === 'default') return 'missing_genre';
+  if (!results.technicalData || !results.data?.metrics) return 'missing_technical_data';
+  return null;
+}
+
+/**
+ * Re-calcula score e sugestões de uma análise salva
+ * @param {Object} results - JSON final salvo (não é alterado)
+ * @param {Object} baseTargets - targets nested do gênero (loadGenreTargetsFromWorker), SEM override
+ * @param {Object} [options]
+ * @param {boolean} [options.force=false] - re-scorar mesmo com targets iguais aos salvos
+ * @returns {{ status: 'updated'|'skipped', reason?: string, results?: Object, previousScore?: number, score?: number }}
+ */
+export function rescoreAnalysis(results, baseTargets, { force = false } = {}) {
+  const reason = skipReason(results);
+  if (reason) return { status: 'skipped', reason };
+  if (!Number.isFinite(baseTargets?.lufs?.target)) return { status: 'skipped', reason: 'missing_targets' };
+
+  const soundDestination = results.soundDestination || 'pista';
+  const customTargets = applySoundDestinationOverride(baseTargets, soundDestination);
+
+  // Idempotente: targets iguais aos usados na análise → nada a fazer
+  // (comparados com a mesma precisão com que foram gravados em jobs.results)
+  if (!force && stableStringify(results.data.genreTargets) === stableStringify(normalizeValuePrecision(customTargets))) {
+    return { status: 'skipped', reason: 'up_to_date' };
+  }
+
+  const updated = structuredClone(results);
+  const genre = updated.genre;
+
+  // ========= SCORE (mesmo caminho de generateJSONOutput) =========
+  const scoringResult = computeMixScore(updated.technicalData, toScoringReference(customTargets));
+  const scoreValue = scoringResult?.score || scoringResult?.scorePct;
+  if (typeof scoreValue !== 'number' || !isFinite(scoreValue)) {
+    throw new Error(`Invalid scoring result: ${JSON.stringify(scoringResult)}`);
+  }
+  Object.assign(updated, buildScoreFields(scoringResult));
+
+  updated.data.genreTargets = customTargets;
+  if (updated.data.targets) updated.data.targets = toFrontendFlatTargets(customTargets);
+
+  // ========= SUGESTÕES V2 (mesmo consolidatedData da Fase 5.4.1) =========
+  // comparisonResult salvo foi calculado com os targets antigos: o Motor V2 recalcula o dele
+  const problemsAndSuggestions = analyzeProblemsAndSuggestionsV2(updated.technicalData, genre, customTargets, {
+    data: {
+      metrics: updated.data.metrics,
+      genreTargets: normalizeGenreTargets(customTargets)
+    },
+    soundDestination,
+    comparisonResult: null
+  });
+
+  const suggestions = orderSuggestionsForUser(problemsAndSuggestions.suggestions || []);
+
+  updated.problemsAnalysis = {
+    problems: problemsAndSuggestions.problems || [],
+    suggestions,
+    qualityAssessment: problemsAndSuggestions.qualityAssessment || {},
+    priorityRecommendations: problemsAndSuggestions.priorityRecommendations || []
+  };
+  updated.diagnostics = {
+    problems: problemsAndSuggestions.diagnostics?.problems || [],
+    suggestions,
+    prioritized: problemsAndSuggestions.diagnostics?.prioritized || []
+  };
+  updated.suggestions = suggestions;
+
+  // Texto da IA foi escrito para os targets antigos: volta ao fallback das sugestões base
+  updated.aiSuggestions = suggestions.map(sug => ({
+    ...sug,
+    aiEnhanced: false,
+    enrichmentStatus: 'rescored'
+  }));
+
+  // Análise do modo reduzido: mesmo bloqueio de texto aplicado no fim do pipeline
+  if (isReducedAnalysis(results)) maskReducedSuggestions(updated);
+
+  updated.summary = { ...(problemsAndSuggestions.summary || { overallRating: 'Análise não disponível', score: 0 }), genre };
+  updated.suggestionMetadata = {
+    ...(problemsAndSuggestions.metadata || {
+      totalSuggestions: suggestions.length,
+      criticalCount: 0,
+      warningCount: 0,
+      okCount: 0,
+      analysisDate: new Date().toISOString(),
+      version: '2.0.0'
+    }),
+    genre
+  };
+
+  updated.rescoring = {
+    version: RESCORE_VERSION,
+    rescoredAt: new Date().toISOString(),
+    previousScore: results.score ?? null,
+    soundDestination
+  };
+
+  return { status: 'updated', results: updated, previousScore: results.score ?? null, score: updated.score };
+}
@@ -4,10 +4,14 @@
  * Previne sobrecarga e melhora performance com múltiplos usuários
  */
 
+import { getQueueWeight } from '../entitlements.js';
+import { waitBucket } from '../queue-fair-share.js';
+
 // Configurações padrão
 const DEFAULT_MAX_CONCURRENT = 2;
 const DEFAULT_QUEUE_TIMEOUT = 5 * 60 * 1000; // 5 minutos
 const DEFAULT_JOB_TIMEOUT = 120 * 1000; // 2 minutos
+const DEFAULT_MAX_PER_USER = 1; // jobs simultâneos por usuário
 
 /**
  * Processador de fila de áudio avançado
@@ -17,6 +21,10 @@ class AudioProcessingQueue {
     this.maxConcurrent = options.maxConcurrent || DEFAULT_MAX_CONCURRENT;
     this.queueTimeout = options.queueTimeout || DEFAULT_QUEUE_TIMEOUT;
     this.defaultJobTimeout = options.jobTimeout || DEFAULT_JOB_TIMEOUT;
+    this.maxPerUser = options.maxPerUser || DEFAULT_MAX_PER_USER;
+    
+    // Fair-share: por usuário → { running, served } (served = trabalho já atendido / peso)
+    this.userShares = new Map();
     
     this.queue = [];
     this.running = [];
@@ -31,7 +39,8 @@ class AudioProcessingQueue {
       failedJobs: 0,
       averageProcessingTime: 0,
       queuedJobs: 0,
-      runningJobs: 0
+      runningJobs: 0,
+      waitHistogramByPlan: {}
     };
     
     console.log('🎵 AudioProcessingQueue inicializada:', {
@@ -56,7 +65,8 @@ class AudioProcessingQueue {
         timeout: options.timeout || this.defaultJobTimeout,
         label: options.label || `audio-${Date.now()}`,
         enqueuedAt: Date.now(),
-        userId: options.userId || 'anonymous'
+        userId: options.userId || 'anonymous',
+        plan: options.plan || 'free'
       };
       
       // Verificar limite de fila por usuário
@@ -93,14 +103,15 @@ class AudioProcessingQueue {
       return;
     }
     
-    // Ordenar por prioridade (menor número = maior prioridade)
-    this.queue.sort((a, b) => {
-      if (a.priority !== b.priority) return a.priority - b.priority;
-      return a.enqueuedAt - b.enqueuedAt; // FIFO para mesma prioridade
-    });
+    const job = this.pickNextJob();
+    if (!job) return; // todos os usuários com trabalhos na fila estão no teto
     
-    const job = this.queue.shift();
+    this.removeFromQueue(job.id);
     this.running.push(job);
+    const share = this.getUserShare(job.userId);
+    share.running++;
+    share.served += 1 / getQueueWeight(job.plan);
+    this.recordWait(job.plan, Date.now() - job.enqueuedAt);
     this.metrics.queuedJobs = this.queue.length;
     this.metrics.runningJobs = this.running.length;
     
@@ -135,6 +146,7 @@ class AudioProcessingQueue {
     } finally {
       // Remover da lista de execução
       this.running = this.running.filter(r => r.id !== job.id);
+      this.releaseUserShare(job.userId);
       this.metrics.runningJobs = this.running.length;
       
       // Processar próximo
@@ -142,6 +154,64 @@ class AudioProcessingQueue {
     }
   }
   
+  /**
+   * Escolhe o próximo trabalho (fair-share ponderado por plano)
+   * Menor "served" do usuário primeiro → prioridade explícita → FIFO
+   */
+  pickNextJob() {
+    let best = null;
+    let bestServed = Infinity;
+    
+    for (const job of this.queue) {
+      const share = this.getUserShare(job.userId);
+      if (share.running >= this.maxPerUser) continue;
+      
+      if (!best ||
+          share.served < bestServed ||
+          (share.served === bestServed && (job.priority < best.priority ||
+            (job.priority === best.priority && job.enqueuedAt < best.enqueuedAt)))) {
+        best = job;
+        bestServed = share.served;
+      }
+    }
+    
+    return best;
+  }
+  
+  getUserShare(userId) {
+    let share = this.userShares.get(userId);
+    if (!share) {
+      // Novo usuário entra no nível do menos atendido (não acumula "crédito" ocioso)
+      let minServed = Infinity;
+      for (const s of this.userShares.values()) minServed = Math.min(minServed, s.served);
+      share = { running: 0, served: Number.isFinite(minServed) ? minServed : 0 };
+      this.userShares.set(userId, share);
+    }
+    return share;
+  }
+  
+  releaseUserShare(userId) {
+    const share = this.userShares.get(userId);
+    if (!share) return;
+    share.running = Math.max(0, share.running - 1);
+    
+    // Usuário sem trabalhos pendentes sai da tabela
+    if (share.running === 0 && !this.queue.some(j => j.userId === userId)) {
+      this.userShares.delete(userId);
+    }
+  }
+  
+  /**
+   * Histograma de espera na fila por plano
+   */
+  recordWait(plan, waitMs) {
+    const histogram = this.metrics.waitHistogramByPlan[plan] ||
+      (this.metrics.waitHistogramByPlan[plan] = { count: 0, buckets: {} });
+    const bucket = waitBucket(waitMs);
+    histogram.count++;
+    histogram.buckets[bucket] = (histogram.buckets[bucket] || 0) + 1;
+  }
+  
   /**
    * Processa arquivo de áudio (integração com sistema existente)
    */
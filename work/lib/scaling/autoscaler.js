@@ -0,0 +1,359 @@
+/**
+ * 📈 AUTOSCALER LOCAL - WORKERS DE ANÁLISE E MASTERIZAÇÃO
+ *
+ * Problema: worker-redis.js sobe com ANALYSIS_CONCURRENCY fixa e o automaster-worker com
+ * AUTOMASTER_CONCURRENCY fixa; pico de uploads vira fila longa, madrugada vira RAM parada.
+ *
+ * SINAIS (a cada AUTOSCALE_INTERVAL_MS, lidos pelo supervisor.js):
+ *   - fila BullMQ: waiting + prioritized (delayed do fair-share não conta como demanda)
+ *   - idade do job mais antigo esperando e duração média dos últimos jobs concluídos
+ *   - host: CPU (delta de os.cpus) e memória usada
+ *
+ * DECISÃO (planScale, pura):
+ *   - slots necessários = ativos + backlog × duraçãoMédia / SLO (fila drenada dentro do SLO)
+ *   - sobe rápido (cooldown curto) se o mais antigo passou de metade do SLO ou a espera prevista
+ *     estoura o SLO — nunca com CPU/memória acima do limite
+ *   - desce devagar (cooldown longo, no máximo 1/4 dos slots por vez) com fila vazia e ociosidade
+ *   - memória crítica: corta um passo mesmo com fila
+ *   - slots → processos × concorrência: concorrência primeiro (até o máximo seguro do worker),
+ *     processos só quando a concorrência não basta
+ *
+ * APLICAÇÃO (WorkerPool):
+ *   - concorrência: IPC { type: 'scale', concurrency } → worker.concurrency do BullMQ em runtime
+ *   - processo a mais: fork com a concorrência atual no env
+ *   - processo a menos: SIGTERM → gracefulShutdown do próprio worker (worker.close() espera os
+ *     jobs ativos); o processo só sai da contagem quando termina
+ *   - processo que morre sem ter sido drenado é recriado
+ *
+ * @version 1.0.0
+ */
+
+import { fork } from 'child_process';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { createLogger } from '../logger.js';
+
+const logger = createLogger('autoscaler');
+
+const WORK_DIR = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '../..');
+
+const envNumber = (name, fallback) => {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && process.env[name] !== '' ? value : fallback;
+};
+
+export const AUTOSCALER_CONFIG = {
+  intervalMs: envNumber('AUTOSCALE_INTERVAL_MS', 15000),
+  queueWaitSloMs: envNumber('AUTOSCALE_QUEUE_WAIT_SLO_MS', 30000),  // alinhado ao bucket de 30s do fair-share
+  upCooldownMs: envNumber('AUTOSCALE_UP_COOLDOWN_MS', 30000),
+  downCooldownMs: envNumber('AUTOSCALE_DOWN_COOLDOWN_MS', 300000),
+  downUtilization: 0.5,             // ativos/capacidade abaixo disso (com fila vazia) = ocioso
+  cpuHigh: envNumber('AUTOSCALE_CPU_HIGH', 0.85),
+  memHigh: envNumber('AUTOSCALE_MEM_HIGH', 0.85),
+  memCritical: envNumber('AUTOSCALE_MEM_CRITICAL', 0.93),
+  completedSample: 20,              // jobs concluídos usados na duração média
+  drainTimeoutMs: 330000            // > timeout do job (5min): processo drenando é morto depois disso
+};
+
+/**
+ * Pools supervisionados: fila, script e limites (máximos seguros dos próprios workers)
+ */
+export const AUTOSCALER_POOLS = {
+  analysis: {
+    queue: 'audio-analyzer',
+    script: path.join(WORK_DIR, 'worker-redis.js'),
+    concurrencyEnv: 'ANALYSIS_CONCURRENCY',
+    minProcesses: envNumber('AUTOSCALE_ANALYSIS_MIN_PROCESSES', 1),
+    maxProcesses: envNumber('AUTOSCALE_ANALYSIS_MAX_PROCESSES', Math.max(1, Math.floor(os.cpus().length / 2))),
+    minConcurrency: 1,
+    maxConcurrency: envNumber('AUTOSCALE_ANALYSIS_MAX_CONCURRENCY', 6),   // MAX_SAFE_CONCURRENCY do worker-redis
+    initialConcurrency: 2,          // DEFAULT_SAFE_CONCURRENCY do worker-redis
+    defaultJobMs: 60000,
+    healthPort: true                // cada processo sobe o health server em PORT própria
+  },
+  mastering: {
+    queue: 'automaster',
+    script: path.join(WORK_DIR, '..', 'queue', 'automaster-worker.cjs'),
+    concurrencyEnv: 'AUTOMASTER_CONCURRENCY',
+    minProcesses: envNumber('AUTOSCALE_MASTERING_MIN_PROCESSES', 1),
+    maxProcesses: envNumber('AUTOSCALE_MASTERING_MAX_PROCESSES', Math.max(1, Math.floor(os.cpus().length / 4))),
+    minConcurrency: 1,
+    maxConcurrency: envNumber('AUTOSCALE_MASTERING_MAX_CONCURRENCY', 4),  // validação de boot do automaster-worker
+    initialConcurrency: 1,
+    defaultJobMs: 90000,
+    healthPort: false
+  }
+};
+
+const clamp = (value, min, max) => Math.min(max, Math.max(min, value));
+
+/**
+ * Slots totais → { processes, concurrency } dentro dos limites do pool
+ * @param {number} slots
+ * @param {Object} bounds - { minProcesses, maxProcesses, minConcurrency, maxConcurrency }
+ */
+export function slotsToShape(slots, bounds) {
+  const processes = clamp(Math.ceil(slots / bounds.maxConcurrency), bounds.minProcesses, bounds.maxProcesses);
+  const concurrency = clamp(Math.ceil(slots / processes), bounds.minConcurrency, bounds.maxConcurrency);
+  return { processes, concurrency };
+}
+
+/**
+ * Decide o tamanho do pool
+ * @param {Object} input
+ * @param {{processes: number, concurrency: number}} input.current
+ * @param {Object} input.bounds - limites do pool (AUTOSCALER_POOLS[x])
+ * @param {Object} input.queue - { waiting, active, oldestWaitMs, avgJobMs }
+ * @param {Object} input.host - { cpu, memUsed } (0-1)
+ * @param {number} input.now
+ * @param {number} input.lastScaleUpAt
+ * @param {number} input.lastScaleDownAt
+ * @param {Object} [config]
+ * @returns {{ processes: number, concurrency: number, slots: number, action: 'up'|'down'|'hold', reason: string, predictedWaitMs: number }}
+ */
+export function planScale({ current, bounds, queue, host, now, lastScaleUpAt = 0, lastScaleDownAt = 0 }, config = AUTOSCALER_CONFIG) {
+  const capacity = current.processes * current.concurrency;
+  const minSlots = bounds.minProcesses * bounds.minConcurrency;
+  const maxSlots = bounds.maxProcesses * bounds.maxConcurrency;
+  const avgJobMs = queue.avgJobMs || bounds.defaultJobMs;
+  const predictedWaitMs = capacity > 0 ? (queue.waiting * avgJobMs) / capacity : Infinity;
+  const lastChangeAt = Math.max(lastScaleUpAt, lastScaleDownAt);
+
+  const hold = reason => ({ ...current, slots: capacity, action: 'hold', reason, predictedWaitMs: Math.round(predictedWaitMs) });
+  const result = (slots, action, reason) => {
+    const shape = slotsToShape(slots, bounds);
+    if (shape.processes === current.processes && shape.concurrency === current.concurrency) return hold(reason);
+    return { ...shape, slots: shape.processes * shape.concurrency, action, reason, predictedWaitMs: Math.round(predictedWaitMs) };
+  };
+
+  // Memória crítica: um passo abaixo mesmo com fila (OOM derruba todos os jobs do host);
+  // espera o cooldown curto para o processo drenado devolver a RAM antes do próximo corte
+  if (host.memUsed >= config.memCritical && capacity > minSlots) {
+    if (now - lastScaleDownAt < config.upCooldownMs) return hold('memória crítica - aguardando drenagem');
+    return result(Math.max(minSlots, capacity - current.concurrency), 'down', `memória crítica ${(host.memUsed * 100).toFixed(0)}%`);
+  }
+
+  const needed = clamp(Math.ceil(queue.active + (queue.waiting * avgJobMs) / config.queueWaitSloMs), minSlots, maxSlots);
+  const behindSlo = queue.oldestWaitMs > config.queueWaitSloMs / 2 || predictedWaitMs > config.queueWaitSloMs;
+
+  if (queue.waiting > 0 && behindSlo && needed > capacity) {
+    if (host.cpu >= config.cpuHigh || host.memUsed >= config.memHigh) {
+      return hold(`fila acima do SLO mas host saturado (cpu ${(host.cpu * 100).toFixed(0)}%, mem ${(host.memUsed * 100).toFixed(0)}%)`);
+    }
+    if (now - lastChangeAt < config.upCooldownMs) return hold('cooldown de subida');
+    return result(needed, 'up', `${queue.waiting} na fila, mais antigo ${Math.round(queue.oldestWaitMs / 1000)}s`);
+  }
+
+  const idle = queue.waiting === 0 && queue.active < capacity * config.downUtilization;
+  if (idle && capacity > minSlots) {
+    if (now - lastChangeAt < config.downCooldownMs) return hold('cooldown de descida');
+    const step = Math.max(1, Math.floor(capacity / 4));
+    const target = Math.max(minSlots, queue.active + 1, capacity - step);
+    if (target < capacity) return result(target, 'down', `ocioso (${queue.active}/${capacity} ativos)`);
+  }
+
+  return hold('dentro do SLO');
+}
+
+/**
+ * Sinais de uma fila BullMQ (ou objeto com a mesma interface)
+ * @param {Object} queue - Queue do BullMQ
+ * @param {Object} [options] - { now, completedSample }
+ * @returns {Promise<{waiting: number, active: number, delayed: number, oldestWaitMs: number, avgJobMs: number|null}>}
+ */
+export async function readQueueSignals(queue, { now = Date.now(), completedSample = AUTOSCALER_CONFIG.completedSample } = {}) {
+  const counts = await queue.getJobCounts('waiting', 'prioritized', 'active', 'delayed');
+  const waiting = (counts.waiting || 0) + (counts.prioritized || 0);
+
+  // Mais antigo: início da lista wait + amostra dos prioritized (ordenados por prioridade, não idade)
+  let oldestWaitMs = 0;
+  if (waiting > 0) {
+    const [oldestWait, prioritized] = await Promise.all([
+      queue.getJobs(['wait'], 0, 0, true),
+      counts.prioritized ? queue.getJobs(['prioritized'], 0, 49, true) : []
+    ]);
+    for (const job of [...oldestWait, ...prioritized]) {
+      if (job?.timestamp) oldestWaitMs = Math.max(oldestWaitMs, now - job.timestamp);
+    }
+  }
+
+  const completed = await queue.getJobs(['completed'], 0, completedSample - 1, false);
+  const durations = completed
+    .filter(job => job?.processedOn && job?.finishedOn)
+    .map(job => job.finishedOn - job.processedOn);
+
+  return {
+    waiting,
+    active: counts.active || 0,
+    delayed: counts.delayed || 0,
+    oldestWaitMs,
+    avgJobMs: durations.length > 0 ? durations.reduce((sum, ms) => sum + ms, 0) / durations.length : null
+  };
+}
+
+/**
+ * Amostrador de CPU/memória do host (CPU = fração ocupada desde a amostra anterior)
+ * @returns {() => {cpu: number, memUsed: number, loadPerCpu: number}}
+ */
+export function createHostSampler() {
+  const totals = () => os.cpus().reduce((acc, cpu) => {
+    const { user, nice, sys, irq, idle } = cpu.times;
+    acc.busy += user + nice + sys + irq;
+    acc.total += user + nice + sys + irq + idle;
+    return acc;
+  }, { busy: 0, total: 0 });
+
+  let previous = totals();
+  return () => {
+    const sample = totals();
+    const total = sample.total - previous.total;
+    const cpu = total > 0 ? (sample.busy - previous.busy) / total : 0;
+    previous = sample;
+    return {
+      cpu: clamp(cpu, 0, 1),
+      memUsed: 1 - os.freemem() / os.totalmem(),
+      loadPerCpu: os.loadavg()[0] / os.cpus().length
+    };
+  };
+}
+
+/**
+ * Processos de um pool: fork, ajuste de concorrência via IPC e drenagem via gracefulShutdown
+ */
+export class WorkerPool {
+  /**
+   * @param {string} name - 'analysis' | 'mastering'
+   * @param {Object} definition - AUTOSCALER_POOLS[name] (+ script/env em testes)
+   * @param {Object} [options]
+   * @param {number} [options.basePort] - PORT do 1º processo (health server), quando definition.healthPort
+   * @param {Function} [options.fork] - child_process.fork
+   */
+  constructor(name, definition, { basePort = 0, fork: forkFn = fork, drainTimeoutMs = AUTOSCALER_CONFIG.drainTimeoutMs } = {}) {
+    this.name = name;
+    this.definition = definition;
+    this.basePort = basePort;
+    this.fork = forkFn;
+    this.drainTimeoutMs = drainTimeoutMs;
+    this.concurrency = definition.minConcurrency;
+    this.members = new Map();   // slot → { child, draining, startedAt }
+    this.target = definition.minProcesses;
+    this.stopping = false;
+    this.restarts = 0;
+    this.lastScaleUpAt = 0;
+    this.lastScaleDownAt = 0;
+    this.lastDecision = null;
+  }
+
+  /** Processos ativos (drenando não contam) */
+  get processes() {
+    let count = 0;
+    for (const member of this.members.values()) if (!member.draining) count++;
+    return count;
+  }
+
+  get draining() {
+    return this.members.size - this.processes;
+  }
+
+  nextSlot() {
+    let slot = 0;
+    while (this.members.has(slot)) slot++;
+    return slot;
+  }
+
+  spawn() {
+    const slot = this.nextSlot();
+    const env = {
+      ...process.env,
+      ...this.definition.env,
+      [this.definition.concurrencyEnv]: String(this.concurrency),
+      AUTOSCALE_SUPERVISED: 'true',
+      AUTOSCALE_POOL: this.name
+    };
+    if (this.definition.healthPort && this.basePort) env.PORT = String(this.basePort + slot);
+
+    const child = this.fork(this.definition.script, [], { env, silent: false });
+    const member = { child, slot, draining: false, startedAt: Date.now(), drainTimer: null };
+    this.members.set(slot, member);
+
+    child.on('exit', (code, signal) => {
+      clearTimeout(member.drainTimer);
+      this.members.delete(slot);
+      if (member.draining || this.stopping) {
+        logger.info(`📉 [AUTOSCALER] ${this.name}#${slot} drenado (PID=${child.pid}, code=${code})`);
+        return;
+      }
+      // Crash fora de drenagem: repõe para manter o tamanho decidido
+      this.restarts++;
+      logger.warn(`⚠️ [AUTOSCALER] ${this.name}#${slot} morreu (PID=${child.pid}, code=${code}, signal=${signal}) - recriando`);
+      setTimeout(() => { if (!this.stopping && this.processes < this.target) this.spawn(); }, Math.min(30000, 1000 * this.restarts)).unref();
+    });
+    child.on('error', error => logger.error(`❌ [AUTOSCALER] ${this.name}#${slot}:`, error.message));
+
+    logger.info(`📈 [AUTOSCALER] ${this.name}#${slot} iniciado PID=${child.pid} (concorrência ${this.concurrency})`);
+    return member;
+  }
+
+  /**
+   * SIGTERM → gracefulShutdown do worker (espera os jobs ativos); SIGKILL após drainTimeoutMs
+   */
+  drain(member) {
+    if (member.draining) return;
+    member.draining = true;
+    try { member.child.kill('SIGTERM'); } catch (_) {}
+    member.drainTimer = setTimeout(() => {
+      logger.warn(`⏰ [AUTOSCALER] ${this.name}#${member.slot} não drenou em ${this.drainTimeoutMs / 1000}s - SIGKILL`);
+      try { member.child.kill('SIGKILL'); } catch (_) {}
+    }, this.drainTimeoutMs);
+    member.drainTimer.unref();
+  }
+
+  /**
+   * Aplica { processes, concurrency }: concorrência via IPC em todos, fork/drenagem para processos
+   */
+  apply({ processes, concurrency }) {
+    this.target = processes;
+
+    if (concurrency !== this.concurrency) {
+      this.concurrency = concurrency;
+      for (const member of this.members.values()) {
+        if (!member.draining && member.child.connected) member.child.send({ type: 'scale', concurrency });
+      }
+    }
+
+    while (this.processes < processes) this.spawn();
+
+    if (this.processes > processes) {
+      // Drena os mais novos primeiro (os antigos já aqueceram caches/conexões)
+      const live = [...this.members.values()].filter(member => !member.draining).sort((a, b) => b.startedAt - a.startedAt || b.slot - a.slot);
+      for (const member of live.slice(0, this.processes - processes)) this.drain(member);
+    }
+  }
+
+  /**
+   * Drena todos e espera os processos terminarem
+   */
+  async stop() {
+    this.stopping = true;
+    const exits = [...this.members.values()].map(member => new Promise(resolve => {
+      member.child.once('exit', resolve);
+      if (member.child.exitCode !== null || member.child.signalCode !== null) resolve();
+    }));
+    for (const member of this.members.values()) this.drain(member);
+    await Promise.all(exits);
+  }
+
+  status() {
+    return {
+      processes: this.processes,
+      draining: this.draining,
+      concurrency: this.concurrency,
+      slots: this.processes * this.concurrency,
+      restarts: this.restarts,
+      pids: [...this.members.values()].map(member => ({ slot: member.slot, pid: member.child.pid, draining: member.draining })),
+      lastDecision: this.lastDecision
+    };
+  }
+}
+
@@ -1,150 +1,422 @@
 /**
  * 💾 CACHE MANAGER - FASE 2
- * Sistema de cache inteligente com fallback para Redis futuro
- * Compatible with Upstash Redis when configured
+ * Cache em duas camadas compartilhado por análise, targets e chat
+ *
+ * - L1: LRU em memória limitado por BYTES (tamanho do payload serializado)
+ * - L2: Redis opcional (ioredis ou Upstash) — compartilhado entre instâncias
+ * - Serialização: msgpack (lib/serialization/msgpack.js, o mesmo codec do IPC de resultados)
+ * - Compressão deflate para payloads acima de compressionThreshold
+ * - TTL por namespace: a chave "analysis:abc" usa namespaces.analysis.ttl
+ * - Métricas de hit/miss/eviction globais e por namespace
  */
 
+import zlib from 'zlib';
+import { promisify } from 'util';
+import { encode, decode } from '../serialization/msgpack.js';
+
+const deflateRaw = promisify(zlib.deflateRaw);
+const inflateRaw = promisify(zlib.inflateRaw);
+
 // Configurações
 const CACHE_CONFIG = {
   defaultTTL: 300, // 5 minutos
-  maxMemoryEntries: 1000,
+  maxMemoryBytes: 64 * 1024 * 1024, // 64MB por instância
+  maxEntryBytes: 8 * 1024 * 1024,   // valores maiores só vão para o Redis
   enableCompression: true,
-  enableMetrics: true
+  compressionThreshold: 1024,       // bytes
+  enableMetrics: true,
+  keyPrefix: 'cache:',
+  namespaces: {
+    analysis: { ttl: 3600 },
+    targets: { ttl: 86400 },
+    chat: { ttl: 300 }
+  }
 };
 
+// Header do payload: [flags:1][expiresAt:8 (double LE)]
+const HEADER_BYTES = 9;
+const FLAG_COMPRESSED = 2;
+
+// Lock só é removido por quem o criou (token)
+const RELEASE_LOCK_SCRIPT = `
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  return redis.call('del', KEYS[1])
+end
+return 0
+`;
+
+function namespaceOf(key) {
+  const idx = key.indexOf(':');
+  return idx > 0 ? key.slice(0, idx) : 'default';
+}
+
 /**
  * Cache Manager with Redis-compatible interface
  */
 export class CacheManager {
   constructor(options = {}) {
-    this.config = { ...CACHE_CONFIG, ...options };
+    this.config = {
+      ...CACHE_CONFIG,
+      ...options,
+      namespaces: { ...CACHE_CONFIG.namespaces, ...(options.namespaces || {}) }
+    };
+
+    // Map em ordem de uso: primeiro = menos recente
     this.memoryCache = new Map();
+    this.memoryBytes = 0;
+    this.inflight = new Map();
+    this.redis = null;
+    this.redisBinary = false;
+
     this.metrics = {
       hits: 0,
+      memoryHits: 0,
+      redisHits: 0,
       misses: 0,
       sets: 0,
       deletes: 0,
-      evictions: 0
+      evictions: 0,
+      redisErrors: 0
     };
-    
-    // Setup cleanup interval
-    this.cleanupInterval = setInterval(() => this.cleanup(), 60000); // 1 minute
-    
-    console.log('💾 CacheManager inicializado:', this.config);
+    this.namespaceMetrics = {};
+
+    console.log('💾 CacheManager inicializado:', {
+      maxMemoryBytes: this.config.maxMemoryBytes,
+      namespaces: Object.keys(this.config.namespaces)
+    });
   }
-  
+
+  // ========= SERIALIZAÇÃO =========
+
+  /**
+   * Serialize value for storage
+   * @returns {Promise<{buffer: Buffer, size: number}>} header + payload msgpack (opcionalmente
+   *   comprimido); size = bytes sem compressão, usado para limitar o L1 (que guarda o valor vivo)
+   */
+  async serialize(value, expiresAt) {
+    let flags = 0;
+    let payload = encode(value);
+    const size = payload.length;
+
+    if (this.config.enableCompression && payload.length > this.config.compressionThreshold) {
+      payload = await this.compress(payload);
+      flags |= FLAG_COMPRESSED;
+    }
+
+    const header = Buffer.allocUnsafe(HEADER_BYTES);
+    header.writeUInt8(flags, 0);
+    header.writeDoubleLE(expiresAt, 1);
+    return { buffer: Buffer.concat([header, payload]), size };
+  }
+
   /**
-   * Get value from cache
+   * Deserialize value from storage
+   * @returns {Promise<{value: any, expiresAt: number, size: number}>}
+   */
+  async deserialize(buffer) {
+    const flags = buffer.readUInt8(0);
+    const expiresAt = buffer.readDoubleLE(1);
+    let payload = buffer.subarray(HEADER_BYTES);
+
+    if (flags & FLAG_COMPRESSED) {
+      payload = await this.decompress(payload);
+    }
+
+    return { value: decode(payload), expiresAt, size: payload.length };
+  }
+
+  compress(data) {
+    return deflateRaw(data, { level: zlib.constants.Z_BEST_SPEED });
+  }
+
+  decompress(data) {
+    return inflateRaw(data);
+  }
+
+  // ========= TTL / MÉTRICAS =========
+
+  ttlFor(key) {
+    return this.config.namespaces[namespaceOf(key)]?.ttl || this.config.defaultTTL;
+  }
+
+  track(key, field) {
+    if (!this.config.enableMetrics) return;
+    this.metrics[field]++;
+    const ns = namespaceOf(key);
+    const nsMetrics = this.namespaceMetrics[ns] ||
+      (this.namespaceMetrics[ns] = { hits: 0, misses: 0, sets: 0, evictions: 0 });
+    if (field in nsMetrics) nsMetrics[field]++;
+  }
+
+  // ========= L1: LRU EM MEMÓRIA =========
+
+  memoryGet(key) {
+    const entry = this.memoryCache.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.memoryDelete(key);
+      return undefined;
+    }
+
+    // Reinserir = marcar como mais recente
+    this.memoryCache.delete(key);
+    this.memoryCache.set(key, entry);
+    return entry.value;
+  }
+
+  memorySet(key, value, expiresAt, size) {
+    this.memoryDelete(key);
+    if (size > this.config.maxEntryBytes) return;
+
+    while (this.memoryBytes + size > this.config.maxMemoryBytes && this.memoryCache.size > 0) {
+      this.evictOldest();
+    }
+
+    this.memoryCache.set(key, { value, expiresAt, size });
+    this.memoryBytes += size;
+  }
+
+  memoryDelete(key) {
+    const entry = this.memoryCache.get(key);
+    if (!entry) return false;
+    this.memoryCache.delete(key);
+    this.memoryBytes -= entry.size;
+    return true;
+  }
+
+  /**
+   * Evict least recently used entry
+   */
+  evictOldest() {
+    const oldestKey = this.memoryCache.keys().next().value;
+    this.memoryDelete(oldestKey);
+    this.track(oldestKey, 'evictions');
+  }
+
+  // ========= L2: REDIS =========
+
+  redisKey(key) {
+    return this.config.keyPrefix + key;
+  }
+
+  async redisGet(key) {
+    if (!this.redis) return null;
+    try {
+      if (this.redisBinary) {
+        return await this.redis.getBuffer(this.redisKey(key));
+      }
+      const encoded = await this.redis.get(this.redisKey(key));
+      return encoded ? Buffer.from(encoded, 'base64') : null;
+    } catch (error) {
+      this.metrics.redisErrors++;
+      return null;
+    }
+  }
+
+  async redisSet(key, buffer, ttl) {
+    if (!this.redis) return;
+    try {
+      if (this.redisBinary) {
+        await this.redis.set(this.redisKey(key), buffer, 'EX', ttl);
+      } else {
+        await this.redis.set(this.redisKey(key), buffer.toString('base64'), { ex: ttl });
+      }
+    } catch (error) {
+      this.metrics.redisErrors++;
+    }
+  }
+
+  // ========= API PÚBLICA =========
+
+  /**
+   * Get value from cache (L1 → L2)
    */
   async get(key) {
+    const hit = await this.lookup(key);
+    return hit ? hit.value : null;
+  }
+
+  /**
+   * Get value and the tier that answered (L1 → L2)
+   * @param {Object} options - { track: false para polling sem contar hit/miss }
+   * @returns {Promise<{value: any, source: 'memory'|'redis'}|null>}
+   */
+  async lookup(key, { track = true } = {}) {
     try {
-      // Try Redis first (if configured)
-      if (this.redis) {
-        const value = await this.redis.get(key);
-        if (value !== null) {
-          this.metrics.hits++;
-          return this.deserialize(value);
+      const local = this.memoryGet(key);
+      if (local !== undefined) {
+        if (track) {
+          this.track(key, 'hits');
+          this.metrics.memoryHits++;
         }
+        return { value: local, source: 'memory' };
       }
-      
-      // Fallback to memory cache
-      const entry = this.memoryCache.get(key);
-      if (entry && entry.expiresAt > Date.now()) {
-        this.metrics.hits++;
-        return entry.value;
-      }
-      
-      // Remove expired entry
-      if (entry) {
-        this.memoryCache.delete(key);
+
+      const buffer = await this.redisGet(key);
+      if (buffer) {
+        const { value, expiresAt, size } = await this.deserialize(buffer);
+        if (expiresAt > Date.now()) {
+          this.memorySet(key, value, expiresAt, size);
+          if (track) {
+            this.track(key, 'hits');
+            this.metrics.redisHits++;
+          }
+          return { value, source: 'redis' };
+        }
       }
-      
-      this.metrics.misses++;
+
+      if (track) this.track(key, 'misses');
       return null;
-      
+
     } catch (error) {
       console.warn('Cache get error:', error);
-      this.metrics.misses++;
+      if (track) this.track(key, 'misses');
       return null;
     }
   }
-  
+
   /**
-   * Set value in cache
+   * Set value in cache (L1 + L2)
+   * @param {number} ttl - segundos (padrão: TTL do namespace da chave)
    */
-  async set(key, value, ttl = this.config.defaultTTL) {
+  async set(key, value, ttl = this.ttlFor(key)) {
     try {
-      const serialized = this.serialize(value);
       const expiresAt = Date.now() + (ttl * 1000);
-      
-      // Try Redis first
-      if (this.redis) {
-        await this.redis.setex(key, ttl, serialized);
-      }
-      
-      // Always store in memory as backup
-      this.memoryCache.set(key, {
-        value,
-        expiresAt,
-        size: this.estimateSize(serialized)
-      });
-      
-      this.metrics.sets++;
-      
-      // Check memory limit
-      if (this.memoryCache.size > this.config.maxMemoryEntries) {
-        this.evictOldest();
-      }
-      
+      const { buffer, size } = await this.serialize(value, expiresAt);
+
+      this.memorySet(key, value, expiresAt, size);
+      await this.redisSet(key, buffer, ttl);
+
+      this.track(key, 'sets');
       return true;
-      
+
     } catch (error) {
       console.warn('Cache set error:', error);
       return false;
     }
   }
-  
+
+  /**
+   * Get or compute: chamadas simultâneas para a mesma chave compartilham fn()
+   */
+  async wrap(key, fn, ttl = this.ttlFor(key)) {
+    const cached = await this.get(key);
+    if (cached !== null) return cached;
+
+    const pending = this.inflight.get(key);
+    if (pending) return pending;
+
+    const promise = (async () => {
+      const value = await fn();
+      if (value !== null && value !== undefined) {
+        await this.set(key, value, ttl);
+      }
+      return value;
+    })();
+
+    this.inflight.set(key, promise);
+    try {
+      return await promise;
+    } finally {
+      this.inflight.delete(key);
+    }
+  }
+
+  // ========= LOCK DISTRIBUÍDO (stampede entre instâncias) =========
+
+  /**
+   * SET NX PX no Redis. Sem Redis (ou com erro) o chamador segue como dono:
+   * o single-flight local já basta
+   * @returns {Promise<boolean>}
+   */
+  async acquireLock(key, token, ttlMs) {
+    if (!this.redis) return true;
+    const lockKey = this.redisKey(`lock:${key}`);
+    try {
+      const ok = this.redisBinary
+        ? await this.redis.set(lockKey, token, 'PX', ttlMs, 'NX')
+        : await this.redis.set(lockKey, token, { px: ttlMs, nx: true });
+      return ok === 'OK';
+    } catch (error) {
+      this.metrics.redisErrors++;
+      return true;
+    }
+  }
+
+  /**
+   * Lock ainda presente? Sem Redis (ou com erro) responde false: quem espera segue e calcula
+   * @returns {Promise<boolean>}
+   */
+  async lockExists(key) {
+    if (!this.redis) return false;
+    try {
+      return !!(await this.redis.exists(this.redisKey(`lock:${key}`)));
+    } catch (error) {
+      this.metrics.redisErrors++;
+      return false;
+    }
+  }
+
+  /**
+   * Libera o lock apenas se ainda pertencer a token
+   */
+  async releaseLock(key, token) {
+    if (!this.redis) return;
+    const lockKey = this.redisKey(`lock:${key}`);
+    try {
+      if (this.redisBinary) {
+        await this.redis.eval(RELEASE_LOCK_SCRIPT, 1, lockKey, token);
+      } else {
+        await this.redis.eval(RELEASE_LOCK_SCRIPT, [lockKey], [token]);
+      }
+    } catch (error) {
+      this.metrics.redisErrors++;
+    }
+  }
+
   /**
    * Delete from cache
    */
   async delete(key) {
     try {
       if (this.redis) {
-        await this.redis.del(key);
+        await this.redis.del(this.redisKey(key));
       }
-      
-      const deleted = this.memoryCache.delete(key);
+
+      const deleted = this.memoryDelete(key);
       if (deleted) {
         this.metrics.deletes++;
       }
-      
+
       return deleted;
-      
+
     } catch (error) {
       console.warn('Cache delete error:', error);
       return false;
     }
   }
-  
+
   /**
    * Check if key exists
    */
   async has(key) {
     try {
+      if (this.memoryGet(key) !== undefined) return true;
+
       if (this.redis) {
-        const exists = await this.redis.exists(key);
-        if (exists) return true;
+        const exists = await this.redis.exists(this.redisKey(key));
+        return !!exists;
       }
-      
-      const entry = this.memoryCache.get(key);
-      return entry && entry.expiresAt > Date.now();
-      
+
+      return false;
+
     } catch (error) {
       console.warn('Cache has error:', error);
       return false;
     }
   }
-  
+
   /**
    * Increment counter (for rate limiting)
    */
@@ -152,113 +424,45 @@ export class CacheManager {
     try {
       const now = Math.floor(Date.now() / 1000);
       const windowKey = `${key}:${Math.floor(now / window)}`;
-      
+
       if (this.redis) {
-        const count = await this.redis.incr(windowKey);
-        await this.redis.expire(windowKey, window * 2);
+        const count = await this.redis.incr(this.redisKey(windowKey));
+        if (count === 1) {
+          await this.redis.expire(this.redisKey(windowKey), window * 2);
+        }
         return count;
       }
-      
+
       // Memory fallback
-      const entry = this.memoryCache.get(windowKey) || { value: 0, expiresAt: (now + window * 2) * 1000 };
-      entry.value++;
-      this.memoryCache.set(windowKey, entry);
-      
-      return entry.value;
-      
+      const count = (this.memoryGet(windowKey) || 0) + 1;
+      this.memorySet(windowKey, count, (now + window * 2) * 1000, 8);
+      return count;
+
     } catch (error) {
       console.warn('Cache increment error:', error);
       return 1;
     }
   }
-  
-  /**
-   * Serialize value for storage
-   */
-  serialize(value) {
-    try {
-      const json = JSON.stringify(value);
-      
-      if (this.config.enableCompression && json.length > 1000) {
-        // Simple compression for large objects
-        return this.compress(json);
-      }
-      
-      return json;
-      
-    } catch (error) {
-      console.warn('Serialization error:', error);
-      return String(value);
-    }
-  }
-  
-  /**
-   * Deserialize value from storage
-   */
-  deserialize(value) {
-    try {
-      if (typeof value === 'string' && value.startsWith('{')) {
-        return JSON.parse(value);
-      }
-      return value;
-      
-    } catch (error) {
-      console.warn('Deserialization error:', error);
-      return value;
-    }
-  }
-  
-  /**
-   * Simple compression (placeholder for future implementation)
-   */
-  compress(data) {
-    // For now, just return as-is
-    // In production, could use LZ-string or similar
-    return data;
-  }
-  
-  /**
-   * Estimate memory size of data
-   */
-  estimateSize(data) {
-    return new Blob([data]).size;
-  }
-  
-  /**
-   * Evict oldest entries when memory limit is reached
-   */
-  evictOldest() {
-    const entries = Array.from(this.memoryCache.entries());
-    entries.sort((a, b) => a[1].expiresAt - b[1].expiresAt);
-    
-    const toEvict = Math.ceil(entries.length * 0.1); // Evict 10%
-    for (let i = 0; i < toEvict; i++) {
-      this.memoryCache.delete(entries[i][0]);
-      this.metrics.evictions++;
-    }
-    
-    console.log(`🧹 Cache eviction: ${toEvict} entries removed`);
-  }
-  
+
   /**
-   * Cleanup expired entries
+   * Cleanup expired entries (sob demanda — a LRU já descarta por bytes)
    */
   cleanup() {
     const now = Date.now();
     const beforeSize = this.memoryCache.size;
-    
+
     for (const [key, entry] of this.memoryCache.entries()) {
       if (entry.expiresAt <= now) {
-        this.memoryCache.delete(key);
+        this.memoryDelete(key);
       }
     }
-    
+
     const cleaned = beforeSize - this.memoryCache.size;
     if (cleaned > 0) {
       console.log(`🧹 Cache cleanup: ${cleaned} expired entries removed`);
     }
   }
-  
+
   /**
    * Get cache statistics
    */
@@ -268,35 +472,55 @@ export class CacheManager {
       ...this.metrics,
       hitRate: totalRequests > 0 ? (this.metrics.hits / totalRequests * 100).toFixed(2) + '%' : '0%',
       memoryEntries: this.memoryCache.size,
-      memoryLimit: this.config.maxMemoryEntries,
-      memoryUsage: `${this.memoryCache.size}/${this.config.maxMemoryEntries}`,
+      memoryBytes: this.memoryBytes,
+      memoryLimitBytes: this.config.maxMemoryBytes,
+      memoryUsage: `${(this.memoryBytes / 1024 / 1024).toFixed(1)}MB/${(this.config.maxMemoryBytes / 1024 / 1024).toFixed(1)}MB`,
+      namespaces: this.namespaceMetrics,
+      serializer: 'msgpack',
       redisConnected: !!this.redis
     };
   }
-  
+
   /**
-   * Connect to Redis (Upstash compatible)
+   * Connect to Redis
+   * @param {Object} config - { client } (ioredis existente) | { url } (ioredis) | { url, token } (Upstash)
    */
   async connectRedis(config) {
     try {
-      if (config.url && config.token) {
-        // Upstash Redis
+      if (config.client) {
+        // Cliente ioredis já criado pelo chamador
+        this.redis = config.client;
+        this.redisBinary = true;
+      } else if (config.url && config.token) {
+        // Upstash Redis (REST — valores em base64)
         const { Redis } = await import('@upstash/redis');
         this.redis = new Redis(config);
+        this.redisBinary = false;
         console.log('✅ Connected to Upstash Redis');
-      } else if (config.host) {
-        // Standard Redis (for future use)
-        console.log('⚠️ Standard Redis not implemented yet');
+      } else if (config.url) {
+        const { default: Redis } = await import('ioredis');
+        this.redis = new Redis(config.url, { lazyConnect: false, maxRetriesPerRequest: 1 });
+        this.redisBinary = true;
+        console.log('✅ Connected to Redis');
       }
-      
+
       return !!this.redis;
-      
+
     } catch (error) {
       console.warn('Failed to connect to Redis:', error);
       return false;
     }
   }
-  
+
+  /**
+   * Desconectar do Redis (ex.: erro no cliente do chamador) — segue só com o L1
+   * @param {Error} [error] - erro que causou a desconexão (contado em metrics.redisErrors)
+   */
+  disconnectRedis(error = null) {
+    if (error) this.metrics.redisErrors++;
+    this.redis = null;
+  }
+
   /**
    * Clear all cache
    */
@@ -306,26 +530,25 @@ export class CacheManager {
         // Note: Be careful with FLUSHALL in production
         console.warn('⚠️ Redis flush not implemented for safety');
       }
-      
+
       this.memoryCache.clear();
+      this.memoryBytes = 0;
       console.log('🧹 Memory cache cleared');
-      
+
     } catch (error) {
       console.warn('Cache clear error:', error);
     }
   }
-  
+
   /**
    * Destroy cache manager
    */
   destroy() {
-    if (this.cleanupInterval) {
-      clearInterval(this.cleanupInterval);
-    }
-    
     this.memoryCache.clear();
+    this.memoryBytes = 0;
+    this.inflight.clear();
     this.redis = null;
-    
+
     console.log('💥 CacheManager destroyed');
   }
 }
@@ -339,50 +562,33 @@ export const globalCache = new CacheManager();
  * Helper functions for common caching patterns
  */
 export class CacheHelpers {
-  
+
   /**
    * Cache with automatic key generation
    */
   static async cacheFunction(fn, args = [], ttl = 300) {
     const key = `fn:${fn.name}:${JSON.stringify(args)}`;
-    
-    let result = await globalCache.get(key);
-    if (result !== null) {
-      return result;
-    }
-    
-    result = await fn(...args);
-    await globalCache.set(key, result, ttl);
-    
-    return result;
+    return globalCache.wrap(key, () => fn(...args), ttl);
   }
-  
+
   /**
    * Cache API responses
    */
   static async cacheApiCall(url, options = {}, ttl = 300) {
     const key = `api:${url}:${JSON.stringify(options)}`;
-    
-    let result = await globalCache.get(key);
-    if (result !== null) {
-      return result;
-    }
-    
-    const response = await fetch(url, options);
-    result = await response.json();
-    
-    await globalCache.set(key, result, ttl);
-    
-    return result;
-  }
-  
+    return globalCache.wrap(key, async () => {
+      const response = await fetch(url, options);
+      return response.json();
+    }, ttl);
+  }
+
   /**
    * Rate limiting with cache
    */
   static async checkRateLimit(userId, maxRequests = 10, window = 60) {
     const key = `rate:${userId}`;
     const count = await globalCache.increment(key, window);
-    
+
     if (count > maxRequests) {
       const error = new Error('Rate limit exceeded');
       error.retryAfter = window;
@@ -390,7 +596,7 @@ export class CacheHelpers {
       error.limit = maxRequests;
       throw error;
     }
-    
+
     return {
       allowed: true,
       current: count,
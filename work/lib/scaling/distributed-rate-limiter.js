@@ -2,8 +2,11 @@
  * 🚀 RATE LIMITER DISTRIBUÍDO - FASE 1 
  * Melhoria 100% compatível com o sistema atual
  * Suporta fallback gracioso para o Map existente
+ * Com options.redis (cliente ioredis) usa o script Lua de redisRateLimit.js (1 round trip)
  */
 
+import { RedisRateLimiter } from '../redisRateLimit.js';
+
 // Configurações
 const DEFAULT_WINDOW_MS = 60 * 1000; // 1 minuto
 const DEFAULT_MAX_REQUESTS = 10;
@@ -17,6 +20,9 @@ export class DistributedRateLimit {
     this.windowMs = options.windowMs || DEFAULT_WINDOW_MS;
     this.maxRequests = options.maxRequests || DEFAULT_MAX_REQUESTS;
     this.requests = new Map(); // Estrutura: userId -> [timestamps]
+    this.redisLimiter = options.redis
+      ? new RedisRateLimiter(options.redis, { algorithm: options.algorithm, windowMs: this.windowMs })
+      : null;
     this.metrics = {
       totalRequests: 0,
       blockedRequests: 0,
@@ -43,6 +49,15 @@ export class DistributedRateLimit {
     // Incrementar métricas
     this.metrics.totalRequests++;
     
+    if (this.redisLimiter) {
+      try {
+        return await this.checkLimitRedis(userId, maxReqs, now);
+      } catch (error) {
+        if (error.code === 'RATE_LIMIT_EXCEEDED') throw error;
+        console.warn('⚠️ Redis indisponível no rate limiter - usando Map local:', error.message);
+      }
+    }
+    
     // Obter histórico do usuário
     let userRequests = this.requests.get(userId) || [];
     
@@ -54,8 +69,8 @@ export class DistributedRateLimit {
     if (userRequests.length >= maxReqs) {
       this.metrics.blockedRequests++;
       
-      // Calcular tempo para retry
-      const oldestRequest = Math.min(...userRequests);
+      // Calcular tempo para retry (timestamps são inseridos em ordem)
+      const oldestRequest = userRequests[0];
       const retryAfter = Math.ceil((oldestRequest + this.windowMs - now) / 1000);
       
       const error = new Error('Rate limit exceeded');
@@ -76,7 +91,34 @@ export class DistributedRateLimit {
       current: userRequests.length,
       limit: maxReqs,
       remaining: maxReqs - userRequests.length,
-      resetTime: Math.min(...userRequests) + this.windowMs
+      resetTime: userRequests[0] + this.windowMs
+    };
+  }
+  
+  /**
+   * Verificação via Redis (Lua atômico)
+   */
+  async checkLimitRedis(userId, maxReqs, now) {
+    const result = await this.redisLimiter.check(`rate:dist:${userId}`, maxReqs);
+    
+    if (!result.allowed) {
+      this.metrics.blockedRequests++;
+      
+      const error = new Error('Rate limit exceeded');
+      error.retryAfter = Math.max(Math.ceil(result.retryAfterMs / 1000), 1);
+      error.code = 'RATE_LIMIT_EXCEEDED';
+      error.current = result.current;
+      error.limit = maxReqs;
+      
+      throw error;
+    }
+    
+    return {
+      allowed: true,
+      current: result.current,
+      limit: maxReqs,
+      remaining: result.remaining,
+      resetTime: now + this.windowMs
     };
   }
   
@@ -113,6 +155,7 @@ export class DistributedRateLimit {
   getMetrics() {
     return {
       ...this.metrics,
+      redis: this.redisLimiter ? this.redisLimiter.getMetrics() : null,
       memoryUsage: this.requests.size,
       blockedRate: this.metrics.totalRequests > 0 
         ? (this.metrics.blockedRequests / this.metrics.totalRequests * 100).toFixed(2) + '%'
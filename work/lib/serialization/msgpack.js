@@ -0,0 +1,29 @@
+// work/lib/serialization/msgpack.js
+// MessagePack (https://github.com/msgpack/msgpack/blob/master/spec.md) via msgpackr
+// ✅ Um único codec para o IPC worker ↔ processo de análise (result-schema.js) e o CacheManager
+// ✅ Mapas padrão (sem a extensão de records do msgpackr): qualquer decoder msgpack lê o payload
+// ✅ Buffer/Uint8Array → bin
+//
+// O codec não reaplica a semântica de JSON.stringify (toJSON, NaN/Infinity → nil, undefined omitido):
+// o resultado da análise já chega normalizado por normalizeResultPrecision (result-schema.js).
+
+import { Packr } from 'msgpackr';
+
+const packr = new Packr({ useRecords: false, mapsAsObjects: true });
+
+/**
+ * Valor → MessagePack
+ * @param {*} value
+ * @returns {Buffer}
+ */
+export function encode(value) {
+  return packr.pack(value);
+}
+
+/**
+ * MessagePack → valor (lança erro em payload truncado ou inválido)
+ * @param {Buffer|Uint8Array} bytes
+ */
+export function decode(bytes) {
+  return packr.unpack(bytes);
+}
@@ -0,0 +1,349 @@
+// work/lib/serialization/result-schema.js
+// Schema versionado do JSON final da análise (api/audio/json-output.js → jobs.results)
+// ✅ Normalizador compilado a partir do schema: campos conhecidos com acesso direto e precisão fixa,
+//    chaves desconhecidas caem no caminho genérico (mesma semântica de JSON.stringify)
+// ✅ Controle de precisão: casas decimais por campo conhecido, dígitos significativos no resto
+// ✅ Forma binária para o IPC worker ↔ analysis-job: MessagePack + aliases idênticos removidos
+//    (technicalData.bands/spectralBands, problemsAnalysis.suggestions...) e restaurados no decode
+//
+// Postgres/HTTP continuam recebendo o JSON completo (com aliases): o frontend lê vários deles.
+
+import { encode, decode } from './msgpack.js';
+
+export const RESULT_SCHEMA_VERSION = 1;
+
+export const RESULT_PRECISION = {
+  DECIMALS: 3,              // mesmo arredondamento de safeSanitize em json-output.js
+  SIGNIFICANT_DIGITS: 7     // números fora do schema (targets, sugestões, scoring...): ~float32
+};
+
+// ========= DSL DO SCHEMA =========
+const num = (decimals = RESULT_PRECISION.DECIMALS) => ({ type: 'number', decimals });
+const str = { type: 'string' };
+const bool = { type: 'boolean' };
+const obj = (properties) => ({ type: 'object', properties });
+const mapOf = (values) => ({ type: 'map', values });
+const listOf = (items) => ({ type: 'array', items });
+
+const fields = (type, names) => Object.fromEntries(names.map(name => [name, type]));
+
+const BAND = obj({ energy_db: num(), percentage: num(), range: str, name: str, status: str });
+const BAND_NAMES = ['sub', 'bass', 'lowMid', 'mid', 'highMid', 'presence', 'air'];
+const BANDS = obj({ ...fields(BAND, BAND_NAMES), totalPercentage: num(), status: str, _status: str });
+const METRIC = obj({ value: num(), unit: str });
+
+const TECHNICAL_DATA = obj({
+  ...fields(num(), [
+    'lufsIntegrated', 'lufsShortTerm', 'lufsMomentary', 'lra', 'originalLUFS', 'normalizedTo', 'gainAppliedDB',
+    'truePeakDbtp', 'truePeakLinear', 'samplePeakLeftDb', 'samplePeakRightDb', 'clippingSamples', 'clippingPct',
+    'stereoCorrelation', 'stereoWidth', 'stereoOpening', 'stereoOpeningPercent', 'balanceLR',
+    'dynamicRange', 'crestFactor', 'peakRmsDb', 'averageRmsDb', 'avgLoudness',
+    'spectralCentroid', 'spectralCentroidHz', 'spectralRolloff', 'spectralRolloffHz', 'spectralBandwidthHz',
+    'spectralSpreadHz', 'spectralFlatness', 'spectralCrest', 'spectralSkewness', 'spectralKurtosis',
+    'zeroCrossingRate', 'spectralFlux', 'spectralChange',
+    'bandSub', 'bandBass', 'bandLowMid', 'bandMid', 'bandHighMid', 'bandPresence', 'bandAir', 'bandMids', 'bandTreble',
+    'peak', 'rms', 'spectralUniformity', 'spectralUniformityPercent', 'bpm', 'bpmConfidence',
+    'correlation', 'balance', 'width', 'opening', 'openingPercent', 'dr'
+  ]),
+  ...fields(str, ['stereoOpeningCategory', 'correlationCategory', 'widthCategory', 'drCategory', 'bpmSource']),
+  ...fields(bool, ['isMonoCompatible', 'monoCompatibility', 'hasPhaseIssues']),
+  spectral_balance: BANDS,
+  spectralBands: BANDS,
+  bands: BANDS,
+  rmsLevels: obj(fields(num(), ['left', 'right', 'average', 'peak', 'count'])),
+  dcOffset: obj({ value: num(), unit: str, detailed: obj({ L: num(), R: num(), severity: str }) })
+});
+
+export const RESULT_SCHEMA = obj({
+  ...fields(str, ['genre', 'mode', 'soundDestination', 'referenceStage', 'referenceJobId', 'classification']),
+  score: num(),
+  loudness: obj({ ...fields(num(), ['integrated', 'shortTerm', 'momentary', 'lra']), unit: str }),
+  truePeak: obj({
+    ...fields(num(), ['maxDbtp', 'maxLinear', 'samplePeakLeft', 'samplePeakRight']),
+    clipping: obj({ samples: num(), percentage: num() })
+  }),
+  stereo: obj({
+    ...fields(num(), ['correlation', 'width', 'opening', 'openingPercent', 'balance']),
+    openingCategory: str,
+    ...fields(bool, ['monoCompatibility', 'hasPhaseIssues'])
+  }),
+  dynamics: obj(fields(num(), ['range', 'crest', 'peakRms', 'avgRms'])),
+  spectral: obj(fields(num(), ['centroidHz', 'rolloffHz', 'flatness', 'flux', 'change'])),
+  spectralBands: BANDS,
+  metrics: obj({ bands: BANDS }),
+  technicalData: TECHNICAL_DATA,
+  scores: mapOf(num()),
+  metadata: obj({ ...fields(str, ['fileName', 'stage', 'jobId', 'timestamp']), ...fields(num(), ['duration', 'sampleRate', 'channels']) }),
+  data: obj({
+    genre: str,
+    metrics: obj({ loudness: METRIC, truePeak: METRIC, dr: METRIC, stereo: METRIC, bands: mapOf(obj({ value: num(), unit: str })) })
+  }),
+  suggestions: listOf({ type: 'any' }),
+  aiSuggestions: listOf({ type: 'any' })
+});
+
+// Aliases que o json-output/pipeline duplicam: [alias, canônico].
+// Ordem importa no decode: um alias só pode ser restaurado depois dos aliases dentro do canônico
+// (problemsAnalysis.suggestions antes de technicalData.problemsAnalysis).
+export const RESULT_ALIASES = [
+  ['problemsAnalysis.suggestions', 'suggestions'],
+  ['diagnostics.suggestions', 'suggestions'],
+  ['technicalData.problemsAnalysis', 'problemsAnalysis'],
+  ['technicalData.spectralBands', 'technicalData.spectral_balance'],
+  ['technicalData.bands', 'technicalData.spectral_balance'],
+  ...BAND_NAMES.map(band => [`metrics.bands.${band}`, `spectralBands.${band}`]),
+  ['scoring.score', 'score'],
+  ['technicalData.correlation', 'technicalData.stereoCorrelation'],
+  ['technicalData.width', 'technicalData.stereoWidth'],
+  ['technicalData.opening', 'technicalData.stereoOpening'],
+  ['technicalData.openingPercent', 'technicalData.stereoOpeningPercent'],
+  ['technicalData.balance', 'technicalData.balanceLR'],
+  ['technicalData.dr', 'technicalData.dynamicRange'],
+  ['technicalData.monoCompatibility', 'technicalData.isMonoCompatible'],
+  ['technicalData.spectralCentroidHz', 'technicalData.spectralCentroid'],
+  ['technicalData.spectralRolloffHz', 'technicalData.spectralRolloff']
+].map(([alias, canonical]) => [alias.split('.'), canonical.split('.')]);
+
+// ========= PRECISÃO =========
+const POW10 = Array.from({ length: 23 }, (_, i) => 10 ** i); // exatos em float64 até 1e22
+
+// Mesmo resultado de +value.toPrecision(n), ~4x mais rápido (sem passar por string)
+function roundSignificant(value) {
+  if (Number.isInteger(value)) return value;
+  const digits = RESULT_PRECISION.SIGNIFICANT_DIGITS - 1 - Math.floor(Math.log10(Math.abs(value)));
+  if (digits >= 0 && digits < POW10.length) return Math.round(value * POW10[digits]) / POW10[digits];
+  if (digits < 0 && -digits < POW10.length) return Math.round(value / POW10[-digits]) * POW10[-digits];
+  return +value.toPrecision(RESULT_PRECISION.SIGNIFICANT_DIGITS);
+}
+
+// ========= CAMINHO GENÉRICO (fora do schema) =========
+// Mesma semântica de JSON.stringify: undefined/função/símbolo omitidos em objetos e null em arrays,
+// NaN/Infinity → null, toJSON() respeitado
+function normalizeAny(value) {
+  switch (typeof value) {
+    case 'number':
+      return Number.isFinite(value) ? roundSignificant(value) : null;
+    case 'string':
+    case 'boolean':
+      return value;
+    case 'object': {
+      if (value === null) return null;
+      if (typeof value.toJSON === 'function') return normalizeAny(value.toJSON());
+      if (Array.isArray(value)) {
+        const result = new Array(value.length);
+        for (let i = 0; i < value.length; i++) result[i] = normalizeAny(value[i]) ?? null;
+        return result;
+      }
+      const result = {};
+      for (const key of Object.keys(value)) {
+        const item = normalizeAny(value[key]);
+        if (item !== undefined) result[key] = item;
+      }
+      return result;
+    }
+    case 'bigint':
+      throw new TypeError('Do not know how to serialize a BigInt');
+    default:
+      return undefined;
+  }
+}
+
+/**
+ * Precisão genérica (dígitos significativos) + semântica de JSON para um valor fora do schema
+ * @param {*} value
+ */
+export function normalizeValuePrecision(value) {
+  return normalizeAny(value) ?? null;
+}
+
+// ========= COMPILADOR =========
+// Gera uma função por nó do schema: propriedades conhecidas lidas direto (sem Object.keys) e
+// arredondadas com o fator já embutido; só chaves fora do schema passam por normalizeAny.
+// O texto final fica com o JSON.stringify nativo: um writer de string gerado em JS mediu
+// ~1,5-2x mais lento que o stringify do V8 (tools/perf/result-serialization-bench.js).
+function compileSchema(schema) {
+  const sources = [];
+  const knownKeys = [];
+
+  // Expressão que normaliza `v` segundo o nó
+  function expression(node) {
+    switch (node.type) {
+      case 'number': {
+        const factor = 10 ** node.decimals;
+        return `(typeof v === 'number' ? (Number.isFinite(v) ? (Number.isInteger(v) ? v : Math.round(v * ${factor}) / ${factor}) : null) : any(v))`;
+      }
+      case 'string':
+        return `(typeof v === 'string' ? v : any(v))`;
+      case 'boolean':
+        return `(typeof v === 'boolean' ? v : any(v))`;
+      case 'object':
+      case 'map':
+        return `(v !== null && typeof v === 'object' && !Array.isArray(v) && typeof v.toJSON !== 'function' ? ${define(node)}(v) : any(v))`;
+      case 'array':
+        return `(Array.isArray(v) ? ${define(node)}(v) : any(v))`;
+      default:
+        return 'any(v)';
+    }
+  }
+
+  function define(node) {
+    const index = sources.length;
+    sources.push(null);
+    let body;
+
+    if (node.type === 'object') {
+      const keys = Object.keys(node.properties);
+      const known = `k${knownKeys.length}`;
+      knownKeys.push(new Set(keys));
+      body = [
+        `  const r = {}; let v, x, present = 0;`,
+        ...keys.map(key => `  v = o[${JSON.stringify(key)}]; if (v !== undefined) { present++; x = ${expression(node.properties[key])}; if (x !== undefined) r[${JSON.stringify(key)}] = x; }`),
+        // Chaves fora do schema (ou presentes com undefined): caminho genérico
+        `  const keys = Object.keys(o);`,
+        `  if (keys.length > present) for (const key of keys) if (!${known}.has(key)) { x = any(o[key]); if (x !== undefined) r[key] = x; }`,
+        `  return r;`
+      ];
+    } else if (node.type === 'map') {
+      body = [
+        `  const r = {}; let v, x;`,
+        `  for (const key of Object.keys(o)) { v = o[key]; x = ${expression(node.values)}; if (x !== undefined) r[key] = x; }`,
+        `  return r;`
+      ];
+    } else {
+      body = [
+        `  const r = new Array(o.length); let v, x;`,
+        `  for (let i = 0; i < o.length; i++) { v = o[i]; x = ${expression(node.items)}; r[i] = x === undefined ? null : x; }`,
+        `  return r;`
+      ];
+    }
+
+    sources[index] = `function n${index}(o) {\n${body.join('\n')}\n}`;
+    return `n${index}`;
+  }
+
+  const root = expression(schema);
+  const code = `${sources.join('\n')}\nreturn function (v) { return ${root}; };`;
+  const factory = new Function('any', ...knownKeys.map((_, i) => `k${i}`), code);
+  return factory(normalizeAny, ...knownKeys);
+}
+
+const normalizeResult = compileSchema(RESULT_SCHEMA);
+
+/**
+ * Cópia do resultado com a precisão do schema aplicada e a semântica de JSON
+ * (undefined omitido, NaN → null, toJSON aplicado)
+ * @param {Object} result - JSON final da análise (não é alterado)
+ */
+export function normalizeResultPrecision(result) {
+  return normalizeResult(result) ?? null;
+}
+
+/**
+ * JSON do resultado para Postgres/HTTP (JSON.stringify com a precisão do schema)
+ * @param {Object} result - JSON final da análise
+ * @returns {string}
+ */
+export function serializeResultJSON(result) {
+  return JSON.stringify(normalizeResultPrecision(result));
+}
+
+// ========= ALIASES =========
+
+function getPath(root, path) {
+  let node = root;
+  for (const key of path) {
+    if (node === null || typeof node !== 'object') return undefined;
+    node = node[key];
+  }
+  return node;
+}
+
+function deepEqual(a, b) {
+  if (a === b) return true;
+  if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) {
+    return typeof a === 'number' && typeof b === 'number' && Number.isNaN(a) && Number.isNaN(b);
+  }
+  if (Array.isArray(a) !== Array.isArray(b)) return false;
+  const keysA = Object.keys(a);
+  if (keysA.length !== Object.keys(b).length) return false;
+  for (const key of keysA) {
+    if (!Object.prototype.hasOwnProperty.call(b, key) || !deepEqual(a[key], b[key])) return false;
+  }
+  return true;
+}
+
+/**
+ * Remove os aliases idênticos ao canônico sem alterar o resultado original
+ * (cópia rasa só dos objetos no caminho de cada alias removido)
+ * @returns {{ value: Object, dropped: number[] }}
+ */
+function dropAliases(result) {
+  const dropped = [];
+  if (!result || typeof result !== 'object' || Array.isArray(result)) return { value: result, dropped };
+
+  RESULT_ALIASES.forEach(([alias, canonical], index) => {
+    const aliasValue = getPath(result, alias);
+    if (aliasValue === undefined) return;
+    const canonicalValue = getPath(result, canonical);
+    if (canonicalValue !== undefined && deepEqual(aliasValue, canonicalValue)) dropped.push(index);
+  });
+  if (dropped.length === 0) return { value: result, dropped };
+
+  const copies = new Map();
+  const copyOf = (original) => {
+    if (!copies.has(original)) copies.set(original, { ...original });
+    return copies.get(original);
+  };
+
+  const value = copyOf(result);
+  for (const index of dropped) {
+    const alias = RESULT_ALIASES[index][0];
+    let original = result;
+    let copy = value;
+    for (const key of alias.slice(0, -1)) {
+      original = original[key];
+      copy[key] = copyOf(original);
+      copy = copy[key];
+    }
+    delete copy[alias[alias.length - 1]];
+  }
+  return { value, dropped };
+}
+
+function restoreAliases(result, dropped) {
+  for (const index of [...dropped].sort((a, b) => a - b)) {
+    const [alias, canonical] = RESULT_ALIASES[index];
+    const parent = getPath(result, alias.slice(0, -1));
+    if (parent && typeof parent === 'object') parent[alias[alias.length - 1]] = getPath(result, canonical);
+  }
+  return result;
+}
+
+// ========= FORMA BINÁRIA (IPC) =========
+
+/**
+ * Resultado → MessagePack [versão do schema, aliases removidos, resultado normalizado]
+ * @param {Object} result - JSON final da análise (não é alterado)
+ * @returns {Buffer}
+ */
+export function encodeResultWire(result) {
+  const { value, dropped } = dropAliases(result);
+  return encode([RESULT_SCHEMA_VERSION, dropped, normalizeResultPrecision(value)]);
+}
+
+/**
+ * MessagePack → resultado com os aliases restaurados (compartilham a referência do canônico)
+ * @param {Buffer|Uint8Array} payload
+ * @returns {Object}
+ */
+export function decodeResultWire(payload) {
+  const envelope = decode(payload);
+  if (!Array.isArray(envelope) || envelope.length !== 3) {
+    throw new Error('Payload de resultado inválido');
+  }
+  const [version, dropped, result] = envelope;
+  if (version !== RESULT_SCHEMA_VERSION) {
+    throw new Error(`Versão de schema do resultado não suportada: ${version} (esperada ${RESULT_SCHEMA_VERSION})`);
+  }
+  return restoreAliases(result, dropped);
+}
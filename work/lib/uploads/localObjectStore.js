@@ -0,0 +1,218 @@
+// work/lib/uploads/localObjectStore.js
+// Stand-in S3-compatível em disco para dev/testes (UPLOAD_STORE=local)
+// Mesma interface de s3MultipartStore.js e mesmo contrato HTTP do bucket para o cliente:
+//   PUT <url assinada da parte> → 200 + header ETag (CORS expõe ETag)
+// - URLs assinadas com HMAC + expiração (assinatura inválida/expirada → 403)
+// - Partes gravadas em disco por streaming (nada inteiro em memória)
+// - Regras do S3 no complete: ETag confere, partes (menos a última) ≥ minPartSize
+// - GET /<bucket>/<key> serve o objeto final (worker local lê daqui)
+
+import http from 'http';
+import os from 'os';
+import path from 'path';
+import crypto from 'crypto';
+import { createReadStream, createWriteStream } from 'fs';
+import { mkdir, rm, stat } from 'fs/promises';
+import { pipeline } from 'stream/promises';
+
+function storeError(code, message, statusCode) {
+  const error = new Error(message);
+  error.code = code;
+  error.statusCode = statusCode;
+  return error;
+}
+
+/**
+ * @param {Object} [options]
+ * @param {string} [options.rootDir] - padrão: LOCAL_UPLOAD_DIR ou <tmp>/soundyai-local-s3
+ * @param {string} [options.bucket='local']
+ * @param {string} [options.host='127.0.0.1']
+ * @param {number} [options.port=0] - 0 = porta livre
+ * @param {number} [options.minPartSize=5MB] - mínimo do S3 para partes não finais
+ */
+export function createLocalObjectStore({
+  rootDir = process.env.LOCAL_UPLOAD_DIR || path.join(os.tmpdir(), 'soundyai-local-s3'),
+  bucket = 'local',
+  host = '127.0.0.1',
+  port = Number(process.env.LOCAL_S3_PORT || 0),
+  minPartSize = 5 * 1024 * 1024
+} = {}) {
+  const secret = crypto.randomBytes(32);
+  const uploads = new Map(); // uploadId → { key, contentType, parts: Map<partNumber, { etag, size }> }
+  let server = null;
+  let baseUrl = null;
+
+  const objectsDir = path.resolve(rootDir, 'objects');
+  const objectPath = (key) => {
+    const resolved = path.resolve(objectsDir, key);
+    if (!resolved.startsWith(objectsDir + path.sep)) throw storeError('InvalidKey', `Chave inválida: ${key}`, 400);
+    return resolved;
+  };
+  const partPath = (uploadId, partNumber) => path.join(rootDir, 'multipart', uploadId, String(partNumber));
+  const sign = (key, uploadId, partNumber, expires) =>
+    crypto.createHmac('sha256', secret).update(`${key}\n${uploadId}\n${partNumber}\n${expires}`).digest('hex');
+
+  function getUpload(uploadId) {
+    const upload = uploads.get(uploadId);
+    if (!upload) throw storeError('NoSuchUpload', `Upload ${uploadId} não existe`, 404);
+    return upload;
+  }
+
+  function send(res, status, headers = {}, body = '') {
+    res.writeHead(status, {
+      'Access-Control-Allow-Origin': '*',
+      'Access-Control-Allow-Methods': 'GET, PUT, OPTIONS',
+      'Access-Control-Allow-Headers': '*',
+      'Access-Control-Expose-Headers': 'ETag',
+      ...headers
+    });
+    res.end(body);
+  }
+
+  async function handlePutPart(req, res, key, query) {
+    const uploadId = query.get('uploadId');
+    const partNumber = Number(query.get('partNumber'));
+    const expires = Number(query.get('expires'));
+    const signature = query.get('signature') || '';
+
+    const expected = sign(key, uploadId, partNumber, expires);
+    const valid = signature.length === expected.length &&
+      crypto.timingSafeEqual(Buffer.from(signature), Buffer.from(expected));
+    if (!valid) return send(res, 403, {}, 'SignatureDoesNotMatch');
+    if (Date.now() / 1000 > expires) return send(res, 403, {}, 'Request has expired');
+
+    const upload = uploads.get(uploadId);
+    if (!upload || upload.key !== key) return send(res, 404, {}, 'NoSuchUpload');
+
+    const target = partPath(uploadId, partNumber);
+    await mkdir(path.dirname(target), { recursive: true });
+
+    const hash = crypto.createHash('md5');
+    let size = 0;
+    req.on('data', (chunk) => {
+      hash.update(chunk);
+      size += chunk.length;
+    });
+    await pipeline(req, createWriteStream(target));
+
+    const etag = `"${hash.digest('hex')}"`;
+    upload.parts.set(partNumber, { etag, size });
+    send(res, 200, { ETag: etag });
+  }
+
+  async function handleRequest(req, res) {
+    const url = new URL(req.url, baseUrl);
+    const prefix = `/${bucket}/`;
+    if (!url.pathname.startsWith(prefix)) return send(res, 404, {}, 'NoSuchBucket');
+    const key = decodeURIComponent(url.pathname.slice(prefix.length));
+
+    if (req.method === 'OPTIONS') return send(res, 204);
+    if (req.method === 'PUT' && url.searchParams.has('uploadId')) return handlePutPart(req, res, key, url.searchParams);
+    if (req.method === 'GET') {
+      const info = await stat(objectPath(key)).catch(() => null);
+      if (!info) return send(res, 404, {}, 'NoSuchKey');
+      res.writeHead(200, { 'Content-Length': info.size, 'Access-Control-Allow-Origin': '*' });
+      return pipeline(createReadStream(objectPath(key)), res);
+    }
+    send(res, 405, {}, 'MethodNotAllowed');
+  }
+
+  let listening = null; // promessa única: assinaturas em paralelo não sobem servidores duplicados
+
+  function listen() {
+    if (!listening) {
+      listening = new Promise((resolve, reject) => {
+        server = http.createServer((req, res) => {
+          handleRequest(req, res).catch((error) => {
+            if (!res.headersSent) send(res, 500, {}, error.message);
+            else res.destroy(error);
+          });
+        });
+        server.once('error', reject);
+        server.listen(port, host, () => {
+          server.unref();
+          baseUrl = `http://${host}:${server.address().port}`;
+          console.log(`🗄️ [LOCAL-S3] Stand-in ouvindo em ${baseUrl}/${bucket} (dir: ${rootDir})`);
+          resolve(baseUrl);
+        });
+      });
+    }
+    return listening;
+  }
+
+  return {
+    listen,
+
+    async close() {
+      if (!server) return;
+      await new Promise(resolve => server.close(resolve));
+      server = null;
+      baseUrl = null;
+      listening = null;
+    },
+
+    async createMultipartUpload({ key, contentType }) {
+      const uploadId = crypto.randomBytes(16).toString('hex');
+      uploads.set(uploadId, { key, contentType, parts: new Map() });
+      return uploadId;
+    },
+
+    async signPartUrl({ key, uploadId, partNumber, expiresSeconds }) {
+      getUpload(uploadId);
+      const root = await listen();
+      const expires = Math.floor(Date.now() / 1000) + expiresSeconds;
+      const query = new URLSearchParams({
+        uploadId,
+        partNumber: String(partNumber),
+        expires: String(expires),
+        signature: sign(key, uploadId, partNumber, expires)
+      });
+      return `${root}/${bucket}/${key.split('/').map(encodeURIComponent).join('/')}?${query}`;
+    },
+
+    async listParts({ key, uploadId }) {
+      const upload = getUpload(uploadId);
+      if (upload.key !== key) throw storeError('NoSuchUpload', `Upload ${uploadId} não pertence a ${key}`, 404);
+      return [...upload.parts.entries()]
+        .sort((a, b) => a[0] - b[0])
+        .map(([partNumber, p]) => ({ partNumber, etag: p.etag, size: p.size }));
+    },
+
+    async completeMultipartUpload({ key, uploadId, parts }) {
+      const upload = getUpload(uploadId);
+      parts.forEach((p, i) => {
+        const stored = upload.parts.get(p.partNumber);
+        if (!stored || stored.etag !== p.etag) throw storeError('InvalidPart', `Parte ${p.partNumber} inválida`, 400);
+        if (i < parts.length - 1 && stored.size < minPartSize) {
+          throw storeError('EntityTooSmall', `Parte ${p.partNumber} menor que ${minPartSize} bytes`, 400);
+        }
+      });
+
+      const target = objectPath(key);
+      await mkdir(path.dirname(target), { recursive: true });
+      const out = createWriteStream(target);
+      for (const p of parts) {
+        await pipeline(createReadStream(partPath(uploadId, p.partNumber)), out, { end: false });
+      }
+      await new Promise((resolve, reject) => out.end(error => (error ? reject(error) : resolve())));
+
+      uploads.delete(uploadId);
+      await rm(path.join(rootDir, 'multipart', uploadId), { recursive: true, force: true });
+    },
+
+    async abortMultipartUpload({ uploadId }) {
+      getUpload(uploadId);
+      uploads.delete(uploadId);
+      await rm(path.join(rootDir, 'multipart', uploadId), { recursive: true, force: true });
+    },
+
+    async deleteObject({ key }) {
+      await rm(objectPath(key), { force: true });
+    },
+
+    async headObject({ key }) {
+      const info = await stat(objectPath(key)).catch(() => null);
+      return info ? { size: info.size } : null;
+    }
+  };
+}
@@ -0,0 +1,205 @@
+// work/lib/uploads/multipartUploads.js
+// Upload multipart pré-assinado: o navegador envia as partes DIRETO para o bucket (B2/S3)
+// ✅ A API só cria o upload, assina URLs de parte e confirma a conclusão — o arquivo nunca
+//    passa pela RAM do processo (antes: multer.memoryStorage() segurava até 150MB por upload)
+// ✅ Retomável: listParts devolve o que já chegou ao bucket; o cliente só reenvia o que falta
+//
+// O storage é injetado (mesma interface nos dois):
+//   - createS3MultipartStore()    → aws-sdk v2 (B2 em produção)
+//   - createLocalObjectStore()    → stand-in S3-compatível em disco (dev/testes)
+
+import crypto from 'crypto';
+
+export const MULTIPART_CONFIG = {
+  MIN_PART_SIZE: 5 * 1024 * 1024,       // mínimo do S3/B2 para todas as partes menos a última
+  DEFAULT_PART_SIZE: 8 * 1024 * 1024,
+  MAX_PARTS: 10000,
+  MAX_UPLOAD_BYTES: 150 * 1024 * 1024,  // mesmo limite do multer antigo
+  URL_EXPIRES_SECONDS: 3600,            // 1h por lote de URLs (retomada pede novas)
+  ALLOWED_EXTENSIONS: ['mp3', 'wav', 'flac', 'm4a']
+};
+
+// Só chaves geradas por startMultipartUpload (impede operar em objetos arbitrários do bucket)
+const FILE_KEY_PATTERN = /^uploads\/audio_\d+_[a-z0-9]+\.(mp3|wav|flac|m4a)$/;
+
+/**
+ * Divide o arquivo em partes (tamanho cresce se passaria de MAX_PARTS)
+ * @param {number} size - bytes
+ * @param {number} [partSize]
+ * @returns {{ partSize: number, partCount: number }}
+ */
+export function planParts(size, partSize = MULTIPART_CONFIG.DEFAULT_PART_SIZE) {
+  const minForCount = Math.ceil(size / MULTIPART_CONFIG.MAX_PARTS);
+  const effective = Math.max(MULTIPART_CONFIG.MIN_PART_SIZE, partSize, minForCount);
+  return { partSize: effective, partCount: Math.max(1, Math.ceil(size / effective)) };
+}
+
+function isValidFileKey(fileKey) {
+  return typeof fileKey === 'string' && FILE_KEY_PATTERN.test(fileKey);
+}
+
+function isMissingUpload(error) {
+  return error && (error.code === 'NoSuchUpload' || error.statusCode === 404);
+}
+
+async function signParts(store, fileKey, uploadId, partNumbers) {
+  return Promise.all(partNumbers.map(async partNumber => ({
+    partNumber,
+    url: await store.signPartUrl({
+      key: fileKey,
+      uploadId,
+      partNumber,
+      expiresSeconds: MULTIPART_CONFIG.URL_EXPIRES_SECONDS
+    })
+  })));
+}
+
+/**
+ * 🚀 Cria o upload multipart e assina todas as partes
+ * @param {Object} store
+ * @param {{ ext: string, contentType?: string, size: number }} params
+ */
+export async function startMultipartUpload(store, { ext, contentType, size } = {}) {
+  const extension = String(ext || '').toLowerCase();
+  if (!MULTIPART_CONFIG.ALLOWED_EXTENSIONS.includes(extension)) {
+    return { success: false, error: 'INVALID_EXTENSION', allowed: MULTIPART_CONFIG.ALLOWED_EXTENSIONS };
+  }
+
+  const bytes = Number(size);
+  if (!Number.isInteger(bytes) || bytes <= 0) {
+    return { success: false, error: 'INVALID_SIZE' };
+  }
+  if (bytes > MULTIPART_CONFIG.MAX_UPLOAD_BYTES) {
+    return { success: false, error: 'FILE_TOO_LARGE', maxBytes: MULTIPART_CONFIG.MAX_UPLOAD_BYTES };
+  }
+
+  const fileKey = `uploads/audio_${Date.now()}_${crypto.randomBytes(4).toString('hex')}.${extension}`;
+  const { partSize, partCount } = planParts(bytes);
+  const uploadId = await store.createMultipartUpload({ key: fileKey, contentType: contentType || 'application/octet-stream' });
+  const partNumbers = Array.from({ length: partCount }, (_, i) => i + 1);
+
+  return {
+    success: true,
+    uploadId,
+    fileKey,
+    size: bytes,
+    partSize,
+    partCount,
+    expiresIn: MULTIPART_CONFIG.URL_EXPIRES_SECONDS,
+    parts: await signParts(store, fileKey, uploadId, partNumbers)
+  };
+}
+
+/**
+ * 🔁 Retomada: partes já recebidas pelo bucket + URLs novas para as que faltam
+ * @param {Object} store
+ * @param {{ fileKey: string, uploadId: string, size: number }} params
+ */
+export async function resumeMultipartUpload(store, { fileKey, uploadId, size } = {}) {
+  if (!isValidFileKey(fileKey) || !uploadId) {
+    return { success: false, error: 'INVALID_KEY' };
+  }
+  const bytes = Number(size);
+  if (!Number.isInteger(bytes) || bytes <= 0 || bytes > MULTIPART_CONFIG.MAX_UPLOAD_BYTES) {
+    return { success: false, error: 'INVALID_SIZE' };
+  }
+
+  let uploaded;
+  try {
+    uploaded = await store.listParts({ key: fileKey, uploadId });
+  } catch (error) {
+    if (isMissingUpload(error)) return { success: false, error: 'UPLOAD_NOT_FOUND' };
+    throw error;
+  }
+
+  const { partSize, partCount } = planParts(bytes);
+  const done = new Set(uploaded.map(p => p.partNumber));
+  const missing = [];
+  for (let n = 1; n <= partCount; n++) {
+    if (!done.has(n)) missing.push(n);
+  }
+
+  return {
+    success: true,
+    uploadId,
+    fileKey,
+    size: bytes,
+    partSize,
+    partCount,
+    expiresIn: MULTIPART_CONFIG.URL_EXPIRES_SECONDS,
+    uploadedParts: uploaded.map(p => p.partNumber).sort((a, b) => a - b),
+    parts: await signParts(store, fileKey, uploadId, missing)
+  };
+}
+
+/**
+ * ✅ Conclui o upload: a lista de partes vem do bucket (listParts), não do cliente,
+ *    e o tamanho final do objeto é conferido com o declarado no início
+ * @param {Object} store
+ * @param {{ fileKey: string, uploadId: string, size: number }} params
+ */
+export async function completeMultipartUpload(store, { fileKey, uploadId, size } = {}) {
+  if (!isValidFileKey(fileKey) || !uploadId) {
+    return { success: false, error: 'INVALID_KEY' };
+  }
+  const bytes = Number(size);
+  if (!Number.isInteger(bytes) || bytes <= 0 || bytes > MULTIPART_CONFIG.MAX_UPLOAD_BYTES) {
+    return { success: false, error: 'INVALID_SIZE' };
+  }
+
+  let uploaded;
+  try {
+    uploaded = await store.listParts({ key: fileKey, uploadId });
+  } catch (error) {
+    if (isMissingUpload(error)) return { success: false, error: 'UPLOAD_NOT_FOUND' };
+    throw error;
+  }
+
+  const { partCount } = planParts(bytes);
+  const byNumber = new Map(uploaded.map(p => [p.partNumber, p]));
+  const missing = [];
+  for (let n = 1; n <= partCount; n++) {
+    if (!byNumber.has(n)) missing.push(n);
+  }
+  if (missing.length > 0) {
+    return { success: false, error: 'INCOMPLETE_UPLOAD', missingParts: missing };
+  }
+
+  const parts = Array.from({ length: partCount }, (_, i) => ({ partNumber: i + 1, etag: byNumber.get(i + 1).etag }));
+  const receivedBytes = parts.reduce((acc, p) => acc + (byNumber.get(p.partNumber).size || 0), 0);
+  if (receivedBytes !== bytes) {
+    return { success: false, error: 'SIZE_MISMATCH', expected: bytes, received: receivedBytes };
+  }
+
+  await store.completeMultipartUpload({ key: fileKey, uploadId, parts });
+
+  const head = await store.headObject({ key: fileKey });
+  if (!head || head.size !== bytes) {
+    // O objeto já foi montado no bucket: removê-lo para não deixar um órfão com tamanho errado
+    if (head) {
+      await store.deleteObject({ key: fileKey }).catch((error) => {
+        console.warn(`⚠️ [UPLOAD] Falha ao remover objeto com tamanho divergente ${fileKey}: ${error.message}`);
+      });
+    }
+    return { success: false, error: 'SIZE_MISMATCH', expected: bytes, received: head ? head.size : null };
+  }
+
+  console.log(`✅ [UPLOAD] Multipart concluído: ${fileKey} (${partCount} partes, ${(bytes / 1024 / 1024).toFixed(1)}MB)`);
+  return { success: true, fileKey, size: bytes };
+}
+
+/**
+ * 🗑️ Cancela o upload (partes já enviadas são descartadas pelo bucket)
+ */
+export async function abortMultipartUpload(store, { fileKey, uploadId } = {}) {
+  if (!isValidFileKey(fileKey) || !uploadId) {
+    return { success: false, error: 'INVALID_KEY' };
+  }
+  try {
+    await store.abortMultipartUpload({ key: fileKey, uploadId });
+  } catch (error) {
+    if (isMissingUpload(error)) return { success: false, error: 'UPLOAD_NOT_FOUND' };
+    throw error;
+  }
+  return { success: true };
+}
@@ -0,0 +1,96 @@
+// work/lib/uploads/s3MultipartStore.js
+// Adaptador aws-sdk v2 (B2/S3) da interface de store usada por multipartUploads.js
+// 🧹 MEMORY OPT: AWS SDK só é importado na primeira operação (mesmo padrão do /api/presign)
+//
+// ⚠️ CORS do bucket precisa expor o header ETag (ExposeHeaders: ["ETag"]) e aceitar PUT
+//    da origem do app — o navegador lê o ETag de cada parte enviada.
+
+const DEFAULT_ENDPOINT = 'https://s3.us-east-005.backblazeb2.com';
+
+/**
+ * @param {Object} [options]
+ * @param {string} [options.bucket] - padrão: B2_BUCKET_NAME
+ * @param {string} [options.endpoint] - padrão: B2_ENDPOINT ou endpoint B2 us-east-005
+ */
+export function createS3MultipartStore({ bucket = process.env.B2_BUCKET_NAME, endpoint = process.env.B2_ENDPOINT || DEFAULT_ENDPOINT } = {}) {
+  let client = null;
+
+  async function getClient() {
+    if (!client) {
+      const AWS = (await import('aws-sdk')).default;
+      client = new AWS.S3({
+        endpoint,
+        region: 'us-east-005',
+        s3ForcePathStyle: true,
+        accessKeyId: process.env.B2_KEY_ID,
+        secretAccessKey: process.env.B2_APP_KEY,
+        signatureVersion: 'v4'
+      });
+    }
+    return client;
+  }
+
+  return {
+    async createMultipartUpload({ key, contentType }) {
+      const s3 = await getClient();
+      const { UploadId } = await s3.createMultipartUpload({ Bucket: bucket, Key: key, ContentType: contentType }).promise();
+      return UploadId;
+    },
+
+    async signPartUrl({ key, uploadId, partNumber, expiresSeconds }) {
+      const s3 = await getClient();
+      return s3.getSignedUrlPromise('uploadPart', {
+        Bucket: bucket,
+        Key: key,
+        UploadId: uploadId,
+        PartNumber: partNumber,
+        Expires: expiresSeconds
+      });
+    },
+
+    async listParts({ key, uploadId }) {
+      const s3 = await getClient();
+      const parts = [];
+      let marker;
+      do {
+        const page = await s3.listParts({ Bucket: bucket, Key: key, UploadId: uploadId, PartNumberMarker: marker }).promise();
+        for (const p of page.Parts || []) {
+          parts.push({ partNumber: p.PartNumber, etag: p.ETag, size: p.Size });
+        }
+        marker = page.IsTruncated ? page.NextPartNumberMarker : undefined;
+      } while (marker);
+      return parts;
+    },
+
+    async completeMultipartUpload({ key, uploadId, parts }) {
+      const s3 = await getClient();
+      await s3.completeMultipartUpload({
+        Bucket: bucket,
+        Key: key,
+        UploadId: uploadId,
+        MultipartUpload: { Parts: parts.map(p => ({ PartNumber: p.partNumber, ETag: p.etag })) }
+      }).promise();
+    },
+
+    async abortMultipartUpload({ key, uploadId }) {
+      const s3 = await getClient();
+      await s3.abortMultipartUpload({ Bucket: bucket, Key: key, UploadId: uploadId }).promise();
+    },
+
+    async deleteObject({ key }) {
+      const s3 = await getClient();
+      await s3.deleteObject({ Bucket: bucket, Key: key }).promise();
+    },
+
+    async headObject({ key }) {
+      const s3 = await getClient();
+      try {
+        const head = await s3.headObject({ Bucket: bucket, Key: key }).promise();
+        return { size: head.ContentLength };
+      } catch (error) {
+        if (error.code === 'NotFound' || error.statusCode === 404) return null;
+        throw error;
+      }
+    }
+  };
+}
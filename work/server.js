@@ -15,6 +15,8 @@ import { detectEnvironment, getCorsConfig } from './config/environment.js';
 import analyzeRouter from "./api/audio/analyze.js";
 import analyzeAnonymousRouter from "./api/audio/analyze-anonymous.js"; // 🔓 NOVO: Análise anônima
 import jobsRouter from "./api/jobs/[id].js";
+import referencesRouter from "./api/references/index.js"; // 📚 Biblioteca de referências
+import multipartUploadRouter from "./api/uploads/multipart.js"; // 📤 Upload multipart direto no bucket
 import healthRouter from "./api/health/redis.js";
 import versionRouter from "./api/health/version.js";
 import stripeCheckoutRouter from './api/stripe/create-checkout-session.js';
@@ -100,6 +102,8 @@ app.get('/api/anonymous/test', (req, res) => {
 // ✅ Rotas autenticadas depois (mais genéricas)
 app.use('/api/audio', analyzeRouter); // Inclui /api/audio/analyze e /api/audio/compare
 app.use('/api/jobs', jobsRouter);
+app.use('/api/references', referencesRouter);
+app.use('/api/uploads/multipart', multipartUploadRouter);
 app.use('/health', healthRouter);
 app.use('/api/health/version', versionRouter); // 🔖 Endpoint de versão/rastreabilidade
 
@@ -191,7 +195,8 @@ app.get('/api', (req, res) => {
       analyze: '/api/audio/analyze',
       jobs: '/api/jobs/:id',
       health: '/health',
-      presign: '/api/presign'
+      presign: '/api/presign',
+      multipartUpload: '/api/uploads/multipart'
     }
   });
 });
@@ -0,0 +1,164 @@
+/**
+ * 📈 SUPERVISOR - AUTOSCALER DOS WORKERS DE ANÁLISE E MASTERIZAÇÃO
+ *
+ * Substitui o "node worker-redis.js" com concorrência fixa: sobe os processos de cada pool,
+ * lê fila/idade/host a cada AUTOSCALE_INTERVAL_MS e ajusta processos × concorrência
+ * (lib/scaling/autoscaler.js) para manter a espera na fila dentro do SLO.
+ *
+ * Uso:
+ *   node supervisor.js                       # pools analysis + mastering
+ *   AUTOSCALE_POOLS=analysis node supervisor.js
+ *
+ * Health: GET /health e /metrics/autoscaler na PORT do supervisor; cada worker de análise
+ * usa PORT+1, PORT+2, ... para o próprio health server.
+ */
+
+import "dotenv/config";
+import { Queue } from 'bullmq';
+import Redis from 'ioredis';
+import express from 'express';
+import {
+  AUTOSCALER_CONFIG,
+  AUTOSCALER_POOLS,
+  WorkerPool,
+  planScale,
+  readQueueSignals,
+  createHostSampler
+} from './lib/scaling/autoscaler.js';
+import { createLogger } from './lib/logger.js';
+
+const logger = createLogger('supervisor');
+
+const PORT = Number(process.env.PORT) || 8081;
+const POOL_NAMES = (process.env.AUTOSCALE_POOLS || 'analysis,mastering')
+  .split(',').map(name => name.trim()).filter(name => AUTOSCALER_POOLS[name]);
+
+if (!process.env.REDIS_URL) {
+  logger.error('💥 [SUPERVISOR] REDIS_URL não configurado');
+  process.exit(1);
+}
+
+const connection = new Redis(process.env.REDIS_URL, {
+  maxRetriesPerRequest: null,
+  enableReadyCheck: false,
+  retryStrategy: (times) => Math.min(times * 1000, 15000)
+});
+connection.on('error', (err) => logger.warn(`⚠️ [SUPERVISOR] Redis: ${err.message}`));
+
+const sampleHost = createHostSampler();
+let loopTimer = null;
+let shuttingDown = false;
+
+const pools = POOL_NAMES.map((name, index) => {
+  const definition = AUTOSCALER_POOLS[name];
+  return {
+    name,
+    definition,
+    queue: new Queue(definition.queue, { connection }),
+    // Faixa de portas por pool: analysis usa PORT+1..PORT+maxProcesses
+    pool: new WorkerPool(name, definition, { basePort: PORT + 1 + index * 100 })
+  };
+});
+
+/**
+ * Uma rodada: sinais → decisão → aplicação, pool a pool
+ */
+async function tick() {
+  const host = sampleHost();
+  const now = Date.now();
+
+  for (const { name, definition, queue, pool } of pools) {
+    let signals;
+    try {
+      signals = await readQueueSignals(queue, { now });
+    } catch (err) {
+      logger.warn(`⚠️ [SUPERVISOR] ${name}: fila indisponível (${err.message}) - mantendo tamanho`);
+      continue;
+    }
+
+    const decision = planScale({
+      current: { processes: pool.processes, concurrency: pool.concurrency },
+      bounds: definition,
+      queue: signals,
+      host,
+      now,
+      lastScaleUpAt: pool.lastScaleUpAt,
+      lastScaleDownAt: pool.lastScaleDownAt
+    });
+    pool.lastDecision = { ...decision, queue: signals, host, at: new Date(now).toISOString() };
+
+    if (decision.action === 'hold') {
+      logger.debug(() => [`[SUPERVISOR] ${name}: ${decision.reason}`, { waiting: signals.waiting, active: signals.active, slots: decision.slots }]);
+      continue;
+    }
+
+    logger.info(`${decision.action === 'up' ? '📈' : '📉'} [SUPERVISOR] ${name}: ${pool.processes}×${pool.concurrency} → ` +
+      `${decision.processes}×${decision.concurrency} (${decision.reason}; espera prevista ${Math.round(decision.predictedWaitMs / 1000)}s)`);
+    if (decision.action === 'up') pool.lastScaleUpAt = now;
+    else pool.lastScaleDownAt = now;
+    pool.apply(decision);
+  }
+}
+
+function scheduleTick() {
+  loopTimer = setTimeout(async () => {
+    try {
+      await tick();
+    } catch (err) {
+      logger.error('❌ [SUPERVISOR] Falha na rodada do autoscaler:', err.message);
+    }
+    if (!shuttingDown) scheduleTick();
+  }, AUTOSCALER_CONFIG.intervalMs);
+}
+
+function startHealthServer() {
+  const app = express();
+  const status = () => ({
+    status: shuttingDown ? 'draining' : 'healthy',
+    pid: process.pid,
+    uptime: process.uptime(),
+    sloMs: AUTOSCALER_CONFIG.queueWaitSloMs,
+    pools: Object.fromEntries(pools.map(({ name, pool }) => [name, pool.status()]))
+  });
+
+  app.get('/health', (req, res) => res.json(status()));
+  app.get('/metrics/autoscaler', (req, res) => res.json({ ...status(), config: AUTOSCALER_CONFIG }));
+  app.listen(PORT, () => logger.info(`🏥 [SUPERVISOR] Health server na porta ${PORT}`));
+}
+
+async function shutdown(signal) {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  clearTimeout(loopTimer);
+  logger.info(`📥 [SUPERVISOR] ${signal} - drenando ${pools.length} pool(s)...`);
+
+  try {
+    // Cada worker recebe SIGTERM → gracefulShutdown (espera os jobs ativos)
+    await Promise.all(pools.map(({ pool }) => pool.stop()));
+    await Promise.all(pools.map(({ queue }) => queue.close()));
+    await connection.quit();
+    logger.info('✅ [SUPERVISOR] Shutdown concluído');
+    process.exit(0);
+  } catch (err) {
+    logger.error('💥 [SUPERVISOR] Erro no shutdown:', err.message);
+    process.exit(1);
+  }
+}
+
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
+
+// Tamanho inicial: mínimo de processos com a concorrência do env (ou o padrão do worker)
+for (const { name, definition, pool } of pools) {
+  const envConcurrency = Number(process.env[definition.concurrencyEnv]);
+  const concurrency = Number.isFinite(envConcurrency) && envConcurrency > 0
+    ? Math.min(definition.maxConcurrency, Math.max(definition.minConcurrency, envConcurrency))
+    : definition.initialConcurrency;
+  pool.concurrency = concurrency;
+  pool.apply({ processes: definition.minProcesses, concurrency });
+  logger.info(`🚀 [SUPERVISOR] ${name}: ${definition.minProcesses}×${concurrency} ` +
+    `(limites ${definition.minProcesses}-${definition.maxProcesses} processos, concorrência ${definition.minConcurrency}-${definition.maxConcurrency})`);
+}
+
+startHealthServer();
+scheduleTick();
@@ -0,0 +1,304 @@
+/**
+ * 🧪 ANALYSIS BACKFILL TESTS
+ *
+ * Backfill de re-scoring das análises salvas (lib/rescoring/analysisBackfill.js):
+ * - Cursor (created_at, id): cada análise exatamente uma vez, em ordem, lotes do tamanho pedido
+ * - Retomada pelo cursor, limite por execução, dry-run não grava, parada após o lote
+ * - Escrita otimista (job alterado no meio = conflito), falhas isoladas, results em texto
+ * - Targets do scoring idênticos aos do pipeline (override de streaming, reference flat)
+ * - Re-scoring de análise em modo reduzido não grava texto de sugestão (mesma máscara do pipeline)
+ *
+ * A origem dos dados é uma fonte em memória com a mesma interface de createJobsSource.
+ *
+ * Uso: node test/analysis-backfill-tests.js
+ */
+
+import { runBackfill } from '../lib/rescoring/analysisBackfill.js';
+import { applySoundDestinationOverride, toScoringReference, toFrontendFlatTargets } from '../lib/audio/utils/scoring-targets.js';
+import { orderSuggestionsForUser } from '../lib/audio/utils/suggestion-order.js';
+import { rescoreAnalysis } from '../lib/rescoring/rescoreAnalysis.js';
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Fonte em memória: jobs ordenados por (createdAt, id), versão = contador de updates
+ */
+function createMemorySource(jobs) {
+  const rows = jobs.map(job => ({ ...job, version: 1 }))
+    .sort((a, b) => (a.createdAt === b.createdAt ? a.id.localeCompare(b.id) : a.createdAt.localeCompare(b.createdAt)));
+  const after = (cursor) => rows.filter(r => !cursor || r.createdAt > cursor.createdAt ||
+    (r.createdAt === cursor.createdAt && r.id > cursor.id));
+  const source = {
+    rows,
+    fetches: [],
+    saves: 0,
+    async count(cursor) {
+      return after(cursor).length;
+    },
+    async fetchBatch(cursor, limit) {
+      source.fetches.push(limit);
+      return after(cursor).slice(0, limit).map(r => ({
+        id: r.id,
+        results: r.results,
+        version: r.version,
+        cursor: { createdAt: r.createdAt, id: r.id }
+      }));
+    },
+    async save(row, results) {
+      const stored = rows.find(r => r.id === row.id);
+      if (stored.version !== row.version) return false;
+      stored.results = results;
+      stored.version++;
+      source.saves++;
+      return true;
+    }
+  };
+  return source;
+}
+
+function makeJobs(count) {
+  return Array.from({ length: count }, (_, i) => ({
+    // Vários jobs no mesmo instante: o desempate pelo id precisa funcionar
+    id: `job-${String(i).padStart(4, '0')}`,
+    createdAt: `2025-01-01 00:00:${String(Math.floor(i / 3)).padStart(2, '0')}.123456+00`,
+    results: { genre: 'funk_bh', score: 50, n: i }
+  }));
+}
+
+const bumpScore = async (results) => ({ status: 'updated', results: { ...results, score: results.score + 10 } });
+
+async function runPaginationTest() {
+  const checks = [];
+  const source = createMemorySource(makeJobs(250));
+  const seen = [];
+  const progress = [];
+
+  const stats = await runBackfill(source, {
+    batchSize: 100,
+    delayMs: 0,
+    transform: async (results, row) => {
+      seen.push(row.id);
+      return bumpScore(results);
+    },
+    onBatch: (p) => progress.push(p)
+  });
+
+  checks.push(check('cada análise exatamente uma vez, em ordem', seen.length === 250 && new Set(seen).size === 250 &&
+    seen.join() === source.rows.map(r => r.id).join()));
+  checks.push(check('lotes de 100 (último parcial encerra)', stats.batches === 3 && source.fetches.join() === '100,100,100',
+    JSON.stringify(source.fetches)));
+  checks.push(check('todas gravadas', stats.updated === 250 && source.saves === 250 &&
+    source.rows.every(r => r.results.score === 60), JSON.stringify(stats)));
+  checks.push(check('progresso por lote com total, taxa e ETA', progress.length === 3 && progress[0].total === 250 &&
+    progress[0].scanned === 100 && progress[0].rate > 0 && progress[2].etaSeconds === 0,
+    JSON.stringify(progress.map(p => [p.scanned, p.etaSeconds]))));
+  checks.push(check('cursor final = último job', stats.cursor.id === 'job-0249'));
+  return checks;
+}
+
+async function runResumeTest() {
+  const checks = [];
+  const source = createMemorySource(makeJobs(50));
+  const checkpoints = [];
+
+  const dry = await runBackfill(source, { batchSize: 20, delayMs: 0, dryRun: true, transform: bumpScore });
+  checks.push(check('dry-run conta mas não grava', dry.updated === 50 && source.saves === 0, JSON.stringify(dry)));
+
+  const first = await runBackfill(source, {
+    batchSize: 10,
+    delayMs: 0,
+    limit: 25,
+    transform: bumpScore,
+    onBatch: (p) => checkpoints.push(p.cursor)
+  });
+  checks.push(check('limite por execução (lote final encolhe)', first.scanned === 25 && first.total === 25 &&
+    source.fetches.slice(-3).join() === '10,10,5', JSON.stringify(source.fetches)));
+
+  const stopped = await runBackfill(source, {
+    cursor: checkpoints[checkpoints.length - 1],
+    batchSize: 10,
+    delayMs: 0,
+    transform: bumpScore,
+    shouldStop: () => true
+  });
+  checks.push(check('retoma do checkpoint e para após o lote', stopped.scanned === 10 && stopped.total === 25 &&
+    stopped.cursor.id === 'job-0034', JSON.stringify(stopped)));
+
+  const rest = await runBackfill(source, { cursor: stopped.cursor, batchSize: 10, delayMs: 50, transform: bumpScore });
+  checks.push(check('restante concluído sem repetir nem pular', rest.scanned === 15 &&
+    source.rows.every(r => r.results.score === 60), JSON.stringify(rest)));
+  checks.push(check('pausa entre lotes (throttling)', rest.elapsedMs >= 50, `${rest.elapsedMs}ms`));
+  return checks;
+}
+
+async function runConflictAndFailureTest() {
+  const checks = [];
+  const jobs = makeJobs(6);
+  jobs[1].results = JSON.stringify(jobs[1].results); // coluna results em texto
+  jobs[2].results = '{quebrado';
+  jobs[3].results = { mode: 'reference' };
+  const source = createMemorySource(jobs);
+  const errors = [];
+
+  const stats = await runBackfill(source, {
+    batchSize: 10,
+    delayMs: 0,
+    transform: async (results, row) => {
+      if (results.mode === 'reference') return { status: 'skipped', reason: 'not_genre_mode' };
+      if (row.id === 'job-0004') throw new Error('targets ausentes');
+      if (row.id === 'job-0005') source.rows.find(r => r.id === row.id).version++; // worker re-processou
+      return bumpScore(results);
+    },
+    onError: (e) => errors.push(e.id)
+  });
+
+  checks.push(check('results em texto é parseado', source.rows[1].results.score === 60));
+  checks.push(check('JSON inválido e exceção viram falhas isoladas', stats.failed === 2 &&
+    errors.join() === 'job-0002,job-0004', JSON.stringify(errors)));
+  checks.push(check('puladas contadas por motivo', stats.skipped === 1 && stats.skippedBy.not_genre_mode === 1));
+  checks.push(check('job alterado durante o backfill não é sobrescrito', stats.conflicts === 1 &&
+    source.rows[5].results.score === 50 && stats.updated === 2, JSON.stringify(stats)));
+  return checks;
+}
+
+async function runScoringTargetsTest() {
+  const checks = [];
+  const base = {
+    lufs: { target: -7.2, tolerance: 2, min: -9, max: -6 },
+    truePeak: { target: -0.3, tolerance: 0.3 },
+    dr: { target: 6, tolerance: 2 },
+    stereoWidth: { target: 0.4, tolerance: 0.2 },
+    bands: { sub: { target_db: -20 } }
+  };
+  const frozen = JSON.stringify(base);
+
+  const pista = applySoundDestinationOverride(base, 'pista');
+  const streaming = applySoundDestinationOverride(base, 'streaming');
+  checks.push(check('override não altera os targets base', JSON.stringify(base) === frozen && pista !== base));
+  checks.push(check('pista mantém os targets do gênero', JSON.stringify(pista) === frozen));
+  checks.push(check('streaming: -14 LUFS / -1 dBTP', streaming.lufs.target === -14 && streaming.lufs.tolerance === 1 &&
+    streaming.truePeak.target === -1 && streaming.truePeak.min === -1.5 && streaming.dr.target === 6));
+
+  const ref = toScoringReference(streaming);
+  checks.push(check('reference flat do scoring', ref.lufs_target === -14 && ref.tol_lufs_min === 1 &&
+    ref.true_peak_target === -1 && ref.dr_target === 6 && ref.lra_target === 7 && ref.stereo_target === 0.4 &&
+    ref.bands.sub.target_db === -20, JSON.stringify(ref)));
+  const flat = toFrontendFlatTargets(pista);
+  checks.push(check('targets flat do frontend sem bands', flat.lufs_target === -7.2 && !('bands' in flat)));
+
+  const ordered = orderSuggestionsForUser([
+    { metric: 'band', severity: 'low' },
+    { metric: 'lufs', severity: 'high' },
+    { metric: 'truePeak', severity: 'critical' }
+  ]);
+  checks.push(check('ordem das sugestões (true peak → lufs → bandas)',
+    ordered.map(s => s.metric).join() === 'truePeak,lufs,band'));
+  return checks;
+}
+
+function buildSavedAnalysis(analysisMode) {
+  const technicalData = {
+    lufsIntegrated: -5.1,
+    truePeakDbtp: 0.4,
+    dynamicRange: 3.2,
+    lra: 2.1,
+    stereoCorrelation: 0.9,
+    spectral_balance: { sub: { energy_db: -14 }, bass: { energy_db: -16 }, mid: { energy_db: -22 } }
+  };
+  const suggestion = { id: 's1', metric: 'lufs', category: 'loudness', message: 'Reduza o volume em 2 dB', action: 'Use um limiter' };
+  return {
+    mode: 'genre',
+    genre: 'funk_bh',
+    analysisMode,
+    isReduced: analysisMode === 'reduced',
+    score: 50,
+    technicalData,
+    data: { metrics: { loudness: { value: -5.1 } }, genreTargets: {} },
+    suggestions: [suggestion],
+    problemsAnalysis: { suggestions: [suggestion] },
+    diagnostics: { suggestions: [suggestion] },
+    aiSuggestions: [{ ...suggestion, problema: 'Master alto demais', solucao: 'Baixe o ceiling' }]
+  };
+}
+
+// Algum campo de texto preenchido em alguma lista de sugestões?
+function suggestionTexts(results) {
+  const lists = [results.suggestions, results.aiSuggestions, results.problemsAnalysis?.suggestions, results.diagnostics?.suggestions];
+  const textFields = ['message', 'title', 'action', 'description', 'problema', 'causaProvavel', 'solucao', 'pluginRecomendado', 'dicaExtra'];
+  return lists.flatMap(list => (list || []).flatMap(s => textFields.filter(f => typeof s[f] === 'string' && s[f])));
+}
+
+async function runReducedModeTest() {
+  const checks = [];
+  const targets = {
+    lufs: { target: -7.2, tolerance: 2 },
+    truePeak: { target: -0.3, tolerance: 0.3 },
+    dr: { target: 6, tolerance: 2 },
+    stereoWidth: { target: 0.4, tolerance: 0.2 },
+    bands: { sub: { target_db: -20, tol_db: 3 }, bass: { target_db: -18, tol_db: 3 }, mid: { target_db: -22, tol_db: 3 } }
+  };
+
+  const reduced = rescoreAnalysis(buildSavedAnalysis('reduced'), targets);
+  checks.push(check('análise reduzida re-scorada', reduced.status === 'updated', JSON.stringify(reduced.reason)));
+  const leaked = suggestionTexts(reduced.results || {});
+  checks.push(check('nenhum texto de sugestão gravado', leaked.length === 0, leaked.join()));
+  checks.push(check('sugestões marcadas como bloqueadas', reduced.results?.aiSuggestions?.every(s => s.blocked === true) &&
+    reduced.results?.diagnostics?.suggestions?.every(s => s.blocked === true)));
+  checks.push(check('modo reduzido preservado', reduced.results?.isReduced === true && reduced.results?.analysisMode === 'reduced'));
+
+  const full = rescoreAnalysis(buildSavedAnalysis('full'), targets);
+  checks.push(check('análise completa mantém o texto', full.status === 'updated' &&
+    suggestionTexts(full.results).length > 0 && !full.results.suggestions.some(s => s.blocked)));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 ANALYSIS BACKFILL TESTS\n');
+
+  const results = [];
+  results.push(await runAccuracyTest('Paginação por cursor em lotes', runPaginationTest));
+  results.push(await runAccuracyTest('Dry-run, limite, retomada e parada', runResumeTest));
+  results.push(await runAccuracyTest('Conflitos, falhas e análises puladas', runConflictAndFailureTest));
+  results.push(await runAccuracyTest('Targets do scoring iguais aos do pipeline', runScoringTargetsTest));
+  results.push(await runAccuracyTest('Re-scoring em modo reduzido sem texto pago', runReducedModeTest));
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
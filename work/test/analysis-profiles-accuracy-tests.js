@@ -0,0 +1,165 @@
+/**
+ * 🧪 ANALYSIS PROFILES ACCURACY TESTS
+ *
+ * Mede o perfil "fast" (hop 4096 + refinamento) contra o "detailed" (hop 1024):
+ * - Bandas espectrais (percentual e energy_db) e mediana do centróide dentro de ANALYSIS_PROFILES.fast.accuracy
+ * - Trechos com clipping e com sub desequilibrado são sinalizados e re-analisados em hop 1024
+ * - Sinal limpo não gera refinamento; fast usa ~1/4 dos frames FFT
+ *
+ * Uso: node test/analysis-profiles-accuracy-tests.js
+ */
+
+import { segmentAudioTemporal } from '../api/audio/temporal-segmentation.js';
+import { ANALYSIS_PROFILES } from '../lib/audio/analysis-profiles.js';
+import { SpectralBatchAnalyzer } from '../lib/audio/features/spectral-batch.js';
+import { SpectralBandsAggregator } from '../lib/audio/features/spectral-bands.js';
+import { SpectralCentroidAggregator } from '../lib/audio/features/spectral-centroid.js';
+
+const SAMPLE_RATE = 48000;
+
+/**
+ * Sinal sintético "musical": kick (sub), baixo, acordes, hi-hat de ruído
+ * @param {Object} options - seconds, bpm, clipAt (s), subImbalanceAt ([início, fim] em s)
+ */
+function generateTrack({ seconds = 30, bpm = 124, clipAt = null, subImbalanceAt = null, seed = 99 }) {
+  const length = seconds * SAMPLE_RATE;
+  const left = new Float32Array(length);
+  const right = new Float32Array(length);
+  const beat = Math.round((60 / bpm) * SAMPLE_RATE);
+  let state = seed;
+  const noise = () => {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    return state / 0x3fffffff - 1;
+  };
+
+  for (let i = 0; i < length; i++) {
+    const t = i / SAMPLE_RATE;
+    const inBeat = i % beat;
+    const kickEnv = Math.exp(-inBeat / (0.12 * SAMPLE_RATE));
+    const kick = 0.45 * kickEnv * Math.sin(2 * Math.PI * (50 + 60 * kickEnv) * inBeat / SAMPLE_RATE);
+    const bass = 0.15 * Math.sin(2 * Math.PI * 55 * t) * (0.6 + 0.4 * Math.sin(2 * Math.PI * 0.5 * t));
+    const chord = 0.05 * (Math.sin(2 * Math.PI * 440 * t) + Math.sin(2 * Math.PI * 554.4 * t) + Math.sin(2 * Math.PI * 659.3 * t));
+    const hat = (i % (beat / 2)) < 2400 ? 0.04 * noise() * Math.exp(-(i % (beat / 2)) / 600) : 0;
+    const air = 0.01 * noise();
+
+    let l = kick + bass + chord + hat + air;
+    let r = kick + bass + chord * 0.9 + hat * 1.1 + 0.01 * noise();
+
+    if (subImbalanceAt && t >= subImbalanceAt[0] && t < subImbalanceAt[1]) {
+      r -= 0.9 * (kick + bass);
+    }
+    if (clipAt !== null && t >= clipAt && t < clipAt + 0.3) {
+      l = Math.max(-1, Math.min(1, l * 4));
+      r = Math.max(-1, Math.min(1, r * 4));
+    }
+
+    left[i] = l;
+    right[i] = r;
+  }
+
+  return { leftChannel: left, rightChannel: right, sampleRate: SAMPLE_RATE, duration: seconds, numberOfChannels: 2 };
+}
+
+function spectralSummary(framesFFT) {
+  const series = new SpectralBatchAnalyzer(SAMPLE_RATE, 4096).analyzeFrames(framesFFT);
+  return {
+    bands: SpectralBandsAggregator.aggregateBatch(series),
+    centroid: SpectralCentroidAggregator.aggregateBatch(series)
+  };
+}
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Executa um cenário: segmenta com os dois perfis e compara
+ */
+function runAccuracyTest(label, trackOptions, expectations = {}) {
+  const audio = generateTrack(trackOptions);
+  const detailed = segmentAudioTemporal(audio, { analysisProfile: 'detailed', jobId: 'profiles-test' });
+  const fast = segmentAudioTemporal(audio, { analysisProfile: 'fast', jobId: 'profiles-test' });
+  const accuracy = ANALYSIS_PROFILES.fast.accuracy;
+
+  const reference = spectralSummary(detailed.framesFFT);
+  const candidate = spectralSummary(fast.framesFFT);
+  const checks = [];
+
+  let maxPctDelta = 0;
+  let maxDbDelta = 0;
+  for (const key of Object.keys(reference.bands.bands)) {
+    const a = reference.bands.bands[key];
+    const b = candidate.bands.bands[key];
+    maxPctDelta = Math.max(maxPctDelta, Math.abs(a.percentage - b.percentage));
+    if (a.energy_db !== null && b.energy_db !== null) {
+      maxDbDelta = Math.max(maxDbDelta, Math.abs(a.energy_db - b.energy_db));
+    }
+  }
+  const centroidDelta = Math.abs(reference.centroid.centroidHz - candidate.centroid.centroidHz);
+
+  checks.push(check('bandas: |Δ%| dentro do documentado', maxPctDelta <= accuracy.bandPercentagePoints, `${maxPctDelta.toFixed(3)} pp`));
+  checks.push(check('bandas: |Δ energy_db| dentro do documentado', maxDbDelta <= accuracy.bandEnergyDb, `${maxDbDelta.toFixed(2)} dB`));
+  checks.push(check('centróide: |Δ| dentro do documentado', centroidDelta <= accuracy.centroidHz, `${centroidDelta.toFixed(1)} Hz`));
+
+  const ratio = detailed.framesFFT.count / fast.framesFFT.count;
+  checks.push(check('fast usa ~1/4 dos frames', ratio > 3.8 && ratio < 4.2, `ratio=${ratio.toFixed(2)}`));
+  checks.push(check('detailed não refina', detailed.analysisProfile.refinedSegments.length === 0));
+
+  const segments = fast.analysisProfile.refinedSegments;
+  const reasons = new Set(segments.flatMap(s => s.reasons));
+  for (const reason of expectations.reasons || []) {
+    checks.push(check(`sinaliza ${reason}`, reasons.has(reason), [...reasons].join(',')));
+  }
+  if (expectations.noRefinement) {
+    checks.push(check('sinal limpo sem refinamento', segments.length === 0, `${segments.length} trechos`));
+  }
+  if (expectations.clipAt !== undefined) {
+    const hit = segments.find(s => s.reasons.includes('clipping'));
+    checks.push(check('trecho de clipping cobre o evento', !!hit && hit.startTime <= expectations.clipAt && hit.endTime >= expectations.clipAt + 0.3));
+  }
+  for (const segment of segments) {
+    // Frames refinados coincidem com a grade do perfil detailed
+    const index = segment.framesFFT.firstFrameIndex;
+    const same = segment.framesFFT.left[0].magnitude.every((v, i) => v === detailed.framesFFT.left[index].magnitude[i]);
+    checks.push(check(`trecho ${segment.startTime.toFixed(1)}s: frames na grade de hop 1024`, segment.framesFFT.hopSize === 1024 && same));
+  }
+
+  return { label, checks, passed: checks.every(c => c.passed) };
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 ANALYSIS PROFILES ACCURACY TESTS\n');
+
+  const results = [
+    runAccuracyTest('sinal limpo', { seconds: 20 }, { noRefinement: true }),
+    runAccuracyTest('clipping aos 12s', { seconds: 24, clipAt: 12 }, { reasons: ['clipping'], clipAt: 12 }),
+    runAccuracyTest('sub desequilibrado 5-8s', { seconds: 30, subImbalanceAt: [5, 8], bpm: 128 }, { reasons: ['sub_imbalance'] })
+  ];
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks) {
+      if (!c.passed) console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+      else if (c.detail) console.log(`   · ${c.name}: ${c.detail}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários dentro da precisão documentada`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
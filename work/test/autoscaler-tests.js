@@ -0,0 +1,289 @@
+/**
+ * 🧪 AUTOSCALER TESTS
+ *
+ * Autoscaler local dos workers (lib/scaling/autoscaler.js + supervisor.js):
+ * - slots → processos × concorrência (concorrência primeiro, dentro dos limites do pool)
+ * - Decisão: sobe com fila acima do SLO, segura com host saturado/cooldown, desce devagar ocioso,
+ *   corta com memória crítica
+ * - Sinais da fila: waiting + prioritized, job mais antigo, duração média dos concluídos
+ * - WorkerPool com processos reais: fork com concorrência no env, IPC 'scale', drenagem por
+ *   SIGTERM dos mais novos e recriação de processo que morreu sozinho
+ *
+ * A fila é um objeto em memória com a mesma interface da Queue do BullMQ.
+ *
+ * Uso: node test/autoscaler-tests.js
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import {
+  AUTOSCALER_CONFIG,
+  slotsToShape,
+  planScale,
+  readQueueSignals,
+  createHostSampler,
+  WorkerPool
+} from '../lib/scaling/autoscaler.js';
+import { reconfigureLogger } from '../lib/logger.js';
+
+const BOUNDS = {
+  minProcesses: 1,
+  maxProcesses: 4,
+  minConcurrency: 1,
+  maxConcurrency: 6,
+  defaultJobMs: 60000
+};
+
+const CONFIG = {
+  ...AUTOSCALER_CONFIG,
+  queueWaitSloMs: 30000,
+  upCooldownMs: 30000,
+  downCooldownMs: 300000,
+  cpuHigh: 0.85,
+  memHigh: 0.85,
+  memCritical: 0.93
+};
+
+const CALM_HOST = { cpu: 0.4, memUsed: 0.5 };
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+function runShapeTest() {
+  const checks = [];
+  const shape = slots => slotsToShape(slots, BOUNDS);
+  checks.push(check('concorrência antes de processos', JSON.stringify(shape(5)) === '{"processes":1,"concurrency":5}'));
+  checks.push(check('processos quando a concorrência não basta (divisão equilibrada)', JSON.stringify(shape(8)) === '{"processes":2,"concurrency":4}'));
+  checks.push(check('limitado ao máximo do pool', JSON.stringify(shape(100)) === '{"processes":4,"concurrency":6}'));
+  checks.push(check('mínimo de 1×1', JSON.stringify(shape(0)) === '{"processes":1,"concurrency":1}'));
+  return checks;
+}
+
+function runDecisionTest() {
+  const checks = [];
+  const now = 10_000_000;
+  const plan = (overrides) => planScale({
+    current: { processes: 1, concurrency: 2 },
+    bounds: BOUNDS,
+    queue: { waiting: 0, active: 0, oldestWaitMs: 0, avgJobMs: 60000 },
+    host: CALM_HOST,
+    now,
+    lastScaleUpAt: 0,
+    lastScaleDownAt: 0,
+    ...overrides
+  }, CONFIG);
+
+  // 6 na fila × 60s / SLO 30s = 12 slots + 2 ativos = 14 → 3×5
+  const backlog = plan({ queue: { waiting: 6, active: 2, oldestWaitMs: 40000, avgJobMs: 60000 } });
+  checks.push(check('fila acima do SLO sobe para drenar dentro do SLO', backlog.action === 'up' &&
+    backlog.processes === 3 && backlog.concurrency === 5 && backlog.predictedWaitMs === 180000, JSON.stringify(backlog)));
+
+  const saturated = plan({ queue: { waiting: 6, active: 2, oldestWaitMs: 40000, avgJobMs: 60000 }, host: { cpu: 0.95, memUsed: 0.5 } });
+  checks.push(check('host saturado segura a subida', saturated.action === 'hold' && saturated.processes === 1 && saturated.concurrency === 2,
+    JSON.stringify(saturated)));
+
+  const cooling = plan({ queue: { waiting: 6, active: 2, oldestWaitMs: 40000, avgJobMs: 60000 }, lastScaleUpAt: now - 10000 });
+  checks.push(check('cooldown de subida', cooling.action === 'hold' && cooling.reason === 'cooldown de subida'));
+
+  const young = plan({ queue: { waiting: 1, active: 1, oldestWaitMs: 2000, avgJobMs: 20000 } });
+  checks.push(check('fila pequena dentro do SLO não escala', young.action === 'hold', JSON.stringify(young)));
+
+  const noHistory = plan({ queue: { waiting: 200, active: 2, oldestWaitMs: 100000, avgJobMs: null } });
+  checks.push(check('sem histórico usa a duração padrão e respeita o máximo', noHistory.action === 'up' &&
+    noHistory.processes === 4 && noHistory.concurrency === 6));
+
+  const idle = { current: { processes: 3, concurrency: 4 }, queue: { waiting: 0, active: 1, oldestWaitMs: 0, avgJobMs: 60000 } };
+  const idleRecent = plan({ ...idle, lastScaleUpAt: now - 60000 });
+  checks.push(check('ocioso dentro do cooldown de descida segura', idleRecent.action === 'hold' && idleRecent.reason === 'cooldown de descida'));
+  const idleDown = plan({ ...idle, lastScaleUpAt: now - 600000 });
+  checks.push(check('ocioso desce no máximo 1/4 dos slots', idleDown.action === 'down' && idleDown.slots <= 12 && idleDown.slots >= 9 &&
+    idleDown.processes === 2, JSON.stringify(idleDown)));
+
+  const busy = plan({ current: { processes: 2, concurrency: 4 }, queue: { waiting: 0, active: 6, oldestWaitMs: 0, avgJobMs: 60000 } });
+  checks.push(check('fila vazia mas ocupado não desce', busy.action === 'hold'));
+
+  const critical = plan({ current: { processes: 3, concurrency: 4 }, queue: { waiting: 10, active: 12, oldestWaitMs: 90000, avgJobMs: 60000 },
+    host: { cpu: 0.5, memUsed: 0.96 } });
+  checks.push(check('memória crítica corta um processo mesmo com fila', critical.action === 'down' && critical.processes === 2 && critical.concurrency === 4,
+    JSON.stringify(critical)));
+  const criticalAgain = plan({ current: { processes: 2, concurrency: 4 }, queue: { waiting: 10, active: 8, oldestWaitMs: 90000, avgJobMs: 60000 },
+    host: { cpu: 0.5, memUsed: 0.96 }, lastScaleDownAt: now - 5000 });
+  checks.push(check('memória crítica espera a drenagem antes do próximo corte', criticalAgain.action === 'hold'));
+
+  const floor = plan({ current: { processes: 1, concurrency: 1 }, queue: { waiting: 0, active: 0, oldestWaitMs: 0, avgJobMs: null } });
+  checks.push(check('no mínimo não desce', floor.action === 'hold'));
+  return checks;
+}
+
+async function runQueueSignalsTest() {
+  const checks = [];
+  const now = 1_000_000;
+  const calls = [];
+  const queue = {
+    async getJobCounts(...types) {
+      calls.push(types.join(','));
+      return { waiting: 3, prioritized: 4, active: 2, delayed: 5 };
+    },
+    async getJobs(types, start, end, asc) {
+      calls.push(`${types.join(',')}:${start}-${end}:${asc}`);
+      if (types[0] === 'wait') return [{ timestamp: now - 12000 }];
+      if (types[0] === 'prioritized') return [{ timestamp: now - 3000 }, { timestamp: now - 45000 }];
+      return [
+        { processedOn: 100, finishedOn: 40100 },
+        { processedOn: 100, finishedOn: 20100 },
+        { processedOn: 100 }                      // sem finishedOn: ignorado
+      ];
+    }
+  };
+
+  const signals = await readQueueSignals(queue, { now, completedSample: 20 });
+  checks.push(check('waiting = wait + prioritized (delayed à parte)', signals.waiting === 7 && signals.delayed === 5 && signals.active === 2));
+  checks.push(check('mais antigo entre wait e prioritized', signals.oldestWaitMs === 45000, String(signals.oldestWaitMs)));
+  checks.push(check('duração média dos concluídos', signals.avgJobMs === 30000, String(signals.avgJobMs)));
+  checks.push(check('amostra de concluídos pedida ao BullMQ', calls.includes('completed:0-19:false'), calls.join(' | ')));
+
+  const empty = await readQueueSignals({
+    async getJobCounts() { return {}; },
+    async getJobs() { return []; }
+  }, { now });
+  checks.push(check('fila vazia', empty.waiting === 0 && empty.oldestWaitMs === 0 && empty.avgJobMs === null));
+
+  const host = createHostSampler();
+  await new Promise(resolve => setTimeout(resolve, 50));
+  const sample = host();
+  checks.push(check('amostra do host em [0, 1]', sample.cpu >= 0 && sample.cpu <= 1 && sample.memUsed > 0 && sample.memUsed < 1, JSON.stringify(sample)));
+  return checks;
+}
+
+/**
+ * Worker falso em processo real: responde ao IPC e drena no SIGTERM como o gracefulShutdown
+ */
+const FAKE_WORKER = `
+const concurrency = Number(process.env.FAKE_CONCURRENCY_ENV && process.env[process.env.FAKE_CONCURRENCY_ENV]);
+process.send({ type: 'boot', concurrency, port: process.env.PORT || null, pool: process.env.AUTOSCALE_POOL });
+process.on('message', msg => {
+  if (msg.type === 'scale') process.send({ type: 'scaled', concurrency: msg.concurrency });
+  if (msg.type === 'crash') process.exit(3);
+});
+process.on('SIGTERM', () => setTimeout(() => process.exit(0), 30));
+setInterval(() => {}, 1000);
+`;
+
+async function runWorkerPoolTest() {
+  const checks = [];
+  const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'autoscaler-tests-'));
+  const script = path.join(dir, 'fake-worker.cjs');
+  fs.writeFileSync(script, FAKE_WORKER);
+
+  const messages = [];
+  const pool = new WorkerPool('analysis', {
+    script,
+    concurrencyEnv: 'ANALYSIS_CONCURRENCY',
+    env: { FAKE_CONCURRENCY_ENV: 'ANALYSIS_CONCURRENCY' },
+    minProcesses: 1,
+    maxProcesses: 4,
+    minConcurrency: 1,
+    maxConcurrency: 6,
+    healthPort: true
+  }, { basePort: 9100, drainTimeoutMs: 5000 });
+
+  const wait = async (predicate, timeoutMs = 5000) => {
+    const start = Date.now();
+    while (!predicate()) {
+      if (Date.now() - start > timeoutMs) return false;
+      await new Promise(resolve => setTimeout(resolve, 20));
+    }
+    return true;
+  };
+  const watch = member => member.child.on('message', msg => messages.push({ slot: member.slot, ...msg }));
+
+  try {
+    pool.concurrency = 2;
+    pool.apply({ processes: 2, concurrency: 2 });
+    for (const member of pool.members.values()) watch(member);
+    await wait(() => messages.filter(m => m.type === 'boot').length === 2);
+    const boots = messages.filter(m => m.type === 'boot').sort((a, b) => a.slot - b.slot);
+    checks.push(check('fork com concorrência e PORT por slot no env', boots.length === 2 &&
+      boots.every(m => m.concurrency === 2 && m.pool === 'analysis') && boots[0].port === '9100' && boots[1].port === '9101',
+      JSON.stringify(boots)));
+
+    pool.apply({ processes: 2, concurrency: 5 });
+    await wait(() => messages.filter(m => m.type === 'scaled').length === 2);
+    checks.push(check('concorrência enviada por IPC a todos', messages.filter(m => m.type === 'scaled' && m.concurrency === 5).length === 2));
+
+    const oldest = pool.members.get(0);
+    const newest = pool.members.get(1);
+    pool.apply({ processes: 1, concurrency: 5 });
+    checks.push(check('processo drenando sai da contagem na hora', pool.processes === 1 && pool.draining === 1 && newest.draining && !oldest.draining));
+    await wait(() => pool.members.size === 1);
+    checks.push(check('mais novo drenado por SIGTERM e removido ao sair', pool.members.size === 1 && pool.members.has(0) &&
+      newest.child.exitCode === 0, `exit=${newest.child.exitCode}`));
+
+    // Crash fora de drenagem → recriado (backoff de 1s na 1ª vez)
+    oldest.child.send({ type: 'crash' });
+    const respawned = await wait(() => pool.members.size === 1 && pool.members.get(0)?.child.pid !== oldest.child.pid, 4000);
+    checks.push(check('processo que morreu sozinho é recriado', respawned && pool.restarts === 1 && pool.processes === 1));
+
+    await pool.stop();
+    checks.push(check('stop drena todos', pool.members.size === 0 && pool.status().processes === 0));
+  } finally {
+    for (const member of pool.members.values()) {
+      try { member.child.kill('SIGKILL'); } catch (_) {}
+    }
+    fs.rmSync(dir, { recursive: true, force: true });
+  }
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 AUTOSCALER TESTS\n');
+  reconfigureLogger({ level: 'error' });
+
+  const results = [];
+  results.push(await runAccuracyTest('Slots → processos × concorrência', runShapeTest));
+  results.push(await runAccuracyTest('Decisão (SLO, host, cooldowns)', runDecisionTest));
+  results.push(await runAccuracyTest('Sinais da fila e do host', runQueueSignalsTest));
+  results.push(await runAccuracyTest('WorkerPool com processos reais', runWorkerPoolTest));
+
+  reconfigureLogger();
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
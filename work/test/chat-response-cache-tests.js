@@ -0,0 +1,177 @@
+/**
+ * 🧪 CHAT RESPONSE CACHE TESTS
+ *
+ * Cache de respostas do chat (lib/ai/chat-response-cache.js) entre duas instâncias da API:
+ * - Stampede: a segunda instância espera o dono do lock e lê o resultado do Redis
+ * - Dono do lock falha: quem espera calcula assim que o lock é liberado (sem aguardar o TTL)
+ *
+ * As duas instâncias são o mesmo módulo importado duas vezes (URLs distintas) sobre um
+ * Redis em memória com os comandos usados pelo CacheManager.
+ *
+ * Uso: node test/chat-response-cache-tests.js
+ */
+
+import crypto from 'crypto';
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * Redis em memória: SET (EX/PX/NX), GET, EXISTS, DEL e o script de liberação do lock
+ */
+function createMemoryRedis() {
+  const store = new Map();
+  const alive = (key) => {
+    const entry = store.get(key);
+    if (entry && entry.expiresAt <= Date.now()) store.delete(key);
+    return store.get(key);
+  };
+  return {
+    async set(key, value, ...args) {
+      const nx = args.includes('NX');
+      if (nx && alive(key)) return null;
+      const px = args.includes('PX') ? args[args.indexOf('PX') + 1] : null;
+      const ex = args.includes('EX') ? args[args.indexOf('EX') + 1] * 1000 : null;
+      store.set(key, { value, expiresAt: Date.now() + (px ?? ex ?? Infinity) });
+      return 'OK';
+    },
+    async getBuffer(key) {
+      return alive(key)?.value ?? null;
+    },
+    async get(key) {
+      return alive(key)?.value ?? null;
+    },
+    async exists(key) {
+      return alive(key) ? 1 : 0;
+    },
+    async del(key) {
+      return store.delete(key) ? 1 : 0;
+    },
+    async eval(_script, _numKeys, key, token) {
+      if (alive(key)?.value !== token) return 0;
+      store.delete(key);
+      return 1;
+    }
+  };
+}
+
+async function loadInstances() {
+  const redis = createMemoryRedis();
+  const url = new URL('../lib/ai/chat-response-cache.js', import.meta.url).href;
+  const a = await import(`${url}?instance=a`);
+  const b = await import(`${url}?instance=b`);
+  for (const instance of [a, b]) {
+    instance.configureChatCache({ redisClient: redis, lockPollMs: 20 });
+  }
+  return { a, b };
+}
+
+function uniqueKey(label) {
+  return crypto.createHash('sha256').update(`${label}-${Math.random()}`).digest('hex');
+}
+
+async function runSharedResultTest() {
+  const checks = [];
+  const { a, b } = await loadInstances();
+  const key = uniqueKey('shared');
+  let calls = 0;
+
+  const owner = a.getOrComputeChatResponse(key, async () => {
+    calls++;
+    await sleep(150);
+    return 'resposta do dono';
+  }, { requestTimeoutMs: 5000 });
+  await sleep(20);
+  const waiter = await b.getOrComputeChatResponse(key, async () => {
+    calls++;
+    return 'resposta duplicada';
+  }, { requestTimeoutMs: 5000 });
+
+  checks.push(check('dono calcula', (await owner).value === 'resposta do dono'));
+  checks.push(check('segunda instância lê do Redis', waiter.value === 'resposta do dono' && waiter.source === 'redis',
+    JSON.stringify(waiter)));
+  checks.push(check('OpenAI chamada uma vez', calls === 1, String(calls)));
+  return checks;
+}
+
+async function runOwnerFailureTest() {
+  const checks = [];
+  const { a, b } = await loadInstances();
+  const key = uniqueKey('failure');
+  const requestTimeoutMs = 5000;
+  let releasedAt = null;
+
+  const owner = a.getOrComputeChatResponse(key, async () => {
+    await sleep(150);
+    throw new Error('OpenAI timeout');
+  }, { requestTimeoutMs }).catch(err => {
+    releasedAt = Date.now();
+    return err;
+  });
+  await sleep(20);
+
+  const started = Date.now();
+  let computedAt = null;
+  const waiter = await b.getOrComputeChatResponse(key, async () => {
+    computedAt = Date.now();
+    return 'resposta da segunda instância';
+  }, { requestTimeoutMs });
+  const ownerError = await owner;
+
+  checks.push(check('erro do dono propagado', ownerError instanceof Error && ownerError.message === 'OpenAI timeout'));
+  checks.push(check('quem espera calcula', waiter.value === 'resposta da segunda instância' && waiter.source === null,
+    JSON.stringify(waiter)));
+  checks.push(check('calcula logo após o lock ser liberado (sem esperar o TTL)',
+    computedAt !== null && releasedAt !== null && computedAt - releasedAt < 200 && Date.now() - started < requestTimeoutMs,
+    `${computedAt - releasedAt}ms após a liberação, ${Date.now() - started}ms no total`));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 CHAT RESPONSE CACHE TESTS\n');
+
+  const results = [];
+  results.push(await runAccuracyTest('Resultado compartilhado entre instâncias', runSharedResultTest));
+  results.push(await runAccuracyTest('Dono do lock falha: espera termina com o lock', runOwnerFailureTest));
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
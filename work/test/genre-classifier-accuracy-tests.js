@@ -0,0 +1,178 @@
+/**
+ * 🧪 GENRE CLASSIFIER ACCURACY TESTS
+ *
+ * Valida o classificador de gênero (lib/audio/features/genre-classifier.js) sobre a tabela
+ * pré-computada refs/genre-centroids.json:
+ * - análise sintética no centróide de cada gênero (+ ruído dentro da tolerância) → gênero no top-3
+ * - acurácia top-1 mínima sobre todos os gêneros
+ * - confianças ordenadas e somando ≤ 1
+ * - tabela gerada dos refs em memória == tabela em disco (centróides)
+ * - poucas features → null (não classifica)
+ *
+ * Uso: node test/genre-classifier-accuracy-tests.js
+ */
+
+import {
+  classifyGenre,
+  loadCentroidTable,
+  buildCentroidTable,
+  GENRE_CLASSIFIER_CONFIG
+} from '../lib/audio/features/genre-classifier.js';
+
+const MIN_TOP1_ACCURACY = 0.8;
+const TRIALS_PER_GENRE = 20;
+const NOISE_FRACTION = 0.3; // ruído em frações da tolerância de cada feature
+
+function createRandom(seed) {
+  let state = seed;
+  return () => {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    return state / 0x7fffffff;
+  };
+}
+
+/**
+ * technicalData sintético (mesmo formato do json-output) a partir de um vetor de features
+ */
+function toTechnicalData(features) {
+  const spectral_balance = {};
+  for (const band of ['sub', 'bass', 'lowMid', 'mid', 'highMid', 'presence', 'air']) {
+    if (features[band] !== undefined) spectral_balance[band] = { energy_db: features[band] };
+  }
+  return {
+    spectral_balance,
+    lufsIntegrated: features.lufs,
+    dynamicRange: features.dr,
+    stereoCorrelation: features.stereo,
+    lra: features.lra
+  };
+}
+
+function sampleAround({ mean, spread }, random, fraction) {
+  const features = {};
+  for (const [feature, value] of Object.entries(mean)) {
+    features[feature] = value + (random() * 2 - 1) * fraction * (spread[feature] || 1);
+  }
+  return features;
+}
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Acurácia top-1 / top-3 sobre todos os gêneros da tabela
+ */
+function runAccuracyTest() {
+  const table = loadCentroidTable();
+  const random = createRandom(7);
+  let top1 = 0;
+  let top3 = 0;
+  let total = 0;
+  const misses = [];
+
+  for (const [genre, centroid] of Object.entries(table.genres)) {
+    for (let t = 0; t < TRIALS_PER_GENRE; t++) {
+      const result = classifyGenre(toTechnicalData(sampleAround(centroid, random, NOISE_FRACTION)), { table });
+      total++;
+      if (result?.top[0]?.genre === genre) top1++;
+      if (result?.top.some(g => g.genre === genre)) top3++;
+      else if (!misses.includes(genre)) misses.push(genre);
+    }
+  }
+
+  const top1Accuracy = top1 / total;
+  const top3Accuracy = top3 / total;
+  return {
+    label: `acurácia (${Object.keys(table.genres).length} gêneros × ${TRIALS_PER_GENRE})`,
+    checks: [
+      check(`top-1 >= ${MIN_TOP1_ACCURACY}`, top1Accuracy >= MIN_TOP1_ACCURACY, top1Accuracy.toFixed(3)),
+      check('top-3 contém o gênero', top3Accuracy === 1, `${top3Accuracy.toFixed(3)}${misses.length ? ` (falhas: ${misses.join(', ')})` : ''}`)
+    ]
+  };
+}
+
+/**
+ * Formato da resposta e confianças
+ */
+function runOutputShapeTest() {
+  const table = loadCentroidTable();
+  const [genre, centroid] = Object.entries(table.genres)[0];
+  const result = classifyGenre(toTechnicalData(centroid.mean), { table });
+  const confidences = result?.top.map(g => g.confidence) || [];
+  const sum = confidences.reduce((acc, c) => acc + c, 0);
+
+  return {
+    label: 'formato da resposta',
+    checks: [
+      check(`top-${GENRE_CLASSIFIER_CONFIG.TOP_K}`, result?.top.length === Math.min(GENRE_CLASSIFIER_CONFIG.TOP_K, Object.keys(table.genres).length)),
+      check('centróide exato → top-1', result?.top[0].genre === genre, result?.top[0].genre),
+      check('confianças ordenadas', confidences.every((c, i) => i === 0 || confidences[i - 1] >= c), confidences.join(' / ')),
+      check('soma das confianças <= 1', sum <= 1.0005, sum.toFixed(3)),
+      check('featuresUsed + tableVersion', result?.featuresUsed.length >= GENRE_CLASSIFIER_CONFIG.MIN_FEATURES && result?.tableVersion === table.version)
+    ]
+  };
+}
+
+/**
+ * Tabela em disco em dia com os refs + casos degenerados
+ */
+function runTableAndEdgeCasesTest() {
+  const onDisk = loadCentroidTable();
+  const rebuilt = buildCentroidTable();
+  const sameGenres = Object.keys(rebuilt.genres).every(g => onDisk.genres[g]);
+  const sameBands = Object.entries(rebuilt.genres).every(([g, { mean }]) =>
+    ['sub', 'mid', 'air'].every(band => mean[band] === onDisk.genres[g]?.mean[band])
+  );
+
+  const sparse = classifyGenre({ spectral_balance: { sub: { energy_db: -20 } }, lufsIntegrated: -10 });
+  const empty = classifyGenre({});
+  const nulls = classifyGenre({ spectral_balance: { sub: { energy_db: null }, bass: { energy_db: null } }, lufsIntegrated: NaN });
+
+  return {
+    label: 'tabela + casos degenerados',
+    checks: [
+      check('refs/out (worker) coberto pela tabela', sameGenres && sameBands, `${Object.keys(rebuilt.genres).length} gêneros`),
+      check('poucas features → null', sparse === null),
+      check('technicalData vazio → null', empty === null),
+      check('null/NaN ignorados', nulls === null)
+    ]
+  };
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 GENRE CLASSIFIER ACCURACY TESTS\n');
+
+  const results = [
+    runAccuracyTest(),
+    runOutputShapeTest(),
+    runTableAndEdgeCasesTest()
+  ].map(result => ({ ...result, passed: result.checks.every(c => c.passed) }));
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks) {
+      if (!c.passed) console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+      else if (c.detail) console.log(`   · ${c.name}: ${c.detail}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} testes passaram`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
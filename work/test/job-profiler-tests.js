@@ -0,0 +1,269 @@
+/**
+ * 🧪 JOB PROFILER TESTS
+ *
+ * Profiling por estágio dos jobs de análise (lib/job-profiler.js):
+ * - Seleção: PROFILE_JOB_IDS por prefixo e PROFILE_SAMPLE_RATE
+ * - Estágios: wall/CPU/heap/arrayBuffers por estágio, síncronos e async, aninhados, somados por nome
+ * - GC: pausas atribuídas ao estágio em que aconteceram
+ * - Falhas: estágio aberto sai como aborted, erro propagado sem perder o estágio
+ * - Artefatos: .cpuprofile/heap snapshot só acima do limiar do orquestrador
+ * - Agregação: p50/p95 por estágio, top N mais lentos e limpeza dos artefatos que saem dele
+ *
+ * Uso: node test/job-profiler-tests.js
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import {
+  configureJobProfiler,
+  shouldProfileJob,
+  startJobProfile,
+  profileStage,
+  startProfileStage,
+  getActiveJobProfile,
+  recordJobProfile,
+  getProfilingAggregates,
+  getProfileKeepThreshold,
+  resetProfilingAggregates
+} from '../lib/job-profiler.js';
+import { reconfigureLogger } from '../lib/logger.js';
+
+const TMP_DIR = fs.mkdtempSync(path.join(os.tmpdir(), 'job-profiler-tests-'));
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+function busy(ms) {
+  const end = Date.now() + ms;
+  let x = 0;
+  while (Date.now() < end) x += Math.sqrt(x + 1);
+  return x;
+}
+
+function churn(objects) {
+  // Lixo de vida curta: força scavenges do GC
+  let last = null;
+  for (let i = 0; i < objects; i++) last = { i, payload: new Array(16).fill(i) };
+  return last;
+}
+
+async function runSelectionTest() {
+  const checks = [];
+  configureJobProfiler({ JOB_IDS: ['3f2a9c1b'], SAMPLE_RATE: 0 });
+  checks.push(check('prefixo de jobId seleciona', shouldProfileJob('3f2a9c1b-0000-4000-8000-000000000000')));
+  checks.push(check('outro jobId não é selecionado sem amostragem', !shouldProfileJob('77aa0000-0000')));
+  checks.push(check('job não selecionado não cria perfil', (await startJobProfile('77aa0000-0000')) === null));
+
+  configureJobProfiler({ JOB_IDS: [], SAMPLE_RATE: 0.25 });
+  checks.push(check('amostragem abaixo da taxa', shouldProfileJob('x', () => 0.1) && !shouldProfileJob('x', () => 0.3)));
+  configureJobProfiler({ JOB_IDS: [], SAMPLE_RATE: 7 });
+  checks.push(check('taxa limitada a 1', shouldProfileJob('x', () => 0.999)));
+  configureJobProfiler({ JOB_IDS: [], SAMPLE_RATE: 0 });
+  return checks;
+}
+
+async function runStagesTest() {
+  const checks = [];
+  const outside = profileStage('decode', () => 42);
+  checks.push(check('sem perfil ativo profileStage só executa', outside === 42 && getActiveJobProfile() === null &&
+    typeof startProfileStage('x') === 'function'));
+
+  const profile = await startJobProfile('job-stages', { force: true });
+  const result = await profile.run(async () => {
+    const endDecode = startProfileStage('decode');
+    const pcm = new Float32Array(8 * 1024 * 1024);   // 32MB fora do heap (arrayBuffers)
+    pcm[0] = 1;
+    endDecode();
+    endDecode();                                     // idempotente
+
+    profileStage('segmentation', () => busy(30));
+    const metrics = await profileStage('core_metrics', async () => {
+      const lufs = await profileStage('metrics:lufs', async () => { busy(10); return -14; });
+      await profileStage('metrics:lufs', async () => busy(5));
+      return { lufs, active: getActiveJobProfile() === profile };
+    });
+    return { pcm, metrics };
+  });
+  const summary = await profile.finish();
+  const stage = name => summary.stages.find(s => s.name === name);
+
+  checks.push(check('resultado de run/profileStage preservado', result.metrics.lufs === -14 && result.metrics.active));
+  checks.push(check('estágios na ordem de abertura', summary.stages.map(s => s.name).join(',') === 'decode,segmentation,core_metrics,metrics:lufs',
+    summary.stages.map(s => s.name).join(',')));
+  checks.push(check('arrayBuffers do decode medido', stage('decode').arrayBuffersDeltaMB >= 30, JSON.stringify(stage('decode'))));
+  checks.push(check('wall e CPU do estágio síncrono', stage('segmentation').wallMs >= 29 && stage('segmentation').cpuUserMs + stage('segmentation').cpuSystemMs >= 15,
+    JSON.stringify(stage('segmentation'))));
+  checks.push(check('mesmo nome somado em calls', stage('metrics:lufs').calls === 2 && stage('metrics:lufs').wallMs >= 14));
+  checks.push(check('estágio pai inclui os filhos', stage('core_metrics').wallMs >= stage('metrics:lufs').wallMs));
+  checks.push(check('resumo do job', summary.jobId === 'job-stages' && summary.status === 'completed' &&
+    summary.totalMs >= 45 && summary.peakHeapUsedMB > 0 && Object.keys(summary.artifacts).length === 0));
+  checks.push(check('finish idempotente e serializável', (await profile.finish()) === summary &&
+    JSON.parse(JSON.stringify(summary)).stages.length === 4));
+  return checks;
+}
+
+async function runGCTest() {
+  const checks = [];
+  const profile = await startJobProfile('job-gc', { force: true });
+  await profile.run(async () => {
+    profileStage('idle', () => busy(5));
+    profileStage('allocations', () => churn(400000));
+  });
+  const summary = await profile.finish();
+  const allocations = summary.stages.find(s => s.name === 'allocations');
+
+  checks.push(check('pausas de GC registradas no job', summary.gc.count > 0 && summary.gc.pauseMs > 0, JSON.stringify(summary.gc)));
+  checks.push(check('GC atribuído ao estágio que alocou', allocations.gcCount > 0 && allocations.gcPauseMs > 0, JSON.stringify(allocations)));
+  return checks;
+}
+
+async function runFailureTest() {
+  const checks = [];
+  const profile = await startJobProfile('job-failed', { force: true });
+  let caught = null;
+  try {
+    await profile.run(async () => {
+      startProfileStage('decode');                   // nunca fechado: o job falha no meio
+      await profileStage('ai', async () => { throw new Error('openai timeout'); });
+    });
+  } catch (error) {
+    caught = error;
+  }
+  const summary = await profile.finish({ status: 'failed' });
+  const decode = summary.stages.find(s => s.name === 'decode');
+  const ai = summary.stages.find(s => s.name === 'ai');
+
+  checks.push(check('erro do estágio propagado', caught?.message === 'openai timeout'));
+  checks.push(check('estágio com erro fechado normalmente', ai && !ai.aborted && ai.calls === 1));
+  checks.push(check('estágio aberto sai como aborted', decode?.aborted === true && summary.status === 'failed'));
+  return checks;
+}
+
+async function runArtifactsTest() {
+  const checks = [];
+  configureJobProfiler({ CPU_PROFILE: true, HEAP_SNAPSHOT: true, DIR: TMP_DIR });
+
+  const slow = await startJobProfile('job-slow', { force: true, keepAboveMs: 0 });
+  await slow.run(async () => profileStage('metrics:fft', () => busy(20)));
+  const kept = await slow.finish();
+
+  const fast = await startJobProfile('job-fast', { force: true, keepAboveMs: 60000 });
+  await fast.run(async () => profileStage('metrics:fft', () => busy(5)));
+  const skipped = await fast.finish();
+  configureJobProfiler({ CPU_PROFILE: false, HEAP_SNAPSHOT: false, DIR: TMP_DIR });
+
+  let cpuProfile = null;
+  try {
+    cpuProfile = JSON.parse(fs.readFileSync(kept.artifacts.cpuProfile, 'utf8'));
+  } catch (_) {}
+  checks.push(check('.cpuprofile gravado acima do limiar', Array.isArray(cpuProfile?.nodes) && cpuProfile.nodes.length > 0 &&
+    kept.artifacts.cpuProfile.startsWith(TMP_DIR), JSON.stringify(kept.artifacts)));
+  checks.push(check('heap snapshot gravado acima do limiar', !!kept.artifacts.heapSnapshot && fs.statSync(kept.artifacts.heapSnapshot).size > 0));
+  checks.push(check('abaixo do limiar nada é gravado', Object.keys(skipped.artifacts).length === 0 &&
+    fs.readdirSync(TMP_DIR).every(file => !file.startsWith('job-fast'))));
+  return checks;
+}
+
+async function runAggregationTest() {
+  const checks = [];
+  configureJobProfiler({ KEEP_SLOWEST: 2, DIR: TMP_DIR });
+  resetProfilingAggregates();
+
+  const artifact = name => {
+    const file = path.join(TMP_DIR, name);
+    fs.writeFileSync(file, '{}');
+    return file;
+  };
+  const summary = (jobId, totalMs, decodeMs, artifacts = {}) => ({
+    jobId,
+    status: 'completed',
+    totalMs,
+    stages: [
+      { name: 'decode', calls: 1, wallMs: decodeMs, cpuUserMs: decodeMs / 2, cpuSystemMs: 0, heapDeltaMB: 4, gcPauseMs: 1 },
+      { name: 'ai', calls: 1, wallMs: totalMs - decodeMs, cpuUserMs: 1, cpuSystemMs: 0, heapDeltaMB: 0, gcPauseMs: 0, aborted: jobId === 'c' }
+    ],
+    artifacts
+  });
+
+  checks.push(check('limiar 0 com o top N vazio', getProfileKeepThreshold() === 0));
+  recordJobProfile(summary('a', 1000, 100, { cpuProfile: artifact('a.cpuprofile') }));
+  recordJobProfile(summary('b', 3000, 300, { cpuProfile: artifact('b.cpuprofile') }));
+  checks.push(check('limiar = N-ésimo mais lento', getProfileKeepThreshold() === 1000));
+  recordJobProfile(summary('c', 2000, 200, { cpuProfile: artifact('c.cpuprofile') }));
+  recordJobProfile(null);
+
+  // unlink é assíncrono
+  await new Promise(resolve => setTimeout(resolve, 50));
+  const aggregates = getProfilingAggregates();
+
+  checks.push(check('top N em ordem decrescente', aggregates.slowest.map(s => s.jobId).join(',') === 'b,c' && getProfileKeepThreshold() === 2000,
+    JSON.stringify(aggregates.slowest)));
+  checks.push(check('artefatos de quem saiu do top N apagados', !fs.existsSync(path.join(TMP_DIR, 'a.cpuprofile')) &&
+    fs.existsSync(path.join(TMP_DIR, 'b.cpuprofile')) && fs.existsSync(path.join(TMP_DIR, 'c.cpuprofile'))));
+  checks.push(check('percentis por estágio', aggregates.jobs === 3 && aggregates.stages.decode.count === 3 &&
+    aggregates.stages.decode.wallMs.p50 === 200 && aggregates.stages.decode.wallMs.max === 300 &&
+    aggregates.stages.decode.cpuMsMean === 100 && aggregates.totalMs.p50 === 2000, JSON.stringify(aggregates.stages.decode)));
+  checks.push(check('aborted contado', aggregates.stages.ai.aborted === 1 && aggregates.stages.decode.aborted === 0));
+
+  configureJobProfiler({ KEEP_SLOWEST: 0 });
+  checks.push(check('KEEP_SLOWEST=0 desliga artefatos', getProfileKeepThreshold() === Infinity));
+  resetProfilingAggregates();
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 JOB PROFILER TESTS\n');
+  reconfigureLogger({ level: 'warn' });
+
+  const results = [];
+  results.push(await runAccuracyTest('Seleção (PROFILE_JOB_IDS / PROFILE_SAMPLE_RATE)', runSelectionTest));
+  results.push(await runAccuracyTest('Estágios: wall, CPU, heap, arrayBuffers', runStagesTest));
+  results.push(await runAccuracyTest('Pausas de GC por estágio', runGCTest));
+  results.push(await runAccuracyTest('Job com falha', runFailureTest));
+  results.push(await runAccuracyTest('Artefatos acima do limiar', runArtifactsTest));
+  results.push(await runAccuracyTest('Agregação no orquestrador', runAggregationTest));
+
+  reconfigureLogger();
+  configureJobProfiler();
+  fs.rmSync(TMP_DIR, { recursive: true, force: true });
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
@@ -0,0 +1,227 @@
+/**
+ * 🧪 LOGGER TESTS
+ *
+ * Logger com níveis (lib/logger.js) usado pelos módulos de áudio e pelo worker:
+ * - Níveis: chamadas abaixo do nível não avaliam o thunk (nada de JSON.stringify em produção)
+ * - Escopos: LOG_DEBUG/LOG_TRACE elevam só os módulos pedidos, inclusive loggers já criados
+ * - Amostragem: sampled(n) emite a 1ª chamada e depois 1 a cada n
+ * - Saída JSON por linha (LOG_FORMAT=json) e logAudio/logAudioFrame do pipeline
+ *
+ * Uso: node test/logger-tests.js
+ */
+
+import { createLogger, reconfigureLogger, LOG_LEVELS } from '../lib/logger.js';
+import { logAudio, logAudioFrame } from '../lib/audio/error-handling.js';
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Captura o que o logger escreveria (console no modo legível, stdout/stderr no modo JSON)
+ */
+function capture(fn) {
+  const lines = [];
+  const { log, warn, error } = console;
+  const stdoutWrite = process.stdout.write;
+  const stderrWrite = process.stderr.write;
+  console.log = (...args) => lines.push({ stream: 'log', args });
+  console.warn = (...args) => lines.push({ stream: 'warn', args });
+  console.error = (...args) => lines.push({ stream: 'error', args });
+  process.stdout.write = (chunk) => lines.push({ stream: 'stdout', line: String(chunk) }) > 0;
+  process.stderr.write = (chunk) => lines.push({ stream: 'stderr', line: String(chunk) }) > 0;
+  try {
+    fn();
+  } finally {
+    Object.assign(console, { log, warn, error });
+    process.stdout.write = stdoutWrite;
+    process.stderr.write = stderrWrite;
+  }
+  return lines;
+}
+
+function runLevelsTest() {
+  const checks = [];
+  reconfigureLogger({ level: 'info', format: 'pretty', debugScopes: [], traceScopes: [] });
+  const logger = createLogger('test:levels');
+
+  let evaluated = 0;
+  const lines = capture(() => {
+    logger.debug(() => { evaluated++; return ['nunca', JSON.stringify({ big: true })]; });
+    logger.trace(() => { evaluated++; return 'nunca'; });
+    logger.info('info', 1);
+    logger.warn('warn');
+    logger.error('error');
+  });
+
+  checks.push(check('thunk abaixo do nível não é avaliado', evaluated === 0, `avaliados=${evaluated}`));
+  checks.push(check('info/warn/error emitidos no console equivalente', lines.length === 3 &&
+    lines[0].stream === 'log' && lines[0].args[1] === 1 && lines[1].stream === 'warn' && lines[2].stream === 'error',
+    JSON.stringify(lines)));
+  checks.push(check('flags de nível', logger.infoEnabled && !logger.debugEnabled && !logger.traceEnabled &&
+    logger.isEnabled('warn') && !logger.isEnabled('debug')));
+
+  reconfigureLogger({ level: 'trace' });
+  const traced = capture(() => {
+    logger.trace(() => [`frame ${7}`, { energy: 0.5 }]);
+    logger.debug(() => 'texto único');
+  });
+  checks.push(check('reconfigure atualiza logger existente', logger.traceEnabled && traced.length === 2));
+  checks.push(check('thunk: array espalhado, valor único como argumento', traced[0].args[0] === 'frame 7' &&
+    traced[0].args[1].energy === 0.5 && traced[1].args.length === 1 && traced[1].args[0] === 'texto único',
+    JSON.stringify(traced)));
+
+  reconfigureLogger({ level: 'silent' });
+  checks.push(check('silent desliga error', capture(() => logger.error('x')).length === 0 && LOG_LEVELS.silent === 0));
+  return checks;
+}
+
+function runScopesTest() {
+  const checks = [];
+  const decode = createLogger('audio:decode');
+  const worker = createLogger('worker');
+  reconfigureLogger({ level: 'info', format: 'pretty', debugScopes: ['audio:*'], traceScopes: ['audio:loudness'] });
+  const loudness = createLogger('audio:loudness');
+
+  checks.push(check('LOG_DEBUG com prefixo eleva loggers já criados', decode.debugEnabled && !decode.traceEnabled));
+  checks.push(check('escopo fora do padrão fica no nível global', worker.infoEnabled && !worker.debugEnabled));
+  checks.push(check('LOG_TRACE com escopo exato', loudness.traceEnabled));
+  checks.push(check('child herda o prefixo do escopo', decode.child('wav').debugEnabled && decode.child('wav').scope === 'audio:decode:wav'));
+
+  reconfigureLogger({ level: 'warn', debugScopes: [], traceScopes: [] });
+  checks.push(check('escopos removidos voltam ao nível global', !decode.debugEnabled && !decode.infoEnabled && decode.warnEnabled));
+  return checks;
+}
+
+function runSamplingTest() {
+  const checks = [];
+  reconfigureLogger({ level: 'debug', format: 'pretty', debugScopes: [], traceScopes: [] });
+  const frames = createLogger('test:frames').sampled(3);
+
+  const emitted = capture(() => {
+    for (let i = 0; i < 7; i++) frames.debug(() => `frame ${i}`);
+  }).map(line => line.args[0]);
+  checks.push(check('1ª chamada e depois 1 a cada N', emitted.join(',') === 'frame 0,frame 3,frame 6', emitted.join(',')));
+
+  // trace desligado: chamadas não contam para a amostragem
+  const traced = createLogger('test:traced').sampled(2);
+  capture(() => { for (let i = 0; i < 5; i++) traced.trace('x'); });
+  reconfigureLogger({ level: 'trace' });
+  const after = capture(() => { traced.trace('a'); traced.trace('b'); traced.trace('c'); }).map(line => line.args[0]);
+  checks.push(check('chamadas abaixo do nível não avançam o contador', after.join(',') === 'a,c', after.join(',')));
+
+  const infoAlways = capture(() => { for (let i = 0; i < 4; i++) frames.info('i'); });
+  checks.push(check('info/warn/error nunca são amostrados', infoAlways.length === 4));
+  return checks;
+}
+
+function runJSONTest() {
+  const checks = [];
+  reconfigureLogger({ level: 'debug', format: 'json', debugScopes: [], traceScopes: [] });
+  const logger = createLogger('worker');
+  const circular = { name: 'job' };
+  circular.self = circular;
+
+  const lines = capture(() => {
+    logger.info('[WORKER] job %s em %dms', 'abc', 42, { pid: 10 });
+    logger.error('[WORKER] falhou:', new Error('boom'));
+    logger.debug(() => ['[TRACE] estado', circular]);
+    logger.sampled(5).debug('amostrado');
+  });
+  const records = lines.map(line => JSON.parse(line.line));
+
+  checks.push(check('uma linha JSON por chamada', lines.length === 4 && lines.every(line => line.line.endsWith('\n'))));
+  checks.push(check('msg formatada e objetos em data', records[0].msg === '[WORKER] job abc em 42ms' &&
+    records[0].data.pid === 10 && records[0].level === 'info' && records[0].scope === 'worker' && !Number.isNaN(Date.parse(records[0].ts)),
+    JSON.stringify(records[0])));
+  checks.push(check('error vai para stderr com Error serializado', lines[1].stream === 'stderr' &&
+    records[1].data.message === 'boom' && typeof records[1].data.stack === 'string'));
+  checks.push(check('estrutura circular não derruba o log', records[2].level === 'debug' && records[2].msg.includes('[TRACE] estado'),
+    JSON.stringify(records[2])));
+  checks.push(check('amostragem registrada no JSON', records[3].sampleEvery === 5));
+  return checks;
+}
+
+function runAudioLogTest() {
+  const checks = [];
+  reconfigureLogger({ level: 'info', format: 'pretty', debugScopes: [], traceScopes: [] });
+
+  let built = 0;
+  const production = capture(() => {
+    logAudio('decode', 'start', { fileName: 'faixa.wav', jobId: 'j1' });
+    logAudio('decode', 'done', { ms: 12, meta: { channels: 2 } });
+    logAudio('spectral_bands', 'init', { bands: 7 });
+    logAudio('core_metrics', 'fft_timeout', { frame: 3 });
+    for (let i = 0; i < 1000; i++) logAudioFrame('spectral_bands', 'calculated', () => ({ frame: i, built: ++built }));
+  }).map(line => `${line.stream}:${line.args[0]}`);
+
+  checks.push(check('produção: start/done em info, ações de falha em warn', production.length === 3 &&
+    production[0] === 'log:[AUDIO] start stage=decode file=faixa.wav jobId=j1' &&
+    production[1] === 'log:[AUDIO] done stage=decode ms=12 meta={"channels":2}' &&
+    production[2] === 'warn:[AUDIO] fft_timeout stage=core_metrics {"frame":3}', production.join(' | ')));
+  checks.push(check('logAudioFrame desligado não monta os dados', built === 0));
+
+  reconfigureLogger({ level: 'trace' });
+  const traced = capture(() => {
+    for (let i = 0; i < 450; i++) {
+      logAudioFrame('spectral', 'centroid_calculated', () => ({ frame: i }));
+      logAudioFrame('spectral', 'rolloff_calculated', () => ({ frame: i }));
+    }
+  }).map(line => line.args[0]);
+  checks.push(check('logAudioFrame amostrado por stage+ação', traced.length === 6 &&
+    traced.filter(line => line.includes('rolloff_calculated')).length === 3 &&
+    traced[traced.length - 1] === '[AUDIO] rolloff_calculated stage=spectral {"frame":400}', traced.join(' | ')));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 LOGGER TESTS\n');
+
+  const results = [];
+  results.push(await runAccuracyTest('Níveis e thunks', runLevelsTest));
+  results.push(await runAccuracyTest('Escopos (LOG_DEBUG / LOG_TRACE)', runScopesTest));
+  results.push(await runAccuracyTest('Amostragem', runSamplingTest));
+  results.push(await runAccuracyTest('Saída JSON', runJSONTest));
+  results.push(await runAccuracyTest('logAudio / logAudioFrame', runAudioLogTest));
+
+  // Volta à configuração do ambiente para o resumo
+  reconfigureLogger();
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
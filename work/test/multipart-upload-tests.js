@@ -0,0 +1,192 @@
+/**
+ * 🧪 MULTIPART UPLOAD TESTS
+ *
+ * Fluxo completo do upload multipart pré-assinado contra o stand-in S3-compatível local
+ * (lib/uploads/localObjectStore.js), com PUTs HTTP reais como o navegador faz:
+ * - start → PUT das partes (em paralelo, fora de ordem) → complete → objeto idêntico
+ * - Retomada: só as partes que faltam recebem URL; complete incompleto é recusado
+ * - Tamanho divergente depois do complete: SIZE_MISMATCH e o objeto montado é removido
+ * - URL adulterada → 403; cancelamento → UPLOAD_NOT_FOUND; limites de tamanho/extensão
+ *
+ * Uso: node test/multipart-upload-tests.js
+ */
+
+import os from 'os';
+import path from 'path';
+import crypto from 'crypto';
+import { readFile, rm } from 'fs/promises';
+import { createLocalObjectStore } from '../lib/uploads/localObjectStore.js';
+import {
+  MULTIPART_CONFIG,
+  planParts,
+  startMultipartUpload,
+  resumeMultipartUpload,
+  completeMultipartUpload,
+  abortMultipartUpload
+} from '../lib/uploads/multipartUploads.js';
+
+const ROOT_DIR = path.join(os.tmpdir(), `soundyai-multipart-test-${process.pid}`);
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+function makeFile(size, seed) {
+  const file = Buffer.alloc(size);
+  let state = seed;
+  for (let i = 0; i < size; i += 4) {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    file.writeUInt32LE(state, Math.min(i, size - 4));
+  }
+  return file;
+}
+
+async function putPart(url, file, partNumber, partSize) {
+  const start = (partNumber - 1) * partSize;
+  return fetch(url, { method: 'PUT', body: file.subarray(start, start + partSize) });
+}
+
+async function runRoundTripTest(store) {
+  const checks = [];
+  const file = makeFile(21 * 1024 * 1024 + 123, 3); // 3 partes de 8MB (última menor)
+
+  const started = await startMultipartUpload(store, { ext: 'wav', contentType: 'audio/wav', size: file.length });
+  checks.push(check('start: 3 partes assinadas', started.success && started.partCount === 3 && started.parts.length === 3,
+    JSON.stringify({ partCount: started.partCount, error: started.error })));
+  checks.push(check('start: fileKey no padrão uploads/audio_*', /^uploads\/audio_\d+_[a-f0-9]+\.wav$/.test(started.fileKey || '')));
+
+  // Fora de ordem e em paralelo, como o uploader do navegador
+  const responses = await Promise.all(started.parts.slice().reverse()
+    .map(p => putPart(p.url, file, p.partNumber, started.partSize)));
+  checks.push(check('PUT das partes: 200 + ETag exposto', responses.every(r => r.ok && r.headers.get('etag'))));
+
+  const completed = await completeMultipartUpload(store, { fileKey: started.fileKey, uploadId: started.uploadId, size: file.length });
+  checks.push(check('complete: sucesso com tamanho conferido', completed.success && completed.size === file.length, completed.error));
+
+  const stored = await readFile(path.join(ROOT_DIR, 'objects', started.fileKey));
+  checks.push(check('objeto final idêntico ao arquivo', stored.equals(file)));
+  return checks;
+}
+
+async function runResumeTest(store) {
+  const checks = [];
+  const file = makeFile(17 * 1024 * 1024, 5);
+
+  const started = await startMultipartUpload(store, { ext: 'mp3', contentType: 'audio/mpeg', size: file.length });
+  await putPart(started.parts[0].url, file, 1, started.partSize);
+
+  const incomplete = await completeMultipartUpload(store, { fileKey: started.fileKey, uploadId: started.uploadId, size: file.length });
+  checks.push(check('complete incompleto → INCOMPLETE_UPLOAD', incomplete.error === 'INCOMPLETE_UPLOAD' &&
+    JSON.stringify(incomplete.missingParts) === '[2,3]', JSON.stringify(incomplete)));
+
+  // "Recarregou a página": só as partes 2 e 3 recebem URL nova
+  const resumed = await resumeMultipartUpload(store, { fileKey: started.fileKey, uploadId: started.uploadId, size: file.length });
+  checks.push(check('retomada: parte 1 já recebida, URLs só para 2 e 3', resumed.success &&
+    JSON.stringify(resumed.uploadedParts) === '[1]' &&
+    JSON.stringify(resumed.parts.map(p => p.partNumber)) === '[2,3]'));
+
+  await Promise.all(resumed.parts.map(p => putPart(p.url, file, p.partNumber, resumed.partSize)));
+  const completed = await completeMultipartUpload(store, { fileKey: started.fileKey, uploadId: started.uploadId, size: file.length });
+  const stored = await readFile(path.join(ROOT_DIR, 'objects', started.fileKey));
+  checks.push(check('retomada: objeto final idêntico', completed.success && stored.equals(file), completed.error));
+
+  // Tamanho declarado diferente do recebido
+  const other = await startMultipartUpload(store, { ext: 'wav', size: 1000 });
+  await fetch(other.parts[0].url, { method: 'PUT', body: Buffer.alloc(999) });
+  const mismatch = await completeMultipartUpload(store, { fileKey: other.fileKey, uploadId: other.uploadId, size: 1000 });
+  checks.push(check('bytes recebidos ≠ declarados → SIZE_MISMATCH', mismatch.error === 'SIZE_MISMATCH', JSON.stringify(mismatch)));
+
+  // Bucket montou o objeto com tamanho diferente do declarado: objeto removido (sem órfão)
+  const diverged = await startMultipartUpload(store, { ext: 'wav', size: 1000 });
+  await fetch(diverged.parts[0].url, { method: 'PUT', body: Buffer.alloc(1000) });
+  const lyingStore = { ...store, headObject: async () => ({ size: 999 }) };
+  const afterComplete = await completeMultipartUpload(lyingStore, { fileKey: diverged.fileKey, uploadId: diverged.uploadId, size: 1000 });
+  const orphan = await store.headObject({ key: diverged.fileKey });
+  checks.push(check('tamanho no bucket ≠ declarado → SIZE_MISMATCH e objeto removido',
+    afterComplete.error === 'SIZE_MISMATCH' && orphan === null, JSON.stringify({ afterComplete, orphan })));
+  return checks;
+}
+
+async function runSecurityTest(store) {
+  const checks = [];
+  const started = await startMultipartUpload(store, { ext: 'flac', size: 1024 });
+  const url = new URL(started.parts[0].url);
+
+  const tampered = new URL(url);
+  tampered.searchParams.set('partNumber', '2');
+  const forged = await fetch(tampered, { method: 'PUT', body: Buffer.alloc(10) });
+  checks.push(check('URL adulterada → 403', forged.status === 403, `status=${forged.status}`));
+
+  const expired = new URL(url);
+  expired.searchParams.set('expires', '1');
+  const stale = await fetch(expired, { method: 'PUT', body: Buffer.alloc(10) });
+  checks.push(check('expiração alterada → 403', stale.status === 403, `status=${stale.status}`));
+
+  const foreignKey = await completeMultipartUpload(store, { fileKey: 'refs/out/pop.json', uploadId: started.uploadId, size: 1024 });
+  checks.push(check('fileKey fora de uploads/audio_* → INVALID_KEY', foreignKey.error === 'INVALID_KEY'));
+
+  const aborted = await abortMultipartUpload(store, { fileKey: started.fileKey, uploadId: started.uploadId });
+  const afterAbort = await resumeMultipartUpload(store, { fileKey: started.fileKey, uploadId: started.uploadId, size: 1024 });
+  checks.push(check('cancelado → UPLOAD_NOT_FOUND', aborted.success && afterAbort.error === 'UPLOAD_NOT_FOUND'));
+
+  const tooLarge = await startMultipartUpload(store, { ext: 'wav', size: MULTIPART_CONFIG.MAX_UPLOAD_BYTES + 1 });
+  const badExt = await startMultipartUpload(store, { ext: 'exe', size: 1024 });
+  checks.push(check('limites: FILE_TOO_LARGE / INVALID_EXTENSION', tooLarge.error === 'FILE_TOO_LARGE' && badExt.error === 'INVALID_EXTENSION'));
+
+  const plan = planParts(MULTIPART_CONFIG.MAX_UPLOAD_BYTES);
+  checks.push(check('planParts: partes ≥ 5MB e ≤ MAX_PARTS', plan.partSize >= MULTIPART_CONFIG.MIN_PART_SIZE && plan.partCount <= MULTIPART_CONFIG.MAX_PARTS));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario, store) {
+  try {
+    const checks = await scenario(store);
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 MULTIPART UPLOAD TESTS\n');
+
+  const store = createLocalObjectStore({ rootDir: ROOT_DIR, bucket: 'test-bucket' });
+  const results = [];
+  try {
+    results.push(await runAccuracyTest('Ida e volta (start → PUT paralelo → complete)', runRoundTripTest, store));
+    results.push(await runAccuracyTest('Retomada e conferência de tamanho', runResumeTest, store));
+    results.push(await runAccuracyTest('Assinatura, cancelamento e limites', runSecurityTest, store));
+  } finally {
+    await store.close();
+    await rm(ROOT_DIR, { recursive: true, force: true });
+  }
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
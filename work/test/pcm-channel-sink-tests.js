@@ -0,0 +1,212 @@
+/**
+ * 🧪 PCM CHANNEL SINK TESTS
+ *
+ * Valida o deinterleave incremental do decode raw f32le (lib/audio/utils/pcm-channel-sink.js)
+ * contra o deinterleave de referência do buffer inteiro (mesmas regras do parser WAV):
+ * - Chunks de tamanho arbitrário (cortando amostras/frames, offsets desalinhados)
+ * - Amostra não finita → wav_non_finite_sample; acima do teto → wav_duration_too_long
+ * - Clamp em [-1, 1]
+ * - Estimativa exata → zero realocações e canais como views (zero-copy)
+ *
+ * Uso: node test/pcm-channel-sink-tests.js
+ */
+
+import { PcmChannelSink } from '../lib/audio/utils/pcm-channel-sink.js';
+
+/**
+ * Gerador determinístico (LCG)
+ */
+function createRandom(seed = 20260301) {
+  let state = seed;
+  return () => {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    return (state + 1) / 0x80000001;
+  };
+}
+
+function makeInterleaved(frames, channels = 2, seed) {
+  const random = createRandom(seed);
+  const pcm = Buffer.alloc(frames * channels * 4);
+  for (let i = 0; i < frames * channels; i++) {
+    pcm.writeFloatLE((random() * 2 - 1) * 1.2, i * 4); // ~17% acima de |1| → exercita o clamp
+  }
+  return pcm;
+}
+
+/**
+ * Referência: deinterleave do buffer inteiro (como decodeWavFloat32Stereo)
+ */
+function referenceDeinterleave(pcm, channels = 2) {
+  const frames = Math.floor(pcm.length / (channels * 4));
+  const out = Array.from({ length: channels }, () => new Float32Array(frames));
+  for (let i = 0; i < frames; i++) {
+    for (let c = 0; c < channels; c++) {
+      out[c][i] = Math.max(-1, Math.min(1, pcm.readFloatLE((i * channels + c) * 4)));
+    }
+  }
+  return out;
+}
+
+/**
+ * Entrega o buffer ao sink em pedaços aleatórios; cada pedaço é copiado para um offset
+ * ímpar de um Buffer maior (simula chunks desalinhados do pool do stdout)
+ */
+function feedInChunks(sink, pcm, seed, maxChunk = 1000) {
+  const random = createRandom(seed);
+  let offset = 0;
+  while (offset < pcm.length) {
+    const size = Math.min(pcm.length - offset, 1 + Math.floor(random() * maxChunk));
+    const shift = Math.floor(random() * 4);
+    const host = Buffer.alloc(size + shift);
+    pcm.copy(host, shift, offset, offset + size);
+    sink.write(host.subarray(shift));
+    offset += size;
+  }
+}
+
+function sameChannels(a, b) {
+  return a.length === b.length && a.every((channel, c) =>
+    channel.length === b[c].length && channel.every((v, i) => v === b[c][i]));
+}
+
+function captureError(fn) {
+  try {
+    fn();
+    return null;
+  } catch (error) {
+    return error;
+  }
+}
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+function runChunkSplitTest() {
+  const checks = [];
+  const pcm = makeInterleaved(48000, 2, 7);
+  const reference = referenceDeinterleave(pcm);
+
+  for (const seed of [1, 2, 3]) {
+    const sink = new PcmChannelSink({ expectedFrames: 48000 });
+    feedInChunks(sink, pcm, seed);
+    const { channels, frames } = sink.finish();
+    checks.push(check(`chunks aleatórios (seed ${seed}) idênticos à referência`, frames === 48000 && sameChannels(channels, reference)));
+  }
+
+  // Frame incompleto no fim: descartado, como o Math.floor do parser WAV
+  const sink = new PcmChannelSink({ expectedFrames: 48000 });
+  sink.write(Buffer.concat([pcm, Buffer.alloc(5)]));
+  const { frames } = sink.finish();
+  checks.push(check('bytes de frame incompleto no fim descartados', frames === 48000, `frames=${frames}`));
+  return checks;
+}
+
+function runValidationTest() {
+  const checks = [];
+
+  const pcm = makeInterleaved(1000, 2, 11);
+  pcm.writeFloatLE(NaN, (500 * 2 + 1) * 4);
+  const nanError = captureError(() => feedInChunks(new PcmChannelSink({ expectedFrames: 1000 }), pcm, 5, 64));
+  checks.push(check('NaN → wav_non_finite_sample', nanError?.code === 'wav_non_finite_sample' && nanError?.stage === 'decode', nanError?.message));
+
+  const inf = Buffer.alloc(8);
+  inf.writeFloatLE(Infinity, 0);
+  const infError = captureError(() => new PcmChannelSink().write(inf));
+  checks.push(check('Infinity → wav_non_finite_sample', infError?.code === 'wav_non_finite_sample'));
+
+  // Teto de duração: falha no write que ultrapassa, antes do fim do stream
+  const sink = new PcmChannelSink({ sampleRate: 100, maxFrames: 1000 });
+  const tooLong = makeInterleaved(1500, 2, 13);
+  let written = 0;
+  const limitError = captureError(() => {
+    for (let offset = 0; offset < tooLong.length; offset += 800) {
+      sink.write(tooLong.subarray(offset, offset + 800));
+      written += 100;
+    }
+  });
+  checks.push(check('acima de maxFrames → wav_duration_too_long no write', limitError?.code === 'wav_duration_too_long' && written === 1000, `frames escritos=${written}`));
+
+  const clampSink = new PcmChannelSink({ expectedFrames: 1 });
+  const loud = Buffer.alloc(8);
+  loud.writeFloatLE(3.5, 0);
+  loud.writeFloatLE(-2, 4);
+  clampSink.write(loud);
+  const { channels } = clampSink.finish();
+  checks.push(check('clamp em [-1, 1]', channels[0][0] === 1 && channels[1][0] === -1));
+  return checks;
+}
+
+function runAllocationTest() {
+  const checks = [];
+  const pcm = makeInterleaved(20000, 2, 17);
+  const reference = referenceDeinterleave(pcm);
+
+  // Estimativa exata (ffprobe): sem realocação, canais são views da capacidade
+  const exact = new PcmChannelSink({ expectedFrames: 20000 + 480 });
+  feedInChunks(exact, pcm, 19, 4096);
+  const exactResult = exact.finish();
+  checks.push(check('estimativa exata: zero realocações', exactResult.reallocations === 0));
+  checks.push(check('estimativa exata: canais como subarray (zero-copy)',
+    exactResult.channels.every(c => c.buffer.byteLength === (20000 + 480) * 4 && c.length === 20000)));
+  checks.push(check('estimativa exata: dados idênticos', sameChannels(exactResult.channels, reference)));
+
+  // Sem estimativa útil: crescimento geométrico, dados preservados entre realocações
+  const growing = new PcmChannelSink({ expectedFrames: 100 });
+  feedInChunks(growing, pcm, 23, 4096);
+  const grown = growing.finish();
+  checks.push(check('crescimento: realocações logarítmicas', grown.reallocations > 0 && grown.reallocations <= 8, `realocações=${grown.reallocations}`));
+  checks.push(check('crescimento: dados idênticos', sameChannels(grown.channels, reference)));
+
+  // Estimativa muito acima do real: devolve cópia justa em vez de segurar a folga
+  const oversized = new PcmChannelSink({ expectedFrames: 100000 });
+  feedInChunks(oversized, pcm, 29, 4096);
+  const trimmed = oversized.finish();
+  checks.push(check('folga > 25%: canais compactados',
+    trimmed.channels.every(c => c.buffer.byteLength === 20000 * 4) && sameChannels(trimmed.channels, reference)));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+function runAccuracyTest(label, scenario) {
+  const checks = scenario();
+  return { label, checks, passed: checks.every(c => c.passed) };
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 PCM CHANNEL SINK TESTS\n');
+
+  const results = [
+    runAccuracyTest('Chunks arbitrários vs deinterleave de referência', runChunkSplitTest),
+    runAccuracyTest('Validações (não finito, duração máxima, clamp)', runValidationTest),
+    runAccuracyTest('Pré-alocação, crescimento e views zero-copy', runAllocationTest)
+  ];
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
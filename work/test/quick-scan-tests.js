@@ -0,0 +1,294 @@
+/**
+ * 🧪 QUICK-SCAN TESTS
+ *
+ * Tier leve da análise anônima (lib/audio/quick-scan.js + lib/audio/source-cache.js):
+ * - Trecho: janela central, arquivo curto inteiro, duração desconhecida
+ * - K-weighting fora de 48kHz: LUFS a 32kHz igual ao de 48kHz (coeficientes derivados)
+ * - True Peak: inter-sample peak recuperado pela interpolação sinc
+ * - Bandas grossas: energia na banda certa e nível em dBFS
+ * - Quick-scan vs métricas completas em sinal musical sintético (deltas e custo)
+ * - Upgrade: validação do job rápido, token do visitante e expectedFrames; source cache (take, TTL, tamanho, teto)
+ *
+ * Uso: node test/quick-scan-tests.js
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import {
+  QUICK_SCAN_CONFIG,
+  selectExcerptWindow,
+  computeTruePeak,
+  computeCoarseBands,
+  runQuickScan,
+  buildQuickScanResult,
+  hashUpgradeToken,
+  resolveQuickScanUpgrade
+} from '../lib/audio/quick-scan.js';
+import {
+  configureSourceCache,
+  putCachedSource,
+  takeCachedSource,
+  pruneSourceCache,
+  sourceCachePath
+} from '../lib/audio/source-cache.js';
+import { calculateLoudnessMetrics } from '../lib/audio/features/loudness.js';
+import { DynamicRangeCalculator } from '../lib/audio/features/dynamics-corrected.js';
+import { reconfigureLogger } from '../lib/logger.js';
+
+const TMP_DIR = fs.mkdtempSync(path.join(os.tmpdir(), 'quick-scan-tests-'));
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+function sine(sampleRate, seconds, freq, amplitude, phase = 0) {
+  const n = Math.round(sampleRate * seconds);
+  const out = new Float32Array(n);
+  for (let i = 0; i < n; i++) out[i] = amplitude * Math.sin(2 * Math.PI * freq * i / sampleRate + phase);
+  return out;
+}
+
+/**
+ * Sinal "musical" determinístico: kick 2 Hz, baixo, acordes, hi-hat e envelope por seção.
+ * Função contínua do tempo → mesmo conteúdo em qualquer sample rate (simula o -ar do FFmpeg).
+ */
+function musicSample(t) {
+  const beat = t % 0.5;
+  const kick = Math.exp(-beat * 18) * Math.sin(2 * Math.PI * (55 + 90 * Math.exp(-beat * 30)) * beat) * 0.55;
+  const bass = 0.18 * Math.sin(2 * Math.PI * 65.4 * t);
+  const chord = 0.08 * (Math.sin(2 * Math.PI * 261.6 * t) + Math.sin(2 * Math.PI * 329.6 * t) + Math.sin(2 * Math.PI * 392 * t));
+  const hat = 0.03 * Math.sin(2 * Math.PI * 7000 * t) * Math.exp(-((t + 0.25) % 0.25) * 60);
+  const section = 0.75 + 0.25 * Math.sin(2 * Math.PI * t / 20); // variação lenta de nível (DR)
+  return section * (kick + bass + chord + hat);
+}
+
+function renderMusic(sampleRate, startSeconds, seconds) {
+  const n = Math.round(sampleRate * seconds);
+  const left = new Float32Array(n);
+  const right = new Float32Array(n);
+  for (let i = 0; i < n; i++) {
+    const t = startSeconds + i / sampleRate;
+    const s = musicSample(t);
+    left[i] = s;
+    right[i] = s * 0.92 + 0.02 * Math.sin(2 * Math.PI * 440 * t);
+  }
+  return { left, right };
+}
+
+function runExcerptWindowTest() {
+  const checks = [];
+  const long = selectExcerptWindow(240, 45);
+  checks.push(check('faixa longa: trecho central', long.startSeconds === 97.5 && long.durationSeconds === 45, JSON.stringify(long)));
+  checks.push(check('faixa longa: cobertura', Math.abs(long.coverage - 0.188) < 0.001, String(long.coverage)));
+
+  const short = selectExcerptWindow(50, 45);
+  checks.push(check('faixa curta (até 1.3× o trecho): arquivo inteiro', short.startSeconds === 0 && short.durationSeconds === null && short.coverage === 1, JSON.stringify(short)));
+
+  const unknown = selectExcerptWindow(null, 45);
+  checks.push(check('duração desconhecida: início, limitado ao trecho', unknown.startSeconds === 0 && unknown.durationSeconds === 45 && unknown.coverage === null, JSON.stringify(unknown)));
+  return checks;
+}
+
+function runKWeightingTest() {
+  const checks = [];
+  const seconds = 12;
+  const at48 = renderMusic(48000, 30, seconds);
+  const at32 = renderMusic(32000, 30, seconds);
+  const lufs48 = calculateLoudnessMetrics(at48.left, at48.right, 48000).lufs_integrated;
+  const lufs32 = calculateLoudnessMetrics(at32.left, at32.right, 32000).lufs_integrated;
+  checks.push(check('LUFS 32kHz ≈ 48kHz (|Δ| < 0.1 LU)', Math.abs(lufs48 - lufs32) < 0.1, `48k=${lufs48.toFixed(3)} 32k=${lufs32.toFixed(3)}`));
+
+  // 1kHz: ganho do K-weighting ~+0.7 dB; estéreo com amplitude A → ~20·log10(A) + 0
+  const tone = sine(32000, 5, 997, 0.5);
+  const lufsTone = calculateLoudnessMetrics(tone, tone, 32000).lufs_integrated;
+  checks.push(check('senoide 997Hz -6 dBFS estéreo ≈ -6 LUFS (±0.3)', Math.abs(lufsTone - (-6.02)) < 0.3, lufsTone.toFixed(3)));
+  return checks;
+}
+
+function runTruePeakTest() {
+  const checks = [];
+  const sr = 32000;
+  // fs/4 com fase de 45°: amostras em ±0.707·A, pico real A entre amostras (+3 dB)
+  const hidden = sine(sr, 1, sr / 4, 0.9, Math.PI / 4);
+  const tp = computeTruePeak(hidden, hidden, sr);
+  checks.push(check('pico de amostra em -3 dB do real', Math.abs(tp.samplePeakLinear - 0.9 * Math.SQRT1_2) < 1e-4, tp.samplePeakLinear.toFixed(4)));
+  checks.push(check('True Peak recupera o pico entre amostras (±0.2 dB)', Math.abs(tp.truePeakDbtp - 20 * Math.log10(0.9)) < 0.2, `${tp.truePeakDbtp.toFixed(3)} dBTP`));
+  checks.push(check('superamostragem 6x a 32kHz', tp.oversample === 6, String(tp.oversample)));
+
+  const plain = sine(sr, 1, 1000, 0.5);
+  const tpPlain = computeTruePeak(plain, plain, sr);
+  checks.push(check('1kHz: True Peak ≈ amplitude (±0.05 dB)', Math.abs(tpPlain.truePeakDbtp - 20 * Math.log10(0.5)) < 0.05, tpPlain.truePeakDbtp.toFixed(3)));
+
+  const silence = new Float32Array(sr);
+  const tpSilence = computeTruePeak(silence, silence, sr);
+  checks.push(check('silêncio: -Infinity sem candidatos', tpSilence.truePeakDbtp === -Infinity && tpSilence.candidates === 0));
+  return checks;
+}
+
+function runCoarseBandsTest() {
+  const checks = [];
+  const sr = 32000;
+  const cases = [[80, 'low'], [300, 'lowMid'], [1000, 'mid'], [8000, 'high']];
+  for (const [freq, band] of cases) {
+    const tone = sine(sr, 4, freq, 0.5);
+    const bands = computeCoarseBands(tone, tone, sr);
+    checks.push(check(`${freq}Hz cai em ${band} (> 98%)`, bands[band].percentage > 98, `${bands[band].percentage.toFixed(2)}%`));
+    if (freq === 1000) {
+      checks.push(check('nível da banda ≈ -9 dBFS (senoide 0.5)', Math.abs(bands.mid.energy_db - (-9.03)) < 0.5, bands.mid.energy_db.toFixed(2)));
+    }
+  }
+  const bands = computeCoarseBands(new Float32Array(100), new Float32Array(100), sr);
+  checks.push(check('áudio menor que um frame: insufficient_audio', bands._status === 'insufficient_audio'));
+  checks.push(check('high termina no Nyquist', computeCoarseBands(sine(sr, 1, 100, 0.1), sine(sr, 1, 100, 0.1), sr).high.range === '4000-16000Hz'));
+  return checks;
+}
+
+function runQuickVsFullTest() {
+  const checks = [];
+  const trackSeconds = 150;
+  const window = selectExcerptWindow(trackSeconds, QUICK_SCAN_CONFIG.excerptSeconds);
+
+  // "Completo": faixa inteira a 48kHz (mesmos módulos de LUFS/DR do pipeline)
+  const full = renderMusic(48000, 0, trackSeconds);
+  let start = process.cpuUsage();
+  const fullLufs = calculateLoudnessMetrics(full.left, full.right, 48000).lufs_integrated;
+  const fullDr = DynamicRangeCalculator.calculateDynamicRange(full.left, full.right, 48000).dynamicRange;
+  const fullPeak = computeTruePeak(full.left, full.right, 48000);
+  const fullCpu = process.cpuUsage(start);
+
+  // Quick: trecho central a 32kHz (o que o FFmpeg entregaria com -ss/-t/-ar)
+  const excerpt = renderMusic(QUICK_SCAN_CONFIG.sampleRate, window.startSeconds, window.durationSeconds);
+  start = process.cpuUsage();
+  const quick = runQuickScan({ leftChannel: excerpt.left, rightChannel: excerpt.right, sampleRate: QUICK_SCAN_CONFIG.sampleRate });
+  const quickCpu = process.cpuUsage(start);
+
+  const cpuMs = (usage) => (usage.user + usage.system) / 1000;
+  checks.push(check('LUFS |Δ| < 0.5 LU', Math.abs(quick.lufsIntegrated - fullLufs) < 0.5, `full=${fullLufs.toFixed(2)} quick=${quick.lufsIntegrated.toFixed(2)}`));
+  checks.push(check('True Peak |Δ| < 0.5 dB', Math.abs(quick.truePeakDbtp - fullPeak.truePeakDbtp) < 0.5, `full=${fullPeak.truePeakDbtp.toFixed(2)} quick=${quick.truePeakDbtp.toFixed(2)}`));
+  checks.push(check('DR |Δ| < 1 dB', Math.abs(quick.dynamicRange - fullDr) < 1, `full=${fullDr.toFixed(2)} quick=${quick.dynamicRange.toFixed(2)}`));
+  checks.push(check('bandas grossas somam 100%', Math.abs(['low', 'lowMid', 'mid', 'high'].reduce((sum, key) => sum + quick.bands[key].percentage, 0) - 100) < 1e-6));
+  checks.push(check('CPU do quick-scan < 1/2 de LUFS+DR+TP completos (sem bandas/estéreo/scoring)', cpuMs(quickCpu) < cpuMs(fullCpu) / 2,
+    `quick=${cpuMs(quickCpu).toFixed(0)}ms full=${cpuMs(fullCpu).toFixed(0)}ms`));
+
+  const result = buildQuickScanResult(quick, {
+    jobId: 'job-1', fileKey: 'uploads/audio_1.wav', fileName: 'track.wav', genre: 'funk_mandela',
+    excerpt: window, sampleRate: QUICK_SCAN_CONFIG.sampleRate, sourceDurationSeconds: trackSeconds, sourceBytes: 1234, processingMs: 10,
+    upgradeTokenHash: hashUpgradeToken('token-1')
+  });
+  checks.push(check('JSON: tier quick, sem score/sugestões', result.analysisTier === 'quick' && result.score === null && result.suggestions.length === 0));
+  checks.push(check('JSON: technicalData com as 4 métricas', result.technicalData.lufsIntegrated === quick.lufsIntegrated &&
+    result.technicalData.truePeakDbtp === quick.truePeakDbtp && result.technicalData.dynamicRange === quick.dynamicRange &&
+    result.technicalData.coarseBands === quick.bands));
+  checks.push(check('JSON: bloco de upgrade', result.quickScan.upgrade.fileKey === 'uploads/audio_1.wav' && result.quickScan.upgrade.sourceDurationSeconds === trackSeconds &&
+    result.quickScan.upgrade.tokenHash === hashUpgradeToken('token-1') && !JSON.stringify(result).includes('token-1')));
+  return checks;
+}
+
+async function runUpgradeTest() {
+  const checks = [];
+  const quickResults = {
+    analysisTier: 'quick',
+    quickScan: { upgrade: { fileKey: 'uploads/audio_9.mp3', sourceBytes: 4096, sourceDurationSeconds: 180.5, tokenHash: hashUpgradeToken('visitor-token') } }
+  };
+  const row = { id: 'quick-job', file_key: 'uploads/audio_9.mp3', status: 'completed', results: JSON.stringify(quickResults) };
+
+  checks.push(check('job inexistente', resolveQuickScanUpgrade(null).error === 'QUICK_SCAN_NOT_FOUND'));
+  checks.push(check('job completo (não quick) recusado', resolveQuickScanUpgrade({ ...row, results: { analysisTier: undefined } }).error === 'QUICK_SCAN_NOT_UPGRADABLE'));
+  checks.push(check('quick ainda em processamento recusado', resolveQuickScanUpgrade({ ...row, status: 'processing' }).error === 'QUICK_SCAN_NOT_UPGRADABLE'));
+  checks.push(check('sem token recusado', resolveQuickScanUpgrade(row).error === 'QUICK_SCAN_FORBIDDEN'));
+  checks.push(check('token de outro visitante recusado', resolveQuickScanUpgrade(row, null, 'outro-token').error === 'QUICK_SCAN_FORBIDDEN'));
+  const legacy = { ...row, results: { ...quickResults, quickScan: { upgrade: { fileKey: 'uploads/audio_9.mp3' } } } };
+  checks.push(check('job sem hash de token recusado', resolveQuickScanUpgrade(legacy, null, 'visitor-token').error === 'QUICK_SCAN_FORBIDDEN'));
+  checks.push(check('fileKey diferente recusado', resolveQuickScanUpgrade(row, 'uploads/outro.wav', 'visitor-token').error === 'QUICK_SCAN_FILE_MISMATCH'));
+
+  const { upgrade } = resolveQuickScanUpgrade(row, null, 'visitor-token');
+  checks.push(check('sem fileKey: reaproveita o upload', upgrade.fileKey === 'uploads/audio_9.mp3' && upgrade.quickScanJobId === 'quick-job'));
+  checks.push(check('expectedFrames = duração a 48kHz + 1s', upgrade.expectedFrames === Math.ceil(180.5 * 48000) + 48000, String(upgrade.expectedFrames)));
+
+  // Source cache
+  configureSourceCache({ dir: path.join(TMP_DIR, 'cache'), ttlMs: 60000, maxBytes: 10000 });
+  const download = path.join(TMP_DIR, 'download.mp3');
+  fs.writeFileSync(download, Buffer.alloc(4096, 1));
+  const cached = await putCachedSource('uploads/audio_9.mp3', download);
+  checks.push(check('put move o download para o cache', !fs.existsSync(download) && cached === sourceCachePath('uploads/audio_9.mp3') && cached.endsWith('.mp3')));
+
+  checks.push(check('tamanho diferente: não reaproveita e descarta', !(await takeCachedSource('uploads/audio_9.mp3', path.join(TMP_DIR, 'x.mp3'), { expectedBytes: 10 })) && !fs.existsSync(cached)));
+
+  fs.writeFileSync(download, Buffer.alloc(4096, 1));
+  await putCachedSource('uploads/audio_9.mp3', download);
+  const dest = path.join(TMP_DIR, 'job.mp3');
+  const taken = await takeCachedSource('uploads/audio_9.mp3', dest, { expectedBytes: 4096 });
+  checks.push(check('take move para o job (uma vez só)', taken && fs.statSync(dest).size === 4096 &&
+    !(await takeCachedSource('uploads/audio_9.mp3', path.join(TMP_DIR, 'again.mp3')))));
+
+  fs.writeFileSync(download, Buffer.alloc(10, 1));
+  await putCachedSource('uploads/old.wav', download);
+  checks.push(check('entrada expirada não é reaproveitada', !(await takeCachedSource('uploads/old.wav', path.join(TMP_DIR, 'old.wav'), { now: Date.now() + 120000 }))));
+
+  for (let i = 0; i < 4; i++) {
+    fs.writeFileSync(download, Buffer.alloc(4000, i));
+    const file = await putCachedSource(`uploads/audio_${i}.wav`, download);
+    const when = new Date(Date.now() - (10 - i) * 1000);
+    fs.utimesSync(file, when, when);
+  }
+  const pruned = await pruneSourceCache();
+  const left = fs.readdirSync(path.join(TMP_DIR, 'cache')).length;
+  checks.push(check('teto de bytes remove os mais antigos', pruned.bytes <= 10000 && left === 2 &&
+    fs.existsSync(sourceCachePath('uploads/audio_3.wav')), `restaram ${left} (${pruned.bytes} bytes)`));
+  return checks;
+}
+
+/**
+ * Executar um cenário e consolidar checks
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 QUICK-SCAN TESTS\n');
+  reconfigureLogger({ level: 'warn' });
+
+  const results = [];
+  results.push(await runAccuracyTest('Janela do trecho', runExcerptWindowTest));
+  results.push(await runAccuracyTest('K-weighting fora de 48kHz', runKWeightingTest));
+  results.push(await runAccuracyTest('True Peak por interpolação sinc', runTruePeakTest));
+  results.push(await runAccuracyTest('Bandas grossas', runCoarseBandsTest));
+  results.push(await runAccuracyTest('Quick-scan vs métricas completas', runQuickVsFullTest));
+  results.push(await runAccuracyTest('Upgrade e source cache', runUpgradeTest));
+
+  reconfigureLogger();
+  fs.rmSync(TMP_DIR, { recursive: true, force: true });
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
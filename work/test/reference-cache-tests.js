@@ -0,0 +1,239 @@
+/**
+ * 🧪 REFERENCE CACHE TESTS
+ *
+ * Cache de medições por faixa das ferramentas de referência (tools/reference-cache.js):
+ * - 1ª execução mede tudo em paralelo (worker_threads); 2ª vem inteira do cache
+ * - Só a faixa alterada é medida de novo; versão de análise nova invalida tudo
+ * - Mesmo áudio em dois caminhos é medido uma vez; falhas não entram no cache
+ * - -Infinity/NaN sobrevivem ao cache; leitor WAV compartilhado (16/24/float/mono)
+ *
+ * O próprio arquivo é o módulo de medição dos workers (measureFixture).
+ *
+ * Uso: node test/reference-cache-tests.js
+ */
+
+import os from 'os';
+import path from 'path';
+import { mkdir, rm, readFile, writeFile, appendFile } from 'fs/promises';
+import { isMainThread, threadId } from 'worker_threads';
+import { fileURLToPath } from 'url';
+import { measureTracksCached, pruneCache } from '../../tools/reference-cache.js';
+import { readWavFile, decodeWavBuffer } from '../../tools/wav-reader.js';
+
+const ROOT_DIR = path.join(os.tmpdir(), `soundyai-refcache-test-${process.pid}`);
+const CACHE_DIR = path.join(ROOT_DIR, '.cache');
+const MEASURE = { module: fileURLToPath(import.meta.url), exportName: 'measureFixture' };
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Medição de teste (roda nos workers): pico e RMS do canal esquerdo
+ */
+export async function measureFixture(filePath, { gain = 1 } = {}) {
+  const { left } = await readWavFile(filePath);
+  let peak = 0, sum = 0;
+  for (let i = 0; i < left.length; i++) {
+    peak = Math.max(peak, Math.abs(left[i]));
+    sum += left[i] * left[i];
+  }
+  const rms = Math.sqrt(sum / left.length) * gain;
+  return { frames: left.length, peak, rms_db: rms > 0 ? 20 * Math.log10(rms) : -Infinity, thread: threadId };
+}
+
+function makeWav({ frames = 4800, channels = 2, bits = 16, float = false, value = (i) => Math.sin(i / 10) * 0.5, extraChunk = null }) {
+  const bps = bits / 8;
+  const dataSize = frames * channels * bps;
+  const extra = extraChunk ? 8 + extraChunk.length + (extraChunk.length % 2) : 0;
+  const buf = Buffer.alloc(44 + extra + dataSize);
+  buf.write('RIFF', 0);
+  buf.writeUInt32LE(36 + extra + dataSize, 4);
+  buf.write('WAVE', 8);
+  buf.write('fmt ', 12);
+  buf.writeUInt32LE(16, 16);
+  buf.writeUInt16LE(float ? 3 : 1, 20);
+  buf.writeUInt16LE(channels, 22);
+  buf.writeUInt32LE(48000, 24);
+  buf.writeUInt32LE(48000 * channels * bps, 28);
+  buf.writeUInt16LE(channels * bps, 32);
+  buf.writeUInt16LE(bits, 34);
+  let pos = 36;
+  if (extraChunk) {
+    buf.write('LIST', pos);
+    buf.writeUInt32LE(extraChunk.length, pos + 4);
+    extraChunk.copy(buf, pos + 8);
+    pos += extra;
+  }
+  buf.write('data', pos);
+  buf.writeUInt32LE(dataSize, pos + 4);
+  pos += 8;
+  for (let i = 0; i < frames; i++) {
+    for (let c = 0; c < channels; c++, pos += bps) {
+      const v = value(i) * (c ? -1 : 1);
+      if (float) buf.writeFloatLE(v, pos);
+      else if (bits === 16) buf.writeInt16LE(Math.round(v * 32767), pos);
+      else buf.writeIntLE(Math.round(v * 8388607), pos, 3);
+    }
+  }
+  return buf;
+}
+
+async function writeTracks(dir, count) {
+  await mkdir(dir, { recursive: true });
+  const files = [];
+  for (let k = 0; k < count; k++) {
+    const file = path.join(dir, `track_${k}.wav`);
+    await writeFile(file, makeWav({ value: (i) => Math.sin(i / (5 + k)) * (0.2 + 0.1 * k) }));
+    files.push(file);
+  }
+  return files;
+}
+
+async function runIncrementalTest() {
+  const checks = [];
+  const files = await writeTracks(path.join(ROOT_DIR, 'genre_a'), 4);
+  const params = { namespace: 'test', version: 'v1', measure: MEASURE, concurrency: 2, cacheDir: CACHE_DIR };
+
+  const first = await measureTracksCached(files, params);
+  const threads = new Set(first.rows.map(r => r.metrics.thread));
+  checks.push(check('1ª execução: 4 medidas em 2 workers', first.stats.measured === 4 && threads.size === 2 && !threads.has(0),
+    JSON.stringify({ stats: first.stats, threads: [...threads] })));
+  checks.push(check('linhas na ordem dos arquivos', first.rows.map(r => r.file).join() === files.join()));
+
+  const second = await measureTracksCached(files, params);
+  checks.push(check('2ª execução: tudo do cache, nada re-hasheado', second.stats.cached === 4 && second.stats.measured === 0 &&
+    second.stats.rehashed === 0, JSON.stringify(second.stats)));
+  checks.push(check('métricas do cache idênticas às medidas',
+    JSON.stringify(second.rows.map(r => r.metrics)) === JSON.stringify(first.rows.map(r => r.metrics))));
+
+  await appendFile(files[2], Buffer.alloc(4)); // altera o áudio de uma faixa
+  const third = await measureTracksCached(files, params);
+  checks.push(check('faixa alterada: só ela é medida', third.stats.measured === 1 && !third.rows[2].cached &&
+    third.rows.filter(r => r.cached).length === 3, JSON.stringify(third.stats)));
+
+  const bumped = await measureTracksCached(files, { ...params, version: 'v2' });
+  checks.push(check('versão de análise nova: mede tudo', bumped.stats.measured === 4, JSON.stringify(bumped.stats)));
+
+  const back = await measureTracksCached(files, params);
+  checks.push(check('versão anterior continua no cache', back.stats.cached === 4, JSON.stringify(back.stats)));
+
+  const forced = await measureTracksCached(files, { ...params, force: true });
+  checks.push(check('force: ignora o cache', forced.stats.measured === 4));
+
+  const pruned = await pruneCache('test', { version: 'v1', cacheDir: CACHE_DIR });
+  const afterPrune = await measureTracksCached(files, { ...params, version: 'v2' });
+  checks.push(check('prune remove versões antigas', pruned.removed >= 4 && afterPrune.stats.measured === 4,
+    JSON.stringify({ pruned, stats: afterPrune.stats })));
+  return checks;
+}
+
+async function runDedupAndFailureTest() {
+  const checks = [];
+  const dir = path.join(ROOT_DIR, 'genre_b');
+  const [original] = await writeTracks(dir, 1);
+  const copy = path.join(dir, 'copia.wav');
+  await writeFile(copy, await readFile(original));
+  const broken = path.join(dir, 'quebrado.wav');
+  await writeFile(broken, Buffer.from('não é um wav'));
+  const silent = path.join(dir, 'silencio.wav');
+  await writeFile(silent, makeWav({ value: () => 0 }));
+
+  const params = { namespace: 'dedup', version: 'v1', measure: MEASURE, cacheDir: CACHE_DIR };
+  const result = await measureTracksCached([original, copy, broken, silent], params);
+  checks.push(check('mesmo áudio em dois caminhos: medido uma vez', result.stats.measured === 3 &&
+    result.stats.deduplicated === 1 && result.rows[0].hash === result.rows[1].hash,
+    JSON.stringify(result.stats)));
+  checks.push(check('arquivo inválido vai para failed', result.failed.length === 1 && result.failed[0].file === broken &&
+    /WAV/.test(result.failed[0].error), JSON.stringify(result.failed)));
+
+  const again = await measureTracksCached([original, copy, broken, silent], params);
+  checks.push(check('falha não é cacheada; o resto é', again.stats.cached === 3 && again.failed.length === 1, JSON.stringify(again.stats)));
+  const silentRow = again.rows.find(r => r.file === silent);
+  checks.push(check('-Infinity sobrevive ao cache', silentRow && silentRow.cached && silentRow.metrics.rms_db === -Infinity,
+    JSON.stringify(silentRow && silentRow.metrics)));
+  return checks;
+}
+
+async function runWavReaderTest() {
+  const checks = [];
+  const value = (i) => ((i % 100) - 50) / 100;
+  const pcm16 = decodeWavBuffer(makeWav({ frames: 200, value }));
+  const pcm24 = decodeWavBuffer(makeWav({ frames: 200, bits: 24, value }));
+  const float = decodeWavBuffer(makeWav({ frames: 200, bits: 32, float: true, value }));
+  const mono = decodeWavBuffer(makeWav({ frames: 200, channels: 1, value }));
+  const odd = decodeWavBuffer(makeWav({ frames: 200, value, extraChunk: Buffer.from('abc') }));
+
+  const maxErr = (decoded, tol) => {
+    let err = 0;
+    for (let i = 0; i < 200; i++) {
+      err = Math.max(err, Math.abs(decoded.left[i] - value(i)), Math.abs(decoded.right[i] + value(i)));
+    }
+    return err <= tol;
+  };
+  checks.push(check('PCM 16 bits', maxErr(pcm16, 1 / 32767) && pcm16.bitDepth === 16 && pcm16.format === 'PCM'));
+  checks.push(check('PCM 24 bits (sinal negativo)', maxErr(pcm24, 1 / 8388607)));
+  checks.push(check('IEEE float 32', maxErr(float, 1e-7) && float.format === 'IEEE_FLOAT'));
+  checks.push(check('mono duplicado em L/R', mono.channels === 1 && mono.left.every((v, i) => v === mono.right[i])));
+  checks.push(check('chunk extra com tamanho ímpar (alinhamento)', odd.left.length === 200 && maxErr(odd, 1 / 32767)));
+
+  let rejected = false;
+  try {
+    decodeWavBuffer(Buffer.from('RIFF____AVI LIST'));
+  } catch (_) {
+    rejected = true;
+  }
+  checks.push(check('não-WAV rejeitado', rejected));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 REFERENCE CACHE TESTS\n');
+
+  const results = [];
+  try {
+    results.push(await runAccuracyTest('Cache incremental (paralelo → cache → só o que mudou)', runIncrementalTest));
+    results.push(await runAccuracyTest('Deduplicação, falhas e valores não finitos', runDedupAndFailureTest));
+    results.push(await runAccuracyTest('Leitor WAV compartilhado', runWavReaderTest));
+  } finally {
+    await rm(ROOT_DIR, { recursive: true, force: true });
+  }
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente (os workers de medição importam este arquivo com o mesmo argv)
+if (isMainThread && import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
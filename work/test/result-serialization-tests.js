@@ -0,0 +1,229 @@
+/**
+ * 🧪 RESULT SERIALIZATION TESTS
+ *
+ * Serialização do JSON final da análise (lib/serialization/):
+ * - MessagePack (msgpackr): formatos compactos da spec, limites de inteiros, bin
+ * - Precisão do schema: decimais nos campos conhecidos, dígitos significativos no resto
+ * - Forma binária do IPC: aliases idênticos removidos e restaurados, versão do schema validada
+ *
+ * O resultado de teste sai do generateJSONOutput real (mesmos aliases que vão para jobs.results).
+ *
+ * Uso: node test/result-serialization-tests.js
+ */
+
+import { isDeepStrictEqual } from 'util';
+import { encode, decode } from '../lib/serialization/msgpack.js';
+import {
+  RESULT_SCHEMA_VERSION,
+  serializeResultJSON,
+  normalizeResultPrecision,
+  normalizeValuePrecision,
+  encodeResultWire,
+  decodeResultWire
+} from '../lib/serialization/result-schema.js';
+import { generateJSONOutput } from '../api/audio/json-output.js';
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * json-output loga cada etapa: silenciar só durante a geração do fixture
+ */
+function quietly(fn) {
+  const { log, warn, error } = console;
+  console.log = console.warn = console.error = () => {};
+  try {
+    return fn();
+  } finally {
+    Object.assign(console, { log, warn, error });
+  }
+}
+
+function band(energy, percentage, name) {
+  return { energy_db: energy, percentage, frequencyRange: '-', name, status: 'calculated' };
+}
+
+function buildResult() {
+  const coreMetrics = {
+    lufs: { integrated: -8.123456789, shortTerm: -7.55555, momentary: -6.91234, lra: 4.4444, originalLUFS: -8.12, normalizedTo: -23, gainAppliedDB: -14.88 },
+    truePeak: { maxDbtp: 0.412345, maxLinear: 1.04857, samplePeakLeftDb: -0.1234, samplePeakRightDb: -0.2345, clippingSamples: 12, clippingPct: 0.0012 },
+    dynamics: { dynamicRange: 5.6789, crestFactor: 8.91011, peakRmsDb: -5.12, averageRmsDb: -11.23, drCategory: 'low' },
+    stereo: { correlation: 0.81234, width: 0.3456, opening: 0.1877, openingPercent: 18.77, openingCategory: 'normal', balance: 0.0123, isMonoCompatible: true, hasPhaseIssues: false },
+    fft: { aggregated: { spectralCentroidHz: 2345.6789, spectralRolloffHz: 8765.4321, spectralFlatness: 0.23456, spectralFlux: 0.01234 } },
+    spectralBands: {
+      bands: {
+        sub: band(-18.123, 22.45, 'Sub'), bass: band(-16.98, 25.1, 'Bass'), lowMid: band(-20.4, 14.2, 'Low-Mid'),
+        mid: band(-22.1, 12.3, 'Mid'), highMid: band(-26.7, 9.1, 'High-Mid'), presence: band(-30.2, 6.2, 'Presence'),
+        air: band(-34.9, 3.4, 'Air')
+      },
+      totalPercentage: 100,
+      valid: true
+    },
+    rms: { average: -11.2345, peak: -5.678, left: -11.1, right: -11.3, count: 4000 },
+    bpm: 128,
+    bpmConfidence: 0.87
+  };
+  const reference = { lufs_target: -7.2, tol_lufs: 2, true_peak_target: -0.3, tol_true_peak: 0.3, dr_target: 6, tol_dr: 2, bands: {} };
+
+  const result = quietly(() => generateJSONOutput(coreMetrics, reference,
+    { fileName: 'faixa.wav', duration: 180.5, sampleRate: 48000, channels: 2 },
+    { jobId: '00000000-0000-4000-8000-000000000000', fileName: 'faixa.wav', mode: 'genre', genre: 'funk_bh', soundDestination: 'pista' }));
+
+  // Como no pipeline: as três listas de sugestões são o mesmo array
+  const suggestions = [
+    { metric: 'lufs', severity: 'high', currentValue: -8.123456789, targetValue: -7.2, delta: 0.923456789, message: 'Loudness acima do alvo ♪' },
+    { metric: 'band_sub', severity: 'low', currentValue: -18.123, targetValue: -20, delta: 1.877 }
+  ];
+  result.suggestions = suggestions;
+  result.problemsAnalysis.suggestions = suggestions;
+  result.diagnostics.suggestions = suggestions;
+  result.aiSuggestions = suggestions.map(s => ({ ...s, aiEnhanced: true, enrichedAt: new Date(0) }));
+  result.data.genreTargets = { lufs: { target: -7.2, tolerance: 2.123456789 }, dr: { target: 6.0600000000000005 } };
+  return result;
+}
+
+function runMsgpackTest() {
+  const checks = [];
+  const hex = (value) => encode(value).toString('hex');
+
+  checks.push(check('formatos compactos da spec', hex({ a: 1 }) === '81a16101' && hex(-33) === 'd0df' &&
+    hex(300) === 'cd012c' && hex(-1) === 'ff' && hex('') === 'a0' && hex([true, null]) === '92c3c0' && hex(1.5) === 'cb3ff8000000000000',
+    [hex({ a: 1 }), hex(-33), hex(300), hex(1.5)].join(' ')));
+
+  const boundaries = [0, 127, 128, 255, 256, 65535, 65536, 2 ** 32 - 1, 2 ** 32, -32, -33, -128, -129, -32768, -32769, -(2 ** 31), -(2 ** 31) - 1, 2 ** 53, 0.1];
+  checks.push(check('limites de inteiros', isDeepStrictEqual(decode(encode(boundaries)), boundaries)));
+
+  const longText = 'ç'.repeat(40000);
+  const value = { s: longText, arr: Array.from({ length: 70000 }, (_, i) => i % 300), nested: { x: [1, { y: 'ação' }] } };
+  checks.push(check('str/array/map de 16 e 32 bits', isDeepStrictEqual(decode(encode(value)), value)));
+
+  // Semântica de JSON.stringify é do normalizador: o wire carrega o que ele devolve
+  const jsonLike = { a: undefined, b: NaN, c: Infinity, d: [undefined, () => 1], e: new Date(0), f() {} };
+  const normalizedLike = normalizeValuePrecision(jsonLike);
+  checks.push(check('semântica de JSON.stringify', isDeepStrictEqual(decode(encode(normalizedLike)), JSON.parse(JSON.stringify(jsonLike))),
+    JSON.stringify(decode(encode(normalizedLike)))));
+
+  const binary = decode(encode({ data: Buffer.from([1, 2, 3]) })).data;
+  checks.push(check('Buffer → bin', Buffer.isBuffer(binary) && binary.equals(Buffer.from([1, 2, 3]))));
+
+  const proto = decode(encode(JSON.parse('{"__proto__":{"admin":true}}')));
+  checks.push(check('__proto__ vira propriedade própria', Object.getPrototypeOf(proto) === Object.prototype && proto.admin === undefined));
+
+  let truncated = null;
+  try {
+    decode(encode({ a: 'texto' }).subarray(0, 4));
+  } catch (error) {
+    truncated = error;
+  }
+  checks.push(check('payload truncado lança erro', truncated instanceof Error));
+  return checks;
+}
+
+function runPrecisionTest() {
+  const checks = [];
+  const result = buildResult();
+  const frozen = JSON.stringify(result);
+  const normalized = normalizeResultPrecision(result);
+
+  checks.push(check('resultado original não é alterado', JSON.stringify(result) === frozen));
+  checks.push(check('JSON do schema = resultado normalizado', isDeepStrictEqual(JSON.parse(serializeResultJSON(result)), normalized)));
+  checks.push(check('campos conhecidos com 3 decimais', normalized.loudness.integrated === -8.123 &&
+    normalized.technicalData.lufsIntegrated === -8.123, String(normalized.loudness.integrated)));
+  checks.push(check('fora do schema: 7 dígitos significativos', normalized.suggestions[0].delta === 0.9234568 &&
+    normalized.data.genreTargets.lufs.tolerance === 2.123457 && normalized.data.genreTargets.dr.target === 6.06,
+    JSON.stringify(normalized.data.genreTargets)));
+  checks.push(check('toJSON aplicado (Date → ISO)', normalized.aiSuggestions[0].enrichedAt === '1970-01-01T00:00:00.000Z'));
+
+  const values = [0.1 + 0.2, 123456.789012, -0.000123456789, 98765432.1, 1e-12 / 3];
+  checks.push(check('mesmo arredondamento de toPrecision(7)', values.every(v => normalizeValuePrecision(v) === +v.toPrecision(7)),
+    JSON.stringify(values.map(normalizeValuePrecision))));
+
+  const again = normalizeResultPrecision(normalized);
+  checks.push(check('normalização idempotente', isDeepStrictEqual(again, normalized)));
+  checks.push(check('JSON não cresce', serializeResultJSON(result).length <= frozen.length));
+  return checks;
+}
+
+function runWireTest() {
+  const checks = [];
+  const result = buildResult();
+  const normalized = normalizeResultPrecision(result);
+  const wire = encodeResultWire(result);
+  const decoded = decodeResultWire(wire);
+
+  checks.push(check('roundtrip = resultado normalizado', isDeepStrictEqual(decoded, normalized)));
+  checks.push(check('aliases restaurados por referência', decoded.problemsAnalysis.suggestions === decoded.suggestions &&
+    decoded.technicalData.bands === decoded.technicalData.spectral_balance &&
+    decoded.metrics.bands.sub === decoded.spectralBands.sub && decoded.technicalData.dr === decoded.technicalData.dynamicRange));
+
+  const fullWire = encode(normalized).length;
+  const jsonBytes = Buffer.byteLength(JSON.stringify(result));
+  checks.push(check('binário menor que o JSON (aliases fora)', wire.length < fullWire && wire.length < jsonBytes * 0.75,
+    `wire=${wire.length} msgpack sem dedup=${fullWire} json=${jsonBytes}`));
+
+  // Alias que divergiu do canônico não pode ser descartado
+  result.technicalData.bands = structuredClone(result.technicalData.bands);
+  result.technicalData.bands.sub.energy_db = -99;
+  const diverged = decodeResultWire(encodeResultWire(result));
+  checks.push(check('alias diferente do canônico é mantido', diverged.technicalData.bands.sub.energy_db === -99 &&
+    diverged.technicalData.spectral_balance.sub.energy_db !== -99 && diverged.technicalData.spectralBands === diverged.technicalData.spectral_balance));
+
+  const otherVersion = encode([RESULT_SCHEMA_VERSION + 1, [], {}]);
+  let versionError = null;
+  try {
+    decodeResultWire(otherVersion);
+  } catch (error) {
+    versionError = error;
+  }
+  checks.push(check('versão de schema desconhecida é rejeitada', versionError !== null && /schema/.test(versionError.message)));
+  checks.push(check('resultado nulo', decodeResultWire(encodeResultWire(null)) === null));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+async function runAccuracyTest(label, scenario) {
+  try {
+    const checks = await scenario();
+    return { label, checks, passed: checks.every(c => c.passed) };
+  } catch (error) {
+    return { label, checks: [check('exceção', false, error.message)], passed: false };
+  }
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 RESULT SERIALIZATION TESTS\n');
+
+  const results = [];
+  results.push(await runAccuracyTest('MessagePack (spec + semântica de JSON)', runMsgpackTest));
+  results.push(await runAccuracyTest('Precisão do schema', runPrecisionTest));
+  results.push(await runAccuracyTest('Forma binária do IPC (aliases + versão)', runWireTest));
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários aprovados`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
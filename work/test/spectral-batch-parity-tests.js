@@ -0,0 +1,167 @@
+/**
+ * 🧪 SPECTRAL BATCH PARITY TESTS
+ *
+ * Garante que a análise em lote do espectrograma (spectral-batch.js) produz os mesmos
+ * agregados que o caminho frame a frame usado pelo core-metrics:
+ * - Bandas espectrais (energia, energy_db e percentuais agregados)
+ * - Spectral centroid (mediana, média, min, max)
+ * - Frames sem FFT são ignorados nos dois caminhos
+ *
+ * Uso: node test/spectral-batch-parity-tests.js
+ */
+
+import { SpectralBandsCalculator, SpectralBandsAggregator } from '../lib/audio/features/spectral-bands.js';
+import { SpectralCentroidCalculator, SpectralCentroidAggregator } from '../lib/audio/features/spectral-centroid.js';
+import { SpectralBatchAnalyzer, summarizeSeries } from '../lib/audio/features/spectral-batch.js';
+
+const SAMPLE_RATE = 48000;
+const FFT_SIZE = 4096;
+const NUM_BINS = FFT_SIZE / 2;
+
+/**
+ * Gera frames FFT sintéticos (espectro rosa + picos + ruído determinístico)
+ */
+function generateFrames({ numFrames = 300, level = 1, silentEvery = 0, missingEvery = 0 }) {
+  const left = [];
+  const right = [];
+  let seed = 424242;
+  const noise = () => {
+    seed = (seed * 1103515245 + 12345) & 0x7fffffff;
+    return seed / 0x7fffffff;
+  };
+
+  for (let f = 0; f < numFrames; f++) {
+    if (missingEvery && f % missingEvery === 3) {
+      left.push(null);
+      right.push(null);
+      continue;
+    }
+    const l = new Float32Array(NUM_BINS);
+    const r = new Float32Array(NUM_BINS);
+    const silent = silentEvery && f % silentEvery === 0;
+    if (!silent) {
+      const peakBin = 20 + (f * 7) % 900;
+      for (let bin = 1; bin < NUM_BINS; bin++) {
+        const pink = level * 50 / Math.sqrt(bin);
+        const peak = Math.abs(bin - peakBin) < 3 ? level * 200 : 0;
+        l[bin] = pink * (0.5 + noise()) + peak;
+        r[bin] = pink * (0.5 + noise()) + peak * 0.7;
+      }
+    }
+    left.push({ magnitude: l });
+    right.push({ magnitude: r });
+  }
+
+  return { left, right, count: numFrames };
+}
+
+/**
+ * Referência: caminho frame a frame (como calculateSpectralBandsMetrics/CentroidMetrics)
+ */
+function perFrameAggregates(framesFFT) {
+  const bandsCalculator = new SpectralBandsCalculator(SAMPLE_RATE, FFT_SIZE);
+  const centroidCalculator = new SpectralCentroidCalculator(SAMPLE_RATE, FFT_SIZE);
+  const bandsResults = [];
+  const centroidResults = [];
+
+  for (let i = 0; i < framesFFT.count; i++) {
+    const leftMag = framesFFT.left[i]?.magnitude;
+    const rightMag = framesFFT.right[i]?.magnitude;
+    if (!leftMag || !rightMag) continue;
+
+    const bands = bandsCalculator.analyzeBands(leftMag, rightMag, i);
+    if (bands.valid) bandsResults.push(bands);
+
+    const centroid = centroidCalculator.calculateCentroidHz(leftMag, rightMag, i);
+    if (centroid && centroid.valid) centroidResults.push(centroid);
+  }
+
+  return {
+    bands: SpectralBandsAggregator.aggregate(bandsResults),
+    centroid: SpectralCentroidAggregator.aggregate(centroidResults)
+  };
+}
+
+function compare(name, expected, actual, tolerance) {
+  const bothNull = expected === null && actual === null;
+  const same = typeof expected === 'boolean' || typeof expected === 'string'
+    ? expected === actual
+    : bothNull || (expected !== null && actual !== null && Math.abs(expected - actual) <= tolerance);
+  return { name, expected, actual, passed: same };
+}
+
+/**
+ * Executa um cenário de paridade
+ */
+function runParityTest(label, frameOptions) {
+  const framesFFT = generateFrames(frameOptions);
+  const reference = perFrameAggregates(framesFFT);
+
+  const series = new SpectralBatchAnalyzer(SAMPLE_RATE, FFT_SIZE).analyzeFrames(framesFFT);
+  const bands = SpectralBandsAggregator.aggregateBatch(series);
+  const centroid = SpectralCentroidAggregator.aggregateBatch(series);
+
+  const checks = [
+    compare('bands.valid', reference.bands.valid, bands.valid, 0),
+    compare('bands.framesUsed', reference.bands.framesUsed ?? null, bands.framesUsed ?? null, 0),
+    compare('bands.totalPercentage', reference.bands.totalPercentage, bands.totalPercentage, 0)
+  ];
+  for (const key of Object.keys(reference.bands.bands)) {
+    const expected = reference.bands.bands[key];
+    const actual = bands.bands[key];
+    checks.push(compare(`bands.${key}.energy`, expected.energy, actual.energy, Math.abs(expected.energy || 0) * 1e-12));
+    checks.push(compare(`bands.${key}.energy_db`, expected.energy_db, actual.energy_db, 0));
+    checks.push(compare(`bands.${key}.percentage`, expected.percentage, actual.percentage, 0));
+  }
+
+  checks.push(compare('centroid.centroidHz', reference.centroid?.centroidHz ?? null, centroid?.centroidHz ?? null, 0));
+  checks.push(compare('centroid.average', reference.centroid?.statistics.average ?? null, centroid?.statistics.average ?? null, 0));
+  checks.push(compare('centroid.framesUsed', reference.centroid?.framesUsed ?? null, centroid?.framesUsed ?? null, 0));
+
+  // Agregados em lote: percentil 50 do centróide bate com a mediana (sem arredondamento)
+  const summary = summarizeSeries(series.centroidHz, [50]);
+  if (reference.centroid) {
+    checks.push(compare('aggregates.centroid.p50 ≈ mediana', reference.centroid.statistics.median, summary.percentiles.p50, 0.1));
+  }
+
+  return { label, checks, passed: checks.every(c => c.passed) };
+}
+
+/**
+ * Suite completa: sinal típico, frames silenciosos, frames ausentes e silêncio total
+ */
+async function runFullTestSuite() {
+  console.log('🧪 SPECTRAL BATCH PARITY TESTS\n');
+
+  const scenarios = [
+    ['espectro típico', { numFrames: 300 }],
+    ['frames silenciosos', { numFrames: 257, silentEvery: 5 }],
+    ['frames ausentes', { numFrames: 200, missingEvery: 17 }],
+    ['nível muito baixo', { numFrames: 64, level: 1e-9 }]
+  ];
+
+  const results = scenarios.map(([label, options]) => runParityTest(label, options));
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const check of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${check.name}: esperado=${check.expected} obtido=${check.actual}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários com paridade`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runParityTest, runFullTestSuite };
@@ -0,0 +1,152 @@
+/**
+ * 🧪 STEMS LAZY + WORKER_THREADS TESTS
+ *
+ * Valida a separação de stems sob demanda no servidor:
+ * - worker_threads (SharedArrayBuffer, chunks) produz exatamente os mesmos stems do caminho inline
+ * - Eventos de progresso chegam durante o processamento
+ * - Cache por fingerprint: segunda chamada reaproveita a separação sem recarregar o áudio
+ * - Sugestões sem targetStem/triggerStem não disparam a separação
+ *
+ * Uso: node test/stems-lazy-worker-tests.js
+ */
+
+import {
+  separateStems,
+  getStemsLazy,
+  createLazyStems,
+  cleanupStemsManager
+} from '../lib/audio/features/stems-manager.js';
+
+const SAMPLE_RATE = 48000;
+const STEMS = ['bass', 'drums', 'vocals', 'other'];
+
+function generateAudio(seconds = 3, seed = 7) {
+  const length = seconds * SAMPLE_RATE;
+  const channels = [new Float32Array(length), new Float32Array(length)];
+  let state = seed;
+  const noise = () => {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    return state / 0x3fffffff - 1;
+  };
+  for (let i = 0; i < length; i++) {
+    const t = i / SAMPLE_RATE;
+    const kick = (i % 24000) < 2000 ? 0.6 * Math.sin(2 * Math.PI * 55 * t) : 0;
+    const mid = 0.2 * Math.sin(2 * Math.PI * 880 * t);
+    channels[0][i] = kick + mid + 0.02 * noise();
+    channels[1][i] = kick + mid * 0.8 + 0.02 * noise();
+  }
+  return {
+    sampleRate: SAMPLE_RATE,
+    numberOfChannels: 2,
+    length,
+    duration: seconds,
+    getChannelData: (ch) => channels[ch]
+  };
+}
+
+function sameStems(a, b) {
+  for (const stem of STEMS) {
+    for (let ch = 0; ch < 2; ch++) {
+      const x = a.stems[stem].getChannelData(ch);
+      const y = b.stems[stem].getChannelData(ch);
+      if (x.length !== y.length) return false;
+      for (let i = 0; i < x.length; i++) {
+        if (x[i] !== y[i]) return false;
+      }
+    }
+  }
+  return true;
+}
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Paridade worker_threads × inline + progresso
+ */
+async function runParityTest() {
+  const audio = generateAudio();
+  const progress = [];
+  const worker = await separateStems(audio, { chunkSize: 16384, onProgress: (p) => progress.push(p) });
+  const inline = await separateStems(audio, { forceInline: true });
+
+  return {
+    label: 'worker_threads × inline',
+    checks: [
+      check('separação no worker', !!worker && worker.processedInWorker === true, worker?.method),
+      check('stems idênticos ao inline', !!worker && !!inline && sameStems(worker, inline)),
+      check('métricas idênticas', !!worker && JSON.stringify(worker.metrics) === JSON.stringify(inline.metrics)),
+      check('progresso reportado', progress.length >= 10 && progress[progress.length - 1] > 95, `${progress.length} eventos`)
+    ]
+  };
+}
+
+/**
+ * Cache por fingerprint e carregamento sob demanda
+ */
+async function runLazyCacheTest() {
+  let loads = 0;
+  const loadAudio = async () => {
+    loads++;
+    return generateAudio(1, 3);
+  };
+
+  const lazy = createLazyStems('analysis-abc', loadAudio);
+  const none = await lazy.forSuggestions([{ type: 'eq', targetStem: 'mix' }, { type: 'lufs' }]);
+  const loadsAfterNone = loads;
+
+  const first = lazy.forSuggestions([{ type: 'eq', targetStem: 'bass' }]);
+  const second = getStemsLazy('analysis-abc', loadAudio);
+  const [a, b] = await Promise.all([first, second]);
+  const third = await lazy.get();
+
+  return {
+    label: 'stems sob demanda',
+    checks: [
+      check('sem sugestão de stem não separa', none === null && loadsAfterNone === 0),
+      check('mesma separação compartilhada', a === b && b === third),
+      check('áudio carregado uma única vez', loads === 1, `${loads} carregamentos`),
+      check('handle reporta cache', lazy.isCached === true),
+      check('fingerprint obrigatório', await getStemsLazy(null, loadAudio).then(() => false, () => true))
+    ]
+  };
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 STEMS LAZY + WORKER_THREADS TESTS\n');
+
+  const results = [];
+  for (const test of [runParityTest, runLazyCacheTest]) {
+    const result = await test();
+    result.passed = result.checks.every(c => c.passed);
+    results.push(result);
+  }
+  cleanupStemsManager();
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks) {
+      if (!c.passed) console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} testes passaram`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runParityTest, runFullTestSuite };
@@ -0,0 +1,265 @@
+/**
+ * 🧪 STREAMING STATS ACCURACY TESTS
+ *
+ * Compara os sketches de streaming-stats.js (e os agregadores que passaram a usá-los)
+ * com os resultados exatos "array + sort":
+ * - RunningStats: média/variância/min/max (erro relativo ≤ 1e-9)
+ * - QuantileSketch: exato até EXACT_LIMIT; acima disso erro de rank ≤ 1%
+ * - LoudnessHistogram: LRA R128 e mediana short-term a ±0.01 LU
+ * - DominantFrequencyAggregator: mesma saída do agrupamento com arrays
+ *
+ * Uso: node test/streaming-stats-accuracy-tests.js
+ */
+
+import { RunningStats, QuantileSketch, LoudnessHistogram } from '../lib/audio/utils/streaming-stats.js';
+import { LUFSMeter } from '../lib/audio/features/loudness.js';
+import { DominantFrequencyAggregator } from '../lib/audio/features/dominant-frequencies.js';
+
+/**
+ * Gerador determinístico (LCG) + normal via Box-Muller
+ */
+function createRandom(seed = 20260101) {
+  let state = seed;
+  const uniform = () => {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    return (state + 1) / 0x80000001;
+  };
+  const normal = () => Math.sqrt(-2 * Math.log(uniform())) * Math.cos(2 * Math.PI * uniform());
+  return { uniform, normal };
+}
+
+function exactMedian(values) {
+  const s = values.slice().sort((a, b) => a - b);
+  const m = Math.floor(s.length / 2);
+  return s.length % 2 ? s[m] : (s[m - 1] + s[m]) / 2;
+}
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Referência: agregador de frequências dominantes com arrays (implementação anterior)
+ */
+function legacyDominantAggregate(frameResults) {
+  const all = [];
+  frameResults.forEach(fr => Array.isArray(fr) && fr.forEach(f => f && typeof f.frequency === 'number' && all.push(f)));
+  if (all.length === 0) return [];
+  const groups = [];
+  all.forEach(freq => {
+    const group = groups.find(g => g.some(e => Math.abs(e.frequency - freq.frequency) <= 25));
+    if (group) group.push(freq); else groups.push([freq]);
+  });
+  const mean = (v) => v.reduce((s, x) => s + x, 0) / v.length;
+  const out = groups.map(group => {
+    const magnitudes = group.map(f => f.magnitude);
+    return {
+      frequency: Math.round(exactMedian(group.map(f => f.frequency)) * 10) / 10,
+      meanMagnitude: Math.round(mean(magnitudes) * 1000) / 1000,
+      maxMagnitude: Math.round(Math.max(...magnitudes) * 1000) / 1000,
+      meanProminence: Math.round(mean(group.map(f => f.prominence)) * 1000) / 1000,
+      occurrences: group.length,
+      consistency: Math.round((group.length / frameResults.length) * 100) / 100
+    };
+  });
+  out.sort((a, b) => b.consistency * b.maxMagnitude - a.consistency * a.maxMagnitude);
+  return out.slice(0, 10);
+}
+
+/**
+ * Cenário 1: RunningStats vs média/variância exatas (incluindo merge de blocos)
+ */
+function runRunningStatsTest() {
+  const { normal } = createRandom(7);
+  const values = Array.from({ length: 50000 }, () => 1000 + 3 * normal());
+  const stats = new RunningStats();
+  const left = new RunningStats();
+  const right = new RunningStats();
+  values.forEach((v, i) => {
+    stats.add(v);
+    (i < 20000 ? left : right).add(v);
+  });
+  stats.add(NaN).add(Infinity);
+  left.merge(right);
+
+  const sum = values.reduce((a, v) => a + v, 0);
+  const mean = sum / values.length;
+  const variance = values.reduce((a, v) => a + (v - mean) ** 2, 0) / values.length;
+  const rel = (a, b) => Math.abs(a - b) / Math.abs(b);
+
+  return [
+    check('count ignora não finitos', stats.count === values.length),
+    check('average === reduce/n', stats.average === mean, `${stats.average} vs ${mean}`),
+    check('mean (Welford)', rel(stats.mean, mean) <= 1e-9),
+    check('variance', rel(stats.variance, variance) <= 1e-9, `${stats.variance} vs ${variance}`),
+    check('min/max', stats.min === Math.min(...values) && stats.max === Math.max(...values)),
+    check('merge ≡ sequencial', rel(left.variance, variance) <= 1e-9 && rel(left.mean, mean) <= 1e-9 && left.count === stats.count)
+  ];
+}
+
+/**
+ * Cenário 2: QuantileSketch exato (n ≤ limite) e t-digest (n grande)
+ */
+function runQuantileSketchTest() {
+  const { normal, uniform } = createRandom(11);
+  const checks = [];
+
+  const small = Array.from({ length: 301 }, () => 100 * uniform());
+  const smallSketch = new QuantileSketch();
+  small.forEach(v => smallSketch.add(v));
+  checks.push(check('exato: mediana ímpar', smallSketch.isExact && smallSketch.median() === exactMedian(small)));
+  smallSketch.add(42);
+  checks.push(check('exato: mediana par', smallSketch.median() === exactMedian([...small, 42])));
+
+  const large = Array.from({ length: 200000 }, () => (uniform() < 0.8 ? normal() : 8 + 2 * normal()));
+  const sketch = new QuantileSketch();
+  large.forEach(v => sketch.add(v));
+  const sorted = Float64Array.from(large).sort();
+  const rankOf = (x) => {
+    let lo = 0, hi = sorted.length;
+    while (lo < hi) { const mid = (lo + hi) >> 1; if (sorted[mid] < x) lo = mid + 1; else hi = mid; }
+    return lo / sorted.length;
+  };
+
+  checks.push(check('digest ativo', !sketch.isExact && sketch.centroidCount < 400, `centróides=${sketch.centroidCount}`));
+  for (const q of [0.01, 0.1, 0.5, 0.9, 0.95, 0.99]) {
+    const estimate = sketch.quantile(q);
+    const rankError = Math.abs(rankOf(estimate) - q);
+    checks.push(check(`digest q=${q} erro de rank ≤ 1%`, rankError <= 0.01, `rank=${rankOf(estimate).toFixed(4)}`));
+  }
+  checks.push(check('digest min/max exatos', sketch.quantile(0) === sorted[0] && sketch.quantile(1) === sorted[sorted.length - 1]));
+  return checks;
+}
+
+/**
+ * Cenário 3: LRA R128 e mediana short-term via histograma vs sort exato
+ */
+function runLoudnessHistogramTest() {
+  const { normal, uniform } = createRandom(23);
+  const meter = new LUFSMeter(48000);
+  const checks = [];
+
+  const series = Array.from({ length: 6000 }, (_, i) => {
+    if (i % 250 === 0) return -Infinity;
+    if (i % 97 === 0) return -80 + 5 * uniform();
+    return -14 + 4 * normal() + (i > 3000 ? -6 : 0);
+  });
+  const integrated = -15.2;
+
+  // Referência exata (implementação anterior)
+  const abs = series.filter(v => Number.isFinite(v) && v >= -70);
+  const rel = abs.filter(v => v >= integrated - 20).sort((a, b) => a - b);
+  const p = (arr, q) => arr[Math.min(arr.length - 1, Math.floor(arr.length * q))];
+  const exactLRA = p(rel, 0.95) - p(rel, 0.10);
+
+  const histogram = new LoudnessHistogram();
+  series.forEach(v => histogram.add(v));
+  const fromHistogram = meter.calculateR128LRA(histogram, integrated);
+  const fromArray = meter.calculateR128LRA(series, integrated);
+
+  checks.push(check('R128 LRA |Δ| ≤ 0.01 LU', Math.abs(fromHistogram.lra - exactLRA) <= 0.01, `${fromHistogram.lra} vs ${exactLRA}`));
+  checks.push(check('R128 remaining', fromHistogram.remaining === rel.length, `${fromHistogram.remaining} vs ${rel.length}`));
+  checks.push(check('R128 array ≡ histograma', fromArray.lra === fromHistogram.lra));
+  checks.push(check('R128 sem valores válidos → null', meter.calculateR128LRA(new LoudnessHistogram(), integrated) === null));
+
+  const valid = series.filter(v => v > -Infinity).sort((a, b) => a - b);
+  const legacyLRA = valid[Math.min(Math.floor(valid.length * 0.95), valid.length - 1)] - valid[Math.floor(valid.length * 0.10)];
+  checks.push(check('LRA legacy |Δ| ≤ 0.01 LU', Math.abs(meter.calculateLRA(series) - legacyLRA) <= 0.01));
+
+  const activeThreshold = Math.max(-70, integrated - 10);
+  const active = series.filter(v => Number.isFinite(v) && v > -70 && v >= activeThreshold);
+  const activeMedian = histogram.median(activeThreshold);
+  checks.push(check('mediana ativa |Δ| ≤ 0.01 LU', Math.abs(activeMedian - exactMedian(active)) <= 0.01, `${activeMedian} vs ${exactMedian(active)}`));
+  return checks;
+}
+
+/**
+ * Cenário 4: DominantFrequencyAggregator (streaming) vs agrupamento com arrays
+ */
+function runDominantFrequencyTest() {
+  const { uniform } = createRandom(31);
+  const binHz = 48000 / 4096;
+  const checks = [];
+
+  const makeFrames = (numFrames) => Array.from({ length: numFrames }, (_, f) => {
+    if (f % 41 === 0) return null;
+    const peaks = [];
+    for (const base of [60, 440, 445, 1000, 3150]) {
+      if (uniform() < 0.7) {
+        const bin = Math.round(base / binHz) + Math.floor(uniform() * 5) - 2;
+        peaks.push({
+          frequency: Math.round(bin * binHz * 10) / 10,
+          magnitude: Math.round(uniform() * 10000) / 1000,
+          prominence: Math.round(uniform() * 3000) / 1000
+        });
+      }
+    }
+    if (uniform() < 0.3) peaks.push({ frequency: Math.round(uniform() * 20000 * 10) / 10, magnitude: 0.5, prominence: 0.2 });
+    return peaks;
+  });
+
+  // ≤ 512 membros por grupo → mediana exata, saída idêntica
+  const frames = makeFrames(400);
+  const streaming = DominantFrequencyAggregator.aggregate(frames);
+  const legacy = legacyDominantAggregate(frames);
+  checks.push(check('saída idêntica (grupos pequenos)', JSON.stringify(streaming) === JSON.stringify(legacy)));
+
+  // Grupos grandes (t-digest): só a mediana de frequência pode variar, dentro de 1 bin FFT
+  const longFrames = makeFrames(4000);
+  const longStreaming = DominantFrequencyAggregator.aggregate(longFrames);
+  const longLegacy = legacyDominantAggregate(longFrames);
+  const sameShape = longStreaming.length === longLegacy.length && longStreaming.every((g, i) =>
+    Math.abs(g.frequency - longLegacy[i].frequency) <= binHz &&
+    g.meanMagnitude === longLegacy[i].meanMagnitude &&
+    g.maxMagnitude === longLegacy[i].maxMagnitude &&
+    g.meanProminence === longLegacy[i].meanProminence &&
+    g.occurrences === longLegacy[i].occurrences &&
+    g.consistency === longLegacy[i].consistency);
+  checks.push(check('grupos grandes: frequência |Δ| ≤ 1 bin, demais campos idênticos', sameShape));
+  return checks;
+}
+
+/**
+ * Executa um cenário e resume as verificações
+ */
+function runAccuracyTest(label, scenario) {
+  const checks = scenario();
+  return { label, checks, passed: checks.every(c => c.passed) };
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 STREAMING STATS ACCURACY TESTS\n');
+
+  const results = [
+    runAccuracyTest('RunningStats (Welford)', runRunningStatsTest),
+    runAccuracyTest('QuantileSketch (exato + t-digest)', runQuantileSketchTest),
+    runAccuracyTest('LoudnessHistogram (LRA / mediana short-term)', runLoudnessHistogramTest),
+    runAccuracyTest('DominantFrequencyAggregator (streaming)', runDominantFrequencyTest)
+  ];
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários dentro dos limites de precisão`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
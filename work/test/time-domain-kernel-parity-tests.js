@@ -0,0 +1,164 @@
+/**
+ * 🧪 TIME-DOMAIN KERNEL PARITY TESTS
+ *
+ * Garante que o kernel de passada única (time-domain-kernel.js) produz as mesmas
+ * métricas que os cálculos diretos sobre os canais:
+ * - RMS por bloco (segmentação temporal, 300ms/100ms com zero-padding)
+ * - Dynamic Range e Crest Factor (janelas reconstruídas a partir dos hops)
+ * - Correlação/largura estéreo (Pearson em uma passada vs duas passadas)
+ * - DC offset global e por janela
+ *
+ * Uso: node test/time-domain-kernel-parity-tests.js
+ */
+
+import { computeTimeDomainStats, rmsBlocksFromStats } from '../lib/audio/features/time-domain-kernel.js';
+import { DynamicRangeCalculator, CrestFactorCalculator } from '../lib/audio/features/dynamics-corrected.js';
+import { StereoMetricsCalculator } from '../lib/audio/features/stereo-metrics.js';
+import { calculateDCOffset, calculateDCOffsetFromStats } from '../lib/audio/features/dc-offset.js';
+
+const SAMPLE_RATE = 48000;
+const RMS_BLOCK_SAMPLES = 14400;
+const RMS_HOP_SAMPLES = 4800;
+
+/**
+ * Gera sinal estéreo sintético com envelope (para DR/crest não triviais)
+ */
+function generateStereoSignal({ duration = 5.37, amplitude = 0.4, dc = 0.003, width = 0.3 }) {
+  const length = Math.floor(duration * SAMPLE_RATE);
+  const left = new Float32Array(length);
+  const right = new Float32Array(length);
+  let seed = 987654;
+  const noise = () => {
+    seed = (seed * 1103515245 + 12345) & 0x7fffffff;
+    return (seed / 0x7fffffff) * 2 - 1;
+  };
+
+  for (let i = 0; i < length; i++) {
+    const t = i / SAMPLE_RATE;
+    const envelope = 0.3 + 0.7 * Math.abs(Math.sin(2 * Math.PI * 0.5 * t));
+    const mid = envelope * (Math.sin(2 * Math.PI * 110 * t) * 0.7 + Math.sin(2 * Math.PI * 3300 * t) * 0.1);
+    const side = noise() * width;
+    left[i] = Math.max(-1, Math.min(1, amplitude * (mid + side) + dc));
+    right[i] = Math.max(-1, Math.min(1, amplitude * (mid - side) - dc));
+  }
+
+  return { left, right };
+}
+
+/**
+ * Referência: RMS por bloco exatamente como segmentChannelForRMS
+ */
+function referenceRMSBlocks(channel) {
+  const numBlocks = Math.ceil(channel.length / RMS_HOP_SAMPLES);
+  const values = [];
+  for (let b = 0; b < numBlocks; b++) {
+    const start = b * RMS_HOP_SAMPLES;
+    const end = Math.min(start + RMS_BLOCK_SAMPLES, channel.length);
+    let sumSquares = 0;
+    for (let i = start; i < end; i++) sumSquares += channel[i] * channel[i];
+    values.push(Math.sqrt(sumSquares / RMS_BLOCK_SAMPLES));
+  }
+  return values;
+}
+
+function maxAbsDiff(a, b) {
+  if (a.length !== b.length) return Infinity;
+  let max = 0;
+  for (let i = 0; i < a.length; i++) max = Math.max(max, Math.abs(a[i] - b[i]));
+  return max;
+}
+
+function compare(name, expected, actual, tolerance) {
+  const bothNull = expected === null && actual === null;
+  const same = typeof expected === 'boolean' || typeof expected === 'string'
+    ? expected === actual
+    : bothNull || Math.abs(expected - actual) <= tolerance;
+  return { name, expected, actual, passed: same };
+}
+
+/**
+ * Executa um cenário de paridade
+ */
+function runParityTest(label, signalOptions) {
+  const { left, right } = generateStereoSignal(signalOptions);
+  const stats = computeTimeDomainStats(left, right, SAMPLE_RATE);
+
+  let peakLeft = 0, peakRight = 0;
+  for (let i = 0; i < left.length; i++) {
+    peakLeft = Math.max(peakLeft, Math.abs(left[i]));
+    peakRight = Math.max(peakRight, Math.abs(right[i]));
+  }
+
+  const drDirect = DynamicRangeCalculator.calculateDynamicRange(left, right, SAMPLE_RATE);
+  const drFused = DynamicRangeCalculator.calculateDynamicRangeFromStats(stats);
+  const crestDirect = CrestFactorCalculator.calculateCrestFactor(left, right);
+  const crestFused = CrestFactorCalculator.calculateCrestFactorFromStats(stats);
+
+  const stereo = new StereoMetricsCalculator();
+  const stereoDirect = stereo.analyzeStereoMetrics(left, right);
+  const stereoFused = stereo.analyzeStereoMetricsFromStats(stats);
+
+  const dcDirect = calculateDCOffset(left, right, 1.7);
+  const dcFused = calculateDCOffsetFromStats(stats, 1.7);
+
+  const checks = [
+    compare('peak.left', peakLeft, stats.peak.left, 0),
+    compare('peak.right', peakRight, stats.peak.right, 0),
+    compare('rms.left max |Δ|', 0, maxAbsDiff(referenceRMSBlocks(left), rmsBlocksFromStats(stats, 'left', RMS_BLOCK_SAMPLES)), 1e-9),
+    compare('rms.right max |Δ|', 0, maxAbsDiff(referenceRMSBlocks(right), rmsBlocksFromStats(stats, 'right', RMS_BLOCK_SAMPLES)), 1e-9),
+    compare('dr.dynamicRange', drDirect?.dynamicRange ?? null, drFused?.dynamicRange ?? null, 1e-6),
+    compare('dr.windowCount', drDirect?.windowCount ?? null, drFused?.windowCount ?? null, 0),
+    compare('crest.crestFactor', crestDirect?.crestFactor ?? null, crestFused?.crestFactor ?? null, 1e-6),
+    compare('crest.crestFactorP95', crestDirect?.crestFactorP95 ?? null, crestFused?.crestFactorP95 ?? null, 1e-6),
+    compare('crest.totalWindows', crestDirect?.totalWindows ?? null, crestFused?.totalWindows ?? null, 0),
+    compare('stereo.valid', stereoDirect.valid, stereoFused.valid, 0),
+    compare('stereo.correlation', stereoDirect.correlation, stereoFused.correlation, 1e-3),
+    compare('stereo.width', stereoDirect.width, stereoFused.width, 1e-3),
+    compare('dc.leftDC', dcDirect.leftDC, dcFused.leftDC, 1e-4),
+    compare('dc.rightDC', dcDirect.rightDC, dcFused.rightDC, 1e-4),
+    compare('dc.temporalVariation', dcDirect.temporalVariation, dcFused.temporalVariation, 1e-4),
+    compare('dc.windowsAnalyzed', dcDirect.metadata.windowsAnalyzed, dcFused.metadata.windowsAnalyzed, 0)
+  ];
+
+  return { label, checks, passed: checks.every(c => c.passed) };
+}
+
+/**
+ * Suite completa: sinal típico, muito estreito, silêncio e áudio curto
+ */
+async function runFullTestSuite() {
+  console.log('🧪 TIME-DOMAIN KERNEL PARITY TESTS\n');
+
+  const scenarios = [
+    ['sinal típico', {}],
+    ['mono (width 0)', { width: 0, dc: 0 }],
+    ['quente com clipping', { amplitude: 1.2, dc: 0.02 }],
+    ['silêncio', { amplitude: 0, dc: 0 }],
+    ['curto (0.35s)', { duration: 0.35 }]
+  ];
+
+  const results = scenarios.map(([label, signal]) => runParityTest(label, signal));
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const check of result.checks.filter(c => !c.passed)) {
+      console.log(`   ❌ ${check.name}: esperado=${check.expected} obtido=${check.actual}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} cenários com paridade`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runParityTest, runFullTestSuite };
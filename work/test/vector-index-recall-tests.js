@@ -0,0 +1,183 @@
+/**
+ * 🧪 VECTOR INDEX RECALL TESTS
+ *
+ * Mede o índice HNSW (lib/audio/utils/vector-index.js) contra o scan linear (brute force):
+ * - recall@k >= MIN_RECALL em fingerprints sintéticos agrupados (6 e 16 dimensões)
+ * - consulta top-k abaixo de 1 ms em média
+ * - inserção incremental mantém o recall; toJSON/fromJSON devolve as mesmas respostas
+ * - getReferenceIndex (reference-matcher) acompanha o crescimento da biblioteca
+ *
+ * Uso: node test/vector-index-recall-tests.js
+ */
+
+import { performance } from 'perf_hooks';
+import { VectorIndex } from '../lib/audio/utils/vector-index.js';
+import { getReferenceIndex } from '../lib/audio/features/reference-matcher.js';
+
+const MIN_RECALL = 0.95;
+const MAX_QUERY_MS = 1;
+
+function createRandom(seed) {
+  let state = seed;
+  return () => {
+    state = (state * 1103515245 + 12345) & 0x7fffffff;
+    return state / 0x7fffffff;
+  };
+}
+
+/**
+ * Vetores agrupados (estilos musicais ≈ clusters) com ruído gaussiano aproximado
+ */
+function generateVectors(count, dimensions, seed = 11, clusters = 24) {
+  const random = createRandom(seed);
+  const gaussian = () => (random() + random() + random() + random() - 2) * 0.9;
+  const centers = Array.from({ length: clusters }, () => Array.from({ length: dimensions }, () => gaussian() * 2));
+  return Array.from({ length: count }, () => {
+    const center = centers[Math.floor(random() * clusters)];
+    return center.map(c => c + gaussian() * 0.6);
+  });
+}
+
+function recallAt(index, queries, k) {
+  let hits = 0;
+  let elapsed = 0;
+  for (const query of queries) {
+    const t0 = performance.now();
+    const approx = index.search(query, k);
+    elapsed += performance.now() - t0;
+    const exact = new Set(index.bruteForce(query, k).map(r => r.id));
+    hits += approx.filter(r => exact.has(r.id)).length;
+  }
+  return { recall: hits / (queries.length * k), avgMs: elapsed / queries.length };
+}
+
+function check(name, passed, detail = '') {
+  return { name, passed, detail };
+}
+
+/**
+ * Recall e latência para uma configuração
+ */
+function runAccuracyTest(label, { count, dimensions, k = 5 }) {
+  // Consultas da mesma distribuição (held-out), como faixas novas de estilos conhecidos
+  const all = generateVectors(count + 200, dimensions);
+  const vectors = all.slice(0, count);
+  const queries = all.slice(count);
+  const index = new VectorIndex({ dimensions });
+  const t0 = performance.now();
+  vectors.forEach((v, i) => index.add(`ref-${i}`, v));
+  const buildMs = performance.now() - t0;
+
+  // Aquecimento (JIT) antes de medir
+  recallAt(index, queries.slice(0, 20), k);
+  const { recall, avgMs } = recallAt(index, queries, k);
+
+  return {
+    label,
+    checks: [
+      check(`recall@${k} >= ${MIN_RECALL}`, recall >= MIN_RECALL, `${recall.toFixed(3)}`),
+      check(`consulta < ${MAX_QUERY_MS} ms`, avgMs < MAX_QUERY_MS, `${avgMs.toFixed(3)} ms (build ${buildMs.toFixed(0)} ms)`)
+    ]
+  };
+}
+
+/**
+ * Inserção incremental + persistência
+ */
+function runIncrementalTest() {
+  const dimensions = 6;
+  const all = generateVectors(4100, dimensions, 5);
+  const vectors = all.slice(0, 4000);
+  const queries = all.slice(4000);
+  const index = new VectorIndex({ dimensions });
+
+  vectors.slice(0, 2000).forEach((v, i) => index.add(i, v));
+  const before = recallAt(index, queries, 5).recall;
+  vectors.slice(2000).forEach((v, i) => index.add(2000 + i, v));
+  const after = recallAt(index, queries, 5).recall;
+
+  const restored = VectorIndex.fromJSON(JSON.parse(JSON.stringify(index.toJSON())));
+  const same = queries.every(q => JSON.stringify(restored.search(q, 5)) === JSON.stringify(index.search(q, 5)));
+  restored.add('novo', vectors[0].map(v => v + 0.001));
+  const found = restored.search(vectors[0], 2).some(r => r.id === 'novo');
+
+  return {
+    label: 'incremental + persistência',
+    checks: [
+      check('recall com metade inserida', before >= MIN_RECALL, before.toFixed(3)),
+      check('recall após inserções incrementais', after >= MIN_RECALL, after.toFixed(3)),
+      check('duplicado ignorado', index.add(0, vectors[0]) === false && index.size === 4000),
+      check('fromJSON responde igual', same),
+      check('inserção após fromJSON', found && restored.size === 4001)
+    ]
+  };
+}
+
+/**
+ * Índice do reference-matcher acompanha a biblioteca
+ */
+function runReferenceIndexTest() {
+  const random = createRandom(3);
+  const makeRef = (i) => ({
+    id: `ref-${i}`,
+    bands: Object.fromEntries(['sub', 'low', 'mid', 'high'].map(b => [b, { target_db: -20 + random() * 14 }])),
+    centroid_target: 1500 + random() * 2000,
+    flatness_target: random() * 0.4
+  });
+  const lib = Array.from({ length: 300 }, (_, i) => makeRef(i));
+
+  const first = getReferenceIndex(lib);
+  lib.push(...Array.from({ length: 50 }, (_, i) => makeRef(300 + i)));
+  const grown = getReferenceIndex(lib);
+  const rebuilt = getReferenceIndex(lib.slice());
+
+  const query = lib[320]._fingerprint;
+  const top = grown.search(query, 1)[0];
+
+  return {
+    label: 'reference-matcher: índice da biblioteca',
+    checks: [
+      check('mesmo índice após crescer (incremental)', first === grown && grown.size === 350, `${grown.size}`),
+      check('nova biblioteca reconstrói', rebuilt !== grown && rebuilt.size === 350),
+      check('referência encontra a si mesma', top.id === 320, `${top.id}`)
+    ]
+  };
+}
+
+/**
+ * Suite completa
+ */
+async function runFullTestSuite() {
+  console.log('🧪 VECTOR INDEX RECALL TESTS\n');
+
+  const results = [
+    runAccuracyTest('fingerprint 6D × 10k', { count: 10000, dimensions: 6 }),
+    runAccuracyTest('fingerprint 16D × 5k', { count: 5000, dimensions: 16 }),
+    runIncrementalTest(),
+    runReferenceIndexTest()
+  ].map(result => ({ ...result, passed: result.checks.every(c => c.passed) }));
+
+  for (const result of results) {
+    console.log(`${result.passed ? '✅' : '❌'} ${result.label}`);
+    for (const c of result.checks) {
+      if (!c.passed) console.log(`   ❌ ${c.name}${c.detail ? `: ${c.detail}` : ''}`);
+      else if (c.detail) console.log(`   · ${c.name}: ${c.detail}`);
+    }
+  }
+
+  const passedCount = results.filter(r => r.passed).length;
+  console.log(`\n📊 RESULTADO FINAL: ${passedCount}/${results.length} testes passaram`);
+  return passedCount === results.length ? 0 : 1;
+}
+
+// Executar se chamado diretamente
+if (import.meta.url === `file://${process.argv[1]}`) {
+  runFullTestSuite()
+    .then(exitCode => process.exit(exitCode))
+    .catch(error => {
+      console.error('Erro fatal:', error);
+      process.exit(1);
+    });
+}
+
+export { runAccuracyTest, runFullTestSuite };
@@ -0,0 +1,36 @@
+#!/usr/bin/env node
+
+/**
+ * 🎼 BUILD GENRE CENTROIDS - Pré-computa a tabela do classificador de gênero
+ *
+ * Lê os targets por gênero (genres.json + <genero>.json) e grava refs/genre-centroids.json,
+ * carregado pelo lib/audio/features/genre-classifier.js no worker.
+ * Rodar sempre que os targets de refs/out forem regenerados.
+ *
+ * Uso:
+ *   node tools/build-genre-centroids.js                     (lê ../public/refs/out)
+ *   node tools/build-genre-centroids.js --in refs/out --out refs/genre-centroids.json
+ */
+
+import fs from 'fs';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { buildCentroidTable } from '../lib/audio/features/genre-classifier.js';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+
+function readArg(name, fallback) {
+  const index = process.argv.indexOf(name);
+  return index >= 0 && process.argv[index + 1] ? path.resolve(process.argv[index + 1]) : fallback;
+}
+
+const refsDir = readArg('--in', path.join(__dirname, '..', '..', 'public', 'refs', 'out'));
+const outPath = readArg('--out', path.join(__dirname, '..', 'refs', 'genre-centroids.json'));
+
+const table = buildCentroidTable(refsDir);
+fs.writeFileSync(outPath, JSON.stringify(table, null, 2) + '\n');
+
+console.log(`✅ [GENRE-CENTROIDS] ${Object.keys(table.genres).length} gêneros → ${path.relative(process.cwd(), outPath)}`);
+for (const [genre, { mean }] of Object.entries(table.genres)) {
+  console.log(`   · ${genre}: ${Object.keys(mean).length} features`);
+}
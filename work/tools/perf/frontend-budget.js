@@ -0,0 +1,145 @@
+// 🔬 FRONTEND PARSE BUDGET
+// Mede o custo de parse/compilação (V8) dos scripts que bloqueiam o DOMContentLoaded do
+// index.html (clássicos síncronos/defer + módulos locais) e dos blocos sob demanda do
+// public/analyzer-loader.js. Serve de proxy do "first interactive" no mobile: todo JS
+// eager precisa ser baixado, parseado e executado antes do DOMContentLoaded.
+// Números reais de navegador: AnalyzerLoader.report() no DevTools.
+//
+// Uso:
+//   node tools/perf/frontend-budget.js
+//   git show <commit>:public/index.html > /tmp/index-before.html
+//   node tools/perf/frontend-budget.js --before=/tmp/index-before.html --budget=50 --budgetKb=3072
+
+import fs from 'fs';
+import path from 'path';
+import vm from 'vm';
+import { performance } from 'perf_hooks';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const PUBLIC_DIR = path.resolve(__dirname, '..', '..', '..', 'public');
+
+function parseArgs() {
+  const args = {
+    html: path.join(PUBLIC_DIR, 'index.html'),
+    before: null,
+    budget: 50,      // ms de parse/compilação eager (desktop; mobile médio ≈ 4-5x)
+    budgetKb: 3072,  // KB eager (determinístico; não depende da máquina)
+    runs: 5
+  };
+
+  for (const arg of process.argv.slice(2)) {
+    const [name, value] = arg.replace(/^--/, '').split('=');
+    if (name in args) args[name] = ['budget', 'budgetKb', 'runs'].includes(name) ? Number(value) : path.resolve(value);
+  }
+
+  return args;
+}
+
+/**
+ * Scripts locais que rodam antes do DOMContentLoaded, na ordem do HTML
+ */
+function listEagerScripts(htmlPath) {
+  const html = fs.readFileSync(htmlPath, 'utf8').replace(/<!--[\s\S]*?-->/g, '');
+  const scripts = [];
+  for (const [, attrs] of html.matchAll(/<script\b([^>]*)>/g)) {
+    const src = attrs.match(/\bsrc="([^"]+)"/)?.[1];
+    if (!src || /^https?:/.test(src) || /\basync\b/.test(attrs)) continue;
+    scripts.push(src);
+  }
+  return scripts;
+}
+
+function resolveScript(src) {
+  const clean = src.split('?')[0];
+  return clean.startsWith('/') ? path.join(PUBLIC_DIR, clean) : path.resolve(PUBLIC_DIR, clean);
+}
+
+/**
+ * Manifesto de blocos do analyzer-loader (avaliado sem DOM)
+ */
+function loadChunkManifest() {
+  const loaderPath = path.join(PUBLIC_DIR, 'analyzer-loader.js');
+  if (!fs.existsSync(loaderPath)) return {};
+  const sandbox = { window: {}, log: () => {}, warn: () => {} };
+  vm.runInNewContext(fs.readFileSync(loaderPath, 'utf8'), sandbox, { filename: loaderPath });
+  return sandbox.window.AnalyzerLoader?.chunks || {};
+}
+
+let compileCounter = 0;
+
+/**
+ * Mediana do tempo de compilação (parse completo do top-level + pre-parse das funções)
+ */
+function measureScript(src, runs) {
+  const file = resolveScript(src);
+  if (!fs.existsSync(file)) return null;
+  let source = fs.readFileSync(file, 'utf8');
+  // Módulos (vm.SourceTextModule exige flag experimental): remove import/export e compila como script
+  if (/^\s*(import|export)\s/m.test(source)) {
+    source = source
+      .replace(/^\s*import\s[\s\S]*?from\s*['"][^'"]+['"];?/gm, '')
+      .replace(/^\s*import\s*['"][^'"]+['"];?/gm, '')
+      .replace(/^\s*export\s*\{[^}]*\}(\s*from\s*['"][^'"]+['"])?;?/gm, '')
+      .replace(/^(\s*)export\s+default\s+(?=(async\s+)?(function|class)\b)/gm, '$1')
+      .replace(/^(\s*)export\s+default\s+/gm, '$1void ')
+      .replace(/^(\s*)export\s+/gm, '$1');
+  }
+
+  const samples = [];
+  for (let i = 0; i < runs; i++) {
+    // Sufixo único: o cache de compilação do V8 é indexado pelo texto do script
+    const unique = `${source}\n// run ${++compileCounter}`;
+    const t0 = performance.now();
+    new vm.Script(unique, { filename: file });
+    samples.push(performance.now() - t0);
+  }
+  samples.sort((a, b) => a - b);
+  return { src, bytes: Buffer.byteLength(source), parseMs: samples[Math.floor(samples.length / 2)] };
+}
+
+function summarize(label, entries) {
+  const valid = entries.filter(Boolean);
+  const bytes = valid.reduce((acc, e) => acc + e.bytes, 0);
+  const parseMs = valid.reduce((acc, e) => acc + e.parseMs, 0);
+  return { label, scripts: valid.length, kb: Math.round(bytes / 1024), parseMs: Number(parseMs.toFixed(1)) };
+}
+
+function main() {
+  const args = parseArgs();
+  const measure = (list) => list.map(src => measureScript(src, args.runs));
+
+  const current = measure(listEagerScripts(args.html));
+  const rows = [summarize('eager (atual)', current)];
+
+  if (args.before) {
+    rows.unshift(summarize('eager (antes)', measure(listEagerScripts(args.before))));
+  }
+
+  for (const [name, chunk] of Object.entries(loadChunkManifest())) {
+    rows.push(summarize(`sob demanda: ${name}`, measure(chunk.scripts)));
+  }
+
+  console.log('🔬 FRONTEND PARSE BUDGET\n');
+  console.table(rows);
+
+  const heaviest = current.filter(Boolean).sort((a, b) => b.parseMs - a.parseMs).slice(0, 5);
+  console.log('Mais pesados no caminho crítico:');
+  for (const e of heaviest) console.log(`   · ${e.src}: ${(e.bytes / 1024).toFixed(0)} KB, ${e.parseMs.toFixed(1)} ms`);
+
+  const eager = rows.find(r => r.label === 'eager (atual)');
+  if (args.before) {
+    const before = rows[0];
+    const saved = before.parseMs - eager.parseMs;
+    console.log(`\n📉 Parse eager: ${before.parseMs} → ${eager.parseMs} ms (${(-saved).toFixed(1)} ms, ${eager.kb - before.kb} KB)`);
+  }
+
+  const withinParse = eager.parseMs <= args.budget;
+  const withinSize = eager.kb <= args.budgetKb;
+  console.log(`${withinParse ? '✅' : '❌'} Orçamento de parse eager: ${eager.parseMs} / ${args.budget} ms`);
+  console.log(`${withinSize ? '✅' : '❌'} Orçamento de tamanho eager: ${eager.kb} / ${args.budgetKb} KB`);
+  const withinBudget = withinParse && withinSize;
+  process.exit(withinBudget ? 0 : 1);
+}
+
+main();
@@ -0,0 +1,170 @@
+// 🔬 LOGGING BENCH
+// Custo dos logs no pipeline completo: mesma análise com LOG_LEVEL=info (produção) e
+// LOG_LEVEL=debug/trace, cada execução num processo novo (como o fork por job do worker).
+// Mede tempo do processAudioComplete e bytes/linhas escritos em stdout+stderr.
+//
+// Uso:
+//   node tools/perf/logging-bench.js audio.wav [--runs=5] [--levels=info,debug,trace] [--genre=funk_mandela]
+//   node tools/perf/logging-bench.js --micro [--iterations=2000000]
+//
+// --micro não precisa de áudio/ffmpeg: custo por chamada de debug desligado (thunk vs argumentos
+// montados na chamada, como nos console.log antigos).
+
+import fs from 'fs';
+import path from 'path';
+import { fork } from 'child_process';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+
+function parseArgs() {
+  const args = { file: null, runs: 5, levels: 'info,debug,trace', genre: 'funk_mandela', iterations: 2000000, micro: false, child: false };
+  for (const arg of process.argv.slice(2)) {
+    if (!arg.startsWith('--')) {
+      args.file = arg;
+      continue;
+    }
+    const [name, value] = arg.replace(/^--/, '').split('=');
+    if (value === undefined) args[name] = true;
+    else if (typeof args[name] === 'number') args[name] = Number(value);
+    else args[name] = value;
+  }
+  return args;
+}
+
+function median(values) {
+  const sorted = [...values].sort((a, b) => a - b);
+  const mid = Math.floor(sorted.length / 2);
+  return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+/**
+ * Processo filho: uma análise completa com o LOG_LEVEL herdado do pai
+ */
+async function runChild(args) {
+  const { processAudioComplete } = await import('../../api/audio/pipeline-complete.js');
+  const buffer = fs.readFileSync(args.file);
+  const start = process.hrtime.bigint();
+  const result = await processAudioComplete(buffer, path.basename(args.file), {
+    jobId: '00000000-0000-4000-8000-000000000000',
+    mode: 'genre',
+    genre: args.genre
+  });
+  const ms = Number(process.hrtime.bigint() - start) / 1e6;
+  process.send({ ms, score: result?.score ?? null }, () => process.exit(0));
+}
+
+/**
+ * Uma execução num processo novo; stdout/stderr contados, não exibidos
+ */
+function runOnce(args, level) {
+  return new Promise((resolve, reject) => {
+    const child = fork(__filename, [args.file, '--child', `--genre=${args.genre}`], {
+      env: { ...process.env, LOG_LEVEL: level, LOG_FORMAT: process.env.LOG_FORMAT || 'pretty' },
+      silent: true
+    });
+    let bytes = 0;
+    let lines = 0;
+    let stderrTail = '';
+    const count = (chunk) => {
+      bytes += chunk.length;
+      for (let i = 0; i < chunk.length; i++) if (chunk[i] === 10) lines++;
+    };
+    child.stdout.on('data', count);
+    child.stderr.on('data', chunk => {
+      count(chunk);
+      stderrTail = (stderrTail + chunk.toString()).slice(-2000);
+    });
+
+    let message = null;
+    child.on('message', msg => { message = msg; });
+    child.on('error', reject);
+    child.on('exit', code => {
+      if (!message) {
+        return reject(new Error(`análise com LOG_LEVEL=${level} terminou sem resultado (exit ${code})\n${stderrTail}`));
+      }
+      resolve({ ...message, bytes, lines });
+    });
+  });
+}
+
+async function runPipelineBench(args) {
+  const levels = args.levels.split(',').map(l => l.trim()).filter(Boolean);
+  console.log(`[LOGGING-BENCH] ${path.basename(args.file)} — ${args.runs} execução(ões) por nível: ${levels.join(', ')}`);
+
+  // Aquecimento: cache de disco do áudio e dos módulos
+  await runOnce(args, 'warn');
+
+  const rows = [];
+  for (const level of levels) {
+    const runs = [];
+    for (let i = 0; i < args.runs; i++) runs.push(await runOnce(args, level));
+    rows.push({
+      LOG_LEVEL: level,
+      medianMs: +median(runs.map(r => r.ms)).toFixed(1),
+      minMs: +Math.min(...runs.map(r => r.ms)).toFixed(1),
+      outputKB: +(median(runs.map(r => r.bytes)) / 1024).toFixed(1),
+      lines: median(runs.map(r => r.lines)),
+      score: runs[0].score
+    });
+  }
+
+  const base = rows.find(r => r.LOG_LEVEL === 'info') || rows[0];
+  for (const row of rows) {
+    row.vsInfo = `${(((row.medianMs - base.medianMs) / base.medianMs) * 100).toFixed(1)}%`;
+  }
+  console.table(rows);
+}
+
+/**
+ * ns por chamada de debug com o nível desligado
+ */
+async function runMicroBench(args) {
+  const { createLogger, reconfigureLogger } = await import('../../lib/logger.js');
+  reconfigureLogger({ level: 'info' });
+  const logger = createLogger('bench');
+
+  const frame = { index: 0, bands: { sub: 22.41, bass: 25.13, mid: 12.3, presence: 6.2, air: 3.4 }, energy: 1.234e-3 };
+  const time = (fn) => {
+    for (let i = 0; i < 100000; i++) fn(i);
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < args.iterations; i++) fn(i);
+    return Number(process.hrtime.bigint() - start) / args.iterations;
+  };
+
+  const rows = [
+    {
+      call: 'debug desligado, argumentos montados (console.log antigo)',
+      ns: time(i => logger.debug(`[FRAME] ${i} energy=${frame.energy.toExponential(3)}`, JSON.stringify(frame.bands)))
+    },
+    {
+      call: 'debug desligado, thunk',
+      ns: time(i => logger.debug(() => [`[FRAME] ${i} energy=${frame.energy.toExponential(3)}`, JSON.stringify(frame.bands)]))
+    },
+    {
+      call: 'guard por flag (if (logger.debugEnabled))',
+      ns: time(i => { if (logger.debugEnabled) logger.debug(`[FRAME] ${i}`, JSON.stringify(frame.bands)); })
+    }
+  ].map(row => ({ ...row, ns: +row.ns.toFixed(1) }));
+
+  console.log(`[LOGGING-BENCH] micro: ${args.iterations} chamadas por caso`);
+  console.table(rows);
+}
+
+const args = parseArgs();
+if (args.child) {
+  runChild(args).catch(error => {
+    console.error('[LOGGING-BENCH] ❌', error);
+    process.exit(1);
+  });
+} else if (args.micro) {
+  runMicroBench(args);
+} else if (!args.file) {
+  console.error('Uso: node tools/perf/logging-bench.js audio.wav [--runs=5] [--levels=info,debug,trace] | --micro');
+  process.exit(1);
+} else {
+  runPipelineBench(args).catch(error => {
+    console.error('[LOGGING-BENCH] ❌', error.message);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,112 @@
+// 🔬 RATE LIMIT LOAD TEST
+// Compara o limitador antigo (INCR + EXPIRE, 1-2 round trips) com o script Lua
+// de lib/redisRateLimit.js (1 round trip + cache local) contra um Redis local.
+//
+// Uso:
+//   REDIS_URL=redis://127.0.0.1:6379 node tools/perf/rate-limit-bench.js
+//   node tools/perf/rate-limit-bench.js --requests=50000 --concurrency=200 --keys=500 --limit=30
+
+import Redis from 'ioredis';
+import { RedisRateLimiter } from '../../lib/redisRateLimit.js';
+
+function parseArgs() {
+  const args = {
+    requests: 20000,
+    concurrency: 100,
+    keys: 200,
+    limit: 30
+  };
+
+  for (const arg of process.argv.slice(2)) {
+    const [name, value] = arg.replace(/^--/, '').split('=');
+    if (name in args) args[name] = Number(value);
+  }
+
+  return args;
+}
+
+/**
+ * Implementação anterior de rateLimiterRedis.js (referência para comparação)
+ */
+async function legacyCheck(redis, key, limit) {
+  const now = new Date();
+  const minute = `${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}`;
+  const current = await redis.incr(`${key}:${minute}`);
+  if (current === 1) {
+    await redis.expire(`${key}:${minute}`, 60);
+  }
+  return { allowed: current <= limit };
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  const idx = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, idx)];
+}
+
+async function runScenario(name, check, { requests, concurrency, keys, limit }) {
+  const latencies = new Float64Array(requests);
+  let next = 0;
+  let allowed = 0;
+
+  const worker = async () => {
+    while (next < requests) {
+      const i = next++;
+      const key = `bench:${name}:k${i % keys}`;
+      const t0 = process.hrtime.bigint();
+      const result = await check(key, limit);
+      latencies[i] = Number(process.hrtime.bigint() - t0) / 1e6;
+      if (result.allowed) allowed++;
+    }
+  };
+
+  const start = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: concurrency }, worker));
+  const totalMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+  const sorted = Array.from(latencies).sort((a, b) => a - b);
+  return {
+    scenario: name,
+    rps: Math.round(requests / (totalMs / 1000)),
+    p50Ms: +percentile(sorted, 50).toFixed(3),
+    p99Ms: +percentile(sorted, 99).toFixed(3),
+    allowed,
+    blocked: requests - allowed
+  };
+}
+
+async function main() {
+  const args = parseArgs();
+  const redis = new Redis(process.env.REDIS_URL || 'redis://127.0.0.1:6379', { enableAutoPipelining: true });
+
+  console.log('[RATE-BENCH] Config:', args);
+
+  const slidingNoCache = new RedisRateLimiter(redis, { algorithm: 'sliding', localCache: false });
+  const slidingCached = new RedisRateLimiter(redis, { algorithm: 'sliding' });
+  const tokenBucket = new RedisRateLimiter(redis, { algorithm: 'token_bucket' });
+
+  const scenarios = [
+    ['legacy-incr-expire', (key, limit) => legacyCheck(redis, key, limit)],
+    ['lua-sliding', (key, limit) => slidingNoCache.check(key, limit)],
+    ['lua-sliding+local-cache', (key, limit) => slidingCached.check(key, limit)],
+    ['lua-token-bucket+local-cache', (key, limit) => tokenBucket.check(key, limit)]
+  ];
+
+  const results = [];
+  for (const [name, check] of scenarios) {
+    // Chaves novas por cenário (prefixo inclui o nome)
+    results.push(await runScenario(name, check, args));
+  }
+
+  console.table(results);
+  console.log('[RATE-BENCH] Cache local (sliding):', slidingCached.getMetrics());
+
+  const keysToClean = await redis.keys('bench:*');
+  if (keysToClean.length > 0) await redis.del(...keysToClean);
+  await redis.quit();
+}
+
+main().catch((err) => {
+  console.error('[RATE-BENCH] ❌ Falha:', err.message);
+  process.exit(1);
+});
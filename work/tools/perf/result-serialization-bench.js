@@ -0,0 +1,95 @@
+// 🔬 RESULT SERIALIZATION BENCH
+// Compara, por resultado de análise, o caminho antigo (JSON.stringify no IPC, no Postgres e no
+// returnvalue do BullMQ) com lib/serialization/result-schema.js: bytes e tempo de serialização.
+//
+// Entrada: resultados reais exportados de jobs.results (um objeto ou um array de objetos), ex.:
+//   psql "$DATABASE_URL" -Atc "SELECT json_agg(results) FROM (SELECT results FROM jobs WHERE status = 'completed' LIMIT 50) t" > results.json
+//
+// Uso:
+//   node tools/perf/result-serialization-bench.js results.json [--iterations=500]
+
+import fs from 'fs';
+import {
+  serializeResultJSON,
+  encodeResultWire,
+  decodeResultWire
+} from '../../lib/serialization/result-schema.js';
+
+function parseArgs() {
+  const args = { file: null, iterations: 500 };
+  for (const arg of process.argv.slice(2)) {
+    if (!arg.startsWith('--')) {
+      args.file = arg;
+      continue;
+    }
+    const [name, value] = arg.replace(/^--/, '').split('=');
+    if (name in args) args[name] = Number(value);
+  }
+  return args;
+}
+
+/**
+ * Tempo médio por operação (µs) após aquecimento do JIT
+ */
+function timeOp(fn, iterations) {
+  for (let i = 0; i < Math.min(iterations, 200); i++) fn();
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) fn();
+  return Number(process.hrtime.bigint() - start) / 1e3 / iterations;
+}
+
+function main() {
+  const args = parseArgs();
+  if (!args.file) {
+    console.error('Uso: node tools/perf/result-serialization-bench.js results.json [--iterations=500]');
+    process.exit(1);
+  }
+
+  const parsed = JSON.parse(fs.readFileSync(args.file, 'utf8'));
+  const results = (Array.isArray(parsed) ? parsed : [parsed])
+    .map(r => (typeof r === 'string' ? JSON.parse(r) : r))
+    .filter(r => r && typeof r === 'object');
+  console.log(`[SERIALIZE-BENCH] ${results.length} resultado(s), ${args.iterations} iterações cada`);
+
+  const rows = results.map((result, index) => {
+    const plain = JSON.stringify(result);
+    const json = serializeResultJSON(result);
+    const wire = encodeResultWire(result);
+    const iterations = args.iterations;
+    // Mesmo resumo que worker-redis.js devolve ao BullMQ
+    const summary = JSON.stringify({
+      jobId: result.metadata?.jobId ?? null,
+      status: 'completed',
+      score: result.score ?? null,
+      processingTime: result.metadata?.processingTime ?? null,
+      payloadBytes: wire.length
+    });
+
+    return {
+      result: result.metadata?.jobId?.substring(0, 8) || `#${index}`,
+      jsonKB: +(Buffer.byteLength(plain) / 1024).toFixed(1),
+      schemaJsonKB: +(Buffer.byteLength(json) / 1024).toFixed(1),
+      wireKB: +(wire.length / 1024).toFixed(1),
+      wireVsJson: `${((1 - wire.length / Buffer.byteLength(plain)) * 100).toFixed(0)}%`,
+      returnvalueB: Buffer.byteLength(summary),
+      stringifyUs: +timeOp(() => JSON.stringify(result), iterations).toFixed(1),
+      schemaJsonUs: +timeOp(() => serializeResultJSON(result), iterations).toFixed(1),
+      parseUs: +timeOp(() => JSON.parse(plain), iterations).toFixed(1),
+      wireEncodeUs: +timeOp(() => encodeResultWire(result), iterations).toFixed(1),
+      wireDecodeUs: +timeOp(() => decodeResultWire(wire), iterations).toFixed(1)
+    };
+  });
+
+  console.table(rows);
+
+  const sum = (key) => rows.reduce((acc, row) => acc + row[key], 0);
+  console.log('[SERIALIZE-BENCH] Total:', {
+    jsonKB: +sum('jsonKB').toFixed(1),
+    schemaJsonKB: +sum('schemaJsonKB').toFixed(1),
+    wireKB: +sum('wireKB').toFixed(1),
+    // Antes: resultado completo também ia para o Redis como returnvalue do BullMQ
+    redisReturnvalueKB: { before: +sum('jsonKB').toFixed(1), after: +(sum('returnvalueB') / 1024).toFixed(1) }
+  });
+}
+
+main();
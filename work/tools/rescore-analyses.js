@@ -0,0 +1,125 @@
+#!/usr/bin/env node
+
+/**
+ * 🔁 RESCORE ANALYSES - Re-scoring em massa das análises salvas
+ *
+ * Depois de atualizar os targets em refs/out (update_all_genres.py, set_band_tolerance_zero.py...),
+ * as análises já salvas em jobs.results continuam com score e sugestões dos targets antigos.
+ * Este backfill re-executa só computeMixScore + Motor V2 de sugestões sobre os dados técnicos
+ * salvos (sem baixar nem decodificar áudio) e grava o resultado no próprio job.
+ *
+ * Idempotente: análises cujos targets salvos já são os atuais são puladas.
+ * O cursor é gravado a cada lote no checkpoint; --resume continua de onde parou.
+ *
+ * Uso:
+ *   node tools/rescore-analyses.js [--genre funk_bh] [--batch-size 100] [--delay-ms 250]
+ *                                  [--limit 5000] [--dry-run] [--force] [--resume]
+ *                                  [--checkpoint .rescore-checkpoint.json]
+ */
+
+import fs from 'fs';
+import path from 'path';
+import pool from '../db.js';
+import { loadGenreTargetsFromWorker, clearTargetsCache } from '../lib/audio/utils/genre-targets-loader.js';
+import { createJobsSource, runBackfill, BACKFILL_CONFIG } from '../lib/rescoring/analysisBackfill.js';
+import { rescoreAnalysis } from '../lib/rescoring/rescoreAnalysis.js';
+
+function readArg(name, fallback) {
+  const index = process.argv.indexOf(name);
+  return index >= 0 && process.argv[index + 1] ? process.argv[index + 1] : fallback;
+}
+
+const hasFlag = (name) => process.argv.includes(name);
+
+const options = {
+  genre: readArg('--genre', null),
+  batchSize: Number(readArg('--batch-size', BACKFILL_CONFIG.BATCH_SIZE)),
+  delayMs: Number(readArg('--delay-ms', BACKFILL_CONFIG.DELAY_MS)),
+  limit: Number(readArg('--limit', Infinity)),
+  dryRun: hasFlag('--dry-run'),
+  force: hasFlag('--force'),
+  resume: hasFlag('--resume'),
+  checkpoint: path.resolve(readArg('--checkpoint', '.rescore-checkpoint.json'))
+};
+
+function formatEta(seconds) {
+  if (!seconds) return '0s';
+  const m = Math.floor(seconds / 60);
+  return m > 0 ? `${m}m${String(seconds % 60).padStart(2, '0')}s` : `${seconds}s`;
+}
+
+async function main() {
+  // Targets relidos do disco (o cache do loader pode ter a versão antiga)
+  clearTargetsCache();
+  const targetsByGenre = new Map();
+  const loadTargets = async (genre) => {
+    if (!targetsByGenre.has(genre)) targetsByGenre.set(genre, await loadGenreTargetsFromWorker(genre));
+    return targetsByGenre.get(genre);
+  };
+
+  let cursor = null;
+  if (options.resume && fs.existsSync(options.checkpoint)) {
+    cursor = JSON.parse(fs.readFileSync(options.checkpoint, 'utf8')).cursor;
+    console.log(`⏩ [RESCORE] Retomando após ${cursor.createdAt} / ${cursor.id}`);
+  }
+
+  let stopping = false;
+  process.on('SIGINT', () => {
+    console.log('\n🛑 [RESCORE] Interrompendo após o lote atual (cursor fica no checkpoint)...');
+    stopping = true;
+  });
+
+  console.log(`🔁 [RESCORE] Início${options.dryRun ? ' (dry-run)' : ''}:`, {
+    genre: options.genre || 'todos',
+    batchSize: options.batchSize,
+    delayMs: options.delayMs,
+    limit: options.limit
+  });
+
+  const stats = await runBackfill(createJobsSource(pool, { genre: options.genre }), {
+    cursor,
+    batchSize: options.batchSize,
+    delayMs: options.delayMs,
+    limit: options.limit,
+    dryRun: options.dryRun,
+    shouldStop: () => stopping,
+    transform: async (results) => {
+      if (!results?.genre || results.genre === 'default') return { status: 'skipped', reason: 'missing_genre' };
+      return rescoreAnalysis(results, await loadTargets(results.genre), { force: options.force });
+    },
+    onError: ({ id, error }) => console.error(`❌ [RESCORE] Job ${id}: ${error.message}`),
+    onBatch: (progress) => {
+      if (!options.dryRun) {
+        fs.writeFileSync(options.checkpoint, JSON.stringify({ cursor: progress.cursor, at: new Date().toISOString() }) + '\n');
+      }
+      const pct = progress.total ? ((progress.scanned / progress.total) * 100).toFixed(1) : '100.0';
+      console.log(`📊 [RESCORE] ${progress.scanned}/${progress.total} (${pct}%) · ` +
+        `atualizadas ${progress.updated} · puladas ${progress.skipped} · conflitos ${progress.conflicts} · ` +
+        `falhas ${progress.failed} · ${progress.rate.toFixed(1)}/s · ETA ${formatEta(progress.etaSeconds)}`);
+    }
+  });
+
+  console.log('✅ [RESCORE] Concluído:', {
+    scanned: stats.scanned,
+    updated: stats.updated,
+    skipped: stats.skippedBy,
+    conflicts: stats.conflicts,
+    failed: stats.failed,
+    ms: stats.elapsedMs
+  });
+  if (!stopping && stats.scanned < options.limit && !options.dryRun && fs.existsSync(options.checkpoint)) {
+    fs.rmSync(options.checkpoint);
+  }
+  return stats.failed > 0 ? 1 : 0;
+}
+
+main()
+  .then(async (exitCode) => {
+    await pool.end();
+    process.exit(exitCode);
+  })
+  .catch(async (error) => {
+    console.error('💥 [RESCORE] Erro fatal:', error);
+    await pool.end().catch(() => {});
+    process.exit(1);
+  });
@@ -19,13 +19,26 @@
  */
 
 import "dotenv/config";
-import { Worker } from 'bullmq';
+import { Worker, DelayedError } from 'bullmq';
 import Redis from 'ioredis';
 import pool from './db.js';
 import path from "path";
 import { fileURLToPath } from "url";
 import express from 'express';
 import { fork } from 'child_process';
+import {
+  FAIR_SHARE_CONFIG,
+  getJobTenant,
+  acquireTenantSlot,
+  releaseTenantSlot,
+  recordQueueWait,
+  getQueueWaitHistograms
+} from './lib/queue-fair-share.js';
+import { decodeResultWire, serializeResultJSON } from './lib/serialization/result-schema.js';
+import { createLogger } from './lib/logger.js';
+import { getProfileKeepThreshold, recordJobProfile, getProfilingAggregates } from './lib/job-profiler.js';
+
+const logger = createLogger('worker');
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -37,48 +50,48 @@ const ANALYSIS_JOB_SCRIPT = path.join(__dirname, 'analysis-job.js');
 process.env.SERVICE_NAME = 'worker';
 
 // 🚀 LOG INICIAL: Worker iniciando
-console.log('🚀 [WORKER] ═══════════════════════════════════════');
-console.log('🚀 [WORKER]     INICIANDO WORKER REDIS ROBUSTO     ');
-console.log('🚀 [WORKER] ═══════════════════════════════════════');
-console.log(`📋 [WORKER-INIT] PID: ${process.pid}`);
-console.log(`🌍 [WORKER-INIT] ENV: ${process.env.NODE_ENV || process.env.RAILWAY_ENVIRONMENT || 'development'}`);
-console.log(`⏰ [WORKER-INIT] Timestamp: ${new Date().toISOString()}\n`);
+logger.info('🚀 [WORKER] ═══════════════════════════════════════');
+logger.info('🚀 [WORKER]     INICIANDO WORKER REDIS ROBUSTO     ');
+logger.info('🚀 [WORKER] ═══════════════════════════════════════');
+logger.info(`📋 [WORKER-INIT] PID: ${process.pid}`);
+logger.info(`🌍 [WORKER-INIT] ENV: ${process.env.NODE_ENV || process.env.RAILWAY_ENVIRONMENT || 'development'}`);
+logger.info(`⏰ [WORKER-INIT] Timestamp: ${new Date().toISOString()}\n`);
 
 // 🔒 VERIFICAÇÃO CRÍTICA: Environment Variables
-console.log('🔍 [WORKER] ═══════════════════════════════════════');
-console.log('🔍 [WORKER]    VALIDAÇÃO DE VARIÁVEIS CRÍTICAS    ');
-console.log('🔍 [WORKER] ═══════════════════════════════════════\n');
+logger.info('🔍 [WORKER] ═══════════════════════════════════════');
+logger.info('🔍 [WORKER]    VALIDAÇÃO DE VARIÁVEIS CRÍTICAS    ');
+logger.info('🔍 [WORKER] ═══════════════════════════════════════\n');
 
 const requiredVars = ['REDIS_URL', 'DATABASE_URL', 'B2_KEY_ID', 'B2_APP_KEY', 'B2_BUCKET_NAME'];
 const missingVars = [];
 
 for (const varName of requiredVars) {
   if (!process.env[varName]) {
-    console.error(`❌ [WORKER] ${varName} não configurada`);
+    logger.error(`❌ [WORKER] ${varName} não configurada`);
     missingVars.push(varName);
   } else {
     const value = process.env[varName];
     const masked = value.substring(0, 25) + '...';
-    console.log(`✅ [WORKER] ${varName}: ${masked}`);
+    logger.info(`✅ [WORKER] ${varName}: ${masked}`);
   }
 }
 
 if (missingVars.length > 0) {
-  console.error('\n💥 [WORKER] ═══════════════════════════════════════');
-  console.error(`💥 [WORKER]   ERRO CRÍTICO: ${missingVars.length} Variáveis Ausentes   `);
-  console.error('💥 [WORKER] ═══════════════════════════════════════');
-  console.error('💡 [WORKER] Configure no Railway Dashboard → Variables');
-  console.error('📋 [WORKER] Variáveis faltando:', missingVars.join(', '));
-  console.error('📋 [WORKER] Ambiente:', process.env.NODE_ENV || process.env.RAILWAY_ENVIRONMENT || 'unknown');
-  console.error('💥 [WORKER] Worker NÃO será iniciado\n');
+  logger.error('\n💥 [WORKER] ═══════════════════════════════════════');
+  logger.error(`💥 [WORKER]   ERRO CRÍTICO: ${missingVars.length} Variáveis Ausentes   `);
+  logger.error('💥 [WORKER] ═══════════════════════════════════════');
+  logger.error('💡 [WORKER] Configure no Railway Dashboard → Variables');
+  logger.error('📋 [WORKER] Variáveis faltando:', missingVars.join(', '));
+  logger.error('📋 [WORKER] Ambiente:', process.env.NODE_ENV || process.env.RAILWAY_ENVIRONMENT || 'unknown');
+  logger.error('💥 [WORKER] Worker NÃO será iniciado\n');
   process.exit(1);
 }
 
-console.log('✅ [WORKER] Todas as variáveis obrigatórias configuradas\n');
+logger.info('✅ [WORKER] Todas as variáveis obrigatórias configuradas\n');
 
 // 🔧 DETECÇÃO AUTOMÁTICA DE TLS BASEADA NA URL
 const isTLS = process.env.REDIS_URL.startsWith('rediss://');
-console.log(`🔐 [WORKER] TLS detectado: ${isTLS ? 'SIM' : 'NÃO'}`);
+logger.info(`🔐 [WORKER] TLS detectado: ${isTLS ? 'SIM' : 'NÃO'}`);
 
 // 🔧 CONFIGURAÇÃO REDIS COM RETRY/BACKOFF ROBUSTO
 // ⚙️ PARTE 2: Configuração ajustada para evitar timeouts
@@ -97,7 +110,7 @@ const REDIS_CONFIG = {
   // 🔄 RETRY STRATEGY ROBUSTO
   retryStrategy: (times) => {
     const delay = Math.min(times * 2000, 30000); // Max 30s delay
-    console.log(`🔄 [REDIS-RETRY] Tentativa ${times}: próxima em ${delay}ms`);
+    logger.info(`🔄 [REDIS-RETRY] Tentativa ${times}: próxima em ${delay}ms`);
     return delay;
   },
   
@@ -129,14 +142,14 @@ async function createRedisConnection() {
     const redisUrl = process.env.REDIS_URL || '';
     const maskedRedisUrl = redisUrl.replace(/:\/\/[^@]*@/, '://***@');
     
-    console.log(`🔌 [REDIS-CONNECT] Tentativa ${connectionAttempts}/${MAX_CONNECTION_ATTEMPTS}`);
-    console.log(`🔌 [REDIS-CONNECT] URL: ${maskedRedisUrl}`);
+    logger.info(`🔌 [REDIS-CONNECT] Tentativa ${connectionAttempts}/${MAX_CONNECTION_ATTEMPTS}`);
+    logger.info(`🔌 [REDIS-CONNECT] URL: ${maskedRedisUrl}`);
     
     const redis = new Redis(process.env.REDIS_URL, REDIS_CONFIG);
     
     // 📡 EVENT LISTENERS DETALHADOS
     redis.on('connect', () => {
-      console.log('🟡 [REDIS-CONNECT] Conexão iniciada...');
+      logger.info('🟡 [REDIS-CONNECT] Conexão iniciada...');
     });
     
     redis.on('ready', async () => {
@@ -145,18 +158,18 @@ async function createRedisConnection() {
         const serverInfo = await redis.info('server');
         const redisVersion = serverInfo.match(/redis_version:([\d.]+)/)?.[1] || 'unknown';
         
-        console.log('✅ [REDIS-CONNECT] Conexão bem-sucedida');
-        console.log(`✅ [REDIS-READY] Client ID: ${clientId}`);
-        console.log(`✅ [REDIS-READY] Redis Version: ${redisVersion}`);
-        console.log(`✅ [REDIS-READY] PID: ${process.pid}`);
+        logger.info('✅ [REDIS-CONNECT] Conexão bem-sucedida');
+        logger.info(`✅ [REDIS-READY] Client ID: ${clientId}`);
+        logger.info(`✅ [REDIS-READY] Redis Version: ${redisVersion}`);
+        logger.info(`✅ [REDIS-READY] PID: ${process.pid}`);
         
         isRedisReady = true;
         redisConnection = redis;
         resolve(redis);
         
       } catch (err) {
-        console.error('💥 [REDIS-READY] Erro ao obter informações:', err.message);
-        console.log('✅ [REDIS-CONNECT] Conexão bem-sucedida');
+        logger.error('💥 [REDIS-READY] Erro ao obter informações:', err.message);
+        logger.info('✅ [REDIS-CONNECT] Conexão bem-sucedida');
         isRedisReady = true;
         redisConnection = redis;
         resolve(redis); // Continua mesmo com erro de info
@@ -164,34 +177,34 @@ async function createRedisConnection() {
     });
     
     redis.on('error', (err) => {
-      console.error('💥 [REDIS-ERROR] Tipo:', err.code || 'UNKNOWN');
-      console.error('💥 [REDIS-ERROR] Mensagem:', err.message);
-      console.error('💥 [REDIS-ERROR] Host:', err.address || 'unknown');
+      logger.error('💥 [REDIS-ERROR] Tipo:', err.code || 'UNKNOWN');
+      logger.error('💥 [REDIS-ERROR] Mensagem:', err.message);
+      logger.error('💥 [REDIS-ERROR] Host:', err.address || 'unknown');
       
       if (connectionAttempts >= MAX_CONNECTION_ATTEMPTS) {
-        console.error(`💥 [REDIS-ERROR] Máximo de tentativas atingido (${MAX_CONNECTION_ATTEMPTS})`);
+        logger.error(`💥 [REDIS-ERROR] Máximo de tentativas atingido (${MAX_CONNECTION_ATTEMPTS})`);
         reject(err);
       }
     });
     
     redis.on('reconnecting', (delay) => {
-      console.log(`🔄 [REDIS-RECONNECT] Reconectando em ${delay}ms...`);
+      logger.info(`🔄 [REDIS-RECONNECT] Reconectando em ${delay}ms...`);
     });
     
     redis.on('end', () => {
-      console.log('🔌 [REDIS-END] Conexão encerrada');
+      logger.info('🔌 [REDIS-END] Conexão encerrada');
       isRedisReady = false;
     });
     
     redis.on('close', () => {
-      console.log('🚪 [REDIS-CLOSE] Conexão fechada');
+      logger.info('🚪 [REDIS-CLOSE] Conexão fechada');
       isRedisReady = false;
     });
     
     // ⏰ TIMEOUT DE SEGURANÇA
     setTimeout(() => {
       if (!isRedisReady) {
-        console.error('⏰ [REDIS-TIMEOUT] Timeout na conexão Redis (30s)');
+        logger.error('⏰ [REDIS-TIMEOUT] Timeout na conexão Redis (30s)');
         reject(new Error('Redis connection timeout'));
       }
     }, 30000);
@@ -204,13 +217,13 @@ async function createRedisConnection() {
 function setupWorkerEventListeners() {
   if (!worker) return;
   
-  console.log('🎧 [WORKER-EVENTS] Configurando listeners...');
+  logger.info('🎧 [WORKER-EVENTS] Configurando listeners...');
   
   // ✅ LISTENER: WORKER PRONTO
   worker.on('ready', () => {
-    console.log('🟢 [WORKER-READY] Worker pronto para processar jobs!');
-    console.log(`🎯 [WORKER-READY] Fila: 'audio-analyzer'`);
-    console.log(`⚙️ [WORKER-READY] PID: ${process.pid}`);
+    logger.info('🟢 [WORKER-READY] Worker pronto para processar jobs!');
+    logger.info(`🎯 [WORKER-READY] Fila: 'audio-analyzer'`);
+    logger.info(`⚙️ [WORKER-READY] PID: ${process.pid}`);
   });
   
   // ✅ LISTENER: JOB RECEBIDO
@@ -218,13 +231,13 @@ function setupWorkerEventListeners() {
     const { jobId, externalId, fileKey, mode } = job.data;
     const displayId = externalId || jobId?.substring(0,8) || 'unknown';
     
-    console.log('🎧 [JOB-RECEIVED] ═══════════════════════════════');
-    console.log('🎧 [JOB-RECEIVED] Job recebido e iniciando processamento');
-    console.log(`🎧 [JOB-RECEIVED] Redis Job ID: ${job.id}`);
-    console.log(`🎧 [JOB-RECEIVED] Display ID: ${displayId}`);
-    console.log(`🎧 [JOB-RECEIVED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
-    console.log(`🎧 [JOB-RECEIVED] Modo: ${mode || 'unknown'}`);
-    console.log(`🎧 [JOB-RECEIVED] Tentativa: ${job.attemptsMade + 1}/${job.opts.attempts}`);
+    logger.info('🎧 [JOB-RECEIVED] ═══════════════════════════════');
+    logger.info('🎧 [JOB-RECEIVED] Job recebido e iniciando processamento');
+    logger.info(`🎧 [JOB-RECEIVED] Redis Job ID: ${job.id}`);
+    logger.info(`🎧 [JOB-RECEIVED] Display ID: ${displayId}`);
+    logger.info(`🎧 [JOB-RECEIVED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
+    logger.info(`🎧 [JOB-RECEIVED] Modo: ${mode || 'unknown'}`);
+    logger.info(`🎧 [JOB-RECEIVED] Tentativa: ${job.attemptsMade + 1}/${job.opts.attempts}`);
   });
   
   // ✅ LISTENER: JOB CONCLUÍDO
@@ -232,13 +245,13 @@ function setupWorkerEventListeners() {
     const { jobId, externalId, fileKey } = job.data;
     const displayId = externalId || jobId?.substring(0,8) || 'unknown';
     
-    console.log('✅ [JOB-COMPLETED] ═══════════════════════════════');
-    console.log('✅ [JOB-COMPLETED] Job concluído com sucesso!');
-    console.log(`✅ [JOB-COMPLETED] Redis Job ID: ${job.id}`);
-    console.log(`✅ [JOB-COMPLETED] Display ID: ${displayId}`);
-    console.log(`✅ [JOB-COMPLETED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
-    console.log(`✅ [JOB-COMPLETED] Duração: ${result?.processingTime || 'N/A'}ms`);
-    console.log(`✅ [JOB-COMPLETED] Status: ${result?.status || 'success'}`);
+    logger.info('✅ [JOB-COMPLETED] ═══════════════════════════════');
+    logger.info('✅ [JOB-COMPLETED] Job concluído com sucesso!');
+    logger.info(`✅ [JOB-COMPLETED] Redis Job ID: ${job.id}`);
+    logger.info(`✅ [JOB-COMPLETED] Display ID: ${displayId}`);
+    logger.info(`✅ [JOB-COMPLETED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
+    logger.info(`✅ [JOB-COMPLETED] Duração: ${result?.processingTime || 'N/A'}ms`);
+    logger.info(`✅ [JOB-COMPLETED] Status: ${result?.status || 'success'}`);
   });
   
   // ✅ LISTENER: JOB FALHOU
@@ -246,36 +259,36 @@ function setupWorkerEventListeners() {
     const { jobId, externalId, fileKey } = job?.data || {};
     const displayId = externalId || jobId?.substring(0,8) || 'unknown';
     
-    console.error('❌ [JOB-FAILED] ═══════════════════════════════');
-    console.error('❌ [JOB-FAILED] Job falhou!');
-    console.error(`❌ [JOB-FAILED] Redis Job ID: ${job?.id || 'unknown'}`);
-    console.error(`❌ [JOB-FAILED] Display ID: ${displayId}`);
-    console.error(`❌ [JOB-FAILED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
-    console.error(`❌ [JOB-FAILED] Erro: ${err.message}`);
-    console.error(`❌ [JOB-FAILED] Tentativa: ${job?.attemptsMade || 0}/${job?.opts?.attempts || 'N/A'}`);
+    logger.error('❌ [JOB-FAILED] ═══════════════════════════════');
+    logger.error('❌ [JOB-FAILED] Job falhou!');
+    logger.error(`❌ [JOB-FAILED] Redis Job ID: ${job?.id || 'unknown'}`);
+    logger.error(`❌ [JOB-FAILED] Display ID: ${displayId}`);
+    logger.error(`❌ [JOB-FAILED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
+    logger.error(`❌ [JOB-FAILED] Erro: ${err.message}`);
+    logger.error(`❌ [JOB-FAILED] Tentativa: ${job?.attemptsMade || 0}/${job?.opts?.attempts || 'N/A'}`);
     
     // Stack trace apenas em desenvolvimento
     if (process.env.NODE_ENV !== 'production') {
-      console.error(`❌ [JOB-FAILED] Stack: ${err.stack}`);
+      logger.error(`❌ [JOB-FAILED] Stack: ${err.stack}`);
     }
   });
   
   // ✅ LISTENER: ERRO DO WORKER
   worker.on('error', (err) => {
-    console.error('🚨 [WORKER-ERROR] ═══════════════════════════════');
-    console.error('🚨 [WORKER-ERROR] Erro crítico no Worker!');
-    console.error(`🚨 [WORKER-ERROR] Tipo: ${err.name || 'UnknownError'}`);
-    console.error(`🚨 [WORKER-ERROR] Mensagem: ${err.message}`);
-    console.error(`🚨 [WORKER-ERROR] PID: ${process.pid}`);
+    logger.error('🚨 [WORKER-ERROR] ═══════════════════════════════');
+    logger.error('🚨 [WORKER-ERROR] Erro crítico no Worker!');
+    logger.error(`🚨 [WORKER-ERROR] Tipo: ${err.name || 'UnknownError'}`);
+    logger.error(`🚨 [WORKER-ERROR] Mensagem: ${err.message}`);
+    logger.error(`🚨 [WORKER-ERROR] PID: ${process.pid}`);
     
     // Stack trace completo em caso de erro crítico
-    console.error(`🚨 [WORKER-ERROR] Stack: ${err.stack}`);
+    logger.error(`🚨 [WORKER-ERROR] Stack: ${err.stack}`);
     
     // Tentar reconectar em caso de erro de conexão
     if (err.message.includes('Connection') || err.message.includes('Redis')) {
-      console.log('🔄 [WORKER-ERROR] Tentando reconectar em 5 segundos...');
+      logger.info('🔄 [WORKER-ERROR] Tentando reconectar em 5 segundos...');
       setTimeout(async () => {
-        console.log('🔄 [WORKER-ERROR] Reiniciando Worker...');
+        logger.info('🔄 [WORKER-ERROR] Reiniciando Worker...');
         // 🧹 MEMORY FIX: fechar worker antigo antes de criar novo para evitar acúmulo de listeners
         if (worker) {
           try { await worker.close(); } catch (_) {}
@@ -291,25 +304,30 @@ function setupWorkerEventListeners() {
     const { jobId, externalId, fileKey } = job.data;
     const displayId = externalId || jobId?.substring(0,8) || 'unknown';
     
-    console.warn('🐌 [JOB-STALLED] ═══════════════════════════════');
-    console.warn('🐌 [JOB-STALLED] Job travado - será reprocessado');
-    console.warn(`🐌 [JOB-STALLED] Redis Job ID: ${job.id}`);
-    console.warn(`🐌 [JOB-STALLED] Display ID: ${displayId}`);
-    console.warn(`🐌 [JOB-STALLED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
+    logger.warn('🐌 [JOB-STALLED] ═══════════════════════════════');
+    logger.warn('🐌 [JOB-STALLED] Job travado - será reprocessado');
+    logger.warn(`🐌 [JOB-STALLED] Redis Job ID: ${job.id}`);
+    logger.warn(`🐌 [JOB-STALLED] Display ID: ${displayId}`);
+    logger.warn(`🐌 [JOB-STALLED] Arquivo: ${fileKey?.split('/').pop() || 'unknown'}`);
   });
   
-  console.log('✅ [WORKER-EVENTS] Todos os listeners configurados!');
+  logger.info('✅ [WORKER-EVENTS] Todos os listeners configurados!');
 }
 
+// Limites de concorrência do worker (boot e ajustes do supervisor.js)
+const DEFAULT_SAFE_CONCURRENCY = 2; // Conservador para Railway 4 vCPU
+const MIN_CONCURRENCY = 1;
+const MAX_SAFE_CONCURRENCY = 6;
+
 /**
  * 🚀 INICIALIZAÇÃO PRINCIPAL DO WORKER
  */
 async function initializeWorker() {
   try {
-    console.log('⏳ [WORKER-INIT] Iniciando processo de inicialização...');
+    logger.info('⏳ [WORKER-INIT] Iniciando processo de inicialização...');
     
     // 🔗 ETAPA 1: ESTABELECER CONEXÃO REDIS
-    console.log('🔗 [WORKER-INIT] Etapa 1: Conectando ao Redis...');
+    logger.info('🔗 [WORKER-INIT] Etapa 1: Conectando ao Redis...');
     
     await createRedisConnection();
     
@@ -318,7 +336,7 @@ async function initializeWorker() {
     }
     
     // ⚙️ ETAPA 2: CONFIGURAR WORKER
-    console.log('⚙️ [WORKER-INIT] Etapa 2: Configurando Worker BullMQ...');
+    logger.info('⚙️ [WORKER-INIT] Etapa 2: Configurando Worker BullMQ...');
     
     // ============================================================================
     // 🚨 CONCORRÊNCIA SEGURA - ANALYSIS WORKER (PATCH 2026-02-23)
@@ -329,48 +347,45 @@ async function initializeWorker() {
     // Exemplo: (2 FFmpeg) × (2 conc) = 4 processos ≤ 4 vCPU × 2 = 8 → OK
     // ============================================================================
 
-    const DEFAULT_SAFE_CONCURRENCY = 2; // Conservador para Railway 4 vCPU
-    const MIN_CONCURRENCY = 1;
-    const MAX_SAFE_CONCURRENCY = 6;
-
     const concurrency = (() => {
       const envValue = Number(process.env.ANALYSIS_CONCURRENCY);
       
       if (!envValue || isNaN(envValue)) {
-        console.log(`[WORKER_INIT] ℹ️  ANALYSIS_CONCURRENCY não definida - usando padrão seguro: ${DEFAULT_SAFE_CONCURRENCY}`);
+        logger.info(`[WORKER_INIT] ℹ️  ANALYSIS_CONCURRENCY não definida - usando padrão seguro: ${DEFAULT_SAFE_CONCURRENCY}`);
         return DEFAULT_SAFE_CONCURRENCY;
       }
       
       if (envValue < MIN_CONCURRENCY) {
-        console.warn(`[WORKER_INIT] ⚠️  ANALYSIS_CONCURRENCY inválido (${envValue}) - usando mínimo: ${MIN_CONCURRENCY}`);
+        logger.warn(`[WORKER_INIT] ⚠️  ANALYSIS_CONCURRENCY inválido (${envValue}) - usando mínimo: ${MIN_CONCURRENCY}`);
         return MIN_CONCURRENCY;
       }
       
       if (envValue > MAX_SAFE_CONCURRENCY) {
-        console.error(`[WORKER_INIT] ❌ ANALYSIS_CONCURRENCY=${envValue} PERIGOSO para Railway!`);
-        console.error(`   Analysis pipeline usa 2-3 processos FFmpeg por job.`);
-        console.error(`   ${envValue} jobs × 2 FFmpeg = ${envValue * 2} processos simultâneos.`);
-        console.error(`   Railway 4 vCPU suporta máximo ${MAX_SAFE_CONCURRENCY} jobs (${MAX_SAFE_CONCURRENCY * 2}-${MAX_SAFE_CONCURRENCY * 3} FFmpeg).`);
-        console.error(`   Recomendação: ANALYSIS_CONCURRENCY=2-4`);
-        console.error(`   Forçando concurrency para máximo seguro: ${MAX_SAFE_CONCURRENCY}`);
+        logger.error(`[WORKER_INIT] ❌ ANALYSIS_CONCURRENCY=${envValue} PERIGOSO para Railway!`);
+        logger.error(`   Analysis pipeline usa 2-3 processos FFmpeg por job.`);
+        logger.error(`   ${envValue} jobs × 2 FFmpeg = ${envValue * 2} processos simultâneos.`);
+        logger.error(`   Railway 4 vCPU suporta máximo ${MAX_SAFE_CONCURRENCY} jobs (${MAX_SAFE_CONCURRENCY * 2}-${MAX_SAFE_CONCURRENCY * 3} FFmpeg).`);
+        logger.error(`   Recomendação: ANALYSIS_CONCURRENCY=2-4`);
+        logger.error(`   Forçando concurrency para máximo seguro: ${MAX_SAFE_CONCURRENCY}`);
         return MAX_SAFE_CONCURRENCY;
       }
       
-      console.log(`[WORKER_INIT] ✅ ANALYSIS_CONCURRENCY=${envValue} (via env)`);
+      logger.info(`[WORKER_INIT] ✅ ANALYSIS_CONCURRENCY=${envValue} (via env)`);
       return envValue;
     })();
 
-    console.log(`━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-    console.log(`🔧 Analysis Worker Configuration:`);
-    console.log(`   Concurrency:  ${concurrency}`);
-    console.log(`   FFmpeg/job:   2-3 processos`);
-    console.log(`   Max simult:   ${concurrency * 3} processos FFmpeg (worst-case)`);
-    console.log(`   Recomendado:  Railway 2-4 vCPU`);
-    console.log(`━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+    logger.info(`━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+    logger.info(`🔧 Analysis Worker Configuration:`);
+    logger.info(`   Concurrency:  ${concurrency}`);
+    logger.info(`   FFmpeg/job:   2-3 processos`);
+    logger.info(`   Max simult:   ${concurrency * 3} processos FFmpeg (worst-case)`);
+    logger.info(`   Recomendado:  Railway 2-4 vCPU`);
+    logger.info(`   Por usuário:  ${FAIR_SHARE_CONFIG.maxInFlightPerTenant} jobs simultâneos (fair-share)`);
+    logger.info(`━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
     
     // 🎯 CRIAR WORKER COM CONEXÃO ESTABELECIDA
     // ⚙️ PARTE 2: Worker com configuração otimizada e lockDuration aumentado
-    worker = new Worker('audio-analyzer', audioProcessor, {
+    worker = new Worker('audio-analyzer', fairShareProcessor, {
       connection: redisConnection,
       concurrency,
       lockDuration: 300000,         // 🧩 MEMORY FIX: 5min de lock (pipeline leva 30-120s; 1min causava reprocessamento duplo)
@@ -383,40 +398,40 @@ async function initializeWorker() {
       }
     });
     
-    console.log('✅ [WORKER-INIT] Worker BullMQ criado com sucesso!');
-    console.log(`✅ [WORKER-INIT] Fila: 'audio-analyzer'`);
+    logger.info('✅ [WORKER-INIT] Worker BullMQ criado com sucesso!');
+    logger.info(`✅ [WORKER-INIT] Fila: 'audio-analyzer'`);
     
     // 🎧 ETAPA 3: CONFIGURAR EVENT LISTENERS
-    console.log('🎧 [WORKER-INIT] Etapa 3: Configurando event listeners...');
+    logger.info('🎧 [WORKER-INIT] Etapa 3: Configurando event listeners...');
     setupWorkerEventListeners();
     
     // 🏥 ETAPA 4: HEALTH CHECK SERVER
-    console.log('🏥 [WORKER-INIT] Etapa 4: Iniciando health check server...');
+    logger.info('🏥 [WORKER-INIT] Etapa 4: Iniciando health check server...');
     startHealthCheckServer();
     
-    console.log('🎉 [WORKER-INIT] ═══════════════════════════════════════');
-    console.log('🎉 [WORKER-INIT] WORKER INICIALIZADO COM SUCESSO!');
-    console.log('🎉 [WORKER-INIT] ═══════════════════════════════════════');
-    console.log(`🎯 [WORKER-INIT] Aguardando jobs na fila 'audio-analyzer'...`);
+    logger.info('🎉 [WORKER-INIT] ═══════════════════════════════════════');
+    logger.info('🎉 [WORKER-INIT] WORKER INICIALIZADO COM SUCESSO!');
+    logger.info('🎉 [WORKER-INIT] ═══════════════════════════════════════');
+    logger.info(`🎯 [WORKER-INIT] Aguardando jobs na fila 'audio-analyzer'...`);
     
   } catch (error) {
-    console.error('💥 [WORKER-INIT] ═══════════════════════════════════════');
-    console.error('💥 [WORKER-INIT] FALHA NA INICIALIZAÇÃO DO WORKER!');
-    console.error('💥 [WORKER-INIT] ═══════════════════════════════════════');
-    console.error(`💥 [WORKER-INIT] Erro: ${error.message}`);
-    console.error(`💥 [WORKER-INIT] Stack: ${error.stack}`);
+    logger.error('💥 [WORKER-INIT] ═══════════════════════════════════════');
+    logger.error('💥 [WORKER-INIT] FALHA NA INICIALIZAÇÃO DO WORKER!');
+    logger.error('💥 [WORKER-INIT] ═══════════════════════════════════════');
+    logger.error(`💥 [WORKER-INIT] Erro: ${error.message}`);
+    logger.error(`💥 [WORKER-INIT] Stack: ${error.stack}`);
     
     // 🔄 RETRY AUTOMÁTICO EM CASO DE FALHA
     if (connectionAttempts < MAX_CONNECTION_ATTEMPTS) {
       const retryDelay = Math.min(connectionAttempts * 5000, 30000); // Max 30s
-      console.log(`🔄 [WORKER-INIT] Tentando novamente em ${retryDelay}ms...`);
+      logger.info(`🔄 [WORKER-INIT] Tentando novamente em ${retryDelay}ms...`);
       
       setTimeout(() => {
-        console.log('🔄 [WORKER-INIT] Reiniciando inicialização...');
+        logger.info('🔄 [WORKER-INIT] Reiniciando inicialização...');
         initializeWorker();
       }, retryDelay);
     } else {
-      console.error('💥 [WORKER-INIT] Máximo de tentativas atingido. Encerrando processo.');
+      logger.error('💥 [WORKER-INIT] Máximo de tentativas atingido. Encerrando processo.');
       process.exit(1);
     }
   }
@@ -449,9 +464,26 @@ function startHealthCheckServer() {
     
     res.json(status);
   });
+
+  // ⚖️ Histogramas de espera na fila por plano (fair-share)
+  app.get('/metrics/queue-wait', async (req, res) => {
+    if (!redisConnection) {
+      return res.status(503).json({ error: 'redis indisponível' });
+    }
+    try {
+      res.json(await getQueueWaitHistograms(redisConnection));
+    } catch (err) {
+      res.status(500).json({ error: err.message });
+    }
+  });
+  
+  // 🔬 Profiling por estágio dos jobs perfilados (PROFILE_JOB_IDS / PROFILE_SAMPLE_RATE)
+  app.get('/metrics/profiling', (req, res) => {
+    res.json(getProfilingAggregates());
+  });
   
   app.listen(port, () => {
-    console.log(`🏥 [HEALTH] Health check server rodando na porta ${port}`);
+    logger.info(`🏥 [HEALTH] Health check server rodando na porta ${port}`);
   });
 
   // 📊 MONITORAMENTO DE MEMÓRIA DO ORQUESTRADOR (a cada 60s)
@@ -461,11 +493,11 @@ function startHealthCheckServer() {
     const rssMB = (mem.rss / 1024 / 1024).toFixed(1);
     const heapMB = (mem.heapUsed / 1024 / 1024).toFixed(1);
     const heapTotalMB = (mem.heapTotal / 1024 / 1024).toFixed(1);
-    console.log(`[MEM-MONITOR] Orquestrador PID=${process.pid} | RSS=${rssMB}MB | Heap=${heapMB}/${heapTotalMB}MB | Jobs ativos=${activeChildProcesses}`);
+    logger.info(`[MEM-MONITOR] Orquestrador PID=${process.pid} | RSS=${rssMB}MB | Heap=${heapMB}/${heapTotalMB}MB | Jobs ativos=${activeChildProcesses}`);
     
     // Alerta se orquestrador estiver usando mais de 200MB (deveria ficar ~30-80MB)
     if (mem.rss > 200 * 1024 * 1024) {
-      console.warn(`[MEM-MONITOR] ⚠️ RSS acima de 200MB — investigar possível leak no orquestrador`);
+      logger.warn(`[MEM-MONITOR] ⚠️ RSS acima de 200MB — investigar possível leak no orquestrador`);
     }
   }, MEM_MONITOR_INTERVAL);
   memInterval.unref(); // Não impedir shutdown
@@ -475,6 +507,33 @@ function startHealthCheckServer() {
 // 🎵 AUDIO PROCESSOR FUNCTION
 // ===============================================
 
+/**
+ * ⚖️ PORTEIRO FAIR-SHARE
+ * Garante o teto de jobs simultâneos por usuário antes de fazer fork do processo de análise.
+ * Sem slot livre → job volta para delayed (não conta como tentativa falha).
+ */
+async function fairShareProcessor(job, token) {
+  const { tenantId, plan } = getJobTenant(job.data);
+
+  const acquired = await acquireTenantSlot(redisConnection, tenantId, job.id);
+  if (!acquired) {
+    logger.info(`⚖️ [FAIR-SHARE] Tenant no teto (${FAIR_SHARE_CONFIG.maxInFlightPerTenant}) - adiando job ${job.id} por ${FAIR_SHARE_CONFIG.deferMs}ms`);
+    await job.moveToDelayed(Date.now() + FAIR_SHARE_CONFIG.deferMs, token);
+    throw new DelayedError();
+  }
+
+  // Espera real na fila (inclui adiamentos); retries não entram no histograma
+  if (job.attemptsMade === 0) {
+    await recordQueueWait(redisConnection, plan, Date.now() - job.timestamp);
+  }
+
+  try {
+    return await audioProcessor(job);
+  } finally {
+    await releaseTenantSlot(redisConnection, tenantId, job.id);
+  }
+}
+
 /**
  * Atualizar status do job no PostgreSQL
  */
@@ -483,8 +542,8 @@ async function updateJobStatus(jobId, status, results = null) {
     // 🔒 VALIDAÇÃO CRÍTICA: Verificar UUID antes de executar query
     const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/i;
     if (!uuidRegex.test(jobId)) {
-      console.error(`💥 [DB-UPDATE] ERRO: jobId inválido para PostgreSQL: '${jobId}'`);
-      console.error(`💥 [DB-UPDATE] IGNORANDO atualização - UUID inválido não pode ser usado no banco`);
+      logger.error(`💥 [DB-UPDATE] ERRO: jobId inválido para PostgreSQL: '${jobId}'`);
+      logger.error(`💥 [DB-UPDATE] IGNORANDO atualização - UUID inválido não pode ser usado no banco`);
       return null; // Retorna null mas não quebra o processamento
     }
 
@@ -495,83 +554,91 @@ async function updateJobStatus(jobId, status, results = null) {
       // 🔐 SANITIZAÇÃO: já feita no processo filho (analysis-job.js) antes do IPC
       
       // ✅ LOGS DE AUDITORIA PRÉ-SALVAMENTO - SUGGESTIONS BASE
-      console.log(`[AI-AUDIT][SAVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][SAVE] 💾 SALVANDO RESULTS NO POSTGRES`);
-      console.log(`[AI-AUDIT][SAVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][SAVE] Job ID: ${jobId}`);
-      console.log(`[AI-AUDIT][SAVE] Status: ${status}`);
-      console.log(`[AI-AUDIT][SAVE] has suggestions?`, Array.isArray(results.suggestions));
-      console.log(`[AI-AUDIT][SAVE] suggestions length:`, results.suggestions?.length || 0);
-      console.log(`[AI-AUDIT][SAVE] suggestions type:`, typeof results.suggestions);
+      // Dumps (JSON.stringify de seções inteiras) só com debug ativo: em produção não custam nada
+      if (logger.debugEnabled) {
+        logger.debug(`[AI-AUDIT][SAVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+        logger.debug(`[AI-AUDIT][SAVE] 💾 SALVANDO RESULTS NO POSTGRES`);
+        logger.debug(`[AI-AUDIT][SAVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+        logger.debug(`[AI-AUDIT][SAVE] Job ID: ${jobId}`);
+        logger.debug(`[AI-AUDIT][SAVE] Status: ${status}`);
+        logger.debug(`[AI-AUDIT][SAVE] has suggestions?`, Array.isArray(results.suggestions));
+        logger.debug(`[AI-AUDIT][SAVE] suggestions length:`, results.suggestions?.length || 0);
+        logger.debug(`[AI-AUDIT][SAVE] suggestions type:`, typeof results.suggestions);
       
-      // 🤖 LOGS DE AUDITORIA - AI SUGGESTIONS
-      console.log(`[AI-AUDIT][SAVE] has aiSuggestions?`, Array.isArray(results.aiSuggestions));
-      console.log(`[AI-AUDIT][SAVE] aiSuggestions length:`, results.aiSuggestions?.length || 0);
-      console.log(`[AI-AUDIT][SAVE] aiSuggestions type:`, typeof results.aiSuggestions);
+        // 🤖 LOGS DE AUDITORIA - AI SUGGESTIONS
+        logger.debug(`[AI-AUDIT][SAVE] has aiSuggestions?`, Array.isArray(results.aiSuggestions));
+        logger.debug(`[AI-AUDIT][SAVE] aiSuggestions length:`, results.aiSuggestions?.length || 0);
+        logger.debug(`[AI-AUDIT][SAVE] aiSuggestions type:`, typeof results.aiSuggestions);
       
-      if (!results.aiSuggestions || results.aiSuggestions.length === 0) {
-        console.error(`[AI-AUDIT][SAVE] ❌ CRÍTICO: results.aiSuggestions AUSENTE no objeto results!`);
-        console.error(`[AI-AUDIT][SAVE] ⚠️ Postgres irá salvar SEM aiSuggestions!`);
-        console.error(`[AI-AUDIT][SAVE] Keys presentes:`, Object.keys(results).slice(0, 10));
-      } else {
-        console.log(`[AI-AUDIT][SAVE] ✅ results.aiSuggestions PRESENTE com ${results.aiSuggestions.length} itens`);
-      }
-      console.log(`[AI-AUDIT][SAVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+        logger.debug(`[AI-AUDIT][SAVE] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
       
-      console.log('\n\n🟣🟣🟣 [AUDIT:RESULT-BEFORE-SAVE] Resultado final antes de retornar:');
-      console.log('🟣 [AUDIT:RESULT-BEFORE-SAVE] Keys:', Object.keys(results).join(', '));
-      console.log('🟣 [AUDIT:RESULT-BEFORE-SAVE] Score:', results?.score);
-      console.log('🟣 [AUDIT:RESULT-BEFORE-SAVE] Genre no results:', results?.metadata?.genre);
-      console.log('🟣 [AUDIT:RESULT-BEFORE-SAVE] results.genre:', results?.genre);
+        logger.debug('\n\n🟣🟣🟣 [AUDIT:RESULT-BEFORE-SAVE] Resultado final antes de retornar:');
+        logger.debug('🟣 [AUDIT:RESULT-BEFORE-SAVE] Keys:', Object.keys(results).join(', '));
+        logger.debug('🟣 [AUDIT:RESULT-BEFORE-SAVE] Score:', results?.score);
+        logger.debug('🟣 [AUDIT:RESULT-BEFORE-SAVE] Genre no results:', results?.metadata?.genre);
+        logger.debug('🟣 [AUDIT:RESULT-BEFORE-SAVE] results.genre:', results?.genre);
       
-      console.log("\n================ AUDITORIA: ANTES DO SALVAMENTO (REDIS) ==============");
-      console.log("[ANTES-SAVE] ⏰ Timestamp:", new Date().toISOString());
-      console.log("[ANTES-SAVE] 📊 FINAL JSON QUE SERÁ SALVO NO POSTGRES:");
-      console.log("[ANTES-SAVE] results.genre:", results.genre);
-      console.log("[ANTES-SAVE] results.mode:", results.mode);
-      console.log("[ANTES-SAVE] results.data?.genre:", results.data?.genre);
-      console.log("[ANTES-SAVE] results.data?.genreTargets:", JSON.stringify(results.data?.genreTargets, null, 2));
-      console.log("[ANTES-SAVE] results.data?.metrics:", JSON.stringify(results.data?.metrics, null, 2));
-      console.log("[ANTES-SAVE] results.problemsAnalysis?.suggestions (primeiros 3):", JSON.stringify(results.problemsAnalysis?.suggestions?.slice(0, 3), null, 2));
-      console.log("[ANTES-SAVE] results.problemsAnalysis?.metadata?.usingConsolidatedData:", results.problemsAnalysis?.metadata?.usingConsolidatedData);
-      console.log("[ANTES-SAVE] results.aiSuggestions (primeiros 2):", JSON.stringify(results.aiSuggestions?.slice(0, 2), null, 2));
-      console.log("[ANTES-SAVE] 🎯 Verificação de Consistência:");
-      console.log("  - Targets no data:", Object.keys(results.data?.genreTargets || {}));
-      console.log("  - Número de sugestões problemsAnalysis:", results.problemsAnalysis?.suggestions?.length || 0);
-      console.log("  - Número de aiSuggestions:", results.aiSuggestions?.length || 0);
-      console.log("======================================================================\n");
+        logger.debug("\n================ AUDITORIA: ANTES DO SALVAMENTO (REDIS) ==============");
+        logger.debug("[ANTES-SAVE] ⏰ Timestamp:", new Date().toISOString());
+        logger.debug("[ANTES-SAVE] 📊 FINAL JSON QUE SERÁ SALVO NO POSTGRES:");
+        logger.debug("[ANTES-SAVE] results.genre:", results.genre);
+        logger.debug("[ANTES-SAVE] results.mode:", results.mode);
+        logger.debug("[ANTES-SAVE] results.data?.genre:", results.data?.genre);
+        logger.debug("[ANTES-SAVE] results.data?.genreTargets:", JSON.stringify(results.data?.genreTargets, null, 2));
+        logger.debug("[ANTES-SAVE] results.data?.metrics:", JSON.stringify(results.data?.metrics, null, 2));
+        logger.debug("[ANTES-SAVE] results.problemsAnalysis?.suggestions (primeiros 3):", JSON.stringify(results.problemsAnalysis?.suggestions?.slice(0, 3), null, 2));
+        logger.debug("[ANTES-SAVE] results.problemsAnalysis?.metadata?.usingConsolidatedData:", results.problemsAnalysis?.metadata?.usingConsolidatedData);
+        logger.debug("[ANTES-SAVE] results.aiSuggestions (primeiros 2):", JSON.stringify(results.aiSuggestions?.slice(0, 2), null, 2));
+        logger.debug("[ANTES-SAVE] 🎯 Verificação de Consistência:");
+        logger.debug("  - Targets no data:", Object.keys(results.data?.genreTargets || {}));
+        logger.debug("  - Número de sugestões problemsAnalysis:", results.problemsAnalysis?.suggestions?.length || 0);
+        logger.debug("  - Número de aiSuggestions:", results.aiSuggestions?.length || 0);
+        logger.debug("======================================================================\n");
       
-      console.log('[GENRE-FLOW][S4_BEFORE_SAVE]', {
-        jobId,
-        hasSuggestions: !!results?.suggestions,
-        hasAiSuggestions: !!results?.aiSuggestions,
-        firstBaseSuggestion: results?.suggestions?.[0] || null,
-        firstAiSuggestion: results?.aiSuggestions?.[0] || null
-      });
-      
-      // ────────────────────────────────────────
-      // STEP 3 — LOGAR AS SUGESTÕES NA HORA DE SALVAR EM results.suggestions
-      // ────────────────────────────────────────
-      console.log("[TRACE_S3_BEFORE_SAVE]", {
-        hasSuggestions: Array.isArray(results?.suggestions),
-        suggestionCount: results?.suggestions?.length,
-        firstSuggestion: results?.suggestions?.[0],
-        technical: results?.suggestions?.[0],
-        targetValue: results?.suggestions?.[0]?.targetValue,
-        currentValue: results?.suggestions?.[0]?.currentValue,
-        delta: results?.suggestions?.[0]?.delta,
-        deltaNum: results?.suggestions?.[0]?.deltaNum
-      });
+        logger.debug('[GENRE-FLOW][S4_BEFORE_SAVE]', {
+          jobId,
+          hasSuggestions: !!results?.suggestions,
+          hasAiSuggestions: !!results?.aiSuggestions,
+          firstBaseSuggestion: results?.suggestions?.[0] || null,
+          firstAiSuggestion: results?.aiSuggestions?.[0] || null
+        });
       
+        // ────────────────────────────────────────
+        // STEP 3 — LOGAR AS SUGESTÕES NA HORA DE SALVAR EM results.suggestions
+        // ────────────────────────────────────────
+        logger.debug("[TRACE_S3_BEFORE_SAVE]", {
+          hasSuggestions: Array.isArray(results?.suggestions),
+          suggestionCount: results?.suggestions?.length,
+          firstSuggestion: results?.suggestions?.[0],
+          technical: results?.suggestions?.[0],
+          targetValue: results?.suggestions?.[0]?.targetValue,
+          currentValue: results?.suggestions?.[0]?.currentValue,
+          delta: results?.suggestions?.[0]?.delta,
+          deltaNum: results?.suggestions?.[0]?.deltaNum
+        });
+      }
+
+      // ⚡ Quick-scan não tem sugestões por definição (lib/audio/quick-scan.js)
+      if (results.analysisTier !== 'quick' && (!results.aiSuggestions || results.aiSuggestions.length === 0)) {
+        logger.error(`[AI-AUDIT][SAVE] ❌ CRÍTICO: results.aiSuggestions AUSENTE no objeto results!`);
+        logger.error(`[AI-AUDIT][SAVE] ⚠️ Postgres irá salvar SEM aiSuggestions!`);
+        logger.error(`[AI-AUDIT][SAVE] Keys presentes:`, Object.keys(results).slice(0, 10));
+      }
+
+      // 📦 JSON com a precisão do schema (lib/serialization/result-schema.js)
+      const serializeStart = performance.now();
+      const resultsJson = serializeResultJSON(results);
+      logger.info(`[DB-UPDATE] 📦 results: ${(Buffer.byteLength(resultsJson) / 1024).toFixed(1)}KB JSON (serialize ${(performance.now() - serializeStart).toFixed(2)}ms)`);
+
       query = `UPDATE jobs SET status = $1, results = $2, updated_at = NOW() WHERE id = $3 RETURNING *`;
-      params = [status, JSON.stringify(results), jobId];
+      params = [status, resultsJson, jobId];
     } else {
       query = `UPDATE jobs SET status = $1, updated_at = NOW() WHERE id = $2 RETURNING *`;
       params = [status, jobId];
     }
 
     const result = await pool.query(query, params);
-    console.log(`📝 [DB-UPDATE][${new Date().toISOString()}] -> Job ${jobId} status updated to '${status}'`);
+    logger.info(`📝 [DB-UPDATE][${new Date().toISOString()}] -> Job ${jobId} status updated to '${status}'`);
     
     // ✅ LOGS DE AUDITORIA PÓS-SALVAMENTO
     if (results && result.rows[0]) {
@@ -579,37 +646,37 @@ async function updateJobStatus(jobId, status, results = null) {
         ? JSON.parse(result.rows[0].results) 
         : result.rows[0].results;
       
-      console.log(`[AI-AUDIT][SAVE.after] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][SAVE.after] ✅ JOB SALVO NO POSTGRES`);
-      console.log(`[AI-AUDIT][SAVE.after] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
-      console.log(`[AI-AUDIT][SAVE.after] Job ID:`, result.rows[0].id);
-      console.log(`[AI-AUDIT][SAVE.after] Status:`, result.rows[0].status);
-      console.log(`[AI-AUDIT][SAVE.after] has suggestions in DB?`, Array.isArray(savedResults.suggestions));
-      console.log(`[AI-AUDIT][SAVE.after] suggestions length in DB:`, savedResults.suggestions?.length || 0);
+      logger.debug(`[AI-AUDIT][SAVE.after] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(`[AI-AUDIT][SAVE.after] ✅ JOB SALVO NO POSTGRES`);
+      logger.debug(`[AI-AUDIT][SAVE.after] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(() => [`[AI-AUDIT][SAVE.after] Job ID:`, result.rows[0].id]);
+      logger.debug(() => [`[AI-AUDIT][SAVE.after] Status:`, result.rows[0].status]);
+      logger.debug(() => [`[AI-AUDIT][SAVE.after] has suggestions in DB?`, Array.isArray(savedResults.suggestions)]);
+      logger.debug(() => [`[AI-AUDIT][SAVE.after] suggestions length in DB:`, savedResults.suggestions?.length || 0]);
       
       // 🤖 VERIFICAÇÃO CRÍTICA: aiSuggestions no banco
-      console.log(`[AI-AUDIT][SAVE.after] has aiSuggestions in DB?`, Array.isArray(savedResults.aiSuggestions));
-      console.log(`[AI-AUDIT][SAVE.after] aiSuggestions length in DB:`, savedResults.aiSuggestions?.length || 0);
+      logger.debug(() => [`[AI-AUDIT][SAVE.after] has aiSuggestions in DB?`, Array.isArray(savedResults.aiSuggestions)]);
+      logger.debug(() => [`[AI-AUDIT][SAVE.after] aiSuggestions length in DB:`, savedResults.aiSuggestions?.length || 0]);
       
       if (!savedResults.aiSuggestions || savedResults.aiSuggestions.length === 0) {
-        console.error(`[AI-AUDIT][SAVE.after] ❌❌❌ CRÍTICO: aiSuggestions NÃO FOI SALVO NO POSTGRES! ❌❌❌`);
-        console.error(`[AI-AUDIT][SAVE.after] ⚠️ API irá retornar SEM aiSuggestions!`);
-        console.error(`[AI-AUDIT][SAVE.after] ⚠️ Frontend não receberá enriquecimento IA!`);
+        logger.error(`[AI-AUDIT][SAVE.after] ❌❌❌ CRÍTICO: aiSuggestions NÃO FOI SALVO NO POSTGRES! ❌❌❌`);
+        logger.error(`[AI-AUDIT][SAVE.after] ⚠️ API irá retornar SEM aiSuggestions!`);
+        logger.error(`[AI-AUDIT][SAVE.after] ⚠️ Frontend não receberá enriquecimento IA!`);
       } else {
-        console.log(`[AI-AUDIT][SAVE.after] ✅✅✅ aiSuggestions SALVO COM SUCESSO! ✅✅✅`);
-        console.log(`[AI-AUDIT][SAVE.after] ${savedResults.aiSuggestions.length} itens enriquecidos disponíveis para frontend`);
+        logger.debug(`[AI-AUDIT][SAVE.after] ✅✅✅ aiSuggestions SALVO COM SUCESSO! ✅✅✅`);
+        logger.debug(() => [`[AI-AUDIT][SAVE.after] ${savedResults.aiSuggestions.length} itens enriquecidos disponíveis para frontend`]);
       }
-      console.log(`[AI-AUDIT][SAVE.after] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
+      logger.debug(`[AI-AUDIT][SAVE.after] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━`);
     }
     
     return result.rows[0];
   } catch (error) {
-    console.error(`💥 [DB-ERROR][${new Date().toISOString()}] -> Failed to update job ${jobId}:`, error.message);
+    logger.error(`💥 [DB-ERROR][${new Date().toISOString()}] -> Failed to update job ${jobId}:`, error.message);
     
     // 🔍 DIAGNÓSTICO ESPECÍFICO para erros UUID
     if (error.message.includes('invalid input syntax for type uuid')) {
-      console.error(`🔍 [DB-ERROR] DIAGNÓSTICO: jobId '${jobId}' não é UUID válido para PostgreSQL`);
-      console.error(`💡 [DB-ERROR] SOLUÇÃO: Verificar se API está gerando UUIDs corretos`);
+      logger.error(`🔍 [DB-ERROR] DIAGNÓSTICO: jobId '${jobId}' não é UUID válido para PostgreSQL`);
+      logger.error(`💡 [DB-ERROR] SOLUÇÃO: Verificar se API está gerando UUIDs corretos`);
     }
     throw error;
   }
@@ -646,18 +713,18 @@ async function audioProcessor(job) {
 
   const displayId = jobId?.substring(0, 8) || 'unknown';
 
-  console.log('[WORKER] ═══════════════════════════════════════');
-  console.log(`[WORKER] 🚀 Job recebido: ${displayId}`);
-  console.log(`[WORKER] Mode: ${mode || 'genre'} | Stage: ${referenceStage || 'N/A'}`);
-  console.log(`[WORKER] Arquivo: ${fileName || 'unknown'}`);
-  console.log(`[WORKER] Processos ativos: ${activeChildProcesses}`);
-  console.log('[WORKER] ═══════════════════════════════════════');
+  logger.info('[WORKER] ═══════════════════════════════════════');
+  logger.info(`[WORKER] 🚀 Job recebido: ${displayId}`);
+  logger.info(`[WORKER] Mode: ${mode || 'genre'} | Stage: ${referenceStage || 'N/A'}`);
+  logger.info(`[WORKER] Arquivo: ${fileName || 'unknown'}`);
+  logger.info(`[WORKER] Processos ativos: ${activeChildProcesses}`);
+  logger.info('[WORKER] ═══════════════════════════════════════');
 
   // Atualizar status para 'processing' imediatamente
   try {
     await updateJobStatus(jobId, 'processing');
   } catch (err) {
-    console.error(`[WORKER] ❌ Falha ao marcar processing: ${err.message}`);
+    logger.error(`[WORKER] ❌ Falha ao marcar processing: ${err.message}`);
     // Continuar — não é fatal
   }
 
@@ -671,18 +738,19 @@ async function audioProcessor(job) {
       env: { ...process.env },
       // Silenciar stdout/stderr do filho — redirecionar para o pai
       silent: false,
-      // serialization: 'advanced' permite transferir Buffers mais eficientemente se necessário
-      serialization: 'json',
+      // serialization: 'advanced' transfere o payload msgpack do resultado como binário
+      // (em 'json' o Buffer viraria um array de números)
+      serialization: 'advanced',
     });
 
     activeChildProcesses++;
     const childPid = child.pid;
-    console.log(`[WORKER] 🔀 Fork criado PID=${childPid} para job ${displayId} (ativos: ${activeChildProcesses})`);
+    logger.info(`[WORKER] 🔀 Fork criado PID=${childPid} para job ${displayId} (ativos: ${activeChildProcesses})`);
 
     // Timeout de segurança: 5 minutos para o processo inteiro
     const JOB_TIMEOUT = 300000;
     const jobTimeout = setTimeout(() => {
-      console.error(`[WORKER] ⏰ Timeout de ${JOB_TIMEOUT / 1000}s para job ${displayId} PID=${childPid}`);
+      logger.error(`[WORKER] ⏰ Timeout de ${JOB_TIMEOUT / 1000}s para job ${displayId} PID=${childPid}`);
       try { child.kill('SIGKILL'); } catch (_) {}
       reject(new Error(`Job timeout após ${JOB_TIMEOUT / 1000}s: ${fileName}`));
     }, JOB_TIMEOUT);
@@ -695,26 +763,46 @@ async function audioProcessor(job) {
         const elapsed = Date.now() - startTime;
         const memAfter = process.memoryUsage();
 
-        console.log(`[WORKER] ═══════════════════════════════════════`);
-        console.log(`[WORKER] ✅ Resultado recebido de PID=${childPid}`);
-        console.log(`[WORKER] Tempo total: ${elapsed}ms`);
-        console.log(`[WORKER] RAM orquestrador: ${(memAfter.rss / 1024 / 1024).toFixed(1)}MB`);
-        console.log(`[WORKER] RAM filho (pico): ${msg.metrics?.peakRssMB || '?'}MB`);
-        console.log(`[WORKER] Heap filho (pico): ${msg.metrics?.heapUsedMB || '?'}MB`);
-        console.log(`[WORKER] ═══════════════════════════════════════`);
+        logger.info(`[WORKER] ═══════════════════════════════════════`);
+        logger.info(`[WORKER] ✅ Resultado recebido de PID=${childPid}`);
+        logger.info(`[WORKER] Tempo total: ${elapsed}ms`);
+        logger.info(`[WORKER] RAM orquestrador: ${(memAfter.rss / 1024 / 1024).toFixed(1)}MB`);
+        logger.info(`[WORKER] RAM filho (pico): ${msg.metrics?.peakRssMB || '?'}MB`);
+        logger.info(`[WORKER] Heap filho (pico): ${msg.metrics?.heapUsedMB || '?'}MB`);
+        logger.info(`[WORKER] ═══════════════════════════════════════`);
+
+        if (msg.metrics?.profile) recordJobProfile(msg.metrics.profile);
 
         try {
+          let result = msg.result;
+          if (msg.encoding === 'msgpack') {
+            const decodeStart = performance.now();
+            result = decodeResultWire(msg.payload);
+            logger.info(`[WORKER] 📦 Payload ${(msg.metrics?.wireBytes / 1024).toFixed(1)}KB msgpack v${msg.schemaVersion} ` +
+              `(encode ${msg.metrics?.wireEncodeMs}ms, decode ${(performance.now() - decodeStart).toFixed(2)}ms)`);
+          }
+
           // Salvar resultado no PostgreSQL
-          await updateJobStatus(jobId, msg.status, msg.result);
-          console.log(`[WORKER] ✅ Job ${displayId} salvo como ${msg.status}`);
-          resolve(msg.result);
+          await updateJobStatus(jobId, msg.status, result);
+          logger.info(`[WORKER] ✅ Job ${displayId} salvo como ${msg.status}`);
+
+          // returnvalue do BullMQ vai para o Redis e para todos os QueueEvents:
+          // só o resumo (o resultado completo já está em jobs.results)
+          resolve({
+            jobId,
+            status: msg.status,
+            score: result?.score ?? null,
+            processingTime: result?.metadata?.processingTime ?? elapsed,
+            payloadBytes: msg.metrics?.wireBytes ?? null
+          });
         } catch (dbError) {
-          console.error(`[WORKER] ❌ Falha ao salvar resultado: ${dbError.message}`);
+          logger.error(`[WORKER] ❌ Falha ao salvar resultado: ${dbError.message}`);
           reject(dbError);
         }
 
       } else if (msg.type === 'error') {
-        console.error(`[WORKER] ❌ Erro do filho PID=${childPid}: ${msg.error}`);
+        logger.error(`[WORKER] ❌ Erro do filho PID=${childPid}: ${msg.error}`);
+        if (msg.metrics?.profile) recordJobProfile(msg.metrics.profile);
 
         // Salvar como failed
         const errorResult = {
@@ -754,7 +842,7 @@ async function audioProcessor(job) {
         try {
           await updateJobStatus(jobId, 'failed', errorResult);
         } catch (dbError) {
-          console.error(`[WORKER] ❌ Falha ao salvar failed: ${dbError.message}`);
+          logger.error(`[WORKER] ❌ Falha ao salvar failed: ${dbError.message}`);
         }
 
         reject(new Error(msg.error));
@@ -769,8 +857,8 @@ async function audioProcessor(job) {
       const elapsed = Date.now() - startTime;
       const memAfter = process.memoryUsage();
 
-      console.log(`[WORKER] 💀 Filho PID=${childPid} encerrou (code=${code}, signal=${signal}) em ${elapsed}ms`);
-      console.log(`[WORKER] 📊 RAM orquestrador após cleanup: ${(memAfter.rss / 1024 / 1024).toFixed(1)}MB (ativos: ${activeChildProcesses})`);
+      logger.info(`[WORKER] 💀 Filho PID=${childPid} encerrou (code=${code}, signal=${signal}) em ${elapsed}ms`);
+      logger.info(`[WORKER] 📊 RAM orquestrador após cleanup: ${(memAfter.rss / 1024 / 1024).toFixed(1)}MB (ativos: ${activeChildProcesses})`);
 
       // Se exit code > 0 e não recebemos mensagem, é crash
       if (code !== 0 && code !== null) {
@@ -792,7 +880,7 @@ async function audioProcessor(job) {
     child.on('error', (err) => {
       activeChildProcesses = Math.max(0, activeChildProcesses - 1);
       clearTimeout(jobTimeout);
-      console.error(`[WORKER] ❌ Erro no fork PID=${childPid}: ${err.message}`);
+      logger.error(`[WORKER] ❌ Erro no fork PID=${childPid}: ${err.message}`);
       reject(err);
     });
 
@@ -800,6 +888,8 @@ async function audioProcessor(job) {
     child.send({
       type: 'job',
       data: job.data,
+      // Filho só grava .cpuprofile/heap snapshot se entrar no top N de jobs mais lentos
+      profiling: { keepAboveMs: getProfileKeepThreshold() },
     });
   });
 }
@@ -809,41 +899,59 @@ async function audioProcessor(job) {
 // ===============================================
 
 // 🚀 INICIAR WORKER
-console.log('🚀 [WORKER] Iniciando aplicação Worker Redis...');
+logger.info('🚀 [WORKER] Iniciando aplicação Worker Redis...');
 initializeWorker();
 
 // 🔄 GRACEFUL SHUTDOWN
 process.on('SIGINT', async () => {
-  console.log(`📥 [SIGNAL][${new Date().toISOString()}] -> Received SIGINT`);
+  logger.info(`📥 [SIGNAL][${new Date().toISOString()}] -> Received SIGINT`);
   await gracefulShutdown('SIGINT');
 });
 
 process.on('SIGTERM', async () => {
-  console.log(`📥 [SIGNAL][${new Date().toISOString()}] -> Received SIGTERM`);
+  logger.info(`📥 [SIGNAL][${new Date().toISOString()}] -> Received SIGTERM`);
   await gracefulShutdown('SIGTERM');
 });
 
+// 📈 SUPERVISOR (supervisor.js): concorrência ajustada em runtime; drenagem chega como SIGTERM
+if (process.send) {
+  process.on('message', (msg) => {
+    if (msg?.type !== 'scale' || !worker) return;
+    const concurrency = Math.min(MAX_SAFE_CONCURRENCY, Math.max(MIN_CONCURRENCY, Math.floor(Number(msg.concurrency)) || MIN_CONCURRENCY));
+    worker.concurrency = concurrency;
+    logger.info(`⚙️ [AUTOSCALER] Concorrência ajustada para ${concurrency} (PID=${process.pid})`);
+  });
+
+  // Supervisor morreu: drenar em vez de ficar órfão
+  process.on('disconnect', () => gracefulShutdown('SUPERVISOR_DISCONNECT'));
+}
+
+let isShuttingDown = false;
+
 async function gracefulShutdown(signal) {
-  console.log(`📥 [SHUTDOWN][${new Date().toISOString()}] -> Iniciando shutdown graceful - Motivo: ${signal}`);
+  // SIGTERM do supervisor + disconnect/sinal do container podem chegar juntos
+  if (isShuttingDown) return;
+  isShuttingDown = true;
+  logger.info(`📥 [SHUTDOWN][${new Date().toISOString()}] -> Iniciando shutdown graceful - Motivo: ${signal}`);
   
   try {
     if (worker) {
-      console.log(`🔄 [SHUTDOWN][${new Date().toISOString()}] -> Fechando Worker...`);
+      logger.info(`🔄 [SHUTDOWN][${new Date().toISOString()}] -> Fechando Worker...`);
       await worker.close();
-      console.log(`✅ [SHUTDOWN][${new Date().toISOString()}] -> Worker fechado com sucesso`);
+      logger.info(`✅ [SHUTDOWN][${new Date().toISOString()}] -> Worker fechado com sucesso`);
     }
     
     if (redisConnection) {
-      console.log(`🔄 [SHUTDOWN][${new Date().toISOString()}] -> Fechando conexão Redis...`);
+      logger.info(`🔄 [SHUTDOWN][${new Date().toISOString()}] -> Fechando conexão Redis...`);
       await redisConnection.quit();
-      console.log(`✅ [SHUTDOWN][${new Date().toISOString()}] -> Conexão Redis fechada`);
+      logger.info(`✅ [SHUTDOWN][${new Date().toISOString()}] -> Conexão Redis fechada`);
     }
     
-    console.log(`✅ [SHUTDOWN][${new Date().toISOString()}] -> Shutdown graceful concluído`);
+    logger.info(`✅ [SHUTDOWN][${new Date().toISOString()}] -> Shutdown graceful concluído`);
     process.exit(0);
     
   } catch (error) {
-    console.error(`💥 [SHUTDOWN][${new Date().toISOString()}] -> Erro durante shutdown:`, error.message);
+    logger.error(`💥 [SHUTDOWN][${new Date().toISOString()}] -> Erro durante shutdown:`, error.message);
     process.exit(1);
   }
 }
\ No newline at end of file
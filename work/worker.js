@@ -58,10 +58,14 @@ const __dirname = path.dirname(__filename);
 
 // ---------- Importar pipeline completo ----------
 let processAudioComplete = null;
+let pipelineTimeoutMs = null;
 
 try {
-  const imported = await import("../api/audio/pipeline-complete.js");
+  const imported = await import("./api/audio/pipeline-complete.js");
   processAudioComplete = imported.processAudioComplete;
+  // Download+decode correm juntos no stream: o pipeline precisa de folga além do timeout do decode
+  const { STREAM_DECODE_TIMEOUT_MS } = await import("./api/audio/audio-decoder.js");
+  pipelineTimeoutMs = STREAM_DECODE_TIMEOUT_MS + 60000;
   console.log("✅ Pipeline completo carregado com sucesso!");
 } catch (err) {
   console.error("❌ CRÍTICO: Falha ao carregar pipeline:", err.message);
@@ -111,59 +115,51 @@ const s3 = new S3Client({
 });
 const BUCKET_NAME = process.env.B2_BUCKET_NAME;
 
-// ---------- Baixar arquivo do bucket ----------
-async function downloadFileFromBucket(key) {
-  console.log(`🔍 Tentando baixar: ${key}`);
+// ---------- Abrir stream do arquivo no bucket ----------
+// 🌊 O Body do GetObject vai direto para o stdin do FFmpeg (decodeAudioFromStream).
+// O upload inteiro continua sendo copiado para localPath em paralelo ao decode:
+// o True Peak (FFmpeg ebur128) lê o arquivo em disco.
+async function openObjectStream(key) {
+  console.log(`🔍 Abrindo stream: ${key}`);
   console.log(`🔍 Bucket: ${BUCKET_NAME}`);
-  
-  const localPath = path.join("/tmp", path.basename(key)); // Railway usa /tmp
-  return new Promise(async (resolve, reject) => {
-    try {
-      const write = fs.createWriteStream(localPath);
-      const command = new GetObjectCommand({ Bucket: BUCKET_NAME, Key: key });
-      const response = await s3.send(command);
-      const read = response.Body;
-
-      // 🔥 TIMEOUT DE 2 MINUTOS - EVITA DOWNLOAD INFINITO
-      const timeout = setTimeout(() => {
-        write.destroy();
-        if (read && read.destroy) read.destroy();
-        reject(new Error(`Download timeout após 2 minutos para: ${key}`));
-      }, 120000);
-
-      read.on("error", (err) => {
-        clearTimeout(timeout);
-        console.error(`❌ Erro no stream de leitura para ${key}:`, err.message);
-        console.error(`❌ Código do erro:`, err.code);
-        console.error(`❌ Status:`, err.statusCode);
-        reject(err);
-      });
-      write.on("error", (err) => {
-        clearTimeout(timeout);
-        console.error(`❌ Erro no stream de escrita para ${key}:`, err.message);
-        reject(err);
-      });
-      write.on("finish", () => {
-        clearTimeout(timeout);
-        console.log(`✅ Download concluído para ${key}`);
-        resolve(localPath);
-      });
 
-      read.pipe(write);
-    } catch (err) {
-      reject(err);
-    }
+  const localPath = path.join("/tmp", path.basename(key)); // Railway usa /tmp
+  const command = new GetObjectCommand({ Bucket: BUCKET_NAME, Key: key });
+  const response = await s3.send(command);
+  const stream = response.Body;
+
+  // 🔥 TIMEOUT DE 2 MINUTOS - EVITA DOWNLOAD INFINITO
+  const timeout = setTimeout(() => {
+    stream.destroy(new Error(`Download timeout após 2 minutos para: ${key}`));
+  }, 120000);
+
+  stream.on("error", (err) => {
+    clearTimeout(timeout);
+    console.error(`❌ Erro no stream de leitura para ${key}:`, err.message);
+    console.error(`❌ Código do erro:`, err.code);
+    console.error(`❌ Status:`, err.statusCode);
+  });
+  stream.on("end", () => {
+    clearTimeout(timeout);
+    console.log(`✅ Download concluído para ${key}`);
   });
+  stream.on("close", () => clearTimeout(timeout));
+
+  return {
+    key,
+    stream,
+    localPath,
+    contentLength: Number(response.ContentLength) || 0,
+  };
 }
 
 // ---------- Análise REAL via pipeline ----------
 // 🔧 FUNÇÃO CORRIGIDA: agora passa genre/mode/jobId corretamente
-async function analyzeAudioWithPipeline(localFilePath, jobOrOptions) {
-  const filename = path.basename(localFilePath);
+async function analyzeAudioWithPipeline(source, jobOrOptions) {
+  const filename = path.basename(source.localPath);
   
   try {
-    const fileBuffer = await fs.promises.readFile(localFilePath);
-    console.log(`📊 Arquivo lido: ${fileBuffer.length} bytes`);
+    console.log(`📊 Arquivo em stream: ${source.contentLength} bytes`);
 
     const t0 = Date.now();
 
@@ -263,12 +259,16 @@ async function analyzeAudioWithPipeline(localFilePath, jobOrOptions) {
       jobId: pipelineOptions.jobId
     });
 
-    // 🔥 TIMEOUT DE 3 MINUTOS PARA EVITAR TRAVAMENTO
-    const pipelinePromise = processAudioComplete(fileBuffer, filename, pipelineOptions);
+    // 🔥 TIMEOUT DO PIPELINE (decode em stream + 1 min) PARA EVITAR TRAVAMENTO
+    const pipelinePromise = processAudioComplete(null, filename, {
+      ...pipelineOptions,
+      inputStream: source.stream,
+      spillPath: source.localPath,
+    });
     const timeoutPromise = new Promise((_, reject) => {
       setTimeout(() => {
-        reject(new Error(`Pipeline timeout após 3 minutos para: ${filename}`));
-      }, 180000); // 3 minutos (reduzido de 5)
+        reject(new Error(`Pipeline timeout após ${pipelineTimeoutMs / 60000} minutos para: ${filename}`));
+      }, pipelineTimeoutMs);
     });
 
     console.log(`⚡ Iniciando processamento de ${filename}...`);
@@ -350,7 +350,7 @@ async function processJob(job) {
   console.log("🔵 [AUDIT:WORKER-ENTRY] FileKey recebido:", job.data?.fileKey);
   console.log("🔵 [AUDIT:WORKER-ENTRY] JobId recebido:", job.data?.jobId);
 
-  let localFilePath = null;
+  let source = null;
   let heartbeatInterval = null;
 
   try {
@@ -377,16 +377,15 @@ async function processJob(job) {
       }
     }, 30000);
 
-    localFilePath = await downloadFileFromBucket(job.file_key);
-    console.log(`🎵 Arquivo pronto para análise: ${localFilePath}`);
+    source = await openObjectStream(job.file_key);
+    console.log(`🎵 Stream pronto para análise: ${source.key}`);
 
-    // 🔍 VALIDAÇÃO BÁSICA DE ARQUIVO
+    // 🔍 VALIDAÇÃO BÁSICA DE ARQUIVO (pelo Content-Length, antes de consumir o stream)
     console.log(`🔍 [${job.id.substring(0,8)}] Validando arquivo antes do pipeline...`);
-    const stats = await fs.promises.stat(localFilePath);
-    const fileSizeMB = stats.size / (1024 * 1024);
+    const fileSizeMB = source.contentLength / (1024 * 1024);
     
-    if (stats.size < 1000) {
-      throw new Error(`File too small: ${stats.size} bytes (minimum 1KB required)`);
+    if (source.contentLength < 1000) {
+      throw new Error(`File too small: ${source.contentLength} bytes (minimum 1KB required)`);
     }
     
     if (fileSizeMB > 100) {
@@ -547,16 +546,14 @@ async function processJob(job) {
     if (job.mode === "comparison") {
       console.log("🎧 [Worker] Iniciando análise comparativa entre faixas...");
 
-      // Baixar arquivo de referência
-      const refPath = await downloadFileFromBucket(job.reference_file_key);
-      console.log(`🎵 Arquivo de referência pronto: ${refPath}`);
-
-      // Analisar ambos os arquivos
-      const userMetrics = await analyzeAudioWithPipeline(localFilePath, job);
-      const refMetrics = await analyzeAudioWithPipeline(refPath, job);
+      // Analisar ambos os arquivos (stream da referência só é aberto quando for consumido)
+      const userMetrics = await analyzeAudioWithPipeline(source, job);
+      const refSource = await openObjectStream(job.reference_file_key);
+      console.log(`🎵 Stream de referência pronto: ${refSource.key}`);
+      const refMetrics = await analyzeAudioWithPipeline(refSource, job);
 
       // Importar função de comparação
-      const { compareMetrics } = await import("../api/audio/pipeline-complete.js");
+      const { compareMetrics } = await import("./api/audio/pipeline-complete.js");
       const comparison = await compareMetrics(userMetrics, refMetrics);
 
       // 🛡️ BLINDAGEM: Forçar genre correto no modo comparison
@@ -633,7 +630,7 @@ async function processJob(job) {
       
       // Limpar arquivo de referência
       try {
-        await fs.promises.unlink(refPath);
+        await fs.promises.unlink(refSource.localPath);
       } catch (e) {
         console.warn("⚠️ Não foi possível remover arquivo de referência temporário:", e?.message);
       }
@@ -649,7 +646,7 @@ async function processJob(job) {
     console.log("[PRÉ-PIPELINE] job.data.genre:", job.data?.genre);
     console.log("============================================================\n");
     
-    const analysisResult = await analyzeAudioWithPipeline(localFilePath, options);
+    const analysisResult = await analyzeAudioWithPipeline(source, options);
     
     console.log("\n================ AUDITORIA: PÓS-PIPELINE ================");
     console.log("[PÓS-PIPELINE] analysisResult.data.genreTargets existe?:", !!analysisResult?.data?.genreTargets);
@@ -1343,11 +1340,15 @@ async function processJob(job) {
       heartbeatInterval = null;
     }
 
-    if (localFilePath) {
+    if (source) {
+      // Stream não consumido (job falhou antes do pipeline) — liberar a conexão com o bucket
+      source.stream.destroy();
       try {
-        await fs.promises.unlink(localFilePath);
+        await fs.promises.unlink(source.localPath);
       } catch (e) {
-        console.warn("⚠️ Não foi possível remover arquivo temporário:", e?.message);
+        if (e?.code !== 'ENOENT') {
+          console.warn("⚠️ Não foi possível remover arquivo temporário:", e?.message);
+        }
       }
     }
   }
@@ -14,6 +14,9 @@ import { parentPort, workerData } from 'worker_threads';
 import { performance } from 'perf_hooks';
 import { calculateLoudnessMetrics } from '../../lib/audio/features/loudness.js';
 import { assertFinite } from '../../lib/audio/error-handling.js';
+import { createLogger } from '../lib/logger.js';
+
+const logger = createLogger('audio:lufs-worker');
 
 async function calculateLUFSMetrics() {
   const startWorker = performance.now();
@@ -30,7 +33,7 @@ async function calculateLUFSMetrics() {
       throw new Error('LUFS Worker: canais com tamanhos diferentes');
     }
 
-    console.log(`[Worker LUFS] Iniciando análise ITU-R BS.1770-4 (${leftChannel.length} samples)`);
+    logger.debug(() => [`[Worker LUFS] Iniciando análise ITU-R BS.1770-4 (${leftChannel.length} samples)`]);
     
     // Calcular LUFS (MESMA LÓGICA do core-metrics.js)
     const lufsMetrics = await calculateLoudnessMetrics(
@@ -56,17 +59,17 @@ async function calculateLUFSMetrics() {
     const endWorker = performance.now();
     const timeMs = (endWorker - startWorker).toFixed(2);
     console.timeEnd('⚡ [Worker LUFS] Total');
-    console.log(`⏱️ [Worker LUFS] levou ${timeMs} ms (${(timeMs / 1000).toFixed(2)} s)`);
-    console.log(`[Worker LUFS] ✅ LUFS Integrated: ${lufsMetrics.integrated.toFixed(2)} dB`);
+    logger.debug(() => [`⏱️ [Worker LUFS] levou ${timeMs} ms (${(timeMs / 1000).toFixed(2)} s)`]);
+    logger.debug(() => [`[Worker LUFS] ✅ LUFS Integrated: ${lufsMetrics.integrated.toFixed(2)} dB`]);
     
     parentPort.postMessage({ success: true, data: lufsMetrics });
     
   } catch (error) {
     const endWorker = performance.now();
     const timeMs = (endWorker - startWorker).toFixed(2);
-    console.error('[Worker LUFS] ❌ Erro:', error.message);
+    logger.error('[Worker LUFS] ❌ Erro:', error.message);
     console.timeEnd('⚡ [Worker LUFS] Total');
-    console.log(`⏱️ [Worker LUFS] falhou após ${timeMs} ms (${(timeMs / 1000).toFixed(2)} s)`);
+    logger.debug(() => [`⏱️ [Worker LUFS] falhou após ${timeMs} ms (${(timeMs / 1000).toFixed(2)} s)`]);
     parentPort.postMessage({ success: false, error: error.message });
   }
 }
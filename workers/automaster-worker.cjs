@@ -32,9 +32,9 @@ console.error('[BOOT]', { file: __filename, pid: process.pid, entrypoint: 'worke
  * ============================================================================
  */
 
-const { execFile } = require('child_process');
 const path = require('path');
 const fs = require('fs');
+const { runPipeline } = require('../automaster/pipeline-thread.cjs');
 
 // ============================================================================
 // CONSTANTES DE SEGURANÇA
@@ -169,85 +169,52 @@ function validatePipelineScript() {
 // ============================================================================
 
 /**
- * Executa o master-pipeline.cjs com timeout e controle
+ * Executa o master-pipeline com timeout e controle (worker_thread, sem subprocess node)
  */
-function executePipelineWithTimeout(inputPath, outputPath, mode) {
-  return new Promise((resolve, reject) => {
-    const startTime = Date.now();
-
-    // Spawn do processo
-    const childProcess = execFile(
-      'node',
-      [MASTER_PIPELINE_SCRIPT, inputPath, outputPath, mode],
-      {
-        timeout: TIMEOUT_MS,
-        maxBuffer: 10 * 1024 * 1024, // 10MB buffer para stdout/stderr
-        killSignal: 'SIGTERM',
-        encoding: 'utf8' // Garantir UTF-8
-      },
-      (error, stdout, stderr) => {
-        const endTime = Date.now();
-        const durationMs = endTime - startTime;
-
-        // Timeout ou kill
-        if (error) {
-          if (error.killed || error.signal === 'SIGTERM') {
-            console.error('[WORKER] Processo morto por timeout');
-            console.error('[WORKER] Stderr:', stderr);
-            return reject({
-              type: 'TIMEOUT',
-              message: `Processo excedeu timeout de ${TIMEOUT_MS / 1000}s`,
-              stderr: stderr ? stderr.trim() : '',
-              duration_ms: durationMs
-            });
-          }
-
-          // Erro de execução
-          console.error('[WORKER] Erro de execução:', error.message);
-          console.error('[WORKER] Stderr:', stderr);
-          return reject({
-            type: 'EXECUTION_ERROR',
-            message: error.message,
-            stderr: stderr ? stderr.trim() : '',
-            code: error.code || null,
-            duration_ms: durationMs
-          });
-        }
-
-        // Validar stdout
-        if (!stdout || !stdout.trim()) {
-          console.error('[WORKER] Pipeline retornou stdout vazio');
-          console.error('[WORKER] Stdout:', stdout);
-          console.error('[WORKER] Stderr:', stderr);
-          return reject({
-            type: 'EMPTY_OUTPUT',
-            message: 'Pipeline retornou stdout vazio',
-            stdout: stdout,
-            stderr: stderr ? stderr.trim() : '',
-            duration_ms: durationMs
-          });
-        }
-
-        // Sucesso - capturar última linha do stdout
-        const lines = stdout.trim().split('\n');
-        const lastLine = lines[lines.length - 1];
-
-        console.error(`[WORKER] Pipeline concluído (${durationMs}ms)`);
-        console.error(`[WORKER] Stdout linhas: ${lines.length}`);
-        console.error(`[WORKER] Última linha (primeiros 100 chars): ${lastLine.substring(0, 100)}`);
-
-        resolve({
-          stdout: stdout.trim(),
-          lastLine: lastLine,
-          stderr: stderr ? stderr.trim() : '',
-          duration_ms: durationMs
-        });
-      }
-    );
+async function executePipelineWithTimeout(inputPath, outputPath, mode) {
+  const startTime = Date.now();
+  console.error(`[WORKER] Pipeline in-process | Timeout: ${TIMEOUT_MS}ms`);
 
-    // Log do PID para debug
-    console.error(`[WORKER] PID: ${childProcess.pid} | Timeout: ${TIMEOUT_MS}ms`);
-  });
+  let run;
+  try {
+    run = await runPipeline({ inputPath, outputPath, mode }, { timeoutMs: TIMEOUT_MS });
+  } catch (error) {
+    const durationMs = Date.now() - startTime;
+
+    // Timeout: thread encerrada
+    if (error.code === 'PIPELINE_TIMEOUT') {
+      console.error('[WORKER] Pipeline encerrado por timeout');
+      throw {
+        type: 'TIMEOUT',
+        message: `Processo excedeu timeout de ${TIMEOUT_MS / 1000}s`,
+        stderr: '',
+        duration_ms: durationMs
+      };
+    }
+
+    // Erro de execução (thread caiu)
+    console.error('[WORKER] Erro de execução:', error.message);
+    throw {
+      type: 'EXECUTION_ERROR',
+      message: error.message,
+      stderr: '',
+      code: error.code || null,
+      duration_ms: durationMs
+    };
+  }
+
+  // Mesmo formato do stdout antigo: JSON do pipeline na última linha
+  const lastLine = JSON.stringify(run.result);
+
+  console.error(`[WORKER] Pipeline concluído (${run.duration_ms}ms)`);
+  console.error(`[WORKER] Última linha (primeiros 100 chars): ${lastLine.substring(0, 100)}`);
+
+  return {
+    stdout: run.stdout ? `${run.stdout}\n${lastLine}` : lastLine,
+    lastLine: lastLine,
+    stderr: run.stderr,
+    duration_ms: run.duration_ms
+  };
 }
 
 // ============================================================================